@@ -75,6 +75,7 @@ class Settings(BaseSettings):
     WEATHER_API_KEY: str = ""
     WEATHER_FORECAST_DAYS: int = 14  # forecast horizon to cache (Open-Meteo max 16)
     WEATHER_CACHE_TTL_MINUTES: int = 180  # snapshot freshness window before refetch
+    WEATHER_API_BASE_URL: str = ""  # override the provider endpoint (self-host/stub)
 
     # AI Service
     AI_DEFAULT_MODEL: str = "gpt-4o-mini"
@@ -187,6 +188,9 @@ class Settings(BaseSettings):
     PAYSTACK_API_BASE_URL: str = "https://api.paystack.co"
     # Where Paystack redirects the user after payment (webhook still does the real activation)
     PAYSTACK_CALLBACK_URL: Optional[str] = None
+    # Pending-payment reconciliation: in-flight verify calls and request starts/sec
+    PAYSTACK_VERIFY_CONCURRENCY: int = 8
+    PAYSTACK_VERIFY_RATE_PER_SEC: float = 10.0
 
     # Flutterwave (optional; alternative payment provider)
     FLUTTERWAVE_SECRET_KEY: str = ""
@@ -228,6 +232,18 @@ class Settings(BaseSettings):
     BREVO_API_KEY: str = ""
     DEFAULT_FROM_EMAIL: str = "no-reply@swimbuddz.com"
     DEFAULT_FROM_NAME: str = "SwimBuddz"
+    BREVO_API_BASE_URL: str = "https://api.brevo.com/v3"
+    # Request starts per second, per email provider. Brevo's transactional API
+    # answers 429 above the account's rate; pacing below it avoids the churn.
+    EMAIL_PROVIDER_RATE_PER_SEC: dict[str, float] = {"brevo": 10.0, "smtp": 5.0}
+    # Communications email outbox: messages per provider call and provider
+    # calls in flight.
+    EMAIL_BATCH_SIZE: int = 50
+    EMAIL_SEND_CONCURRENCY: int = 4
+    # Session reminder sweep: due notifications handled per tick, and in-app
+    # reminder dispatches in flight.
+    REMINDER_WAVE_SIZE: int = 500
+    REMINDER_DISPATCH_CONCURRENCY: int = 8
 
     model_config = SettingsConfigDict(
         env_file=_ENV_FILE,
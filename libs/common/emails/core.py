@@ -6,12 +6,21 @@ DigitalOcean block outbound SMTP ports (25/465/587), which makes smtplib
 delivery time out — so when a Brevo v3 API key (``BREVO_API_KEY``, an
 ``xkeysib-`` key) is configured we send over HTTPS. Without it we fall back to
 SMTP for environments where the ports are open (local/dev).
+
+``send_email`` sends one message. ``send_email_batch`` sends many in one
+provider call (Brevo ``messageVersions``; one login for SMTP) and reports a
+retryable/permanent outcome so the communications outbox can back off. Both
+share one pooled HTTP client and a per-provider request pacer, so a burst of
+sends stays under the provider's rate limit instead of drawing 429s.
 """
 
+import asyncio
 import smtplib
+import time
+from dataclasses import dataclass, field
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Optional
+from typing import Optional, Sequence
 
 import httpx
 from libs.common.config import get_settings
@@ -19,7 +28,110 @@ from libs.common.logging import get_logger
 
 logger = get_logger(__name__)
 
-BREVO_API_URL = "https://api.brevo.com/v3/smtp/email"
+# Brevo accepts up to 1000 message versions per call; keep requests small
+# enough that one rejected batch is cheap to retry.
+MAX_BATCH_SIZE = 100
+BREVO_MAX_CONNECTIONS = 10
+
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+@dataclass
+class EmailMessage:
+    """One rendered email, ready for a provider."""
+
+    to_email: str
+    subject: str
+    body: str
+    html_body: Optional[str] = None
+
+
+@dataclass
+class BatchSendResult:
+    """Outcome of ``send_email_batch``.
+
+    ``delivered`` lines up with the messages passed in. When nothing (or not
+    everything) was accepted, ``retryable`` says whether trying again later can
+    help, and ``retry_after`` carries the provider's back-off hint in seconds.
+    """
+
+    delivered: list[bool]
+    retryable: bool = False
+    retry_after: Optional[float] = None
+    error: Optional[str] = None
+    message_ids: list[str] = field(default_factory=list)
+
+
+class _ProviderPacer:
+    """Spaces request starts to one provider's rate limit.
+
+    Reservations happen without awaiting, so concurrent senders on one event
+    loop never race for a slot. ``pause`` pushes every later slot past a
+    provider back-off window.
+    """
+
+    def __init__(self, rate_per_sec: float):
+        self.interval = 1.0 / rate_per_sec if rate_per_sec > 0 else 0.0
+        self._next_start = 0.0
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def pause(self, seconds: float) -> None:
+        self._next_start = max(self._next_start, time.monotonic() + seconds)
+
+
+_pacers: dict[str, _ProviderPacer] = {}
+
+
+def provider_pacer(provider: str) -> _ProviderPacer:
+    """The process-wide pacer for ``provider`` ("brevo" or "smtp")."""
+    pacer = _pacers.get(provider)
+    if pacer is None:
+        rate = get_settings().EMAIL_PROVIDER_RATE_PER_SEC.get(provider, 0.0)
+        pacer = _pacers[provider] = _ProviderPacer(rate)
+    return pacer
+
+
+def _brevo_http() -> httpx.AsyncClient:
+    """Shared keep-alive client for Brevo API calls, one per event loop."""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            timeout=20.0,
+            limits=httpx.Limits(
+                max_connections=BREVO_MAX_CONNECTIONS,
+                max_keepalive_connections=BREVO_MAX_CONNECTIONS,
+            ),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+def _brevo_url() -> str:
+    return f"{get_settings().BREVO_API_BASE_URL.rstrip('/')}/smtp/email"
+
+
+def _brevo_headers(api_key: str) -> dict[str, str]:
+    return {
+        "api-key": api_key,
+        "content-type": "application/json",
+        "accept": "application/json",
+    }
+
+
+def _brevo_retry_after(resp: httpx.Response, default: float = 1.0) -> float:
+    raw = resp.headers.get("x-sib-ratelimit-reset") or resp.headers.get("retry-after")
+    try:
+        return max(0.0, float(raw)) if raw is not None else default
+    except ValueError:
+        return default
 
 
 def _get_smtp_password() -> str:
@@ -77,20 +189,16 @@ async def _send_via_brevo_api(
         payload["htmlContent"] = html_body
 
     try:
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            resp = await client.post(
-                BREVO_API_URL,
-                headers={
-                    "api-key": api_key,
-                    "content-type": "application/json",
-                    "accept": "application/json",
-                },
-                json=payload,
-            )
+        await provider_pacer("brevo").acquire()
+        resp = await _brevo_http().post(
+            _brevo_url(), headers=_brevo_headers(api_key), json=payload
+        )
         # Brevo returns 201 Created (with a messageId) on success.
         if resp.status_code in (200, 201):
             logger.info(f"Email sent to {to_email} via Brevo API: {subject}")
             return True
+        if resp.status_code == 429:
+            provider_pacer("brevo").pause(_brevo_retry_after(resp))
         logger.error(
             f"Brevo API send to {to_email} failed: {resp.status_code} {resp.text[:300]}"
         )
@@ -124,24 +232,19 @@ async def _send_via_smtp(
         return False
 
     try:
-        if html_body:
-            msg = MIMEMultipart("alternative")
-            msg.attach(MIMEText(body, "plain"))
-            msg.attach(MIMEText(html_body, "html"))
-        else:
-            msg = MIMEText(body, "plain")
-
-        msg["Subject"] = subject
-        msg["From"] = f"{sender_name} <{sender_email}>"
-        msg["To"] = to_email
-
         logger.info(f"Sending email to {to_email} via SMTP: {subject}")
-
-        with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=30) as server:
-            server.starttls()
-            server.login(settings.SMTP_USERNAME, smtp_password)
-            server.sendmail(sender_email, to_email, msg.as_string())
-
+        await provider_pacer("smtp").acquire()
+        # smtplib blocks; keep it off the event loop.
+        [error] = await asyncio.to_thread(
+            _smtp_send_all,
+            [EmailMessage(to_email, subject, body, html_body)],
+            sender_email,
+            sender_name,
+            smtp_password,
+        )
+        if error:
+            logger.error(f"SMTP error sending email: {error}")
+            return False
         logger.info(f"Email sent successfully to {to_email}")
         return True
 
@@ -154,3 +257,171 @@ async def _send_via_smtp(
     except Exception as e:
         logger.error(f"Failed to send email: {type(e).__name__}: {e}")
         return False
+
+
+def _mime(message: EmailMessage, sender_email: str, sender_name: str):
+    if message.html_body:
+        msg = MIMEMultipart("alternative")
+        msg.attach(MIMEText(message.body, "plain"))
+        msg.attach(MIMEText(message.html_body, "html"))
+    else:
+        msg = MIMEText(message.body, "plain")
+    msg["Subject"] = message.subject
+    msg["From"] = f"{sender_name} <{sender_email}>"
+    msg["To"] = message.to_email
+    return msg
+
+
+def _smtp_send_all(
+    messages: Sequence[EmailMessage],
+    sender_email: str,
+    sender_name: str,
+    smtp_password: str,
+) -> list[Optional[str]]:
+    """Send ``messages`` over one SMTP session (runs in a worker thread).
+
+    Returns a per-message error (None when accepted). A refused recipient only
+    fails its own message; a dropped connection raises.
+    """
+    settings = get_settings()
+    errors: list[Optional[str]] = []
+    with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=30) as server:
+        server.starttls()
+        server.login(settings.SMTP_USERNAME, smtp_password)
+        for message in messages:
+            try:
+                server.sendmail(
+                    sender_email,
+                    message.to_email,
+                    _mime(message, sender_email, sender_name).as_string(),
+                )
+                errors.append(None)
+            except (
+                smtplib.SMTPRecipientsRefused,
+                smtplib.SMTPDataError,
+                smtplib.SMTPSenderRefused,
+            ) as e:
+                errors.append(f"{type(e).__name__}: {e}")
+    return errors
+
+
+async def send_email_batch(
+    messages: Sequence[EmailMessage],
+    from_email: Optional[str] = None,
+    from_name: Optional[str] = None,
+) -> BatchSendResult:
+    """
+    Send up to ``MAX_BATCH_SIZE`` messages from one sender in a single provider
+    call. Over Brevo that is one ``messageVersions`` request (each version
+    carries its own recipient, subject and content); over SMTP it is one
+    authenticated session.
+
+    Never raises for provider or network failures — the outcome is in the
+    returned ``BatchSendResult``.
+    """
+    if len(messages) > MAX_BATCH_SIZE:
+        raise ValueError(f"at most {MAX_BATCH_SIZE} messages per batch")
+    if not messages:
+        return BatchSendResult(delivered=[])
+    settings = get_settings()
+    sender_email = from_email or settings.DEFAULT_FROM_EMAIL
+    sender_name = from_name or settings.DEFAULT_FROM_NAME
+
+    api_key = getattr(settings, "BREVO_API_KEY", "") or ""
+    if api_key:
+        return await _send_batch_via_brevo_api(
+            api_key, messages, sender_email, sender_name
+        )
+    return await _send_batch_via_smtp(messages, sender_email, sender_name)
+
+
+def _brevo_batch_payload(
+    messages: Sequence[EmailMessage], sender_email: str, sender_name: str
+) -> dict:
+    first = messages[0]
+    # Top-level content is only a default, and Brevo prefers an inherited
+    # htmlContent over a version's own textContent, so the top level stays
+    # text-only and every version carries its own body.
+    payload: dict = {
+        "sender": {"email": sender_email, "name": sender_name},
+        "subject": first.subject,
+        "textContent": first.body,
+    }
+    versions = []
+    for m in messages:
+        version: dict = {"to": [{"email": m.to_email}], "textContent": m.body}
+        if m.subject != first.subject:
+            version["subject"] = m.subject
+        if m.html_body:
+            version["htmlContent"] = m.html_body
+        versions.append(version)
+    payload["messageVersions"] = versions
+    return payload
+
+
+async def _send_batch_via_brevo_api(
+    api_key: str,
+    messages: Sequence[EmailMessage],
+    sender_email: str,
+    sender_name: str,
+) -> BatchSendResult:
+    pacer = provider_pacer("brevo")
+    payload = _brevo_batch_payload(messages, sender_email, sender_name)
+    try:
+        await pacer.acquire()
+        resp = await _brevo_http().post(
+            _brevo_url(), headers=_brevo_headers(api_key), json=payload
+        )
+    except httpx.HTTPError as e:
+        return BatchSendResult(
+            delivered=[False] * len(messages),
+            retryable=True,
+            error=f"{type(e).__name__}: {e}",
+        )
+
+    if resp.status_code in (200, 201):
+        ids = resp.json().get("messageIds") or []
+        return BatchSendResult(delivered=[True] * len(messages), message_ids=ids)
+
+    retry_after = None
+    if resp.status_code == 429:
+        retry_after = _brevo_retry_after(resp)
+        pacer.pause(retry_after)
+    return BatchSendResult(
+        delivered=[False] * len(messages),
+        retryable=resp.status_code == 429 or resp.status_code >= 500,
+        retry_after=retry_after,
+        error=f"Brevo {resp.status_code}: {resp.text[:300]}",
+    )
+
+
+async def _send_batch_via_smtp(
+    messages: Sequence[EmailMessage], sender_email: str, sender_name: str
+) -> BatchSendResult:
+    settings = get_settings()
+    smtp_password = _get_smtp_password()
+    if not smtp_password or not settings.SMTP_USERNAME:
+        logger.warning("SMTP not configured - %d emails not sent", len(messages))
+        return BatchSendResult(
+            delivered=[False] * len(messages), error="SMTP not configured"
+        )
+    try:
+        await provider_pacer("smtp").acquire()
+        errors = await asyncio.to_thread(
+            _smtp_send_all, messages, sender_email, sender_name, smtp_password
+        )
+    except smtplib.SMTPAuthenticationError as e:
+        return BatchSendResult(
+            delivered=[False] * len(messages), error=f"SMTP auth failed: {e}"
+        )
+    except Exception as e:
+        return BatchSendResult(
+            delivered=[False] * len(messages),
+            retryable=True,
+            error=f"{type(e).__name__}: {e}",
+        )
+    rejected = [e for e in errors if e]
+    return BatchSendResult(
+        delivered=[e is None for e in errors],
+        error="; ".join(rejected[:3]) or None,
+    )
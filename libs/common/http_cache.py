@@ -0,0 +1,21 @@
+"""HTTP conditional-request helpers shared across services."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an ``If-None-Match`` header against ``etag``.
+
+    Accepts comma-separated lists, ``W/`` tags and ``*``, as browsers and
+    proxies send them.
+    """
+    if not if_none_match:
+        return False
+
+    def opaque(tag: str) -> str:
+        return tag.strip().removeprefix("W/")
+
+    tags = {opaque(tag) for tag in if_none_match.split(",")}
+    return "*" in tags or opaque(etag) in tags
@@ -15,13 +15,21 @@ this in a bare ``except: pass``.
 
 The full posting endpoint lands in PR-2 (task P1.6); this module is the stable
 client contract (tasks P0.7 / P1.10).
+
+``JournalEntryBatcher`` keeps that contract for high-volume emitters
+(backfills, replays, settlement runs): entries posted within a short window
+travel in one ``/journal-entries/batch`` request, but each ``post`` call still
+resolves to its own entry's result or RAISES for its own entry.
 """
 
 from __future__ import annotations
 
+import asyncio
 from datetime import date, datetime
 from typing import Any, Optional, TypedDict, Union
 
+import httpx
+
 from libs.common.config import get_settings
 
 from .service_client.core import internal_post
@@ -56,6 +64,33 @@ def _to_iso_date(value: Union[str, date, datetime]) -> str:
     return value.isoformat()
 
 
+def _entry_payload(
+    *,
+    entry_date: Union[str, date, datetime],
+    description: str,
+    source_service: str,
+    source_type: str,
+    source_id: str,
+    lines: list[JournalLineSpec],
+    org_id: Optional[str] = None,
+    metadata: Optional[dict] = None,
+) -> dict[str, Any]:
+    """Build the ``JournalEntryCreate`` body (idempotency key derived from source)."""
+    payload: dict[str, Any] = {
+        "idempotency_key": f"{source_service}:{source_type}:{source_id}",
+        "entry_date": _to_iso_date(entry_date),
+        "description": description,
+        "source_service": source_service,
+        "source_type": source_type,
+        "source_id": source_id,
+        "lines": lines,
+        "metadata": metadata or {},
+    }
+    if org_id is not None:
+        payload["org_id"] = org_id
+    return payload
+
+
 async def post_journal_entry(
     *,
     entry_date: Union[str, date, datetime],
@@ -94,19 +129,16 @@ async def post_journal_entry(
         must catch and dead-letter (do NOT swallow). See plan §5 / P1.8.
     """
     settings = get_settings()
-    idempotency_key = f"{source_service}:{source_type}:{source_id}"
-    payload: dict[str, Any] = {
-        "idempotency_key": idempotency_key,
-        "entry_date": _to_iso_date(entry_date),
-        "description": description,
-        "source_service": source_service,
-        "source_type": source_type,
-        "source_id": source_id,
-        "lines": lines,
-        "metadata": metadata or {},
-    }
-    if org_id is not None:
-        payload["org_id"] = org_id
+    payload = _entry_payload(
+        entry_date=entry_date,
+        description=description,
+        source_service=source_service,
+        source_type=source_type,
+        source_id=source_id,
+        lines=lines,
+        org_id=org_id,
+        metadata=metadata,
+    )
 
     resp = await internal_post(
         service_url=settings.LEDGER_SERVICE_URL,
@@ -118,6 +150,147 @@ async def post_journal_entry(
     return resp.json()
 
 
+async def post_journal_entries(
+    *,
+    entries: list[dict],
+    calling_service: str,
+) -> dict:
+    """Post many ``JournalEntryCreate`` bodies in one request (max 500).
+
+    Returns the ledger's ``JournalEntryBatchResult`` dict — ``items`` in request
+    order, each with either ``result`` or ``error``/``error_status``. RAISES only
+    for a failure of the request as a whole; per-entry rejections come back in
+    the body (``JournalEntryBatcher`` turns those into per-entry exceptions).
+    """
+    settings = get_settings()
+    resp = await internal_post(
+        service_url=settings.LEDGER_SERVICE_URL,
+        path="/internal/ledger/journal-entries/batch",
+        calling_service=calling_service,
+        json={"entries": entries},
+    )
+    resp.raise_for_status()
+    return resp.json()
+
+
+class JournalEntryBatcher:
+    """Coalesce journal entries emitted within a short window into batch posts.
+
+    ``await batcher.post(**kwargs)`` takes ``post_journal_entry``'s kwargs (minus
+    ``calling_service``) and has the same contract: it returns that entry's
+    ``JournalEntryResult`` dict or RAISES — ``httpx.HTTPStatusError`` (400/409)
+    if the ledger rejected this entry, or the batch request's own error — so
+    callers keep dead-lettering per entry. A batch is sent once ``max_batch``
+    entries are waiting or ``max_wait`` seconds after the first one arrived.
+
+        async with JournalEntryBatcher(calling_service="payments") as batcher:
+            results = await asyncio.gather(
+                *(batcher.post(**kw) for kw in kwargs_list), return_exceptions=True
+            )
+    """
+
+    def __init__(
+        self,
+        *,
+        calling_service: str,
+        max_batch: int = 200,
+        max_wait: float = 0.05,
+    ) -> None:
+        self.calling_service = calling_service
+        self.max_batch = max(1, min(max_batch, 500))
+        self.max_wait = max_wait
+        self._pending: list[tuple[dict, asyncio.Future]] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._in_flight: set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> "JournalEntryBatcher":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.flush()
+
+    async def post(self, **kwargs: Any) -> dict:
+        """Queue one entry; resolves when its batch has been posted."""
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending.append((_entry_payload(**kwargs), future))
+        if len(self._pending) >= self.max_batch:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._dispatch_after_wait())
+        return await future
+
+    async def flush(self) -> None:
+        """Send whatever is queued and wait for every in-flight batch."""
+        if self._pending:
+            self._dispatch()
+        while self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    async def _dispatch_after_wait(self) -> None:
+        await asyncio.sleep(self.max_wait)
+        self._timer = None
+        if self._pending:
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        batch, self._pending = self._pending, []
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+        task = asyncio.create_task(self._send(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, batch: list[tuple[dict, asyncio.Future]]) -> None:
+        try:
+            body = await post_journal_entries(
+                entries=[payload for payload, _ in batch],
+                calling_service=self.calling_service,
+            )
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 422 and len(batch) > 1:
+                # One schema-invalid entry fails the whole request — retry
+                # singly so every entry gets its own verdict.
+                for item in batch:
+                    await self._send([item])
+                return
+            _fail_all(batch, exc)
+            return
+        except Exception as exc:  # noqa: BLE001 — surfaced per entry, not lost
+            _fail_all(batch, exc)
+            return
+
+        settings = get_settings()
+        request = httpx.Request(
+            "POST",
+            f"{settings.LEDGER_SERVICE_URL}/internal/ledger/journal-entries/batch",
+        )
+        for (_, future), item in zip(batch, body["items"]):
+            if future.done():
+                continue
+            if item.get("result") is not None:
+                future.set_result(item["result"])
+                continue
+            response = httpx.Response(
+                item.get("error_status") or 400,
+                json={"detail": item.get("error")},
+                request=request,
+            )
+            future.set_exception(
+                httpx.HTTPStatusError(
+                    f"ledger rejected {item['idempotency_key']}: {item.get('error')}",
+                    request=request,
+                    response=response,
+                )
+            )
+
+
+def _fail_all(batch: list[tuple[dict, asyncio.Future]], exc: BaseException) -> None:
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(exc)
+
+
 async def post_external_transactions(
     *,
     transactions: list[dict],
@@ -213,6 +386,8 @@ async def create_invoice(
 
 __all__ = [
     "post_journal_entry",
+    "post_journal_entries",
+    "JournalEntryBatcher",
     "post_external_transactions",
     "create_invoice",
     "JournalLineSpec",
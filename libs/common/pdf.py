@@ -1,17 +1,206 @@
 """
 PDF generation utilities using ReportLab.
+
+Styles (``getSampleStyleSheet()``, the custom ``ParagraphStyle``s and
+``TableStyle``s) and the fixed header/body paragraphs are built once per
+process and reused by every document — building them used to dominate the
+cost of a small report. Use ``render_progress_reports`` /
+``render_certificates`` to render many documents in one call (e.g. one
+process-pool task per batch).
+
+Certificates are deterministic for their inputs: ``certificate_digest``
+content-addresses a certificate (inputs + ``CERTIFICATE_TEMPLATE_VERSION``)
+so callers can store the rendered bytes once and serve them as an
+immutable artifact. Bump the version whenever the certificate layout
+changes.
 """
 
+import hashlib
 import io
+import json
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional
 
 from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.styles import ParagraphStyle, StyleSheet1, getSampleStyleSheet
 from reportlab.lib.units import inch
 from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
 
+CERTIFICATE_TEMPLATE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class _Styles:
+    sample: StyleSheet1
+    # Progress report
+    title: ParagraphStyle
+    heading: ParagraphStyle
+    footer: ParagraphStyle
+    info_table: TableStyle
+    summary_table: TableStyle
+    milestone_table: TableStyle
+    # Certificate
+    cert_title: ParagraphStyle
+    cert_subtitle: ParagraphStyle
+    cert_name: ParagraphStyle
+    cert_body: ParagraphStyle
+    cert_footer: ParagraphStyle
+
+
+@lru_cache(maxsize=None)
+def _styles() -> _Styles:
+    """All paragraph/table styles, built once per process."""
+    styles = getSampleStyleSheet()
+    return _Styles(
+        sample=styles,
+        title=ParagraphStyle(
+            "CustomTitle",
+            parent=styles["Heading1"],
+            fontSize=24,
+            textColor=colors.HexColor("#0891b2"),
+            spaceAfter=20,
+        ),
+        heading=ParagraphStyle(
+            "CustomHeading",
+            parent=styles["Heading2"],
+            fontSize=14,
+            textColor=colors.HexColor("#1e293b"),
+            spaceBefore=20,
+            spaceAfter=10,
+        ),
+        footer=ParagraphStyle(
+            "Footer",
+            parent=styles["Normal"],
+            fontSize=9,
+            textColor=colors.HexColor("#94a3b8"),
+            alignment=1,  # Center
+        ),
+        info_table=TableStyle(
+            [
+                ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+                ("FONTSIZE", (0, 0), (-1, -1), 11),
+                ("TEXTCOLOR", (0, 0), (0, -1), colors.HexColor("#64748b")),
+                ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+            ]
+        ),
+        summary_table=TableStyle(
+            [
+                ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+                ("FONTSIZE", (0, 0), (-1, -1), 11),
+                ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#f8fafc")),
+                ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#e2e8f0")),
+                ("PADDING", (0, 0), (-1, -1), 10),
+            ]
+        ),
+        milestone_table=TableStyle(
+            [
+                # Header
+                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#0891b2")),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("FONTSIZE", (0, 0), (-1, 0), 10),
+                # Body
+                ("FONTSIZE", (0, 1), (-1, -1), 9),
+                ("BACKGROUND", (0, 1), (-1, -1), colors.white),
+                ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#e2e8f0")),
+                ("PADDING", (0, 0), (-1, -1), 8),
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ]
+        ),
+        cert_title=ParagraphStyle(
+            "CertTitle",
+            parent=styles["Heading1"],
+            fontSize=36,
+            textColor=colors.HexColor("#0891b2"),
+            alignment=1,  # Center
+            spaceAfter=10,
+        ),
+        cert_subtitle=ParagraphStyle(
+            "CertSubtitle",
+            parent=styles["Normal"],
+            fontSize=14,
+            textColor=colors.HexColor("#64748b"),
+            alignment=1,
+            spaceAfter=30,
+        ),
+        cert_name=ParagraphStyle(
+            "CertName",
+            parent=styles["Heading1"],
+            fontSize=28,
+            textColor=colors.HexColor("#1e293b"),
+            alignment=1,
+            spaceBefore=20,
+            spaceAfter=20,
+        ),
+        cert_body=ParagraphStyle(
+            "CertBody",
+            parent=styles["Normal"],
+            fontSize=14,
+            textColor=colors.HexColor("#475569"),
+            alignment=1,
+            spaceAfter=10,
+        ),
+        cert_footer=ParagraphStyle(
+            "CertFooter",
+            parent=styles["Normal"],
+            fontSize=10,
+            textColor=colors.HexColor("#94a3b8"),
+            alignment=1,
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class _StaticParagraphs:
+    """Fixed text, parsed once per process and shared by every document.
+
+    Paragraph markup parsing happens in the constructor; wrapping/drawing
+    doesn't mutate a paragraph that fits its frame, so these are safe to
+    reuse across builds.
+    """
+
+    report_title: Paragraph
+    report_subtitle: Paragraph
+    report_milestones_heading: Paragraph
+    report_summary_heading: Paragraph
+    report_no_milestones: Paragraph
+    cert_title: Paragraph
+    cert_subtitle: Paragraph
+    cert_certify: Paragraph
+    cert_completed: Paragraph
+    cert_verify_url: Paragraph
+
+
+@lru_cache(maxsize=None)
+def _static() -> _StaticParagraphs:
+    s = _styles()
+    return _StaticParagraphs(
+        report_title=Paragraph("🏊‍♂️ SwimBuddz Academy", s.title),
+        report_subtitle=Paragraph("Progress Report", s.sample["Heading2"]),
+        report_summary_heading=Paragraph("Progress Summary", s.heading),
+        report_milestones_heading=Paragraph("Milestone Details", s.heading),
+        report_no_milestones=Paragraph(
+            "No milestone progress recorded yet.", s.sample["Normal"]
+        ),
+        cert_title=Paragraph("🏊‍♂️ SwimBuddz Academy", s.cert_title),
+        cert_subtitle=Paragraph("Certificate of Completion", s.cert_subtitle),
+        cert_certify=Paragraph("This is to certify that", s.cert_body),
+        cert_completed=Paragraph(
+            "has successfully completed all requirements for",
+            s.cert_body,
+        ),
+        cert_verify_url=Paragraph("Verify at swimbuddz.com/verify", s.cert_footer),
+    )
+
+
+def _build(elements: list, **doc_kwargs) -> bytes:
+    buffer = io.BytesIO()
+    SimpleDocTemplate(buffer, **doc_kwargs).build(elements)
+    return buffer.getvalue()
+
 
 def generate_progress_report_pdf(
     student_name: str,
@@ -32,40 +221,13 @@ def generate_progress_report_pdf(
 
     Returns PDF as bytes for email attachment or download.
     """
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        rightMargin=0.75 * inch,
-        leftMargin=0.75 * inch,
-        topMargin=0.75 * inch,
-        bottomMargin=0.75 * inch,
-    )
-
-    styles = getSampleStyleSheet()
+    s = _styles()
+    static = _static()
     elements = []
 
-    # Custom styles
-    title_style = ParagraphStyle(
-        "CustomTitle",
-        parent=styles["Heading1"],
-        fontSize=24,
-        textColor=colors.HexColor("#0891b2"),
-        spaceAfter=20,
-    )
-    heading_style = ParagraphStyle(
-        "CustomHeading",
-        parent=styles["Heading2"],
-        fontSize=14,
-        textColor=colors.HexColor("#1e293b"),
-        spaceBefore=20,
-        spaceAfter=10,
-    )
-    normal_style = styles["Normal"]
-
     # Header
-    elements.append(Paragraph("🏊‍♂️ SwimBuddz Academy", title_style))
-    elements.append(Paragraph("Progress Report", styles["Heading2"]))
+    elements.append(static.report_title)
+    elements.append(static.report_subtitle)
     elements.append(Spacer(1, 20))
 
     # Student Info
@@ -79,22 +241,13 @@ def generate_progress_report_pdf(
     if coach_name:
         info_data.append(["Coach:", coach_name])
 
-    info_table = Table(info_data, colWidths=[1.5 * inch, 4 * inch])
-    info_table.setStyle(
-        TableStyle(
-            [
-                ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, -1), 11),
-                ("TEXTCOLOR", (0, 0), (0, -1), colors.HexColor("#64748b")),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-            ]
-        )
+    elements.append(
+        Table(info_data, colWidths=[1.5 * inch, 4 * inch], style=s.info_table)
     )
-    elements.append(info_table)
     elements.append(Spacer(1, 20))
 
     # Progress Summary
-    elements.append(Paragraph("Progress Summary", heading_style))
+    elements.append(static.report_summary_heading)
     completion_rate = (
         round((completed_milestones / total_milestones) * 100)
         if total_milestones > 0
@@ -105,23 +258,13 @@ def generate_progress_report_pdf(
         ["Completed:", str(completed_milestones)],
         ["Completion Rate:", f"{completion_rate}%"],
     ]
-    summary_table = Table(summary_data, colWidths=[2 * inch, 2 * inch])
-    summary_table.setStyle(
-        TableStyle(
-            [
-                ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, -1), 11),
-                ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#f8fafc")),
-                ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#e2e8f0")),
-                ("PADDING", (0, 0), (-1, -1), 10),
-            ]
-        )
+    elements.append(
+        Table(summary_data, colWidths=[2 * inch, 2 * inch], style=s.summary_table)
     )
-    elements.append(summary_table)
     elements.append(Spacer(1, 20))
 
     # Milestones Table
-    elements.append(Paragraph("Milestone Details", heading_style))
+    elements.append(static.report_milestones_heading)
     if milestones:
         # Table header
         milestone_data = [["Milestone", "Status", "Date", "Coach Notes"]]
@@ -135,51 +278,34 @@ def generate_progress_report_pdf(
                 notes = notes[:37] + "..."
             milestone_data.append([m.get("name", "Unknown"), status, date_str, notes])
 
-        milestone_table = Table(
-            milestone_data, colWidths=[2 * inch, 1 * inch, 1 * inch, 2.5 * inch]
-        )
-        milestone_table.setStyle(
-            TableStyle(
-                [
-                    # Header
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#0891b2")),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 10),
-                    # Body
-                    ("FONTSIZE", (0, 1), (-1, -1), 9),
-                    ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#e2e8f0")),
-                    ("PADDING", (0, 0), (-1, -1), 8),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ]
+        elements.append(
+            Table(
+                milestone_data,
+                colWidths=[2 * inch, 1 * inch, 1 * inch, 2.5 * inch],
+                style=s.milestone_table,
             )
         )
-        elements.append(milestone_table)
     else:
-        elements.append(Paragraph("No milestone progress recorded yet.", normal_style))
+        elements.append(static.report_no_milestones)
 
     elements.append(Spacer(1, 30))
 
     # Footer
-    footer_style = ParagraphStyle(
-        "Footer",
-        parent=normal_style,
-        fontSize=9,
-        textColor=colors.HexColor("#94a3b8"),
-        alignment=1,  # Center
-    )
     elements.append(
         Paragraph(
             f"Generated by SwimBuddz Academy • {report_date_str}",
-            footer_style,
+            s.footer,
         )
     )
 
-    # Build PDF
-    doc.build(elements)
-    buffer.seek(0)
-    return buffer.getvalue()
+    return _build(
+        elements,
+        pagesize=A4,
+        rightMargin=0.75 * inch,
+        leftMargin=0.75 * inch,
+        topMargin=0.75 * inch,
+        bottomMargin=0.75 * inch,
+    )
 
 
 def generate_certificate_pdf(
@@ -194,107 +320,65 @@ def generate_certificate_pdf(
     Returns PDF as bytes for email attachment or download.
     Landscape A4 format with professional styling.
     """
-    from reportlab.lib.pagesizes import A4 as A4_SIZE
-    from reportlab.lib.pagesizes import landscape
-
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=landscape(A4_SIZE),
+    s = _styles()
+    static = _static()
+    completion_str = completion_date.strftime("%B %d, %Y")
+    elements = [
+        Spacer(1, 40),
+        static.cert_title,
+        static.cert_subtitle,
+        Spacer(1, 20),
+        static.cert_certify,
+        Paragraph(f"<b>{student_name}</b>", s.cert_name),
+        static.cert_completed,
+        Paragraph(f"<b>{program_name}</b>", s.cert_name),
+        Spacer(1, 30),
+        Paragraph(f"Completed on {completion_str}", s.cert_body),
+        Spacer(1, 50),
+        Paragraph(f"Verification Code: <b>{verification_code}</b>", s.cert_footer),
+        static.cert_verify_url,
+    ]
+    # invariant: no creation timestamp / random document ID, so the same
+    # inputs always produce the same bytes (see certificate_digest).
+    return _build(
+        elements,
+        pagesize=landscape(A4),
         rightMargin=1 * inch,
         leftMargin=1 * inch,
         topMargin=0.75 * inch,
         bottomMargin=0.75 * inch,
+        invariant=1,
     )
 
-    styles = getSampleStyleSheet()
-    elements = []
-
-    # Title style
-    title_style = ParagraphStyle(
-        "CertTitle",
-        parent=styles["Heading1"],
-        fontSize=36,
-        textColor=colors.HexColor("#0891b2"),
-        alignment=1,  # Center
-        spaceAfter=10,
-    )
-
-    # Subtitle style
-    subtitle_style = ParagraphStyle(
-        "CertSubtitle",
-        parent=styles["Normal"],
-        fontSize=14,
-        textColor=colors.HexColor("#64748b"),
-        alignment=1,
-        spaceAfter=30,
-    )
-
-    # Name style
-    name_style = ParagraphStyle(
-        "CertName",
-        parent=styles["Heading1"],
-        fontSize=28,
-        textColor=colors.HexColor("#1e293b"),
-        alignment=1,
-        spaceBefore=20,
-        spaceAfter=20,
-    )
 
-    # Body style
-    body_style = ParagraphStyle(
-        "CertBody",
-        parent=styles["Normal"],
-        fontSize=14,
-        textColor=colors.HexColor("#475569"),
-        alignment=1,
-        spaceAfter=10,
-    )
-
-    # Footer style
-    footer_style = ParagraphStyle(
-        "CertFooter",
-        parent=styles["Normal"],
-        fontSize=10,
-        textColor=colors.HexColor("#94a3b8"),
-        alignment=1,
+def certificate_digest(
+    student_name: str,
+    program_name: str,
+    completion_date: datetime,
+    verification_code: str,
+) -> str:
+    """Content address (sha256 hex) of the certificate for these inputs."""
+    payload = json.dumps(
+        [
+            CERTIFICATE_TEMPLATE_VERSION,
+            student_name,
+            program_name,
+            completion_date.strftime("%B %d, %Y"),
+            verification_code,
+        ]
     )
+    return hashlib.sha256(payload.encode()).hexdigest()
 
-    # Build certificate content
-    elements.append(Spacer(1, 40))
-    elements.append(Paragraph("🏊‍♂️ SwimBuddz Academy", title_style))
-    elements.append(Paragraph("Certificate of Completion", subtitle_style))
-    elements.append(Spacer(1, 20))
 
-    elements.append(Paragraph("This is to certify that", body_style))
-    elements.append(Paragraph(f"<b>{student_name}</b>", name_style))
-    elements.append(
-        Paragraph(
-            "has successfully completed all requirements for",
-            body_style,
-        )
-    )
-    elements.append(Paragraph(f"<b>{program_name}</b>", name_style))
+def render_progress_reports(reports: Iterable[dict]) -> list[bytes]:
+    """Render many progress reports (``generate_progress_report_pdf`` kwargs).
 
-    completion_str = completion_date.strftime("%B %d, %Y")
-    elements.append(Spacer(1, 30))
-    elements.append(Paragraph(f"Completed on {completion_str}", body_style))
+    One call per batch amortises per-call overhead (e.g. process-pool
+    pickling) on top of the shared styles.
+    """
+    return [generate_progress_report_pdf(**report) for report in reports]
 
-    elements.append(Spacer(1, 50))
-    elements.append(
-        Paragraph(
-            f"Verification Code: <b>{verification_code}</b>",
-            footer_style,
-        )
-    )
-    elements.append(
-        Paragraph(
-            "Verify at swimbuddz.com/verify",
-            footer_style,
-        )
-    )
 
-    # Build PDF
-    doc.build(elements)
-    buffer.seek(0)
-    return buffer.getvalue()
+def render_certificates(certificates: Iterable[dict]) -> list[bytes]:
+    """Render many certificates (``generate_certificate_pdf`` kwargs)."""
+    return [generate_certificate_pdf(**cert) for cert in certificates]
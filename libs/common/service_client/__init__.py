@@ -13,7 +13,7 @@ New code may import directly from a submodule
 from __future__ import annotations
 
 from .academy import check_cohort_enrollment, list_enrollment_progress
-from .attendance import get_member_attendance
+from .attendance import get_member_attendance, get_session_attendee_ids_bulk
 from .communications import dispatch_notification
 from .core import (
     _DEFAULT_TIMEOUT,
@@ -22,6 +22,7 @@ from .core import (
     internal_patch,
     internal_post,
     internal_request,
+    internal_stream,
 )
 from .media import (
     create_media_direct_upload,
@@ -33,6 +34,7 @@ from .media import (
 from .members import (
     get_admin_members,
     get_birthdays_today,
+    get_coach_availabilities_bulk,
     get_coach_availability,
     get_coach_profile,
     get_coach_readiness_data,
@@ -42,8 +44,11 @@ from .members import (
     get_member_membership,
     get_members_bulk,
     get_pod_by_id,
+    iter_active_members,
+    iter_approved_members,
     list_pods,
     search_members,
+    search_members_page,
 )
 from .pools import get_partner_pool
 from .payments import (
@@ -65,7 +70,9 @@ from .sessions import (
     get_confirmed_booking_member_ids,
     get_next_session_for_cohort,
     get_session_by_id,
+    get_session_coach_ids_bulk,
     get_session_ids_for_cohort,
+    get_sessions_bulk,
 )
 from .volunteer import (
     cancel_opportunities_for_context,
@@ -75,8 +82,10 @@ from .volunteer import (
 from .wallet import (
     check_wallet_balance,
     credit_member_wallet,
+    credit_member_wallets,
     debit_member_wallet,
     emit_rewards_event,
+    emit_rewards_events,
     get_wallet_balance,
     grant_challenge_reward_bubbles,
     grant_pool_submission_reward,
@@ -90,6 +99,7 @@ __all__ = [
     "internal_post",
     "internal_patch",
     "internal_delete",
+    "internal_stream",
     # Media
     "create_media_direct_upload",
     "verify_media_object",
@@ -99,8 +109,12 @@ __all__ = [
     # Members
     "get_member_by_auth_id",
     "search_members",
+    "search_members_page",
+    "iter_active_members",
+    "iter_approved_members",
     "get_member_by_id",
     "get_members_bulk",
+    "get_coach_availabilities_bulk",
     "get_coach_availability",
     "get_coach_profile",
     "get_member_membership",
@@ -117,12 +131,15 @@ __all__ = [
     "list_enrollment_progress",
     # Attendance
     "get_member_attendance",
+    "get_session_attendee_ids_bulk",
     # Sessions
     "get_booking_by_id",
     "generate_cohort_sessions",
     "get_completed_session_ids_for_cohort",
     "get_confirmed_booking_member_ids",
     "get_session_by_id",
+    "get_session_coach_ids_bulk",
+    "get_sessions_bulk",
     "get_next_session_for_cohort",
     "get_session_ids_for_cohort",
     # Wallet
@@ -131,8 +148,10 @@ __all__ = [
     "grant_challenge_reward_bubbles",
     "debit_member_wallet",
     "credit_member_wallet",
+    "credit_member_wallets",
     "check_wallet_balance",
     "emit_rewards_event",
+    "emit_rewards_events",
     # Volunteer
     "grant_challenge_volunteer_hours",
     "cancel_opportunities_for_context",
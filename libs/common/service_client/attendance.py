@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from libs.common.config import get_settings
 
-from .core import internal_get
+from .core import internal_get, internal_post
 
 
 async def get_member_attendance(
@@ -31,3 +31,20 @@ async def get_member_attendance(
         return []
     resp.raise_for_status()
     return resp.json()
+
+
+async def get_session_attendee_ids_bulk(
+    session_ids: list[str], *, calling_service: str
+) -> dict[str, list[str]]:
+    """Distinct attendee member IDs keyed by session ID."""
+    if not session_ids:
+        return {}
+    settings = get_settings()
+    resp = await internal_post(
+        service_url=settings.ATTENDANCE_SERVICE_URL,
+        path="/internal/attendance/sessions/member-ids",
+        calling_service=calling_service,
+        json={"session_ids": session_ids},
+    )
+    resp.raise_for_status()
+    return resp.json()
@@ -7,7 +7,8 @@ other services directly.
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
 
 import httpx
 
@@ -18,6 +19,15 @@ from libs.common.logging import get_request_id
 _DEFAULT_TIMEOUT = 10.0
 
 
+def _internal_headers(calling_service: str) -> dict[str, str]:
+    headers = {"Authorization": f"Bearer {_service_role_jwt(calling_service)}"}
+    request_id = get_request_id()
+    if request_id:
+        headers["X-Request-ID"] = request_id
+    headers["X-Caller-Service"] = calling_service
+    return headers
+
+
 async def internal_request(
     *,
     service_url: str,
@@ -46,17 +56,11 @@ async def internal_request(
         httpx.RequestError on connection failures.
     """
     url = f"{service_url}{path}"
-    headers = {"Authorization": f"Bearer {_service_role_jwt(calling_service)}"}
-    request_id = get_request_id()
-    if request_id:
-        headers["X-Request-ID"] = request_id
-    headers["X-Caller-Service"] = calling_service
-
     async with httpx.AsyncClient(timeout=timeout) as client:
         response = await client.request(
             method,
             url,
-            headers=headers,
+            headers=_internal_headers(calling_service),
             json=json,
             params=params,
         )
@@ -82,6 +86,31 @@ async def internal_get(
     )
 
 
+@asynccontextmanager
+async def internal_stream(
+    *,
+    service_url: str,
+    path: str,
+    calling_service: str,
+    params: Optional[dict] = None,
+    timeout: float = _DEFAULT_TIMEOUT,
+) -> AsyncIterator[httpx.Response]:
+    """Authenticated streaming GET; the body is read lazily.
+
+    Use as ``async with internal_stream(...) as resp:`` and iterate
+    ``resp.aiter_lines()`` / ``resp.aiter_bytes()``. ``timeout`` applies per
+    read, not to the whole body.
+    """
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        async with client.stream(
+            "GET",
+            f"{service_url}{path}",
+            headers=_internal_headers(calling_service),
+            params=params,
+        ) as response:
+            yield response
+
+
 async def internal_post(
     *,
     service_url: str,
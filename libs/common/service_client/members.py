@@ -6,11 +6,12 @@ admin rosters, eligible coaches, and the pod helpers used by sessions_service.
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import json
+from typing import Any, AsyncIterator, Optional
 
 from libs.common.config import get_settings
 
-from .core import internal_get, internal_post
+from .core import internal_get, internal_post, internal_stream
 
 
 async def get_member_by_auth_id(
@@ -50,6 +51,67 @@ async def search_members(
     return resp.json()
 
 
+async def search_members_page(
+    query: str,
+    *,
+    calling_service: str,
+    limit: int = 50,
+    after: Optional[str] = None,
+) -> tuple[list[dict], Optional[str]]:
+    """One page of ranked member search results plus the next-page cursor.
+
+    Pass the returned cursor back as ``after`` to continue; None means the
+    results are exhausted.
+    """
+    settings = get_settings()
+    params: dict = {"q": query, "limit": limit}
+    if after:
+        params["after"] = after
+    resp = await internal_get(
+        service_url=settings.MEMBERS_SERVICE_URL,
+        path="/internal/members/search",
+        calling_service=calling_service,
+        params=params,
+    )
+    resp.raise_for_status()
+    return resp.json(), resp.headers.get("X-Next-Cursor")
+
+
+async def _iter_ndjson(path: str, *, calling_service: str) -> AsyncIterator[dict]:
+    settings = get_settings()
+    async with internal_stream(
+        service_url=settings.MEMBERS_SERVICE_URL,
+        path=path,
+        calling_service=calling_service,
+    ) as resp:
+        resp.raise_for_status()
+        async for line in resp.aiter_lines():
+            if line:
+                yield json.loads(line)
+
+
+def iter_active_members(*, calling_service: str) -> AsyncIterator[dict]:
+    """Yield active members one at a time from the NDJSON stream.
+
+    Same dicts as ``/internal/members/active`` ({id, auth_id, first_name,
+    last_name, email, phone}) without materialising the whole roster.
+    """
+    return _iter_ndjson(
+        "/internal/members/active/stream", calling_service=calling_service
+    )
+
+
+def iter_approved_members(*, calling_service: str) -> AsyncIterator[dict]:
+    """Yield approved, active members one at a time from the NDJSON stream.
+
+    Same dicts as ``/internal/members/approved-list`` ({id, auth_id,
+    first_name, last_name, primary_tier}).
+    """
+    return _iter_ndjson(
+        "/internal/members/approved-list/stream", calling_service=calling_service
+    )
+
+
 async def get_member_by_id(member_id: str, *, calling_service: str) -> Optional[dict]:
     """Look up a member by their member ID.
 
@@ -130,6 +192,27 @@ async def get_coach_availability(
     return resp.json()
 
 
+async def get_coach_availabilities_bulk(
+    member_ids: list[str], *, calling_service: str
+) -> list[dict]:
+    """Bulk-lookup coach availability calendars + spacing overrides.
+
+    Returns a list of {member_id, availability_calendar,
+    min_hours_between_sessions}; members without a coach profile are omitted.
+    """
+    if not member_ids:
+        return []
+    settings = get_settings()
+    resp = await internal_post(
+        service_url=settings.MEMBERS_SERVICE_URL,
+        path="/internal/members/coaches/availability/bulk",
+        calling_service=calling_service,
+        json={"ids": member_ids},
+    )
+    resp.raise_for_status()
+    return resp.json()
+
+
 async def get_member_membership(
     member_id: str, *, calling_service: str
 ) -> Optional[dict]:
@@ -26,6 +26,40 @@ async def get_session_by_id(session_id: str, *, calling_service: str) -> Optiona
     return resp.json()
 
 
+async def get_sessions_bulk(
+    session_ids: list[str], *, calling_service: str
+) -> list[dict]:
+    """Bulk-lookup sessions by IDs. Unknown IDs are omitted from the result."""
+    if not session_ids:
+        return []
+    settings = get_settings()
+    resp = await internal_post(
+        service_url=settings.SESSIONS_SERVICE_URL,
+        path="/internal/sessions/bulk",
+        calling_service=calling_service,
+        json={"ids": session_ids},
+    )
+    resp.raise_for_status()
+    return resp.json()
+
+
+async def get_session_coach_ids_bulk(
+    session_ids: list[str], *, calling_service: str
+) -> dict[str, list[str]]:
+    """Coach member IDs keyed by session ID."""
+    if not session_ids:
+        return {}
+    settings = get_settings()
+    resp = await internal_post(
+        service_url=settings.SESSIONS_SERVICE_URL,
+        path="/internal/sessions/coaches/bulk",
+        calling_service=calling_service,
+        json={"ids": session_ids},
+    )
+    resp.raise_for_status()
+    return resp.json()
+
+
 async def get_next_session_for_cohort(
     cohort_id: str, *, calling_service: str
 ) -> Optional[dict]:
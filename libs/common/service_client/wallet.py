@@ -170,6 +170,48 @@ async def credit_member_wallet(
     return resp.json()
 
 
+async def credit_member_wallets(
+    credits: list[dict],
+    *,
+    calling_service: str,
+) -> list[dict]:
+    """Credit many wallets in one call (``POST /internal/wallet/credit/bulk``).
+
+    Each dict takes the keyword arguments of ``credit_member_wallet`` except
+    ``calling_service``, with the member under ``auth_id``. The wallet
+    service applies the batch in one transaction (at most 500 credits).
+
+    Returns one dict per credit, in order, with {idempotency_key, success,
+    transaction_id, balance_after, detail}; ``success`` is False for a
+    member without a wallet. Raises httpx errors on failure.
+    """
+    if not credits:
+        return []
+    settings = get_settings()
+    resp = await internal_post(
+        service_url=settings.WALLET_SERVICE_URL,
+        path="/internal/wallet/credit/bulk",
+        calling_service=calling_service,
+        json={
+            "credits": [
+                {
+                    "idempotency_key": credit["idempotency_key"],
+                    "member_auth_id": credit["auth_id"],
+                    "amount": credit["amount"],
+                    "transaction_type": credit.get("transaction_type", "refund"),
+                    "description": credit["description"],
+                    "service_source": calling_service,
+                    "reference_type": credit.get("reference_type"),
+                    "reference_id": credit.get("reference_id"),
+                }
+                for credit in credits
+            ]
+        },
+    )
+    resp.raise_for_status()
+    return resp.json()["results"]
+
+
 async def check_wallet_balance(
     auth_id: str,
     *,
@@ -241,3 +283,47 @@ async def emit_rewards_event(
             exc_info=True,
         )
         return None
+
+
+async def emit_rewards_events(
+    events: list[dict],
+    *,
+    calling_service: str,
+) -> Optional[list[dict]]:
+    """Emit many rewards events in one call (``POST /internal/wallet/events/batch``).
+
+    Each dict takes the keyword arguments of ``emit_rewards_event`` except
+    ``calling_service``; ``event_id`` and ``occurred_at`` default as there.
+    The wallet service processes the batch in one transaction. Best-effort
+    like ``emit_rewards_event``: returns None on failure, otherwise one
+    result dict per event, in order.
+    """
+    if not events:
+        return []
+    settings = get_settings()
+    now = utc_now().isoformat()
+    payload = [
+        {
+            "event_id": str(uuid.uuid4()),
+            "member_id": None,
+            "occurred_at": now,
+            **event,
+        }
+        for event in events
+    ]
+    try:
+        resp = await internal_post(
+            service_url=settings.WALLET_SERVICE_URL,
+            path="/internal/wallet/events/batch",
+            calling_service=calling_service,
+            json={"events": payload},
+        )
+        resp.raise_for_status()
+        return resp.json()["results"]
+    except Exception:
+        logger.warning(
+            "Failed to emit a batch of %d rewards events (best-effort, continuing)",
+            len(events),
+            exc_info=True,
+        )
+        return None
@@ -0,0 +1,277 @@
+"""Benchmark the coach dashboard: per-step queries vs aggregated + cached.
+
+Seeds a coach with ``--cohorts`` cohorts of ``--students`` students each
+(a third of them with a claim awaiting review) and builds the dashboard
+three ways, with each members-service call simulated by ``--http-ms`` of
+sleep:
+
+  * original   — the old endpoint's shape: member lookup, then coach
+                 profile, then cohorts (+ selectin programs), student
+                 counts, enrollment ids, pending-review count and the
+                 next session's enrolled count, one after another
+  * aggregated — member lookup, then the coach profile overlapped with
+                 ``load_coach_dashboard`` (three grouped queries)
+  * cached     — a warm hit: the cached-summary Redis GET (only with
+                 ``--redis``; needs a reachable ``REDIS_URL``)
+
+Reports median / p95 latency and queries per request. Everything runs in
+one transaction that is rolled back, so nothing persists. Run in-container:
+
+    docker compose exec academy-service \\
+        python scripts/academy/bench_coach_dashboard.py --cohorts 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import timedelta
+
+from libs.common.config import get_settings
+from libs.common.datetime_utils import utc_now
+from services.academy_service.models import (
+    BillingType,
+    Cohort,
+    CohortStatus,
+    Enrollment,
+    EnrollmentSource,
+    EnrollmentStatus,
+    LocationType,
+    Milestone,
+    MilestoneType,
+    PaymentStatus,
+    Program,
+    ProgramLevel,
+    ProgressStatus,
+    RequiredEvidence,
+    StudentProgress,
+)
+from services.academy_service.services import coach_dashboard
+from sqlalchemy import event, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import selectinload, sessionmaker
+
+
+async def _seed(session: AsyncSession, cohorts: int, students: int) -> uuid.UUID:
+    now = utc_now()
+    coach_id = uuid.uuid4()
+    program = Program(
+        id=uuid.uuid4(),
+        name="Bench Programme",
+        slug=f"bench-{uuid.uuid4().hex[:6]}",
+        level=ProgramLevel.BEGINNER_1,
+        duration_weeks=12,
+        default_capacity=students,
+        currency="NGN",
+        price_amount=150000,
+        billing_type=BillingType.ONE_TIME,
+        is_published=True,
+        version=1,
+    )
+    milestone = Milestone(
+        id=uuid.uuid4(),
+        program_id=program.id,
+        name="Float",
+        criteria="Float on back for 10 seconds",
+        order_index=0,
+        milestone_type=MilestoneType.SKILL,
+        required_evidence=RequiredEvidence.NONE,
+    )
+    session.add_all([program, milestone])
+    await session.flush()
+
+    enrollment_rows, progress_rows = [], []
+    for i in range(cohorts):
+        cohort = Cohort(
+            id=uuid.uuid4(),
+            program_id=program.id,
+            coach_id=coach_id,
+            name=f"Bench cohort {i}",
+            start_date=now + timedelta(days=i * 7 - 30),
+            end_date=now + timedelta(days=i * 7 + 54),
+            capacity=students,
+            timezone="Africa/Lagos",
+            location_type=LocationType.POOL.value,
+            location_name="Sunfit Pool",
+            status=(CohortStatus.ACTIVE if i % 3 == 0 else CohortStatus.OPEN).value,
+        )
+        session.add(cohort)
+        for n in range(students):
+            enrollment_id = uuid.uuid4()
+            enrollment_rows.append(
+                {
+                    "id": enrollment_id,
+                    "cohort_id": cohort.id,
+                    "program_id": program.id,
+                    "member_id": uuid.uuid4(),
+                    "member_auth_id": str(uuid.uuid4()),
+                    "status": (
+                        EnrollmentStatus.PENDING_APPROVAL
+                        if n % 10 == 0
+                        else EnrollmentStatus.ENROLLED
+                    ),
+                    "payment_status": PaymentStatus.PAID,
+                    "price_snapshot_amount": 150000,
+                    "currency_snapshot": "NGN",
+                    "source": EnrollmentSource.WEB,
+                    "enrolled_at": now,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+            if n % 3 == 0:
+                progress_rows.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "enrollment_id": enrollment_id,
+                        "milestone_id": milestone.id,
+                        "status": ProgressStatus.PENDING,
+                    }
+                )
+    await session.flush()
+    await session.execute(insert(Enrollment), enrollment_rows)
+    if progress_rows:
+        await session.execute(insert(StudentProgress), progress_rows)
+    await session.flush()
+    return coach_id
+
+
+async def _original(session: AsyncSession, coach_id: uuid.UUID, http_s: float):
+    """The pre-aggregation endpoint body (counts only, no response model)."""
+    await asyncio.sleep(http_s)  # member by auth id
+    await asyncio.sleep(http_s)  # coach profile
+    cohorts = (
+        (
+            await session.execute(
+                select(Cohort)
+                .where(Cohort.coach_id == coach_id)
+                .options(selectinload(Cohort.program))
+            )
+        )
+        .scalars()
+        .all()
+    )
+    cohort_ids = [c.id for c in cohorts]
+    await session.execute(
+        select(
+            func.count(Enrollment.id).filter(
+                Enrollment.status == EnrollmentStatus.ENROLLED
+            ),
+            func.count(Enrollment.id).filter(
+                Enrollment.status == EnrollmentStatus.PENDING_APPROVAL
+            ),
+        ).where(Enrollment.cohort_id.in_(cohort_ids))
+    )
+    enrollment_ids = (
+        (
+            await session.execute(
+                select(Enrollment.id).where(
+                    Enrollment.cohort_id.in_(cohort_ids),
+                    Enrollment.status == EnrollmentStatus.ENROLLED,
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+    await session.execute(
+        select(func.count(StudentProgress.id)).where(
+            StudentProgress.enrollment_id.in_(enrollment_ids),
+            StudentProgress.status == ProgressStatus.PENDING,
+            StudentProgress.reviewed_at.is_(None),
+        )
+    )
+    active = next((c for c in cohorts if c.status == CohortStatus.ACTIVE), None)
+    if active:
+        await session.execute(
+            select(func.count(Enrollment.id)).where(
+                Enrollment.cohort_id == active.id,
+                Enrollment.status == EnrollmentStatus.ENROLLED,
+            )
+        )
+    session.expunge_all()
+
+
+async def _aggregated(session: AsyncSession, coach_id: uuid.UUID, http_s: float):
+    await asyncio.sleep(http_s)  # member by auth id
+    await asyncio.gather(
+        asyncio.sleep(http_s),  # coach profile
+        coach_dashboard.load_coach_dashboard(session, coach_id),
+    )
+
+
+async def _cached(session: AsyncSession, coach_id: uuid.UUID, http_s: float):
+    await coach_dashboard.get_cached_dashboard(coach_id)
+
+
+async def _measure(label, fn, session, coach_id, http_s, repeats, statements):
+    timings = []
+    statements.clear()
+    for _ in range(repeats):
+        started = time.perf_counter()
+        await fn(session, coach_id, http_s)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(
+        f"  {label:10s} median {statistics.median(timings):8.1f} ms   "
+        f"p95 {p95:8.1f} ms   {len(statements) / repeats:4.1f} queries/request"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cohorts", type=int, default=40)
+    parser.add_argument("--students", type=int, default=25)
+    parser.add_argument("--http-ms", type=float, default=30)
+    parser.add_argument("--repeats", type=int, default=30)
+    parser.add_argument(
+        "--redis", action="store_true", help="time a warm Redis cache hit too"
+    )
+    args = parser.parse_args()
+
+    engine = create_async_engine(
+        get_settings().DATABASE_URL, connect_args={"prepare_threshold": 0}
+    )
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, params, context, executemany):
+        statements.append(statement)
+
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_factory() as session:
+            coach_id = await _seed(session, args.cohorts, args.students)
+            print(
+                f"coach with {args.cohorts} cohorts x {args.students} students, "
+                f"{args.http_ms:.0f} ms per members-service call"
+            )
+            event.listen(engine.sync_engine, "before_cursor_execute", _count)
+            http_s = args.http_ms / 1000
+            for label, fn in (("original", _original), ("aggregated", _aggregated)):
+                await _measure(
+                    label, fn, session, coach_id, http_s, args.repeats, statements
+                )
+            if args.redis:
+                await coach_dashboard.cache_dashboard(coach_id, {"bench": True})
+                await _measure(
+                    "cached",
+                    _cached,
+                    session,
+                    coach_id,
+                    http_s,
+                    args.repeats,
+                    statements,
+                )
+                await coach_dashboard.invalidate_coach_dashboards(coach_id)
+            event.remove(engine.sync_engine, "before_cursor_execute", _count)
+            await session.rollback()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,190 @@
+"""Benchmark the installment billing sweeps' delivery phase.
+
+Builds ``--installments`` synthetic due installments (spread over
+``--members`` members) and runs the per-installment work two ways, with
+each internal HTTP call simulated by ``--http-ms`` of latency:
+
+  * sequential — the original loop: ``get_member_by_id``, then the
+                 Paystack ``/internal/payments/initialize`` call, then the
+                 email, awaited one installment at a time
+  * set-based  — one ``get_members_bulk`` call, then
+                 ``deliver_installment_notices`` minting links and sending
+                 emails ``--concurrency`` at a time
+
+Reports wall time, installments/second and HTTP calls made. The DB query
+is unchanged between the two (one select + selectin load) and is not
+timed. No database or network. Run in-container:
+
+    docker compose exec academy-worker \\
+        python scripts/academy/bench_installment_sweeps.py --installments 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from services.academy_service.tasks import billing
+from services.academy_service.tasks.billing import (
+    BILLING_SWEEP_CONCURRENCY,
+    InstallmentNotice,
+    deliver_installment_notices,
+)
+
+DUE = datetime(2026, 10, 25, 9, 0, tzinfo=timezone.utc)
+
+
+class _SimulatedServices:
+    """Stand-ins for the members / payments / communications calls."""
+
+    def __init__(self, latency_s: float, members: dict[str, dict]):
+        self.latency_s = latency_s
+        self.members = members
+        self.calls = 0
+
+    async def _hop(self) -> None:
+        self.calls += 1
+        await asyncio.sleep(self.latency_s)
+
+    async def get_member_by_id(self, member_id: str, **kwargs):
+        await self._hop()
+        return self.members.get(member_id)
+
+    async def get_members_bulk(self, member_ids: list[str], **kwargs):
+        await self._hop()
+        return [self.members[m] for m in member_ids if m in self.members]
+
+    async def internal_post(self, **kwargs):
+        await self._hop()
+        return SimpleNamespace(
+            status_code=200,
+            text="",
+            json=lambda: {"authorization_url": "https://checkout.bench/x"},
+        )
+
+    async def send_template(self, **kwargs) -> bool:
+        await self._hop()
+        return True
+
+
+def _fixtures(installments: int, members: int):
+    member_rows = {}
+    for i in range(members):
+        member_id = str(uuid.uuid4())
+        member_rows[member_id] = {
+            "id": member_id,
+            "email": f"student{i}@bench.test",
+            "first_name": f"Student {i}",
+        }
+    member_ids = list(member_rows)
+    cohort = SimpleNamespace(id=uuid.uuid4(), name="October Cohort")
+    program = SimpleNamespace(name="Learn to Swim")
+    due = []
+    for i in range(installments):
+        enrollment = SimpleNamespace(
+            id=uuid.uuid4(),
+            member_id=member_ids[i % members],
+            member_auth_id=str(uuid.uuid4()),
+            currency_snapshot="NGN",
+            total_installments=3,
+            reminders_sent=[],
+        )
+        installment = SimpleNamespace(
+            id=uuid.uuid4(),
+            installment_number=i % 3 + 1,
+            amount=5_000_000,
+            due_at=DUE,
+        )
+        due.append((installment, enrollment, cohort, program))
+    return member_rows, due
+
+
+async def _sequential(due, services: _SimulatedServices) -> None:
+    for installment, enrollment, cohort, program in due:
+        member = await services.get_member_by_id(str(enrollment.member_id))
+        if not member:
+            continue
+        notice = InstallmentNotice(
+            installment=installment,
+            enrollment=enrollment,
+            cohort=cohort,
+            program=program,
+            member=member,
+            reminder_key=f"installment_{installment.installment_number}_7d",
+            days_until=7,
+        )
+        checkout_url = await billing._mint_checkout_url(notice)
+        await services.send_template(
+            template_type="installment_payment_reminder",
+            to_email=member["email"],
+            template_data={"checkout_url": checkout_url},
+        )
+
+
+async def _set_based(due, services: _SimulatedServices, concurrency: int) -> None:
+    members = await billing._members_by_id(e.member_id for _, e, _, _ in due)
+    notices = [
+        InstallmentNotice(
+            installment=installment,
+            enrollment=enrollment,
+            cohort=cohort,
+            program=program,
+            member=members[str(enrollment.member_id)],
+            reminder_key=f"installment_{installment.installment_number}_7d",
+            days_until=7,
+        )
+        for installment, enrollment, cohort, program in due
+    ]
+    await deliver_installment_notices(notices, services, concurrency=concurrency)
+
+
+async def _run(label: str, work, services: _SimulatedServices, count: int) -> None:
+    services.calls = 0
+    started = time.perf_counter()
+    await work
+    elapsed = time.perf_counter() - started
+    print(
+        f"  {label:10s} {elapsed:8.1f} s   {count / elapsed:8.0f} installments/s   "
+        f"{services.calls:,} HTTP calls"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--installments", type=int, default=5000)
+    parser.add_argument("--members", type=int, default=4000)
+    parser.add_argument("--http-ms", type=float, default=40)
+    parser.add_argument("--concurrency", type=int, default=BILLING_SWEEP_CONCURRENCY)
+    parser.add_argument(
+        "--skip-sequential", action="store_true", help="only run the set-based path"
+    )
+    args = parser.parse_args()
+
+    member_rows, due = _fixtures(args.installments, args.members)
+    services = _SimulatedServices(args.http_ms / 1000, member_rows)
+    print(
+        f"{args.installments} due installments over {args.members} members, "
+        f"{args.http_ms:.0f} ms per HTTP call, concurrency {args.concurrency}"
+    )
+    with (
+        patch.object(billing, "get_members_bulk", services.get_members_bulk),
+        patch.object(billing, "internal_post", services.internal_post),
+        patch.object(billing.logger, "info", lambda *a, **k: None),
+    ):
+        if not args.skip_sequential:
+            await _run("sequential", _sequential(due, services), services, len(due))
+        await _run(
+            "set-based",
+            _set_based(due, services, args.concurrency),
+            services,
+            len(due),
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
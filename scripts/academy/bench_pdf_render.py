@@ -0,0 +1,131 @@
+"""Micro-benchmark ReportLab rendering in libs.common.pdf (PDFs/sec).
+
+Renders ``--count`` progress reports (12 milestones) and certificates
+three ways:
+
+  * rebuilt   — styles and fixed paragraphs rebuilt on every call (the
+                original behaviour; emulated by clearing the caches)
+  * cached    — per-process style / static-paragraph cache
+  * batched   — ``render_progress_reports`` / ``render_certificates`` in
+                batches of ``--batch`` across a ``--processes`` pool
+
+Pure CPU — no database or network. Run:
+
+    python scripts/academy/bench_pdf_render.py --count 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from libs.common import pdf
+
+NOW = datetime(2026, 10, 18, 8, 0, tzinfo=timezone.utc)
+
+
+def _report(i: int) -> dict:
+    return {
+        "student_name": f"Student {i}",
+        "program_name": "Learn to Swim",
+        "cohort_name": "October Cohort",
+        "start_date": NOW - timedelta(days=45),
+        "end_date": NOW + timedelta(days=45),
+        "milestones": [
+            {
+                "name": f"Milestone {n}",
+                "status": "achieved" if n < 6 else "pending",
+                "achieved_at": NOW - timedelta(days=n) if n < 6 else None,
+                "coach_notes": "Keep elbows high" if n % 3 == 0 else None,
+            }
+            for n in range(12)
+        ],
+        "total_milestones": 12,
+        "completed_milestones": 6,
+        "report_date": NOW,
+    }
+
+
+def _certificate(i: int) -> dict:
+    return {
+        "student_name": f"Student {i}",
+        "program_name": "Learn to Swim",
+        "completion_date": NOW,
+        "verification_code": f"SB-2026-{i:08X}",
+    }
+
+
+def _rebuilt(render, items: list[dict]) -> None:
+    for item in items:
+        pdf._styles.cache_clear()
+        pdf._static.cache_clear()
+        render(**item)
+
+
+def _cached(render, items: list[dict]) -> None:
+    for item in items:
+        render(**item)
+
+
+def _batched(render_many, items: list[dict], processes: int, batch: int) -> float:
+    chunks = [items[i : i + batch] for i in range(0, len(items), batch)]
+    with ProcessPoolExecutor(
+        max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        # Warm the workers (imports, style cache) outside the timing.
+        list(pool.map(render_many, [items[:1]] * processes))
+        started = time.perf_counter()
+        list(pool.map(render_many, chunks))
+        return time.perf_counter() - started
+
+
+def _rate(count: int, seconds: float) -> str:
+    return f"{count / seconds:8.0f} PDFs/s"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--batch", type=int, default=25)
+    args = parser.parse_args()
+
+    cases = [
+        (
+            "progress report",
+            pdf.generate_progress_report_pdf,
+            pdf.render_progress_reports,
+            [_report(i) for i in range(args.count)],
+        ),
+        (
+            "certificate",
+            pdf.generate_certificate_pdf,
+            pdf.render_certificates,
+            [_certificate(i) for i in range(args.count)],
+        ),
+    ]
+    print(f"{args.count} documents each, pool of {args.processes}, batch {args.batch}")
+    for label, render, render_many, items in cases:
+        render(**items[0])  # font / module warm-up
+
+        started = time.perf_counter()
+        _rebuilt(render, items)
+        rebuilt = time.perf_counter() - started
+
+        started = time.perf_counter()
+        _cached(render, items)
+        cached = time.perf_counter() - started
+
+        batched = _batched(render_many, items, args.processes, args.batch)
+        print(
+            f"  {label:16s} rebuilt {_rate(len(items), rebuilt)}   "
+            f"cached {_rate(len(items), cached)}   "
+            f"batched {_rate(len(items), batched)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Benchmark weekly academy progress-report delivery (PDF render + email).
+
+Builds ``--enrollments`` synthetic reports (a 12-milestone programme with
+mixed progress and coach notes) and delivers them two ways, with email
+sends simulated by ``--email-ms`` of latency:
+
+  * inline    — the original loop: render each PDF on the event loop,
+                then await its email before moving to the next student
+  * pipeline  — ``deliver_progress_reports``: PDFs in a process pool,
+                emails ``PROGRESS_EMAIL_CONCURRENCY`` at a time
+
+Reports throughput (reports/minute) and the longest event-loop stall seen
+by a 10 ms ticker — the time other ARQ jobs on the worker would have been
+starved. No database or network. Run in-container:
+
+    docker compose exec academy-worker \\
+        python scripts/academy/bench_progress_reports.py --enrollments 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from libs.common.pdf import generate_progress_report_pdf
+from services.academy_service.tasks.reporting import (
+    PDF_RENDER_PROCESSES,
+    ProgressReport,
+    deliver_progress_reports,
+)
+
+NOW = datetime(2026, 10, 18, 8, 0, tzinfo=timezone.utc)
+MILESTONES = [
+    "Water confidence",
+    "Breath control",
+    "Front float",
+    "Back float",
+    "Flutter kick",
+    "Glide",
+    "Freestyle arms",
+    "Side breathing",
+    "Backstroke",
+    "Treading water",
+    "Deep-water entry",
+    "25 m freestyle",
+]
+
+
+class _SimulatedEmail:
+    def __init__(self, latency_s: float):
+        self.latency_s = latency_s
+
+    async def send_template(self, **kwargs) -> bool:
+        await asyncio.sleep(self.latency_s)
+        return True
+
+
+def _reports(count: int) -> list[ProgressReport]:
+    rng = random.Random(5)
+    reports = []
+    for i in range(count):
+        done = rng.randrange(0, len(MILESTONES) + 1)
+        milestones = [
+            {
+                "name": name,
+                "status": "achieved" if n < done else "pending",
+                "achieved_at": (
+                    NOW - timedelta(days=rng.randrange(1, 60)) if n < done else None
+                ),
+                "coach_notes": "Keep elbows high" if rng.random() < 0.3 else None,
+            }
+            for n, name in enumerate(MILESTONES)
+        ]
+        reports.append(
+            ProgressReport(
+                to_email=f"student{i}@bench.test",
+                template_data={"member_name": f"Student {i}"},
+                pdf_kwargs={
+                    "student_name": f"Student {i}",
+                    "program_name": "Learn to Swim",
+                    "cohort_name": "October Cohort",
+                    "start_date": NOW - timedelta(days=45),
+                    "end_date": NOW + timedelta(days=45),
+                    "milestones": milestones,
+                    "total_milestones": len(MILESTONES),
+                    "completed_milestones": done,
+                    "report_date": NOW,
+                },
+            )
+        )
+    return reports
+
+
+async def _inline(reports, email_client) -> None:
+    for report in reports:
+        generate_progress_report_pdf(**report.pdf_kwargs)
+        await email_client.send_template(
+            template_type="progress_report",
+            to_email=report.to_email,
+            template_data=report.template_data,
+        )
+
+
+async def _run(label: str, work, count: int) -> None:
+    stall = 0.0
+    stop = asyncio.Event()
+
+    async def _ticker():
+        nonlocal stall
+        last = time.perf_counter()
+        while not stop.is_set():
+            await asyncio.sleep(0.01)
+            now = time.perf_counter()
+            stall = max(stall, now - last - 0.01)
+            last = now
+
+    ticker = asyncio.create_task(_ticker())
+    started = time.perf_counter()
+    await work
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker
+    print(
+        f"  {label:9s} {elapsed:7.1f} s   {count / elapsed * 60:8.0f} reports/min   "
+        f"longest loop stall {stall * 1000:8.1f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--enrollments", type=int, default=2000)
+    parser.add_argument("--email-ms", type=float, default=80)
+    parser.add_argument("--processes", type=int, default=PDF_RENDER_PROCESSES)
+    parser.add_argument(
+        "--skip-inline", action="store_true", help="only run the pipeline"
+    )
+    args = parser.parse_args()
+
+    reports = _reports(args.enrollments)
+    email_client = _SimulatedEmail(args.email_ms / 1000)
+    print(
+        f"{args.enrollments} reports, {args.email_ms:.0f} ms per email, "
+        f"{args.processes} render processes"
+    )
+    if not args.skip_inline:
+        await _run("inline", _inline(reports, email_client), len(reports))
+    await _run(
+        "pipeline",
+        deliver_progress_reports(reports, email_client, processes=args.processes),
+        len(reports),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
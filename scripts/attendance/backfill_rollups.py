@@ -0,0 +1,103 @@
+"""One-off backfill: session durations + weekly attendance rollups.
+
+Why: ``attendance_records.session_minutes`` and ``attendance_weekly_rollups``
+are maintained on every attendance write, and the migration builds the
+rollups from the records it finds, but records written before then carry no
+duration. Member stats look those sessions up in sessions_service on every
+call until this has run. This
+
+  1. fills ``session_minutes`` for records missing it, from sessions_service
+     (``/internal/sessions/bulk``, 500 sessions per call), then
+  2. rebuilds every member's weekly rollups from the records in one
+     ``INSERT … SELECT``.
+
+Both steps are idempotent — re-running just recomputes the same values.
+Dry-run by default (everything is rolled back); pass --commit to keep it.
+
+Must run inside the compose network (to reach sessions-service):
+
+  docker compose exec attendance-service \\
+    python scripts/attendance/backfill_rollups.py            # dry-run
+  ...  python scripts/attendance/backfill_rollups.py --commit
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from libs.common.config import get_settings
+from libs.common.service_client import get_sessions_bulk
+from services.attendance_service.models import AttendanceRecord
+from services.attendance_service.rollups import (
+    SESSION_LOOKUP_CHUNK,
+    rebuild_attendance_rollups,
+    session_minutes,
+)
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+
+async def _fill_session_minutes(session: AsyncSession) -> tuple[int, int]:
+    session_ids = [
+        str(sid)
+        for sid in (
+            await session.execute(
+                select(AttendanceRecord.session_id)
+                .where(AttendanceRecord.session_minutes.is_(None))
+                .distinct()
+            )
+        ).scalars()
+    ]
+    filled = 0
+    for start in range(0, len(session_ids), SESSION_LOOKUP_CHUNK):
+        sessions = await get_sessions_bulk(
+            session_ids[start : start + SESSION_LOOKUP_CHUNK],
+            calling_service="attendance",
+        )
+        params = [
+            {"sid": s["id"], "minutes": minutes}
+            for s in sessions
+            if (minutes := session_minutes(s)) is not None
+        ]
+        if params:
+            await session.execute(
+                update(AttendanceRecord)
+                .where(
+                    AttendanceRecord.session_id == bindparam("sid"),
+                    AttendanceRecord.session_minutes.is_(None),
+                )
+                .values(session_minutes=bindparam("minutes"))
+                .execution_options(synchronize_session=False),
+                params,
+            )
+            filled += len(params)
+    return len(session_ids), filled
+
+
+async def main(commit: bool) -> None:
+    engine = create_async_engine(
+        get_settings().DATABASE_URL, connect_args={"prepare_threshold": 0}
+    )
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with factory() as session:
+            print(f"mode: {'COMMIT' if commit else 'DRY-RUN (rolled back)'}")
+            missing, filled = await _fill_session_minutes(session)
+            print(f"sessions missing a duration: {missing}, filled: {filled}")
+            rows = await rebuild_attendance_rollups(session)
+            print(f"weekly rollup rows written: {rows}")
+            if commit:
+                await session.commit()
+            else:
+                await session.rollback()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commit", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(main(args.commit))
@@ -0,0 +1,167 @@
+"""Benchmark member attendance stats over years of history.
+
+Seeds members with several years of attendance (a few sessions a week,
+mixed statuses), builds their weekly rollups and times the stats for one
+member over a quarter and over the whole history, two ways:
+
+  * raw scan — the original shape: load every record in the range, count
+               in Python, then one sessions_service durations call
+               (simulated with ``--http-ms`` of sleep)
+  * rollups  — ``member_attendance_stats`` (weekly rollups + edge weeks)
+
+Everything runs in one transaction that is rolled back, so nothing
+persists. Run in-container:
+
+    docker compose exec attendance-service \\
+        python scripts/attendance/bench_member_stats.py --years 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from libs.common.config import get_settings
+from services.attendance_service.models import (
+    AttendanceRecord,
+    AttendanceRole,
+    AttendanceStatus,
+)
+from services.attendance_service.rollups import (
+    member_attendance_stats,
+    rebuild_attendance_rollups,
+)
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+END = datetime(2026, 9, 30, 23, 59, tzinfo=timezone.utc)
+STATUSES = [AttendanceStatus.PRESENT] * 7 + [
+    AttendanceStatus.LATE,
+    AttendanceStatus.ABSENT,
+    AttendanceStatus.EXCUSED,
+]
+
+
+async def _seed(session: AsyncSession, members: int, years: int, per_week: int):
+    rng = random.Random(7)
+    start = END - timedelta(days=365 * years)
+    member_ids = [uuid.uuid4() for _ in range(members)]
+    rows = []
+    for member_id in member_ids:
+        at = start
+        while at < END:
+            for _ in range(per_week):
+                created = at + timedelta(minutes=rng.randrange(0, 7 * 24 * 60))
+                rows.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "session_id": uuid.uuid4(),
+                        "member_id": member_id,
+                        "status": rng.choice(STATUSES),
+                        "role": AttendanceRole.SWIMMER,
+                        "session_minutes": rng.choice((60, 90, 120)),
+                        "created_at": created,
+                        "updated_at": created,
+                    }
+                )
+            at += timedelta(weeks=1)
+    for i in range(0, len(rows), 1000):
+        await session.execute(insert(AttendanceRecord), rows[i : i + 1000])
+    await rebuild_attendance_rollups(session, member_ids)
+    await session.flush()
+    return member_ids, len(rows), start
+
+
+async def _raw_scan(session, member_id, date_from, date_to, http_s):
+    records = (
+        (
+            await session.execute(
+                select(AttendanceRecord).where(
+                    AttendanceRecord.member_id == member_id,
+                    AttendanceRecord.created_at >= date_from,
+                    AttendanceRecord.created_at <= date_to,
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+    attended = [
+        r
+        for r in records
+        if r.status in (AttendanceStatus.PRESENT, AttendanceStatus.LATE)
+    ]
+    status_counts = Counter(r.status for r in records)
+    day_counts = Counter(r.created_at.strftime("%A") for r in attended)
+    weeks = {r.created_at.isocalendar()[1] for r in attended}
+    await asyncio.sleep(http_s)  # /internal/sessions/durations
+    return status_counts, day_counts, weeks
+
+
+async def _time_ms(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=50)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--per-week", type=int, default=4)
+    parser.add_argument("--http-ms", type=float, default=25)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_async_engine(
+        get_settings().DATABASE_URL, connect_args={"prepare_threshold": 0}
+    )
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_factory() as session:
+            started = time.perf_counter()
+            member_ids, total, history_start = await _seed(
+                session, args.members, args.years, args.per_week
+            )
+            print(
+                f"seeded {total:,} records for {args.members} members over "
+                f"{args.years} years in {time.perf_counter() - started:.1f}s"
+            )
+            member_id = member_ids[0]
+            ranges = {
+                "quarter": (END - timedelta(days=91), END),
+                "history": (history_start, END),
+            }
+            for label, (date_from, date_to) in ranges.items():
+                raw_ms = await _time_ms(
+                    lambda: _raw_scan(
+                        session, member_id, date_from, date_to, args.http_ms / 1000
+                    ),
+                    args.repeat,
+                )
+                rollup_ms = await _time_ms(
+                    lambda: member_attendance_stats(
+                        session, member_id, date_from, date_to
+                    ),
+                    args.repeat,
+                )
+                print(
+                    f"  {label:8s} raw scan {raw_ms:8.1f} ms   "
+                    f"rollups {rollup_ms:8.1f} ms"
+                )
+            await session.rollback()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
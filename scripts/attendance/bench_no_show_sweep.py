@@ -0,0 +1,170 @@
+"""Benchmark the nightly NO_SHOW sweep over a week of bookings.
+
+Builds a week of sessions with confirmed bookings (a share of them already
+marked) and runs the sweep's decision + insert work two ways:
+
+  * per booking — the original loop: one existence SELECT and one session
+                  HTTP lookup per booking, ORM add per miss
+  * set-based   — one bulk session call, then ``mark_no_shows`` (tuple-IN
+                  anti-join, multi-row INSERT … ON CONFLICT DO NOTHING)
+
+sessions_service is simulated in-process; each HTTP call costs
+``--http-ms`` of sleep. Reports wall time, SQL statements and rows/sec.
+Everything runs in one transaction that is rolled back, so nothing
+persists. Run in-container:
+
+    docker compose exec attendance-service \
+        python scripts/attendance/bench_no_show_sweep.py --bookings 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from libs.common.config import get_settings
+from services.attendance_service.models import (
+    AttendanceRecord,
+    AttendanceRole,
+    AttendanceStatus,
+)
+from services.attendance_service.tasks import _parse_iso, mark_no_shows
+from sqlalchemy import event, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+NOW = datetime.now(timezone.utc)
+
+
+def _week(rng: random.Random, bookings: int, sessions: int):
+    session_rows = {}
+    for _ in range(sessions):
+        ends_at = NOW - timedelta(minutes=rng.randrange(-12 * 60, 7 * 24 * 60))
+        sid = str(uuid.uuid4())
+        session_rows[sid] = {"id": sid, "ends_at": ends_at.isoformat()}
+    ids = list(session_rows)
+    booking_rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "session_id": rng.choice(ids),
+            "member_id": str(uuid.uuid4()),
+        }
+        for _ in range(bookings)
+    ]
+    return booking_rows, session_rows
+
+
+async def _seed_marked(session: AsyncSession, bookings, share: float, rng) -> None:
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "session_id": uuid.UUID(b["session_id"]),
+            "member_id": uuid.UUID(b["member_id"]),
+            "status": AttendanceStatus.PRESENT,
+            "role": AttendanceRole.SWIMMER,
+            "created_at": NOW,
+            "updated_at": NOW,
+        }
+        for b in bookings
+        if rng.random() < share
+    ]
+    for start in range(0, len(rows), 1000):
+        await session.execute(insert(AttendanceRecord), rows[start : start + 1000])
+    await session.flush()
+
+
+async def _per_booking(session: AsyncSession, bookings, sessions, http_s: float):
+    created = 0
+    for booking in bookings:
+        session_id = uuid.UUID(booking["session_id"])
+        member_id = uuid.UUID(booking["member_id"])
+        existing = (
+            await session.execute(
+                select(AttendanceRecord).where(
+                    AttendanceRecord.session_id == session_id,
+                    AttendanceRecord.member_id == member_id,
+                )
+            )
+        ).scalar_one_or_none()
+        if existing is not None:
+            continue
+        await asyncio.sleep(http_s)
+        ends_at = _parse_iso(sessions[booking["session_id"]]["ends_at"])
+        if ends_at is None or ends_at > NOW:
+            continue
+        session.add(
+            AttendanceRecord(
+                session_id=session_id,
+                member_id=member_id,
+                status=AttendanceStatus.ABSENT,
+                role=AttendanceRole.SWIMMER,
+                booking_id=uuid.UUID(booking["id"]),
+            )
+        )
+        created += 1
+    await session.flush()
+    return created
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bookings", type=int, default=5000)
+    parser.add_argument("--sessions", type=int, default=120)
+    parser.add_argument("--marked", type=float, default=0.7, help="share marked")
+    parser.add_argument("--http-ms", type=float, default=15)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    bookings, sessions = _week(rng, args.bookings, args.sessions)
+    http_s = args.http_ms / 1000
+
+    engine = create_async_engine(
+        get_settings().DATABASE_URL, connect_args={"prepare_threshold": 0}
+    )
+    statements = 0
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count(*_args) -> None:
+        nonlocal statements
+        statements += 1
+
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_factory() as session:
+            await _seed_marked(session, bookings, args.marked, rng)
+            print(
+                f"{args.bookings:,} bookings over {args.sessions} sessions, "
+                f"{args.marked:.0%} already marked, {args.http_ms:.0f} ms/HTTP call"
+            )
+
+            savepoint = await session.begin_nested()
+            statements = 0
+            started = time.perf_counter()
+            created = await _per_booking(session, bookings, sessions, http_s)
+            elapsed = time.perf_counter() - started
+            print(
+                f"  per booking  {elapsed * 1000:9.0f} ms  {statements:6d} statements  "
+                f"{args.bookings / elapsed:9.0f} rows/s  ({created} created)"
+            )
+            await savepoint.rollback()
+
+            statements = 0
+            started = time.perf_counter()
+            await asyncio.sleep(http_s)  # one bulk sessions call
+            counts = await mark_no_shows(session, bookings, sessions, now=NOW)
+            elapsed = time.perf_counter() - started
+            print(
+                f"  set-based    {elapsed * 1000:9.0f} ms  {statements:6d} statements  "
+                f"{args.bookings / elapsed:9.0f} rows/s  ({counts['created']} created)"
+            )
+            await session.rollback()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,146 @@
+"""Benchmark email delivery throughput for a session announcement.
+
+Starts ``brevo_stub`` in-process on a local port, points the Brevo settings at
+it, renders one announcement per member and sends them two ways:
+
+  * serial, client per email — the pre-outbox announcement loop
+  * outbox batches           — ``send_batches`` (messageVersions, bounded
+                               concurrency, paced under the stub's limit)
+
+The serial path is timed on a sample and extrapolated. No database is touched;
+``deliver_outbox`` adds one claim and one bulk update per page on top of this.
+Run from the repo root:
+
+    python scripts/communications/bench_outbox.py --members 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import time
+import uuid
+
+import httpx
+import uvicorn
+from libs.common.config import get_settings
+from libs.common.emails import core as email_core
+from scripts.communications.brevo_stub import create_app
+from services.communications_service.services.email_outbox import (
+    OutboundBatch,
+    send_batches,
+)
+from services.communications_service.templates.session_notifications import (
+    render_session_announcement_email,
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _render(members: int):
+    return [
+        render_session_announcement_email(
+            to_email=f"member{i}@example.com",
+            member_name=f"Member {i}",
+            session_title="Saturday Community Swim",
+            session_type="community",
+            session_date="Saturday, June 06, 2026",
+            session_time="07:00 AM",
+            session_location="Rowe Park",
+            session_address="Yaba, Lagos",
+            pool_fee=2000,
+        )
+        for i in range(members)
+    ]
+
+
+async def _serial_fresh_client(url: str, messages) -> None:
+    headers = {"api-key": "xkeysib-stub", "content-type": "application/json"}
+    for m in messages:
+        async with httpx.AsyncClient(timeout=20) as client:
+            await client.post(
+                url,
+                headers=headers,
+                json={
+                    "sender": {"email": "no-reply@swimbuddz.com", "name": "SwimBuddz"},
+                    "to": [{"email": m.to_email}],
+                    "subject": m.subject,
+                    "textContent": m.body,
+                    "htmlContent": m.html_body,
+                },
+            )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=5000)
+    parser.add_argument("--serial-sample", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=120)
+    parser.add_argument("--stub-rate", type=float, default=10, help="stub req/s")
+    parser.add_argument("--rate", type=float, default=8, help="client req/s")
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    port = _free_port()
+    stub = create_app(latency_ms=args.latency_ms, rate_per_sec=args.stub_rate)
+    server = uvicorn.Server(
+        uvicorn.Config(stub, host="127.0.0.1", port=port, log_level="warning")
+    )
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    settings = get_settings()
+    settings.BREVO_API_BASE_URL = f"http://127.0.0.1:{port}"
+    settings.BREVO_API_KEY = "xkeysib-stub"
+    settings.EMAIL_PROVIDER_RATE_PER_SEC = {"brevo": args.rate}
+    email_core._pacers.clear()
+    messages = _render(args.members)
+
+    try:
+        print(
+            f"{args.members:,} recipients, stub {args.latency_ms:.0f} ms / "
+            f"{args.stub_rate:.0f} req/s"
+        )
+        sample = messages[: args.serial_sample]
+        started = time.perf_counter()
+        await _serial_fresh_client(f"{settings.BREVO_API_BASE_URL}/smtp/email", sample)
+        per_email = (time.perf_counter() - started) / len(sample)
+        print(
+            f"  serial, client per email {60 / per_email:10.0f} emails/min "
+            f"(announcement ≈ {per_email * args.members:.0f}s, "
+            f"429s={stub.state.limited})"
+        )
+
+        await asyncio.sleep(1)  # let the stub's bucket refill
+        stub.state.limited = stub.state.calls = stub.state.emails = 0
+        batches = [
+            OutboundBatch(
+                messages=messages[i : i + args.batch_size],
+                row_ids=[uuid.uuid4() for _ in messages[i : i + args.batch_size]],
+            )
+            for i in range(0, len(messages), args.batch_size)
+        ]
+        started = time.perf_counter()
+        outcomes = await send_batches(batches, concurrency=args.concurrency)
+        elapsed = time.perf_counter() - started
+        sent = sum(sum(result.delivered) for _, result in outcomes)
+        print(
+            f"  outbox ({args.batch_size}/call, {args.concurrency} in flight, "
+            f"{args.rate:.0f}/s) {sent * 60 / elapsed:10.0f} emails/min  "
+            f"{elapsed:.1f}s  sent={sent} calls={stub.state.calls} "
+            f"429s={stub.state.limited}"
+        )
+    finally:
+        server.should_exit = True
+        await serving
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,105 @@
+"""Local Brevo stub for exercising email delivery without the API.
+
+Serves ``POST /smtp/email`` (plain or ``messageVersions``) with configurable
+latency and a token-bucket rate limit that answers 429 +
+``x-sib-ratelimit-reset`` like Brevo does. Every accepted version gets a
+``messageId``; nothing is delivered.
+
+    uvicorn scripts.communications.brevo_stub:app --port 8098
+    BREVO_API_BASE_URL=http://localhost:8098 BREVO_API_KEY=xkeysib-stub ...
+
+Tuning (env): BREVO_STUB_LATENCY_MS (default 120), BREVO_STUB_RATE_PER_SEC
+(default 10; 0 disables limiting), BREVO_STUB_BURST (default 5).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+import uuid
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Consume a token; returns 0 on success or seconds until one is free."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+def create_app(
+    latency_ms: float | None = None,
+    rate_per_sec: float | None = None,
+    burst: int | None = None,
+) -> FastAPI:
+    latency = (
+        latency_ms
+        if latency_ms is not None
+        else float(os.getenv("BREVO_STUB_LATENCY_MS", "120"))
+    ) / 1000
+    rate = (
+        rate_per_sec
+        if rate_per_sec is not None
+        else float(os.getenv("BREVO_STUB_RATE_PER_SEC", "10"))
+    )
+    bucket = (
+        _TokenBucket(rate, burst or int(os.getenv("BREVO_STUB_BURST", "5")))
+        if rate > 0
+        else None
+    )
+    stub = FastAPI(title="Brevo stub")
+    stub.state.calls = 0
+    stub.state.limited = 0
+    stub.state.emails = 0
+
+    @stub.post("/smtp/email")
+    async def send(request: Request):
+        stub.state.calls += 1
+        wait = bucket.take() if bucket else 0.0
+        if wait:
+            stub.state.limited += 1
+            return JSONResponse(
+                {"code": "too_many_requests", "message": "Rate limit exceeded"},
+                status_code=429,
+                headers={"x-sib-ratelimit-reset": f"{wait:.2f}"},
+            )
+        payload = await request.json()
+        if "messageVersions" in payload:
+            count = sum(len(v.get("to", [])) for v in payload["messageVersions"])
+        else:
+            count = len(payload.get("to", []))
+        if not count:
+            return JSONResponse(
+                {"code": "missing_parameter", "message": "to is missing"},
+                status_code=400,
+            )
+        await asyncio.sleep(latency)
+        stub.state.emails += count
+        ids = [f"<{uuid.uuid4().hex}@smtp-relay.stub>" for _ in range(count)]
+        if "messageVersions" in payload:
+            return JSONResponse({"messageIds": ids}, status_code=201)
+        return JSONResponse({"messageId": ids[0]}, status_code=201)
+
+    return stub
+
+
+app = create_app()
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, port=int(os.getenv("BREVO_STUB_PORT", "8098")))
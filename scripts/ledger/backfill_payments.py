@@ -31,7 +31,7 @@ import asyncio
 from collections import Counter
 
 from libs.common.config import get_settings
-from libs.common.ledger_client import post_journal_entry
+from libs.common.ledger_client import JournalEntryBatcher
 from services.payments_service.models import Payment, PaymentStatus
 from services.payments_service.services.ledger_emit import build_post_kwargs, to_kobo
 from sqlalchemy import select
@@ -49,6 +49,7 @@ async def main(commit: bool, limit: int | None) -> None:
     count_by_purpose: Counter[str] = Counter()
     kobo_by_purpose: Counter[str] = Counter()
     skipped: list[str] = []
+    to_post: list[tuple[str, dict]] = []
     posted = 0
     failed = 0
 
@@ -80,13 +81,21 @@ async def main(commit: bool, limit: int | None) -> None:
                 purpose = p.purpose.value
                 count_by_purpose[purpose] += 1
                 kobo_by_purpose[purpose] += to_kobo(p.amount)
-                if commit:
-                    try:
-                        await post_journal_entry(calling_service="payments", **kwargs)
-                        posted += 1
-                    except Exception as exc:  # noqa: BLE001 — report, keep going
+                to_post.append((p.reference, kwargs))
+
+            if commit:
+                # Posted in batches; each entry still succeeds or fails alone.
+                async with JournalEntryBatcher(calling_service="payments") as batcher:
+                    outcomes = await asyncio.gather(
+                        *(batcher.post(**kwargs) for _, kwargs in to_post),
+                        return_exceptions=True,
+                    )
+                for (reference, _), outcome in zip(to_post, outcomes):
+                    if isinstance(outcome, BaseException):
                         failed += 1
-                        print(f"  FAIL {p.reference}: {str(exc)[:140]}")
+                        print(f"  FAIL {reference}: {str(outcome)[:140]}")
+                    else:
+                        posted += 1
 
         print("\n================= SUMMARY =================")
         mapped = sum(count_by_purpose.values())
@@ -0,0 +1,200 @@
+"""Benchmark settlement-reconciliation intake at settlement-day volumes.
+
+Builds a throwaway org whose books carry N cash-in entries (each line tagged
+with its payment reference), then pushes a settlement batch of N Paystack
+transactions through ``intake_external_transactions``:
+
+  * ~90% tie out, ~5% differ in amount, ~5% were never booked
+  * first pass   — every transaction is new; breaks open
+  * re-push      — the same batch again (idempotent upsert, breaks refreshed)
+
+For comparison it also times the old per-transaction journal-line lookup
+(one query per ref) over the same refs.
+
+Everything runs in one transaction that is rolled back, so nothing persists.
+Run in-container:
+
+    docker compose exec ledger-service \
+        python scripts/ledger/bench_reconciliation.py --txns 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import date
+
+from libs.common.config import get_settings
+from libs.common.datetime_utils import utc_now
+from services.ledger_service.models import JournalEntry, JournalLine, Organization
+from services.ledger_service.models.enums import EntryStatus
+from services.ledger_service.schemas.reconciliation import ExternalTransactionIn
+from services.ledger_service.services.accounts import (
+    resolve_account_ids,
+    seed_chart_of_accounts,
+)
+from services.ledger_service.services.periods import resolve_or_create_period
+from services.ledger_service.services.reconciliation import (
+    intake_external_transactions,
+)
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+CHUNK = 5000
+
+
+async def _seed_cashins(
+    session: AsyncSession, org_id: uuid.UUID, refs: list[str], amounts: list[int]
+) -> None:
+    """Book one cash-in entry per ref (DR clearing / CR deferred revenue)."""
+    accounts = await resolve_account_ids(
+        session, org_id, ["paystack_clearing", "deferred_revenue_academy"]
+    )
+    entry_date = date.today().replace(day=1)
+    period = await resolve_or_create_period(session, org_id, entry_date)
+    now = utc_now()
+    for start in range(0, len(refs), CHUNK):
+        entries, lines = [], []
+        for ref, amount in zip(refs[start : start + CHUNK], amounts[start:]):
+            entry_id = uuid.uuid4()
+            entries.append(
+                {
+                    "id": entry_id,
+                    "org_id": org_id,
+                    "entry_date": entry_date,
+                    "posting_date": now,
+                    "description": "bench cash-in",
+                    "source_service": "bench",
+                    "source_type": "payment_paid",
+                    "source_id": ref,
+                    "idempotency_key": f"bench:{ref}",
+                    "status": EntryStatus.POSTED,
+                    "period_id": period.id,
+                    "created_at": now,
+                    "posted_at": now,
+                }
+            )
+            for ref_acct, dr, cr in (
+                ("paystack_clearing", amount, 0),
+                ("deferred_revenue_academy", 0, amount),
+            ):
+                lines.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "org_id": org_id,
+                        "entry_id": entry_id,
+                        "account_id": accounts[ref_acct],
+                        "debit_minor": dr,
+                        "credit_minor": cr,
+                        "currency": "NGN",
+                        "base_debit_minor": dr,
+                        "base_credit_minor": cr,
+                        "external_ref": ref,
+                    }
+                )
+        await session.execute(insert(JournalEntry), entries)
+        await session.execute(insert(JournalLine), lines)
+
+
+def _settlement_batch(
+    rng: random.Random, refs: list[str], amounts: list[int]
+) -> list[ExternalTransactionIn]:
+    batch = []
+    for i, (ref, amount) in enumerate(zip(refs, amounts)):
+        roll = rng.random()
+        if roll < 0.05:
+            ref = f"UNBOOKED-{i}"
+        elif roll < 0.10:
+            amount -= rng.randrange(1, 500)
+        batch.append(
+            ExternalTransactionIn(
+                psp="paystack",
+                external_txn_id=f"BENCH-{i}",
+                external_ref=ref,
+                settlement_ref="SET-BENCH",
+                amount_minor=amount,
+                fee_minor=amount // 100,
+                currency="NGN",
+                status="success",
+            )
+        )
+    return batch
+
+
+async def _per_ref_lookups(
+    session: AsyncSession, org_id: uuid.UUID, refs: list[str]
+) -> None:
+    """The old matcher's journal-line query, issued once per transaction."""
+    for ref in refs:
+        await session.execute(
+            select(
+                JournalLine.entry_id,
+                JournalLine.debit_minor,
+                JournalLine.credit_minor,
+            ).where(JournalLine.org_id == org_id, JournalLine.external_ref == ref)
+        )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--txns", type=int, default=10_000)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    engine = create_async_engine(
+        settings.DATABASE_URL, connect_args={"prepare_threshold": 0}
+    )
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_factory() as session:
+            org_id = uuid.uuid4()
+            await session.execute(
+                text("SELECT set_config('app.current_org_id', :o, true)"),
+                {"o": str(org_id)},
+            )
+            session.add(Organization(id=org_id, name=f"bench-{org_id.hex[:8]}"))
+            await session.flush()
+            await seed_chart_of_accounts(session, org_id)
+
+            rng = random.Random(42)
+            refs = [f"PAY-BENCH-{i:06d}" for i in range(args.txns)]
+            amounts = [rng.randrange(1_000, 500_000) for _ in refs]
+            started = time.perf_counter()
+            await _seed_cashins(session, org_id, refs, amounts)
+            await session.execute(text("ANALYZE journal_lines"))
+            print(
+                f"seeded {args.txns:,} cash-in entries "
+                f"in {time.perf_counter() - started:.1f}s"
+            )
+
+            batch = _settlement_batch(rng, refs, amounts)
+            for label in ("first pass", "re-push"):
+                started = time.perf_counter()
+                summary = await intake_external_transactions(session, org_id, batch)
+                await session.flush()
+                elapsed = time.perf_counter() - started
+                print(
+                    f"  intake {label:<12} {elapsed * 1000:9.1f} ms  "
+                    f"({args.txns / elapsed:,.0f} txns/s)  {summary}"
+                )
+
+            sample = refs[: min(len(refs), 1000)]
+            started = time.perf_counter()
+            await _per_ref_lookups(session, org_id, sample)
+            per_ref = (time.perf_counter() - started) / len(sample)
+            print(
+                f"  per-ref line lookup      {per_ref * 1000:9.3f} ms/txn "
+                f"(~{per_ref * args.txns:.1f}s of queries for {args.txns:,} txns "
+                "before counting txn/break round trips)"
+            )
+            await session.rollback()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
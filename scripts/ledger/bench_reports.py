@@ -0,0 +1,229 @@
+"""Benchmark financial-report latency at multi-year ledger sizes.
+
+Builds a throwaway org with a synthetic ledger (N years × M entries/month,
+two lines each, balances recomputed per month exactly as posting does), then
+times each report three ways:
+
+  * line scan  — the pre-snapshot aggregation over every journal line
+  * snapshot   — account_balances for elapsed months + open-month delta
+  * cached     — a repeat call through report_cache at the same high-water mark
+
+Everything runs in one transaction that is rolled back, so nothing persists.
+Run in-container:
+
+    docker compose exec ledger-service \
+        python scripts/ledger/bench_reports.py --years 3 --per-month 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import date, timedelta
+
+from libs.common.config import get_settings
+from libs.common.datetime_utils import utc_now
+from services.ledger_service.models import (
+    ChartOfAccounts,
+    JournalEntry,
+    JournalLine,
+    Organization,
+)
+from services.ledger_service.models.enums import EntryStatus
+from services.ledger_service.services.accounts import (
+    resolve_account_ids,
+    seed_chart_of_accounts,
+)
+from services.ledger_service.services.balances import recompute_account_balances
+from services.ledger_service.services.periods import (
+    month_bounds,
+    resolve_or_create_period,
+)
+from services.ledger_service.services.report_cache import cached_report
+from services.ledger_service.services.reports import (
+    balance_sheet,
+    cash_position,
+    trial_balance,
+)
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+# (debit ref, credit ref) pairs the synthetic entries draw from.
+FLOWS = [
+    ("paystack_clearing", "revenue_community"),
+    ("paystack_clearing", "revenue_store"),
+    ("bank_operating_ngn", "paystack_clearing"),
+    ("paystack_clearing", "deferred_revenue_academy"),
+    ("deferred_revenue_academy", "revenue_academy"),
+]
+
+
+async def _seed_ledger(
+    session: AsyncSession, org_id: uuid.UUID, years: int, per_month: int
+) -> tuple[int, date]:
+    """Insert the synthetic ledger; returns (line count, last entry date)."""
+    refs = {ref for flow in FLOWS for ref in flow}
+    accounts = await resolve_account_ids(session, org_id, refs)
+    rng = random.Random(42)
+    today = date.today()
+    month = date(today.year - years, today.month, 1)
+    lines_total = 0
+    last_day = month
+    while month <= today:
+        _, start, end = month_bounds(month)
+        period = await resolve_or_create_period(session, org_id, start)
+        now = utc_now()
+        entries, lines = [], []
+        for i in range(per_month):
+            entry_id = uuid.uuid4()
+            entry_date = start + timedelta(days=rng.randrange((end - start).days + 1))
+            debit_ref, credit_ref = rng.choice(FLOWS)
+            amount = rng.randrange(1_000, 500_000)
+            entries.append(
+                {
+                    "id": entry_id,
+                    "org_id": org_id,
+                    "entry_date": entry_date,
+                    "posting_date": now,
+                    "description": "bench",
+                    "source_service": "bench",
+                    "source_type": "bench",
+                    "source_id": f"{start:%Y%m}-{i}",
+                    "idempotency_key": f"bench:{entry_id}",
+                    "status": EntryStatus.POSTED,
+                    "period_id": period.id,
+                    "created_at": now,
+                    "posted_at": now,
+                }
+            )
+            for ref, dr, cr in ((debit_ref, amount, 0), (credit_ref, 0, amount)):
+                lines.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "org_id": org_id,
+                        "entry_id": entry_id,
+                        "account_id": accounts[ref],
+                        "debit_minor": dr,
+                        "credit_minor": cr,
+                        "currency": "NGN",
+                        "base_debit_minor": dr,
+                        "base_credit_minor": cr,
+                    }
+                )
+            last_day = max(last_day, entry_date)
+        await session.execute(insert(JournalEntry), entries)
+        await session.execute(insert(JournalLine), lines)
+        await recompute_account_balances(session, org_id, period.id, accounts.values())
+        lines_total += len(lines)
+        month = end + timedelta(days=1)
+    return lines_total, last_day
+
+
+async def _line_scan_trial_balance(
+    session: AsyncSession, org_id: uuid.UUID, as_of: date
+) -> list:
+    """The pre-snapshot trial-balance aggregation, kept here for comparison."""
+    return (
+        await session.execute(
+            select(
+                ChartOfAccounts.code,
+                func.coalesce(func.sum(JournalLine.debit_minor), 0),
+                func.coalesce(func.sum(JournalLine.credit_minor), 0),
+            )
+            .select_from(JournalLine)
+            .join(JournalEntry, JournalLine.entry_id == JournalEntry.id)
+            .join(ChartOfAccounts, JournalLine.account_id == ChartOfAccounts.id)
+            .where(JournalLine.org_id == org_id, JournalEntry.entry_date <= as_of)
+            .group_by(ChartOfAccounts.code)
+        )
+    ).all()
+
+
+async def _timed(label: str, fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        best = min(best, time.perf_counter() - started)
+    print(f"  {label:<32} {best * 1000:9.1f} ms")
+    return best
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--per-month", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    engine = create_async_engine(
+        settings.DATABASE_URL, connect_args={"prepare_threshold": 0}
+    )
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_factory() as session:
+            org_id = uuid.uuid4()
+            await session.execute(
+                text("SELECT set_config('app.current_org_id', :o, true)"),
+                {"o": str(org_id)},
+            )
+            session.add(Organization(id=org_id, name=f"bench-{org_id.hex[:8]}"))
+            await session.flush()
+            await seed_chart_of_accounts(session, org_id)
+
+            started = time.perf_counter()
+            lines, last_day = await _seed_ledger(
+                session, org_id, args.years, args.per_month
+            )
+            await session.execute(text("ANALYZE journal_entries, journal_lines"))
+            print(
+                f"seeded {lines:,} lines over {args.years}y "
+                f"in {time.perf_counter() - started:.1f}s"
+            )
+
+            as_of = last_day - timedelta(days=3)
+            print(f"report as_of {as_of} (best of {args.repeat}):")
+            scan = await _timed(
+                "trial balance — line scan",
+                lambda: _line_scan_trial_balance(session, org_id, as_of),
+                args.repeat,
+            )
+            snap = await _timed(
+                "trial balance — snapshot",
+                lambda: trial_balance(session, org_id, as_of),
+                args.repeat,
+            )
+            await _timed(
+                "balance sheet — snapshot",
+                lambda: balance_sheet(session, org_id, as_of),
+                args.repeat,
+            )
+            await _timed(
+                "cash position — snapshot",
+                lambda: cash_position(session, org_id, as_of),
+                args.repeat,
+            )
+            await _timed(
+                "trial balance — cached",
+                lambda: cached_report(
+                    session,
+                    org_id,
+                    "trial_balance",
+                    (as_of,),
+                    lambda: trial_balance(session, org_id, as_of),
+                ),
+                args.repeat,
+            )
+            print(f"snapshot speed-up over line scan: {scan / snap:.1f}x")
+            await session.rollback()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -18,7 +18,7 @@ from __future__ import annotations
 import asyncio
 
 from libs.common.config import get_settings
-from libs.common.ledger_client import post_journal_entry
+from libs.common.ledger_client import JournalEntryBatcher
 from libs.common.logging import get_logger
 from services.payments_service.models.ledger_failure import LedgerPostFailure
 from services.wallet_service.models.ledger_failure import WalletLedgerPostFailure
@@ -40,18 +40,22 @@ async def _replay(
     )
     print(f"{len(rows)} pending {calling_service} dead-letter row(s)")
     replayed = still_failing = 0
-    for row in rows:
-        try:
-            # payload holds the exact post_journal_entry kwargs (minus
-            # calling_service, which we pass explicitly).
-            await post_journal_entry(calling_service=calling_service, **row.payload)
-            row.status = "replayed"
-            replayed += 1
-        except Exception as exc:  # noqa: BLE001 — keep going through the batch
+    # payload holds the exact post_journal_entry kwargs (minus calling_service,
+    # which the batcher carries). Entries go out in batches but each row still
+    # gets its own verdict.
+    async with JournalEntryBatcher(calling_service=calling_service) as batcher:
+        outcomes = await asyncio.gather(
+            *(batcher.post(**row.payload) for row in rows), return_exceptions=True
+        )
+    for row, outcome in zip(rows, outcomes):
+        if isinstance(outcome, BaseException):
             row.attempts += 1
-            row.last_error = str(exc)
+            row.last_error = str(outcome)
             still_failing += 1
-            logger.warning("Replay failed for %s: %s", row.idempotency_key, exc)
+            logger.warning("Replay failed for %s: %s", row.idempotency_key, outcome)
+        else:
+            row.status = "replayed"
+            replayed += 1
     await session.commit()
     return replayed, still_failing
 
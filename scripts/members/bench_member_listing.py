@@ -0,0 +1,156 @@
+"""Benchmark bulk approved-member listing: JSON array vs NDJSON stream.
+
+Seeds ``--members`` approved members (with memberships) and reads them all
+back two ways, the way a reporting caller would:
+
+  * array   — the original ``/internal/members/approved-list``: load every
+              ``Member`` with its memberships (and the other ``selectin``
+              relationships), build ``ApprovedMemberBasic`` models,
+              serialise one JSON array, then ``json.loads`` it whole
+  * stream  — ``member_stream.stream_approved_members``: keyset pages of
+              plain columns, NDJSON, parsed line by line as it arrives
+
+Reports time-to-first-row, total time, Python heap peak (tracemalloc) and
+max-RSS growth. The stream runs first so its RSS figure isn't hidden under
+the array's high-water mark. Everything runs in one transaction that is
+rolled back, so nothing persists. Run in-container:
+
+    docker compose exec members-service \\
+        python scripts/members/bench_member_listing.py --members 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import resource
+import time
+import tracemalloc
+import uuid
+from contextlib import nullcontext
+from datetime import datetime, timezone
+
+from libs.common.config import get_settings
+from services.members_service.models import Member, MemberMembership
+from services.members_service.routers.internal._schemas import ApprovedMemberBasic
+from services.members_service.services import member_stream
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import selectinload, sessionmaker
+
+
+async def _seed(session: AsyncSession, members: int) -> None:
+    now = datetime.now(timezone.utc)
+    member_rows, membership_rows = [], []
+    for i in range(members):
+        member_id = uuid.uuid4()
+        member_rows.append(
+            {
+                "id": member_id,
+                "auth_id": str(uuid.uuid4()),
+                "email": f"listing.{i}.{member_id.hex[:6]}@bench.test",
+                "first_name": "Bench",
+                "last_name": f"Member {i}",
+                "is_active": True,
+                "approval_status": "approved",
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+        membership_rows.append(
+            {"id": uuid.uuid4(), "member_id": member_id, "primary_tier": "club"}
+        )
+    for i in range(0, members, 2000):
+        await session.execute(insert(Member), member_rows[i : i + 2000])
+        await session.execute(insert(MemberMembership), membership_rows[i : i + 2000])
+    await session.flush()
+
+
+async def _array(session: AsyncSession) -> tuple[float, int]:
+    """Original endpoint + caller; returns (seconds to first row, rows)."""
+    started = time.perf_counter()
+    result = await session.execute(
+        select(Member)
+        .options(selectinload(Member.membership))
+        .where(Member.approval_status == "approved", Member.is_active.is_(True))
+    )
+    payload = [
+        ApprovedMemberBasic(
+            id=str(m.id),
+            auth_id=m.auth_id,
+            first_name=m.first_name,
+            last_name=m.last_name,
+            primary_tier=(m.membership.primary_tier if m.membership else None),
+        ).model_dump()
+        for m in result.scalars().all()
+    ]
+    body = json.dumps(payload).encode()
+    del payload
+    members = json.loads(body)
+    first_row = time.perf_counter() - started
+    session.expunge_all()
+    return first_row, len(members)
+
+
+async def _stream(session: AsyncSession) -> tuple[float, int]:
+    started = time.perf_counter()
+    first_row = None
+    count = 0
+    async for chunk in member_stream.stream_approved_members(
+        session_factory=lambda: nullcontext(session)
+    ):
+        for line in chunk.splitlines():
+            json.loads(line)
+            count += 1
+            if first_row is None:
+                first_row = time.perf_counter() - started
+    return first_row or 0.0, count
+
+
+def _max_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def _measure(label: str, fn, session) -> None:
+    rss_before = _max_rss_mb()
+    tracemalloc.start()
+    started = time.perf_counter()
+    first_row, rows = await fn(session)
+    total = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"  {label:6s} {rows:,} rows   first row {first_row * 1000:8.1f} ms   "
+        f"total {total * 1000:8.1f} ms   heap peak {peak / 2**20:7.1f} MB   "
+        f"max RSS +{_max_rss_mb() - rss_before:6.1f} MB"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=50_000)
+    args = parser.parse_args()
+
+    engine = create_async_engine(
+        get_settings().DATABASE_URL, connect_args={"prepare_threshold": 0}
+    )
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_factory() as session:
+            started = time.perf_counter()
+            await _seed(session, args.members)
+            print(
+                f"seeded {args.members:,} approved members in "
+                f"{time.perf_counter() - started:.1f}s "
+                f"(page size {member_stream.STREAM_PAGE_SIZE})"
+            )
+            await _measure("stream", _stream, session)
+            await _measure("array", _array, session)
+            await session.rollback()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,163 @@
+"""Benchmark internal member search over a large synthetic member table.
+
+Seeds ``--members`` members (Nigerian and English first/last names, unique
+emails) and times a handful of picker-style queries two ways:
+
+  * ilike    — the original ``/internal/members/search``: ``ILIKE '%q%'``
+               on first name, last name and email, ordered by name
+  * indexed  — ``member_search._search_statement`` (pg_trgm GIN on
+               ``search_text`` / prefix btrees, ranked, keyset-paged)
+
+Also reports whether each way finds the intended member for typo'd queries.
+Everything runs in one transaction that is rolled back, so nothing
+persists. Run in-container:
+
+    docker compose exec members-service \\
+        python scripts/members/bench_search.py --members 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timezone
+
+from libs.common.config import get_settings
+from services.members_service.models import Member
+from services.members_service.services.member_search import (
+    FUZZY_THRESHOLD,
+    _search_statement,
+    normalize_query,
+)
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+FIRST = [
+    "Adebayo", "Chidi", "Ngozi", "Oluwaseun", "Funmilayo", "Emeka", "Aisha",
+    "Tunde", "Yetunde", "Ifeoma", "Olamide", "Kelechi", "Sarah", "James",
+    "Temitope", "Babajide", "Folake", "Uchenna", "Zainab", "David",
+]  # fmt: skip
+LAST = [
+    "Okonkwo", "Adeyemi", "Balogun", "Eze", "Okafor", "Ogunleye", "Nwosu",
+    "Bello", "Adewale", "Olatunji", "Smith", "Johnson", "Ibrahim", "Afolabi",
+    "Chukwu", "Oyelaran", "Akinola", "Obi", "Williams", "Ojo",
+]  # fmt: skip
+# (query, what it should find) — the last three are typos.
+QUERIES = [
+    ("ad", None),
+    ("okonk", None),
+    ("gunle", None),
+    ("adebayo okonkwo", None),
+    ("adebyo", "Adebayo"),
+    ("oluwasen", "Oluwaseun"),
+    ("ogunlye", "Ogunleye"),
+]
+
+
+async def _seed(session: AsyncSession, members: int) -> None:
+    rng = random.Random(3)
+    now = datetime.now(timezone.utc)
+    rows = []
+    for i in range(members):
+        first, last = rng.choice(FIRST), rng.choice(LAST)
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "auth_id": str(uuid.uuid4()),
+                "email": f"{first}.{last}.{i}@bench.test".lower(),
+                "first_name": first,
+                "last_name": last,
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+    for i in range(0, len(rows), 2000):
+        await session.execute(insert(Member), rows[i : i + 2000])
+    await session.execute(text("ANALYZE members"))
+
+
+def _ilike_statement(q: str, limit: int):
+    term = f"%{q.strip()}%"
+    return (
+        select(Member.id, Member.first_name, Member.last_name)
+        .where(
+            (Member.first_name.ilike(term))
+            | (Member.last_name.ilike(term))
+            | (Member.email.ilike(term))
+        )
+        .order_by(Member.last_name.asc(), Member.first_name.asc())
+        .limit(limit)
+    )
+
+
+async def _time(session, stmt, repeat: int):
+    timings, rows = [], []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = (await session.execute(stmt)).all()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), rows
+
+
+def _found(rows, name: str | None) -> str:
+    if name is None:
+        return ""
+    hit = any(name in (r.first_name, r.last_name) for r in rows)
+    return "found" if hit else "MISSED"
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    engine = create_async_engine(
+        get_settings().DATABASE_URL, connect_args={"prepare_threshold": 0}
+    )
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_factory() as session:
+            started = time.perf_counter()
+            await _seed(session, args.members)
+            print(
+                f"seeded {args.members:,} members in "
+                f"{time.perf_counter() - started:.1f}s"
+            )
+            await session.execute(
+                select(
+                    func.set_config(
+                        "pg_trgm.word_similarity_threshold",
+                        str(FUZZY_THRESHOLD),
+                        True,
+                    )
+                )
+            )
+            for q, expected in QUERIES:
+                ilike_ms, ilike_rows = await _time(
+                    session, _ilike_statement(q, args.limit), args.repeat
+                )
+                indexed_ms, indexed_rows = await _time(
+                    session,
+                    _search_statement(normalize_query(q), args.limit, None),
+                    args.repeat,
+                )
+                print(
+                    f"  {q!r:18s} ilike {ilike_ms:7.1f} ms "
+                    f"{_found(ilike_rows, expected):7s} "
+                    f"indexed {indexed_ms:7.1f} ms "
+                    f"{_found(indexed_rows, expected)}"
+                )
+            await session.rollback()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,218 @@
+"""Benchmark cohort block-payout computation at cohort scale.
+
+Seeds a throwaway cohort (N students × W weekly classes, mixed attendance)
+and times ``compute_block_payout`` for the second block, counting the SQL
+statements it issues. For comparison it also runs the old per-student shape
+(one attendance query + one prior-delivered query per student) over the same
+data.
+
+Everything runs in one transaction that is rolled back, so nothing persists.
+Run in-container:
+
+    docker compose exec payments-service \
+        python scripts/payments/bench_payouts.py --students 60 --weeks 12
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from libs.common.config import get_settings
+from services.academy_service.models import Cohort, Enrollment, Program, ProgramLevel
+from services.attendance_service.models import AttendanceRecord
+from services.members_service.models import Member
+from services.payments_service.models import RecurringPayoutConfig
+from services.payments_service.services.payout_calculator import compute_block_payout
+from services.sessions_service.models import Session, SessionType
+from sqlalchemy import bindparam, event, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+START = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+STATUSES = ["present"] * 7 + ["late", "absent", "excused"]
+
+
+async def _seed(session: AsyncSession, students: int, weeks: int) -> uuid.UUID:
+    rng = random.Random(7)
+    now = datetime.now(timezone.utc)
+    program = Program(
+        name="bench",
+        slug=f"bench-{uuid.uuid4().hex[:8]}",
+        level=ProgramLevel.BEGINNER_1,
+        duration_weeks=weeks,
+    )
+    session.add(program)
+    await session.flush()
+    cohort = Cohort(
+        program_id=program.id,
+        name="bench",
+        start_date=START,
+        end_date=START + timedelta(weeks=weeks),
+        capacity=students,
+    )
+    session.add(cohort)
+    await session.flush()
+
+    session_rows = [
+        {
+            "id": uuid.uuid4(),
+            "title": f"bench week {w + 1}",
+            "session_type": SessionType.COHORT_CLASS,
+            "cohort_id": cohort.id,
+            "starts_at": START + timedelta(weeks=w),
+            "ends_at": START + timedelta(weeks=w, hours=1),
+        }
+        for w in range(weeks)
+    ]
+    members = [
+        {
+            "id": uuid.uuid4(),
+            "auth_id": str(uuid.uuid4()),
+            "email": f"bench-{uuid.uuid4().hex[:10]}@example.com",
+            "first_name": "Bench",
+            "last_name": str(i),
+        }
+        for i in range(students)
+    ]
+    await session.execute(insert(Session), session_rows)
+    await session.execute(insert(Member), members)
+    await session.execute(
+        insert(Enrollment),
+        [
+            {
+                "id": uuid.uuid4(),
+                "cohort_id": cohort.id,
+                "program_id": program.id,
+                "member_id": m["id"],
+                "member_auth_id": m["auth_id"],
+                "enrolled_at": START - timedelta(days=2),
+                "created_at": START - timedelta(days=2),
+                "updated_at": now,
+            }
+            for m in members
+        ],
+    )
+    await session.execute(
+        insert(AttendanceRecord),
+        [
+            {
+                "id": uuid.uuid4(),
+                "session_id": s["id"],
+                "member_id": m["id"],
+                "status": rng.choice(STATUSES),
+                "role": "swimmer",
+            }
+            for s in session_rows
+            for m in members
+        ],
+    )
+    await session.execute(text("ANALYZE attendance_records, sessions, enrollments"))
+    return cohort.id
+
+
+async def _per_student_shape(
+    session: AsyncSession, cohort_id, member_ids, session_ids, block_start
+) -> None:
+    """The pre-bulk query pattern: two round trips per student."""
+    attendance = text(
+        "SELECT session_id, status FROM public.attendance_records "
+        "WHERE member_id = :m AND session_id IN :ids"
+    ).bindparams(bindparam("ids", expanding=True))
+    prior = text(
+        "SELECT count(*) FROM public.attendance_records ar "
+        "JOIN public.sessions s ON s.id = ar.session_id "
+        "WHERE ar.member_id = :m AND s.cohort_id = :c AND s.starts_at < :b "
+        "AND lower(ar.status::text) IN ('present', 'late')"
+    )
+    for member_id in member_ids:
+        await session.execute(attendance, {"m": member_id, "ids": session_ids})
+        await session.execute(prior, {"m": member_id, "c": cohort_id, "b": block_start})
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, default=60)
+    parser.add_argument("--weeks", type=int, default=12)
+    parser.add_argument("--block-days", type=int, default=28)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_async_engine(
+        get_settings().DATABASE_URL, connect_args={"prepare_threshold": 0}
+    )
+    statements = 0
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count(*_args) -> None:
+        nonlocal statements
+        statements += 1
+
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_factory() as session:
+            started = time.perf_counter()
+            cohort_id = await _seed(session, args.students, args.weeks)
+            print(
+                f"seeded {args.students} students × {args.weeks} classes "
+                f"in {time.perf_counter() - started:.1f}s"
+            )
+
+            config = RecurringPayoutConfig(
+                id=uuid.uuid4(),
+                coach_member_id=uuid.uuid4(),
+                cohort_id=cohort_id,
+                band_percentage=40,
+                total_blocks=max(1, args.weeks * 7 // args.block_days),
+                block_length_days=args.block_days,
+                cohort_start_date=START,
+                cohort_end_date=START + timedelta(weeks=args.weeks),
+                cohort_price_amount=15_000_000,
+                total_classes=args.weeks,
+                per_class_amount_kobo=50_000,
+                role="lead",
+                block_index=1,
+            )
+
+            best, queries = float("inf"), 0
+            for _ in range(args.repeat):
+                statements = 0
+                started = time.perf_counter()
+                computation = await compute_block_payout(session, config, 1)
+                best = min(best, time.perf_counter() - started)
+                queries = statements
+            print(
+                f"  bulk compute_block_payout   {best * 1000:8.1f} ms  "
+                f"{queries:4d} statements  ({len(computation.lines)} lines)"
+            )
+
+            member_ids = [line.student_member_id for line in computation.lines]
+            block_start = START + timedelta(days=args.block_days)
+            session_ids = [
+                row[0]
+                for row in await session.execute(
+                    text("SELECT id FROM public.sessions WHERE cohort_id = :c"),
+                    {"c": cohort_id},
+                )
+            ]
+            statements = 0
+            started = time.perf_counter()
+            await _per_student_shape(
+                session, cohort_id, member_ids, session_ids, block_start
+            )
+            print(
+                f"  per-student query shape     "
+                f"{(time.perf_counter() - started) * 1000:8.1f} ms  "
+                f"{statements:4d} statements  (queries only, no compute)"
+            )
+            await session.rollback()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
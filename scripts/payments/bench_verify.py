@@ -0,0 +1,112 @@
+"""Benchmark pending-payment verification throughput against the Paystack stub.
+
+Starts ``paystack_stub`` in-process on a local port, points the payments
+Paystack settings at it, then verifies a backlog of references three ways:
+
+  * serial, new client per call — the pre-pool worker loop
+  * serial, pooled client       — ``_verify_paystack_transaction`` one by one
+  * concurrent                  — ``verify_references`` (bounded + paced)
+
+No database is touched. Run from the repo root:
+
+    python scripts/payments/bench_verify.py --pending 2000 --latency-ms 150
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import time
+
+import httpx
+import uvicorn
+from libs.common.config import get_settings
+from scripts.payments.paystack_stub import create_app
+from services.payments_service.routers.intents import _verify_paystack_transaction
+from services.payments_service.services.payment_reconciliation import (
+    verify_references,
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _serial_fresh_client(base_url: str, refs: list[str]) -> None:
+    headers = {"Authorization": "Bearer sk_test_stub"}
+    for ref in refs:
+        async with httpx.AsyncClient(timeout=30) as client:
+            await client.get(f"{base_url}/transaction/verify/{ref}", headers=headers)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pending", type=int, default=2000)
+    parser.add_argument("--serial-sample", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=150)
+    parser.add_argument("--stub-rate", type=float, default=60, help="stub req/s")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rate", type=float, default=50, help="client req/s")
+    args = parser.parse_args()
+
+    port = _free_port()
+    stub = create_app(latency_ms=args.latency_ms, rate_per_sec=args.stub_rate)
+    server = uvicorn.Server(
+        uvicorn.Config(stub, host="127.0.0.1", port=port, log_level="warning")
+    )
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    settings = get_settings()
+    base_url = f"http://127.0.0.1:{port}"
+    settings.PAYSTACK_API_BASE_URL = base_url
+    settings.PAYSTACK_SECRET_KEY = "sk_test_stub"
+    refs = [f"PAY-BENCH-{i:06d}" for i in range(args.pending)]
+    sample = refs[: args.serial_sample]
+
+    try:
+        print(
+            f"{args.pending:,} pending, stub {args.latency_ms:.0f} ms / "
+            f"{args.stub_rate:.0f} req/s"
+        )
+        started = time.perf_counter()
+        await _serial_fresh_client(base_url, sample)
+        fresh = (time.perf_counter() - started) / len(sample)
+        print(
+            f"  serial, client per call  {1 / fresh:8.1f} verifies/s "
+            f"(backlog ≈ {fresh * args.pending:.0f}s)"
+        )
+
+        stub.state.limited = 0
+        started = time.perf_counter()
+        for ref in sample:
+            await _verify_paystack_transaction(ref)
+        pooled = (time.perf_counter() - started) / len(sample)
+        print(
+            f"  serial, pooled client    {1 / pooled:8.1f} verifies/s "
+            f"(backlog ≈ {pooled * args.pending:.0f}s)"
+        )
+
+        stub.state.limited = 0
+        started = time.perf_counter()
+        results = await verify_references(
+            refs, concurrency=args.concurrency, rate_per_sec=args.rate
+        )
+        elapsed = time.perf_counter() - started
+        errors = sum(isinstance(v, Exception) for v in results.values())
+        print(
+            f"  concurrent ({args.concurrency} in flight, {args.rate:.0f}/s) "
+            f"{args.pending / elapsed:8.1f} verifies/s  {elapsed:.1f}s  "
+            f"errors={errors} 429s={stub.state.limited}"
+        )
+    finally:
+        server.should_exit = True
+        await serving
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
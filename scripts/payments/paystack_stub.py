@@ -0,0 +1,102 @@
+"""Local Paystack stub for exercising payment reconciliation without the API.
+
+Serves ``GET /transaction/verify/{reference}`` with configurable latency and a
+token-bucket rate limit that answers 429 + ``Retry-After`` like Paystack does.
+Each reference gets a stable outcome from its hash: ~70% success, ~20%
+abandoned, ~10% still ongoing.
+
+    uvicorn scripts.payments.paystack_stub:app --port 8099
+    PAYSTACK_API_BASE_URL=http://localhost:8099 PAYSTACK_SECRET_KEY=sk_test_stub ...
+
+Tuning (env): PAYSTACK_STUB_LATENCY_MS (default 150), PAYSTACK_STUB_RATE_PER_SEC
+(default 25; 0 disables limiting), PAYSTACK_STUB_BURST (default 10).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import time
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Consume a token; returns 0 on success or seconds until one is free."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+def create_app(
+    latency_ms: float | None = None,
+    rate_per_sec: float | None = None,
+    burst: int | None = None,
+) -> FastAPI:
+    latency = (
+        latency_ms
+        if latency_ms is not None
+        else float(os.getenv("PAYSTACK_STUB_LATENCY_MS", "150"))
+    ) / 1000
+    rate = (
+        rate_per_sec
+        if rate_per_sec is not None
+        else float(os.getenv("PAYSTACK_STUB_RATE_PER_SEC", "25"))
+    )
+    bucket = (
+        _TokenBucket(rate, burst or int(os.getenv("PAYSTACK_STUB_BURST", "10")))
+        if rate > 0
+        else None
+    )
+    stub = FastAPI(title="Paystack stub")
+    stub.state.calls = 0
+    stub.state.limited = 0
+
+    @stub.get("/transaction/verify/{reference}")
+    async def verify(reference: str):
+        stub.state.calls += 1
+        wait = bucket.take() if bucket else 0.0
+        if wait:
+            stub.state.limited += 1
+            return JSONResponse(
+                {"status": False, "message": "Too many requests"},
+                status_code=429,
+                headers={"Retry-After": f"{wait:.2f}"},
+            )
+        await asyncio.sleep(latency)
+        roll = hashlib.sha1(reference.encode()).digest()[0] / 256
+        status = "success" if roll < 0.7 else "abandoned" if roll < 0.9 else "ongoing"
+        return {
+            "status": True,
+            "message": "Verification successful",
+            "data": {
+                "reference": reference,
+                "status": status,
+                "amount": 500_000,
+                "currency": "NGN",
+                "paid_at": "2026-06-01T10:00:00.000Z" if status == "success" else None,
+            },
+        }
+
+    return stub
+
+
+app = create_app()
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, port=int(os.getenv("PAYSTACK_STUB_PORT", "8099")))
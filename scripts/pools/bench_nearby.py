@@ -0,0 +1,152 @@
+"""Benchmark the "pools near me" query against a full-table distance sort.
+
+Seeds N synthetic active partner pools spread across Nigeria (denser around
+Lagos and Abuja), then times, for a handful of search points:
+
+  * full scan — haversine over every geocoded pool, ORDER BY distance
+  * nearby    — ``find_nearby_pools`` (lat/lon index bounding box, widening
+                rings until the page is filled)
+
+Both queries return the same first page; the script asserts that. Everything
+runs in one transaction that is rolled back, so nothing persists. Run
+in-container:
+
+    docker compose exec pools-service \\
+        python scripts/pools/bench_nearby.py --pools 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+
+from libs.common.config import get_settings
+from services.pools_service.models import PartnershipStatus, Pool
+from services.pools_service.services.geo import distance_km_expr, find_nearby_pools
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+# (lat, lon, spread in degrees, share of pools)
+CLUSTERS = [
+    (6.52, 3.38, 0.25, 0.5),  # Lagos
+    (9.07, 7.40, 0.20, 0.2),  # Abuja
+    (7.38, 3.95, 0.15, 0.1),  # Ibadan
+]
+COUNTRY = (4.3, 13.9, 2.7, 14.6)  # min_lat, max_lat, min_lon, max_lon
+SEARCH_POINTS = {
+    "Yaba": (6.5095, 3.3711),
+    "Wuse": (9.0765, 7.4700),
+    "Kano": (12.0022, 8.5920),
+    "Maiduguri": (11.8333, 13.1500),
+}
+
+
+def _synthetic_rows(count: int) -> list[dict]:
+    rng = random.Random(7)
+    rows = []
+    for i in range(count):
+        roll, acc = rng.random(), 0.0
+        for lat, lon, spread, share in CLUSTERS:
+            acc += share
+            if roll < acc:
+                lat, lon = rng.gauss(lat, spread), rng.gauss(lon, spread)
+                break
+        else:
+            lat = rng.uniform(COUNTRY[0], COUNTRY[1])
+            lon = rng.uniform(COUNTRY[2], COUNTRY[3])
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "name": f"Bench Pool {i}",
+                "slug": f"bench-pool-{uuid.uuid4().hex[:12]}",
+                "latitude": lat,
+                "longitude": lon,
+                "partnership_status": PartnershipStatus.ACTIVE_PARTNER,
+                "is_active": True,
+            }
+        )
+    return rows
+
+
+def _base_query():
+    return select(Pool).where(
+        Pool.partnership_status == PartnershipStatus.ACTIVE_PARTNER,
+        Pool.is_active.is_(True),
+    )
+
+
+async def _full_scan(session: AsyncSession, lat: float, lon: float, limit: int):
+    distance = distance_km_expr(lat, lon)
+    query = (
+        _base_query()
+        .where(Pool.latitude.is_not(None), Pool.longitude.is_not(None))
+        .add_columns(distance)
+        .order_by(distance, Pool.id)
+        .limit(limit)
+    )
+    return [(pool.id, round(d, 6)) for pool, d in (await session.execute(query)).all()]
+
+
+async def _nearby(session: AsyncSession, lat: float, lon: float, limit: int):
+    rows, _ = await find_nearby_pools(
+        session, _base_query(), lat=lat, lon=lon, limit=limit
+    )
+    return [(pool.id, round(d, 6)) for pool, d in rows]
+
+
+async def _time(fn, repeat: int) -> tuple[float, list]:
+    timings, result = [], []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = await fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), result
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pools", type=int, default=50_000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_async_engine(get_settings().DATABASE_URL)
+    try:
+        async with engine.connect() as conn:
+            outer = await conn.begin()
+            session = AsyncSession(bind=conn, expire_on_commit=False)
+            try:
+                rows = _synthetic_rows(args.pools)
+                for start in range(0, len(rows), 5000):
+                    await session.execute(insert(Pool), rows[start : start + 5000])
+                await session.execute(text("ANALYZE pools"))
+                print(f"{args.pools} seeded pools, page size {args.page_size}")
+
+                for label, (lat, lon) in SEARCH_POINTS.items():
+                    scan_ms, expected = await _time(
+                        lambda: _full_scan(session, lat, lon, args.page_size),
+                        args.repeat,
+                    )
+                    near_ms, got = await _time(
+                        lambda: _nearby(session, lat, lon, args.page_size),
+                        args.repeat,
+                    )
+                    assert got == expected, f"{label}: nearby page differs"
+                    print(
+                        f"  {label:<10} full scan {scan_ms:8.2f} ms   "
+                        f"nearby {near_ms:8.2f} ms   "
+                        f"(nearest {got[0][1]:.2f} km)"
+                    )
+            finally:
+                await session.close()
+                await outer.rollback()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
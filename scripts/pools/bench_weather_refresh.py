@@ -0,0 +1,155 @@
+"""Benchmark the weather pre-fetch for a few hundred pools.
+
+Starts ``open_meteo_stub`` in-process on a local port, points the weather
+provider at it, seeds N geocoded pools (roughly one in ten sharing a ~1km
+location with another) and refreshes them two ways:
+
+  * per pool  — the old loop: one provider request + one upsert per pool
+  * batched   — ``refresh_all_pools`` (deduplicated multi-location requests,
+                bulk upsert)
+
+Everything runs in one transaction that is rolled back (the refresh's commits
+become savepoints), so nothing persists. Any active pools already in the
+database are refreshed too. Run in-container:
+
+    docker compose exec pools-service \
+        python scripts/pools/bench_weather_refresh.py --pools 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import socket
+import time
+import uuid
+
+import uvicorn
+from libs.common.config import get_settings
+from scripts.pools.open_meteo_stub import create_app
+from services.pools_service.models import Pool
+from services.pools_service.weather.provider import get_provider
+from services.pools_service.weather.refresh import (
+    _active_pools_query,
+    refresh_all_pools,
+)
+from services.pools_service.weather.snapshot_service import store_forecast
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _seed_pools(session: AsyncSession, count: int) -> None:
+    rng = random.Random(42)
+    rows = []
+    for i in range(count):
+        # Lagos-ish bounding box; every tenth pool sits next to the previous one.
+        if i % 10 == 9:
+            lat, lon = rows[-1]["latitude"] + 0.001, rows[-1]["longitude"]
+        else:
+            lat, lon = rng.uniform(6.40, 6.70), rng.uniform(3.10, 3.60)
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "name": f"Bench Pool {i}",
+                "slug": f"bench-pool-{uuid.uuid4().hex[:12]}",
+                "location_area": f"Area {i % 25}",
+                "latitude": lat,
+                "longitude": lon,
+                "is_active": True,
+            }
+        )
+    await session.execute(insert(Pool), rows)
+
+
+async def _refresh_per_pool(session: AsyncSession) -> int:
+    provider = get_provider()
+    settings = get_settings()
+    pools = (await session.execute(_active_pools_query())).scalars().all()
+    for pool in pools:
+        forecast = await provider.fetch_forecast(
+            latitude=pool.latitude,
+            longitude=pool.longitude,
+            days=settings.WEATHER_FORECAST_DAYS,
+            timezone=settings.TIMEZONE or "Africa/Lagos",
+        )
+        await store_forecast(
+            session,
+            latitude=pool.latitude,
+            longitude=pool.longitude,
+            forecast=forecast,
+            pool_id=pool.id,
+            label=pool.location_area or pool.name,
+        )
+    return len(pools)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pools", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=200)
+    parser.add_argument("--per-location-ms", type=float, default=2)
+    args = parser.parse_args()
+
+    port = _free_port()
+    stub = create_app(latency_ms=args.latency_ms, per_location_ms=args.per_location_ms)
+    server = uvicorn.Server(
+        uvicorn.Config(stub, host="127.0.0.1", port=port, log_level="warning")
+    )
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    settings = get_settings()
+    settings.WEATHER_API_BASE_URL = f"http://127.0.0.1:{port}/v1/forecast"
+    engine = create_async_engine(settings.DATABASE_URL)
+
+    try:
+        async with engine.connect() as conn:
+            outer = await conn.begin()
+            session = AsyncSession(
+                bind=conn,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            )
+            try:
+                await _seed_pools(session, args.pools)
+                print(
+                    f"{args.pools} seeded pools, stub {args.latency_ms:.0f} ms "
+                    f"+ {args.per_location_ms:.0f} ms/location"
+                )
+
+                started = time.perf_counter()
+                refreshed = await _refresh_per_pool(session)
+                elapsed = time.perf_counter() - started
+                print(
+                    f"  per pool  {elapsed:7.2f}s  pools={refreshed} "
+                    f"requests={stub.state.calls}"
+                )
+
+                stub.state.calls = stub.state.locations = 0
+                started = time.perf_counter()
+                result = await refresh_all_pools(session)
+                elapsed = time.perf_counter() - started
+                print(
+                    f"  batched   {elapsed:7.2f}s  pools={result['refreshed']} "
+                    f"locations={result['locations']} requests={stub.state.calls} "
+                    f"failed={result['failed']}"
+                )
+            finally:
+                await session.close()
+                await outer.rollback()
+    finally:
+        await engine.dispose()
+        server.should_exit = True
+        await serving
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+"""Local Open-Meteo stub for exercising weather refreshes without the API.
+
+Serves ``GET /v1/forecast`` with configurable latency, including the
+multi-location form (comma-separated ``latitude``/``longitude`` lists answered
+with a JSON array). Forecast values are synthetic but shaped like Open-Meteo's
+hourly/daily parallel arrays, so snapshots store and slice normally.
+
+    uvicorn scripts.pools.open_meteo_stub:app --port 8097
+    WEATHER_API_BASE_URL=http://localhost:8097/v1/forecast ...
+
+Tuning (env): OPEN_METEO_STUB_LATENCY_MS (default 200), plus
+OPEN_METEO_STUB_PER_LOCATION_MS (default 2) added per location in a request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from datetime import date, timedelta
+
+from fastapi import FastAPI, Query
+from fastapi.responses import JSONResponse
+
+
+def _forecast(latitude: float, longitude: float, days: int, timezone: str) -> dict:
+    start = date(2026, 6, 6)
+    day_list = [(start + timedelta(days=d)).isoformat() for d in range(days)]
+    hours = [f"{d}T{h:02d}:00" for d in day_list for h in range(24)]
+    seed = int(abs(latitude * 100 + longitude * 100)) % 50
+    return {
+        "latitude": latitude,
+        "longitude": longitude,
+        "timezone": timezone,
+        "hourly": {
+            "time": hours,
+            "precipitation_probability": [(seed + i) % 100 for i in range(len(hours))],
+            "precipitation": [
+                round(((seed + i) % 7) / 10, 1) for i in range(len(hours))
+            ],
+            "temperature_2m": [26.0 + (i % 6) / 2 for i in range(len(hours))],
+            "weather_code": [61 if (seed + i) % 3 else 3 for i in range(len(hours))],
+        },
+        "daily": {
+            "time": day_list,
+            "precipitation_sum": [float((seed + d) % 17) for d in range(days)],
+            "precipitation_probability_max": [
+                (seed + d * 7) % 100 for d in range(days)
+            ],
+            "temperature_2m_max": [29.0] * days,
+            "temperature_2m_min": [25.0] * days,
+            "weather_code": [63] * days,
+        },
+    }
+
+
+def create_app(
+    latency_ms: float | None = None, per_location_ms: float | None = None
+) -> FastAPI:
+    latency = (
+        latency_ms
+        if latency_ms is not None
+        else float(os.getenv("OPEN_METEO_STUB_LATENCY_MS", "200"))
+    ) / 1000
+    per_location = (
+        per_location_ms
+        if per_location_ms is not None
+        else float(os.getenv("OPEN_METEO_STUB_PER_LOCATION_MS", "2"))
+    ) / 1000
+    stub = FastAPI(title="Open-Meteo stub")
+    stub.state.calls = 0
+    stub.state.locations = 0
+
+    @stub.get("/v1/forecast")
+    async def forecast(
+        latitude: str,
+        longitude: str,
+        timezone: str = "Africa/Lagos",
+        forecast_days: int = Query(7, ge=1, le=16),
+    ):
+        lats = [float(v) for v in latitude.split(",")]
+        lons = [float(v) for v in longitude.split(",")]
+        if len(lats) != len(lons):
+            return JSONResponse(
+                {"error": True, "reason": "latitude and longitude lengths differ"},
+                status_code=400,
+            )
+        stub.state.calls += 1
+        stub.state.locations += len(lats)
+        await asyncio.sleep(latency + per_location * len(lats))
+        results = [
+            _forecast(lat, lon, forecast_days, timezone) for lat, lon in zip(lats, lons)
+        ]
+        return results if len(results) > 1 else results[0]
+
+    return stub
+
+
+app = create_app()
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, port=int(os.getenv("OPEN_METEO_STUB_PORT", "8097")))
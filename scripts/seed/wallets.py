@@ -40,6 +40,7 @@ from services.wallet_service.models import (
 )
 from services.wallet_service.models.enums import ReferralStatus
 from services.wallet_service.models.referral import ReferralCode, ReferralRecord
+from services.wallet_service.services.wallet_stats import rebuild_wallet_stats
 from sqlalchemy.future import select
 
 # ---------------------------------------------------------------------------
@@ -309,6 +310,11 @@ async def seed_wallets():
             # NOTE: Reward rules are now seeded by standalone reward_rules.py
             # (runs before wallets.py in all.sh, and in production via deploy.yml)
 
+            # The transactions above bypass wallet_ops, so derive their
+            # daily stats here.
+            await session.flush()
+            await rebuild_wallet_stats(session)
+
             print("\n✓ Wallet seed data complete!")
 
 
@@ -0,0 +1,205 @@
+"""Benchmark make-up slot computation over dense 90-day calendars.
+
+Builds a coach who publishes several blocks every weekday, runs a few
+sessions a day, and a learner with a busy schedule, then compares:
+
+  * pairwise — the original approach: every candidate slot checked against
+               every coach session and every learner session
+  * engine   — ``compute_bookable_slots`` (merged busy intervals, one
+               sweep, bisected spacing lookups)
+
+Both must produce identical options. Also times ``rank_makeup_options``
+across several coaches for one learner. Pure CPU — no database or network.
+Run:
+
+    python scripts/sessions/bench_makeup_slots.py --days 90 --coaches 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from services.sessions_service.services.makeup_scheduling import (
+    DEFAULT_SLOT_MINUTES,
+    DEFAULT_SPACING_HOURS,
+    BookableSlot,
+    CoachCalendar,
+    CoachSession,
+    Interval,
+    _coach_tz,
+    _overlaps,
+    _spacing_warnings,
+    compute_bookable_slots,
+    expand_availability,
+    rank_makeup_options,
+    slice_into_slots,
+)
+
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+
+def _calendar(rng: random.Random) -> dict:
+    blocks = []
+    for day in WEEKDAYS:
+        for start, end in ((5, 10), (12, 15), (16, 21)):
+            if rng.random() < 0.8:
+                blocks.append(
+                    {"weekday": day, "start": f"{start:02d}:00", "end": f"{end:02d}:00"}
+                )
+    return {"timezone": "Africa/Lagos", "recurring": blocks, "slot_minutes": 30}
+
+
+def _coach_sessions(
+    rng: random.Random, start: date, days: int, per_day: int
+) -> list[CoachSession]:
+    sessions = []
+    for d in range(days):
+        day = datetime.combine(start + timedelta(days=d), datetime.min.time())
+        for _ in range(per_day):
+            begins = day.replace(tzinfo=timezone.utc) + timedelta(
+                minutes=rng.randrange(4 * 60, 21 * 60, 15)
+            )
+            capacity = rng.choice((4, 6, 10))
+            sessions.append(
+                CoachSession(
+                    start=begins,
+                    end=begins + timedelta(minutes=rng.choice((45, 60, 90))),
+                    session_id=f"s{len(sessions)}",
+                    title="Club",
+                    capacity=capacity,
+                    booked_count=rng.randint(0, capacity),
+                )
+            )
+    return sessions
+
+
+def _learner_sessions(
+    rng: random.Random, start: date, days: int, count: int
+) -> list[datetime]:
+    base = datetime.combine(start, datetime.min.time(), tzinfo=timezone.utc)
+    return [
+        base + timedelta(minutes=rng.randrange(0, days * 24 * 60, 30))
+        for _ in range(count)
+    ]
+
+
+def _pairwise(
+    calendar: dict,
+    *,
+    window_start: date,
+    window_end: date,
+    coach_sessions: list[CoachSession],
+    learner_sessions: list[datetime],
+) -> list[BookableSlot]:
+    """The pre-sweep implementation, kept here as the baseline."""
+    tz = _coach_tz(calendar)
+    slot_minutes = int(calendar.get("slot_minutes") or DEFAULT_SLOT_MINUTES)
+    occupied = [Interval(cs.start, cs.end) for cs in coach_sessions]
+    out = []
+    for block in expand_availability(
+        calendar, window_start=window_start, window_end=window_end
+    ):
+        for slot in slice_into_slots(block, slot_minutes=slot_minutes):
+            if any(_overlaps(slot, o) for o in occupied):
+                continue
+            warnings = _spacing_warnings(
+                slot, learner_sessions, spacing_hours=DEFAULT_SPACING_HOURS, tz=tz
+            )
+            out.append(
+                BookableSlot(
+                    slot.start, slot.end, "open", ok=not warnings, warnings=warnings
+                )
+            )
+    for cs in coach_sessions:
+        if not cs.has_room:
+            continue
+        warnings = _spacing_warnings(
+            Interval(cs.start, cs.end),
+            learner_sessions,
+            spacing_hours=DEFAULT_SPACING_HOURS,
+            tz=tz,
+        )
+        out.append(
+            BookableSlot(
+                cs.start,
+                cs.end,
+                "join_session",
+                session_id=cs.session_id,
+                session_title=cs.title,
+                spots_left=cs.spots_left,
+                ok=not warnings,
+                warnings=warnings,
+            )
+        )
+    out.sort(key=lambda s: (s.start, s.kind))
+    return out
+
+
+def _time_ms(fn, repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - started) * 1000)
+    return statistics.median(runs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--sessions-per-day", type=int, default=6)
+    parser.add_argument("--learner-sessions", type=int, default=120)
+    parser.add_argument("--coaches", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    start = date(2026, 6, 1)
+    end = start + timedelta(days=args.days - 1)
+    learner = _learner_sessions(rng, start, args.days, args.learner_sessions)
+    coaches = [
+        CoachCalendar(
+            coach_id=f"coach-{i}",
+            calendar=_calendar(rng),
+            sessions=_coach_sessions(rng, start, args.days, args.sessions_per_day),
+        )
+        for i in range(args.coaches)
+    ]
+    one = coaches[0]
+    kwargs = dict(
+        window_start=start,
+        window_end=end,
+        coach_sessions=one.sessions,
+        learner_sessions=learner,
+    )
+
+    baseline = _pairwise(one.calendar, **kwargs)
+    engine = compute_bookable_slots(one.calendar, **kwargs)
+    assert engine == baseline, "engine output differs from the pairwise baseline"
+
+    pairwise_ms = _time_ms(lambda: _pairwise(one.calendar, **kwargs), args.repeat)
+    engine_ms = _time_ms(
+        lambda: compute_bookable_slots(one.calendar, **kwargs), args.repeat
+    )
+    ranked_ms = _time_ms(
+        lambda: rank_makeup_options(
+            coaches, window_start=start, window_end=end, learner_sessions=learner
+        ),
+        args.repeat,
+    )
+
+    print(
+        f"{args.days}-day window, {len(one.sessions)} coach sessions, "
+        f"{len(learner)} learner sessions, {len(engine)} options (identical)"
+    )
+    print(f"  pairwise  {pairwise_ms:8.1f} ms")
+    print(f"  engine    {engine_ms:8.1f} ms   ({pairwise_ms / engine_ms:.1f}x)")
+    print(f"  ranked    {ranked_ms:8.1f} ms   across {args.coaches} coaches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""Load-test a limited-stock drop: concurrent checkouts racing for the last units.
+
+Puts ``--stock`` units of one item on sale and fires ``--buyers`` checkouts
+for ``--quantity`` units each at once. Each buyer has its own session, and
+there are ``--connections`` pooled connections. Runs the drop four ways:
+
+  * legacy   — the pre-change ``start_checkout`` path: read the inventory
+               row, check ``quantity_available`` in Python, then
+               ``quantity_reserved += quantity`` on the ORM object and commit
+  * atomic   — ``reserve_order_stock``: one conditional UPDATE, all or
+               nothing, plus the reservation row
+  * hold+pay — paying with Bubbles, debiting the wallet while the hold's
+               row lock is taken, so every buyer queues behind the call
+  * pay+hold — paying with Bubbles the way ``start_checkout`` does: debit,
+               then hold and commit; a buyer who sold out is refunded
+
+Checkout calls the members service between its stock check and the hold.
+``--think-ms`` simulates that call in every mode, ``--wallet-ms`` the
+wallet service's debit (and refund) in the Bubbles modes. Reports holds
+granted, sold-out refusals (and refunds), check-constraint failures, units
+oversold (held beyond the stock), checkouts/second and median / p95
+latency. The checkouts commit, because a savepoint can't show
+cross-connection races, so the bench rows are deleted at the end. Run
+in-container:
+
+    docker compose exec store-service \\
+        python scripts/store/bench_stock_drop.py --buyers 500 --stock 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from decimal import Decimal
+
+from libs.common.config import get_settings
+from services.store_service.models import (
+    Category,
+    InventoryItem,
+    InventoryMovement,
+    InventoryMovementType,
+    Order,
+    OrderStatus,
+    Product,
+    ProductStatus,
+    ProductType,
+    ProductVariant,
+)
+from services.store_service.reservations import InsufficientStock, reserve_order_stock
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+
+class _SoldOut(Exception):
+    pass
+
+
+class _Refunded(_SoldOut):
+    """Sold out after the Bubbles were debited."""
+
+
+async def _seed_item(sessions, stock: int, created: dict) -> uuid.UUID:
+    """Create category→product→variant→inventory; return the inventory item id."""
+    s = uuid.uuid4().hex[:8]
+    async with sessions() as db:
+        category = Category(name=f"Bench {s}", slug=f"bench-{s}", is_active=True)
+        db.add(category)
+        await db.flush()
+        product = Product(
+            category_id=category.id,
+            name=f"Drop bench {s}",
+            slug=f"drop-bench-{s}",
+            product_type=ProductType.STANDARD,
+            base_price_ngn=Decimal("15000.00"),
+            status=ProductStatus.ACTIVE,
+            is_featured=False,
+            has_variants=False,
+        )
+        db.add(product)
+        await db.flush()
+        variant = ProductVariant(
+            product_id=product.id, sku=f"BENCH-{s}", name="Default"
+        )
+        db.add(variant)
+        await db.flush()
+        item = InventoryItem(variant_id=variant.id, quantity_on_hand=stock)
+        db.add(item)
+        await db.commit()
+    created[Category].append(category.id)
+    created[Product].append(product.id)
+    created[InventoryItem].append(item.id)
+    return item.id
+
+
+def _order() -> Order:
+    return Order(
+        order_number=Order.generate_order_number(),
+        customer_email="bench@example.com",
+        customer_name="Drop bench",
+        subtotal_ngn=Decimal("15000.00"),
+        total_ngn=Decimal("15000.00"),
+        status=OrderStatus.PENDING_PAYMENT,
+    )
+
+
+async def _legacy_checkout(
+    db: AsyncSession, item_id: uuid.UUID, quantity: int, think: float, wallet: float
+) -> uuid.UUID:
+    """The pre-change stock check and reservation (totals, payment omitted)."""
+    inv = (
+        await db.execute(select(InventoryItem).where(InventoryItem.id == item_id))
+    ).scalar_one()
+    if inv.quantity_available < quantity:
+        raise _SoldOut
+    await asyncio.sleep(think)
+    inv.quantity_reserved += quantity
+    db.add(
+        InventoryMovement(
+            inventory_item_id=inv.id,
+            movement_type=InventoryMovementType.RESERVATION,
+            quantity=quantity,
+            reference_type="cart",
+            reference_id=uuid.uuid4(),
+        )
+    )
+    order = _order()
+    db.add(order)
+    await db.commit()
+    return order.id
+
+
+async def _fast_fail(
+    db: AsyncSession, item_id: uuid.UUID, quantity: int, think: float
+) -> None:
+    """``start_checkout``'s snapshot check, then the members service call."""
+    available = (
+        await db.execute(
+            select(
+                InventoryItem.quantity_on_hand - InventoryItem.quantity_reserved
+            ).where(InventoryItem.id == item_id)
+        )
+    ).scalar_one()
+    if available < quantity:
+        raise _SoldOut
+    await asyncio.sleep(think)
+
+
+async def _atomic_checkout(
+    db: AsyncSession, item_id: uuid.UUID, quantity: int, think: float, wallet: float
+) -> uuid.UUID:
+    """The snapshot fast-fail, then the conditional hold."""
+    await _fast_fail(db, item_id, quantity, think)
+    order = _order()
+    db.add(order)
+    await db.flush()
+    try:
+        await reserve_order_stock(db, order.id, {item_id: quantity})
+    except InsufficientStock:
+        await db.rollback()
+        raise _SoldOut
+    await db.commit()
+    return order.id
+
+
+async def _hold_then_pay_checkout(
+    db: AsyncSession, item_id: uuid.UUID, quantity: int, think: float, wallet: float
+) -> uuid.UUID:
+    """Bubbles checkout with the debit inside the hold's transaction."""
+    await _fast_fail(db, item_id, quantity, think)
+    order = _order()
+    db.add(order)
+    await db.flush()
+    try:
+        await reserve_order_stock(db, order.id, {item_id: quantity})
+    except InsufficientStock:
+        await db.rollback()
+        raise _SoldOut
+    await asyncio.sleep(wallet)  # debit_member_wallet
+    await db.commit()
+    return order.id
+
+
+async def _pay_then_hold_checkout(
+    db: AsyncSession, item_id: uuid.UUID, quantity: int, think: float, wallet: float
+) -> uuid.UUID:
+    """Bubbles checkout as ``start_checkout`` runs it: debit, then hold."""
+    await _fast_fail(db, item_id, quantity, think)
+    order = _order()
+    db.add(order)
+    await db.flush()
+    await asyncio.sleep(wallet)  # debit_member_wallet
+    try:
+        await reserve_order_stock(db, order.id, {item_id: quantity})
+    except InsufficientStock:
+        await db.rollback()
+        await asyncio.sleep(wallet)  # credit_member_wallet (refund)
+        raise _Refunded
+    await db.commit()
+    return order.id
+
+
+async def _run(label, checkout, sessions, args, created: dict) -> None:
+    item_id = await _seed_item(sessions, args.stock, created)
+    timings: list[float] = []
+    outcomes = {"held": 0, "sold_out": 0, "refunded": 0, "constraint": 0}
+
+    async def _buyer() -> None:
+        started = time.perf_counter()
+        async with sessions() as db:
+            try:
+                created[Order].append(
+                    await checkout(
+                        db,
+                        item_id,
+                        args.quantity,
+                        args.think_ms / 1000,
+                        args.wallet_ms / 1000,
+                    )
+                )
+                outcomes["held"] += 1
+            except _Refunded:
+                outcomes["sold_out"] += 1
+                outcomes["refunded"] += 1
+            except _SoldOut:
+                outcomes["sold_out"] += 1
+            except IntegrityError:
+                outcomes["constraint"] += 1
+        timings.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_buyer() for _ in range(args.buyers)))
+    elapsed = time.perf_counter() - started
+
+    async with sessions() as db:
+        reserved = (
+            await db.execute(
+                select(InventoryItem.quantity_reserved).where(
+                    InventoryItem.id == item_id
+                )
+            )
+        ).scalar_one()
+    oversold = max(outcomes["held"] * args.quantity - args.stock, 0)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(
+        f"  {label:8s} held {outcomes['held']:5d}   sold out "
+        f"{outcomes['sold_out']:5d} ({outcomes['refunded']} refunded)   "
+        f"constraint errors {outcomes['constraint']:4d}   oversold "
+        f"{oversold:4d} units   reserved {reserved}/{args.stock}"
+    )
+    print(
+        f"           {args.buyers / elapsed:7.0f} checkouts/s   "
+        f"median {statistics.median(timings):7.1f} ms   p95 {p95:7.1f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--buyers", type=int, default=500)
+    parser.add_argument("--stock", type=int, default=50)
+    parser.add_argument("--quantity", type=int, default=1)
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--think-ms", type=float, default=20.0)
+    parser.add_argument("--wallet-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    engine = create_async_engine(
+        get_settings().DATABASE_URL,
+        connect_args={"prepare_threshold": 0},
+        pool_size=args.connections,
+        max_overflow=0,
+    )
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    # Deleted in this order: orders cascade to their reservations, inventory
+    # items to their movements, products to their variants.
+    created: dict = {Order: [], InventoryItem: [], Product: [], Category: []}
+    print(
+        f"{args.buyers} buyers x {args.quantity} unit(s) for {args.stock} in "
+        f"stock, {args.connections} connections, {args.think_ms:.0f} ms think, "
+        f"{args.wallet_ms:.0f} ms wallet call"
+    )
+    try:
+        for label, checkout in (
+            ("legacy", _legacy_checkout),
+            ("atomic", _atomic_checkout),
+            ("hold+pay", _hold_then_pay_checkout),
+            ("pay+hold", _pay_then_hold_checkout),
+        ):
+            await _run(label, checkout, sessions, args, created)
+    finally:
+        async with sessions() as db:
+            for model, ids in created.items():
+                if ids:
+                    await db.execute(delete(model).where(model.id.in_(ids)))
+            await db.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,110 @@
+"""Benchmark the ride-assignment planner on synthetic sessions.
+
+Generates sessions of a few hundred riders spread over Lagos pickup points
+(one to three seats per booking) heading to a Yaba pool, and compares:
+
+  * per stop  — the booking-time numbering: riders fill vehicles per pickup
+                location only (``seats // capacity + 1``), one stop per trip
+  * planner   — ``plan_config`` (proximity packing + pickup sequencing)
+
+Reports vehicles used, seat utilisation, total estimated drive minutes and
+planning time. Pure CPU — no database or network. Run:
+
+    python scripts/transport/bench_ride_assignment.py --riders 300 --stops 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+import uuid
+
+from services.transport_service.services.ride_assignment import (
+    RiderBooking,
+    _path_km,
+    drive_minutes,
+    plan_config,
+)
+
+POOL = (6.5095, 3.3711)  # Yaba
+LAGOS = (6.42, 6.68, 3.24, 3.62)  # min_lat, max_lat, min_lon, max_lon
+
+
+def _session(rng: random.Random, riders: int, stops: int):
+    locations = {
+        uuid.uuid4(): (rng.uniform(LAGOS[0], LAGOS[1]), rng.uniform(LAGOS[2], LAGOS[3]))
+        for _ in range(stops)
+    }
+    # Popular stops get more riders (roughly Zipf).
+    ids = list(locations)
+    weights = [1 / (rank + 1) for rank in range(len(ids))]
+    bookings = [
+        RiderBooking(uuid.uuid4(), stop, rng.choice((1, 1, 1, 1, 2, 2, 3)))
+        for stop in rng.choices(ids, weights=weights, k=riders)
+    ]
+    return locations, bookings
+
+
+def _per_stop(bookings, locations, capacity) -> tuple[int, float]:
+    """Vehicles and drive minutes for the booking-time numbering."""
+    seats_by_stop: dict[uuid.UUID, int] = {}
+    for b in bookings:
+        seats_by_stop[b.pickup_location_id] = (
+            seats_by_stop.get(b.pickup_location_id, 0) + b.seats
+        )
+    vehicles = 0
+    minutes = 0.0
+    for stop, seats in seats_by_stop.items():
+        trips = -(-seats // capacity)
+        vehicles += trips
+        minutes += trips * drive_minutes(_path_km([locations[stop]], POOL))
+    return vehicles, minutes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--riders", type=int, default=300)
+    parser.add_argument("--stops", type=int, default=40)
+    parser.add_argument("--capacity", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    naive_vehicles, naive_minutes = [], []
+    plan_vehicles, plan_minutes, plan_ms, utilisation = [], [], [], []
+    for _ in range(args.sessions):
+        locations, bookings = _session(rng, args.riders, args.stops)
+        vehicles, minutes = _per_stop(bookings, locations, args.capacity)
+        naive_vehicles.append(vehicles)
+        naive_minutes.append(minutes)
+
+        started = time.perf_counter()
+        plan = plan_config(uuid.uuid4(), args.capacity, bookings, locations, POOL)
+        plan_ms.append((time.perf_counter() - started) * 1000)
+        plan_vehicles.append(len(plan.rides))
+        plan_minutes.append(plan.total_drive_minutes)
+        utilisation.append(
+            sum(r.seats for r in plan.rides) / (len(plan.rides) * args.capacity)
+        )
+
+    seats = sum(b.seats for b in bookings)
+    print(
+        f"{args.sessions} sessions × {args.riders} riders (~{seats} seats), "
+        f"{args.stops} stops, capacity {args.capacity}"
+    )
+    print(
+        f"  per stop  vehicles {statistics.mean(naive_vehicles):6.1f}   "
+        f"drive {statistics.mean(naive_minutes):8.0f} min"
+    )
+    print(
+        f"  planner   vehicles {statistics.mean(plan_vehicles):6.1f}   "
+        f"drive {statistics.mean(plan_minutes):8.0f} min   "
+        f"fill {statistics.mean(utilisation):5.1%}   "
+        f"plan {statistics.median(plan_ms):6.1f} ms (median)"
+    )
+
+
+if __name__ == "__main__":
+    main()
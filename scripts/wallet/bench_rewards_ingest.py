@@ -0,0 +1,246 @@
+"""Benchmark rewards event ingestion throughput (events/second).
+
+Seeds ``--members`` wallets and three reward rules on one event type (one
+uncapped, one with a lifetime cap, one with a daily cap) and ingests
+``--events`` events three ways:
+
+  * uncached — one event per transaction with the rule index reloaded for
+               every event and the cap counters off, so caps are counted in
+               Postgres: the query shape of the pre-index engine
+  * indexed  — one event per transaction (``POST /events``) with the warm
+               compiled rule index
+  * batch    — ``process_events`` over ``--batch-size`` events per
+               transaction (``POST /events/batch``)
+
+Cap counters use Redis only with ``--redis`` (needs a reachable
+``REDIS_URL``); otherwise every mode counts caps in Postgres. Ledger
+posting is stubbed out. Reports events/second and queries per event.
+Everything runs inside one outer transaction that is rolled back, so
+nothing persists. Run in-container:
+
+    docker compose exec wallet-service \\
+        python scripts/wallet/bench_rewards_ingest.py --events 2000 --redis
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import uuid
+from contextlib import ExitStack
+from unittest.mock import AsyncMock, patch
+
+from libs.common.config import get_settings
+from libs.common.datetime_utils import utc_now
+from services.wallet_service.models import (
+    RewardCategory,
+    RewardPeriod,
+    Wallet,
+    WalletStatus,
+)
+from services.wallet_service.models.rewards import RewardRule, WalletEvent
+from services.wallet_service.services import cap_checker, ledger_emit, rule_index
+from services.wallet_service.services.rewards_engine import (
+    process_event,
+    process_events,
+)
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+EVENT_TYPE = "bench.attendance.checkin"
+
+
+async def _seed_wallets(session: AsyncSession, members: int) -> list[str]:
+    """Fresh members per mode, so every mode starts under the same caps."""
+    now = utc_now()
+    auth_ids = [f"bench-{uuid.uuid4().hex[:12]}" for _ in range(members)]
+    await session.execute(
+        insert(Wallet),
+        [
+            {
+                "id": uuid.uuid4(),
+                "member_id": uuid.uuid4(),
+                "member_auth_id": auth_id,
+                "balance": 0,
+                "status": WalletStatus.ACTIVE,
+                "lifetime_bubbles_purchased": 0,
+                "lifetime_bubbles_spent": 0,
+                "lifetime_bubbles_received": 0,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for auth_id in auth_ids
+        ],
+    )
+    return auth_ids
+
+
+async def _seed_rules(session: AsyncSession) -> None:
+    suffix = uuid.uuid4().hex[:6]
+    session.add_all(
+        [
+            RewardRule(
+                rule_name=f"bench-checkin-{suffix}",
+                display_name="Checked in",
+                event_type=EVENT_TYPE,
+                reward_bubbles=1,
+                category=RewardCategory.RETENTION,
+                priority=0,
+            ),
+            RewardRule(
+                rule_name=f"bench-first-ten-{suffix}",
+                display_name="First ten sessions",
+                event_type=EVENT_TYPE,
+                reward_bubbles=2,
+                category=RewardCategory.RETENTION,
+                max_per_member_lifetime=10,
+                priority=5,
+            ),
+            RewardRule(
+                rule_name=f"bench-early-bird-{suffix}",
+                display_name="Early bird",
+                event_type=EVENT_TYPE,
+                trigger_config={"max_hour": 8},
+                reward_bubbles=3,
+                category=RewardCategory.RETENTION,
+                max_per_member_per_period=1,
+                period=RewardPeriod.DAY,
+                priority=10,
+            ),
+        ]
+    )
+    await session.commit()
+
+
+async def _events(session: AsyncSession, members: int, count: int) -> list[WalletEvent]:
+    auth_ids = await _seed_wallets(session, members)
+    await session.commit()
+    now = utc_now()
+    return [
+        WalletEvent(
+            event_id=uuid.uuid4(),
+            event_type=EVENT_TYPE,
+            member_auth_id=auth_ids[i % len(auth_ids)],
+            service_source="attendance",
+            occurred_at=now,
+            event_data={"hour": 6 + i % 6},
+            idempotency_key=f"bench-{uuid.uuid4().hex}",
+        )
+        for i in range(count)
+    ]
+
+
+async def _one_per_transaction(session: AsyncSession, events: list[WalletEvent]):
+    for wallet_event in events:
+        session.add(wallet_event)
+        await session.flush()
+        await process_event(wallet_event, session)
+        await session.commit()
+
+
+async def _batched(session: AsyncSession, events: list[WalletEvent], size: int):
+    for start in range(0, len(events), size):
+        chunk = events[start : start + size]
+        session.add_all(chunk)
+        await session.flush()
+        await process_events(chunk, session)
+        await session.commit()
+
+
+async def _run(label, work, count: int, statements: list[str]) -> None:
+    statements.clear()
+    started = time.perf_counter()
+    await work
+    elapsed = time.perf_counter() - started
+    print(
+        f"  {label:9s} {count / elapsed:8.0f} events/s   "
+        f"{len(statements) / count:5.1f} queries/event"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--members", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument(
+        "--redis", action="store_true", help="use Redis cap counters (indexed/batch)"
+    )
+    args = parser.parse_args()
+
+    engine = create_async_engine(
+        get_settings().DATABASE_URL, connect_args={"prepare_threshold": 0}
+    )
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, params, context, executemany):
+        if not statement.lstrip().upper().startswith(("SAVEPOINT", "RELEASE")):
+            statements.append(statement)
+
+    redis_down = AsyncMock(side_effect=ConnectionError("bench: Redis disabled"))
+    try:
+        async with engine.connect() as conn:
+            outer = await conn.begin()
+            # Commits inside the engine become savepoint releases of the
+            # outer transaction, which is rolled back at the end.
+            session = AsyncSession(
+                bind=conn,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            )
+            await _seed_rules(session)
+            print(
+                f"{args.events} events over {args.members} members, 3 rules, "
+                f"batch size {args.batch_size}, cap counters in "
+                f"{'Redis' if args.redis else 'Postgres'}"
+            )
+            event.listen(engine.sync_engine, "before_cursor_execute", _count)
+            with ExitStack() as stack:
+                stack.enter_context(
+                    patch.object(ledger_emit, "emit_wallet_txn_to_ledger", AsyncMock())
+                )
+                stack.enter_context(
+                    patch.object(cap_checker.logger, "warning", lambda *a: None)
+                )
+                with (
+                    patch.object(rule_index, "RULE_INDEX_TTL_SECONDS", 0),
+                    patch.object(cap_checker, "get_redis", redis_down),
+                ):
+                    events = await _events(session, args.members, args.events)
+                    await _run(
+                        "uncached",
+                        _one_per_transaction(session, events),
+                        args.events,
+                        statements,
+                    )
+
+                if not args.redis:
+                    stack.enter_context(
+                        patch.object(cap_checker, "get_redis", redis_down)
+                    )
+                rule_index.invalidate_rule_index()
+                events = await _events(session, args.members, args.events)
+                await _run(
+                    "indexed",
+                    _one_per_transaction(session, events),
+                    args.events,
+                    statements,
+                )
+                events = await _events(session, args.members, args.events)
+                await _run(
+                    "batch",
+                    _batched(session, events, args.batch_size),
+                    args.events,
+                    statements,
+                )
+            event.remove(engine.sync_engine, "before_cursor_execute", _count)
+            await session.close()
+            await outer.rollback()
+    finally:
+        rule_index.invalidate_rule_index()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
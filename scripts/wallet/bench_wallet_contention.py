@@ -0,0 +1,237 @@
+"""Benchmark concurrent debits against one wallet: row lock vs conditional UPDATE.
+
+Fires ``--debits`` purchase debits at a single wallet at once (each task
+with its own session, ``--connections`` pooled connections) two ways:
+
+  * locked      — the pre-change path: idempotency lookup, ``SELECT ... FOR
+                  UPDATE`` on the wallet, promo grants loaded and decremented
+                  one ORM row at a time, then the transaction insert and the
+                  wallet flush, all while holding the row lock
+  * conditional — ``debit_wallet``: one ``UPDATE ... WHERE balance >= amount
+                  RETURNING``, one set-based promo-grant UPDATE, the insert
+
+Each mode gets a fresh wallet seeded with ``--grants`` promotional grants,
+so early debits draw promo Bubbles and later ones purchased Bubbles.
+Reports debits/second and median / p95 latency, and checks the final
+balance. Ledger posting is stubbed out. The debits commit (a savepoint can't
+show cross-connection contention), so the bench wallets and their rows are
+deleted at the end. Run in-container:
+
+    docker compose exec wallet-service \\
+        python scripts/wallet/bench_wallet_contention.py --debits 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from unittest.mock import AsyncMock, patch
+
+from libs.common.config import get_settings
+from libs.common.datetime_utils import utc_now
+from services.wallet_service.models import (
+    GrantType,
+    PromotionalBubbleGrant,
+    TransactionDirection,
+    TransactionStatus,
+    TransactionType,
+    Wallet,
+    WalletStatus,
+    WalletTransaction,
+)
+from services.wallet_service.services import ledger_emit
+from services.wallet_service.services.wallet_ops import debit_wallet
+from sqlalchemy import delete, insert, or_, select
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+AMOUNT = 2
+
+
+async def _seed_wallet(sessions, debits: int, grants: int) -> Wallet:
+    now = utc_now()
+    async with sessions() as session:
+        wallet = Wallet(
+            member_id=uuid.uuid4(),
+            member_auth_id=f"bench-{uuid.uuid4().hex[:12]}",
+            balance=debits * AMOUNT,
+            status=WalletStatus.ACTIVE,
+            lifetime_bubbles_purchased=debits * AMOUNT // 2,
+            lifetime_bubbles_spent=0,
+            lifetime_bubbles_received=debits * AMOUNT // 2,
+        )
+        session.add(wallet)
+        await session.flush()
+        if grants:
+            # Half the balance is promotional, spread over ``grants`` grants.
+            per_grant = max(1, debits * AMOUNT // 2 // grants)
+            await session.execute(
+                insert(PromotionalBubbleGrant),
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        "wallet_id": wallet.id,
+                        "member_auth_id": wallet.member_auth_id,
+                        "grant_type": GrantType.CAMPAIGN,
+                        "bubbles_amount": per_grant,
+                        "bubbles_remaining": per_grant,
+                        "reason": "Contention bench",
+                        "created_at": now,
+                    }
+                    for _ in range(grants)
+                ],
+            )
+        await session.commit()
+        return wallet
+
+
+async def _locked_debit(db: AsyncSession, auth_id: str, key: str) -> None:
+    """The pre-change ``debit_wallet`` body (validation errors omitted)."""
+    existing = await db.execute(
+        select(WalletTransaction).where(WalletTransaction.idempotency_key == key)
+    )
+    if existing.scalar_one_or_none():
+        return
+    wallet = (
+        await db.execute(
+            select(Wallet).where(Wallet.member_auth_id == auth_id).with_for_update()
+        )
+    ).scalar_one()
+    now = utc_now()
+    grants = (
+        (
+            await db.execute(
+                select(PromotionalBubbleGrant)
+                .where(
+                    PromotionalBubbleGrant.wallet_id == wallet.id,
+                    PromotionalBubbleGrant.bubbles_remaining > 0,
+                    or_(
+                        PromotionalBubbleGrant.expires_at.is_(None),
+                        PromotionalBubbleGrant.expires_at > now,
+                    ),
+                )
+                .order_by(PromotionalBubbleGrant.created_at.asc())
+            )
+        )
+        .scalars()
+        .all()
+    )
+    remaining = AMOUNT
+    for grant in grants:
+        if remaining <= 0:
+            break
+        take = min(remaining, grant.bubbles_remaining)
+        grant.bubbles_remaining -= take
+        remaining -= take
+    db.add(
+        WalletTransaction(
+            wallet_id=wallet.id,
+            idempotency_key=key,
+            transaction_type=TransactionType.PURCHASE,
+            direction=TransactionDirection.DEBIT,
+            amount=AMOUNT,
+            balance_before=wallet.balance,
+            balance_after=wallet.balance - AMOUNT,
+            status=TransactionStatus.COMPLETED,
+            description="Contention bench",
+            service_source="bench",
+            txn_metadata={
+                "promo_bubbles": AMOUNT - remaining,
+                "purchased_bubbles": remaining,
+            },
+        )
+    )
+    wallet.balance -= AMOUNT
+    wallet.lifetime_bubbles_spent += AMOUNT
+    wallet.updated_at = now
+    await db.commit()
+
+
+async def _conditional_debit(db: AsyncSession, auth_id: str, key: str) -> None:
+    await debit_wallet(
+        db,
+        member_auth_id=auth_id,
+        amount=AMOUNT,
+        idempotency_key=key,
+        transaction_type=TransactionType.PURCHASE,
+        description="Contention bench",
+        service_source="bench",
+    )
+
+
+async def _run(label, debit, sessions, debits: int, grants: int) -> uuid.UUID:
+    wallet = await _seed_wallet(sessions, debits, grants)
+    timings: list[float] = []
+
+    async def _one() -> None:
+        started = time.perf_counter()
+        async with sessions() as db:
+            await debit(db, wallet.member_auth_id, f"bench-{uuid.uuid4().hex}")
+        timings.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_one() for _ in range(debits)))
+    elapsed = time.perf_counter() - started
+
+    async with sessions() as db:
+        balance = (
+            await db.execute(select(Wallet.balance).where(Wallet.id == wallet.id))
+        ).scalar_one()
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(
+        f"  {label:11s} {debits / elapsed:7.0f} debits/s   "
+        f"median {statistics.median(timings):7.1f} ms   p95 {p95:7.1f} ms   "
+        f"final balance {balance} {'ok' if balance == 0 else 'MISMATCH'}"
+    )
+    return wallet.id
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--debits", type=int, default=500)
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--grants", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_async_engine(
+        get_settings().DATABASE_URL,
+        connect_args={"prepare_threshold": 0},
+        pool_size=args.connections,
+        max_overflow=0,
+    )
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    wallet_ids: list[uuid.UUID] = []
+    print(
+        f"{args.debits} concurrent debits of {AMOUNT} on one wallet, "
+        f"{args.connections} connections, {args.grants} promo grants"
+    )
+    try:
+        with patch.object(ledger_emit, "emit_wallet_txn_to_ledger", AsyncMock()):
+            for label, debit in (
+                ("locked", _locked_debit),
+                ("conditional", _conditional_debit),
+            ):
+                wallet_ids.append(
+                    await _run(label, debit, sessions, args.debits, args.grants)
+                )
+    finally:
+        if wallet_ids:
+            async with sessions() as db:
+                for model in (WalletTransaction, PromotionalBubbleGrant):
+                    await db.execute(
+                        delete(model).where(model.wallet_id.in_(wallet_ids))
+                    )
+                await db.execute(delete(Wallet).where(Wallet.id.in_(wallet_ids)))
+                await db.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,294 @@
+"""Benchmark wallet ecosystem / member stats: raw scans vs daily aggregates.
+
+Seeds ``--wallets`` wallets and ``--transactions`` completed transactions
+(purchases over four service buckets, one in five a top-up) spread over
+``--days`` days with one ``INSERT … SELECT generate_series``, rebuilds the
+daily stats, then times
+
+  * ecosystem — ``/ecosystem-stats`` over the last 30 days and over the
+                whole history: the old four scans of wallet_transactions vs
+                ``ecosystem_stats``
+  * member    — ``/member-summary`` for a random wallet over a 90-day
+                window with partial edge days: the old scan vs
+                ``member_wallet_summary``
+
+Each pair is checked for equal results. Reports median / p95 latency.
+Everything runs inside one transaction that is rolled back, so nothing
+persists. Run in-container:
+
+    docker compose exec wallet-service \\
+        python scripts/wallet/bench_wallet_stats.py --transactions 2000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+from libs.common.config import get_settings
+from libs.common.datetime_utils import utc_now
+from services.wallet_service.models import (
+    TransactionDirection,
+    TransactionStatus,
+    TransactionType,
+    Wallet,
+    WalletStatus,
+    WalletTransaction,
+)
+from services.wallet_service.services.wallet_stats import (
+    UNCATEGORIZED_BUCKET,
+    ecosystem_stats,
+    member_wallet_summary,
+    rebuild_wallet_stats,
+)
+from sqlalchemy import case, distinct, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+_SEED_TRANSACTIONS = text(
+    """
+    INSERT INTO wallet_transactions (
+        id, wallet_id, idempotency_key, transaction_type, direction, amount,
+        balance_before, balance_after, status, description, service_source,
+        created_at, updated_at
+    )
+    SELECT
+        gen_random_uuid(),
+        w.ids[1 + (g * 7919) % cardinality(w.ids)],
+        :prefix || g,
+        (CASE WHEN g % 5 = 0 THEN 'topup' ELSE 'purchase' END)
+            ::transaction_type_enum,
+        (CASE WHEN g % 5 = 0 THEN 'credit' ELSE 'debit' END)
+            ::transaction_direction_enum,
+        1 + g % 50,
+        0,
+        0,
+        'completed'::transaction_status_enum,
+        'bench',
+        (ARRAY['store_service', 'academy_service', 'sessions_service', NULL])
+            [1 + (g / 3) % 4],
+        :start + (g % :span_seconds) * interval '1 second',
+        now()
+    FROM generate_series(1, :count) AS g,
+        (SELECT array_agg(id) AS ids FROM wallets WHERE id = ANY(:wallet_ids)) AS w
+    """
+)
+
+
+async def _seed(
+    session: AsyncSession, wallets: int, transactions: int, days: int
+) -> list[uuid.UUID]:
+    now = utc_now()
+    wallet_ids = [uuid.uuid4() for _ in range(wallets)]
+    await session.execute(
+        insert(Wallet),
+        [
+            {
+                "id": wallet_id,
+                "member_id": uuid.uuid4(),
+                "member_auth_id": f"bench-{wallet_id.hex[:12]}",
+                "balance": 0,
+                "status": WalletStatus.ACTIVE,
+                "lifetime_bubbles_purchased": 0,
+                "lifetime_bubbles_spent": 0,
+                "lifetime_bubbles_received": 0,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for wallet_id in wallet_ids
+        ],
+    )
+    await session.execute(
+        _SEED_TRANSACTIONS,
+        {
+            "prefix": f"bench-{uuid.uuid4().hex[:8]}-",
+            "start": now - timedelta(days=days),
+            "span_seconds": days * 86400,
+            "count": transactions,
+            "wallet_ids": wallet_ids,
+        },
+    )
+    await session.execute(text("ANALYZE wallet_transactions"))
+    return wallet_ids
+
+
+async def _raw_ecosystem(session: AsyncSession, start: date, end: date) -> dict:
+    """The pre-aggregate endpoint body: four scans of wallet_transactions."""
+    txn = WalletTransaction
+    in_window = (
+        txn.created_at >= datetime.combine(start, datetime.min.time(), timezone.utc),
+        txn.created_at
+        < datetime.combine(end + timedelta(days=1), datetime.min.time(), timezone.utc),
+        txn.status == TransactionStatus.COMPLETED,
+    )
+    bucket = func.coalesce(txn.service_source, UNCATEGORIZED_BUCKET)
+    active = (
+        await session.execute(
+            select(func.count(distinct(txn.wallet_id))).where(*in_window)
+        )
+    ).scalar()
+    spend = dict(
+        (
+            await session.execute(
+                select(bucket.label("bucket"), func.sum(txn.amount))
+                .where(*in_window, txn.direction == TransactionDirection.DEBIT)
+                .group_by("bucket")
+            )
+        ).all()
+    )
+    topup = (
+        await session.execute(
+            select(func.coalesce(func.sum(txn.amount), 0)).where(
+                *in_window,
+                txn.direction == TransactionDirection.CREDIT,
+                txn.transaction_type == TransactionType.TOPUP,
+            )
+        )
+    ).scalar()
+    per_wallet = (
+        select(func.count(distinct(bucket)).label("services"))
+        .where(*in_window, txn.direction == TransactionDirection.DEBIT)
+        .group_by(txn.wallet_id)
+        .subquery()
+    )
+    cross = (
+        await session.execute(
+            select(func.count())
+            .select_from(per_wallet)
+            .where(per_wallet.c.services >= 2)
+        )
+    ).scalar()
+    return {
+        "active_wallet_users": int(active or 0),
+        "cross_service_users": int(cross or 0),
+        "total_bubbles_spent": int(sum(spend.values())),
+        "total_topup_bubbles": int(topup or 0),
+    }
+
+
+async def _raw_member(session, wallet_id, date_from, date_to) -> tuple[int, int]:
+    txn = WalletTransaction
+    row = (
+        await session.execute(
+            select(
+                func.coalesce(
+                    func.sum(
+                        case(
+                            (txn.direction == TransactionDirection.CREDIT, txn.amount),
+                            else_=0,
+                        )
+                    ),
+                    0,
+                ),
+                func.coalesce(
+                    func.sum(
+                        case(
+                            (txn.direction == TransactionDirection.DEBIT, txn.amount),
+                            else_=0,
+                        )
+                    ),
+                    0,
+                ),
+            ).where(
+                txn.wallet_id == wallet_id,
+                txn.created_at >= date_from,
+                txn.created_at <= date_to,
+            )
+        )
+    ).one()
+    return int(row[0]), int(row[1])
+
+
+async def _measure(label: str, calls, repeats: int) -> list:
+    timings, results = [], []
+    for i in range(repeats):
+        started = time.perf_counter()
+        results.append(await calls(i))
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(
+        f"  {label:24s} median {statistics.median(timings):9.1f} ms   "
+        f"p95 {p95:9.1f} ms"
+    )
+    return results
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=2_000_000)
+    parser.add_argument("--wallets", type=int, default=20_000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    engine = create_async_engine(
+        get_settings().DATABASE_URL, connect_args={"prepare_threshold": 0}
+    )
+    try:
+        async with engine.connect() as conn:
+            outer = await conn.begin()
+            session = AsyncSession(bind=conn, expire_on_commit=False)
+            started = time.perf_counter()
+            wallet_ids = await _seed(
+                session, args.wallets, args.transactions, args.days
+            )
+            print(
+                f"seeded {args.transactions} transactions over {args.wallets} "
+                f"wallets and {args.days} days in "
+                f"{time.perf_counter() - started:.1f} s"
+            )
+            started = time.perf_counter()
+            totals, activity = await rebuild_wallet_stats(session)
+            print(
+                f"rebuilt stats ({totals} daily totals, {activity} member-day "
+                f"rows) in {time.perf_counter() - started:.1f} s"
+            )
+
+            today = utc_now().date()
+            for label, start in (
+                ("30 days", today - timedelta(days=29)),
+                ("all history", today - timedelta(days=args.days)),
+            ):
+                print(f"ecosystem stats, {label}:")
+                raw = await _measure(
+                    "raw scans",
+                    lambda _: _raw_ecosystem(session, start, today),
+                    args.repeats,
+                )
+                agg = await _measure(
+                    "daily aggregates",
+                    lambda _: ecosystem_stats(session, start, today),
+                    args.repeats,
+                )
+                match = all(agg[0][key] == value for key, value in raw[0].items())
+                print(f"  results match: {match}")
+
+            rng = random.Random(7)
+            windows = []
+            for _ in range(args.repeats):
+                end = utc_now() - timedelta(seconds=rng.randrange(args.days * 43200))
+                windows.append((rng.choice(wallet_ids), end - timedelta(days=90), end))
+            print("member summary, 90 days:")
+            raw = await _measure(
+                "raw scan", lambda i: _raw_member(session, *windows[i]), args.repeats
+            )
+            agg = await _measure(
+                "daily aggregates",
+                lambda i: member_wallet_summary(session, *windows[i]),
+                args.repeats,
+            )
+            print(f"  results match: {raw == agg}")
+
+            await session.close()
+            await outer.rollback()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
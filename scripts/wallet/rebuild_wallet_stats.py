@@ -0,0 +1,59 @@
+"""Rebuild the daily wallet stats from wallet_transactions.
+
+Why: ``wallet_daily_totals`` and ``wallet_member_daily_activity`` are
+maintained by every ``wallet_ops`` write and backfilled by the migration
+that adds them, but transactions written outside ``wallet_ops`` (e.g. by
+hand-run SQL, or by the previous release mid-deploy) aren't counted. This re-derives both tables from the transactions in
+one ``INSERT … SELECT`` per table — every day, or UTC days from ``--since``
+on. Wallet writes wait on the stats tables' lock while it runs, so prefer
+``--since`` for repairs.
+
+Idempotent — re-running recomputes the same values. Dry-run by default
+(everything is rolled back); pass --commit to keep it:
+
+  docker compose exec wallet-service \\
+    python scripts/wallet/rebuild_wallet_stats.py                 # dry-run
+  ...  python scripts/wallet/rebuild_wallet_stats.py --since 2026-10-01 --commit
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import date
+from typing import Optional
+
+from libs.common.config import get_settings
+from services.wallet_service.services.wallet_stats import rebuild_wallet_stats
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+
+async def main(commit: bool, since: Optional[date]) -> None:
+    engine = create_async_engine(
+        get_settings().DATABASE_URL, connect_args={"prepare_threshold": 0}
+    )
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with factory() as session:
+            print(f"mode: {'COMMIT' if commit else 'DRY-RUN (rolled back)'}")
+            print(f"days: {f'from {since}' if since else 'all'}")
+            totals, activity = await rebuild_wallet_stats(session, since)
+            print(f"daily total rows written: {totals}")
+            print(f"member activity rows written: {activity}")
+            if commit:
+                await session.commit()
+            else:
+                await session.rollback()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commit", action="store_true")
+    parser.add_argument(
+        "--since", type=date.fromisoformat, help="first UTC day (YYYY-MM-DD)"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.commit, args.since))
@@ -6,7 +6,11 @@ from services.academy_service.models.cohort import (
     CohortResource,
     CohortTimelineShiftLog,
 )
-from services.academy_service.models.enrollment import Enrollment, EnrollmentInstallment
+from services.academy_service.models.enrollment import (
+    CertificateArtifact,
+    Enrollment,
+    EnrollmentInstallment,
+)
 from services.academy_service.models.enums import (
     BillingType,
     CoachAssignmentRole,
@@ -51,6 +55,7 @@ from services.academy_service.models.progress import (
 
 __all__ = [
     "BillingType",
+    "CertificateArtifact",
     "CoachAssignment",
     "CoachAssignmentRole",
     "CoachAssignmentStatus",
@@ -13,7 +13,7 @@ from services.academy_service.models.enums import (
 )
 from sqlalchemy import JSON, Boolean, DateTime
 from sqlalchemy import Enum as SAEnum
-from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import ForeignKey, Integer, LargeBinary, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -206,3 +206,31 @@ class EnrollmentInstallment(Base):
 
     def __repr__(self):
         return f"<EnrollmentInstallment Enrollment={self.enrollment_id} No={self.installment_number} Status={self.status}>"
+
+
+class CertificateArtifact(Base):
+    """A rendered certificate PDF, content-addressed and immutable.
+
+    ``digest`` is ``libs.common.pdf.certificate_digest`` of the certificate
+    inputs (name, programme, completion date, code, template version), so a
+    row never changes: new inputs or a new template get a new row. Served
+    by ``GET /enrollments/{id}/certificate.pdf`` with the digest as ETag.
+    """
+
+    __tablename__ = "certificate_artifacts"
+
+    digest: Mapped[str] = mapped_column(String(64), primary_key=True)
+    enrollment_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("enrollments.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    pdf: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now
+    )
+
+    def __repr__(self):
+        return f"<CertificateArtifact {self.digest[:12]} {self.enrollment_id}>"
@@ -25,6 +25,9 @@ from services.academy_service.schemas import (
     ShadowEvaluationCreate,
     ShadowEvaluationResponse,
 )
+from services.academy_service.services.coach_dashboard import (
+    invalidate_coach_dashboards,
+)
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -113,11 +116,14 @@ async def create_assignment(
     db.add(assignment)
 
     # Also set Cohort.coach_id for backward compat when assigning a lead
+    previous_coach_id = cohort.coach_id
     if data.role == AssignmentRoleEnum.LEAD and not data.is_session_override:
         cohort.coach_id = data.coach_id
 
     await db.commit()
     await db.refresh(assignment)
+    if cohort.coach_id != previous_coach_id:
+        await invalidate_coach_dashboards(previous_coach_id, cohort.coach_id)
 
     coach_name = await _get_member_name(data.coach_id)
     return _assignment_to_response(
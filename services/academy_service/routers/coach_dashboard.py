@@ -24,6 +24,7 @@ from services.academy_service.routers._shared import (
     StudentProgress,
     UpcomingSessionSummary,
     _sync_installment_state_for_enrollment,
+    asyncio,
     func,
     get_async_db,
     get_coach_profile,
@@ -39,6 +40,14 @@ from services.academy_service.routers._shared import (
     utc_now,
     uuid,
 )
+from services.academy_service.services.coach_dashboard import (
+    cache_coach_member_id,
+    cache_dashboard,
+    get_cached_coach_member_id,
+    get_cached_dashboard,
+    invalidate_coach_dashboards,
+    load_coach_dashboard,
+)
 
 router = APIRouter(tags=["academy"])
 logger = get_logger(__name__)
@@ -64,38 +73,37 @@ async def get_coach_dashboard(
     - Next upcoming session
             - Earnings summary
     """
-    # 1. Resolve Member ID via members-service
-    member = await get_member_by_auth_id(
-        current_user.user_id, calling_service="academy"
+    # 1. Resolve Member ID via members-service (the mapping is cached)
+    member_id = await get_cached_coach_member_id(current_user.user_id)
+    if member_id is None:
+        member = await get_member_by_auth_id(
+            current_user.user_id, calling_service="academy"
+        )
+        if not member:
+            raise HTTPException(status_code=404, detail="Member profile not found")
+        member_id = member["id"]
+        await cache_coach_member_id(current_user.user_id, member_id)
+
+    cached = await get_cached_dashboard(member_id)
+    if cached is not None:
+        return cached
+
+    # 2. Coach profile (rate info) over HTTP while the DB aggregates:
+    #    cohorts, grouped enrollment counts and pending reviews.
+    coach_profile, data = await asyncio.gather(
+        get_coach_profile(str(member_id), calling_service="academy"),
+        load_coach_dashboard(db, uuid.UUID(str(member_id))),
     )
-    if not member:
-        raise HTTPException(status_code=404, detail="Member profile not found")
-
-    member_id = member["id"]
-
-    # 2. Get coach profile for rate info
-    coach_profile = await get_coach_profile(str(member_id), calling_service="academy")
     stipend = coach_profile["academy_cohort_stipend"] if coach_profile else 0
 
-    # 3. Get all cohorts for this coach with program info
-    cohorts_query = (
-        select(Cohort)
-        .where(Cohort.coach_id == member_id)
-        .options(selectinload(Cohort.program))
-    )
-    cohorts_result = await db.execute(cohorts_query)
-    cohorts = cohorts_result.scalars().all()
-
-    # 4. Count cohorts by status
+    # 3. Count cohorts by status
     active_cohorts = 0
     upcoming_cohorts = 0
     completed_cohorts = 0
     current_period_earnings = 0
-    cohort_ids = []
 
     now = utc_now()
-    for cohort in cohorts:
-        cohort_ids.append(cohort.id)
+    for cohort in data.cohorts:
         if cohort.status == CohortStatus.ACTIVE:
             active_cohorts += 1
             current_period_earnings += stipend or 0
@@ -104,83 +112,38 @@ async def get_coach_dashboard(
         elif cohort.status == CohortStatus.COMPLETED:
             completed_cohorts += 1
 
-    # 5. Get student counts
-    total_students = 0
-    students_pending = 0
-    if cohort_ids:
-        students_query = select(
-            func.count(Enrollment.id)
-            .filter(Enrollment.status == EnrollmentStatus.ENROLLED)
-            .label("enrolled"),
-            func.count(Enrollment.id)
-            .filter(Enrollment.status == EnrollmentStatus.PENDING_APPROVAL)
-            .label("pending"),
-        ).where(Enrollment.cohort_id.in_(cohort_ids))
-        students_result = await db.execute(students_query)
-        counts = students_result.mappings().first()
-        if counts:
-            total_students = counts["enrolled"] or 0
-            students_pending = counts["pending"] or 0
-
-    # 6. Count pending milestone reviews
-    pending_reviews = 0
-    if cohort_ids:
-        # Get enrollment IDs for these cohorts
-        enrollment_ids_query = select(Enrollment.id).where(
-            Enrollment.cohort_id.in_(cohort_ids),
-            Enrollment.status == EnrollmentStatus.ENROLLED,
-        )
-        enrollment_ids_result = await db.execute(enrollment_ids_query)
-        enrollment_ids = [row[0] for row in enrollment_ids_result.fetchall()]
-
-        if enrollment_ids:
-            pending_query = select(func.count(StudentProgress.id)).where(
-                StudentProgress.enrollment_id.in_(enrollment_ids),
-                StudentProgress.status == ProgressStatus.PENDING,
-                # Claimed and awaiting review. reviewed_at is NULL on a fresh
-                # claim/resubmission and set once a coach acts, so this counts
-                # claims (with or without evidence) but excludes rejected items.
-                StudentProgress.reviewed_at.is_(None),
-            )
-            pending_result = await db.execute(pending_query)
-            pending_reviews = pending_result.scalar() or 0
+    # 4. Student counts
+    total_students = sum(enrolled for enrolled, _ in data.enrollment_counts.values())
+    students_pending = sum(pending for _, pending in data.enrollment_counts.values())
 
-    # 7. Find next upcoming session (simplified - based on active cohorts)
+    # 5. Find next upcoming session (simplified - based on active cohorts)
     next_session = None
-    if active_cohorts > 0:
-        # Get the first active cohort as a proxy for next session
-        for cohort in cohorts:
-            if cohort.status == CohortStatus.ACTIVE:
-                # Get enrolled count for this cohort
-                enrolled_query = select(func.count(Enrollment.id)).where(
-                    Enrollment.cohort_id == cohort.id,
-                    Enrollment.status == EnrollmentStatus.ENROLLED,
-                )
-                enrolled_result = await db.execute(enrolled_query)
-                enrolled_count = enrolled_result.scalar() or 0
-
-                next_session = UpcomingSessionSummary(
-                    cohort_id=cohort.id,
-                    cohort_name=cohort.name,
-                    program_name=cohort.program.name if cohort.program else None,
-                    session_date=cohort.start_date,  # Placeholder - would need session model
-                    location_name=cohort.location_name,
-                    enrolled_count=enrolled_count,
-                )
-                break
+    for cohort in data.cohorts:
+        if cohort.status == CohortStatus.ACTIVE:
+            next_session = UpcomingSessionSummary(
+                cohort_id=cohort.id,
+                cohort_name=cohort.name,
+                program_name=cohort.program_name,
+                session_date=cohort.start_date,  # Placeholder - would need session model
+                location_name=cohort.location_name,
+                enrolled_count=data.enrollment_counts.get(cohort.id, (0, 0))[0],
+            )
+            break
 
-    return CoachDashboardSummary(
+    summary = CoachDashboardSummary(
         active_cohorts=active_cohorts,
         upcoming_cohorts=upcoming_cohorts,
         completed_cohorts=completed_cohorts,
         total_students=total_students,
         students_pending_approval=students_pending,
-        pending_milestone_reviews=pending_reviews,
+        pending_milestone_reviews=data.pending_reviews,
         upcoming_sessions_count=active_cohorts,  # Simplified
         next_session=next_session,
         current_period_earnings=current_period_earnings,
         pending_payout=current_period_earnings,  # Placeholder
     )
+    await cache_dashboard(member_id, summary.model_dump(mode="json"))
+    return summary
 
 
 @router.get("/coach/me/cohorts/{cohort_id}", response_model=CoachCohortDetail)
@@ -687,6 +650,7 @@ async def review_milestone_claim(
     )
 
     await db.commit()
+    await invalidate_coach_dashboards(member_id)
 
     return {
         "message": f"Milestone {action.action}d successfully",
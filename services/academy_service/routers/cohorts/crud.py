@@ -19,6 +19,9 @@ from services.academy_service.models import CoachAssignment, Cohort
 from services.academy_service.routers._shared import _ensure_active_coach
 from services.academy_service.schemas import CohortCreate, CohortResponse, CohortUpdate
 from services.academy_service.services.chat_sync import ensure_cohort_channel
+from services.academy_service.services.coach_dashboard import (
+    invalidate_coach_dashboards,
+)
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -66,6 +69,7 @@ async def create_cohort(
             cohort.coach_id = ca_input.coach_id
 
     await db.commit()
+    await invalidate_coach_dashboards(cohort.coach_id)
 
     # Provision the cohort's chat channel (best-effort — never fails the
     # cohort create on chat downtime). The lead coach becomes channel admin
@@ -108,11 +112,15 @@ async def update_cohort(
         raise HTTPException(status_code=404, detail="Cohort not found")
 
     update_data = cohort_in.model_dump(exclude_unset=True)
+    previous_coach_id = cohort.coach_id
 
     for field, value in update_data.items():
         setattr(cohort, field, value)
 
     await db.commit()
+    # Name, dates and status show on the coach's dashboard (old and new
+    # coach, should the update ever move the cohort).
+    await invalidate_coach_dashboards(previous_coach_id, cohort.coach_id)
 
     query = (
         select(Cohort)
@@ -153,8 +161,10 @@ async def delete_cohort(
 
     # DB cascades handle: enrollments → student_progress, cohort_resources,
     # cohort_complexity_scores, coach_assignments (all have ondelete="CASCADE").
+    coach_id = cohort.coach_id
     await db.delete(cohort)
     await db.commit()
+    await invalidate_coach_dashboards(coach_id)
     return None
 
 
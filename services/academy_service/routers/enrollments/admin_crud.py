@@ -31,6 +31,9 @@ from services.academy_service.services.chat_sync import (
     ensure_cohort_channel,
     reconcile_cohort_membership,
 )
+from services.academy_service.services.coach_dashboard import (
+    invalidate_dashboards_for_cohorts,
+)
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -119,6 +122,7 @@ async def enroll_student(
     await _sync_installment_state_for_enrollment(db, enrollment)
 
     await db.commit()
+    await invalidate_dashboards_for_cohorts(db, enrollment.cohort_id)
 
     refreshed = await db.execute(
         select(Enrollment)
@@ -316,12 +320,16 @@ async def update_enrollment(
     if not enrollment:
         raise HTTPException(status_code=404, detail="Enrollment not found")
 
+    previous_cohort_id = enrollment.cohort_id
     update_data = enrollment_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(enrollment, field, value)
 
     await _sync_installment_state_for_enrollment(db, enrollment)
     await db.commit()
+    await invalidate_dashboards_for_cohorts(
+        db, previous_cohort_id, enrollment.cohort_id
+    )
 
     # Reload with relationships eager loaded to avoid lazy-load during response serialization
     refreshed = await db.execute(query)
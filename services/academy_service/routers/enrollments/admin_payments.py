@@ -32,6 +32,9 @@ from services.academy_service.services.chat_sync import (
     ensure_cohort_channel,
     reconcile_cohort_membership,
 )
+from services.academy_service.services.coach_dashboard import (
+    invalidate_dashboards_for_cohorts,
+)
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -193,6 +196,7 @@ async def admin_mark_enrollment_paid(
                 enrollment.status = EnrollmentStatus.ENROLLED
 
     await db.commit()
+    await invalidate_dashboards_for_cohorts(db, enrollment.cohort_id)
 
     # Best-effort: reconcile chat-channel membership. Idempotent — safe to
     # call on every mark-paid hit (Paystack webhook + verify fallback +
@@ -466,6 +470,7 @@ async def admin_dropout_action(
         )
 
     await db.commit()
+    await invalidate_dashboards_for_cohorts(db, enrollment.cohort_id)
 
     # Reflect the dropout decision in chat membership. Best-effort.
     if enrollment.cohort_id is not None:
@@ -29,6 +29,9 @@ from services.academy_service.schemas import (
     WithdrawEnrollmentRequest,
     WithdrawEnrollmentResponse,
 )
+from services.academy_service.services.coach_dashboard import (
+    invalidate_dashboards_for_cohorts,
+)
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -344,6 +347,7 @@ async def withdraw_my_enrollment(
     )
 
     await db.commit()
+    await invalidate_dashboards_for_cohorts(db, enrollment.cohort_id)
 
     refund_naira = refund_kobo / 100
     if refund_kobo > 0:
@@ -21,6 +21,9 @@ from services.academy_service.routers._shared import (
     _sync_installment_state_for_enrollment,
 )
 from services.academy_service.schemas import EnrollmentResponse
+from services.academy_service.services.coach_dashboard import (
+    invalidate_dashboards_for_cohorts,
+)
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -214,6 +217,7 @@ async def self_enroll(
     await _sync_installment_state_for_enrollment(db, enrollment)
 
     await db.commit()
+    await invalidate_dashboards_for_cohorts(db, enrollment.cohort_id)
 
     # Re-fetch with relationships to avoid lazy loading issues
     query = (
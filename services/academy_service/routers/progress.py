@@ -34,6 +34,9 @@ from services.academy_service.routers._shared import (
     utc_now,
     uuid,
 )
+from services.academy_service.services.coach_dashboard import (
+    invalidate_dashboards_for_cohorts,
+)
 
 router = APIRouter(tags=["academy"])
 logger = get_logger(__name__)
@@ -183,6 +186,7 @@ async def update_student_progress(
 
     await db.commit()
     await db.refresh(progress)
+    await invalidate_dashboards_for_cohorts(db, enrollment.cohort_id)
 
     # Best-effort: emit academy milestone reward event
     await emit_rewards_event(
@@ -357,6 +361,7 @@ async def claim_milestone(
 
     await db.commit()
     await db.refresh(progress)
+    await invalidate_dashboards_for_cohorts(db, enrollment.cohort_id)
     return progress
 
 
@@ -572,6 +577,7 @@ async def override_progress(
 
     await db.commit()
     await db.refresh(progress)
+    await invalidate_dashboards_for_cohorts(db, enrollment.cohort_id)
 
     logger.info(
         "Override recorded: progress=%s actor=%s:%s new_status=%s prior_event=%s",
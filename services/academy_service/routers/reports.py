@@ -1,4 +1,9 @@
-from fastapi import APIRouter
+import asyncio
+
+from fastapi import APIRouter, Request
+from libs.common.http_cache import etag_matches
+from libs.common.pdf import certificate_digest
+from services.academy_service.models import CertificateArtifact
 from services.academy_service.routers._shared import (
     AsyncSession,
     AuthUser,
@@ -22,10 +27,17 @@ from services.academy_service.routers._shared import (
     utc_now,
     uuid,
 )
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 router = APIRouter(tags=["academy"])
 logger = get_logger(__name__)
 
+# The artifact is keyed by digest but the URL isn't: a name or programme
+# change serves a different certificate at the same URL. So the browser
+# revalidates every time, which costs a 304 while the digest ETag still
+# matches; "private" because certificates are per-member.
+_CERTIFICATE_CACHE_CONTROL = "private, no-cache"
+
 
 # --- PDF Reports ---
 
@@ -133,12 +145,17 @@ async def download_cohort_progress_report(
 @router.get("/enrollments/{enrollment_id}/certificate.pdf")
 async def download_certificate(
     enrollment_id: uuid.UUID,
+    request: Request,
     current_user: AuthUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db),
 ):
     """
     Download completion certificate for an enrollment.
     Only available if all milestones are completed and certificate was issued.
+
+    The PDF is stored as an immutable artifact keyed by the digest of its
+    inputs and served with that digest as a strong ETag, revalidated on
+    every request.
     """
     # Get enrollment with program and cohort
     query = (
@@ -185,18 +202,39 @@ async def download_certificate(
     program = enrollment.program or (cohort.program if cohort else None)
     program_name = program.name if program else "SwimBuddz Program"
 
-    # Generate PDF
-    pdf_bytes = generate_certificate_pdf(
-        student_name=student_name,
-        program_name=program_name,
-        completion_date=enrollment.certificate_issued_at,
-        verification_code=enrollment.certificate_code,
-    )
+    cert_inputs = {
+        "student_name": student_name,
+        "program_name": program_name,
+        "completion_date": enrollment.certificate_issued_at,
+        "verification_code": enrollment.certificate_code,
+    }
+    digest = certificate_digest(**cert_inputs)
+    headers = {
+        "ETag": f'"{digest}"',
+        "Cache-Control": _CERTIFICATE_CACHE_CONTROL,
+        "Content-Disposition": f"attachment; filename=certificate_{program_name.replace(' ', '_')}.pdf",
+    }
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    # Rendered once per distinct certificate, then served from the stored
+    # artifact. Rendering is CPU-bound, so it runs off the event loop.
+    artifact = await db.get(CertificateArtifact, digest)
+    if artifact is not None:
+        pdf_bytes = artifact.pdf
+    else:
+        pdf_bytes = await asyncio.to_thread(generate_certificate_pdf, **cert_inputs)
+        await db.execute(
+            pg_insert(CertificateArtifact)
+            .values(
+                digest=digest,
+                enrollment_id=enrollment.id,
+                pdf=pdf_bytes,
+                size_bytes=len(pdf_bytes),
+                created_at=utc_now(),
+            )
+            .on_conflict_do_nothing(index_elements=["digest"])
+        )
+        await db.commit()
 
-    return Response(
-        content=pdf_bytes,
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f"attachment; filename=certificate_{program_name.replace(' ', '_')}.pdf"
-        },
-    )
+    return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
@@ -0,0 +1,191 @@
+"""Aggregated coach dashboard summary and its per-coach Redis cache.
+
+``GET /academy/coach/me/dashboard`` is assembled from three queries no
+matter how many cohorts the coach has: the cohorts (with program name),
+enrollment counts grouped by cohort, and the pending-review count. The
+summary is cached per coach for ``COACH_DASHBOARD_TTL_SECONDS`` and dropped
+explicitly when an enrollment or milestone claim in one of the coach's
+cohorts changes (``invalidate_dashboards_for_cohorts``) and when an admin
+creates, edits or deletes a cohort or moves it to another lead coach (both
+coaches); background status transitions (installment compliance, waitlist
+promotion) simply age out.
+The auth id → member id mapping the endpoint needs first is cached too,
+so a warm dashboard costs no HTTP or DB round trips.
+
+Fail-open like ``libs.common.validation_cache``: if Redis is unavailable
+the endpoint just recomputes.
+"""
+
+import json
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from libs.common.logging import get_logger
+from libs.common.redis import get_redis
+from services.academy_service.models import (
+    Cohort,
+    Enrollment,
+    EnrollmentStatus,
+    Program,
+    ProgressStatus,
+    StudentProgress,
+)
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = get_logger(__name__)
+
+COACH_DASHBOARD_TTL_SECONDS = 60
+COACH_MEMBER_ID_TTL_SECONDS = 24 * 60 * 60
+
+
+@dataclass
+class CoachDashboardData:
+    """Everything the dashboard needs from the academy database."""
+
+    cohorts: list[Any]
+    # cohort_id -> (enrolled, pending approval)
+    enrollment_counts: dict[uuid.UUID, tuple[int, int]] = field(default_factory=dict)
+    pending_reviews: int = 0
+
+
+async def load_coach_dashboard(
+    db: AsyncSession, coach_id: uuid.UUID
+) -> CoachDashboardData:
+    """Cohorts, per-cohort enrollment counts and pending reviews for a coach."""
+    cohorts = (
+        await db.execute(
+            select(
+                Cohort.id,
+                Cohort.name,
+                Cohort.status,
+                Cohort.start_date,
+                Cohort.location_name,
+                Program.name.label("program_name"),
+            )
+            .outerjoin(Program, Program.id == Cohort.program_id)
+            .where(Cohort.coach_id == coach_id)
+            .order_by(Cohort.start_date, Cohort.id)
+        )
+    ).all()
+    if not cohorts:
+        return CoachDashboardData(cohorts=[])
+
+    counts = await db.execute(
+        select(
+            Enrollment.cohort_id,
+            func.count(Enrollment.id)
+            .filter(Enrollment.status == EnrollmentStatus.ENROLLED)
+            .label("enrolled"),
+            func.count(Enrollment.id)
+            .filter(Enrollment.status == EnrollmentStatus.PENDING_APPROVAL)
+            .label("pending"),
+        )
+        .join(Cohort, Cohort.id == Enrollment.cohort_id)
+        .where(Cohort.coach_id == coach_id)
+        .group_by(Enrollment.cohort_id)
+    )
+    enrollment_counts = {
+        row.cohort_id: (row.enrolled, row.pending) for row in counts.all()
+    }
+
+    pending_reviews = 0
+    if any(enrolled for enrolled, _ in enrollment_counts.values()):
+        pending_reviews = (
+            await db.execute(
+                select(func.count(StudentProgress.id))
+                .join(Enrollment, Enrollment.id == StudentProgress.enrollment_id)
+                .join(Cohort, Cohort.id == Enrollment.cohort_id)
+                .where(
+                    Cohort.coach_id == coach_id,
+                    Enrollment.status == EnrollmentStatus.ENROLLED,
+                    StudentProgress.status == ProgressStatus.PENDING,
+                    # Claimed and awaiting review. reviewed_at is NULL on a
+                    # fresh claim/resubmission and set once a coach acts, so
+                    # this counts claims (with or without evidence) but
+                    # excludes rejected items.
+                    StudentProgress.reviewed_at.is_(None),
+                )
+            )
+        ).scalar() or 0
+
+    return CoachDashboardData(
+        cohorts=cohorts,
+        enrollment_counts=enrollment_counts,
+        pending_reviews=pending_reviews,
+    )
+
+
+def _key(coach_id) -> str:
+    return f"academy:coach-dashboard:{coach_id}"
+
+
+def _member_id_key(auth_id: str) -> str:
+    return f"academy:coach-member-id:{auth_id}"
+
+
+async def get_cached_coach_member_id(auth_id: str) -> Optional[str]:
+    try:
+        redis = await get_redis()
+        raw = await redis.get(_member_id_key(auth_id))
+    except Exception as e:
+        logger.warning(f"Coach member-id cache read failed for {auth_id}: {e}")
+        return None
+    return raw or None
+
+
+async def cache_coach_member_id(auth_id: str, member_id: str) -> None:
+    try:
+        redis = await get_redis()
+        await redis.set(
+            _member_id_key(auth_id), member_id, ex=COACH_MEMBER_ID_TTL_SECONDS
+        )
+    except Exception as e:
+        logger.warning(f"Coach member-id cache write failed for {auth_id}: {e}")
+
+
+async def get_cached_dashboard(coach_id) -> Optional[dict]:
+    try:
+        redis = await get_redis()
+        raw = await redis.get(_key(coach_id))
+    except Exception as e:
+        logger.warning(f"Coach dashboard cache read failed for {coach_id}: {e}")
+        return None
+    return json.loads(raw) if raw else None
+
+
+async def cache_dashboard(coach_id, payload: dict) -> None:
+    try:
+        redis = await get_redis()
+        await redis.set(
+            _key(coach_id), json.dumps(payload), ex=COACH_DASHBOARD_TTL_SECONDS
+        )
+    except Exception as e:
+        logger.warning(f"Coach dashboard cache write failed for {coach_id}: {e}")
+
+
+async def invalidate_coach_dashboards(*coach_ids) -> None:
+    coach_ids = {cid for cid in coach_ids if cid is not None}
+    if not coach_ids:
+        return
+    try:
+        redis = await get_redis()
+        await redis.delete(*{_key(cid) for cid in coach_ids})
+    except Exception as e:
+        logger.warning(f"Coach dashboard cache invalidation failed: {e}")
+
+
+async def invalidate_dashboards_for_cohorts(
+    db: AsyncSession, *cohort_ids: Optional[uuid.UUID]
+) -> None:
+    """Drop the cached dashboards of whoever coaches ``cohort_ids``."""
+    cohort_ids = {cid for cid in cohort_ids if cid is not None}
+    if not cohort_ids:
+        return
+    result = await db.execute(
+        select(Cohort.coach_id).where(
+            Cohort.id.in_(cohort_ids), Cohort.coach_id.is_not(None)
+        )
+    )
+    await invalidate_coach_dashboards(*result.scalars().all())
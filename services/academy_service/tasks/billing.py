@@ -1,7 +1,20 @@
-"""Billing-related background tasks: installment compliance, reminders, and auto-deduction."""
-
+"""Billing-related background tasks: installment compliance, reminders, and auto-deduction.
+
+The reminder and due-day sweeps are set-based: one query loads the due
+installments together with their enrollments (whose ``reminders_sent`` list
+is the idempotency record), one ``get_members_bulk`` call resolves every
+member, then Paystack links are minted and emails sent concurrently, at
+most ``BILLING_SWEEP_CONCURRENCY`` at a time (``deliver_installment_notices``).
+The DB session is only touched before and after that phase. Each sweep
+returns and logs its counts plus ``elapsed_ms``.
+"""
+
+import asyncio
 import secrets
+import time
+from dataclasses import dataclass
 from datetime import timedelta
+from typing import Iterable, Optional
 
 from libs.common.config import get_settings
 from libs.common.currency import KOBO_PER_NAIRA
@@ -9,7 +22,7 @@ from libs.common.datetime_utils import utc_now
 from libs.common.emails.client import get_email_client
 from libs.common.logging import get_logger
 from libs.common.service_client import (
-    get_member_by_id,
+    get_members_bulk,
     internal_post,
 )
 from libs.db.session import get_async_db
@@ -19,6 +32,7 @@ from services.academy_service.models import (
     EnrollmentInstallment,
     EnrollmentStatus,
     InstallmentStatus,
+    Program,
 )
 from services.academy_service.services.installments import (
     mark_overdue_installments,
@@ -29,6 +43,175 @@ from sqlalchemy.orm import selectinload
 
 logger = get_logger(__name__)
 
+# Paystack initialisations / email sends in flight at once per sweep. Both
+# are internal HTTP calls; this keeps a large due-day batch from opening
+# hundreds of connections to the payments and communications services.
+BILLING_SWEEP_CONCURRENCY = 8
+
+
+@dataclass
+class InstallmentNotice:
+    """One installment email to send: what it's for and who it goes to."""
+
+    installment: EnrollmentInstallment
+    enrollment: Enrollment
+    cohort: Cohort
+    program: Program
+    member: dict
+    reminder_key: str
+    days_until: int
+
+
+async def _members_by_id(member_ids: Iterable) -> dict[str, dict]:
+    """Resolve every member a sweep needs with one ``get_members_bulk`` call."""
+    ids = list({str(member_id) for member_id in member_ids})
+    members = await get_members_bulk(ids, calling_service="academy")
+    return {m["id"]: m for m in members}
+
+
+def _installment_query(*conditions):
+    return (
+        select(EnrollmentInstallment)
+        .where(EnrollmentInstallment.status == InstallmentStatus.PENDING, *conditions)
+        .options(
+            selectinload(EnrollmentInstallment.enrollment)
+            .selectinload(Enrollment.cohort)
+            .selectinload(Cohort.program),
+            selectinload(EnrollmentInstallment.enrollment).selectinload(
+                Enrollment.program
+            ),
+        )
+    )
+
+
+async def _mint_checkout_url(notice: InstallmentNotice) -> Optional[str]:
+    """Initialise a Paystack checkout for the installment; None if refused."""
+    installment, enrollment = notice.installment, notice.enrollment
+    payment_ref = f"PAY-{secrets.token_hex(3).upper()}"
+    init_resp = await internal_post(
+        service_url=get_settings().PAYMENTS_SERVICE_URL,
+        path="/internal/payments/initialize",
+        calling_service="academy",
+        json={
+            "reference": payment_ref,
+            "member_auth_id": enrollment.member_auth_id,
+            "amount": float(installment.amount) / KOBO_PER_NAIRA,
+            "currency": enrollment.currency_snapshot or "NGN",
+            "purpose": "academy_cohort",
+            "callback_url": (
+                f"/account/academy/enrollment-success?enrollment_id={enrollment.id}"
+            ),
+            "metadata": {
+                "payer_email": notice.member["email"],
+                "enrollment_id": str(enrollment.id),
+                "cohort_id": str(notice.cohort.id),
+                "installment_id": str(installment.id),
+                "installment_number": installment.installment_number,
+                "total_installments": enrollment.total_installments,
+            },
+        },
+    )
+    if init_resp.status_code < 400:
+        return init_resp.json().get("authorization_url")
+    logger.error(
+        "Paystack init failed for installment %s (%s): %s",
+        installment.id,
+        init_resp.status_code,
+        init_resp.text,
+    )
+    return None
+
+
+async def deliver_installment_notices(
+    notices: list[InstallmentNotice],
+    email_client,
+    *,
+    concurrency: int = BILLING_SWEEP_CONCURRENCY,
+) -> tuple[list[InstallmentNotice], dict]:
+    """Mint a checkout link and send the payment email for each notice.
+
+    At most ``concurrency`` notices are in flight at once, and one notice
+    failing never stops the others. A link that can't be minted is
+    non-fatal: the email falls back to the dashboard button.
+
+    Returns the notices whose email went out and
+    ``{"sent", "failed", "link_failed"}`` counts. Touches no DB session.
+    """
+    counts = {"sent": 0, "failed": 0, "link_failed": 0}
+    delivered: list[InstallmentNotice] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(notice: InstallmentNotice) -> None:
+        installment, enrollment = notice.installment, notice.enrollment
+        async with semaphore:
+            try:
+                checkout_url = await _mint_checkout_url(notice)
+            except Exception as init_err:
+                logger.error(
+                    "Error minting Paystack link for installment %s: %s",
+                    installment.id,
+                    init_err,
+                )
+                checkout_url = None
+            if checkout_url is None:
+                counts["link_failed"] += 1
+
+            try:
+                success = await email_client.send_template(
+                    template_type="installment_payment_reminder",
+                    to_email=notice.member["email"],
+                    template_data={
+                        "member_name": notice.member.get("first_name") or "Student",
+                        "program_name": notice.program.name,
+                        "cohort_name": notice.cohort.name,
+                        "installment_number": installment.installment_number,
+                        "total_installments": enrollment.total_installments,
+                        "amount": installment.amount,
+                        "currency": enrollment.currency_snapshot or "NGN",
+                        "due_date": installment.due_at.strftime("%A, %B %d, %Y"),
+                        "days_until": notice.days_until,
+                        "checkout_url": checkout_url,
+                        "insufficient_wallet": False,
+                    },
+                )
+            except Exception as send_err:
+                logger.error(
+                    "Failed to send installment email for installment %s: %s",
+                    installment.id,
+                    send_err,
+                )
+                success = False
+
+        if success:
+            counts["sent"] += 1
+            delivered.append(notice)
+            logger.info(
+                f"Sent installment email ({notice.days_until} days before due) to "
+                f"{notice.member['email']} for installment "
+                f"{installment.installment_number} of enrollment {enrollment.id}"
+            )
+        else:
+            counts["failed"] += 1
+            logger.error(
+                f"Failed to send installment email to {notice.member['email']}"
+            )
+
+    await asyncio.gather(*(_one(notice) for notice in notices))
+    return delivered, counts
+
+
+def _record_reminders(notices: Iterable[InstallmentNotice]) -> None:
+    """Append each notice's key to its enrollment's ``reminders_sent``.
+
+    Applied after delivery, one enrollment at a time, so two installments
+    of the same enrollment in one sweep both land.
+    """
+    for notice in notices:
+        enrollment = notice.enrollment
+        enrollment.reminders_sent = (enrollment.reminders_sent or []) + [
+            notice.reminder_key
+        ]
+
 
 async def evaluate_installment_compliance():
     """Mark overdue installments and enforce suspension/dropout rules.
@@ -41,6 +224,8 @@ async def evaluate_installment_compliance():
         - Otherwise → DROPPED automatically.
     - Sends admin notification when an enrollment moves to DROPOUT_PENDING.
     """
+    started = time.perf_counter()
+    result = {"enrollments": 0, "updated": 0, "dropout_pending": 0, "notified": 0}
     async for db in get_async_db():
         try:
             now = utc_now()
@@ -64,8 +249,8 @@ async def evaluate_installment_compliance():
                     selectinload(Enrollment.installments),
                 )
             )
-            result = await db.execute(query)
-            enrollments = result.scalars().all()
+            enrollments = (await db.execute(query)).scalars().all()
+            result["enrollments"] = len(enrollments)
 
             updated = 0
             newly_dropout_pending = []
@@ -118,37 +303,24 @@ async def evaluate_installment_compliance():
                     newly_dropout_pending.append((enrollment, cohort, program))
 
             await db.commit()
+            result["updated"] = updated
+            result["dropout_pending"] = len(newly_dropout_pending)
 
             # Send admin notifications for new dropout-pending cases
-            for enrollment, cohort, program in newly_dropout_pending:
+            if newly_dropout_pending:
                 try:
-                    member = await get_member_by_id(
-                        str(enrollment.member_id), calling_service="academy"
+                    members = await _members_by_id(
+                        e.member_id for e, _, _ in newly_dropout_pending
                     )
-                    email_client = get_email_client()
-                    await email_client.send_template(
-                        template_type="admin_dropout_pending",
-                        to_email="admin@swimbuddz.com",  # Replace with config-driven admin email
-                        template_data={
-                            "member_name": (
-                                f"{member['first_name']} {member['last_name']}"
-                                if member
-                                else "Unknown member"
-                            ),
-                            "member_id": str(enrollment.member_id),
-                            "enrollment_id": str(enrollment.id),
-                            "program_name": program.name,
-                            "cohort_name": cohort.name,
-                            "missed_count": enrollment.missed_installments_count,
-                        },
-                    )
-                    logger.info(
-                        f"Sent dropout-pending admin notification for enrollment {enrollment.id}"
-                    )
-                except Exception as notify_err:
+                except Exception as lookup_err:
                     logger.error(
-                        f"Failed to send dropout-pending notification for enrollment {enrollment.id}: {notify_err}"
+                        "Member lookup for dropout-pending notifications failed: %s",
+                        lookup_err,
                     )
+                    members = {}
+                result["notified"] = await _notify_dropout_pending(
+                    newly_dropout_pending, members
+                )
 
             if updated:
                 logger.info(
@@ -158,42 +330,83 @@ async def evaluate_installment_compliance():
         except Exception as e:
             logger.error(f"Error evaluating installment compliance: {e}")
             await db.rollback()
+            result["error"] = str(e)
         finally:
             await db.close()
             break
 
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    logger.info("evaluate_installment_compliance: %s", result)
+    return result
+
+
+async def _notify_dropout_pending(cases: list, members: dict[str, dict]) -> int:
+    """Email the admin about each new DROPOUT_PENDING enrollment; returns sent."""
+    email_client = get_email_client()
+    semaphore = asyncio.Semaphore(BILLING_SWEEP_CONCURRENCY)
+
+    async def _one(enrollment, cohort, program) -> bool:
+        member = members.get(str(enrollment.member_id))
+        try:
+            async with semaphore:
+                await email_client.send_template(
+                    template_type="admin_dropout_pending",
+                    to_email="admin@swimbuddz.com",  # Replace with config-driven admin email
+                    template_data={
+                        "member_name": (
+                            f"{member['first_name']} {member['last_name']}"
+                            if member
+                            else "Unknown member"
+                        ),
+                        "member_id": str(enrollment.member_id),
+                        "enrollment_id": str(enrollment.id),
+                        "program_name": program.name,
+                        "cohort_name": cohort.name,
+                        "missed_count": enrollment.missed_installments_count,
+                    },
+                )
+            logger.info(
+                "Sent dropout-pending admin notification for enrollment %s",
+                enrollment.id,
+            )
+            return True
+        except Exception as notify_err:
+            logger.error(
+                "Failed to send dropout-pending notification for enrollment %s: %s",
+                enrollment.id,
+                notify_err,
+            )
+            return False
+
+    sent = await asyncio.gather(*(_one(*case) for case in cases))
+    return sum(sent)
+
 
-async def send_installment_payment_reminders():
+async def send_installment_payment_reminders(
+    *, concurrency: int = BILLING_SWEEP_CONCURRENCY
+):
     """Send payment reminders for upcoming installment due dates.
 
     Reminders are sent at 7, 3, and 1 day(s) before the due date.
     Students can pay early as soon as the first reminder arrives.
-    Reminder keys stored on the installment to prevent duplicate sends.
+    Reminder keys stored on the enrollment to prevent duplicate sends;
+    a key is only recorded once its email went out.
     """
+    started = time.perf_counter()
+    result = {"candidates": 0, "due": 0, "sent": 0, "failed": 0, "link_failed": 0}
     async for db in get_async_db():
         try:
             now = utc_now()
 
             # Find PENDING installments due within the next 8 days
-            query = (
-                select(EnrollmentInstallment)
-                .where(
-                    EnrollmentInstallment.status == InstallmentStatus.PENDING,
-                    EnrollmentInstallment.due_at > now,
-                    EnrollmentInstallment.due_at <= now + timedelta(days=8),
-                )
-                .options(
-                    selectinload(EnrollmentInstallment.enrollment)
-                    .selectinload(Enrollment.cohort)
-                    .selectinload(Cohort.program),
-                    selectinload(EnrollmentInstallment.enrollment).selectinload(
-                        Enrollment.program
-                    ),
-                )
+            query = _installment_query(
+                EnrollmentInstallment.due_at > now,
+                EnrollmentInstallment.due_at <= now + timedelta(days=8),
             )
-            result = await db.execute(query)
-            installments = result.scalars().all()
+            installments = (await db.execute(query)).scalars().all()
+            result["candidates"] = len(installments)
 
+            due = []
             for installment in installments:
                 enrollment = installment.enrollment
                 if not enrollment:
@@ -218,117 +431,63 @@ async def send_installment_payment_reminders():
                 reminder_key = (
                     f"installment_{installment.installment_number}_{days_until}d"
                 )
-                reminders_sent = enrollment.reminders_sent or []
-                if reminder_key in reminders_sent:
-                    continue
-
-                member = await get_member_by_id(
-                    str(enrollment.member_id), calling_service="academy"
-                )
-                if not member:
+                if reminder_key in (enrollment.reminders_sent or []):
                     continue
+                due.append((installment, enrollment, cohort, program, reminder_key))
 
-                # Mint a Paystack checkout link for this installment so the
-                # reminder email carries a one-click "Pay Now" button. Mirrors
-                # attempt_wallet_auto_deduction's due-day flow. Cohort fees are
-                # real-money only (founder policy May 2026) — no Bubbles path.
-                #
-                # Idempotency note: the 7/3/1-day reminders each mint their own
-                # link. In the common case the member pays after the first one,
-                # the installment flips to PAID, and the later reminders are
-                # skipped (this query only selects PENDING installments). A
-                # procrastinator who ignores earlier reminders may accrue a few
-                # abandoned PENDING intents — harmless; Paystack drops unpaid
-                # transactions and any one valid link still applies the same
-                # installment when paid.
-                settings = get_settings()
-                checkout_url = None
-                try:
-                    payment_ref = f"PAY-{secrets.token_hex(3).upper()}"
-                    init_resp = await internal_post(
-                        service_url=settings.PAYMENTS_SERVICE_URL,
-                        path="/internal/payments/initialize",
-                        calling_service="academy",
-                        json={
-                            "reference": payment_ref,
-                            "member_auth_id": enrollment.member_auth_id,
-                            "amount": float(installment.amount) / KOBO_PER_NAIRA,
-                            "currency": enrollment.currency_snapshot or "NGN",
-                            "purpose": "academy_cohort",
-                            "callback_url": (
-                                f"/account/academy/enrollment-success"
-                                f"?enrollment_id={enrollment.id}"
-                            ),
-                            "metadata": {
-                                "payer_email": member["email"],
-                                "enrollment_id": str(enrollment.id),
-                                "cohort_id": str(cohort.id),
-                                "installment_id": str(installment.id),
-                                "installment_number": installment.installment_number,
-                                "total_installments": enrollment.total_installments,
-                            },
-                        },
-                    )
-                    if init_resp.status_code < 400:
-                        checkout_url = init_resp.json().get("authorization_url")
-                    else:
-                        logger.error(
-                            "Reminder: Paystack init failed for installment %s (%s): %s",
-                            installment.id,
-                            init_resp.status_code,
-                            init_resp.text,
-                        )
-                except Exception as init_err:
-                    # Non-fatal — still send the reminder; the email falls back
-                    # to the dashboard button when checkout_url is None.
-                    logger.error(
-                        "Reminder: error minting Paystack link for installment %s: %s",
-                        installment.id,
-                        init_err,
-                    )
-
-                email_client = get_email_client()
-                success = await email_client.send_template(
-                    template_type="installment_payment_reminder",
-                    to_email=member["email"],
-                    template_data={
-                        "member_name": member["first_name"],
-                        "program_name": program.name,
-                        "cohort_name": cohort.name,
-                        "installment_number": installment.installment_number,
-                        "total_installments": enrollment.total_installments,
-                        "amount": installment.amount,
-                        "currency": enrollment.currency_snapshot or "NGN",
-                        "due_date": installment.due_at.strftime("%A, %B %d, %Y"),
-                        "days_until": days_until,
-                        "has_sufficient_balance": False,
-                        "checkout_url": checkout_url,
-                    },
+            members = await _members_by_id(d[1].member_id for d in due)
+            notices = [
+                InstallmentNotice(
+                    installment=installment,
+                    enrollment=enrollment,
+                    cohort=cohort,
+                    program=program,
+                    member=members[str(enrollment.member_id)],
+                    reminder_key=reminder_key,
+                    days_until=(installment.due_at.date() - now.date()).days,
                 )
+                for installment, enrollment, cohort, program, reminder_key in due
+                if str(enrollment.member_id) in members
+            ]
+            result["due"] = len(notices)
+
+            # Mint a Paystack checkout link for each installment so the
+            # reminder email carries a one-click "Pay Now" button. Mirrors
+            # attempt_wallet_auto_deduction's due-day flow. Cohort fees are
+            # real-money only (founder policy May 2026) — no Bubbles path.
+            #
+            # Idempotency note: the 7/3/1-day reminders each mint their own
+            # link. In the common case the member pays after the first one,
+            # the installment flips to PAID, and the later reminders are
+            # skipped (this query only selects PENDING installments). A
+            # procrastinator who ignores earlier reminders may accrue a few
+            # abandoned PENDING intents — harmless; Paystack drops unpaid
+            # transactions and any one valid link still applies the same
+            # installment when paid.
+            delivered, counts = await deliver_installment_notices(
+                notices, get_email_client(), concurrency=concurrency
+            )
+            result.update(counts)
 
-                if success:
-                    new_reminders = reminders_sent + [reminder_key]
-                    enrollment.reminders_sent = new_reminders
-                    logger.info(
-                        f"Sent {days_until}-day installment reminder to {member['email']} "
-                        f"for installment {installment.installment_number} of enrollment {enrollment.id}"
-                    )
-                else:
-                    logger.error(
-                        f"Failed to send installment reminder to {member['email']}"
-                    )
-
+            _record_reminders(delivered)
             await db.commit()
 
         except Exception as e:
             logger.error(f"Error sending installment payment reminders: {e}")
             await db.rollback()
+            result["error"] = str(e)
         finally:
             await db.close()
             break
 
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    logger.info("send_installment_payment_reminders: %s", result)
+    return result
+
 
-async def attempt_wallet_auto_deduction():
+async def attempt_wallet_auto_deduction(
+    *, concurrency: int = BILLING_SWEEP_CONCURRENCY
+):
     """Send a Paystack checkout link for installments due today.
 
     Per founder policy (May 2026), academy cohort fees must be paid in real
@@ -340,8 +499,8 @@ async def attempt_wallet_auto_deduction():
     Function name retained for cron compatibility — see the
     "installment_payment_reminder" email template used below.
     """
-    settings_obj = get_settings()
-
+    started = time.perf_counter()
+    result = {"candidates": 0, "due": 0, "sent": 0, "failed": 0, "link_failed": 0}
     async for db in get_async_db():
         try:
             now = utc_now()
@@ -351,25 +510,14 @@ async def attempt_wallet_auto_deduction():
             window_start = now - timedelta(hours=1)
             window_end = now  # Only process past-due-or-just-due, not future
 
-            query = (
-                select(EnrollmentInstallment)
-                .where(
-                    EnrollmentInstallment.status == InstallmentStatus.PENDING,
-                    EnrollmentInstallment.due_at >= window_start,
-                    EnrollmentInstallment.due_at <= window_end,
-                )
-                .options(
-                    selectinload(EnrollmentInstallment.enrollment)
-                    .selectinload(Enrollment.cohort)
-                    .selectinload(Cohort.program),
-                    selectinload(EnrollmentInstallment.enrollment).selectinload(
-                        Enrollment.program
-                    ),
-                )
+            query = _installment_query(
+                EnrollmentInstallment.due_at >= window_start,
+                EnrollmentInstallment.due_at <= window_end,
             )
-            result = await db.execute(query)
-            due_installments = result.scalars().all()
+            due_installments = (await db.execute(query)).scalars().all()
+            result["candidates"] = len(due_installments)
 
+            due = []
             for installment in due_installments:
                 enrollment = installment.enrollment
                 if not enrollment:
@@ -392,98 +540,48 @@ async def attempt_wallet_auto_deduction():
                 # same installment within the same window. Key name kept stable
                 # for backwards compatibility with already-emitted records.
                 reminder_key = f"wallet_deduction_{installment.installment_number}"
-                reminders_sent = enrollment.reminders_sent or []
-                if reminder_key in reminders_sent:
+                if reminder_key in (enrollment.reminders_sent or []):
                     continue
+                due.append((installment, enrollment, cohort, program, reminder_key))
 
-                member_auth_id = enrollment.member_auth_id
-                program_name = program.name if program else "Academy Program"
-                cohort_name = cohort.name
-
-                member = await get_member_by_id(
-                    str(enrollment.member_id), calling_service="academy"
-                )
-                member_email = member.get("email") if member else None
-                member_name = (
-                    member.get("first_name", "Student") if member else "Student"
+            members = await _members_by_id(d[1].member_id for d in due)
+            notices = [
+                InstallmentNotice(
+                    installment=installment,
+                    enrollment=enrollment,
+                    cohort=cohort,
+                    program=program,
+                    member=members.get(str(enrollment.member_id)) or {},
+                    reminder_key=reminder_key,
+                    days_until=0,  # Due today — urgent prompt
                 )
+                for installment, enrollment, cohort, program, reminder_key in due
+            ]
+            result["due"] = len(notices)
+
+            # Per founder policy (May 2026): generate a Paystack checkout
+            # link and email it to the student. Wallet deduction is no
+            # longer attempted — cohort fees are real-money only.
+            _, counts = await deliver_installment_notices(
+                [n for n in notices if n.member.get("email")],
+                get_email_client(),
+                concurrency=concurrency,
+            )
+            result.update(counts)
 
-                # Per founder policy (May 2026): generate a Paystack checkout
-                # link and email it to the student. Wallet deduction is no
-                # longer attempted — cohort fees are real-money only.
-                if member_email:
-                    try:
-                        payment_ref = f"PAY-{secrets.token_hex(3).upper()}"
-                        init_resp = await internal_post(
-                            service_url=settings_obj.PAYMENTS_SERVICE_URL,
-                            path="/internal/payments/initialize",
-                            calling_service="academy",
-                            json={
-                                "reference": payment_ref,
-                                "member_auth_id": member_auth_id,
-                                "amount": float(installment.amount) / KOBO_PER_NAIRA,
-                                "currency": enrollment.currency_snapshot or "NGN",
-                                "purpose": "academy_cohort",
-                                "callback_url": (
-                                    f"/account/academy/enrollment-success"
-                                    f"?enrollment_id={enrollment.id}"
-                                ),
-                                "metadata": {
-                                    "payer_email": member_email,
-                                    "enrollment_id": str(enrollment.id),
-                                    "cohort_id": str(cohort.id),
-                                    "installment_id": str(installment.id),
-                                    "installment_number": installment.installment_number,
-                                    "total_installments": enrollment.total_installments,
-                                },
-                            },
-                        )
-
-                        checkout_url = None
-                        if init_resp.status_code < 400:
-                            init_data = init_resp.json()
-                            checkout_url = init_data.get("authorization_url")
-
-                        email_client = get_email_client()
-                        await email_client.send_template(
-                            template_type="installment_payment_reminder",
-                            to_email=member_email,
-                            template_data={
-                                "member_name": member_name,
-                                "program_name": program_name,
-                                "cohort_name": cohort_name,
-                                "installment_number": installment.installment_number,
-                                "total_installments": enrollment.total_installments,
-                                "amount": installment.amount,
-                                "currency": enrollment.currency_snapshot or "NGN",
-                                "due_date": installment.due_at.strftime(
-                                    "%A, %B %d, %Y"
-                                ),
-                                "days_until": 0,  # Due today — urgent prompt
-                                "checkout_url": checkout_url,
-                                "insufficient_wallet": False,
-                            },
-                        )
-                        logger.info(
-                            "Sent Paystack payment link to %s for installment %s",
-                            member_email,
-                            installment.id,
-                        )
-                    except Exception as paystack_err:
-                        logger.error(
-                            "Failed to generate Paystack link for installment %s: %s",
-                            installment.id,
-                            paystack_err,
-                        )
-
-                # Record that the reminder was sent (prevents re-processing)
-                enrollment.reminders_sent = reminders_sent + [reminder_key]
-
+            # Record that the reminder was sent (prevents re-processing),
+            # whether or not the link/email went through.
+            _record_reminders(notices)
             await db.commit()
 
         except Exception as e:
             logger.error("Error in wallet auto-deduction task: %s", e)
             await db.rollback()
+            result["error"] = str(e)
         finally:
             await db.close()
             break
+
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    logger.info("attempt_wallet_auto_deduction: %s", result)
+    return result
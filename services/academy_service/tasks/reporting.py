@@ -1,7 +1,17 @@
 """Reporting-related background tasks: progress reports, certificates, and attendance."""
 
+import asyncio
+import multiprocessing
+import os
 import secrets
-from datetime import timedelta
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any
 
 from libs.common.config import get_settings
 from libs.common.datetime_utils import utc_now
@@ -34,15 +44,133 @@ logger = get_logger(__name__)
 # idempotent, so re-attempting is harmless.
 REWARD_RETRY_DAYS = 3
 
+# Weekly progress-report PDFs render in a process pool (CPU-bound ReportLab
+# work kept off the worker's event loop); leave a core for the loop itself.
+PDF_RENDER_PROCESSES = max(1, min(4, (os.cpu_count() or 2) - 1))
+PROGRESS_EMAIL_CONCURRENCY = 10
+
+
+@dataclass
+class ProgressReport:
+    """Everything needed to render and send one student's weekly report."""
+
+    to_email: str
+    template_data: dict[str, Any]
+    pdf_kwargs: dict[str, Any]
+
+
+def _progress_summary(
+    progress: list[StudentProgress],
+    milestone_map: dict[uuid.UUID, str],
+    since: datetime,
+) -> dict[str, Any]:
+    """Completed count, recent achievements, coach feedback and PDF rows."""
+    completed = [p for p in progress if p.status.value == "achieved"]
+    return {
+        "completed_count": len(completed),
+        # Recent achievements (since ``since``)
+        "recent": [
+            {
+                "name": milestone_map.get(p.milestone_id, "Unknown"),
+                "achieved_at": p.achieved_at,
+            }
+            for p in completed
+            if p.achieved_at and p.achieved_at >= since
+        ],
+        # Coach feedback from recent reviews
+        "feedback": [
+            {
+                "milestone": milestone_map.get(p.milestone_id, "Unknown"),
+                "notes": p.coach_notes,
+            }
+            for p in progress
+            if p.coach_notes and p.reviewed_at and p.reviewed_at >= since
+        ],
+        "milestones": [
+            {
+                "name": milestone_map.get(p.milestone_id, "Unknown"),
+                "status": p.status.value if p.status else "pending",
+                "achieved_at": p.achieved_at,
+                "coach_notes": p.coach_notes,
+            }
+            for p in progress
+        ],
+    }
+
+
+async def deliver_progress_reports(
+    reports: list[ProgressReport],
+    email_client,
+    *,
+    processes: int = PDF_RENDER_PROCESSES,
+    email_concurrency: int = PROGRESS_EMAIL_CONCURRENCY,
+) -> dict[str, int]:
+    """Render each report's PDF in a process pool and send the emails.
+
+    ReportLab rendering is CPU-bound, so it runs in ``processes`` worker
+    processes (spawned, so nothing inherits the event loop or DB pool)
+    instead of on the event loop. At most twice that many renders are
+    queued at once, and at most ``email_concurrency`` sends are in flight.
+    A failed render or send only affects that student.
+    """
+    from libs.common.pdf import generate_progress_report_pdf
+
+    loop = asyncio.get_running_loop()
+    render_slots = asyncio.Semaphore(processes * 2)
+    send_slots = asyncio.Semaphore(email_concurrency)
+    counts = {"sent": 0, "failed": 0, "pdf_failed": 0}
+
+    async def _one(pool: ProcessPoolExecutor, report: ProgressReport) -> None:
+        async with render_slots:
+            try:
+                await loop.run_in_executor(
+                    pool, partial(generate_progress_report_pdf, **report.pdf_kwargs)
+                )
+            except Exception as pdf_err:
+                counts["pdf_failed"] += 1
+                logger.error(f"Failed to generate PDF for {report.to_email}: {pdf_err}")
+
+        async with send_slots:
+            try:
+                # Note: PDF attachment not yet supported via the template API
+                sent = await email_client.send_template(
+                    template_type="progress_report",
+                    to_email=report.to_email,
+                    template_data=report.template_data,
+                )
+            except Exception as email_err:
+                sent = False
+                logger.error(
+                    f"Failed to send progress report to {report.to_email}: "
+                    f"{email_err}"
+                )
+        if sent:
+            counts["sent"] += 1
+            logger.info(f"Sent progress report to {report.to_email}")
+        else:
+            counts["failed"] += 1
+
+    if not reports:
+        return counts
+    with ProcessPoolExecutor(
+        max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        await asyncio.gather(*(_one(pool, report) for report in reports))
+    return counts
+
 
 async def send_weekly_progress_reports():
     """
     Send weekly progress report emails to all enrolled students in active cohorts.
     Includes PDF attachment with full progress details.
     Runs once per week (controlled by caller).
-    """
-    from libs.common.pdf import generate_progress_report_pdf
 
+    Milestones are loaded once for all programs and progress once per
+    cohort; PDFs render in a process pool and emails go out concurrently
+    (see ``deliver_progress_reports``).
+    """
+    started = time.perf_counter()
+    reports: list[ProgressReport] = []
     async for db in get_async_db():
         try:
             now = utc_now()
@@ -55,12 +183,20 @@ async def send_weekly_progress_reports():
                 .where(Cohort.status == CohortStatus.ACTIVE)
             )
             result = await db.execute(query)
-            cohorts = result.scalars().all()
+            cohorts = [c for c in result.scalars().all() if c.program]
+
+            # Milestones for every program involved, in one query
+            program_ids = {c.program.id for c in cohorts}
+            milestones_by_program: dict[uuid.UUID, list[Milestone]] = defaultdict(list)
+            if program_ids:
+                milestone_result = await db.execute(
+                    select(Milestone).where(Milestone.program_id.in_(program_ids))
+                )
+                for milestone in milestone_result.scalars().all():
+                    milestones_by_program[milestone.program_id].append(milestone)
 
             for cohort in cohorts:
                 program = cohort.program
-                if not program:
-                    continue
 
                 # Get all enrollments for this cohort
                 enrollment_query = select(Enrollment).where(
@@ -69,6 +205,8 @@ async def send_weekly_progress_reports():
                 )
                 result = await db.execute(enrollment_query)
                 enrollment_list = result.scalars().all()
+                if not enrollment_list:
+                    continue
 
                 # Bulk-lookup member details
                 pr_member_ids = list({str(e.member_id) for e in enrollment_list})
@@ -77,105 +215,60 @@ async def send_weekly_progress_reports():
                 )
                 pr_members_map = {m["id"]: m for m in pr_members}
 
-                # Get total milestones for program
-                milestone_query = select(Milestone).where(
-                    Milestone.program_id == program.id
-                )
-                milestone_result = await db.execute(milestone_query)
-                all_milestones = milestone_result.scalars().all()
+                all_milestones = milestones_by_program[program.id]
                 total_milestones = len(all_milestones)
                 milestone_map = {m.id: m.name for m in all_milestones}
 
+                # Progress for every enrollment in the cohort, in one query
+                progress_result = await db.execute(
+                    select(StudentProgress).where(
+                        StudentProgress.enrollment_id.in_(
+                            [e.id for e in enrollment_list]
+                        )
+                    )
+                )
+                progress_by_enrollment: dict[uuid.UUID, list[StudentProgress]] = (
+                    defaultdict(list)
+                )
+                for p in progress_result.scalars().all():
+                    progress_by_enrollment[p.enrollment_id].append(p)
+
                 for enrollment in enrollment_list:
                     member = pr_members_map.get(str(enrollment.member_id), {})
                     if not member:
                         continue
-                    # Get all progress for this enrollment
-                    progress_query = select(StudentProgress).where(
-                        StudentProgress.enrollment_id == enrollment.id
+                    summary = _progress_summary(
+                        progress_by_enrollment[enrollment.id],
+                        milestone_map,
+                        seven_days_ago,
                     )
-                    progress_result = await db.execute(progress_query)
-                    all_progress = progress_result.scalars().all()
-
-                    # Count completed milestones
-                    completed = [
-                        p for p in all_progress if p.status.value == "achieved"
-                    ]
-                    completed_count = len(completed)
-
-                    # Recent achievements (last 7 days)
-                    recent = [
-                        {
-                            "name": milestone_map.get(p.milestone_id, "Unknown"),
-                            "achieved_at": p.achieved_at,
-                        }
-                        for p in completed
-                        if p.achieved_at and p.achieved_at >= seven_days_ago
-                    ]
-
-                    # Coach feedback from recent reviews
-                    feedback = [
-                        {
-                            "milestone": milestone_map.get(p.milestone_id, "Unknown"),
-                            "notes": p.coach_notes,
-                        }
-                        for p in all_progress
-                        if p.coach_notes
-                        and p.reviewed_at
-                        and p.reviewed_at >= seven_days_ago
-                    ]
-
-                    # Build milestone data for PDF
-                    milestone_data = [
-                        {
-                            "name": milestone_map.get(p.milestone_id, "Unknown"),
-                            "status": p.status.value if p.status else "pending",
-                            "achieved_at": p.achieved_at,
-                            "coach_notes": p.coach_notes,
-                        }
-                        for p in all_progress
-                    ]
-
-                    # Generate PDF
-                    try:
-                        generate_progress_report_pdf(
-                            student_name=f"{member['first_name']} {member['last_name']}",
-                            program_name=program.name,
-                            cohort_name=cohort.name,
-                            start_date=cohort.start_date,
-                            end_date=cohort.end_date,
-                            milestones=milestone_data,
-                            total_milestones=total_milestones,
-                            completed_milestones=completed_count,
-                            report_date=now,
-                        )
-                    except Exception as pdf_err:
-                        logger.error(
-                            f"Failed to generate PDF for {member['email']}: {pdf_err}"
-                        )
-
-                    # Send email via centralized email service
-                    try:
-                        email_client = get_email_client()
-                        await email_client.send_template(
-                            template_type="progress_report",
+                    reports.append(
+                        ProgressReport(
                             to_email=member["email"],
                             template_data={
                                 "member_name": member["first_name"],
                                 "program_name": program.name,
                                 "cohort_name": cohort.name,
-                                "milestones_completed": completed_count,
+                                "milestones_completed": summary["completed_count"],
                                 "total_milestones": total_milestones,
-                                "recent_achievements": recent,
-                                "coach_feedback": feedback,
-                                # Note: PDF attachment not yet supported via API
+                                "recent_achievements": summary["recent"],
+                                "coach_feedback": summary["feedback"],
+                            },
+                            pdf_kwargs={
+                                "student_name": (
+                                    f"{member['first_name']} {member['last_name']}"
+                                ),
+                                "program_name": program.name,
+                                "cohort_name": cohort.name,
+                                "start_date": cohort.start_date,
+                                "end_date": cohort.end_date,
+                                "milestones": summary["milestones"],
+                                "total_milestones": total_milestones,
+                                "completed_milestones": summary["completed_count"],
+                                "report_date": now,
                             },
                         )
-                        logger.info(f"Sent progress report to {member['email']}")
-                    except Exception as email_err:
-                        logger.error(
-                            f"Failed to send progress report to {member['email']}: {email_err}"
-                        )
+                    )
 
         except Exception as e:
             logger.error(f"Error sending weekly progress reports: {e}")
@@ -183,6 +276,17 @@ async def send_weekly_progress_reports():
             await db.close()
             break
 
+    # The DB session is closed before rendering/sending starts, so no
+    # connection is held for the (long) delivery phase. Reports built
+    # before an error above still go out, as they did when sent inline.
+    counts = await deliver_progress_reports(reports, get_email_client())
+    elapsed_ms = int((time.perf_counter() - started) * 1000)
+    logger.info(
+        f"Weekly progress reports: {counts['sent']} sent, {counts['failed']} "
+        f"failed, {counts['pdf_failed']} PDF failures in {elapsed_ms} ms"
+    )
+    return {**counts, "elapsed_ms": elapsed_ms}
+
 
 async def check_and_issue_certificates():
     """
@@ -4,6 +4,7 @@ from services.attendance_service.models.core import (
     AttendanceRecord,
     AttendanceRole,
     AttendanceStatus,
+    AttendanceWeeklyRollup,
     MemberRef,
 )
 
@@ -11,5 +12,6 @@ __all__ = [
     "AttendanceRecord",
     "AttendanceRole",
     "AttendanceStatus",
+    "AttendanceWeeklyRollup",
     "MemberRef",
 ]
@@ -1,5 +1,5 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
 from libs.common.datetime_utils import utc_now
@@ -9,10 +9,10 @@ from services.attendance_service.models.enums import (
     AttendanceStatus,
     enum_values,
 )
-from sqlalchemy import DateTime
+from sqlalchemy import Date, DateTime
 from sqlalchemy import Enum as SAEnum
-from sqlalchemy import CheckConstraint, String, UniqueConstraint
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import CheckConstraint, Integer, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -95,6 +95,11 @@ class AttendanceRecord(Base):
         UUID(as_uuid=True), nullable=True, index=True
     )
 
+    # Scheduled session length, captured from the session payload at write
+    # time so stats don't need a sessions_service call. NULL for rows written
+    # before the column existed (see scripts/attendance/backfill_rollups.py).
+    session_minutes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=utc_now
     )
@@ -127,3 +132,40 @@ class AttendanceRecord(Base):
 
     def __repr__(self):
         return f"<AttendanceRecord Session={self.session_id} Member={self.member_id}>"
+
+
+class AttendanceWeeklyRollup(Base):
+    """Per member per ISO week (UTC Monday of created_at) attendance totals.
+
+    Derived from attendance_records — refreshed by every attendance write and
+    rebuilt by the backfill script. See services/attendance_service/rollups.py.
+    """
+
+    __tablename__ = "attendance_weekly_rollups"
+
+    member_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    week_start: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    present: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    late: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    absent: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    excused: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # All rows, including cancelled.
+    total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Present/late only. timed_sessions counts the attended rows that carry
+    # session_minutes, so pool-hour maths can apply a per-session allowance.
+    attended_minutes: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    timed_sessions: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Attended count per weekday, Monday first.
+    attended_by_weekday: Mapped[list[int]] = mapped_column(
+        ARRAY(Integer), nullable=False
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now, onupdate=utc_now
+    )
+
+    def __repr__(self):
+        return (
+            f"<AttendanceWeeklyRollup Member={self.member_id} Week={self.week_start}>"
+        )
@@ -0,0 +1,431 @@
+"""Per-member weekly attendance rollups.
+
+``attendance_weekly_rollups`` keeps one row per (member, ISO week — UTC
+Monday of ``created_at``) with status counts, attended weekdays and attended
+pool minutes. Write paths call ``refresh_attendance_rollups`` with the keys
+they touched; like the ledger's account balances, the touched rows are
+re-derived from ``attendance_records`` rather than incremented, so status
+flips and deletes can't drift the totals. Concurrent refreshes of the same
+row are serialised with a transaction-level advisory lock, so the last one
+to commit always sees the other's records.
+
+Pool minutes come from ``AttendanceRecord.session_minutes``, captured from
+the session payload the write path already fetched — so member stats don't
+need a sessions_service round-trip. Records written before that column
+existed have no minutes until scripts/attendance/backfill_rollups.py fills
+them; until then their sessions are looked up in sessions_service.
+
+``member_attendance_stats`` serves ``/internal/attendance/stats/member``:
+whole weeks inside the range come from the rollups, the (at most two)
+partial edge weeks from the raw records, so results match a full scan.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import Date, and_, cast, delete, extract, func, or_, select, text
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from libs.common.datetime_utils import utc_now
+from libs.common.logging import get_logger
+from libs.common.service_client import get_sessions_bulk
+from services.attendance_service.models import (
+    AttendanceRecord,
+    AttendanceStatus,
+    AttendanceWeeklyRollup,
+)
+
+WEEKDAYS = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+ATTENDED = (AttendanceStatus.PRESENT, AttendanceStatus.LATE)
+# Warm-up / rest allowance subtracted per attended session from pool hours.
+_WARMUP_HOURS_PER_SESSION = 1.0
+
+# Session ids per sessions_service bulk lookup.
+SESSION_LOOKUP_CHUNK = 500
+
+RollupKey = tuple[uuid.UUID, date]
+
+logger = get_logger(__name__)
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _midnight(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def week_start(value: datetime) -> date:
+    """UTC Monday of the ISO week ``value`` falls in."""
+    day = _utc(value).date()
+    return day - timedelta(days=day.weekday())
+
+
+def session_minutes(session_data: Optional[dict]) -> Optional[int]:
+    """Scheduled length of a sessions_service session payload, in minutes."""
+    if not session_data:
+        return None
+    try:
+        starts, ends = (
+            datetime.fromisoformat(session_data[key].replace("Z", "+00:00"))
+            for key in ("starts_at", "ends_at")
+        )
+    except (KeyError, AttributeError, ValueError):
+        return None
+    minutes = int((ends - starts).total_seconds() // 60)
+    return minutes if minutes > 0 else None
+
+
+def rollup_keys(records: Iterable[AttendanceRecord]) -> set[RollupKey]:
+    """Rollup rows affected by ``records`` (guest rows have no member)."""
+    return {
+        (r.member_id, week_start(r.created_at))
+        for r in records
+        if r.member_id is not None and r.created_at is not None
+    }
+
+
+def _lock_id(key: RollupKey) -> int:
+    """Advisory lock id (signed 64-bit) for one rollup row."""
+    member_id, week = key
+    digest = hashlib.blake2b(
+        f"attendance-rollup:{member_id}:{week}".encode(), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _week_expr():
+    return cast(
+        func.date_trunc("week", func.timezone("UTC", AttendanceRecord.created_at)),
+        Date,
+    )
+
+
+def _rollup_columns():
+    attended = AttendanceRecord.status.in_(ATTENDED)
+    weekday = extract("isodow", func.timezone("UTC", AttendanceRecord.created_at))
+    return [
+        func.count()
+        .filter(AttendanceRecord.status == AttendanceStatus.PRESENT)
+        .label("present"),
+        func.count()
+        .filter(AttendanceRecord.status == AttendanceStatus.LATE)
+        .label("late"),
+        func.count()
+        .filter(AttendanceRecord.status == AttendanceStatus.ABSENT)
+        .label("absent"),
+        func.count()
+        .filter(AttendanceRecord.status == AttendanceStatus.EXCUSED)
+        .label("excused"),
+        func.count().label("total"),
+        func.coalesce(
+            func.sum(AttendanceRecord.session_minutes).filter(attended), 0
+        ).label("attended_minutes"),
+        func.count(AttendanceRecord.session_minutes)
+        .filter(attended)
+        .label("timed_sessions"),
+        array(
+            [
+                func.count().filter(and_(attended, weekday == isodow))
+                for isodow in range(1, 8)
+            ]
+        ).label("attended_by_weekday"),
+    ]
+
+
+async def refresh_attendance_rollups(
+    db: AsyncSession, keys: Iterable[RollupKey]
+) -> None:
+    """Re-derive the given (member, week) rollup rows. Does not commit.
+
+    Takes a transaction-level advisory lock per row first, then one grouped
+    aggregate over the touched members' records, one upsert and at most one
+    delete (for weeks that no longer have any records). Without the lock,
+    two writers to the same week could each aggregate before the other
+    committed and the later upsert would keep stale totals.
+    """
+    wanted = set(keys)
+    if not wanted:
+        return
+    # Sorted, so two refreshes of overlapping keys can't deadlock; unnest
+    # yields the array in order.
+    await db.execute(
+        text("SELECT pg_advisory_xact_lock(k) FROM unnest(CAST(:ids AS bigint[])) k"),
+        {"ids": sorted({_lock_id(key) for key in wanted})},
+    )
+    members = {member_id for member_id, _ in wanted}
+    first = min(week for _, week in wanted)
+    last = max(week for _, week in wanted) + timedelta(days=7)
+    week = _week_expr()
+    rows = (
+        await db.execute(
+            select(
+                AttendanceRecord.member_id,
+                week.label("week_start"),
+                *_rollup_columns(),
+            )
+            .where(
+                AttendanceRecord.member_id.in_(members),
+                AttendanceRecord.created_at >= _midnight(first),
+                AttendanceRecord.created_at < _midnight(last),
+            )
+            .group_by(AttendanceRecord.member_id, week)
+        )
+    ).mappings()
+    values = [
+        {**row, "updated_at": utc_now()}
+        for row in rows
+        if (row["member_id"], row["week_start"]) in wanted
+    ]
+    if values:
+        stmt = pg_insert(AttendanceWeeklyRollup).values(values)
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["member_id", "week_start"],
+                set_={
+                    name: stmt.excluded[name]
+                    for name in values[0]
+                    if name not in ("member_id", "week_start")
+                },
+            )
+        )
+    emptied = wanted - {(v["member_id"], v["week_start"]) for v in values}
+    if emptied:
+        await db.execute(
+            delete(AttendanceWeeklyRollup).where(
+                or_(
+                    *(
+                        and_(
+                            AttendanceWeeklyRollup.member_id == member_id,
+                            AttendanceWeeklyRollup.week_start == week_start_,
+                        )
+                        for member_id, week_start_ in emptied
+                    )
+                )
+            )
+        )
+
+
+async def rebuild_attendance_rollups(
+    db: AsyncSession, member_ids: Optional[list[uuid.UUID]] = None
+) -> int:
+    """Rebuild rollups from scratch (all members, or just ``member_ids``).
+
+    Used by the backfill command. Does not commit; returns rows written.
+    """
+    scope = (
+        AttendanceRecord.member_id.in_(member_ids)
+        if member_ids is not None
+        else AttendanceRecord.member_id.is_not(None)
+    )
+    clear = delete(AttendanceWeeklyRollup)
+    if member_ids is not None:
+        clear = clear.where(AttendanceWeeklyRollup.member_id.in_(member_ids))
+    await db.execute(clear)
+
+    week = _week_expr()
+    columns = _rollup_columns()
+    select_rows = (
+        select(AttendanceRecord.member_id, week, *columns, func.now())
+        .where(scope)
+        .group_by(AttendanceRecord.member_id, week)
+    )
+    result = await db.execute(
+        pg_insert(AttendanceWeeklyRollup).from_select(
+            ["member_id", "week_start", *(c.name for c in columns), "updated_at"],
+            select_rows,
+        )
+    )
+    return result.rowcount or 0
+
+
+@dataclass
+class _Tally:
+    present: int = 0
+    late: int = 0
+    absent: int = 0
+    excused: int = 0
+    total: int = 0
+    attended_minutes: int = 0
+    timed_sessions: int = 0
+    by_weekday: list[int] = field(default_factory=lambda: [0] * 7)
+    attended_weeks: set[date] = field(default_factory=set)
+
+    def add_rollup(self, row: AttendanceWeeklyRollup) -> None:
+        self.present += row.present
+        self.late += row.late
+        self.absent += row.absent
+        self.excused += row.excused
+        self.total += row.total
+        self.attended_minutes += row.attended_minutes
+        self.timed_sessions += row.timed_sessions
+        for i, count in enumerate(row.attended_by_weekday or ()):
+            self.by_weekday[i] += count
+        if row.present or row.late:
+            self.attended_weeks.add(row.week_start)
+
+    def add_record(self, record: AttendanceRecord) -> None:
+        self.total += 1
+        if record.status == AttendanceStatus.PRESENT:
+            self.present += 1
+        elif record.status == AttendanceStatus.LATE:
+            self.late += 1
+        elif record.status == AttendanceStatus.ABSENT:
+            self.absent += 1
+        elif record.status == AttendanceStatus.EXCUSED:
+            self.excused += 1
+        if record.status in ATTENDED:
+            self.by_weekday[_utc(record.created_at).weekday()] += 1
+            self.attended_weeks.add(week_start(record.created_at))
+            if record.session_minutes is not None:
+                self.attended_minutes += record.session_minutes
+                self.timed_sessions += 1
+
+
+async def _untimed_attended_minutes(
+    db: AsyncSession, member_id: uuid.UUID, date_from: datetime, date_to: datetime
+) -> tuple[int, int]:
+    """(minutes, sessions) of attended records in range without ``session_minutes``.
+
+    Those records predate the column; their sessions are looked up in
+    sessions_service until the backfill has filled them. Best-effort — if
+    the lookup fails they add nothing to pool hours.
+    """
+    session_ids = (
+        (
+            await db.execute(
+                select(AttendanceRecord.session_id).where(
+                    AttendanceRecord.member_id == member_id,
+                    AttendanceRecord.status.in_(ATTENDED),
+                    AttendanceRecord.session_minutes.is_(None),
+                    AttendanceRecord.created_at >= date_from,
+                    AttendanceRecord.created_at <= date_to,
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+    distinct = sorted({str(sid) for sid in session_ids})
+    minutes_by_session: dict[uuid.UUID, int] = {}
+    try:
+        for start in range(0, len(distinct), SESSION_LOOKUP_CHUNK):
+            sessions = await get_sessions_bulk(
+                distinct[start : start + SESSION_LOOKUP_CHUNK],
+                calling_service="attendance",
+            )
+            for session in sessions:
+                minutes = session_minutes(session)
+                if minutes is not None:
+                    minutes_by_session[uuid.UUID(str(session["id"]))] = minutes
+    except Exception as e:
+        logger.warning(
+            "Session durations lookup failed for member %s: %s", member_id, e
+        )
+        return 0, 0
+    found = [
+        minutes_by_session[sid] for sid in session_ids if sid in minutes_by_session
+    ]
+    return sum(found), len(found)
+
+
+async def member_attendance_stats(
+    db: AsyncSession, member_id: uuid.UUID, date_from: datetime, date_to: datetime
+) -> Optional[dict]:
+    """Attendance stats for ``member_id`` with ``created_at`` in [from, to].
+
+    Returns None when the member has no records in the range.
+    """
+    date_from, date_to = _utc(date_from), _utc(date_to)
+    # Whole ISO weeks inside the range are served by the rollups.
+    first_full = week_start(date_from)
+    if _midnight(first_full) < date_from:
+        first_full += timedelta(days=7)
+    end_full = week_start(date_to)  # exclusive
+    if end_full < first_full:
+        end_full = first_full
+
+    tally = _Tally()
+    created = AttendanceRecord.created_at
+    raw_ranges = [and_(created >= date_from, created <= date_to)]
+    if end_full > first_full:
+        rollups = (
+            await db.execute(
+                select(AttendanceWeeklyRollup).where(
+                    AttendanceWeeklyRollup.member_id == member_id,
+                    AttendanceWeeklyRollup.week_start >= first_full,
+                    AttendanceWeeklyRollup.week_start < end_full,
+                )
+            )
+        ).scalars()
+        for row in rollups:
+            tally.add_rollup(row)
+        # Only the partial weeks at either end are read record by record.
+        raw_ranges = [
+            and_(created >= date_from, created < _midnight(first_full)),
+            and_(created >= _midnight(end_full), created <= date_to),
+        ]
+
+    edge_records = (
+        await db.execute(
+            select(AttendanceRecord).where(
+                AttendanceRecord.member_id == member_id, or_(*raw_ranges)
+            )
+        )
+    ).scalars()
+    for record in edge_records:
+        tally.add_record(record)
+
+    if tally.total == 0:
+        return None
+    if tally.present + tally.late > tally.timed_sessions:
+        minutes, sessions = await _untimed_attended_minutes(
+            db, member_id, date_from, date_to
+        )
+        tally.attended_minutes += minutes
+        tally.timed_sessions += sessions
+
+    by_day = {WEEKDAYS[i]: count for i, count in enumerate(tally.by_weekday) if count}
+    # Ties go to the earlier weekday.
+    favorite_day = max(by_day, key=by_day.get) if by_day else None
+
+    # One flag per week in the range, capped at the current week so weeks
+    # that haven't happened yet don't reset a streak.
+    weekly_attendance = []
+    current, end_iter = date_from, min(date_to, utc_now())
+    while current <= end_iter:
+        weekly_attendance.append(week_start(current) in tally.attended_weeks)
+        current += timedelta(weeks=1)
+
+    hours = (
+        tally.attended_minutes / 60 - tally.timed_sessions * _WARMUP_HOURS_PER_SESSION
+    )
+    return {
+        "total_present": tally.present,
+        "total_late": tally.late,
+        "total_absent": tally.absent,
+        "total_excused": tally.excused,
+        "total_sessions": tally.total,
+        "by_day": by_day or None,
+        "favorite_day": favorite_day,
+        "weekly_attendance": weekly_attendance,
+        "total_pool_hours": round(max(0.0, hours), 1),
+    }
@@ -6,7 +6,6 @@ call them directly via Docker network.
 """
 
 import uuid
-from collections import Counter
 from datetime import datetime
 from typing import List, Optional
 
@@ -19,7 +18,7 @@ from libs.auth.dependencies import require_service_role
 from libs.auth.models import AuthUser
 from libs.db.session import get_async_db
 from services.attendance_service.models import AttendanceRecord
-from services.attendance_service.models.enums import AttendanceStatus
+from services.attendance_service.rollups import member_attendance_stats
 
 router = APIRouter(prefix="/internal/attendance", tags=["internal"])
 
@@ -96,6 +95,39 @@ async def get_session_attendee_member_ids(
     return [str(mid) for mid in result.scalars().all()]
 
 
+class BulkSessionAttendeesRequest(BaseModel):
+    session_ids: List[str]
+
+
+@router.post(
+    "/sessions/member-ids",
+    response_model=dict[str, List[str]],
+)
+async def get_sessions_attendee_member_ids(
+    body: BulkSessionAttendeesRequest,
+    _: AuthUser = Depends(require_service_role),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Bulk form of ``/session/{session_id}/member-ids``: distinct attendee
+    member IDs keyed by session ID (empty list when none)."""
+    attendees: dict[str, List[str]] = {sid: [] for sid in body.session_ids}
+    if not body.session_ids:
+        return attendees
+    query = (
+        select(AttendanceRecord.session_id, AttendanceRecord.member_id)
+        .where(
+            AttendanceRecord.session_id.in_(
+                [uuid.UUID(sid) for sid in body.session_ids]
+            )
+        )
+        .distinct()
+    )
+    result = await db.execute(query)
+    for session_id, member_id in result.all():
+        attendees.setdefault(str(session_id), []).append(str(member_id))
+    return attendees
+
+
 # ---------------------------------------------------------------------------
 # Reporting aggregation
 # ---------------------------------------------------------------------------
@@ -132,8 +164,11 @@ async def get_member_attendance_stats(
 ):
     """Aggregate attendance stats for a member within a date range.
 
-    Used by the reporting service for quarterly reports.
-    The member_auth_id is matched against members.auth_id via the member_id FK.
+    Used by the reporting service for quarterly reports and seasonality
+    ingest. The member_auth_id is matched against members.auth_id via the
+    member_id FK. Served from the weekly rollups plus the partial edge weeks
+    (see services/attendance_service/rollups.py). sessions_service is only
+    called for attended records that predate ``session_minutes``.
     """
     from services.attendance_service.models.core import MemberRef
 
@@ -145,98 +180,7 @@ async def get_member_attendance_stats(
     if member_uuid is None:
         return MemberAttendanceStats()
 
-    # Get all attendance records in the date range
-    result = await db.execute(
-        select(AttendanceRecord).where(
-            AttendanceRecord.member_id == member_uuid,
-            AttendanceRecord.created_at >= date_from,
-            AttendanceRecord.created_at <= date_to,
-        )
-    )
-    records = result.scalars().all()
-
-    if not records:
+    stats = await member_attendance_stats(db, member_uuid, date_from, date_to)
+    if stats is None:
         return MemberAttendanceStats()
-
-    # Count by status
-    status_counts = Counter(
-        r.status.value if hasattr(r.status, "value") else str(r.status) for r in records
-    )
-
-    total_present = status_counts.get("present", 0)
-    total_late = status_counts.get("late", 0)
-
-    # Count by day of week
-    day_counts: Counter = Counter()
-    for r in records:
-        if r.status in (AttendanceStatus.PRESENT, AttendanceStatus.LATE):
-            day_name = r.created_at.strftime("%A")
-            day_counts[day_name] += 1
-
-    favorite_day = day_counts.most_common(1)[0][0] if day_counts else None
-
-    # Compute weekly attendance (which weeks had at least one session)
-    from datetime import timedelta
-
-    weeks_attended: dict[int, bool] = {}
-    for r in records:
-        if r.status in (AttendanceStatus.PRESENT, AttendanceStatus.LATE):
-            week_num = r.created_at.isocalendar()[1]
-            weeks_attended[week_num] = True
-
-    # Build ordered list of weeks in the range — cap at the current week so
-    # weeks that haven't happened yet don't reset the streak to 0.
-    from libs.common.datetime_utils import utc_now
-
-    end_iter = min(date_to, utc_now())
-    weekly_attendance = []
-    current = date_from
-    while current <= end_iter:
-        wk = current.isocalendar()[1]
-        weekly_attendance.append(wk in weeks_attended)
-        current += timedelta(weeks=1)
-
-    # Compute pool hours from attended sessions
-    # Fetch session durations from sessions service for attended session IDs
-    attended_session_ids = list(
-        {
-            str(r.session_id)
-            for r in records
-            if r.status in (AttendanceStatus.PRESENT, AttendanceStatus.LATE)
-        }
-    )
-    total_pool_hours = 0.0
-    if attended_session_ids:
-        try:
-            from libs.common.config import get_settings
-            from libs.common.service_client import internal_get
-
-            _settings = get_settings()
-            resp = await internal_get(
-                service_url=_settings.SESSIONS_SERVICE_URL,
-                path="/internal/sessions/durations",
-                calling_service="attendance",
-                params={"ids": ",".join(attended_session_ids)},
-                timeout=10.0,
-            )
-            if resp.status_code == 200:
-                durations = resp.json()
-                # durations is a list of {"session_id": ..., "duration_hours": ...}
-                raw_hours = sum(d.get("duration_hours", 0) for d in durations)
-                # Subtract ~1 hour per session for warmups/rests (minimum 0)
-                effective_hours = max(0, raw_hours - len(attended_session_ids) * 1.0)
-                total_pool_hours = round(effective_hours, 1)
-        except Exception:
-            pass  # Graceful fallback — pool hours stays 0
-
-    return MemberAttendanceStats(
-        total_present=total_present,
-        total_late=total_late,
-        total_absent=status_counts.get("absent", 0),
-        total_excused=status_counts.get("excused", 0),
-        total_sessions=len(records),
-        by_day=dict(day_counts) if day_counts else None,
-        favorite_day=favorite_day,
-        weekly_attendance=weekly_attendance,
-        total_pool_hours=total_pool_hours,
-    )
+    return MemberAttendanceStats(**stats)
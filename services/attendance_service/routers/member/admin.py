@@ -10,7 +10,7 @@ from libs.db.session import get_async_db
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from services.attendance_service.models import AttendanceRecord
+from services.attendance_service.models import AttendanceRecord, AttendanceWeeklyRollup
 
 router = APIRouter()
 
@@ -55,5 +55,10 @@ async def admin_delete_member_attendance(
     result = await db.execute(
         delete(AttendanceRecord).where(AttendanceRecord.member_id == member_id)
     )
+    await db.execute(
+        delete(AttendanceWeeklyRollup).where(
+            AttendanceWeeklyRollup.member_id == member_id
+        )
+    )
     await db.commit()
     return {"deleted": result.rowcount or 0}
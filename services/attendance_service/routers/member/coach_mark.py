@@ -11,6 +11,11 @@ from libs.auth.models import AuthUser
 from libs.common.service_client import get_members_bulk, get_session_by_id
 from libs.db.session import get_async_db
 from services.attendance_service.models import AttendanceRecord, AttendanceStatus
+from services.attendance_service.rollups import (
+    refresh_attendance_rollups,
+    rollup_keys,
+    session_minutes,
+)
 from services.attendance_service.schemas import (
     AttendanceResponse,
     CoachAttendanceMarkRequest,
@@ -93,6 +98,8 @@ async def coach_mark_session_attendance(
 
     upserted = 0
     deleted = 0
+    minutes = session_minutes(session_data)
+    touched: list[AttendanceRecord] = []
 
     for entry in payload.entries:
         existing = existing_by_member.get(entry.member_id)
@@ -109,36 +116,40 @@ async def coach_mark_session_attendance(
         # silently no-op'd every cohort-present click.
         if entry.status == AttendanceStatus.PRESENT:
             if existing is None:
-                db.add(
-                    AttendanceRecord(
-                        session_id=session_id,
-                        member_id=entry.member_id,
-                        status=AttendanceStatus.PRESENT,
-                        notes=entry.notes,
-                    )
+                existing = AttendanceRecord(
+                    session_id=session_id,
+                    member_id=entry.member_id,
+                    status=AttendanceStatus.PRESENT,
+                    notes=entry.notes,
                 )
+                db.add(existing)
             else:
                 existing.status = AttendanceStatus.PRESENT
                 if entry.notes is not None:
                     existing.notes = entry.notes
+            existing.session_minutes = minutes
+            touched.append(existing)
             upserted += 1
             continue
 
         if existing is None:
-            db.add(
-                AttendanceRecord(
-                    session_id=session_id,
-                    member_id=entry.member_id,
-                    status=entry.status,
-                    notes=entry.notes,
-                )
+            existing = AttendanceRecord(
+                session_id=session_id,
+                member_id=entry.member_id,
+                status=entry.status,
+                notes=entry.notes,
             )
+            db.add(existing)
         else:
             existing.status = entry.status
             if entry.notes is not None:
                 existing.notes = entry.notes
+        existing.session_minutes = minutes
+        touched.append(existing)
         upserted += 1
 
+    await db.flush()
+    await refresh_attendance_rollups(db, rollup_keys(touched))
     await db.commit()
 
     # Re-fetch the resulting state for the response.
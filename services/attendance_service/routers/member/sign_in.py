@@ -19,6 +19,11 @@ from services.attendance_service.models import (
     AttendanceStatus,
     MemberRef,
 )
+from services.attendance_service.rollups import (
+    refresh_attendance_rollups,
+    rollup_keys,
+    session_minutes,
+)
 from services.attendance_service.schemas import (
     AttendanceCreate,
     AttendanceResponse,
@@ -135,7 +140,10 @@ async def sign_in_to_session(
             booking_id=linked_booking_id,
         )
         db.add(attendance)
+    attendance.session_minutes = session_minutes(session_data)
 
+    await db.flush()
+    await refresh_attendance_rollups(db, rollup_keys([attendance]))
     await db.commit()
     await db.refresh(attendance)
 
@@ -219,7 +227,10 @@ async def public_sign_in_to_session(
             booking_id=linked_booking_id,
         )
         db.add(attendance)
+    attendance.session_minutes = session_minutes(session_data)
 
+    await db.flush()
+    await refresh_attendance_rollups(db, rollup_keys([attendance]))
     await db.commit()
     await db.refresh(attendance)
     return attendance
@@ -269,6 +280,8 @@ async def record_guest_attendance(
             notes=attendance_in.notes,
         )
         db.add(attendance)
+    # Guests have no member rollup, but keep the row's duration consistent.
+    attendance.session_minutes = session_minutes(session_data)
 
     await db.commit()
     await db.refresh(attendance)
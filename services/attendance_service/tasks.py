@@ -9,29 +9,34 @@ cleanly; the member just didn't show up), and the negative outcome is
 captured on AttendanceRecord where every other attendance fact lives.
 
 After A1 Phase 3.3 was relocated to sessions_service, this task is
-cross-service: pull candidates from sessions_service, check each against
-local AttendanceRecord, create ABSENT rows for misses.
+cross-service: pull candidates from sessions_service, check them against
+local AttendanceRecord, create ABSENT rows for misses. Both sweeps are
+set-based — session data and coach ids come from the bulk internal
+endpoints, existing records from one tuple-IN anti-join, and ABSENT rows
+go in as multi-row ``INSERT … ON CONFLICT DO NOTHING``.
 
 See docs/design/A1_SESSION_DISCRIMINATOR_REFACTOR.md §C.
 """
 
 from __future__ import annotations
 
+import time
 import uuid
 from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from libs.common.config import get_settings
 from libs.common.datetime_utils import utc_now
 from libs.common.logging import get_logger
 from libs.common.service_client import (
     dispatch_notification,
     get_admin_members,
-    get_session_by_id,
-    internal_get,
+    get_session_coach_ids_bulk,
+    get_sessions_bulk,
 )
 from libs.common.service_client.sessions import list_confirmed_bookings_since
 from libs.db.config import AsyncSessionLocal
@@ -40,9 +45,19 @@ from services.attendance_service.models import (
     AttendanceRole,
     AttendanceStatus,
 )
+from services.attendance_service.rollups import (
+    refresh_attendance_rollups,
+    session_minutes,
+    week_start,
+)
 
 logger = get_logger(__name__)
 
+# Bind-parameter budget: (session_id, member_id) pairs per anti-join query
+# and rows per multi-row INSERT (9 columns each).
+_PAIR_CHUNK = 2000
+_INSERT_CHUNK = 1000
+
 
 def _parse_iso(value: Optional[str]) -> Optional[datetime]:
     if not value:
@@ -53,84 +68,157 @@ def _parse_iso(value: Optional[str]) -> Optional[datetime]:
         return None
 
 
+async def _session_lookup(session_ids: list[str]) -> dict[str, dict]:
+    """Sessions keyed by id — one bulk call; unknown ids are absent."""
+    sessions = await get_sessions_bulk(session_ids, calling_service="attendance")
+    return {s["id"]: s for s in sessions}
+
+
+async def _attendance_statuses(
+    db: AsyncSession, pairs: list[tuple[uuid.UUID, uuid.UUID]]
+) -> dict[tuple[uuid.UUID, uuid.UUID], AttendanceStatus]:
+    """Existing AttendanceRecord status per (session_id, member_id) pair.
+
+    Pairs without a record are simply missing from the result — the
+    anti-join is done by the caller with a dict lookup.
+    """
+    statuses: dict[tuple[uuid.UUID, uuid.UUID], AttendanceStatus] = {}
+    for start in range(0, len(pairs), _PAIR_CHUNK):
+        rows = await db.execute(
+            select(
+                AttendanceRecord.session_id,
+                AttendanceRecord.member_id,
+                AttendanceRecord.status,
+            ).where(
+                tuple_(AttendanceRecord.session_id, AttendanceRecord.member_id).in_(
+                    pairs[start : start + _PAIR_CHUNK]
+                )
+            )
+        )
+        for session_id, member_id, status in rows.all():
+            statuses[(session_id, member_id)] = status
+    return statuses
+
+
+async def mark_no_shows(
+    db: AsyncSession,
+    bookings: list[dict],
+    sessions_by_id: dict[str, dict],
+    *,
+    now: datetime,
+) -> dict:
+    """Insert ABSENT rows for ended, unmarked bookings. Does not commit.
+
+    One anti-join query per ``_PAIR_CHUNK`` bookings and one multi-row
+    ``INSERT … ON CONFLICT DO NOTHING`` per chunk of misses, so a row that
+    a coach marks between the two is left alone rather than failing the run.
+    """
+    counts = {
+        "checked": len(bookings),
+        "created": 0,
+        "skipped_already_attended": 0,
+        "skipped_session_lookup": 0,
+        "skipped_session_future": 0,
+    }
+    keyed = [
+        (
+            uuid.UUID(b["session_id"]),
+            uuid.UUID(b["member_id"]),
+            uuid.UUID(b["id"]),
+        )
+        for b in bookings
+    ]
+    existing = await _attendance_statuses(db, [(sid, mid) for sid, mid, _ in keyed])
+
+    rows: list[dict] = []
+    seen: set[tuple[uuid.UUID, uuid.UUID]] = set()
+    for session_id, member_id, booking_id in keyed:
+        # Either the member showed up, or a previous sweep already marked
+        # them ABSENT.
+        if (session_id, member_id) in existing or (session_id, member_id) in seen:
+            counts["skipped_already_attended"] += 1
+            continue
+        # Session has to have ENDED for the no-show to be a fact.
+        session_data = sessions_by_id.get(str(session_id))
+        if session_data is None:
+            counts["skipped_session_lookup"] += 1
+            continue
+        ends_at = _parse_iso(session_data.get("ends_at"))
+        if ends_at is None or ends_at > now:
+            counts["skipped_session_future"] += 1
+            continue
+        seen.add((session_id, member_id))
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "session_id": session_id,
+                "member_id": member_id,
+                "status": AttendanceStatus.ABSENT,
+                "role": AttendanceRole.SWIMMER,
+                "booking_id": booking_id,
+                "notes": "auto-marked NO_SHOW by nightly sweep",
+                "session_minutes": session_minutes(session_data),
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+
+    marked: set[uuid.UUID] = set()
+    for start in range(0, len(rows), _INSERT_CHUNK):
+        inserted = (
+            (
+                await db.execute(
+                    pg_insert(AttendanceRecord)
+                    .values(rows[start : start + _INSERT_CHUNK])
+                    .on_conflict_do_nothing(constraint="uq_session_member_attendance")
+                    .returning(AttendanceRecord.member_id)
+                )
+            )
+            .scalars()
+            .all()
+        )
+        counts["created"] += len(inserted)
+        # Marked concurrently since the anti-join ran.
+        counts["skipped_already_attended"] += len(
+            rows[start : start + _INSERT_CHUNK]
+        ) - len(inserted)
+        marked.update(inserted)
+    await refresh_attendance_rollups(
+        db, {(member_id, week_start(now)) for member_id in marked}
+    )
+    return counts
+
+
 async def sweep_no_show_bookings(*, lookback_days: int = 7) -> dict:
     """Create ABSENT AttendanceRecords for CONFIRMED bookings past session end
     that have no attendance row.
 
     Bounded by ``lookback_days`` (default 7) so the job stays O(recent
-    bookings) — anything older is assumed already swept.
+    bookings) — anything older is assumed already swept. Set-based: one
+    bookings call, one bulk sessions call, then ``mark_no_shows``.
     """
+    started = time.perf_counter()
     cutoff_lower = (utc_now() - timedelta(days=lookback_days)).isoformat()
 
-    checked = 0
-    created = 0
-    skipped_already_attended = 0
-    skipped_session_lookup = 0
-    skipped_session_future = 0
-
     try:
         bookings = await list_confirmed_bookings_since(
             since_iso=cutoff_lower, calling_service="attendance"
         )
+        sessions_by_id = await _session_lookup(
+            list({b["session_id"] for b in bookings})
+        )
     except Exception as exc:
         logger.error("sweep_no_show_bookings: failed to fetch bookings: %s", exc)
         return {"error": str(exc)}
 
     async with AsyncSessionLocal() as db:
-        for booking in bookings:
-            checked += 1
-            session_id = uuid.UUID(booking["session_id"])
-            member_id = uuid.UUID(booking["member_id"])
-            booking_id = uuid.UUID(booking["id"])
-
-            # Skip if an attendance record already exists for this
-            # (session, member) — either the member showed up, or a previous
-            # sweep already marked them ABSENT.
-            existing = (
-                await db.execute(
-                    select(AttendanceRecord).where(
-                        AttendanceRecord.session_id == session_id,
-                        AttendanceRecord.member_id == member_id,
-                    )
-                )
-            ).scalar_one_or_none()
-            if existing is not None:
-                skipped_already_attended += 1
-                continue
-
-            # Session has to have ENDED for the no-show to be a fact.
-            session_data = await get_session_by_id(
-                str(session_id), calling_service="attendance"
-            )
-            if session_data is None:
-                skipped_session_lookup += 1
-                continue
-            ends_at = _parse_iso(session_data.get("ends_at"))
-            if ends_at is None or ends_at > utc_now():
-                skipped_session_future += 1
-                continue
-
-            record = AttendanceRecord(
-                session_id=session_id,
-                member_id=member_id,
-                status=AttendanceStatus.ABSENT,
-                role=AttendanceRole.SWIMMER,
-                booking_id=booking_id,
-                notes="auto-marked NO_SHOW by nightly sweep",
-            )
-            db.add(record)
-            created += 1
-
-        if created > 0:
+        result = await mark_no_shows(db, bookings, sessions_by_id, now=utc_now())
+        if result["created"] > 0:
             await db.commit()
 
-    result = {
-        "checked": checked,
-        "created": created,
-        "skipped_already_attended": skipped_already_attended,
-        "skipped_session_lookup": skipped_session_lookup,
-        "skipped_session_future": skipped_session_future,
-    }
+    elapsed = time.perf_counter() - started
+    result["elapsed_ms"] = round(elapsed * 1000, 1)
+    result["rows_per_sec"] = round(result["checked"] / elapsed) if elapsed else 0
     logger.info("sweep_no_show_bookings: %s", result)
     return result
 
@@ -140,27 +228,6 @@ async def sweep_no_show_bookings(*, lookback_days: int = 7) -> dict:
 # ---------------------------------------------------------------------------
 
 
-async def _get_session_coach_ids(session_id: str) -> list[str]:
-    """Service-to-service call: get coach member IDs for a session.
-
-    Wraps the internal sessions endpoint. Returns [] on failure (the
-    notification job is best-effort).
-    """
-    settings = get_settings()
-    try:
-        resp = await internal_get(
-            service_url=settings.SESSIONS_SERVICE_URL,
-            path=f"/internal/sessions/{session_id}/coaches",
-            calling_service="attendance",
-        )
-        resp.raise_for_status()
-        ids = resp.json()
-        return [str(x) for x in (ids or [])]
-    except Exception as exc:
-        logger.warning("Failed to fetch coach ids for session %s: %s", session_id, exc)
-        return []
-
-
 async def notify_stale_attendance(*, lookback_hours: int = 24) -> dict:
     """Notify coaches + admins about sessions whose attendance is still
     unmarked some hours after they ended.
@@ -191,93 +258,98 @@ async def notify_stale_attendance(*, lookback_hours: int = 24) -> dict:
     for b in bookings:
         bookings_by_session[b["session_id"]].append(b)
 
+    try:
+        sessions_by_id = await _session_lookup(list(bookings_by_session))
+    except Exception as exc:
+        logger.error("notify_stale_attendance: failed to fetch sessions: %s", exc)
+        return {"error": str(exc)}
+
+    ended: dict[str, list[dict]] = {}
+    for session_id_str, session_bookings in bookings_by_session.items():
+        session_data = sessions_by_id.get(session_id_str)
+        if session_data is None:
+            continue
+        ends_at = _parse_iso(session_data.get("ends_at"))
+        # Only sessions that ended inside our window.
+        if ends_at is not None and cutoff_lower <= ends_at <= cutoff_upper:
+            ended[session_id_str] = session_bookings
+
+    # Count unmatched: bookings whose (session, member) tuple has no
+    # AttendanceRecord at all. ABSENT counts as "unmatched" because it was
+    # likely auto-created by an earlier run of the no-show sweep; we still
+    # want the coach to confirm/override.
+    async with AsyncSessionLocal() as db:
+        statuses = await _attendance_statuses(
+            db,
+            [
+                (uuid.UUID(sid), uuid.UUID(b["member_id"]))
+                for sid, session_bookings in ended.items()
+                for b in session_bookings
+            ],
+        )
+    unmatched: dict[str, int] = {}
+    for session_id_str, session_bookings in ended.items():
+        session_uuid = uuid.UUID(session_id_str)
+        count = sum(
+            1
+            for b in session_bookings
+            if statuses.get((session_uuid, uuid.UUID(b["member_id"])))
+            in (None, AttendanceStatus.ABSENT)
+        )
+        if count:
+            unmatched[session_id_str] = count
+
     notifications_sent = 0
-    sessions_with_stale = 0
+    sessions_with_stale = len(unmatched)
 
-    # Lazy-load admin recipients — we'll fan out to all admins per stale
-    # session. (Admins are the safety net when no coach is assigned.)
+    # Best-effort recipients: coaches per session (one bulk call) plus every
+    # admin as the safety net when no coach is assigned.
+    coach_ids_by_session: dict[str, list[str]] = {}
     admin_ids: list[str] = []
-    admins_loaded = False
-
-    async with AsyncSessionLocal() as db:
-        for session_id_str, session_bookings in bookings_by_session.items():
-            session_uuid = uuid.UUID(session_id_str)
-            session_data = await get_session_by_id(
-                session_id_str, calling_service="attendance"
-            )
-            if session_data is None:
-                continue
-            ends_at = _parse_iso(session_data.get("ends_at"))
-            if ends_at is None:
-                continue
-            # Only sessions that ended inside our window.
-            if not (cutoff_lower <= ends_at <= cutoff_upper):
-                continue
-
-            # Count unmatched: bookings whose (session, member) tuple has
-            # no AttendanceRecord at all. ABSENT counts as "unmatched"
-            # because it was likely auto-created by an earlier run of the
-            # no-show sweep; we still want the coach to confirm/override.
-            unmatched_count = 0
-            for b in session_bookings:
-                member_uuid = uuid.UUID(b["member_id"])
-                existing = (
-                    await db.execute(
-                        select(AttendanceRecord.status).where(
-                            AttendanceRecord.session_id == session_uuid,
-                            AttendanceRecord.member_id == member_uuid,
-                        )
-                    )
-                ).scalar_one_or_none()
-                if existing is None:
-                    unmatched_count += 1
-                elif str(existing).lower() == "absent":
-                    unmatched_count += 1
-
-            if unmatched_count == 0:
-                continue
-
-            sessions_with_stale += 1
-            coach_ids = await _get_session_coach_ids(session_id_str)
-            if not admins_loaded:
-                try:
-                    admins = await get_admin_members(calling_service="attendance")
-                    admin_ids = [str(a.get("id")) for a in admins if a.get("id")]
-                except Exception as exc:
-                    logger.warning(
-                        "notify_stale_attendance: admin lookup failed: %s", exc
-                    )
-                    admin_ids = []
-                admins_loaded = True
-
-            recipients = list({*coach_ids, *admin_ids})
-            if not recipients:
-                continue
-
-            title = f"Attendance still unmarked: {session_data.get('title', 'session')}"
-            body = (
-                f"{unmatched_count} booking"
-                f"{'' if unmatched_count == 1 else 's'} "
-                f"haven't been marked yet. The system will auto-mark them "
-                f"as absent overnight if you don't confirm."
-            )
-            resp = await dispatch_notification(
-                type="attendance_stale_reminder",
-                category="attendance",
-                member_ids=recipients,
-                title=title,
-                body=body,
-                action_url=f"/admin/attendance?session={session_id_str}",
-                icon="alert-triangle",
-                channels=["in_app"],
-                metadata={
-                    "session_id": session_id_str,
-                    "unmatched_count": unmatched_count,
-                },
-                calling_service="attendance",
+    if unmatched:
+        try:
+            coach_ids_by_session = await get_session_coach_ids_bulk(
+                list(unmatched), calling_service="attendance"
             )
-            if resp is not None:
-                notifications_sent += 1
+        except Exception as exc:
+            logger.warning("notify_stale_attendance: coach lookup failed: %s", exc)
+        try:
+            admins = await get_admin_members(calling_service="attendance")
+            admin_ids = [str(a.get("id")) for a in admins if a.get("id")]
+        except Exception as exc:
+            logger.warning("notify_stale_attendance: admin lookup failed: %s", exc)
+
+    for session_id_str, unmatched_count in unmatched.items():
+        session_data = sessions_by_id[session_id_str]
+        coach_ids = coach_ids_by_session.get(session_id_str) or []
+        recipients = list({*coach_ids, *admin_ids})
+        if not recipients:
+            continue
+
+        title = f"Attendance still unmarked: {session_data.get('title', 'session')}"
+        body = (
+            f"{unmatched_count} booking"
+            f"{'' if unmatched_count == 1 else 's'} "
+            f"haven't been marked yet. The system will auto-mark them "
+            f"as absent overnight if you don't confirm."
+        )
+        resp = await dispatch_notification(
+            type="attendance_stale_reminder",
+            category="attendance",
+            member_ids=recipients,
+            title=title,
+            body=body,
+            action_url=f"/admin/attendance?session={session_id_str}",
+            icon="alert-triangle",
+            channels=["in_app"],
+            metadata={
+                "session_id": session_id_str,
+                "unmatched_count": unmatched_count,
+            },
+            calling_service="attendance",
+        )
+        if resp is not None:
+            notifications_sent += 1
 
     result = {
         "sessions_with_stale": sessions_with_stale,
@@ -10,6 +10,8 @@ from services.communications_service.models.core import (
     AnnouncementStatus,
     ContentComment,
     ContentPost,
+    EmailOutbox,
+    EmailOutboxStatus,
     MemberRef,
     MessageLog,
     MessageRecipientType,
@@ -32,6 +34,8 @@ __all__ = [
     "AnnouncementStatus",
     "ContentComment",
     "ContentPost",
+    "EmailOutbox",
+    "EmailOutboxStatus",
     "MemberRef",
     "MessageLog",
     "MessageRecipientType",
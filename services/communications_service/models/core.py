@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Index, String, Text, text
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text, text
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -13,6 +13,7 @@ from services.communications_service.models.enums import (
     AnnouncementAudience,
     AnnouncementCategory,
     AnnouncementStatus,
+    EmailOutboxStatus,
     MessageRecipientType,
     ScheduledNotificationStatus,
     SessionNotificationType,
@@ -450,6 +451,72 @@ class SessionNotificationLog(Base):
         return f"<SessionNotificationLog {self.notification_type.value} to {self.member_id} via {self.channel}>"
 
 
+class EmailOutbox(Base):
+    """
+    Rendered emails awaiting delivery by the outbox worker.
+
+    ``dedupe_key`` (e.g. ``session_published:<session>:<member>``) is unique, so
+    enqueueing the same notification twice is a no-op. Rows are claimed in
+    ``sending`` with a lease in ``next_attempt_at``; a worker that dies
+    mid-send leaves them to be reclaimed once the lease runs out.
+    """
+
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index(
+            "ix_email_outbox_due",
+            "next_attempt_at",
+            postgresql_where=text("status IN ('pending', 'sending')"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    dedupe_key: Mapped[str] = mapped_column(String, nullable=False, unique=True)
+    category: Mapped[str] = mapped_column(
+        String(50), nullable=False
+    )  # e.g. "session_published", "reminder_24h"
+    to_email: Mapped[str] = mapped_column(String, nullable=False)
+    subject: Mapped[str] = mapped_column(String, nullable=False)
+    body: Mapped[str] = mapped_column(Text, nullable=False)
+    html_body: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    from_email: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    from_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+
+    # Session notification log row to mark delivered/failed, if any
+    notification_log_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )
+
+    status: Mapped[EmailOutboxStatus] = mapped_column(
+        SAEnum(
+            EmailOutboxStatus,
+            name="email_outbox_status_enum",
+            values_callable=enum_values,
+            validate_strings=True,
+        ),
+        default=EmailOutboxStatus.PENDING,
+        nullable=False,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now, nullable=False
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    provider_message_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now
+    )
+    sent_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    def __repr__(self):
+        return f"<EmailOutbox {self.category} to {self.to_email} ({self.status.value})>"
+
+
 # ============================================================================
 # PERSONAL NOTIFICATIONS
 # ============================================================================
@@ -0,0 +1,374 @@
+"""Email outbox: durable, batched, rate-limited delivery.
+
+Producers render their emails and ``enqueue_emails`` them in their own
+transaction; a unique ``dedupe_key`` makes re-enqueueing the same notification
+a no-op, so dedupe is one ``INSERT ... ON CONFLICT DO NOTHING`` for the whole
+audience instead of one lookup per member.
+
+``deliver_outbox`` drains due rows: it claims a page (``FOR UPDATE SKIP
+LOCKED``, leased so a crashed worker's rows come back), groups it into
+``EMAIL_BATCH_SIZE``-message provider calls, sends ``EMAIL_SEND_CONCURRENCY`` of
+them at a time through ``send_email_batch`` (which paces each provider), and
+records the outcome in bulk:
+
+* accepted → ``sent``, and the linked session notification log row too;
+* 429 → retried in-run after the provider's back-off;
+* other retryable failures → back to ``pending`` with exponential backoff,
+  ``failed`` after ``MAX_ATTEMPTS``;
+* a batch the provider rejects outright is split and re-sent one message per
+  call, so one bad address doesn't fail its neighbours.
+
+Request handlers only enqueue and call ``request_delivery``; the drain runs in
+the worker (kicked immediately, and every minute for retries).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Awaitable, Callable, Optional, Sequence
+
+from arq import create_pool
+from libs.common.arq_config import get_redis_settings
+from libs.common.config import get_settings
+from libs.common.datetime_utils import utc_now
+from libs.common.emails.core import (
+    BatchSendResult,
+    EmailMessage,
+    send_email_batch,
+)
+from libs.common.logging import get_logger
+from libs.db.config import AsyncSessionLocal
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from services.communications_service.models import (
+    EmailOutbox,
+    EmailOutboxStatus,
+    SessionNotificationLog,
+)
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+MAX_ATTEMPTS = 6
+BASE_RETRY_SECONDS = 30
+MAX_RETRY_SECONDS = 3600
+# 429s retried inside one drain before the batch goes back to the outbox.
+MAX_RATE_LIMIT_RETRIES = 3
+# How long a claimed row stays invisible to other drains.
+CLAIM_LEASE = timedelta(minutes=10)
+# Rows examined per drain; the cron picks up the rest on its next tick.
+DRAIN_LIMIT = 20_000
+_ENQUEUE_CHUNK = 1000
+
+SendBatchFn = Callable[..., Awaitable[BatchSendResult]]
+
+# ── Lazy ARQ Redis pool for kicking the delivery job from request handlers ──
+_redis_pool = None
+
+
+@dataclass
+class OutboundBatch:
+    """Messages from one sender, sent in one provider call."""
+
+    messages: list[EmailMessage]
+    from_email: Optional[str] = None
+    from_name: Optional[str] = None
+    row_ids: Optional[list[uuid.UUID]] = None
+
+
+@dataclass
+class DeliverySummary:
+    claimed: int = 0
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+    provider_calls: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def per_minute(self) -> float:
+        return self.sent * 60 / self.elapsed_s if self.elapsed_s else 0.0
+
+
+async def enqueue_emails(db: AsyncSession, rows: Sequence[dict]) -> set[str]:
+    """Insert outbox rows, skipping any whose ``dedupe_key`` is already queued.
+
+    Each row needs ``dedupe_key``, ``category``, ``to_email``, ``subject`` and
+    ``body``; ``html_body``, ``from_email``, ``from_name`` and
+    ``notification_log_id`` are optional. Runs in the caller's transaction and
+    returns the dedupe keys actually inserted.
+    """
+    inserted: set[str] = set()
+    now = utc_now()
+    for i in range(0, len(rows), _ENQUEUE_CHUNK):
+        chunk = [
+            {
+                "id": uuid.uuid4(),
+                "html_body": None,
+                "from_email": None,
+                "from_name": None,
+                "notification_log_id": None,
+                **row,
+                "status": EmailOutboxStatus.PENDING,
+                "attempts": 0,
+                "next_attempt_at": now,
+                "created_at": now,
+            }
+            for row in rows[i : i + _ENQUEUE_CHUNK]
+        ]
+        result = await db.execute(
+            pg_insert(EmailOutbox)
+            .values(chunk)
+            .on_conflict_do_nothing(index_elements=["dedupe_key"])
+            .returning(EmailOutbox.dedupe_key)
+        )
+        inserted.update(result.scalars().all())
+    return inserted
+
+
+def _split(batch: OutboundBatch) -> list[OutboundBatch]:
+    return [
+        OutboundBatch(
+            [m],
+            batch.from_email,
+            batch.from_name,
+            [batch.row_ids[i]] if batch.row_ids else None,
+        )
+        for i, m in enumerate(batch.messages)
+    ]
+
+
+async def send_batches(
+    batches: Sequence[OutboundBatch],
+    *,
+    concurrency: Optional[int] = None,
+    send_batch: Optional[SendBatchFn] = None,
+) -> list[tuple[OutboundBatch, BatchSendResult]]:
+    """Send batches with bounded concurrency; no database access.
+
+    Returns one ``(batch, result)`` per provider call that settled — a batch
+    the provider rejected outright comes back as its single-message retries.
+    """
+    send = send_batch or send_email_batch
+    semaphore = asyncio.Semaphore(concurrency or settings.EMAIL_SEND_CONCURRENCY)
+    outcomes: list[tuple[OutboundBatch, BatchSendResult]] = []
+
+    async def _one(batch: OutboundBatch) -> None:
+        async with semaphore:
+            for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+                result = await send(
+                    batch.messages,
+                    from_email=batch.from_email,
+                    from_name=batch.from_name,
+                )
+                # The provider's pacer already waits out retry_after.
+                if result.retry_after is None or attempt == MAX_RATE_LIMIT_RETRIES:
+                    break
+        if (
+            not result.retryable
+            and not any(result.delivered)
+            and len(batch.messages) > 1
+        ):
+            await asyncio.gather(*(_one(single) for single in _split(batch)))
+            return
+        outcomes.append((batch, result))
+
+    await asyncio.gather(*(_one(b) for b in batches))
+    return outcomes
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    seconds = min(MAX_RETRY_SECONDS, BASE_RETRY_SECONDS * 2 ** (attempts - 1))
+    return timedelta(seconds=seconds * random.uniform(0.8, 1.2))
+
+
+async def _claim(limit: int) -> list[EmailOutbox]:
+    now = utc_now()
+    due = (
+        select(EmailOutbox.id)
+        .where(
+            EmailOutbox.status.in_(
+                [EmailOutboxStatus.PENDING, EmailOutboxStatus.SENDING]
+            ),
+            EmailOutbox.next_attempt_at <= now,
+        )
+        .order_by(EmailOutbox.next_attempt_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    async with AsyncSessionLocal() as db:
+        rows = (
+            (
+                await db.execute(
+                    update(EmailOutbox)
+                    .where(EmailOutbox.id.in_(due.scalar_subquery()))
+                    .values(
+                        status=EmailOutboxStatus.SENDING,
+                        attempts=EmailOutbox.attempts + 1,
+                        next_attempt_at=now + CLAIM_LEASE,
+                    )
+                    .returning(EmailOutbox)
+                    .execution_options(synchronize_session=False)
+                )
+            )
+            .scalars()
+            .all()
+        )
+        await db.commit()
+        return list(rows)
+
+
+def _batches(rows: Sequence[EmailOutbox], batch_size: int) -> list[OutboundBatch]:
+    by_sender: dict[tuple, list[EmailOutbox]] = defaultdict(list)
+    for row in rows:
+        by_sender[(row.from_email, row.from_name)].append(row)
+    batches = []
+    for (from_email, from_name), group in by_sender.items():
+        for i in range(0, len(group), batch_size):
+            chunk = group[i : i + batch_size]
+            batches.append(
+                OutboundBatch(
+                    messages=[
+                        EmailMessage(r.to_email, r.subject, r.body, r.html_body)
+                        for r in chunk
+                    ],
+                    from_email=from_email,
+                    from_name=from_name,
+                    row_ids=[r.id for r in chunk],
+                )
+            )
+    return batches
+
+
+async def _record(
+    outcomes: list[tuple[OutboundBatch, BatchSendResult]],
+    rows: dict[uuid.UUID, EmailOutbox],
+    summary: DeliverySummary,
+) -> None:
+    now = utc_now()
+    updates: list[dict] = []
+    sent_logs: list[uuid.UUID] = []
+    failed_logs: list[uuid.UUID] = []
+    for batch, result in outcomes:
+        ids = result.message_ids
+        for i, row_id in enumerate(batch.row_ids or []):
+            row = rows[row_id]
+            if result.delivered[i]:
+                summary.sent += 1
+                updates.append(
+                    {
+                        "id": row_id,
+                        "status": EmailOutboxStatus.SENT,
+                        "sent_at": now,
+                        "last_error": None,
+                        "provider_message_id": ids[i]
+                        if len(ids) == len(batch.messages)
+                        else None,
+                    }
+                )
+                if row.notification_log_id:
+                    sent_logs.append(row.notification_log_id)
+            elif result.retryable and row.attempts < MAX_ATTEMPTS:
+                summary.retried += 1
+                updates.append(
+                    {
+                        "id": row_id,
+                        "status": EmailOutboxStatus.PENDING,
+                        "next_attempt_at": now + _retry_delay(row.attempts),
+                        "last_error": result.error,
+                    }
+                )
+            else:
+                summary.failed += 1
+                updates.append(
+                    {
+                        "id": row_id,
+                        "status": EmailOutboxStatus.FAILED,
+                        "last_error": result.error,
+                    }
+                )
+                if row.notification_log_id:
+                    failed_logs.append(row.notification_log_id)
+
+    async with AsyncSessionLocal() as db:
+        if updates:
+            await db.execute(update(EmailOutbox), updates)
+        for status, log_ids in (("sent", sent_logs), ("failed", failed_logs)):
+            if log_ids:
+                await db.execute(
+                    update(SessionNotificationLog)
+                    .where(SessionNotificationLog.id.in_(log_ids))
+                    .values(delivery_status=status)
+                )
+        await db.commit()
+
+
+async def deliver_outbox(
+    *,
+    limit: int = DRAIN_LIMIT,
+    batch_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    send_batch: Optional[SendBatchFn] = None,
+) -> DeliverySummary:
+    """Send every due outbox row (up to ``limit``) and record the outcomes."""
+    started = time.perf_counter()
+    batch_size = batch_size or settings.EMAIL_BATCH_SIZE
+    concurrency = concurrency or settings.EMAIL_SEND_CONCURRENCY
+    # A page keeps every sender slot busy for a few rounds between DB writes.
+    page = batch_size * concurrency * 4
+    summary = DeliverySummary()
+
+    while summary.claimed < limit:
+        rows = await _claim(min(page, limit - summary.claimed))
+        if not rows:
+            break
+        summary.claimed += len(rows)
+        outcomes = await send_batches(
+            _batches(rows, batch_size),
+            concurrency=concurrency,
+            send_batch=send_batch,
+        )
+        summary.provider_calls += len(outcomes)
+        await _record(outcomes, {r.id: r for r in rows}, summary)
+
+    summary.elapsed_s = time.perf_counter() - started
+    if summary.claimed:
+        logger.info(
+            "Email outbox: %d claimed, %d sent, %d retrying, %d failed "
+            "in %d provider calls, %.1fs (%.0f emails/min)",
+            summary.claimed,
+            summary.sent,
+            summary.retried,
+            summary.failed,
+            summary.provider_calls,
+            summary.elapsed_s,
+            summary.per_minute,
+        )
+    return summary
+
+
+async def request_delivery() -> None:
+    """Ask the worker to drain the outbox now.
+
+    The fixed job id collapses concurrent requests into one drain. Fails
+    silently — the per-minute cron delivers anything left behind.
+    """
+    global _redis_pool
+    try:
+        if _redis_pool is None:
+            _redis_pool = await create_pool(get_redis_settings())
+        await _redis_pool.enqueue_job(
+            "task_deliver_email_outbox",
+            _job_id="deliver_email_outbox",
+            _queue_name="arq:communications",
+        )
+    except Exception as e:
+        logger.warning("Failed to enqueue email outbox delivery: %s", e)
@@ -7,9 +7,12 @@ Handles:
 - Cancelling notifications when sessions are cancelled
 """
 
+import asyncio
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional
-from uuid import UUID
+from typing import Callable, Optional, Sequence
+from uuid import UUID, uuid4
 from zoneinfo import ZoneInfo
 
 from libs.common.config import get_settings
@@ -18,11 +21,15 @@ from libs.common.logging import get_logger
 from libs.common.service_client import (
     dispatch_notification,
     get_members_bulk,
+    get_session_attendee_ids_bulk,
     get_session_by_id,
+    get_session_coach_ids_bulk,
+    get_sessions_bulk,
     internal_get,
 )
+from libs.common.emails.core import EmailMessage
 from libs.db.session import get_async_db
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from services.communications_service.models import (
@@ -32,10 +39,15 @@ from services.communications_service.models import (
     SessionNotificationLog,
     SessionNotificationType,
 )
+from services.communications_service.services.email_outbox import (
+    deliver_outbox,
+    enqueue_emails,
+    request_delivery,
+)
 from services.communications_service.templates.session_notifications import (
-    send_session_announcement_email,
-    send_session_cancelled_email,
-    send_session_reminder_email,
+    render_session_announcement_email,
+    render_session_cancelled_email,
+    render_session_reminder_email,
 )
 
 logger = get_logger(__name__)
@@ -186,24 +198,19 @@ async def send_session_announcement(
                 return
             all_members = members_resp.json()
 
-            # Filter by notification preferences (our own table)
-            member_ids_with_prefs = {}
-            for m in all_members:
-                member_ids_with_prefs[m["id"]] = m
-
-            # Get notification preferences for these members
-            member_uuids = [UUID(m["id"]) for m in all_members]
+            # Get notification preferences (our own table, keyed by auth_id)
+            auth_ids = [m["auth_id"] for m in all_members if m.get("auth_id")]
             prefs_result = await db.execute(
                 select(NotificationPreferences).where(
-                    NotificationPreferences.member_id.in_(member_uuids)
+                    NotificationPreferences.member_auth_id.in_(auth_ids)
                 )
             )
-            prefs_map = {str(p.member_id): p for p in prefs_result.scalars().all()}
+            prefs_map = {p.member_auth_id: p for p in prefs_result.scalars().all()}
 
             # Filter members based on preferences
             eligible_members = []
             for m in all_members:
-                pref = prefs_map.get(m["id"])
+                pref = prefs_map.get(m.get("auth_id"))
                 # Default: subscribed (None means opted-in)
                 subscribed = True
                 if pref:
@@ -219,53 +226,27 @@ async def send_session_announcement(
             session_date = session_start.strftime("%A, %B %d, %Y")
             session_time = session_start.strftime("%I:%M %p")
 
-            sent_count = 0
-            for member in eligible_members:
-                # Check if already sent (prevent duplicates)
-                existing_log = await db.execute(
-                    select(SessionNotificationLog).where(
-                        SessionNotificationLog.session_id == session_id,
-                        SessionNotificationLog.member_id == UUID(member["id"]),
-                        SessionNotificationLog.notification_type
-                        == SessionNotificationType.SESSION_PUBLISHED,
-                    )
-                )
-                if existing_log.scalar_one_or_none():
-                    continue
-
-                try:
-                    success = await send_session_announcement_email(
-                        to_email=member["email"],
-                        member_name=member["first_name"],
-                        session_title=session["title"],
-                        session_type=session["session_type"],
-                        session_date=session_date,
-                        session_time=session_time,
-                        session_location=session.get("location_name")
-                        or session.get("location")
-                        or "TBD",
-                        session_address=session.get("location_address") or "",
-                        pool_fee=session.get("pool_fee") or 0,
-                        is_short_notice=is_short_notice,
-                        short_notice_message=short_notice_message,
-                    )
-
-                    if success:
-                        # Log the notification
-                        log_entry = SessionNotificationLog(
-                            session_id=session_id,
-                            member_id=UUID(member["id"]),
-                            notification_type=SessionNotificationType.SESSION_PUBLISHED,
-                            channel="email",
-                            delivery_status="sent",
-                        )
-                        db.add(log_entry)
-                        sent_count += 1
-
-                except Exception as e:
-                    logger.error(
-                        f"Failed to send announcement to {member['email']}: {e}"
-                    )
+            queued_count = await _queue_session_emails(
+                db,
+                session_id,
+                SessionNotificationType.SESSION_PUBLISHED,
+                eligible_members,
+                lambda member: render_session_announcement_email(
+                    to_email=member["email"],
+                    member_name=member["first_name"],
+                    session_title=session["title"],
+                    session_type=session["session_type"],
+                    session_date=session_date,
+                    session_time=session_time,
+                    session_location=session.get("location_name")
+                    or session.get("location")
+                    or "TBD",
+                    session_address=session.get("location_address") or "",
+                    pool_fee=session.get("pool_fee") or 0,
+                    is_short_notice=is_short_notice,
+                    short_notice_message=short_notice_message,
+                ),
+            )
 
             # Dispatch in-app notifications for all eligible members
             member_ids_for_notif = [m["id"] for m in eligible_members]
@@ -291,8 +272,9 @@ async def send_session_announcement(
 
             await db.commit()
             logger.info(
-                f"Sent session announcement to {sent_count} members for session {session_id}"
+                f"Queued session announcement for {queued_count} members for session {session_id}"
             )
+            await request_delivery()
 
         except Exception as e:
             logger.error(f"Error sending session announcement: {e}")
@@ -302,14 +284,45 @@ async def send_session_announcement(
             break
 
 
-async def process_pending_notifications() -> None:
+@dataclass
+class ReminderWaveSummary:
+    notifications: int = 0
+    sessions: int = 0
+    recipients: int = 0
+    queued: int = 0
+    sent: int = 0
+    cancelled: int = 0
+    failed: int = 0
+    fetch_s: float = 0.0
+    elapsed_s: float = 0.0
+
+
+@dataclass
+class _ReminderWave:
+    """Everything a tick's due notifications need, fetched once."""
+
+    sessions: dict[str, dict] = field(default_factory=dict)
+    coaches: dict[str, list[str]] = field(default_factory=dict)
+    attendees: dict[str, list[str]] = field(default_factory=dict)
+    members: dict[str, dict] = field(default_factory=dict)
+    # Keyed by auth id, like the preferences table
+    prefs: dict[str, NotificationPreferences] = field(default_factory=dict)
+
+
+async def process_pending_notifications() -> Optional[ReminderWaveSummary]:
     """
     Process all pending scheduled notifications that are due.
 
-    This is called periodically by the ARQ worker (every 5 minutes).
+    This is called periodically by the ARQ worker (every 5 minutes). The due
+    notifications form one wave: sessions, coaches, attendees, member details
+    and preferences are each fetched once for the whole wave, reminder emails
+    are queued in the outbox, and in-app reminders are dispatched with
+    bounded concurrency after the commit.
     """
+    settings = get_settings()
     async for db in get_async_db():
         try:
+            started = time.perf_counter()
             now = utc_now()
 
             # Find due notifications
@@ -320,53 +333,152 @@ async def process_pending_notifications() -> None:
                     ScheduledNotification.scheduled_for <= now,
                 )
                 .order_by(ScheduledNotification.scheduled_for.asc())
-                .limit(100)  # Process in batches
+                .limit(settings.REMINDER_WAVE_SIZE)
             )
             result = await db.execute(query)
             notifications = result.scalars().all()
 
             if not notifications:
-                return
+                return None
 
-            logger.info(f"Processing {len(notifications)} pending notifications")
+            summary = ReminderWaveSummary(notifications=len(notifications))
+            wave = await _load_reminder_wave(db, notifications)
+            summary.sessions = len(wave.sessions)
+            summary.fetch_s = time.perf_counter() - started
 
+            dispatches = []
             for notification in notifications:
                 try:
-                    await _process_single_notification(db, notification)
+                    dispatch = await _process_single_notification(
+                        db, notification, wave, summary
+                    )
+                    if dispatch:
+                        dispatches.append(dispatch)
                 except Exception as e:
                     logger.error(
                         f"Error processing notification {notification.id}: {e}"
                     )
                     notification.status = ScheduledNotificationStatus.FAILED
                     notification.error_message = str(e)
+                    summary.failed += 1
 
             await db.commit()
 
+            semaphore = asyncio.Semaphore(settings.REMINDER_DISPATCH_CONCURRENCY)
+
+            async def _dispatch(kwargs: dict) -> None:
+                async with semaphore:
+                    await dispatch_notification(
+                        **kwargs, calling_service="communications"
+                    )
+
+            await asyncio.gather(*(_dispatch(d) for d in dispatches))
+
+            summary.elapsed_s = time.perf_counter() - started
+            logger.info(
+                "Reminder wave: %d notifications over %d sessions, %d sent, "
+                "%d cancelled, %d failed; %d recipients, %d emails queued; "
+                "fetch %.2fs, total %.2fs",
+                summary.notifications,
+                summary.sessions,
+                summary.sent,
+                summary.cancelled,
+                summary.failed,
+                summary.recipients,
+                summary.queued,
+                summary.fetch_s,
+                summary.elapsed_s,
+            )
+            await deliver_outbox()
+            return summary
+
         except Exception as e:
             logger.error(f"Error in process_pending_notifications: {e}")
             await db.rollback()
         finally:
             await db.close()
             break
+    return None
+
+
+async def _load_reminder_wave(
+    db: AsyncSession, notifications: Sequence[ScheduledNotification]
+) -> _ReminderWave:
+    """Bulk-fetch session data, recipients and preferences for a wave."""
+    wave = _ReminderWave()
+    session_ids = sorted({str(n.session_id) for n in notifications})
+    wave.sessions = {
+        s["id"]: s
+        for s in await get_sessions_bulk(session_ids, calling_service="communications")
+    }
+
+    live = {
+        sid
+        for sid, s in wave.sessions.items()
+        if s["status"] not in ("cancelled", "completed")
+    }
+    # Attendees only matter for community sessions with a 24h/3h reminder due
+    need_attendees = {
+        str(n.session_id)
+        for n in notifications
+        if str(n.session_id) in live
+        and n.notification_type != SessionNotificationType.REMINDER_1H
+        and wave.sessions[str(n.session_id)].get("session_type") == "community"
+    }
+    wave.coaches, wave.attendees = await asyncio.gather(
+        get_session_coach_ids_bulk(sorted(live), calling_service="communications"),
+        get_session_attendee_ids_bulk(
+            sorted(need_attendees), calling_service="communications"
+        ),
+    )
+
+    member_ids = sorted(
+        {mid for ids in wave.coaches.values() for mid in ids}
+        | {mid for ids in wave.attendees.values() for mid in ids}
+    )
+    if not member_ids:
+        return wave
+    wave.members = {
+        m["id"]: m
+        for m in await get_members_bulk(member_ids, calling_service="communications")
+    }
+    auth_ids = sorted({m["auth_id"] for m in wave.members.values() if m.get("auth_id")})
+    if not auth_ids:
+        return wave
+    prefs_result = await db.execute(
+        select(NotificationPreferences).where(
+            NotificationPreferences.member_auth_id.in_(auth_ids)
+        )
+    )
+    wave.prefs = {p.member_auth_id: p for p in prefs_result.scalars().all()}
+    return wave
 
 
 async def _process_single_notification(
     db: AsyncSession,
     notification: ScheduledNotification,
-) -> None:
-    """Process a single scheduled notification."""
-    # Get session via sessions-service
-    session = await _get_session_data(notification.session_id)
+    wave: _ReminderWave,
+    summary: ReminderWaveSummary,
+) -> Optional[dict]:
+    """
+    Process one scheduled notification from a preloaded wave.
+
+    Queues its emails and returns the in-app dispatch to send once the wave
+    is committed (None when there is nothing to dispatch).
+    """
+    session = wave.sessions.get(str(notification.session_id))
     if not session:
         notification.status = ScheduledNotificationStatus.CANCELLED
         notification.error_message = "Session not found"
-        return
+        summary.cancelled += 1
+        return None
 
     # Skip if session is cancelled or completed
     if session["status"] in ["cancelled", "completed"]:
         notification.status = ScheduledNotificationStatus.CANCELLED
         notification.error_message = f"Session is {session['status']}"
-        return
+        summary.cancelled += 1
+        return None
 
     # Skip if session has already started (e.g. worker was down and is catching up)
     session_start = datetime.fromisoformat(session["starts_at"])
@@ -374,19 +486,24 @@ async def _process_single_notification(
     if session_start <= now:
         notification.status = ScheduledNotificationStatus.CANCELLED
         notification.error_message = "Session already started — reminder too late"
+        summary.cancelled += 1
         logger.warning(
             f"Skipping stale {notification.notification_type.value} for session "
             f"{notification.session_id} (started {session_start.isoformat()})"
         )
-        return
-
-    # Determine recipients based on notification type
-    if notification.notification_type == SessionNotificationType.REMINDER_1H:
-        # 1h reminders go only to coaches
-        members = await _get_session_coaches(session)
-    else:
-        # 24h and 3h reminders go to registered attendees and coaches
-        members = await _get_session_attendees_and_coaches(db, session)
+        return None
+
+    # 1h reminders go only to coaches; 24h and 3h reminders go to registered
+    # attendees and coaches
+    member_ids = list(wave.coaches.get(session["id"], []))
+    if notification.notification_type != SessionNotificationType.REMINDER_1H:
+        coach_id_set = set(member_ids)
+        member_ids += [
+            mid
+            for mid in wave.attendees.get(session["id"], [])
+            if mid not in coach_id_set
+        ]
+    members = [wave.members[mid] for mid in member_ids if mid in wave.members]
 
     reminder_type = notification.notification_type.value.replace("reminder_", "")
 
@@ -396,80 +513,60 @@ async def _process_single_notification(
     session_date = local_start.strftime("%A, %B %d, %Y")
     session_time = local_start.strftime("%I:%M %p")
 
-    sent_count = 0
-    for member in members:
-        # Check preferences
-        prefs = await _get_member_preferences(db, UUID(member["id"]))
-        if not _should_send_reminder(prefs, reminder_type):
-            continue
-
-        # Check if already sent
-        existing = await db.execute(
-            select(SessionNotificationLog).where(
-                SessionNotificationLog.session_id == notification.session_id,
-                SessionNotificationLog.member_id == UUID(member["id"]),
-                SessionNotificationLog.notification_type
-                == notification.notification_type,
-            )
-        )
-        if existing.scalar_one_or_none():
-            continue
-
-        try:
-            success = await send_session_reminder_email(
-                to_email=member["email"],
-                member_name=member["first_name"],
-                session_title=session["title"],
-                session_date=session_date,
-                session_time=session_time,
-                session_location=session.get("location_name")
-                or session.get("location")
-                or "TBD",
-                session_address=session.get("location_address") or "",
-                reminder_type=reminder_type,
-                pool_fee=session.get("pool_fee") or 0,
-            )
-
-            if success:
-                log_entry = SessionNotificationLog(
-                    session_id=notification.session_id,
-                    member_id=UUID(member["id"]),
-                    notification_type=notification.notification_type,
-                    channel="email",
-                    delivery_status="sent",
-                )
-                db.add(log_entry)
-                sent_count += 1
-
-        except Exception as e:
-            logger.error(f"Failed to send reminder to {member['email']}: {e}")
-
-    # Dispatch in-app notifications for reminders
-    reminder_member_ids = [m["id"] for m in members]
-    if reminder_member_ids:
-        reminder_labels = {"24h": "tomorrow", "3h": "in 3 hours", "1h": "in 1 hour"}
-        time_label = reminder_labels.get(reminder_type, f"in {reminder_type}")
-        await dispatch_notification(
-            type=f"session_reminder_{reminder_type}",
-            category="sessions",
-            member_ids=reminder_member_ids,
-            title=f"Reminder: {session['title']} {time_label}",
-            body=f"{session_date} at {session_time}",
-            action_url=f"/sessions/{session['id']}",
-            icon="clock",
-            metadata={
-                "session_id": str(notification.session_id),
-                "reminder_type": reminder_type,
-            },
-            calling_service="communications",
-        )
+    recipients = [
+        member
+        for member in members
+        if _should_send_reminder(wave.prefs.get(member.get("auth_id")), reminder_type)
+    ]
+
+    queued_count = await _queue_session_emails(
+        db,
+        notification.session_id,
+        notification.notification_type,
+        recipients,
+        lambda member: render_session_reminder_email(
+            to_email=member["email"],
+            member_name=member["first_name"],
+            session_title=session["title"],
+            session_date=session_date,
+            session_time=session_time,
+            session_location=session.get("location_name")
+            or session.get("location")
+            or "TBD",
+            session_address=session.get("location_address") or "",
+            reminder_type=reminder_type,
+            pool_fee=session.get("pool_fee") or 0,
+        ),
+    )
 
     notification.status = ScheduledNotificationStatus.SENT
     notification.sent_at = utc_now()
+    summary.sent += 1
+    summary.recipients += len(recipients)
+    summary.queued += queued_count
     logger.info(
-        f"Sent {notification.notification_type.value} to {sent_count} members for session {notification.session_id}"
+        f"Queued {notification.notification_type.value} for {queued_count} members for session {notification.session_id}"
     )
 
+    # In-app reminder, dispatched after the wave commits
+    if not members:
+        return None
+    reminder_labels = {"24h": "tomorrow", "3h": "in 3 hours", "1h": "in 1 hour"}
+    time_label = reminder_labels.get(reminder_type, f"in {reminder_type}")
+    return {
+        "type": f"session_reminder_{reminder_type}",
+        "category": "sessions",
+        "member_ids": [m["id"] for m in members],
+        "title": f"Reminder: {session['title']} {time_label}",
+        "body": f"{session_date} at {session_time}",
+        "action_url": f"/sessions/{session['id']}",
+        "icon": "clock",
+        "metadata": {
+            "session_id": str(notification.session_id),
+            "reminder_type": reminder_type,
+        },
+    }
+
 
 async def cancel_session_notifications(
     session_id: UUID,
@@ -515,33 +612,20 @@ async def cancel_session_notifications(
             session_date = local_start.strftime("%A, %B %d, %Y")
             session_time = local_start.strftime("%I:%M %p")
 
-            sent_count = 0
-            for member in members:
-                try:
-                    success = await send_session_cancelled_email(
-                        to_email=member["email"],
-                        member_name=member["first_name"],
-                        session_title=session["title"],
-                        session_date=session_date,
-                        session_time=session_time,
-                        cancellation_reason=cancellation_reason,
-                    )
-
-                    if success:
-                        log_entry = SessionNotificationLog(
-                            session_id=session_id,
-                            member_id=UUID(member["id"]),
-                            notification_type=SessionNotificationType.SESSION_CANCELLED,
-                            channel="email",
-                            delivery_status="sent",
-                        )
-                        db.add(log_entry)
-                        sent_count += 1
-
-                except Exception as e:
-                    logger.error(
-                        f"Failed to send cancellation to {member['email']}: {e}"
-                    )
+            queued_count = await _queue_session_emails(
+                db,
+                session_id,
+                SessionNotificationType.SESSION_CANCELLED,
+                members,
+                lambda member: render_session_cancelled_email(
+                    to_email=member["email"],
+                    member_name=member["first_name"],
+                    session_title=session["title"],
+                    session_date=session_date,
+                    session_time=session_time,
+                    cancellation_reason=cancellation_reason,
+                ),
+            )
 
             # Dispatch in-app notifications for cancellation
             cancel_member_ids = [m["id"] for m in members]
@@ -564,8 +648,9 @@ async def cancel_session_notifications(
 
             await db.commit()
             logger.info(
-                f"Sent cancellation notice to {sent_count} members for session {session_id}"
+                f"Queued cancellation notice for {queued_count} members for session {session_id}"
             )
+            await request_delivery()
 
         except Exception as e:
             logger.error(f"Error cancelling session notifications: {e}")
@@ -578,6 +663,77 @@ async def cancel_session_notifications(
 # ─── Helper functions ─────────────────────────────────────────────────
 
 
+async def _queue_session_emails(
+    db: AsyncSession,
+    session_id: UUID,
+    notification_type: SessionNotificationType,
+    members: list[dict],
+    render: Callable[[dict], EmailMessage],
+) -> int:
+    """
+    Queue one session email per member in the outbox, skipping members who
+    were already notified.
+
+    Dedupe is one lookup against the notification log plus the outbox's
+    unique dedupe key (which also covers a concurrent run). Log rows are
+    written as "queued" and flipped to "sent"/"failed" on delivery.
+    Returns how many emails were queued.
+    """
+    members = list({m["id"]: m for m in members if m.get("email")}.values())
+    if not members:
+        return 0
+
+    logged = await db.execute(
+        select(SessionNotificationLog.member_id).where(
+            SessionNotificationLog.session_id == session_id,
+            SessionNotificationLog.notification_type == notification_type,
+            SessionNotificationLog.member_id.in_([UUID(m["id"]) for m in members]),
+        )
+    )
+    already_sent = {str(member_id) for member_id in logged.scalars().all()}
+
+    rows, log_ids = [], {}
+    for member in members:
+        if member["id"] in already_sent:
+            continue
+        message = render(member)
+        dedupe_key = f"{notification_type.value}:{session_id}:{member['id']}"
+        log_ids[dedupe_key] = (uuid4(), member["id"])
+        rows.append(
+            {
+                "dedupe_key": dedupe_key,
+                "category": notification_type.value,
+                "to_email": message.to_email,
+                "subject": message.subject,
+                "body": message.body,
+                "html_body": message.html_body,
+                "notification_log_id": log_ids[dedupe_key][0],
+            }
+        )
+    if not rows:
+        return 0
+
+    queued = await enqueue_emails(db, rows)
+    if queued:
+        now = utc_now()
+        await db.execute(
+            insert(SessionNotificationLog),
+            [
+                {
+                    "id": log_ids[key][0],
+                    "session_id": session_id,
+                    "member_id": UUID(log_ids[key][1]),
+                    "notification_type": notification_type,
+                    "channel": "email",
+                    "sent_at": now,
+                    "delivery_status": "queued",
+                }
+                for key in queued
+            ],
+        )
+    return len(queued)
+
+
 async def _get_session_coaches(session: dict) -> list[dict]:
     """Get coach members for a session via sessions-service + members-service."""
     settings = get_settings()
@@ -640,18 +796,6 @@ async def _get_session_attendees_and_coaches(
     return all_members
 
 
-async def _get_member_preferences(
-    db: AsyncSession, member_id: UUID
-) -> Optional[NotificationPreferences]:
-    """Get notification preferences for a member."""
-    result = await db.execute(
-        select(NotificationPreferences).where(
-            NotificationPreferences.member_id == member_id
-        )
-    )
-    return result.scalar_one_or_none()
-
-
 def _should_send_reminder(
     prefs: Optional[NotificationPreferences], reminder_type: str
 ) -> bool:
@@ -741,18 +885,18 @@ async def send_weekly_session_digest() -> None:
                 return
             all_members = members_resp.json()
 
-            # Filter by weekly digest preference (our own table)
-            member_uuids = [UUID(m["id"]) for m in all_members]
+            # Filter by weekly digest preference (our own table, keyed by auth_id)
+            auth_ids = [m["auth_id"] for m in all_members if m.get("auth_id")]
             prefs_result = await db.execute(
                 select(NotificationPreferences).where(
-                    NotificationPreferences.member_id.in_(member_uuids)
+                    NotificationPreferences.member_auth_id.in_(auth_ids)
                 )
             )
-            prefs_map = {str(p.member_id): p for p in prefs_result.scalars().all()}
+            prefs_map = {p.member_auth_id: p for p in prefs_result.scalars().all()}
 
             eligible_members = []
             for m in all_members:
-                pref = prefs_map.get(m["id"])
+                pref = prefs_map.get(m.get("auth_id"))
                 # Default: opted-in (None means yes)
                 if pref and pref.weekly_session_digest is False:
                     continue
@@ -5,7 +5,7 @@ Templates for session announcements, reminders, and updates.
 """
 
 from libs.common.config import get_settings
-from libs.common.emails.core import send_email
+from libs.common.emails.core import EmailMessage, send_email
 from services.communications_service.templates.base import (
     GRADIENT_CYAN,
     GRADIENT_AMBER,
@@ -19,7 +19,7 @@ from services.communications_service.templates.base import (
 settings = get_settings()
 
 
-async def send_session_announcement_email(
+def render_session_announcement_email(
     to_email: str,
     member_name: str,
     session_title: str,
@@ -32,9 +32,9 @@ async def send_session_announcement_email(
     is_short_notice: bool = False,
     short_notice_message: str = "",
     currency: str = "NGN",
-) -> bool:
+) -> EmailMessage:
     """
-    Send session announcement email when a new session is published.
+    Render the session announcement email sent when a new session is published.
 
     Args:
         to_email: Recipient email address.
@@ -130,10 +130,10 @@ View session details and register on the SwimBuddz app.
         preheader=f"New {type_label.lower()} on {session_date}",
     )
 
-    return await send_email(to_email, subject, body, html_body)
+    return EmailMessage(to_email, subject, body, html_body)
 
 
-async def send_session_reminder_email(
+def render_session_reminder_email(
     to_email: str,
     member_name: str,
     session_title: str,
@@ -144,9 +144,9 @@ async def send_session_reminder_email(
     reminder_type: str = "24h",
     pool_fee: float = 0,
     currency: str = "NGN",
-) -> bool:
+) -> EmailMessage:
     """
-    Send session reminder email (24h, 3h, or 1h before).
+    Render the session reminder email (24h, 3h, or 1h before).
 
     Args:
         to_email: Recipient email address.
@@ -234,19 +234,19 @@ See you there! 🏊‍♂️
         preheader=f"Reminder: {session_title} - {title_suffix}",
     )
 
-    return await send_email(to_email, subject, body, html_body)
+    return EmailMessage(to_email, subject, body, html_body)
 
 
-async def send_session_cancelled_email(
+def render_session_cancelled_email(
     to_email: str,
     member_name: str,
     session_title: str,
     session_date: str,
     session_time: str,
     cancellation_reason: str = "",
-) -> bool:
+) -> EmailMessage:
     """
-    Send session cancellation notification.
+    Render the session cancellation notification.
 
     Args:
         to_email: Recipient email address.
@@ -311,7 +311,7 @@ We apologize for any inconvenience. Please check the app for other upcoming sess
         preheader=f"Session cancelled: {session_title}",
     )
 
-    return await send_email(to_email, subject, body, html_body)
+    return EmailMessage(to_email, subject, body, html_body)
 
 
 async def send_session_updated_email(
@@ -4,7 +4,7 @@ Schedules periodic tasks for session notifications via ARQ cron jobs backed by R
 Run with: arq services.communications_service.worker.WorkerSettings
 """
 
-from arq import cron
+from arq import cron, func
 from libs.common.arq_config import get_redis_settings
 from libs.common.logging import get_logger
 
@@ -54,6 +54,15 @@ async def task_send_daily_birthday_celebrations(ctx: dict):
     await send_daily_birthday_celebrations()
 
 
+async def task_deliver_email_outbox(ctx: dict):
+    """Send due emails from the outbox (new sends and backed-off retries)."""
+    from services.communications_service.services.email_outbox import (
+        deliver_outbox,
+    )
+
+    await deliver_outbox()
+
+
 # ── Worker configuration ──
 
 
@@ -70,9 +79,19 @@ class WorkerSettings:
         task_publish_scheduled_content,
         task_generate_content_images,
         task_send_daily_birthday_celebrations,
+        # No kept result, so the fixed job id used by request_delivery()
+        # frees up as soon as a drain finishes.
+        func(task_deliver_email_outbox, keep_result=0),
     ]
 
     cron_jobs = [
+        # Drain the email outbox every minute (retries and anything a
+        # request-time delivery kick missed)
+        cron(
+            task_deliver_email_outbox,
+            minute=set(range(60)),
+            run_at_startup=False,
+        ),
         # Process pending notifications every 5 minutes
         cron(
             task_process_pending_notifications,
@@ -164,6 +164,13 @@ class JournalLine(Base):
             "member_ref",
             postgresql_where=text("member_ref IS NOT NULL"),
         ),
+        # Settlement reconciliation joins PSP transactions on external_ref.
+        Index(
+            "ix_journal_lines_org_external_ref",
+            "org_id",
+            "external_ref",
+            postgresql_where=text("external_ref IS NOT NULL"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -62,6 +62,7 @@ from services.ledger_service.services.invoices import (
     void_invoice,
 )
 from services.ledger_service.services.reconciliation import reconciliation_report
+from services.ledger_service.services.report_cache import cached_report
 from services.ledger_service.services.reports import (
     balance_sheet,
     bubbles_liability,
@@ -159,8 +160,13 @@ async def get_trial_balance(
     as_of: Optional[date] = None,
 ) -> TrialBalanceReport:
     org_id = request.state.org_id
-    return await trial_balance(
-        session, org_id, as_of or utc_now().astimezone(timezone.utc).date()
+    as_of = as_of or utc_now().astimezone(timezone.utc).date()
+    return await cached_report(
+        session,
+        org_id,
+        "trial_balance",
+        (as_of,),
+        lambda: trial_balance(session, org_id, as_of),
     )
 
 
@@ -175,7 +181,13 @@ async def get_profit_loss(
 ) -> ProfitLossReport:
     org_id = request.state.org_id
     try:
-        return await profit_loss(session, org_id, from_date, to_date, group_by)
+        return await cached_report(
+            session,
+            org_id,
+            "profit_loss",
+            (from_date, to_date, group_by),
+            lambda: profit_loss(session, org_id, from_date, to_date, group_by),
+        )
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
@@ -217,8 +229,13 @@ async def get_balance_sheet(
 ) -> BalanceSheetReport:
     """Statement of financial position (A = L + E) as of a date (design §14)."""
     org_id = request.state.org_id
-    return await balance_sheet(
-        session, org_id, as_of or utc_now().astimezone(timezone.utc).date()
+    as_of = as_of or utc_now().astimezone(timezone.utc).date()
+    return await cached_report(
+        session,
+        org_id,
+        "balance_sheet",
+        (as_of,),
+        lambda: balance_sheet(session, org_id, as_of),
     )
 
 
@@ -231,8 +248,13 @@ async def get_cash_position(
 ) -> CashPositionReport:
     """Cash by location — settled in bank vs in-transit at the PSP (design §14)."""
     org_id = request.state.org_id
-    return await cash_position(
-        session, org_id, as_of or utc_now().astimezone(timezone.utc).date()
+    as_of = as_of or utc_now().astimezone(timezone.utc).date()
+    return await cached_report(
+        session,
+        org_id,
+        "cash_position",
+        (as_of,),
+        lambda: cash_position(session, org_id, as_of),
     )
 
 
@@ -245,8 +267,13 @@ async def get_bubbles_liability(
 ) -> BubblesLiabilityReport:
     """Outstanding Bubbles liability, purchased vs promotional (§19-B)."""
     org_id = request.state.org_id
-    return await bubbles_liability(
-        session, org_id, as_of or utc_now().astimezone(timezone.utc).date()
+    as_of = as_of or utc_now().astimezone(timezone.utc).date()
+    return await cached_report(
+        session,
+        org_id,
+        "bubbles_liability",
+        (as_of,),
+        lambda: bubbles_liability(session, org_id, as_of),
     )
 
 
@@ -260,7 +287,13 @@ async def get_margin(
 ) -> MarginReport:
     """Gross margin (revenue − COGS) per domain over a date range (design §14)."""
     org_id = request.state.org_id
-    return await margin_by_domain(session, org_id, from_date, to_date)
+    return await cached_report(
+        session,
+        org_id,
+        "margin",
+        (from_date, to_date),
+        lambda: margin_by_domain(session, org_id, from_date, to_date),
+    )
 
 
 # ---- Invoices (design §13) ----------------------------------------------------
@@ -11,6 +11,9 @@ from libs.auth.dependencies import require_service_role
 from libs.auth.models import AuthUser
 from services.ledger_service.app.deps import get_ledger_db
 from services.ledger_service.schemas.journal import (
+    JournalEntryBatch,
+    JournalEntryBatchItem,
+    JournalEntryBatchResult,
     JournalEntryCreate,
     JournalEntryResult,
 )
@@ -24,6 +27,7 @@ from services.ledger_service.services.posting import (
     PeriodClosedError,
     UnbalancedEntryError,
     UnresolvedAccountError,
+    post_entries_bulk,
     post_entry,
 )
 from services.ledger_service.services.reconciliation import (
@@ -73,6 +77,63 @@ async def post_journal_entry(
     return result
 
 
+@router.post(
+    "/journal-entries/batch",
+    response_model=JournalEntryBatchResult,
+    status_code=status.HTTP_200_OK,
+)
+async def post_journal_entries_batch(
+    payload: JournalEntryBatch,
+    request: Request,
+    _user: AuthUser = Depends(require_service_role),
+    session: AsyncSession = Depends(get_ledger_db),
+) -> JournalEntryBatchResult:
+    """Post many journal entries in one transaction (idempotent per entry).
+
+    Always 200 once the batch validates: each item carries its own result or
+    the error (and the status the single-entry route would have returned), so
+    one bad entry doesn't reject its neighbours. Service-role only.
+    """
+    org_id = request.state.org_id
+    outcomes = await post_entries_bulk(
+        session,
+        org_id=org_id,
+        payloads=payload.entries,
+        posted_by_service=request.headers.get("X-Caller-Service"),
+    )
+    await session.commit()
+
+    items: list[JournalEntryBatchItem] = []
+    posted = replayed = rejected = 0
+    for entry, outcome in zip(payload.entries, outcomes):
+        if isinstance(outcome, JournalEntryResult):
+            if outcome.idempotent_replay:
+                replayed += 1
+            else:
+                posted += 1
+            items.append(
+                JournalEntryBatchItem(
+                    idempotency_key=entry.idempotency_key, result=outcome
+                )
+            )
+            continue
+        rejected += 1
+        items.append(
+            JournalEntryBatchItem(
+                idempotency_key=entry.idempotency_key,
+                error=str(outcome),
+                error_status=(
+                    status.HTTP_409_CONFLICT
+                    if isinstance(outcome, PeriodClosedError)
+                    else status.HTTP_400_BAD_REQUEST
+                ),
+            )
+        )
+    return JournalEntryBatchResult(
+        items=items, posted=posted, replayed=replayed, rejected=rejected
+    )
+
+
 @router.post(
     "/external-transactions",
     response_model=ReconciliationIntakeResult,
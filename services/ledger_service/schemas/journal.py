@@ -79,3 +79,35 @@ class ReverseRequest(BaseModel):
     """Optional body for reversing an entry."""
 
     reason: Optional[str] = None
+
+
+class JournalEntryBatch(BaseModel):
+    """Many journal entries posted in one request (backfills, settlement runs).
+
+    Each entry is idempotent on its own key, exactly as on the single route.
+    """
+
+    entries: list[JournalEntryCreate] = Field(..., min_length=1, max_length=500)
+
+
+class JournalEntryBatchItem(BaseModel):
+    """Outcome for one entry of a batch, in request order.
+
+    ``error_status`` is the HTTP status the single-entry route would have
+    returned for this entry (400 bad ref, 409 closed period); ``result`` is
+    set when the entry posted or replayed.
+    """
+
+    idempotency_key: str
+    result: Optional[JournalEntryResult] = None
+    error: Optional[str] = None
+    error_status: Optional[int] = None
+
+
+class JournalEntryBatchResult(BaseModel):
+    """Returned by the batch posting route."""
+
+    items: list[JournalEntryBatchItem]
+    posted: int
+    replayed: int
+    rejected: int
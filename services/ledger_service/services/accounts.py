@@ -3,7 +3,8 @@
 `seed_chart_of_accounts` loads a vertical template (coa_templates/*.yaml) and
 creates the accounts for an org idempotently. `resolve_account_ids` maps the
 stable `maps_to` refs emitters use back to account ids (using the functional
-index from migration 298d02a91299).
+index from migration 298d02a91299); `resolve_account_refs` is the non-raising
+variant batch posting uses to reject only the entries with bad refs.
 """
 
 from __future__ import annotations
@@ -111,20 +112,19 @@ async def seed_chart_of_accounts(
     }
 
 
-async def resolve_account_ids(
+async def resolve_account_refs(
     session: AsyncSession, org_id: uuid.UUID, refs: Iterable[str]
-) -> dict[str, uuid.UUID]:
-    """Map account refs to ids for an org.
+) -> tuple[dict[str, uuid.UUID], list[str]]:
+    """Map account refs to ids for an org in one query; returns (resolved, missing).
 
     A ref is either a stable ``maps_to`` value (used by service emitters) or an
     account ``code`` (used by accountants posting manual entries — they think in
     codes, and many postable accounts have no maps_to). maps_to wins if a value
-    matches both. Raises ValueError listing any refs that don't resolve to an
-    active account — surfacing a mismatch loudly instead of silently mis-posting.
+    matches both. Only active accounts resolve.
     """
     wanted = list(dict.fromkeys(refs))  # dedupe, preserve order
     if not wanted:
-        return {}
+        return {}, []
     maps_to = ChartOfAccounts.account_metadata["maps_to"].astext
     rows = (
         await session.execute(
@@ -150,6 +150,18 @@ async def resolve_account_ids(
             resolved[ref] = by_code[ref]
         else:
             missing.append(ref)
+    return resolved, missing
+
+
+async def resolve_account_ids(
+    session: AsyncSession, org_id: uuid.UUID, refs: Iterable[str]
+) -> dict[str, uuid.UUID]:
+    """Map account refs to ids for an org (see ``resolve_account_refs``).
+
+    Raises ValueError listing any refs that don't resolve to an active account —
+    surfacing a mismatch loudly instead of silently mis-posting.
+    """
+    resolved, missing = await resolve_account_refs(session, org_id, refs)
     if missing:
         raise ValueError(f"unresolved account refs for org {org_id}: {missing}")
     return resolved
@@ -27,11 +27,21 @@ async def recompute_account_balances(
     period_id: uuid.UUID,
     account_ids: Iterable[uuid.UUID],
 ) -> None:
-    """Recompute (org, account, period) balance rows for the given accounts."""
-    for account_id in set(account_ids):
-        debits, credits, currency = (
+    """Recompute (org, account, period) balance rows for the given accounts.
+
+    One grouped aggregate over the period's lines and one load of the existing
+    balance rows, however many accounts are affected — so a batch post
+    recomputes each touched account exactly once.
+    """
+    wanted = set(account_ids)
+    if not wanted:
+        return
+    totals = {
+        account_id: (debits, credits, currency)
+        for account_id, debits, credits, currency in (
             await session.execute(
                 select(
+                    JournalLine.account_id,
                     func.coalesce(func.sum(JournalLine.debit_minor), 0),
                     func.coalesce(func.sum(JournalLine.credit_minor), 0),
                     func.min(JournalLine.currency),
@@ -40,14 +50,32 @@ async def recompute_account_balances(
                 .join(JournalEntry, JournalLine.entry_id == JournalEntry.id)
                 .where(
                     JournalLine.org_id == org_id,
-                    JournalLine.account_id == account_id,
+                    JournalLine.account_id.in_(wanted),
                     JournalEntry.period_id == period_id,
                 )
+                .group_by(JournalLine.account_id)
             )
-        ).one()
-        currency = currency or "NGN"
+        ).all()
+    }
+    existing = {
+        bal.account_id: bal
+        for bal in (
+            await session.execute(
+                select(AccountBalance).where(
+                    AccountBalance.org_id == org_id,
+                    AccountBalance.period_id == period_id,
+                    AccountBalance.account_id.in_(wanted),
+                )
+            )
+        )
+        .scalars()
+        .all()
+    }
 
-        bal = await session.get(AccountBalance, (org_id, account_id, period_id))
+    for account_id in wanted:
+        debits, credits, currency = totals.get(account_id, (0, 0, None))
+        currency = currency or "NGN"
+        bal = existing.get(account_id)
         opening = bal.opening_minor if bal is not None else 0
         closing = opening + debits - credits
         if bal is None:
@@ -6,6 +6,11 @@ that its period is open, resolves account refs to ids, writes the entry + lines,
 recomputes affected balances, and audit-logs the post — all within the caller's
 transaction (the route commits). Entries are immutable; corrections are
 reversing entries (PR-3).
+
+`post_entries_bulk` applies the same rules to a whole batch with set-based SQL
+(one idempotency lookup, one account resolution, multi-row inserts, one balance
+recompute per touched period) and reports a per-entry outcome instead of
+raising, so one bad entry doesn't sink the batch.
 """
 
 from __future__ import annotations
@@ -30,10 +35,18 @@ from services.ledger_service.schemas.journal import (
     JournalEntryCreate,
     JournalEntryResult,
 )
-from services.ledger_service.services.accounts import resolve_account_ids
+from services.ledger_service.services.accounts import (
+    resolve_account_ids,
+    resolve_account_refs,
+)
 from services.ledger_service.services.balances import recompute_account_balances
-from services.ledger_service.services.periods import resolve_or_create_period
+from services.ledger_service.services.periods import (
+    month_bounds,
+    resolve_or_create_period,
+)
+from services.ledger_service.services.report_cache import invalidate_reports
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -75,6 +88,36 @@ async def _get_by_idempotency(
     ).scalar_one_or_none()
 
 
+async def _get_many_by_idempotency(
+    session: AsyncSession, org_id: uuid.UUID, keys: list[str]
+) -> dict[str, JournalEntryResult]:
+    """Replay results for every key that already has an entry (one query)."""
+    if not keys:
+        return {}
+    rows = (
+        await session.execute(
+            select(
+                JournalEntry.idempotency_key,
+                JournalEntry.id,
+                JournalEntry.status,
+                JournalEntry.period_id,
+            ).where(
+                JournalEntry.org_id == org_id,
+                JournalEntry.idempotency_key.in_(keys),
+            )
+        )
+    ).all()
+    return {
+        key: JournalEntryResult(
+            entry_id=entry_id,
+            status=status.value,
+            period_id=period_id,
+            idempotent_replay=True,
+        )
+        for key, entry_id, status, period_id in rows
+    }
+
+
 def _result(entry: JournalEntry, *, replay: bool) -> JournalEntryResult:
     return JournalEntryResult(
         entry_id=entry.id,
@@ -203,6 +246,7 @@ async def post_entry(
     await recompute_account_balances(
         session, org_id, period.id, list(account_map.values())
     )
+    invalidate_reports(org_id)
 
     # 8. Audit.
     session.add(
@@ -233,6 +277,249 @@ async def post_entry(
     return _result(entry, replay=False)
 
 
+# Rows per multi-row INSERT — keeps journal_entries (14 cols) well under the
+# 65535 bind-parameter limit.
+_INSERT_CHUNK = 1000
+
+
+async def post_entries_bulk(
+    session: AsyncSession,
+    *,
+    org_id: uuid.UUID,
+    payloads: list[JournalEntryCreate],
+    posted_by_service: Optional[str] = None,
+) -> list[JournalEntryResult | LedgerError]:
+    """Post many emitter entries at once. Returns one outcome per payload, in order.
+
+    Each entry follows `post_entry`'s rules (idempotent replay, balanced, refs
+    resolve, period accepts emitter posts — batches are never adjustments). A
+    rejected entry's outcome is the LedgerError it would have raised; accepted
+    entries are written in the caller's transaction. A key repeated within the
+    batch replays its first occurrence. Concurrent inserts of the same key are
+    absorbed by ON CONFLICT DO NOTHING and reported as replays.
+    """
+    outcomes: list[JournalEntryResult | LedgerError | None] = [None] * len(payloads)
+
+    # 1. Idempotency — one lookup for the whole batch.
+    keys = list(dict.fromkeys(p.idempotency_key for p in payloads))
+    replays = await _get_many_by_idempotency(session, org_id, keys)
+
+    # 2. Account refs, periods, base currency, cost centers — each loaded once.
+    account_map, _missing = await resolve_account_refs(
+        session, org_id, [line.account_ref for p in payloads for line in p.lines]
+    )
+    periods = {}
+    for p in payloads:
+        name = month_bounds(p.entry_date)[0]
+        if p.idempotency_key not in replays and name not in periods:
+            periods[name] = await resolve_or_create_period(
+                session, org_id, p.entry_date
+            )
+    org = await session.get(Organization, org_id)
+    base_currency = org.base_currency if org is not None else "NGN"
+    cc_codes = {
+        line.cost_center for p in payloads for line in p.lines if line.cost_center
+    }
+    cc_map: dict[str, uuid.UUID] = {}
+    if cc_codes:
+        cc_map = {
+            code: cid
+            for code, cid in (
+                await session.execute(
+                    select(CostCenter.code, CostCenter.id).where(
+                        CostCenter.org_id == org_id,
+                        CostCenter.code.in_(cc_codes),
+                    )
+                )
+            ).all()
+        }
+
+    # 3. Validate each entry and build its rows.
+    now = utc_now()
+    first_index: dict[str, int] = {}
+    pending: dict[str, tuple[int, dict, list[dict]]] = {}
+    for i, payload in enumerate(payloads):
+        key = payload.idempotency_key
+        if key in replays:
+            outcomes[i] = replays[key]
+            continue
+        if key in first_index:
+            continue  # filled from the first occurrence below
+        first_index[key] = i
+
+        total_debit = sum(line.debit for line in payload.lines)
+        total_credit = sum(line.credit for line in payload.lines)
+        unresolved = [
+            line.account_ref
+            for line in payload.lines
+            if line.account_ref not in account_map
+        ]
+        period = periods[month_bounds(payload.entry_date)[0]]
+        if total_debit != total_credit:
+            outcomes[i] = UnbalancedEntryError(
+                f"debits {total_debit} != credits {total_credit}"
+            )
+            continue
+        if unresolved:
+            outcomes[i] = UnresolvedAccountError(
+                f"unresolved account refs for org {org_id}: {unresolved}"
+            )
+            continue
+        if period.status == PeriodStatus.HARD_CLOSED:
+            outcomes[i] = PeriodClosedError(
+                f"period {period.period_name} is hard-closed"
+            )
+            continue
+        if period.status == PeriodStatus.SOFT_CLOSED:
+            outcomes[i] = PeriodClosedError(
+                f"period {period.period_name} is soft-closed — only adjusting entries allowed"
+            )
+            continue
+
+        entry_id = uuid.uuid4()
+        entry_row = {
+            "id": entry_id,
+            "org_id": org_id,
+            "entry_date": payload.entry_date,
+            "posting_date": now,
+            "description": payload.description,
+            "source_service": payload.source_service,
+            "source_type": payload.source_type,
+            "source_id": payload.source_id,
+            "idempotency_key": key,
+            "status": EntryStatus.POSTED,
+            "period_id": period.id,
+            "posted_by_service": posted_by_service or payload.source_service,
+            "entry_metadata": payload.metadata,
+            "created_at": now,
+            "posted_at": now,
+        }
+        line_rows = [
+            {
+                "id": uuid.uuid4(),
+                "org_id": org_id,
+                "entry_id": entry_id,
+                "account_id": account_map[line.account_ref],
+                "debit_minor": line.debit,
+                "credit_minor": line.credit,
+                "currency": (line.currency or base_currency).upper(),
+                "base_debit_minor": line.debit,
+                "base_credit_minor": line.credit,
+                "cost_center_id": (
+                    cc_map.get(line.cost_center) if line.cost_center else None
+                ),
+                "dimension_1": line.dimension_1,
+                "dimension_2": line.dimension_2,
+                "member_ref": line.member_ref,
+                "external_ref": line.external_ref,
+                "description": line.description,
+            }
+            for line in payload.lines
+        ]
+        pending[key] = (i, entry_row, line_rows)
+
+    # 4. Insert entries; a key a concurrent post won is skipped, not an error.
+    inserted: set[str] = set()
+    entry_rows = [entry_row for _, entry_row, _ in pending.values()]
+    for start in range(0, len(entry_rows), _INSERT_CHUNK):
+        inserted.update(
+            (
+                await session.execute(
+                    pg_insert(JournalEntry)
+                    .values(entry_rows[start : start + _INSERT_CHUNK])
+                    .on_conflict_do_nothing(constraint="uq_journal_entries_org_idem")
+                    .returning(JournalEntry.idempotency_key)
+                )
+            )
+            .scalars()
+            .all()
+        )
+    lost = [key for key in pending if key not in inserted]
+    raced = await _get_many_by_idempotency(session, org_id, lost)
+    for key in lost:
+        outcomes[pending.pop(key)[0]] = raced[key]
+
+    line_rows = [row for _, _, rows in pending.values() for row in rows]
+    for start in range(0, len(line_rows), _INSERT_CHUNK):
+        await session.execute(
+            pg_insert(JournalLine).values(line_rows[start : start + _INSERT_CHUNK])
+        )
+
+    # 5. Recompute each touched (period, account) once, then audit.
+    touched: dict[uuid.UUID, set[uuid.UUID]] = {}
+    for _, entry_row, rows in pending.values():
+        touched.setdefault(entry_row["period_id"], set()).update(
+            row["account_id"] for row in rows
+        )
+    for period_id, account_ids in touched.items():
+        await recompute_account_balances(session, org_id, period_id, account_ids)
+    if pending:
+        invalidate_reports(org_id)
+
+    for key, (i, entry_row, _) in pending.items():
+        payload = payloads[i]
+        session.add(
+            AuditLog(
+                org_id=org_id,
+                actor_service=entry_row["posted_by_service"],
+                action=AuditActionType.ENTRY_POSTED,
+                subject_type="journal_entry",
+                subject_id=str(entry_row["id"]),
+                payload={
+                    "source": f"{payload.source_service}:{payload.source_type}:{payload.source_id}",
+                    "idempotency_key": key,
+                    "batch": True,
+                },
+            )
+        )
+        outcomes[i] = JournalEntryResult(
+            entry_id=entry_row["id"],
+            status=EntryStatus.POSTED.value,
+            period_id=entry_row["period_id"],
+            idempotent_replay=False,
+        )
+    await session.flush()
+
+    # 6. Recognition schedules for entries carrying a deferred-revenue credit.
+    from services.ledger_service.services.recognition import (
+        RECOGNITION_POLICY,
+        ensure_schedules_for_entry,
+    )
+
+    deferred = {
+        entry_row["id"]: payloads[i]
+        for i, entry_row, _ in pending.values()
+        if any(
+            line.credit > 0 and line.account_ref in RECOGNITION_POLICY
+            for line in payloads[i].lines
+        )
+    }
+    if deferred:
+        entries = (
+            (
+                await session.execute(
+                    select(JournalEntry).where(JournalEntry.id.in_(deferred))
+                )
+            )
+            .scalars()
+            .all()
+        )
+        for entry in entries:
+            await ensure_schedules_for_entry(session, org_id, entry, deferred[entry.id])
+
+    # In-batch duplicates mirror their first occurrence.
+    for i, payload in enumerate(payloads):
+        if outcomes[i] is not None:
+            continue
+        first = outcomes[first_index[payload.idempotency_key]]
+        outcomes[i] = (
+            first.model_copy(update={"idempotent_replay": True})
+            if isinstance(first, JournalEntryResult)
+            else first
+        )
+    return outcomes  # type: ignore[return-value]
+
+
 async def reverse_entry(
     session: AsyncSession,
     *,
@@ -330,6 +617,7 @@ async def reverse_entry(
     await recompute_account_balances(session, org_id, period.id, affected)
     if original.period_id != period.id:
         await recompute_account_balances(session, org_id, original.period_id, affected)
+    invalidate_reports(org_id)
 
     session.add(
         AuditLog(
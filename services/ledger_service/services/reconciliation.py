@@ -16,6 +16,8 @@ a break once the missing entry appears.
 
 from __future__ import annotations
 
+import uuid
+from collections import defaultdict
 from typing import Optional
 
 from libs.common.datetime_utils import utc_now
@@ -28,157 +30,255 @@ from services.ledger_service.schemas.reconciliation import (
     ReconciliationBreakOut,
     ReconciliationReport,
 )
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
-async def _open_break(
-    session: AsyncSession,
-    org_id,
-    break_type: str,
-    txn: ExternalTransaction,
-    *,
-    expected: Optional[int],
-    detail: str,
-) -> bool:
-    """Upsert an open break for this (org, type, ref). Returns True if newly opened."""
-    existing = (
-        await session.execute(
-            select(ReconciliationBreak).where(
-                ReconciliationBreak.org_id == org_id,
-                ReconciliationBreak.break_type == break_type,
-                ReconciliationBreak.external_ref == txn.external_ref,
-            )
-        )
-    ).scalar_one_or_none()
-    if existing is not None:
-        # Refresh the live numbers; reopen if it had been resolved but recurs.
-        existing.actual_minor = txn.amount_minor
-        existing.expected_minor = expected
-        existing.external_txn_id = txn.external_txn_id
-        existing.settlement_ref = txn.settlement_ref
-        existing.detail = detail
-        if existing.status != "open":
-            existing.status = "open"
-            existing.resolved_at = None
-            existing.resolved_by = None
-            return True
-        return False
-    session.add(
-        ReconciliationBreak(
-            org_id=org_id,
-            break_type=break_type,
-            psp=txn.psp,
-            external_ref=txn.external_ref,
-            external_txn_id=txn.external_txn_id,
-            settlement_ref=txn.settlement_ref,
+# Keeps IN lists and multi-row VALUES well under Postgres' bind-parameter cap.
+_CHUNK = 1000
+
+_NO_REF_DETAIL = "Settlement transaction carries no reference to match."
+_NOT_BOOKED_DETAIL = (
+    "Settled at the PSP but no journal entry carries this reference "
+    "(money in, not booked)."
+)
+
+
+def _chunks(items: list, size: int = _CHUNK):
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+class _BreakBook:
+    """In-memory view of the breaks an intake batch touches.
+
+    Loaded once for every ref in the batch, mutated while matching (in request
+    order, so a break opened and then resolved within one batch ends resolved,
+    exactly as the row-at-a-time flow behaved), then written back in bulk.
+    """
+
+    def __init__(self, org_id, rows: list) -> None:
+        self.org_id = org_id
+        self.by_key: dict[tuple[str, Optional[str]], dict] = {}
+        self.by_ref: dict[Optional[str], list[dict]] = defaultdict(list)
+        self.new: list[dict] = []
+        self.new_ids: set[uuid.UUID] = set()
+        self.dirty: dict[uuid.UUID, dict] = {}
+        for row in rows:
+            b = dict(row._mapping)
+            self.by_key[(b["break_type"], b["external_ref"])] = b
+            self.by_ref[b["external_ref"]].append(b)
+
+    def open(
+        self, break_type: str, txn: dict, *, expected: Optional[int], detail: str
+    ) -> bool:
+        """Upsert an open break for (type, ref). Returns True if newly opened."""
+        key = (break_type, txn["external_ref"])
+        b = self.by_key.get(key)
+        if b is None:
+            b = {
+                "id": uuid.uuid4(),
+                "org_id": self.org_id,
+                "break_type": break_type,
+                "psp": txn["psp"],
+                "external_ref": txn["external_ref"],
+                "currency": txn["currency"] or "NGN",
+                "status": "open",
+                "resolved_at": None,
+                "resolved_by": None,
+            }
+            self.by_key[key] = b
+            self.by_ref[b["external_ref"]].append(b)
+            self.new.append(b)
+            self.new_ids.add(b["id"])
+            opened = True
+        else:
+            # Refresh the live numbers; reopen if it had been resolved but recurs.
+            opened = b["status"] != "open"
+            if opened:
+                b.update(status="open", resolved_at=None, resolved_by=None)
+            if b["id"] not in self.new_ids:
+                self.dirty.setdefault(b["id"], b)
+        b.update(
+            actual_minor=txn["amount_minor"],
             expected_minor=expected,
-            actual_minor=txn.amount_minor,
-            currency=txn.currency or "NGN",
-            status="open",
+            external_txn_id=txn["external_txn_id"],
+            settlement_ref=txn["settlement_ref"],
             detail=detail,
         )
-    )
-    return True
+        return opened
 
+    def resolve(self, external_ref: Optional[str], when) -> None:
+        """Resolve any open breaks for this ref (the entry has now appeared/ties out)."""
+        if not external_ref:
+            return
+        for b in self.by_ref.get(external_ref, ()):
+            if b["status"] == "open":
+                b.update(status="resolved", resolved_at=when, resolved_by="auto-match")
+                if b["id"] not in self.new_ids:
+                    self.dirty.setdefault(b["id"], b)
 
-async def _resolve_breaks(session: AsyncSession, org_id, external_ref: str) -> None:
-    """Resolve any open breaks for this ref (the entry has now appeared/ties out)."""
-    if not external_ref:
-        return
-    open_breaks = (
-        (
+    async def flush(self, session: AsyncSession, when) -> None:
+        for chunk in _chunks(self.new):
             await session.execute(
-                select(ReconciliationBreak).where(
-                    ReconciliationBreak.org_id == org_id,
-                    ReconciliationBreak.external_ref == external_ref,
-                    ReconciliationBreak.status == "open",
-                )
+                insert(ReconciliationBreak),
+                [{**b, "created_at": when, "updated_at": when} for b in chunk],
             )
-        )
-        .scalars()
-        .all()
-    )
-    for b in open_breaks:
-        b.status = "resolved"
-        b.resolved_at = utc_now()
-        b.resolved_by = "auto-match"
-
-
-async def _match_one(
-    session: AsyncSession, org_id, txn: ExternalTransaction
-) -> tuple[str, bool]:
-    """Match one external txn against the books. Returns (match_status, break_opened)."""
-    if not txn.external_ref:
-        txn.match_status = "unmatched"
-        opened = await _open_break(
-            session,
-            org_id,
-            "unmatched_settlement",
-            txn,
-            expected=None,
-            detail="Settlement transaction carries no reference to match.",
-        )
-        return "unmatched", opened
-
-    lines = (
-        await session.execute(
-            select(
-                JournalLine.entry_id,
-                JournalLine.debit_minor,
-                JournalLine.credit_minor,
-            ).where(
-                JournalLine.org_id == org_id,
-                JournalLine.external_ref == txn.external_ref,
+        if self.dirty:
+            # ORM bulk UPDATE by primary key — one executemany for every change.
+            await session.execute(
+                update(ReconciliationBreak),
+                [
+                    {
+                        "id": b["id"],
+                        "actual_minor": b["actual_minor"],
+                        "expected_minor": b["expected_minor"],
+                        "external_txn_id": b["external_txn_id"],
+                        "settlement_ref": b["settlement_ref"],
+                        "detail": b["detail"],
+                        "status": b["status"],
+                        "resolved_at": b["resolved_at"],
+                        "resolved_by": b["resolved_by"],
+                        "updated_at": when,
+                    }
+                    for b in self.dirty.values()
+                ],
             )
+
+
+def _match(txn: dict, lines: list, breaks: _BreakBook, when) -> tuple[str, bool]:
+    """Match one staged txn against its ref's journal lines.
+
+    Returns (match_status, break_opened); mutates ``txn`` and ``breaks``.
+    """
+    if not txn["external_ref"]:
+        txn["match_status"] = "unmatched"
+        opened = breaks.open(
+            "unmatched_settlement", txn, expected=None, detail=_NO_REF_DETAIL
         )
-    ).all()
+        return "unmatched", opened
 
     if not lines:
-        txn.match_status = "unmatched"
-        opened = await _open_break(
-            session,
-            org_id,
-            "unmatched_settlement",
-            txn,
-            expected=None,
-            detail=(
-                "Settled at the PSP but no journal entry carries this reference "
-                "(money in, not booked)."
-            ),
+        txn["match_status"] = "unmatched"
+        opened = breaks.open(
+            "unmatched_settlement", txn, expected=None, detail=_NOT_BOOKED_DETAIL
         )
         return "unmatched", opened
 
     # gross-in-books = the largest debit line for this ref (the clearing/bank side
     # of the cash-in entry). Prefer the entry whose debit equals the txn amount.
+    amount = txn["amount_minor"]
     gross = max((line.debit_minor for line in lines), default=0)
-    matched_entry = next(
-        (line.entry_id for line in lines if line.debit_minor == txn.amount_minor),
+    txn["matched_entry_id"] = next(
+        (line.entry_id for line in lines if line.debit_minor == amount),
         lines[0].entry_id,
     )
-    txn.matched_entry_id = matched_entry
 
-    amount_ok = any(
-        line.debit_minor == txn.amount_minor or line.credit_minor == txn.amount_minor
-        for line in lines
-    )
-    if amount_ok:
-        txn.match_status = "matched"
-        await _resolve_breaks(session, org_id, txn.external_ref)
+    if any(line.debit_minor == amount or line.credit_minor == amount for line in lines):
+        txn["match_status"] = "matched"
+        breaks.resolve(txn["external_ref"], when)
         return "matched", False
 
-    txn.match_status = "amount_mismatch"
-    opened = await _open_break(
-        session,
-        org_id,
+    txn["match_status"] = "amount_mismatch"
+    opened = breaks.open(
         "amount_mismatch",
         txn,
         expected=gross,
-        detail=f"PSP amount {txn.amount_minor} != booked gross {gross}.",
+        detail=f"PSP amount {amount} != booked gross {gross}.",
     )
     return "amount_mismatch", opened
 
 
+async def _load_existing_txns(
+    session: AsyncSession, org_id, keys: list[tuple[str, str]]
+) -> dict[tuple[str, str], dict]:
+    cols = (
+        ExternalTransaction.id,
+        ExternalTransaction.psp,
+        ExternalTransaction.external_txn_id,
+        ExternalTransaction.external_ref,
+        ExternalTransaction.settlement_ref,
+        ExternalTransaction.amount_minor,
+        ExternalTransaction.fee_minor,
+        ExternalTransaction.currency,
+        ExternalTransaction.status,
+        ExternalTransaction.matched_entry_id,
+    )
+    found: dict[tuple[str, str], dict] = {}
+    for chunk in _chunks(keys):
+        rows = await session.execute(
+            select(*cols).where(
+                ExternalTransaction.org_id == org_id,
+                tuple_(
+                    ExternalTransaction.psp, ExternalTransaction.external_txn_id
+                ).in_(chunk),
+            )
+        )
+        for row in rows:
+            found[(row.psp, row.external_txn_id)] = dict(row._mapping)
+    return found
+
+
+async def _load_lines_by_ref(
+    session: AsyncSession, org_id, refs: list[str]
+) -> dict[str, list]:
+    """Every journal line carrying one of ``refs``, grouped by ref."""
+    by_ref: dict[str, list] = defaultdict(list)
+    for chunk in _chunks(refs):
+        rows = await session.execute(
+            select(
+                JournalLine.external_ref,
+                JournalLine.entry_id,
+                JournalLine.debit_minor,
+                JournalLine.credit_minor,
+            ).where(
+                JournalLine.org_id == org_id,
+                JournalLine.external_ref.in_(chunk),
+            )
+        )
+        for row in rows:
+            by_ref[row.external_ref].append(row)
+    return by_ref
+
+
+async def _load_breaks(
+    session: AsyncSession, org_id, refs: list[str], include_null_ref: bool
+) -> list:
+    cols = (
+        ReconciliationBreak.id,
+        ReconciliationBreak.break_type,
+        ReconciliationBreak.external_ref,
+        ReconciliationBreak.external_txn_id,
+        ReconciliationBreak.settlement_ref,
+        ReconciliationBreak.expected_minor,
+        ReconciliationBreak.actual_minor,
+        ReconciliationBreak.detail,
+        ReconciliationBreak.status,
+        ReconciliationBreak.resolved_at,
+        ReconciliationBreak.resolved_by,
+    )
+    rows: list = []
+    for chunk in _chunks(refs):
+        rows.extend(
+            await session.execute(
+                select(*cols).where(
+                    ReconciliationBreak.org_id == org_id,
+                    ReconciliationBreak.external_ref.in_(chunk),
+                )
+            )
+        )
+    if include_null_ref:
+        rows.extend(
+            await session.execute(
+                select(*cols).where(
+                    ReconciliationBreak.org_id == org_id,
+                    ReconciliationBreak.external_ref.is_(None),
+                )
+            )
+        )
+    return rows
+
+
 async def intake_external_transactions(
     session: AsyncSession, org_id, transactions: list
 ) -> dict:
@@ -186,6 +286,12 @@ async def intake_external_transactions(
 
     ``transactions`` is a list of ExternalTransactionIn (Pydantic). Idempotent
     per (org, psp, external_txn_id). The caller commits.
+
+    Set-based: the batch is staged in memory, existing transactions, journal
+    lines (joined by ``external_ref``) and breaks are each loaded in one pass,
+    and everything is written back with multi-row inserts and a bulk update —
+    a fixed number of round trips per 1k transactions instead of ~5 per item.
+    Outcomes match processing the items one at a time, in request order.
     """
     summary = {
         "received": len(transactions),
@@ -193,47 +299,91 @@ async def intake_external_transactions(
         "matched": 0,
         "breaks_opened": 0,
     }
-    for t in transactions:
-        row = (
-            await session.execute(
-                select(ExternalTransaction).where(
-                    ExternalTransaction.org_id == org_id,
-                    ExternalTransaction.psp == t.psp,
-                    ExternalTransaction.external_txn_id == t.external_txn_id,
-                )
-            )
-        ).scalar_one_or_none()
+    if not transactions:
+        return summary
+
+    keys = list(dict.fromkeys((t.psp, t.external_txn_id) for t in transactions))
+    existing = await _load_existing_txns(session, org_id, keys)
 
+    refs = list({t.external_ref for t in transactions if t.external_ref})
+    lines_by_ref = await _load_lines_by_ref(session, org_id, refs)
+    # Ref-less breaks key on "" or NULL, whichever the PSP sent — load those too.
+    break_refs = list({t.external_ref for t in transactions} - {None})
+    breaks = _BreakBook(
+        org_id,
+        await _load_breaks(
+            session,
+            org_id,
+            break_refs,
+            include_null_ref=any(t.external_ref is None for t in transactions),
+        ),
+    )
+
+    now = utc_now()
+    staged: dict[tuple[str, str], dict] = {}
+    for t in transactions:
+        key = (t.psp, t.external_txn_id)
+        row = staged.get(key) or existing.get(key)
         if row is None:
-            row = ExternalTransaction(
-                org_id=org_id,
-                psp=t.psp,
-                external_txn_id=t.external_txn_id,
-                external_ref=t.external_ref,
-                settlement_ref=t.settlement_ref,
-                amount_minor=int(t.amount_minor or 0),
-                fee_minor=int(t.fee_minor or 0),
-                currency=t.currency or "NGN",
-                status=t.status,
-                occurred_at=t.occurred_at,
-                raw_payload=t.raw_payload,
-            )
-            session.add(row)
-            await session.flush()
+            row = {
+                "id": uuid.uuid4(),
+                "org_id": org_id,
+                "psp": t.psp,
+                "external_txn_id": t.external_txn_id,
+                "external_ref": t.external_ref,
+                "settlement_ref": t.settlement_ref,
+                "amount_minor": int(t.amount_minor or 0),
+                "fee_minor": int(t.fee_minor or 0),
+                "currency": t.currency or "NGN",
+                "status": t.status,
+                "occurred_at": t.occurred_at,
+                "raw_payload": t.raw_payload,
+                "matched_entry_id": None,
+                "created_at": now,
+                "_new": True,
+            }
             summary["inserted"] += 1
         else:
             # Settlement may re-report the same txn — refresh mutable fields.
-            row.settlement_ref = t.settlement_ref or row.settlement_ref
-            row.amount_minor = int(t.amount_minor or row.amount_minor)
-            row.fee_minor = int(t.fee_minor or row.fee_minor)
-            row.status = t.status or row.status
+            row["settlement_ref"] = t.settlement_ref or row["settlement_ref"]
+            row["amount_minor"] = int(t.amount_minor or row["amount_minor"])
+            row["fee_minor"] = int(t.fee_minor or row["fee_minor"])
+            row["status"] = t.status or row["status"]
+        staged[key] = row
 
-        status, break_opened = await _match_one(session, org_id, row)
+        status, break_opened = _match(
+            row, lines_by_ref.get(row["external_ref"], []), breaks, now
+        )
         if status == "matched":
             summary["matched"] += 1
         if break_opened:
             summary["breaks_opened"] += 1
 
+    fresh, known = [], []
+    for r in staged.values():
+        (fresh if r.pop("_new", False) else known).append(r)
+    for chunk in _chunks(fresh):
+        await session.execute(
+            insert(ExternalTransaction), [{**r, "updated_at": now} for r in chunk]
+        )
+    if known:
+        await session.execute(
+            update(ExternalTransaction),
+            [
+                {
+                    "id": r["id"],
+                    "settlement_ref": r["settlement_ref"],
+                    "amount_minor": r["amount_minor"],
+                    "fee_minor": r["fee_minor"],
+                    "status": r["status"],
+                    "match_status": r["match_status"],
+                    "matched_entry_id": r["matched_entry_id"],
+                    "updated_at": now,
+                }
+                for r in known
+            ],
+        )
+    await breaks.flush(session, now)
     return summary
 
 
@@ -0,0 +1,76 @@
+"""Per-process cache of computed financial reports.
+
+Reports are keyed on (org, report, params, ledger high-water mark). The
+high-water mark is read from the small ``account_balances`` table — its
+(row count, total debits, last update) moves on every post and reversal, since
+both recompute balances in the posting transaction — so a new entry changes the
+key and a stale report is never served, across every worker process. Posting
+also calls ``invalidate_reports`` so this process drops the org's dead entries
+eagerly instead of waiting for LRU eviction.
+
+Only reports that are a pure function of posted journal lines belong here
+(deferred revenue also reads recognition schedules, which the nightly backfill
+can create without posting, so it is not cached).
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections import OrderedDict
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+from services.ledger_service.models import AccountBalance
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+
+MAX_CACHED_REPORTS = 256
+
+_reports: "OrderedDict[tuple, object]" = OrderedDict()
+
+
+async def ledger_high_water_mark(session: AsyncSession, org_id: uuid.UUID) -> tuple:
+    """A value that changes whenever an entry posts to the org's ledger."""
+    count, debits, updated = (
+        await session.execute(
+            select(
+                func.count(),
+                func.coalesce(func.sum(AccountBalance.debits_minor), 0),
+                func.max(AccountBalance.updated_at),
+            ).where(AccountBalance.org_id == org_id)
+        )
+    ).one()
+    return (int(count), int(debits), updated)
+
+
+async def cached_report(
+    session: AsyncSession,
+    org_id: uuid.UUID,
+    report: str,
+    params: tuple[Hashable, ...],
+    compute: Callable[[], Awaitable[T]],
+) -> T:
+    """Return the cached report for the current ledger state, computing on miss.
+
+    Cached results are shared between callers — treat them as read-only.
+    """
+    key = (org_id, report, params, await ledger_high_water_mark(session, org_id))
+    if key in _reports:
+        _reports.move_to_end(key)
+        return _reports[key]  # type: ignore[return-value]
+
+    result = await compute()
+    _reports[key] = result
+    while len(_reports) > MAX_CACHED_REPORTS:
+        _reports.popitem(last=False)
+    return result
+
+
+def invalidate_reports(org_id: uuid.UUID | None = None) -> None:
+    """Drop cached reports for one org (or every org when org_id is None)."""
+    if org_id is None:
+        _reports.clear()
+        return
+    for key in [k for k in _reports if k[0] == org_id]:
+        del _reports[key]
@@ -1,8 +1,17 @@
 """Financial reports derived from journal lines.
 
-Trial balance and P&L are computed directly from journal_lines (joined to
-entries for dates and accounts for type), debit-positive convention. Reversed
-entries and their reversing entries both contribute lines, so they net.
+Per-account reports (trial balance, balance sheet, P&L by account, cash
+position, Bubbles liability) read the materialised ``account_balances``
+snapshot for every month-period wholly inside the report window and only scan
+journal_lines for the periods the window cuts through (typically the current,
+open month). Snapshots are recomputed in the same transaction as every post
+(services/balances.py), so snapshot + delta equals a full line scan — at a cost
+bounded by the open period instead of the whole ledger history.
+
+Domain-grouped reports (P&L by dimension_1, margin) still scan lines: snapshots
+aren't kept per dimension, and those reports are date-range bounded anyway.
+Debit-positive convention throughout. Reversed entries and their reversing
+entries both contribute lines, so they net.
 """
 
 from __future__ import annotations
@@ -11,12 +20,14 @@ import uuid
 from datetime import date
 
 from services.ledger_service.models import (
+    AccountBalance,
     ChartOfAccounts,
     JournalEntry,
     JournalLine,
+    Period,
     RevenueRecognitionSchedule,
 )
-from services.ledger_service.models.enums import AccountType
+from services.ledger_service.models.enums import AccountType, PeriodType
 from services.ledger_service.schemas.reports import (
     BalanceSheetReport,
     BalanceSheetRow,
@@ -33,7 +44,7 @@ from services.ledger_service.schemas.reports import (
     TrialBalanceReport,
     TrialBalanceRow,
 )
-from sqlalchemy import func, select
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 REVENUE_TYPES = (AccountType.REVENUE, AccountType.CONTRA_REVENUE)
@@ -50,34 +61,85 @@ CASH_ACCOUNTS = {
 }
 
 
+async def _account_totals(
+    session: AsyncSession,
+    org_id: uuid.UUID,
+    to_date: date,
+    from_date: date | None = None,
+    *filters,
+) -> list[tuple]:
+    """Per-account (code, name, type, maps_to, debit, credit) over a date window.
+
+    The window is [from_date, to_date], open-ended below when from_date is None.
+    Month-periods wholly inside the window come from the balance snapshot; lines
+    in any period the window only partly covers are summed directly. ``filters``
+    are extra ChartOfAccounts predicates. Sorted by code.
+    """
+    maps_to = ChartOfAccounts.account_metadata["maps_to"].astext
+    acct_cols = (
+        ChartOfAccounts.code,
+        ChartOfAccounts.name,
+        ChartOfAccounts.type,
+        maps_to,
+    )
+
+    covered = [Period.period_type == PeriodType.MONTH, Period.end_date <= to_date]
+    partial = [Period.period_type != PeriodType.MONTH, Period.end_date > to_date]
+    if from_date is not None:
+        covered.append(Period.start_date >= from_date)
+        partial.append(Period.start_date < from_date)
+
+    snapshot = (
+        select(
+            *acct_cols,
+            func.coalesce(func.sum(AccountBalance.debits_minor), 0),
+            func.coalesce(func.sum(AccountBalance.credits_minor), 0),
+        )
+        .select_from(AccountBalance)
+        .join(Period, AccountBalance.period_id == Period.id)
+        .join(ChartOfAccounts, AccountBalance.account_id == ChartOfAccounts.id)
+        .where(AccountBalance.org_id == org_id, *covered, *filters)
+        .group_by(*acct_cols)
+    )
+    delta = (
+        select(
+            *acct_cols,
+            func.coalesce(func.sum(JournalLine.debit_minor), 0),
+            func.coalesce(func.sum(JournalLine.credit_minor), 0),
+        )
+        .select_from(JournalLine)
+        .join(JournalEntry, JournalLine.entry_id == JournalEntry.id)
+        .join(Period, JournalEntry.period_id == Period.id)
+        .join(ChartOfAccounts, JournalLine.account_id == ChartOfAccounts.id)
+        .where(
+            JournalLine.org_id == org_id,
+            JournalEntry.entry_date <= to_date,
+            or_(*partial),
+            *filters,
+        )
+        .group_by(*acct_cols)
+    )
+    if from_date is not None:
+        delta = delta.where(JournalEntry.entry_date >= from_date)
+
+    totals: dict[str, list] = {}
+    for query in (snapshot, delta):
+        for code, name, type_, m, debit, credit in (await session.execute(query)).all():
+            row = totals.setdefault(code, [code, name, type_, m, 0, 0])
+            row[4] += int(debit)
+            row[5] += int(credit)
+    return [tuple(totals[code]) for code in sorted(totals)]
+
+
 async def trial_balance(
     session: AsyncSession, org_id: uuid.UUID, as_of: date
 ) -> TrialBalanceReport:
     """Per-account debit/credit balances for all entries on or before as_of."""
-    rows = (
-        await session.execute(
-            select(
-                ChartOfAccounts.code,
-                ChartOfAccounts.name,
-                ChartOfAccounts.type,
-                func.coalesce(func.sum(JournalLine.debit_minor), 0),
-                func.coalesce(func.sum(JournalLine.credit_minor), 0),
-            )
-            .select_from(JournalLine)
-            .join(JournalEntry, JournalLine.entry_id == JournalEntry.id)
-            .join(ChartOfAccounts, JournalLine.account_id == ChartOfAccounts.id)
-            .where(
-                JournalLine.org_id == org_id,
-                JournalEntry.entry_date <= as_of,
-            )
-            .group_by(ChartOfAccounts.code, ChartOfAccounts.name, ChartOfAccounts.type)
-            .order_by(ChartOfAccounts.code)
-        )
-    ).all()
+    rows = await _account_totals(session, org_id, as_of)
 
     out: list[TrialBalanceRow] = []
     total_debit = total_credit = 0
-    for code, name, type_, debit, credit in rows:
+    for code, name, type_, _maps_to, debit, credit in rows:
         net = debit - credit
         dr = net if net > 0 else 0
         cr = -net if net < 0 else 0
@@ -121,31 +183,39 @@ async def profit_loss(
 
     if group_by == "dimension_1":
         key_col = func.coalesce(JournalLine.dimension_1, "(unassigned)")
-    else:
-        key_col = ChartOfAccounts.code
-
-    rows = (
-        await session.execute(
-            select(
-                key_col.label("key"),
-                ChartOfAccounts.name,
-                ChartOfAccounts.type,
-                func.coalesce(func.sum(JournalLine.credit_minor), 0),
-                func.coalesce(func.sum(JournalLine.debit_minor), 0),
+        rows = (
+            await session.execute(
+                select(
+                    key_col.label("key"),
+                    ChartOfAccounts.name,
+                    ChartOfAccounts.type,
+                    func.coalesce(func.sum(JournalLine.credit_minor), 0),
+                    func.coalesce(func.sum(JournalLine.debit_minor), 0),
+                )
+                .select_from(JournalLine)
+                .join(JournalEntry, JournalLine.entry_id == JournalEntry.id)
+                .join(ChartOfAccounts, JournalLine.account_id == ChartOfAccounts.id)
+                .where(
+                    JournalLine.org_id == org_id,
+                    JournalEntry.entry_date >= from_date,
+                    JournalEntry.entry_date <= to_date,
+                    ChartOfAccounts.type.in_(REVENUE_TYPES + EXPENSE_TYPES),
+                )
+                .group_by(key_col, ChartOfAccounts.name, ChartOfAccounts.type)
+                .order_by(key_col)
             )
-            .select_from(JournalLine)
-            .join(JournalEntry, JournalLine.entry_id == JournalEntry.id)
-            .join(ChartOfAccounts, JournalLine.account_id == ChartOfAccounts.id)
-            .where(
-                JournalLine.org_id == org_id,
-                JournalEntry.entry_date >= from_date,
-                JournalEntry.entry_date <= to_date,
+        ).all()
+    else:
+        rows = [
+            (code, name, type_, credit, debit)
+            for code, name, type_, _maps_to, debit, credit in await _account_totals(
+                session,
+                org_id,
+                to_date,
+                from_date,
                 ChartOfAccounts.type.in_(REVENUE_TYPES + EXPENSE_TYPES),
             )
-            .group_by(key_col, ChartOfAccounts.name, ChartOfAccounts.type)
-            .order_by(key_col)
-        )
-    ).all()
+        ]
 
     # Fold (key, type) rows into per-key revenue/expense.
     agg: dict[str, dict] = {}
@@ -239,30 +309,14 @@ async def balance_sheet(
     equity row. Because every journal entry balances, total assets always equals
     total liabilities + equity (incl. that row) — ``balanced`` is the guard.
     """
-    rows = (
-        await session.execute(
-            select(
-                ChartOfAccounts.code,
-                ChartOfAccounts.name,
-                ChartOfAccounts.type,
-                func.coalesce(func.sum(JournalLine.debit_minor), 0),
-                func.coalesce(func.sum(JournalLine.credit_minor), 0),
-            )
-            .select_from(JournalLine)
-            .join(JournalEntry, JournalLine.entry_id == JournalEntry.id)
-            .join(ChartOfAccounts, JournalLine.account_id == ChartOfAccounts.id)
-            .where(JournalLine.org_id == org_id, JournalEntry.entry_date <= as_of)
-            .group_by(ChartOfAccounts.code, ChartOfAccounts.name, ChartOfAccounts.type)
-            .order_by(ChartOfAccounts.code)
-        )
-    ).all()
+    rows = await _account_totals(session, org_id, as_of)
 
     assets: list[BalanceSheetRow] = []
     liabilities: list[BalanceSheetRow] = []
     equity: list[BalanceSheetRow] = []
     total_assets = total_liab = total_equity = net_income = 0
 
-    for code, name, type_, debit, credit in rows:
+    for code, name, type_, _maps_to, debit, credit in rows:
         net_debit = debit - credit
         net_credit = credit - debit
         if type_ in (AccountType.ASSET, AccountType.CONTRA_ASSET):
@@ -383,25 +437,16 @@ async def bubbles_liability(
 ) -> BubblesLiabilityReport:
     """Outstanding Bubbles liability split into purchased vs promotional (§19-B)."""
     maps_to = ChartOfAccounts.account_metadata["maps_to"].astext
-    rows = (
-        await session.execute(
-            select(
-                maps_to,
-                func.coalesce(func.sum(JournalLine.credit_minor), 0)
-                - func.coalesce(func.sum(JournalLine.debit_minor), 0),
-            )
-            .select_from(JournalLine)
-            .join(JournalEntry, JournalLine.entry_id == JournalEntry.id)
-            .join(ChartOfAccounts, JournalLine.account_id == ChartOfAccounts.id)
-            .where(
-                JournalLine.org_id == org_id,
-                JournalEntry.entry_date <= as_of,
-                maps_to.in_(["bubbles_liability", "bubbles_liability_promo"]),
-            )
-            .group_by(maps_to)
-        )
-    ).all()
-    balances = {m: int(bal) for m, bal in rows}
+    rows = await _account_totals(
+        session,
+        org_id,
+        as_of,
+        None,
+        maps_to.in_(["bubbles_liability", "bubbles_liability_promo"]),
+    )
+    balances: dict[str, int] = {}
+    for _code, _name, _type, m, debit, credit in rows:
+        balances[m] = balances.get(m, 0) + credit - debit
     purchased = balances.get("bubbles_liability", 0)
     promo = balances.get("bubbles_liability_promo", 0)
     return BubblesLiabilityReport(
@@ -421,27 +466,12 @@ async def cash_position(
     clearing balance means cash collected that the bank hasn't settled yet.
     """
     maps_to = ChartOfAccounts.account_metadata["maps_to"].astext
-    rows = (
-        await session.execute(
-            select(
-                ChartOfAccounts.code,
-                ChartOfAccounts.name,
-                maps_to,
-                func.coalesce(func.sum(JournalLine.debit_minor), 0)
-                - func.coalesce(func.sum(JournalLine.credit_minor), 0),
-            )
-            .select_from(JournalLine)
-            .join(JournalEntry, JournalLine.entry_id == JournalEntry.id)
-            .join(ChartOfAccounts, JournalLine.account_id == ChartOfAccounts.id)
-            .where(
-                JournalLine.org_id == org_id,
-                JournalEntry.entry_date <= as_of,
-                maps_to.in_(list(CASH_ACCOUNTS)),
-            )
-            .group_by(ChartOfAccounts.code, ChartOfAccounts.name, maps_to)
-            .order_by(ChartOfAccounts.code)
+    rows = [
+        (code, name, m, debit - credit)
+        for code, name, _type, m, debit, credit in await _account_totals(
+            session, org_id, as_of, None, maps_to.in_(list(CASH_ACCOUNTS))
         )
-    ).all()
+    ]
 
     out: list[CashPositionRow] = []
     bank = clearing = 0
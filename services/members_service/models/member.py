@@ -4,7 +4,17 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    func,
+    text,
+)
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -30,7 +40,32 @@ class Member(Base):
     """
 
     __tablename__ = "members"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # Internal member search (services/member_search.py): trigram index
+        # for substring/fuzzy matches, prefix indexes for 1–2 char terms.
+        Index(
+            "ix_members_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_members_lower_first_name_prefix",
+            func.lower(text("first_name")).label("lower_first_name"),
+            postgresql_ops={"lower_first_name": "text_pattern_ops"},
+        ),
+        Index(
+            "ix_members_lower_last_name_prefix",
+            func.lower(text("last_name")).label("lower_last_name"),
+            postgresql_ops={"lower_last_name": "text_pattern_ops"},
+        ),
+        Index(
+            "ix_members_lower_email_prefix",
+            func.lower(text("email")).label("lower_email"),
+            postgresql_ops={"lower_email": "text_pattern_ops"},
+        ),
+        {"extend_existing": True},
+    )
 
     # Identity
     id: Mapped[uuid.UUID] = mapped_column(
@@ -42,6 +77,13 @@ class Member(Base):
     email: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
     first_name: Mapped[str] = mapped_column(String, nullable=False)
     last_name: Mapped[str] = mapped_column(String, nullable=False)
+    search_text: Mapped[Optional[str]] = mapped_column(
+        String,
+        Computed(
+            "lower(first_name || ' ' || last_name || ' ' || email)", persisted=True
+        ),
+        nullable=True,
+    )
 
     # Status
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
@@ -18,7 +18,8 @@ Submodules:
   - lookups.py     /by-auth/{auth_id}, /active, /search, /approved-list
   - birthdays.py   /birthdays-today, /admins
   - flywheel.py    /joined-tier
-  - coach.py       /coaches/eligible, /coaches/{member_id}/profile,
+  - coach.py       /coaches/eligible, /coaches/availability/bulk,
+                   /coaches/{member_id}/profile,
                    /coaches/{member_id}/readiness, /{member_id}/bank-account
   - membership.py  /{member_id}/membership, /{member_id}/tier-history,
                    /{member_id}, /bulk
@@ -22,6 +22,7 @@ from sqlalchemy import case, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ._schemas import (
+    BulkMembersRequest,
     CoachAvailabilityInternal,
     CoachBankAccountResponse,
     CoachProfileBasic,
@@ -109,6 +110,41 @@ async def get_eligible_coaches(
     ]
 
 
+@router.post(
+    "/coaches/availability/bulk", response_model=List[CoachAvailabilityInternal]
+)
+async def get_coach_availabilities_bulk(
+    body: BulkMembersRequest,
+    _: AuthUser = Depends(require_service_role),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Availability calendars + spacing overrides for several coaches at once.
+
+    Members without a coach profile are omitted. Consumed by sessions_service
+    to rank make-up options across coaches in one call.
+    """
+    if not body.ids:
+        return []
+    uuids = [uuid.UUID(mid) for mid in body.ids]
+    profiles = (
+        (
+            await db.execute(
+                select(CoachProfile).where(CoachProfile.member_id.in_(uuids))
+            )
+        )
+        .scalars()
+        .all()
+    )
+    return [
+        CoachAvailabilityInternal(
+            member_id=str(profile.member_id),
+            availability_calendar=profile.availability_calendar,
+            min_hours_between_sessions=profile.min_hours_between_sessions,
+        )
+        for profile in profiles
+    ]
+
+
 @router.get("/coaches/{member_id}/profile", response_model=CoachProfileBasic)
 async def get_coach_profile(
     member_id: uuid.UUID,
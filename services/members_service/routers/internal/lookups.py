@@ -1,18 +1,21 @@
 """Static-path member lookup endpoints.
 
-`/by-auth/{auth_id}`, `/active`, `/search`, `/approved-list` — all must be
+`/by-auth/{auth_id}`, `/active`, `/search`, `/approved-list` (and the NDJSON
+`/active/stream`, `/approved-list/stream`) — all must be
 registered before any `/{member_id}` dynamic route in the aggregator so
 FastAPI doesn't capture the literal segment as a UUID.
 """
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from libs.auth.dependencies import require_service_role
 from libs.auth.models import AuthUser
 from libs.common.media_utils import resolve_media_urls
 from libs.db.session import get_async_db
 from services.members_service.models import Member
+from services.members_service.services import member_search, member_stream
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -65,6 +68,7 @@ async def get_active_members(
     return [
         MemberBasic(
             id=str(m.id),
+            auth_id=m.auth_id,
             first_name=m.first_name,
             last_name=m.last_name,
             email=m.email,
@@ -74,40 +78,49 @@ async def get_active_members(
     ]
 
 
+@router.get("/active/stream")
+async def stream_active_members(
+    _: AuthUser = Depends(require_service_role),
+):
+    """Active members as NDJSON (one `MemberBasic`-shaped object per line).
+
+    Streaming counterpart of `/active` for roster-sized callers: keyset-paged
+    server-side, so memory stays flat on both ends.
+    """
+    return StreamingResponse(
+        member_stream.stream_active_members(),
+        media_type=member_stream.NDJSON_MEDIA_TYPE,
+    )
+
+
 @router.get("/search", response_model=List[MemberSearchResult])
 async def search_members(
+    response: Response,
     q: str = Query(..., min_length=1, description="Search term (name or email)"),
     limit: int = Query(50, ge=1, le=200),
+    after: Optional[str] = Query(
+        None, description="Continuation cursor from a previous X-Next-Cursor"
+    ),
     _: AuthUser = Depends(require_service_role),
     db: AsyncSession = Depends(get_async_db),
 ):
-    """Search members by first name, last name, or email (case-insensitive substring).
+    """Search members by name or email — ranked, typo-tolerant.
 
-    Used by other services (e.g., wallet_service admin) to resolve human-readable
-    queries into auth_ids for filtering. Returns up to `limit` matches.
+    Used by the chat, admin and coach pickers (on every keystroke) and by
+    other services (e.g., wallet_service admin) to resolve human-readable
+    queries into auth_ids. Word-prefix matches rank first, then substring,
+    then fuzzy matches. Returns up to `limit` matches; when more exist the
+    `X-Next-Cursor` response header carries the cursor for `after`.
     """
-    term = f"%{q.strip()}%"
-    result = await db.execute(
-        select(Member)
-        .where(
-            (Member.first_name.ilike(term))
-            | (Member.last_name.ilike(term))
-            | (Member.email.ilike(term))
+    try:
+        results, next_cursor = await member_search.search_members(
+            db, q, limit=limit, after=after
         )
-        .order_by(Member.last_name.asc(), Member.first_name.asc())
-        .limit(limit)
-    )
-    members = result.scalars().all()
-    return [
-        MemberSearchResult(
-            id=str(m.id),
-            auth_id=m.auth_id,
-            first_name=m.first_name,
-            last_name=m.last_name,
-            email=m.email,
-        )
-        for m in members
-    ]
+    except member_search.InvalidSearchCursor:
+        raise HTTPException(status_code=400, detail="Invalid search cursor")
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return [MemberSearchResult(**r) for r in results]
 
 
 @router.get("/approved-list", response_model=List[ApprovedMemberBasic])
@@ -140,3 +153,17 @@ async def get_approved_members_list(
         )
         for m in members
     ]
+
+
+@router.get("/approved-list/stream")
+async def stream_approved_members_list(
+    _: AuthUser = Depends(require_service_role),
+):
+    """Approved members as NDJSON (one `ApprovedMemberBasic` per line).
+
+    Streaming counterpart of `/approved-list`; see `/active/stream`.
+    """
+    return StreamingResponse(
+        member_stream.stream_approved_members(),
+        media_type=member_stream.NDJSON_MEDIA_TYPE,
+    )
@@ -0,0 +1,192 @@
+"""Indexed, typo-tolerant member search for the internal pickers.
+
+``members.search_text`` is a generated ``lower(first_name || ' ' ||
+last_name || ' ' || email)`` column with a pg_trgm GIN index, so
+substring matches (``LIKE '%term%'``) and fuzzy word matches
+(``search_text %> term``, i.e. word_similarity above the threshold) are
+both index-backed. One- and two-character terms have no trigrams to use,
+so they fall back to prefix matches on the three ``lower(...)
+text_pattern_ops`` btree indexes.
+
+Ranking, best first: a word in the name/email starts with the term, then
+any substring match, then fuzzy-only matches; within a tier by
+word_similarity. Pages are keyset-continued with an opaque cursor over
+``(rank, similarity, id)`` that also carries a hash of the normalised query,
+so a cursor can't continue a different search.
+
+Pickers call this on every keystroke, so pages are cached in Redis for
+``SEARCH_CACHE_TTL_SECONDS``. Renames simply age out. Fail-open like
+``libs.common.validation_cache``: if Redis is unavailable the query runs.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import uuid
+from decimal import Decimal
+from typing import Optional
+
+from libs.common.logging import get_logger
+from libs.common.redis import get_redis
+from services.members_service.models import Member
+from sqlalchemy import Numeric, case, cast, func, literal, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = get_logger(__name__)
+
+SEARCH_CACHE_TTL_SECONDS = 15
+# pg_trgm's default word_similarity_threshold (0.6) misses most one-letter
+# typos in short names; 0.5 catches "Adebayo" for "adebyo".
+FUZZY_THRESHOLD = 0.5
+MAX_QUERY_LENGTH = 100
+_MIN_TRIGRAM_TERM = 3
+
+
+class InvalidSearchCursor(ValueError):
+    """The ``after`` cursor is malformed or from a different query."""
+
+
+def normalize_query(q: str) -> str:
+    return " ".join(q.lower().split())[:MAX_QUERY_LENGTH]
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _query_hash(term: str) -> str:
+    return hashlib.sha1(term.encode()).hexdigest()[:12]
+
+
+def encode_cursor(
+    term: str, rank: int, similarity: Decimal, member_id: uuid.UUID
+) -> str:
+    raw = json.dumps(
+        [_query_hash(term), rank, str(similarity), str(member_id)]
+    ).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, term: str) -> tuple[int, Decimal, uuid.UUID]:
+    """``(rank, similarity, id)`` of a cursor issued for ``term``."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        query_hash, rank, similarity, member_id = json.loads(
+            base64.urlsafe_b64decode(padded)
+        )
+        position = int(rank), Decimal(similarity), uuid.UUID(member_id)
+    except (ValueError, TypeError, ArithmeticError) as exc:
+        raise InvalidSearchCursor(str(exc)) from exc
+    if query_hash != _query_hash(term):
+        raise InvalidSearchCursor("cursor is from a different query")
+    return position
+
+
+def _search_statement(term: str, limit: int, after: Optional[str]):
+    text = Member.search_text
+    like = _escape_like(term)
+    # Rounded to a numeric so the cursor round-trips exactly.
+    similarity = func.round(cast(func.word_similarity(term, text), Numeric), 3)
+    if len(term) < _MIN_TRIGRAM_TERM:
+        match = or_(
+            func.lower(Member.first_name).like(f"{like}%"),
+            func.lower(Member.last_name).like(f"{like}%"),
+            func.lower(Member.email).like(f"{like}%"),
+        )
+        rank = literal(2)
+    else:
+        word_prefix = or_(text.like(f"{like}%"), text.like(f"% {like}%"))
+        contains = text.like(f"%{like}%")
+        match = or_(contains, text.op("%>")(term))
+        rank = case((word_prefix, 2), (contains, 1), else_=0)
+
+    stmt = (
+        select(
+            Member.id,
+            Member.auth_id,
+            Member.first_name,
+            Member.last_name,
+            Member.email,
+            rank.label("rank"),
+            similarity.label("similarity"),
+        )
+        .where(match)
+        .order_by(rank.desc(), similarity.desc(), Member.id.desc())
+        .limit(limit + 1)
+    )
+    if after:
+        stmt = stmt.where(
+            tuple_(rank, similarity, Member.id) < tuple_(*decode_cursor(after, term))
+        )
+    return stmt
+
+
+def _cache_key(term: str, limit: int, after: Optional[str]) -> str:
+    digest = hashlib.sha1(f"{term}\x00{limit}\x00{after or ''}".encode()).hexdigest()
+    return f"members:search:{digest}"
+
+
+async def _cached_page(key: str) -> Optional[dict]:
+    try:
+        redis = await get_redis()
+        raw = await redis.get(key)
+    except Exception as e:
+        logger.warning(f"Member search cache read failed: {e}")
+        return None
+    return json.loads(raw) if raw else None
+
+
+async def _cache_page(key: str, page: dict) -> None:
+    try:
+        redis = await get_redis()
+        await redis.set(key, json.dumps(page), ex=SEARCH_CACHE_TTL_SECONDS)
+    except Exception as e:
+        logger.warning(f"Member search cache write failed: {e}")
+
+
+async def search_members(
+    db: AsyncSession, q: str, *, limit: int, after: Optional[str] = None
+) -> tuple[list[dict], Optional[str]]:
+    """One ranked page of members matching ``q`` and the next-page cursor.
+
+    Raises ``InvalidSearchCursor`` for a malformed ``after`` or one issued
+    for a different query.
+    """
+    term = normalize_query(q)
+    if not term:
+        return [], None
+    if after:
+        decode_cursor(after, term)  # reject bad cursors before the cache lookup
+
+    key = _cache_key(term, limit, after)
+    cached = await _cached_page(key)
+    if cached is not None:
+        return cached["results"], cached["next_cursor"]
+
+    await db.execute(
+        select(
+            func.set_config(
+                "pg_trgm.word_similarity_threshold", str(FUZZY_THRESHOLD), True
+            )
+        )
+    )
+    rows = (await db.execute(_search_statement(term, limit, after))).all()
+    next_cursor = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        next_cursor = encode_cursor(term, last.rank, last.similarity, last.id)
+        rows = rows[:limit]
+    results = [
+        {
+            "id": str(r.id),
+            "auth_id": r.auth_id,
+            "first_name": r.first_name,
+            "last_name": r.last_name,
+            "email": r.email,
+        }
+        for r in rows
+    ]
+    await _cache_page(key, {"results": results, "next_cursor": next_cursor})
+    return results, next_cursor
@@ -0,0 +1,107 @@
+"""NDJSON streaming for the bulk internal member listings.
+
+``/internal/members/active`` and ``/internal/members/approved-list`` load
+every matching ``Member`` (plus its eagerly ``selectin``-loaded profile,
+membership, preferences, … relationships) and serialise them as one JSON
+array, so both the members service and the caller hold the whole roster in
+memory at once. The ``/stream`` variants instead:
+
+* select only the columns the listing needs (no ORM objects, no eager
+  relationship loads);
+* page through ``members`` by primary key (keyset, ``id > last_id``), one
+  short-lived session per page so no connection is held while the client
+  is slow to read;
+* emit one JSON object per line (``application/x-ndjson``), a page at a
+  time.
+
+Memory on both sides is bounded by ``STREAM_PAGE_SIZE`` regardless of
+membership size. Consume with ``libs.common.service_client.members
+.iter_active_members`` / ``iter_approved_members``.
+
+The session is opened inside the generator rather than taken from
+``get_async_db``: yield-dependencies are torn down before a
+``StreamingResponse`` body is sent.
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from typing import AsyncIterator, Callable, Optional
+
+from libs.db.config import AsyncSessionLocal
+from services.members_service.models import Member, MemberMembership, MemberProfile
+from sqlalchemy import select
+
+STREAM_PAGE_SIZE = 500
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _active_statement():
+    return (
+        select(
+            Member.id,
+            Member.auth_id,
+            Member.first_name,
+            Member.last_name,
+            Member.email,
+            MemberProfile.phone,
+        )
+        .outerjoin(MemberProfile, MemberProfile.member_id == Member.id)
+        .where(Member.is_active.is_(True))
+    )
+
+
+def _approved_statement():
+    return (
+        select(
+            Member.id,
+            Member.auth_id,
+            Member.first_name,
+            Member.last_name,
+            MemberMembership.primary_tier,
+        )
+        .outerjoin(MemberMembership, MemberMembership.member_id == Member.id)
+        .where(
+            Member.approval_status == "approved",
+            Member.is_active.is_(True),
+        )
+    )
+
+
+async def _iter_pages(
+    stmt, page_size: Optional[int], session_factory: Optional[Callable]
+) -> AsyncIterator[list[dict]]:
+    page_size = page_size or STREAM_PAGE_SIZE
+    factory = session_factory or AsyncSessionLocal
+    last_id: Optional[uuid.UUID] = None
+    while True:
+        page_stmt = stmt.order_by(Member.id).limit(page_size)
+        if last_id is not None:
+            page_stmt = page_stmt.where(Member.id > last_id)
+        async with factory() as session:
+            rows = (await session.execute(page_stmt)).mappings().all()
+        if not rows:
+            return
+        yield [{**row, "id": str(row["id"])} for row in rows]
+        if len(rows) < page_size:
+            return
+        last_id = rows[-1]["id"]
+
+
+async def stream_ndjson(
+    stmt, *, page_size: Optional[int] = None, session_factory=None
+) -> AsyncIterator[bytes]:
+    """NDJSON body for ``stmt`` (one chunk per page)."""
+    async for page in _iter_pages(stmt, page_size, session_factory):
+        yield "".join(json.dumps(row) + "\n" for row in page).encode()
+
+
+def stream_active_members(**kwargs) -> AsyncIterator[bytes]:
+    """Active members as ``MemberBasic``-shaped NDJSON lines."""
+    return stream_ndjson(_active_statement(), **kwargs)
+
+
+def stream_approved_members(**kwargs) -> AsyncIterator[bytes]:
+    """Approved, active members as ``ApprovedMemberBasic``-shaped lines."""
+    return stream_ndjson(_approved_statement(), **kwargs)
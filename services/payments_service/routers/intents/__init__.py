@@ -16,7 +16,7 @@ tasks, and tests is preserved via re-exports below.
   - `_apply_entitlement_with_tracking`
   - `_mark_paid_and_apply`
   - `_verify_paystack_signature`
-  - `_verify_paystack_transaction`
+  - `_verify_paystack_transaction`, `PaystackRateLimitedError`
   - `_initialize_paystack`
   - `_paystack_enabled`, `_paystack_headers`, `_to_kobo`, `_callback_url`
   - `_try_qualify_referral`
@@ -74,6 +74,7 @@ from ._entitlement import (  # noqa: F401  re-exported
 )
 from ._helpers import _try_qualify_referral  # noqa: F401  re-exported (tests)
 from ._paystack import (  # noqa: F401  re-exported
+    PaystackRateLimitedError,
     _callback_url,
     _initialize_paystack,
     _paystack_enabled,
@@ -104,6 +105,7 @@ __all__ = [
     "_mark_paid_and_apply",
     "_verify_paystack_signature",
     "_verify_paystack_transaction",
+    "PaystackRateLimitedError",
     "_initialize_paystack",
     "_paystack_enabled",
     "_paystack_headers",
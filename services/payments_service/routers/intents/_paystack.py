@@ -7,8 +7,10 @@ Imported by intent_creation, member_payments, the webhook handler in
 `routers/internal.py`.
 """
 
+import asyncio
 import hashlib
 import hmac
+import ssl
 from decimal import ROUND_HALF_UP, Decimal
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
@@ -29,6 +31,49 @@ FULFILLMENT_META_KEY = "fulfillment"
 MAX_FULFILLMENT_RETRIES = 8
 BASE_FULFILLMENT_RETRY_MINUTES = 2
 
+# Keep-alive pool shared by every Paystack call in the process. Sized for the
+# reconciliation worker's verify concurrency plus live checkout traffic.
+PAYSTACK_MAX_CONNECTIONS = 20
+
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+class PaystackRateLimitedError(HTTPException):
+    """Paystack answered 429. ``retry_after`` is its back-off hint, in seconds."""
+
+    def __init__(self, retry_after: float, detail: str):
+        super().__init__(status_code=status.HTTP_502_BAD_GATEWAY, detail=detail)
+        self.retry_after = retry_after
+
+
+def _paystack_http() -> httpx.AsyncClient:
+    """Shared pooled client for Paystack API calls.
+
+    One client per event loop: reusing TLS connections matters when the worker
+    verifies hundreds of references a pass, and a client can't outlive the loop
+    it was created on (tests and scripts each run their own).
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            timeout=30,
+            limits=httpx.Limits(
+                max_connections=PAYSTACK_MAX_CONNECTIONS,
+                max_keepalive_connections=PAYSTACK_MAX_CONNECTIONS,
+            ),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+def _retry_after_seconds(resp: httpx.Response, default: float = 1.0) -> float:
+    try:
+        return max(0.0, float(resp.headers.get("retry-after", default)))
+    except ValueError:
+        return default
+
 
 def _paystack_enabled() -> bool:
     key = (settings.PAYSTACK_SECRET_KEY or "").strip()
@@ -106,12 +151,11 @@ async def _initialize_paystack(
     if settings.ENVIRONMENT in ("local", "development"):
         payload["channels"] = ["card", "bank", "ussd", "bank_transfer"]
 
-    async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.post(
-            f"{settings.PAYSTACK_API_BASE_URL.rstrip('/')}/transaction/initialize",
-            headers=_paystack_headers(),
-            json=payload,
-        )
+    resp = await _paystack_http().post(
+        f"{settings.PAYSTACK_API_BASE_URL.rstrip('/')}/transaction/initialize",
+        headers=_paystack_headers(),
+        json=payload,
+    )
 
     if resp.status_code >= 400:
         raise HTTPException(
@@ -139,18 +183,19 @@ async def _verify_paystack_transaction(
             detail="Paystack is not configured.",
         )
 
-    import asyncio
-    import ssl as _ssl
-
     url = f"{settings.PAYSTACK_API_BASE_URL.rstrip('/')}/transaction/verify/{reference}"
     headers = _paystack_headers()
 
     for attempt in range(1, _max_retries + 1):
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.get(url, headers=headers)
+            resp = await _paystack_http().get(url, headers=headers)
             break  # success — exit retry loop
-        except (_ssl.SSLError, httpx.ConnectError, httpx.ReadError) as exc:
+        except (
+            ssl.SSLError,
+            httpx.ConnectError,
+            httpx.ReadError,
+            httpx.RemoteProtocolError,  # pooled connection closed by the peer
+        ) as exc:
             if attempt < _max_retries:
                 logger.warning(
                     "Paystack verify attempt %d/%d failed (%s: %s), retrying...",
@@ -171,6 +216,11 @@ async def _verify_paystack_transaction(
                     detail=f"Paystack connection error after {_max_retries} retries: {exc}",
                 ) from exc
 
+    if resp.status_code == 429:
+        raise PaystackRateLimitedError(
+            retry_after=_retry_after_seconds(resp),
+            detail=f"Paystack verify rate-limited (429): {resp.text}",
+        )
     if resp.status_code >= 400:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
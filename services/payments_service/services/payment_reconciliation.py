@@ -0,0 +1,309 @@
+"""Worker-side reconciliation of pending Paystack payments.
+
+The Paystack webhook is the primary PENDING → PAID path; this module is the
+fallback sweep for webhooks that never arrived.
+
+Verification is I/O-bound (one Paystack round trip per reference), so the sweep
+verifies a wave of references concurrently — bounded by
+``PAYSTACK_VERIFY_CONCURRENCY`` in-flight calls and paced to
+``PAYSTACK_VERIFY_RATE_PER_SEC`` request starts — over the shared pooled client.
+A 429 pauses every worker for Paystack's ``Retry-After`` before the reference is
+retried. Before each wave the candidates are re-read, so payments a webhook
+resolved since the sweep started are skipped without a Paystack call.
+
+Database writes stay per payment (``_mark_paid_and_apply`` locks the row), run
+in their own sessions under ``FULFILLMENT_CONCURRENCY`` so the sweep never
+holds more connections than the pool allows.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Iterable, Optional
+
+from libs.common.config import get_settings
+from libs.common.datetime_utils import utc_now
+from libs.common.logging import get_logger
+from libs.db.config import AsyncSessionLocal
+from services.payments_service.models import Payment, PaymentStatus
+from sqlalchemy import select
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Oldest-first pending payments examined per sweep, and how many are verified
+# between re-reads of their status.
+RECONCILE_BATCH_LIMIT = 1000
+RECONCILE_WAVE_SIZE = 100
+# Concurrent DB-writing fulfillments. Each holds a pooled connection while it
+# calls out to other services, so this stays below DB_POOL_SIZE + overflow.
+FULFILLMENT_CONCURRENCY = 4
+# A reference that keeps drawing 429s is left for the next sweep.
+MAX_RATE_LIMIT_RETRIES = 3
+
+TERMINAL_FAILURE_STATUSES = {"failed", "abandoned", "reversed"}
+
+VerifyFn = Callable[[str], Awaitable[dict]]
+
+
+class RequestPacer:
+    """Spaces request starts to a steady rate and adapts to provider back-off.
+
+    ``wait()`` reserves the next start slot. ``back_off(seconds)`` pushes every
+    later slot past the rate-limit window — so all in-flight workers pause
+    together instead of hammering the API into more 429s — and halves the pace
+    (once per window, however many in-flight calls report it). Each
+    ``succeeded()`` speeds it back up gradually, towards the configured rate.
+    """
+
+    # Slowest pace the back-off can reach (seconds between request starts).
+    MAX_INTERVAL = 1.0
+
+    def __init__(self, rate_per_sec: float):
+        self._base_interval = 1.0 / rate_per_sec if rate_per_sec > 0 else 0.0
+        self._interval = self._base_interval
+        self._next_start = 0.0
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate_per_sec(self) -> float:
+        return 1.0 / self._interval if self._interval else float("inf")
+
+    async def wait(self) -> None:
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def back_off(self, seconds: float) -> None:
+        now = asyncio.get_running_loop().time()
+        # Calls already in flight hit the same window; slow down once per window.
+        if now >= self._paused_until:
+            self._interval = min(self.MAX_INTERVAL, max(self._interval * 2, 0.01))
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._next_start = max(self._next_start, self._paused_until)
+
+    def succeeded(self) -> None:
+        if self._interval > self._base_interval:
+            self._interval = max(self._base_interval, self._interval * 0.9)
+
+
+async def verify_references(
+    references: Iterable[str],
+    *,
+    verify: Optional[VerifyFn] = None,
+    concurrency: Optional[int] = None,
+    rate_per_sec: Optional[float] = None,
+    pacer: Optional[RequestPacer] = None,
+) -> dict[str, dict | Exception]:
+    """Verify many Paystack references concurrently.
+
+    Returns ``{reference: verify data | exception}`` — a failure for one
+    reference never affects the others.
+    """
+    from services.payments_service.routers.intents import PaystackRateLimitedError
+
+    if verify is None:
+        from services.payments_service.routers.intents import (
+            _verify_paystack_transaction as verify,
+        )
+    semaphore = asyncio.Semaphore(concurrency or settings.PAYSTACK_VERIFY_CONCURRENCY)
+    pacer = pacer or RequestPacer(
+        rate_per_sec
+        if rate_per_sec is not None
+        else settings.PAYSTACK_VERIFY_RATE_PER_SEC
+    )
+    results: dict[str, dict | Exception] = {}
+
+    async def _one(reference: str) -> None:
+        async with semaphore:
+            for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+                await pacer.wait()
+                try:
+                    results[reference] = await verify(reference)
+                    pacer.succeeded()
+                    return
+                except PaystackRateLimitedError as exc:
+                    pacer.back_off(exc.retry_after)
+                    results[reference] = exc
+                    if attempt < MAX_RATE_LIMIT_RETRIES:
+                        logger.info(
+                            "Paystack rate-limited; pausing %.1fs", exc.retry_after
+                        )
+                except Exception as exc:  # noqa: BLE001 — per-reference outcome
+                    results[reference] = exc
+                    return
+
+    await asyncio.gather(*(_one(ref) for ref in dict.fromkeys(references)))
+    return results
+
+
+def _parse_paid_at(data: dict) -> Optional[datetime]:
+    raw = data.get("paid_at")
+    if not isinstance(raw, str) or not raw:
+        return None
+    try:
+        return datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+@dataclass
+class ReconcileSummary:
+    candidates: int = 0
+    skipped_resolved: int = 0
+    verified: int = 0
+    paid: int = 0
+    failed: int = 0
+    still_pending: int = 0
+    errors: int = 0
+    elapsed_s: float = 0.0
+
+
+async def _still_pending(ids: list[uuid.UUID]) -> set[uuid.UUID]:
+    async with AsyncSessionLocal() as db:
+        rows = await db.execute(
+            select(Payment.id).where(
+                Payment.id.in_(ids), Payment.status == PaymentStatus.PENDING
+            )
+        )
+        return set(rows.scalars().all())
+
+
+async def _apply_paid(payment_id: uuid.UUID, data: dict) -> None:
+    from services.payments_service.routers.intents import _mark_paid_and_apply
+
+    async with AsyncSessionLocal() as db:
+        payment = await db.get(Payment, payment_id)
+        if payment is None:
+            return
+        await _mark_paid_and_apply(
+            db=db,
+            payment=payment,
+            provider="paystack",
+            provider_reference=payment.reference,
+            paid_at=_parse_paid_at(data),
+            provider_payload={"verify": data, "source": "payments_worker"},
+        )
+
+
+async def _apply_failed(failures: dict[uuid.UUID, tuple[str, dict]]) -> int:
+    """Mark provider-failed payments FAILED in one transaction.
+
+    Rows are locked and re-checked, so a payment a webhook flipped to PAID in
+    the meantime is never overwritten.
+    """
+    async with AsyncSessionLocal() as db:
+        payments = (
+            (
+                await db.execute(
+                    select(Payment)
+                    .where(
+                        Payment.id.in_(list(failures)),
+                        Payment.status == PaymentStatus.PENDING,
+                    )
+                    .with_for_update()
+                )
+            )
+            .scalars()
+            .all()
+        )
+        for payment in payments:
+            provider_status, data = failures[payment.id]
+            payment.status = PaymentStatus.FAILED
+            payment.entitlement_error = f"Provider status: {provider_status}"
+            metadata = dict(payment.payment_metadata or {})
+            metadata["provider_payload"] = {"verify": data, "source": "payments_worker"}
+            payment.payment_metadata = metadata
+        await db.commit()
+        return len(payments)
+
+
+async def reconcile_pending_paystack(
+    *,
+    min_age: timedelta = timedelta(minutes=2),
+    limit: int = RECONCILE_BATCH_LIMIT,
+    wave_size: int = RECONCILE_WAVE_SIZE,
+    verify: Optional[VerifyFn] = None,
+) -> ReconcileSummary:
+    """Verify stale PENDING Paystack payments and advance their state."""
+    started = time.perf_counter()
+    summary = ReconcileSummary()
+    cutoff = utc_now() - min_age
+
+    async with AsyncSessionLocal() as db:
+        candidates = (
+            await db.execute(
+                select(Payment.id, Payment.reference)
+                .where(
+                    Payment.status == PaymentStatus.PENDING,
+                    Payment.provider == "paystack",
+                    Payment.created_at <= cutoff,
+                )
+                .order_by(Payment.created_at.asc())
+                .limit(limit)
+            )
+        ).all()
+    summary.candidates = len(candidates)
+
+    pacer = RequestPacer(settings.PAYSTACK_VERIFY_RATE_PER_SEC)
+    fulfil = asyncio.Semaphore(FULFILLMENT_CONCURRENCY)
+
+    async def _paid(payment_id: uuid.UUID, data: dict) -> bool:
+        async with fulfil:
+            try:
+                await _apply_paid(payment_id, data)
+                return True
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "Applying verified payment %s failed: %s", payment_id, exc
+                )
+                return False
+
+    for i in range(0, len(candidates), wave_size):
+        batch = candidates[i : i + wave_size]
+        # Webhook-first: anything resolved since the list was read is done.
+        pending_ids = await _still_pending([c.id for c in batch])
+        wave = [c for c in batch if c.id in pending_ids]
+        summary.skipped_resolved += len(batch) - len(wave)
+        if not wave:
+            continue
+
+        results = await verify_references(
+            [c.reference for c in wave], verify=verify, pacer=pacer
+        )
+        paid: list = []
+        failures: dict[uuid.UUID, tuple[str, dict]] = {}
+        for c in wave:
+            data = results.get(c.reference)
+            if isinstance(data, Exception) or data is None:
+                summary.errors += 1
+                logger.warning(
+                    "Pending payment verify failed for %s: %s", c.reference, data
+                )
+                continue
+            summary.verified += 1
+            provider_status = str(data.get("status") or "").lower()
+            if provider_status == "success":
+                paid.append((c.id, data))
+            elif provider_status in TERMINAL_FAILURE_STATUSES:
+                failures[c.id] = (provider_status, data)
+            else:
+                summary.still_pending += 1
+
+        if paid:
+            applied = await asyncio.gather(*(_paid(pid, data) for pid, data in paid))
+            summary.paid += sum(applied)
+        if failures:
+            summary.failed += await _apply_failed(failures)
+
+    summary.elapsed_s = time.perf_counter() - started
+    return summary
@@ -210,36 +210,42 @@ async def _active_enrollments(
     return [dict(r) for r in rows]
 
 
-async def _attendance_for_student_in_sessions(
+async def _attendance_for_students_in_sessions(
     db: AsyncSession,
-    member_id: uuid.UUID,
+    member_ids: List[uuid.UUID],
     session_ids: List[uuid.UUID],
-) -> dict[uuid.UUID, str]:
-    """Return {session_id: status} for explicitly-recorded attendance rows.
+) -> dict[tuple[uuid.UUID, uuid.UUID], str]:
+    """Return {(member_id, session_id): status} for explicitly-recorded
+    attendance rows of every student in the block, in one query.
 
-    Sessions without a row default to PRESENT (handled by caller).
+    Pairs without a row are absent from the map (classified "skip" by caller).
     """
-    if not session_ids:
+    if not member_ids or not session_ids:
         return {}
     stmt = text(
         """
-        SELECT session_id, status
+        SELECT member_id, session_id, status
         FROM public.attendance_records
-        WHERE member_id = :member_id
+        WHERE member_id IN :member_ids
           AND session_id IN :session_ids
         """
-    ).bindparams(bindparam("session_ids", expanding=True))
+    ).bindparams(
+        bindparam("member_ids", expanding=True),
+        bindparam("session_ids", expanding=True),
+    )
     rows = (
         (
             await db.execute(
                 stmt,
-                {"member_id": member_id, "session_ids": session_ids},
+                {"member_ids": member_ids, "session_ids": session_ids},
             )
         )
         .mappings()
         .all()
     )
-    return {r["session_id"]: (r["status"] or "").lower() for r in rows}
+    return {
+        (r["member_id"], r["session_id"]): (r["status"] or "").lower() for r in rows
+    }
 
 
 async def _completed_makeups_in_block(
@@ -297,54 +303,64 @@ async def _active_paid_coach_count(db: AsyncSession, cohort_id: uuid.UUID) -> in
     return int(n or 0)
 
 
-async def _delivered_before(
+async def _delivered_before_block(
     db: AsyncSession,
-    student_id: uuid.UUID,
+    member_ids: List[uuid.UUID],
     cohort_id: uuid.UUID,
     block_start: datetime,
+) -> dict[uuid.UUID, List[datetime]]:
+    """Start times of each student's PRESENT/LATE cohort classes that ran
+    BEFORE this block, in one query — the basis for the cumulative
+    per-student class cap (a coach is never paid for more than
+    ``total_classes`` per student).
+
+    The per-enrollment window (after enrolment, before drop/pause) is applied
+    by ``_count_delivered_before`` so one load serves every student.
+    """
+    if not member_ids:
+        return {}
+    stmt = text(
+        """
+        SELECT ar.member_id, s.starts_at
+        FROM public.attendance_records ar
+        JOIN public.sessions s ON s.id = ar.session_id
+        WHERE ar.member_id IN :member_ids
+          AND s.cohort_id = :cohort
+          AND s.session_type = 'cohort_class'
+          AND s.status IS DISTINCT FROM CAST(:cancelled AS session_status_enum)
+          AND s.starts_at < :block_start
+          AND lower(ar.status::text) IN ('present', 'late')
+        """
+    ).bindparams(bindparam("member_ids", expanding=True))
+    rows = await db.execute(
+        stmt,
+        {
+            "member_ids": member_ids,
+            "cohort": cohort_id,
+            "cancelled": CANCELLED_STATUS,
+            "block_start": block_start,
+        },
+    )
+    by_member: dict[uuid.UUID, List[datetime]] = {}
+    for member_id, starts_at in rows.all():
+        by_member.setdefault(member_id, []).append(starts_at)
+    return by_member
+
+
+def _count_delivered_before(
+    starts: List[datetime],
     enrolled_at: datetime,
     dropped_at: Optional[datetime],
-    paused_at: Optional[datetime] = None,
+    paused_at: Optional[datetime],
 ) -> int:
-    """Count a student's PRESENT/LATE classes in eligible cohort sessions that
-    ran BEFORE this block — the basis for the cumulative per-student class cap
-    (a coach is never paid for more than ``total_classes`` per student)."""
-    n = (
-        await db.execute(
-            text(
-                """
-                SELECT count(*)
-                FROM public.attendance_records ar
-                JOIN public.sessions s ON s.id = ar.session_id
-                WHERE ar.member_id = :student
-                  AND s.cohort_id = :cohort
-                  AND s.session_type = 'cohort_class'
-                  AND s.status IS DISTINCT FROM CAST(:cancelled AS session_status_enum)
-                  AND s.starts_at < :block_start
-                  AND s.starts_at > :enrolled_at
-                  AND (
-                      CAST(:dropped_at AS timestamptz) IS NULL
-                      OR s.starts_at < CAST(:dropped_at AS timestamptz)
-                  )
-                  AND (
-                      CAST(:paused_at AS timestamptz) IS NULL
-                      OR s.starts_at < CAST(:paused_at AS timestamptz)
-                  )
-                  AND lower(ar.status::text) IN ('present', 'late')
-                """
-            ),
-            {
-                "student": student_id,
-                "cohort": cohort_id,
-                "cancelled": CANCELLED_STATUS,
-                "block_start": block_start,
-                "enrolled_at": enrolled_at,
-                "dropped_at": dropped_at,
-                "paused_at": paused_at,
-            },
-        )
-    ).scalar()
-    return int(n or 0)
+    """Count prior delivered classes inside one enrollment's eligible window."""
+    return sum(
+        1
+        for starts_at in starts
+        if starts_at > enrolled_at
+        and (dropped_at is None or starts_at < dropped_at)
+        and (paused_at is None or starts_at < paused_at)
+    )
 
 
 def _per_session_amount_kobo(
@@ -431,6 +447,19 @@ async def compute_block_payout(
         per_session_kobo = _per_session_amount_kobo(config, sessions_in_block)
         class_cap = None
 
+    # Attendance and prior-block deliveries for every student in the block are
+    # loaded up front (two queries total, not two per student); the loop below
+    # is pure in-memory classification.
+    member_ids = list({enr["member_id"] for enr in enrollments})
+    attendance = await _attendance_for_students_in_sessions(
+        db, member_ids, [s["id"] for s in sessions]
+    )
+    prior_starts = (
+        await _delivered_before_block(db, member_ids, config.cohort_id, block_start)
+        if use_fixed
+        else {}
+    )
+
     lines: List[StudentBlockLine] = []
     new_makeup_obligations: List[dict] = []
 
@@ -484,15 +513,10 @@ async def compute_block_payout(
                 }
             )
 
-        # Look up explicit attendance for the eligible sessions.
-        attendance = await _attendance_for_student_in_sessions(
-            db, student_id, [s["id"] for s in eligible_sessions]
-        )
-
         excused_count = 0
         delivered_count = 0
         for s in eligible_sessions:
-            status = attendance.get(s["id"])  # None if no row recorded
+            status = attendance.get((student_id, s["id"]))  # None if no row recorded
             classification = classify_session_for_payout(status)
             if classification == "delivered":
                 # Explicit Present/Late attendance row — coach taught the
@@ -522,14 +546,8 @@ async def compute_block_payout(
             # (no double-count). Cap cumulative paid classes per student at
             # total_classes across all blocks: pay only up to the classes still
             # remaining after what prior blocks already covered.
-            prior_delivered = await _delivered_before(
-                db,
-                student_id,
-                config.cohort_id,
-                block_start,
-                enrolled_at,
-                dropped_at,
-                paused_at,
+            prior_delivered = _count_delivered_before(
+                prior_starts.get(student_id, []), enrolled_at, dropped_at, paused_at
             )
             paid_classes = _paid_classes(
                 delivered_count, prior_delivered, class_cap or 0
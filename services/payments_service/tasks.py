@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import defaultdict
 from datetime import datetime, timedelta
 
 from libs.common.datetime_utils import utc_now
@@ -50,83 +52,44 @@ def _payment_next_retry_at(payment: Payment) -> datetime | None:
 
 async def reconcile_pending_paystack_payments() -> None:
     """Verify stale pending Paystack payments and advance state."""
-    from services.payments_service.routers.intents import (
-        _mark_paid_and_apply,
-        _verify_paystack_transaction,
+    from services.payments_service.services.payment_reconciliation import (
+        reconcile_pending_paystack,
     )
 
-    cutoff = utc_now() - timedelta(minutes=2)
-    processed = 0
-
-    async with AsyncSessionLocal() as db:
-        result = await db.execute(
-            select(Payment)
-            .where(
-                Payment.status == PaymentStatus.PENDING,
-                Payment.provider == "paystack",
-                Payment.created_at <= cutoff,
-            )
-            .order_by(Payment.created_at.asc())
-            .limit(200)
+    summary = await reconcile_pending_paystack()
+    if summary.candidates:
+        logger.info(
+            "Reconciled pending Paystack payments: candidates=%d "
+            "skipped_resolved=%d verified=%d paid=%d failed=%d still_pending=%d "
+            "errors=%d in %.1fs (%.1f verifies/s)",
+            summary.candidates,
+            summary.skipped_resolved,
+            summary.verified,
+            summary.paid,
+            summary.failed,
+            summary.still_pending,
+            summary.errors,
+            summary.elapsed_s,
+            summary.verified / summary.elapsed_s if summary.elapsed_s else 0.0,
         )
-        pending = list(result.scalars().all())
-
-        for payment in pending:
-            try:
-                data = await _verify_paystack_transaction(payment.reference)
-            except Exception as exc:
-                logger.warning(
-                    "Pending payment verify failed for %s: %s",
-                    payment.reference,
-                    exc,
-                )
-                continue
 
-            status = str((data.get("status") or "")).lower()
-            if status == "success":
-                paid_at = None
-                paid_at_str = data.get("paid_at")
-                if isinstance(paid_at_str, str) and paid_at_str:
-                    try:
-                        paid_at = datetime.fromisoformat(
-                            paid_at_str.replace("Z", "+00:00")
-                        )
-                    except ValueError:
-                        paid_at = None
-                await _mark_paid_and_apply(
-                    db=db,
-                    payment=payment,
-                    provider="paystack",
-                    provider_reference=payment.reference,
-                    paid_at=paid_at,
-                    provider_payload={"verify": data, "source": "payments_worker"},
-                )
-                processed += 1
-            elif status in {"failed", "abandoned", "reversed"}:
-                payment.status = PaymentStatus.FAILED
-                payment.entitlement_error = f"Provider status: {status}"
-                metadata = dict(payment.payment_metadata or {})
-                metadata["provider_payload"] = {
-                    "verify": data,
-                    "source": "payments_worker",
-                }
-                payment.payment_metadata = metadata
-                db.add(payment)
-                await db.commit()
-                processed += 1
 
-    if processed:
-        logger.info("Reconciled %d pending Paystack payments", processed)
+# Entitlement retries in flight at once. Each holds a pooled DB connection
+# while it calls the owning service, so this stays below the pool size.
+FULFILLMENT_RETRY_CONCURRENCY = 4
 
 
 async def retry_failed_entitlement_fulfillment() -> None:
-    """Retry entitlement fulfillment for paid payments pending application."""
+    """Retry entitlement fulfillment for paid payments pending application.
+
+    Independent payments are retried concurrently (up to
+    ``FULFILLMENT_RETRY_CONCURRENCY``), each in its own session.
+    """
     from services.payments_service.routers.intents import (
         _apply_entitlement_with_tracking,
     )
 
     now = utc_now()
-    processed = 0
 
     async with AsyncSessionLocal() as db:
         result = await db.execute(
@@ -140,20 +103,32 @@ async def retry_failed_entitlement_fulfillment() -> None:
         )
         pending = list(result.scalars().all())
 
-        for payment in pending:
-            # Skip dead-lettered payments (max retries exhausted)
-            fulfillment = (payment.payment_metadata or {}).get("fulfillment") or {}
-            if fulfillment.get("status") == "dead_letter":
-                continue
-
-            next_retry_at = _payment_next_retry_at(payment)
-            if next_retry_at and next_retry_at > now:
-                continue
-
+    due = []
+    for payment in pending:
+        # Skip dead-lettered payments (max retries exhausted)
+        fulfillment = (payment.payment_metadata or {}).get("fulfillment") or {}
+        if fulfillment.get("status") == "dead_letter":
+            continue
+
+        next_retry_at = _payment_next_retry_at(payment)
+        if next_retry_at and next_retry_at > now:
+            continue
+        due.append(payment.id)
+
+    semaphore = asyncio.Semaphore(FULFILLMENT_RETRY_CONCURRENCY)
+
+    async def _retry(payment_id) -> bool:
+        async with semaphore, AsyncSessionLocal() as db:
+            payment = await db.get(Payment, payment_id)
+            # A replay or webhook may have applied it since the list was read.
+            if payment is None or payment.entitlement_applied_at is not None:
+                return False
             await _apply_entitlement_with_tracking(payment)
             db.add(payment)
             await db.commit()
-            processed += 1
+            return True
+
+    processed = sum(await asyncio.gather(*(_retry(pid) for pid in due)))
 
     if processed:
         logger.info("Retried entitlement fulfillment for %d payments", processed)
@@ -173,11 +148,134 @@ def _period_label(block_start: datetime, block_end: datetime, block_index: int)
     )
 
 
+# Cohorts the daily payout sweep works on at once. Configs on the same cohort
+# (lead + assistant) stay serial: they emit the same late-join make-up
+# obligations, which are de-duplicated read-then-insert.
+PAYOUT_SWEEP_CONCURRENCY = 4
+
+
+async def _process_recurring_config(db, config: RecurringPayoutConfig) -> bool:
+    """Generate the due block payout for one config and advance its schedule.
+
+    Commits on success. Returns False when the config had already run all its
+    blocks (marked COMPLETED, no payout created).
+    """
+    # Don't process beyond the configured total.
+    if config.block_index >= config.total_blocks:
+        config.status = RecurringPayoutStatus.COMPLETED
+        db.add(config)
+        await db.commit()
+        return False
+
+    computation = await compute_block_payout(db, config, config.block_index)
+
+    # Insert the PENDING payout row.
+    payout = CoachPayout(
+        coach_member_id=config.coach_member_id,
+        config_id=config.id,
+        block_index=config.block_index,
+        period_start=computation.block_start,
+        period_end=computation.block_end,
+        period_label=_period_label(
+            computation.block_start,
+            computation.block_end,
+            config.block_index,
+        ),
+        academy_earnings=computation.total_kobo,
+        session_earnings=0,
+        other_earnings=0,
+        total_amount=computation.total_kobo,
+        currency=config.currency,
+        status=PayoutStatus.PENDING,
+        admin_notes=(
+            f"Auto-generated from recurring config {config.id}. "
+            f"Block {config.block_index + 1}/{config.total_blocks}. "
+            f"{computation.per_session_amount_kobo} kobo per class "
+            f"× classes delivered, {len(computation.lines)} students "
+            f"= {computation.total_kobo} kobo. Recomputed from final "
+            f"attendance at approval."
+        ),
+    )
+    db.add(payout)
+    await db.flush()  # Need payout.id for makeup credit linking.
+
+    # Mark which make-up obligations were credited in this payout.
+    # Find COMPLETED make-ups in this block window without payout link.
+    makeup_credit_result = await db.execute(
+        select(CohortMakeupObligation).where(
+            CohortMakeupObligation.cohort_id == config.cohort_id,
+            CohortMakeupObligation.coach_member_id == config.coach_member_id,
+            CohortMakeupObligation.status == MakeupStatus.COMPLETED,
+            CohortMakeupObligation.completed_at >= computation.block_start,
+            CohortMakeupObligation.completed_at < computation.block_end,
+            CohortMakeupObligation.pay_credited_in_payout_id.is_(None),
+        )
+    )
+    for obligation in makeup_credit_result.scalars().all():
+        obligation.pay_credited_in_payout_id = payout.id
+
+    # Persist new make-up obligations (de-duped by uniqueness key against
+    # everything already tracked for the cohort, loaded in one query).
+    if computation.new_makeup_obligations:
+        tracked = set(
+            (
+                await db.execute(
+                    select(
+                        CohortMakeupObligation.student_member_id,
+                        CohortMakeupObligation.original_session_id,
+                        CohortMakeupObligation.reason,
+                    ).where(CohortMakeupObligation.cohort_id == config.cohort_id)
+                )
+            ).all()
+        )
+        for new_obligation in computation.new_makeup_obligations:
+            key = (
+                new_obligation["student_member_id"],
+                new_obligation["original_session_id"],
+                new_obligation["reason"],
+            )
+            if key in tracked:
+                continue  # Already tracked.
+            tracked.add(key)
+            db.add(CohortMakeupObligation(**new_obligation))
+
+    # Advance the schedule.
+    config.block_index += 1
+    config.next_run_date = config.next_run_date + timedelta(
+        days=config.block_length_days
+    )
+    if config.block_index >= config.total_blocks:
+        config.status = RecurringPayoutStatus.COMPLETED
+
+    db.add(config)
+    await db.commit()
+
+    # Mirror the accrued coach payout to the ledger (best-effort, §8.1).
+    from services.payments_service.services.ledger_emit import (
+        emit_payout_accrual_to_ledger,
+    )
+
+    await emit_payout_accrual_to_ledger(db, payout)
+    logger.info(
+        "Created PENDING payout %s for coach %s (block %d/%d, total %d kobo)",
+        payout.id,
+        config.coach_member_id,
+        config.block_index,
+        config.total_blocks,
+        computation.total_kobo,
+    )
+    return True
+
+
 async def process_recurring_payouts() -> None:
     """Daily cron: find recurring configs whose next_run_date has arrived,
     compute the block payout, insert a PENDING CoachPayout, persist any
     new make-up obligations, and advance the schedule.
 
+    Independent cohorts are processed concurrently (up to
+    ``PAYOUT_SWEEP_CONCURRENCY``), each in its own DB session; a cohort's
+    configs run in order within that session.
+
     Idempotency:
       - Each config has block_index incremented after a successful run.
       - Late-join obligations are de-duplicated by (cohort, student,
@@ -191,121 +289,39 @@ async def process_recurring_payouts() -> None:
 
     async with AsyncSessionLocal() as db:
         result = await db.execute(
-            select(RecurringPayoutConfig).where(
+            select(RecurringPayoutConfig.id, RecurringPayoutConfig.cohort_id)
+            .where(
                 RecurringPayoutConfig.status == RecurringPayoutStatus.ACTIVE,
                 RecurringPayoutConfig.next_run_date <= now,
             )
+            .order_by(RecurringPayoutConfig.next_run_date)
         )
-        configs = list(result.scalars().all())
-
-        for config in configs:
-            try:
-                # Don't process beyond the configured total.
-                if config.block_index >= config.total_blocks:
-                    config.status = RecurringPayoutStatus.COMPLETED
-                    db.add(config)
-                    await db.commit()
-                    continue
-
-                computation = await compute_block_payout(db, config, config.block_index)
-
-                # Insert the PENDING payout row.
-                payout = CoachPayout(
-                    coach_member_id=config.coach_member_id,
-                    config_id=config.id,
-                    block_index=config.block_index,
-                    period_start=computation.block_start,
-                    period_end=computation.block_end,
-                    period_label=_period_label(
-                        computation.block_start,
-                        computation.block_end,
-                        config.block_index,
-                    ),
-                    academy_earnings=computation.total_kobo,
-                    session_earnings=0,
-                    other_earnings=0,
-                    total_amount=computation.total_kobo,
-                    currency=config.currency,
-                    status=PayoutStatus.PENDING,
-                    admin_notes=(
-                        f"Auto-generated from recurring config {config.id}. "
-                        f"Block {config.block_index + 1}/{config.total_blocks}. "
-                        f"{computation.per_session_amount_kobo} kobo per class "
-                        f"× classes delivered, {len(computation.lines)} students "
-                        f"= {computation.total_kobo} kobo. Recomputed from final "
-                        f"attendance at approval."
-                    ),
-                )
-                db.add(payout)
-                await db.flush()  # Need payout.id for makeup credit linking.
-
-                # Mark which make-up obligations were credited in this payout.
-                # Find COMPLETED make-ups in this block window without payout link.
-                makeup_credit_result = await db.execute(
-                    select(CohortMakeupObligation).where(
-                        CohortMakeupObligation.cohort_id == config.cohort_id,
-                        CohortMakeupObligation.coach_member_id
-                        == config.coach_member_id,
-                        CohortMakeupObligation.status == MakeupStatus.COMPLETED,
-                        CohortMakeupObligation.completed_at >= computation.block_start,
-                        CohortMakeupObligation.completed_at < computation.block_end,
-                        CohortMakeupObligation.pay_credited_in_payout_id.is_(None),
-                    )
-                )
-                for obligation in makeup_credit_result.scalars().all():
-                    obligation.pay_credited_in_payout_id = payout.id
-
-                # Persist new make-up obligations (de-duped by uniqueness key).
-                for new_obligation in computation.new_makeup_obligations:
-                    existing = await db.execute(
-                        select(CohortMakeupObligation).where(
-                            CohortMakeupObligation.cohort_id
-                            == new_obligation["cohort_id"],
-                            CohortMakeupObligation.student_member_id
-                            == new_obligation["student_member_id"],
-                            CohortMakeupObligation.original_session_id
-                            == new_obligation["original_session_id"],
-                            CohortMakeupObligation.reason == new_obligation["reason"],
-                        )
-                    )
-                    if existing.scalar_one_or_none():
-                        continue  # Already tracked.
-                    db.add(CohortMakeupObligation(**new_obligation))
-
-                # Advance the schedule.
-                config.block_index += 1
-                config.next_run_date = config.next_run_date + timedelta(
-                    days=config.block_length_days
-                )
-                if config.block_index >= config.total_blocks:
-                    config.status = RecurringPayoutStatus.COMPLETED
+        by_cohort: dict = defaultdict(list)
+        for config_id, cohort_id in result.all():
+            by_cohort[cohort_id].append(config_id)
 
-                db.add(config)
-                await db.commit()
+    semaphore = asyncio.Semaphore(PAYOUT_SWEEP_CONCURRENCY)
 
-                # Mirror the accrued coach payout to the ledger (best-effort, §8.1).
-                from services.payments_service.services.ledger_emit import (
-                    emit_payout_accrual_to_ledger,
-                )
+    async def _run_cohort(config_ids: list) -> None:
+        nonlocal processed, failed
+        async with semaphore, AsyncSessionLocal() as db:
+            for config_id in config_ids:
+                try:
+                    config = await db.get(RecurringPayoutConfig, config_id)
+                    if config is not None and await _process_recurring_config(
+                        db, config
+                    ):
+                        processed += 1
+                except Exception as exc:  # noqa: BLE001
+                    await db.rollback()
+                    failed += 1
+                    logger.exception(
+                        "Failed to process recurring payout config %s: %s",
+                        config_id,
+                        exc,
+                    )
 
-                await emit_payout_accrual_to_ledger(db, payout)
-                processed += 1
-                logger.info(
-                    "Created PENDING payout %s for coach %s (block %d/%d, total %d kobo)",
-                    payout.id,
-                    config.coach_member_id,
-                    config.block_index,
-                    config.total_blocks,
-                    computation.total_kobo,
-                )
-            except Exception as exc:  # noqa: BLE001
-                await db.rollback()
-                failed += 1
-                logger.exception(
-                    "Failed to process recurring payout config %s: %s",
-                    config.id,
-                    exc,
-                )
+    await asyncio.gather(*(_run_cohort(ids) for ids in by_cohort.values()))
 
     if processed or failed:
         logger.info(
@@ -0,0 +1,23 @@
+"""Alembic script template for pools service."""
+
+revision = "5c1e8a7f3d92"
+down_revision = '49800070bb20'
+branch_labels = None
+depends_on = None
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_pools_lat_lon',
+        'pools',
+        ['latitude', 'longitude'],
+        unique=False,
+        postgresql_where=sa.text('latitude IS NOT NULL AND longitude IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pools_lat_lon', table_name='pools')
@@ -7,7 +7,17 @@ from typing import TYPE_CHECKING, Optional
 
 from libs.common.datetime_utils import utc_now
 from libs.db.base import Base
-from sqlalchemy import Boolean, DateTime, Float, Integer, Numeric, String, Text
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -37,6 +47,15 @@ class Pool(Base):
     """
 
     __tablename__ = "pools"
+    __table_args__ = (
+        # Bounding-box range scans for "pools near me" (see services/geo.py).
+        Index(
+            "ix_pools_lat_lon",
+            "latitude",
+            "longitude",
+            postgresql_where=text("latitude IS NOT NULL AND longitude IS NOT NULL"),
+        ),
+    )
 
     # ── Identity ──────────────────────────────────────────────────────────
     id: Mapped[uuid.UUID] = mapped_column(
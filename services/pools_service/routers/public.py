@@ -9,11 +9,24 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from services.pools_service.models import PartnershipStatus, Pool, PoolType
-from services.pools_service.schemas import PoolListResponse, PoolResponse
+from services.pools_service.schemas import (
+    PoolListResponse,
+    PoolNearbyListResponse,
+    PoolNearbyResponse,
+    PoolResponse,
+)
+from services.pools_service.services.geo import find_nearby_pools
 
 router = APIRouter(tags=["pools"])
 
 
+def _partner_pools_query():
+    return select(Pool).where(
+        Pool.partnership_status == PartnershipStatus.ACTIVE_PARTNER,
+        Pool.is_active.is_(True),
+    )
+
+
 @router.get("", response_model=PoolListResponse)
 async def list_partner_pools(
     pool_type: Optional[PoolType] = None,
@@ -24,10 +37,7 @@ async def list_partner_pools(
     db: AsyncSession = Depends(get_async_db),
 ):
     """List active partner pools (public-facing)."""
-    query = select(Pool).where(
-        Pool.partnership_status == PartnershipStatus.ACTIVE_PARTNER,
-        Pool.is_active.is_(True),
-    )
+    query = _partner_pools_query()
 
     if pool_type is not None:
         query = query.where(Pool.pool_type == pool_type)
@@ -54,6 +64,51 @@ async def list_partner_pools(
     )
 
 
+@router.get("/nearby", response_model=PoolNearbyListResponse)
+async def list_nearby_partner_pools(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius_km: Optional[float] = Query(None, gt=0, le=500),
+    min_score: Optional[float] = Query(None, ge=0, le=5),
+    pool_type: Optional[PoolType] = None,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Active partner pools nearest to (lat, lon), closest first.
+
+    Pools without coordinates are left out. ``radius_km`` bounds the search;
+    without it every geocoded pool is ranked.
+    """
+    query = _partner_pools_query()
+    if pool_type is not None:
+        query = query.where(Pool.pool_type == pool_type)
+
+    rows, total = await find_nearby_pools(
+        db,
+        query,
+        lat=lat,
+        lon=lon,
+        radius_km=radius_km,
+        min_score=min_score,
+        offset=(page - 1) * page_size,
+        limit=page_size,
+    )
+
+    return PoolNearbyListResponse(
+        items=[
+            PoolNearbyResponse(
+                **PoolResponse.model_validate(pool).model_dump(),
+                distance_km=round(distance, 3),
+            )
+            for pool, distance in rows
+        ],
+        total=total,
+        page=page,
+        page_size=page_size,
+    )
+
+
 @router.get("/{pool_id}", response_model=PoolResponse)
 async def get_partner_pool(
     pool_id: uuid.UUID,
@@ -3,6 +3,8 @@
 from services.pools_service.schemas.main import (
     PoolCreate,
     PoolListResponse,
+    PoolNearbyListResponse,
+    PoolNearbyResponse,
     PoolResponse,
     PoolUpdate,
 )
@@ -33,6 +35,8 @@ __all__ = [
     # main
     "PoolCreate",
     "PoolListResponse",
+    "PoolNearbyListResponse",
+    "PoolNearbyResponse",
     "PoolResponse",
     "PoolUpdate",
     # submissions
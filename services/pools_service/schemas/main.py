@@ -176,3 +176,18 @@ class PoolListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+
+
+class PoolNearbyResponse(PoolResponse):
+    """A pool with its great-circle distance from the search point."""
+
+    distance_km: float
+
+
+class PoolNearbyListResponse(BaseModel):
+    """Paginated pools ranked by distance (nearest first)."""
+
+    items: list[PoolNearbyResponse]
+    total: int
+    page: int
+    page_size: int
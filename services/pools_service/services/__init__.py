@@ -1,8 +1,14 @@
 """Pools service — business logic helpers."""
 
+from services.pools_service.services.geo import find_nearby_pools, haversine_km
 from services.pools_service.services.scoring import (
     compute_pool_score,
     recompute_pool_score,
 )
 
-__all__ = ["compute_pool_score", "recompute_pool_score"]
+__all__ = [
+    "compute_pool_score",
+    "find_nearby_pools",
+    "haversine_km",
+    "recompute_pool_score",
+]
@@ -0,0 +1,139 @@
+"""Distance search over pool coordinates ("pools near me").
+
+Works on vanilla Postgres — no PostGIS. ``Pool.latitude``/``longitude`` carry
+a composite B-tree index (``ix_pools_lat_lon``), so a latitude/longitude
+bounding box is an index range scan. Exact great-circle distance (haversine)
+is then computed only for the pools inside the box and used for the final
+radius check and ordering.
+
+Without an explicit radius the search widens ring by ring (``SEARCH_RINGS_KM``)
+until the requested page is filled by pools that are provably the nearest: a
+pool within ring ``r`` is always inside ring ``r``'s box, so anything outside
+the box is farther than every pool already returned.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import Select, and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from services.pools_service.models import Pool
+
+EARTH_RADIUS_KM = 6371.0088
+# Successive search radii when no radius is given; None = no bound.
+SEARCH_RINGS_KM: tuple[Optional[float], ...] = (5.0, 20.0, 80.0, 320.0, 1280.0, None)
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+    min_lat: float
+    max_lat: float
+    # None when the box spans every longitude (near a pole or the antimeridian)
+    min_lon: Optional[float]
+    max_lon: Optional[float]
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in km between two coordinates."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lon2 - lon1)
+    a = (
+        math.sin(dphi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(lat: float, lon: float, radius_km: float) -> BoundingBox:
+    """Smallest lat/lon box containing every point within ``radius_km``."""
+    dlat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat, max_lat = lat - dlat, lat + dlat
+    if min_lat <= -90 or max_lat >= 90:
+        return BoundingBox(max(min_lat, -90.0), min(max_lat, 90.0), None, None)
+    # Widest longitude span sits at the box's pole-ward edge.
+    widest_lat = math.radians(max(abs(min_lat), abs(max_lat)))
+    dlon = math.degrees(radius_km / (EARTH_RADIUS_KM * math.cos(widest_lat)))
+    if lon - dlon < -180 or lon + dlon > 180:
+        return BoundingBox(min_lat, max_lat, None, None)
+    return BoundingBox(min_lat, max_lat, lon - dlon, lon + dlon)
+
+
+def distance_km_expr(lat: float, lon: float) -> ColumnElement[float]:
+    """SQL haversine distance (km) from (lat, lon) to each pool."""
+    phi1 = math.radians(lat)
+    dphi = func.radians(Pool.latitude) - phi1
+    dlmb = func.radians(Pool.longitude) - math.radians(lon)
+    a = func.power(func.sin(dphi / 2), 2) + math.cos(phi1) * func.cos(
+        func.radians(Pool.latitude)
+    ) * func.power(func.sin(dlmb / 2), 2)
+    return 2 * EARTH_RADIUS_KM * func.asin(func.least(1.0, func.sqrt(a)))
+
+
+def _within(box: BoundingBox) -> ColumnElement[bool]:
+    clauses = [Pool.latitude.between(box.min_lat, box.max_lat)]
+    if box.min_lon is not None:
+        clauses.append(Pool.longitude.between(box.min_lon, box.max_lon))
+    return and_(*clauses)
+
+
+def _located(base: Select) -> Select:
+    return base.where(Pool.latitude.is_not(None), Pool.longitude.is_not(None))
+
+
+async def find_nearby_pools(
+    db: AsyncSession,
+    base: Select,
+    *,
+    lat: float,
+    lon: float,
+    radius_km: Optional[float] = None,
+    min_score: Optional[float] = None,
+    offset: int = 0,
+    limit: int = 20,
+) -> tuple[list[tuple[Pool, float]], int]:
+    """Pools from ``base`` (a ``select(Pool)`` with filters) ranked by distance.
+
+    Returns ``([(pool, distance_km), ...], total)`` where ``total`` counts every
+    geocoded match within ``radius_km`` (or anywhere, when no radius is given).
+    """
+    base = _located(base)
+    if min_score is not None:
+        base = base.where(Pool.computed_score >= Decimal(str(min_score)))
+    distance = distance_km_expr(lat, lon).label("distance_km")
+
+    def ranked(radius: Optional[float]) -> Select:
+        query = base.add_columns(distance)
+        if radius is not None:
+            query = query.where(_within(bounding_box(lat, lon, radius))).where(
+                distance <= radius
+            )
+        return query.order_by(distance, Pool.id)
+
+    def counted(radius: Optional[float]) -> Select:
+        query = base
+        if radius is not None:
+            query = query.where(_within(bounding_box(lat, lon, radius))).where(
+                distance_km_expr(lat, lon) <= radius
+            )
+        return select(func.count()).select_from(query.subquery())
+
+    total = (await db.execute(counted(radius_km))).scalar() or 0
+
+    if radius_km is not None:
+        rows = (await db.execute(ranked(radius_km).offset(offset).limit(limit))).all()
+        return [(pool, float(dist)) for pool, dist in rows], total
+
+    wanted = min(offset + limit, total)
+    rows = []
+    for ring in SEARCH_RINGS_KM:
+        rows = (await db.execute(ranked(ring).limit(offset + limit))).all()
+        if len(rows) >= wanted:
+            break
+    return [(pool, float(dist)) for pool, dist in rows[offset:]], total
@@ -0,0 +1,166 @@
+"""Process-local cache of parsed weather snapshots.
+
+Snapshots change at most once per TTL (``WEATHER_CACHE_TTL_MINUTES``), so the
+read API keeps the already-validated response model in memory instead of
+loading and decoding the JSONB forecast from Postgres on every request.
+
+Entries are keyed by location key, with a pool_id → location key index for the
+by-pool route. Freshness follows the snapshot's own ``expires_at`` (the same
+test as ``is_stale``):
+
+* fresh          — served from memory;
+* stale          — still served (flagged ``stale``) while one background task
+                   per key re-runs ``get_or_fetch`` and swaps the entry in;
+* stale too long — past ``MAX_STALE`` the caller refetches inline.
+
+Each worker process has its own cache; the Redis fetch lock in
+``snapshot_service`` keeps their refreshes from stampeding the provider.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from libs.common.datetime_utils import utc_now
+from libs.common.logging import get_logger
+from libs.db.config import AsyncSessionLocal
+from services.pools_service.weather.models import WeatherSnapshot
+from services.pools_service.weather.schemas import WeatherSnapshotResponse
+from services.pools_service.weather.snapshot_service import get_or_fetch
+
+logger = get_logger(__name__)
+
+MAX_ENTRIES = 2048
+# How long past expiry a snapshot may still be served while it revalidates.
+MAX_STALE = timedelta(hours=6)
+
+
+@dataclass
+class CachedSnapshot:
+    """A parsed snapshot plus what's needed to serve and revalidate it."""
+
+    response: WeatherSnapshotResponse
+    expires_at: datetime
+
+    @property
+    def location_key(self) -> str:
+        return self.response.location_key
+
+    def is_stale(self, now: Optional[datetime] = None) -> bool:
+        return self.expires_at <= (now or utc_now())
+
+    def is_servable(self, now: Optional[datetime] = None) -> bool:
+        return (now or utc_now()) < self.expires_at + MAX_STALE
+
+    def etag(self, date: Optional[str] = None) -> str:
+        """Validator for one rendering (forecast version × day slice × stale)."""
+        raw = (
+            f"{self.location_key}|{self.response.fetched_at.isoformat()}|"
+            f"{date or ''}|{int(self.is_stale())}"
+        )
+        return f'W/"{hashlib.sha1(raw.encode()).hexdigest()[:20]}"'
+
+    def max_age(self) -> int:
+        """Seconds until this entry goes stale (0 once it has)."""
+        return max(0, int((self.expires_at - utc_now()).total_seconds()))
+
+
+class SnapshotCache:
+    """LRU of ``CachedSnapshot`` with single-flight background revalidation."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CachedSnapshot] = OrderedDict()
+        self._by_pool: dict[uuid.UUID, str] = {}
+        self._refreshing: dict[str, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, location_key: str) -> Optional[CachedSnapshot]:
+        entry = self._entries.get(location_key)
+        if entry is None:
+            return None
+        if not entry.is_servable():
+            self._drop(location_key)
+            return None
+        self._entries.move_to_end(location_key)
+        return entry
+
+    def get_by_pool(self, pool_id: uuid.UUID) -> Optional[CachedSnapshot]:
+        location_key = self._by_pool.get(pool_id)
+        return self.get(location_key) if location_key else None
+
+    def put(
+        self,
+        snapshot: WeatherSnapshot,
+        *,
+        pool_id: Optional[uuid.UUID] = None,
+    ) -> CachedSnapshot:
+        """Cache ``snapshot`` (replacing any entry for its location)."""
+        entry = CachedSnapshot(
+            response=WeatherSnapshotResponse.model_validate(snapshot),
+            expires_at=snapshot.expires_at,
+        )
+        self._entries[entry.location_key] = entry
+        self._entries.move_to_end(entry.location_key)
+        for pid in {pool_id, snapshot.pool_id} - {None}:
+            self._by_pool[pid] = entry.location_key
+        while len(self._entries) > self._max_entries:
+            oldest, _ = self._entries.popitem(last=False)
+            self._forget_pools(oldest)
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_pool.clear()
+
+    def revalidate(
+        self,
+        entry: CachedSnapshot,
+        *,
+        pool_id: Optional[uuid.UUID] = None,
+    ) -> None:
+        """Refresh a stale entry in the background (at most one task per key)."""
+        key = entry.location_key
+        if key in self._refreshing:
+            return
+        task = asyncio.create_task(self._refresh(entry, pool_id))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _refresh(
+        self, entry: CachedSnapshot, pool_id: Optional[uuid.UUID]
+    ) -> None:
+        resp = entry.response
+        try:
+            async with AsyncSessionLocal() as db:
+                snapshot = await get_or_fetch(
+                    db,
+                    latitude=resp.latitude,
+                    longitude=resp.longitude,
+                    pool_id=pool_id or resp.pool_id,
+                    label=resp.label,
+                )
+            self.put(snapshot, pool_id=pool_id)
+        except Exception as exc:  # noqa: BLE001 — keep serving the stale entry
+            logger.warning(
+                "weather.revalidate_failed key=%s err=%s", entry.location_key, exc
+            )
+
+    def _drop(self, location_key: str) -> None:
+        self._entries.pop(location_key, None)
+        self._forget_pools(location_key)
+
+    def _forget_pools(self, location_key: str) -> None:
+        for pid in [p for p, k in self._by_pool.items() if k == location_key]:
+            del self._by_pool[pid]
+
+
+snapshot_cache = SnapshotCache()
@@ -12,8 +12,9 @@ provider gets wired in. See docs/design/WEATHER_SERVICE_DESIGN.md.
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-from typing import Optional, Protocol
+from typing import Optional, Protocol, Sequence, Union
 
 import httpx
 
@@ -39,6 +40,10 @@ _DAILY_FIELDS = [
 ]
 
 _MAX_FORECAST_DAYS = 16  # Open-Meteo serves at most 16 forecast days
+# Coordinates per multi-location request; keeps the query string well under
+# URL limits while turning a 200-pool refresh into a handful of calls.
+_MAX_LOCATIONS_PER_REQUEST = 50
+_BATCH_CONCURRENCY = 4
 
 
 @dataclass
@@ -60,6 +65,20 @@ class WeatherProvider(Protocol):
         self, *, latitude: float, longitude: float, days: int, timezone: str
     ) -> ForecastData: ...
 
+    async def fetch_forecasts(
+        self,
+        *,
+        coords: Sequence[tuple[float, float]],
+        days: int,
+        timezone: str,
+    ) -> list[Union[ForecastData, Exception]]:
+        """Forecasts for many locations, aligned with ``coords``.
+
+        A failed upstream request fills its locations' slots with the
+        exception instead of raising, so one bad batch doesn't sink the rest.
+        """
+        ...
+
 
 class OpenMeteoProvider:
     """Open-Meteo implementation (https://open-meteo.com/)."""
@@ -98,6 +117,57 @@ class OpenMeteoProvider:
 
         return parse_open_meteo(data, fallback_timezone=timezone)
 
+    async def fetch_forecasts(
+        self,
+        *,
+        coords: Sequence[tuple[float, float]],
+        days: int,
+        timezone: str,
+    ) -> list[Union[ForecastData, Exception]]:
+        # Open-Meteo takes comma-separated coordinate lists and answers with
+        # one result per location, in order (a bare object for a single one).
+        results: list[Union[ForecastData, Exception]] = [None] * len(coords)
+        semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+        async def _chunk(client: httpx.AsyncClient, start: int) -> None:
+            chunk = coords[start : start + _MAX_LOCATIONS_PER_REQUEST]
+            params = {
+                "latitude": ",".join(str(lat) for lat, _ in chunk),
+                "longitude": ",".join(str(lon) for _, lon in chunk),
+                "hourly": ",".join(_HOURLY_FIELDS),
+                "daily": ",".join(_DAILY_FIELDS),
+                "timezone": timezone,
+                "forecast_days": max(1, min(int(days), _MAX_FORECAST_DAYS)),
+            }
+            if self._api_key:
+                params["apikey"] = self._api_key
+            try:
+                async with semaphore:
+                    resp = await client.get(self._base_url, params=params)
+                resp.raise_for_status()
+                data = resp.json()
+                items = data if isinstance(data, list) else [data]
+                if len(items) != len(chunk):
+                    raise ValueError(
+                        f"expected {len(chunk)} forecasts, got {len(items)}"
+                    )
+                for i, item in enumerate(items):
+                    results[start + i] = parse_open_meteo(
+                        item, fallback_timezone=timezone
+                    )
+            except Exception as exc:  # noqa: BLE001 — reported per location
+                for i in range(len(chunk)):
+                    results[start + i] = exc
+
+        async with httpx.AsyncClient(timeout=self._timeout) as client:
+            await asyncio.gather(
+                *(
+                    _chunk(client, start)
+                    for start in range(0, len(coords), _MAX_LOCATIONS_PER_REQUEST)
+                )
+            )
+        return results
+
 
 def parse_open_meteo(
     data: dict, *, fallback_timezone: str = "Africa/Lagos"
@@ -125,4 +195,6 @@ def get_provider() -> WeatherProvider:
             "weather: unknown WEATHER_PROVIDER=%r, falling back to open-meteo",
             provider,
         )
-    return OpenMeteoProvider(api_key=api_key)
+    return OpenMeteoProvider(
+        base_url=settings.WEATHER_API_BASE_URL or _OPEN_METEO_URL, api_key=api_key
+    )
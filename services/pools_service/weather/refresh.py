@@ -14,7 +14,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from libs.common.logging import get_logger
 from services.pools_service.models import Pool
-from services.pools_service.weather.snapshot_service import fetch_and_store
+from services.pools_service.weather.snapshot_service import (
+    ForecastTarget,
+    fetch_and_store_many,
+)
 
 logger = get_logger(__name__)
 
@@ -31,43 +34,65 @@ def _active_pools_query():
 
 
 async def refresh_all_pools(db: AsyncSession) -> dict:
-    """Pre-fetch and cache a forecast for every active pool with coordinates."""
+    """Pre-fetch and cache a forecast for every active pool with coordinates.
+
+    Pools are deduplicated by location key and fetched in multi-location
+    provider requests, then the snapshots are upserted in bulk. Pools that
+    share a location all count as refreshed from the one fetch.
+    """
     result = await db.execute(_active_pools_query())
     pools = result.scalars().all()
 
-    refreshed = 0
-    failed = 0
     skipped_no_coords = 0
-    pool_ids: list[str] = []
-
+    targets: list[tuple[str, ForecastTarget]] = []
     for pool in pools:
         if pool.latitude is None or pool.longitude is None:
             skipped_no_coords += 1
             continue
-        try:
-            await fetch_and_store(
-                db,
-                latitude=pool.latitude,
-                longitude=pool.longitude,
-                pool_id=pool.id,
-                label=pool.location_area or pool.name,
+        targets.append(
+            (
+                str(pool.id),
+                ForecastTarget(
+                    latitude=pool.latitude,
+                    longitude=pool.longitude,
+                    pool_id=pool.id,
+                    label=pool.location_area or pool.name,
+                ),
             )
+        )
+
+    try:
+        outcomes = await fetch_and_store_many(db, [t for _, t in targets])
+    except Exception as exc:  # noqa: BLE001 — report the run as failed, don't raise
+        logger.warning("weather.refresh_failed err=%s", exc)
+        await db.rollback()
+        outcomes = {t.location_key: exc for _, t in targets}
+
+    refreshed = 0
+    failed = 0
+    pool_ids: list[str] = []
+    for pool_id, target in targets:
+        error = outcomes.get(target.location_key)
+        if error is None:
             refreshed += 1
-            pool_ids.append(str(pool.id))
-        except Exception as exc:  # noqa: BLE001 — one bad pool shouldn't abort the run
+            pool_ids.append(pool_id)
+        else:
             failed += 1
-            logger.warning("weather.refresh_failed pool=%s err=%s", pool.id, exc)
+            logger.warning("weather.refresh_failed pool=%s err=%s", pool_id, error)
 
     logger.info(
-        "weather.refresh complete: refreshed=%s failed=%s skipped_no_coords=%s",
+        "weather.refresh complete: refreshed=%s failed=%s skipped_no_coords=%s "
+        "locations=%s",
         refreshed,
         failed,
         skipped_no_coords,
+        len(outcomes),
     )
     return {
         "refreshed": refreshed,
         "failed": failed,
         "skipped_no_coords": skipped_no_coords,
+        "locations": len(outcomes),
         "pool_ids": pool_ids,
     }
 
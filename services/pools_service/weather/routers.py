@@ -10,12 +10,22 @@ from __future__ import annotations
 import uuid
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from libs.auth.dependencies import get_current_user, require_admin
 from libs.auth.models import AuthUser
+from libs.common.http_cache import etag_matches
 from libs.db.session import get_async_db
+from services.pools_service.weather.cache import CachedSnapshot, snapshot_cache
 from services.pools_service.weather.models import WeatherSnapshot
 from services.pools_service.weather.refresh import get_pool_coords, refresh_all_pools
 from services.pools_service.weather.schemas import (
@@ -27,6 +37,7 @@ from services.pools_service.weather.snapshot_service import (
     get_snapshot_by_pool,
     is_stale,
     list_snapshots,
+    normalize_location_key,
 )
 
 member_router = APIRouter(tags=["weather"])
@@ -80,11 +91,42 @@ def to_response(
     return resp
 
 
+def cached_to_response(
+    entry: CachedSnapshot, *, date: Optional[str] = None
+) -> WeatherSnapshotResponse:
+    """``to_response`` for a cached entry (no re-validation of the forecast)."""
+    base = entry.response
+    update: dict = {"stale": entry.is_stale()}
+    if date:
+        update["hourly"] = slice_hourly(base.hourly or {}, date)
+        update["daily"] = slice_daily(base.daily, date)
+    return base.model_copy(update=update)
+
+
+def _serve(
+    entry: CachedSnapshot,
+    request: Request,
+    response: Response,
+    date: Optional[str],
+):
+    etag = entry.etag(date)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={entry.max_age()}",
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return cached_to_response(entry, date=date)
+
+
 # ----------------------------------------------------------------------------
 # Member endpoints — mounted at /weather
 # ----------------------------------------------------------------------------
 @member_router.get("", response_model=WeatherSnapshotResponse)
 async def get_weather(
+    request: Request,
+    response: Response,
     lat: float = Query(..., ge=-90, le=90, description="Latitude"),
     lon: float = Query(..., ge=-180, le=180, description="Longitude"),
     date: Optional[str] = Query(
@@ -95,14 +137,26 @@ async def get_weather(
     _: AuthUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_db),
 ):
-    """Cached forecast for any coordinates (cache-aside)."""
-    snapshot = await get_or_fetch(db, latitude=lat, longitude=lon)
-    return to_response(snapshot, date=date)
+    """Cached forecast for any coordinates (cache-aside).
+
+    Served from the in-process cache when possible; a stale entry is returned
+    (``stale: true``) while it revalidates in the background. Supports
+    ``If-None-Match`` (304 when the client's copy is current).
+    """
+    entry = snapshot_cache.get(normalize_location_key(lat, lon))
+    if entry is None:
+        snapshot = await get_or_fetch(db, latitude=lat, longitude=lon)
+        entry = snapshot_cache.put(snapshot)
+    elif entry.is_stale():
+        snapshot_cache.revalidate(entry)
+    return _serve(entry, request, response, date)
 
 
 @member_router.get("/pools/{pool_id}", response_model=WeatherSnapshotResponse)
 async def get_weather_for_pool(
     pool_id: uuid.UUID,
+    request: Request,
+    response: Response,
     date: Optional[str] = Query(
         None,
         description="Optional YYYY-MM-DD to return only that day's hours",
@@ -113,9 +167,17 @@ async def get_weather_for_pool(
 ):
     """Cached forecast for a specific pool.
 
-    Fast path: the pre-fetched snapshot. On a cache miss, resolve the pool's
-    coordinates directly from the Pool table (same service, no HTTP).
+    Fastest path: the in-process cache (stale entries revalidate in the
+    background). Then the pre-fetched snapshot. On a cache miss, resolve the
+    pool's coordinates directly from the Pool table (same service, no HTTP).
+    Supports ``If-None-Match``.
     """
+    entry = snapshot_cache.get_by_pool(pool_id)
+    if entry is not None:
+        if entry.is_stale():
+            snapshot_cache.revalidate(entry, pool_id=pool_id)
+        return _serve(entry, request, response, date)
+
     snapshot = await get_snapshot_by_pool(db, pool_id)
     if snapshot is not None:
         snapshot = await get_or_fetch(
@@ -125,7 +187,8 @@ async def get_weather_for_pool(
             pool_id=pool_id,
             label=snapshot.label,
         )
-        return to_response(snapshot, date=date)
+        entry = snapshot_cache.put(snapshot, pool_id=pool_id)
+        return _serve(entry, request, response, date)
 
     coords = await get_pool_coords(db, pool_id)
     if coords is None:
@@ -137,7 +200,8 @@ async def get_weather_for_pool(
     snapshot = await get_or_fetch(
         db, latitude=lat, longitude=lon, pool_id=pool_id, label=label
     )
-    return to_response(snapshot, date=date)
+    entry = snapshot_cache.put(snapshot, pool_id=pool_id)
+    return _serve(entry, request, response, date)
 
 
 # ----------------------------------------------------------------------------
@@ -150,6 +214,8 @@ async def trigger_refresh(
 ):
     """Force a synchronous pre-fetch of every active pool's forecast."""
     result = await refresh_all_pools(db)
+    # Drop this process's cached copies so reads pick up the new snapshots.
+    snapshot_cache.clear()
     return WeatherRefreshResult(**result)
 
 
@@ -41,4 +41,5 @@ class WeatherRefreshResult(BaseModel):
     refreshed: int = 0
     failed: int = 0
     skipped_no_coords: int = 0
+    locations: int = 0  # distinct location keys fetched (pools can share one)
     pool_ids: list[str] = Field(default_factory=list)
@@ -1,22 +1,64 @@
-"""Snapshot storage + cache-aside logic for the weather module."""
+"""Snapshot storage + cache-aside logic for the weather module.
+
+Live fetches for a stale location are single-flight across workers: the first
+request takes a short Redis lock on the location key and refetches; the others
+serve the stale row (or wait briefly for the first fetch when there is none)
+instead of each hitting the provider.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import uuid
+from dataclasses import dataclass
 from datetime import timedelta
-from typing import Optional
+from typing import Optional, Sequence, Union
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from libs.common.config import get_settings
 from libs.common.datetime_utils import utc_now
 from libs.common.logging import get_logger
+from libs.common.redis import get_redis
 from services.pools_service.weather.models import WeatherSnapshot
 from services.pools_service.weather.provider import ForecastData, get_provider
 
 logger = get_logger(__name__)
 
+# Single-flight lock per location key. The TTL outlives a slow provider call;
+# waiters without a snapshot to fall back on poll for the winner's row.
+_FETCH_LOCK_PREFIX = "weather:fetch:"
+_FETCH_LOCK_TTL_MS = 30_000
+_FETCH_WAIT_SECONDS = 10.0
+_FETCH_POLL_SECONDS = 0.25
+# Rows per bulk upsert statement (each carries a multi-day JSONB forecast).
+_UPSERT_CHUNK = 100
+
+# Delete the lock only if we still own it (it may have expired and been
+# re-taken by another worker).
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+@dataclass
+class ForecastTarget:
+    """A location to refresh, with the pool/label to stamp on its snapshot."""
+
+    latitude: float
+    longitude: float
+    pool_id: Optional[uuid.UUID] = None
+    label: Optional[str] = None
+
+    @property
+    def location_key(self) -> str:
+        return normalize_location_key(self.latitude, self.longitude)
+
 
 def normalize_location_key(latitude: float, longitude: float) -> str:
     """Round coords to ~1km so nearby requests share one cache row."""
@@ -134,6 +176,154 @@ async def fetch_and_store(
     )
 
 
+async def store_forecasts(
+    db: AsyncSession,
+    items: Sequence[tuple[ForecastTarget, ForecastData]],
+    *,
+    days: Optional[int] = None,
+    ttl_minutes: Optional[int] = None,
+) -> int:
+    """Bulk-upsert forecasts keyed by normalized location; returns rows written.
+
+    Same field semantics as ``store_forecast`` (``pool_id``/``label`` are only
+    overwritten when given) but one ``INSERT ... ON CONFLICT`` per chunk
+    instead of a read + write per location. Targets should already be
+    deduplicated by location key.
+    """
+    if not items:
+        return 0
+    days = days or _forecast_days()
+    ttl = ttl_minutes if ttl_minutes is not None else _ttl_minutes()
+    now = utc_now()
+    expires_at = now + timedelta(minutes=ttl)
+
+    for start in range(0, len(items), _UPSERT_CHUNK):
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "location_key": target.location_key,
+                "latitude": float(target.latitude),
+                "longitude": float(target.longitude),
+                "pool_id": target.pool_id,
+                "label": target.label,
+                "provider": forecast.provider,
+                "timezone": forecast.timezone,
+                "forecast_days": days,
+                "hourly": forecast.hourly,
+                "daily": forecast.daily,
+                "fetched_at": now,
+                "expires_at": expires_at,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for target, forecast in items[start : start + _UPSERT_CHUNK]
+        ]
+        stmt = pg_insert(WeatherSnapshot).values(rows)
+        excluded = stmt.excluded
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[WeatherSnapshot.location_key],
+                set_={
+                    "latitude": excluded.latitude,
+                    "longitude": excluded.longitude,
+                    "provider": excluded.provider,
+                    "timezone": excluded.timezone,
+                    "forecast_days": excluded.forecast_days,
+                    "hourly": excluded.hourly,
+                    "daily": excluded.daily,
+                    "fetched_at": excluded.fetched_at,
+                    "expires_at": excluded.expires_at,
+                    "updated_at": excluded.updated_at,
+                    "pool_id": func.coalesce(excluded.pool_id, WeatherSnapshot.pool_id),
+                    "label": func.coalesce(excluded.label, WeatherSnapshot.label),
+                },
+            )
+        )
+    await db.commit()
+    return len(items)
+
+
+async def fetch_and_store_many(
+    db: AsyncSession, targets: Sequence[ForecastTarget]
+) -> dict[str, Optional[Exception]]:
+    """Fetch forecasts for many locations in batched provider calls and
+    bulk-upsert them.
+
+    Targets sharing a location key are fetched once (the first one's
+    pool/label is stamped). Returns ``{location_key: None | error}``.
+    """
+    unique: dict[str, ForecastTarget] = {}
+    for target in targets:
+        unique.setdefault(target.location_key, target)
+    if not unique:
+        return {}
+
+    keyed = list(unique.items())
+    forecasts = await get_provider().fetch_forecasts(
+        coords=[(t.latitude, t.longitude) for _, t in keyed],
+        days=_forecast_days(),
+        timezone=_timezone(),
+    )
+    outcomes: dict[str, Optional[Exception]] = {}
+    fetched: list[tuple[ForecastTarget, ForecastData]] = []
+    for (key, target), forecast in zip(keyed, forecasts):
+        if isinstance(forecast, Exception):
+            outcomes[key] = forecast
+        else:
+            outcomes[key] = None
+            fetched.append((target, forecast))
+
+    await store_forecasts(db, fetched)
+    return outcomes
+
+
+async def _acquire_fetch_lock(location_key: str) -> Union[str, bool, None]:
+    """Try to take the single-flight lock.
+
+    Returns the lock token when acquired, False when another worker holds it,
+    and None when Redis is unavailable (callers then fetch unguarded).
+    """
+    token = uuid.uuid4().hex
+    try:
+        redis = await get_redis()
+        acquired = await redis.set(
+            _FETCH_LOCK_PREFIX + location_key, token, nx=True, px=_FETCH_LOCK_TTL_MS
+        )
+    except Exception as exc:  # noqa: BLE001 — the lock is an optimisation
+        logger.warning("weather.lock_unavailable key=%s err=%s", location_key, exc)
+        return None
+    return token if acquired else False
+
+
+async def _release_fetch_lock(location_key: str, token: str) -> None:
+    try:
+        redis = await get_redis()
+        await redis.eval(
+            _RELEASE_LOCK_SCRIPT, 1, _FETCH_LOCK_PREFIX + location_key, token
+        )
+    except Exception as exc:  # noqa: BLE001 — the lock expires on its own
+        logger.warning("weather.lock_release_failed key=%s err=%s", location_key, exc)
+
+
+async def _wait_for_fetch(
+    db: AsyncSession, location_key: str
+) -> Optional[WeatherSnapshot]:
+    """Poll for a fresh row written by the worker holding the fetch lock."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + _FETCH_WAIT_SECONDS
+    while loop.time() < deadline:
+        await asyncio.sleep(_FETCH_POLL_SECONDS)
+        result = await db.execute(
+            select(WeatherSnapshot)
+            .where(WeatherSnapshot.location_key == location_key)
+            .execution_options(populate_existing=True)
+        )
+        snapshot = result.scalar_one_or_none()
+        if snapshot is not None and not is_stale(snapshot):
+            return snapshot
+    return None
+
+
 async def get_or_fetch(
     db: AsyncSession,
     *,
@@ -146,13 +336,24 @@ async def get_or_fetch(
     """Cache-aside read: serve a fresh cached row, else fetch + store.
 
     On provider failure with a stale row present, the stale row is returned
-    rather than raising — weather is better-late-than-never for planning.
+    rather than raising — weather is better-late-than-never for planning. A
+    stale row is also what's served while another worker holds the location's
+    fetch lock (``force`` included — one refetch in flight is enough).
     """
     location_key = normalize_location_key(latitude, longitude)
     snapshot = await get_snapshot_by_key(db, location_key)
     if snapshot is not None and not force and not is_stale(snapshot):
         return snapshot
 
+    token = await _acquire_fetch_lock(location_key)
+    if token is False:
+        # Another worker is already refetching this location.
+        if snapshot is not None:
+            return snapshot
+        fresh = await _wait_for_fetch(db, location_key)
+        if fresh is not None:
+            return fresh
+
     try:
         return await fetch_and_store(
             db, latitude=latitude, longitude=longitude, pool_id=pool_id, label=label
@@ -162,3 +363,6 @@ async def get_or_fetch(
         if snapshot is not None:
             return snapshot
         raise
+    finally:
+        if token:
+            await _release_fetch_lock(location_key, token)
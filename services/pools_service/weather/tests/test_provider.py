@@ -97,3 +97,49 @@ def test_fetch_forecast_clamps_days_to_provider_max(monkeypatch):
         provider.fetch_forecast(latitude=1.0, longitude=2.0, days=30, timezone="UTC")
     )
     assert _FakeClient.captured["params"]["forecast_days"] == 16
+
+
+class _FakeMultiClient(_FakeClient):
+    calls: list = []
+    fail_first: bool = False
+
+    async def get(self, url, params=None):
+        _FakeMultiClient.calls.append(params)
+        if _FakeMultiClient.fail_first and len(_FakeMultiClient.calls) == 1:
+            raise prov.httpx.ConnectError("boom")
+        count = len(params["latitude"].split(","))
+        payload = SAMPLE_OPEN_METEO if count == 1 else [SAMPLE_OPEN_METEO] * count
+        return _FakeResp(payload)
+
+
+def test_fetch_forecasts_batches_coordinates(monkeypatch):
+    monkeypatch.setattr(prov.httpx, "AsyncClient", _FakeMultiClient)
+    monkeypatch.setattr(_FakeMultiClient, "calls", [])
+    coords = [(6.0 + i / 100, 3.0) for i in range(prov._MAX_LOCATIONS_PER_REQUEST + 1)]
+
+    results = asyncio.run(
+        OpenMeteoProvider().fetch_forecasts(
+            coords=coords, days=14, timezone="Africa/Lagos"
+        )
+    )
+
+    assert len(_FakeMultiClient.calls) == 2
+    assert _FakeMultiClient.calls[0]["latitude"].split(",")[:2] == ["6.0", "6.01"]
+    assert len(results) == len(coords)
+    assert all(r.hourly["temperature_2m"] == [26.0, 25.8, 26.2] for r in results)
+
+
+def test_fetch_forecasts_reports_failed_batch_per_location(monkeypatch):
+    monkeypatch.setattr(prov.httpx, "AsyncClient", _FakeMultiClient)
+    monkeypatch.setattr(_FakeMultiClient, "calls", [])
+    monkeypatch.setattr(_FakeMultiClient, "fail_first", True)
+    monkeypatch.setattr(prov, "_BATCH_CONCURRENCY", 1)
+    coords = [(float(i), 3.0) for i in range(prov._MAX_LOCATIONS_PER_REQUEST + 1)]
+
+    results = asyncio.run(
+        OpenMeteoProvider().fetch_forecasts(coords=coords, days=14, timezone="UTC")
+    )
+
+    failed = [r for r in results if isinstance(r, Exception)]
+    assert len(failed) == prov._MAX_LOCATIONS_PER_REQUEST
+    assert not isinstance(results[-1], Exception)
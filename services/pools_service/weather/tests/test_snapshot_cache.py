@@ -0,0 +1,141 @@
+"""Unit tests for the in-process weather snapshot cache (no DB, no network)."""
+
+import asyncio
+import uuid
+from datetime import timedelta
+
+from fastapi import Request, Response
+
+import services.pools_service.weather.cache as cache_mod
+from libs.common.datetime_utils import utc_now
+from libs.common.http_cache import etag_matches
+from services.pools_service.weather.cache import SnapshotCache
+from services.pools_service.weather.models import WeatherSnapshot
+from services.pools_service.weather.routers import _serve, cached_to_response
+
+_HOURLY = {
+    "time": ["2026-06-06T22:00", "2026-06-06T23:00", "2026-06-07T00:00"],
+    "precipitation_probability": [76, 53, 41],
+}
+
+
+def _snapshot(expires_in: timedelta, **overrides) -> WeatherSnapshot:
+    now = utc_now()
+    defaults = dict(
+        id=uuid.uuid4(),
+        location_key="6.51,3.37",
+        latitude=6.5095,
+        longitude=3.3711,
+        pool_id=None,
+        label="Yaba",
+        provider="open-meteo",
+        timezone="Africa/Lagos",
+        forecast_days=14,
+        hourly=_HOURLY,
+        daily=None,
+        fetched_at=now,
+        expires_at=now + expires_in,
+    )
+    defaults.update(overrides)
+    return WeatherSnapshot(**defaults)
+
+
+def _request(if_none_match: str = "") -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "headers": headers})
+
+
+def test_put_then_get_by_key_and_pool():
+    cache = SnapshotCache()
+    pool_id = uuid.uuid4()
+    cache.put(_snapshot(timedelta(hours=1)), pool_id=pool_id)
+
+    assert cache.get("6.51,3.37").response.label == "Yaba"
+    assert cache.get_by_pool(pool_id) is cache.get("6.51,3.37")
+    assert cache.get_by_pool(uuid.uuid4()) is None
+
+
+def test_entries_far_past_expiry_are_dropped():
+    cache = SnapshotCache()
+    pool_id = uuid.uuid4()
+    expired = -(cache_mod.MAX_STALE + timedelta(minutes=1))
+    cache.put(_snapshot(expired), pool_id=pool_id)
+
+    assert cache.get("6.51,3.37") is None
+    assert cache.get_by_pool(pool_id) is None
+
+
+def test_lru_evicts_oldest_entry():
+    cache = SnapshotCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(_snapshot(timedelta(hours=1), location_key=key))
+
+    assert cache.get("a") is None
+    assert len(cache) == 2
+
+
+def test_revalidate_runs_one_refresh_per_key(monkeypatch):
+    cache = SnapshotCache()
+    refreshed: list[str] = []
+
+    async def fake_refresh(entry, pool_id):
+        await asyncio.sleep(0)
+        refreshed.append(entry.location_key)
+        cache.put(_snapshot(timedelta(hours=3), label="fresh"))
+
+    monkeypatch.setattr(cache, "_refresh", fake_refresh)
+
+    async def scenario():
+        entry = cache.put(_snapshot(timedelta(minutes=-5)))
+        assert entry.is_stale()
+        cache.revalidate(entry)
+        cache.revalidate(entry)
+        await asyncio.gather(*cache._refreshing.values())
+
+    asyncio.run(scenario())
+
+    assert refreshed == ["6.51,3.37"]
+    assert cache.get("6.51,3.37").response.label == "fresh"
+    assert not cache.get("6.51,3.37").is_stale()
+
+
+def test_cached_response_flags_stale_and_slices():
+    entry = SnapshotCache().put(_snapshot(timedelta(minutes=-5)))
+
+    resp = cached_to_response(entry, date="2026-06-06")
+
+    assert resp.stale is True
+    assert resp.hourly["time"] == ["2026-06-06T22:00", "2026-06-06T23:00"]
+    assert entry.response.hourly["time"] == _HOURLY["time"]
+
+
+def test_etag_varies_with_forecast_version_and_day():
+    base = _snapshot(timedelta(hours=1))
+    entry = SnapshotCache().put(base)
+    newer = SnapshotCache().put(
+        _snapshot(timedelta(hours=1), fetched_at=base.fetched_at + timedelta(hours=3))
+    )
+
+    assert entry.etag() == entry.etag()
+    assert entry.etag() != entry.etag("2026-06-06")
+    assert entry.etag() != newer.etag()
+
+
+def test_etag_matches_handles_lists_weak_and_wildcard():
+    assert etag_matches('"x", W/"abc"', 'W/"abc"')
+    assert etag_matches('"abc"', 'W/"abc"')
+    assert etag_matches("*", 'W/"abc"')
+    assert not etag_matches('W/"other"', 'W/"abc"')
+    assert not etag_matches(None, 'W/"abc"')
+
+
+def test_serve_returns_304_for_current_client_copy():
+    entry = SnapshotCache().put(_snapshot(timedelta(hours=1)))
+
+    fresh = _serve(entry, _request(), Response(), None)
+    not_modified = _serve(entry, _request(entry.etag()), Response(), None)
+
+    assert fresh.location_key == "6.51,3.37"
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == entry.etag()
+    assert not_modified.headers["cache-control"].startswith("private, max-age=")
@@ -1,10 +1,13 @@
 """Unit tests for weather caching/slicing logic (no DB, no network)."""
 
+import asyncio
 import uuid
 from datetime import timedelta
 
+import services.pools_service.weather.snapshot_service as svc
 from libs.common.datetime_utils import utc_now
 from services.pools_service.weather.models import WeatherSnapshot
+from services.pools_service.weather.provider import ForecastData
 from services.pools_service.weather.routers import (
     slice_daily,
     slice_hourly,
@@ -87,3 +90,79 @@ def test_to_response_computes_stale_and_slices():
     assert resp.stale is True
     assert resp.hourly["time"] == ["2026-06-06T22:00", "2026-06-06T23:00"]
     assert resp.label == "Yaba"
+
+
+def _patch_single_flight(monkeypatch, *, existing, lock):
+    fetches: list[str] = []
+
+    async def fake_get(db, key):
+        return existing
+
+    async def fake_lock(key):
+        return lock
+
+    async def fake_release(key, token):
+        return None
+
+    async def fake_fetch(db, **kwargs):
+        fetches.append(kwargs["pool_id"])
+        return _snapshot(label="fresh")
+
+    monkeypatch.setattr(svc, "get_snapshot_by_key", fake_get)
+    monkeypatch.setattr(svc, "_acquire_fetch_lock", fake_lock)
+    monkeypatch.setattr(svc, "_release_fetch_lock", fake_release)
+    monkeypatch.setattr(svc, "fetch_and_store", fake_fetch)
+    return fetches
+
+
+def test_get_or_fetch_serves_stale_while_another_worker_fetches(monkeypatch):
+    stale = _snapshot(expires_at=utc_now() - timedelta(minutes=1))
+    fetches = _patch_single_flight(monkeypatch, existing=stale, lock=False)
+
+    result = asyncio.run(svc.get_or_fetch(None, latitude=6.5095, longitude=3.3711))
+
+    assert result is stale
+    assert fetches == []
+
+
+def test_get_or_fetch_refetches_when_lock_acquired(monkeypatch):
+    stale = _snapshot(expires_at=utc_now() - timedelta(minutes=1))
+    fetches = _patch_single_flight(monkeypatch, existing=stale, lock="token")
+
+    result = asyncio.run(
+        svc.get_or_fetch(None, latitude=6.5095, longitude=3.3711, pool_id="p1")
+    )
+
+    assert result.label == "fresh"
+    assert fetches == ["p1"]
+
+
+def test_fetch_and_store_many_dedupes_by_location_key(monkeypatch):
+    requested: list = []
+    stored: list = []
+
+    class _Provider:
+        async def fetch_forecasts(self, *, coords, days, timezone):
+            requested.extend(coords)
+            return [
+                ForecastData(provider="stub", timezone=timezone, hourly={})
+                for _ in coords
+            ]
+
+    async def fake_store(db, items, **kwargs):
+        stored.extend(items)
+        return len(items)
+
+    monkeypatch.setattr(svc, "get_provider", lambda: _Provider())
+    monkeypatch.setattr(svc, "store_forecasts", fake_store)
+    targets = [
+        svc.ForecastTarget(6.5095, 3.3711, label="Yaba"),
+        svc.ForecastTarget(6.5142, 3.3688, label="Yaba 2"),
+        svc.ForecastTarget(6.4281, 3.4219, label="Ikoyi"),
+    ]
+
+    outcomes = asyncio.run(svc.fetch_and_store_many(None, targets))
+
+    assert outcomes == {"6.51,3.37": None, "6.43,3.42": None}
+    assert len(requested) == 2
+    assert [t.label for t, _ in stored] == ["Yaba", "Ikoyi"]
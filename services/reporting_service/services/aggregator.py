@@ -15,7 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from libs.common.config import get_settings
 from libs.common.datetime_utils import utc_now
 from libs.common.logging import get_logger
-from libs.common.service_client import internal_get
+from libs.common.service_client import internal_get, iter_approved_members
 from services.reporting_service.models import (
     CommunityQuarterlyStats,
     MemberQuarterlyReport,
@@ -162,15 +162,6 @@ async def _fetch_transport_summary(
     return data or {}
 
 
-async def _fetch_all_approved_members() -> list[dict]:
-    """Fetch list of all approved members from members service."""
-    data = await _safe_get(
-        settings.MEMBERS_SERVICE_URL,
-        "/internal/members/approved-list",
-    )
-    return data or []
-
-
 def _compute_streaks(attendance_data: dict) -> tuple[int, int]:
     """Compute longest and current weekly attendance streaks.
 
@@ -343,29 +334,43 @@ async def compute_all_member_reports(year: int, quarter: int, db: AsyncSession)
 
     Processes members sequentially to avoid SQLAlchemy async session
     concurrency issues (a single AsyncSession must not be used by
-    concurrent coroutines).
+    concurrent coroutines). A member whose report fails is logged and
+    skipped; if the member stream itself fails partway, this raises.
     """
-    members = await _fetch_all_approved_members()
-    if not members:
-        logger.warning("No approved members found to generate reports for.")
-        return 0
-
+    seen = 0
     count = 0
 
-    for member in members:
-        try:
-            await compute_member_report(
-                member_auth_id=member["auth_id"],
-                year=year,
-                quarter=quarter,
-                db=db,
-                member_info=member,
-            )
-            count += 1
-        except Exception as e:
-            logger.error(f"Failed to compute report for {member.get('auth_id')}: {e}")
-            # Rollback so the session is usable for the next member
-            await db.rollback()
+    # Members are streamed (NDJSON) rather than fetched as one list, so the
+    # roster is never held in memory.
+    try:
+        async for member in iter_approved_members(calling_service=CALLING_SERVICE):
+            seen += 1
+            try:
+                await compute_member_report(
+                    member_auth_id=member["auth_id"],
+                    year=year,
+                    quarter=quarter,
+                    db=db,
+                    member_info=member,
+                )
+                count += 1
+            except Exception as e:
+                logger.error(
+                    f"Failed to compute report for {member.get('auth_id')}: {e}"
+                )
+                # Rollback so the session is usable for the next member
+                await db.rollback()
+    except Exception as e:
+        # A cut-off stream means a partial roster: fail the run rather than
+        # publish percentiles and community stats over some of the members.
+        logger.error(f"Approved-member stream failed after {seen} members: {e}")
+        raise RuntimeError(
+            f"Approved-member stream failed after {seen} members: {e}"
+        ) from e
+
+    if not seen:
+        logger.warning("No approved members found to generate reports for.")
+        return 0
 
     logger.info(f"Generated {count} member reports for Q{quarter} {year}")
 
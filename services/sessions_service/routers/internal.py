@@ -67,6 +67,10 @@ class NextSessionResponse(BaseModel):
     location_name: Optional[str] = None
 
 
+class BulkSessionsRequest(BaseModel):
+    ids: List[str]
+
+
 class GenerateCohortSessionsRequest(BaseModel):
     # Half-open window (from_date, to_date]. Typically from_date = the cohort's
     # pre-extension end_date and to_date = the new (post-extension) end_date.
@@ -81,6 +85,26 @@ class GenerateCohortSessionsResponse(BaseModel):
     reason: Optional[str] = None
 
 
+def _session_basic(s: Session) -> SessionBasic:
+    return SessionBasic(
+        id=str(s.id),
+        title=s.title,
+        session_type=s.session_type.value,
+        status=s.status.value,
+        starts_at=s.starts_at.isoformat(),
+        ends_at=s.ends_at.isoformat(),
+        location_name=s.location_name,
+        location_address=s.location_address,
+        location=s.location.value if s.location else None,
+        cohort_id=str(s.cohort_id) if s.cohort_id else None,
+        capacity=s.capacity,
+        pool_fee=s.pool_fee,
+        week_number=s.week_number,
+        lesson_title=s.lesson_title,
+        timezone=s.timezone,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -107,26 +131,7 @@ async def get_scheduled_sessions(
     query = query.order_by(Session.starts_at.asc())
     result = await db.execute(query)
     sessions = result.scalars().all()
-    return [
-        SessionBasic(
-            id=str(s.id),
-            title=s.title,
-            session_type=s.session_type.value,
-            status=s.status.value,
-            starts_at=s.starts_at.isoformat(),
-            ends_at=s.ends_at.isoformat(),
-            location_name=s.location_name,
-            location_address=s.location_address,
-            location=s.location.value if s.location else None,
-            cohort_id=str(s.cohort_id) if s.cohort_id else None,
-            capacity=s.capacity,
-            pool_fee=s.pool_fee,
-            week_number=s.week_number,
-            lesson_title=s.lesson_title,
-            timezone=s.timezone,
-        )
-        for s in sessions
-    ]
+    return [_session_basic(s) for s in sessions]
 
 
 # ---------------------------------------------------------------------------
@@ -335,6 +340,41 @@ async def get_session_durations(
     ]
 
 
+@router.post("/bulk", response_model=List[SessionBasic])
+async def get_sessions_bulk(
+    body: BulkSessionsRequest,
+    _: AuthUser = Depends(require_service_role),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Bulk-lookup sessions by IDs. Unknown IDs are omitted."""
+    if not body.ids:
+        return []
+    uuids = [uuid.UUID(sid) for sid in body.ids]
+    result = await db.execute(select(Session).where(Session.id.in_(uuids)))
+    return [_session_basic(s) for s in result.scalars().all()]
+
+
+@router.post("/coaches/bulk", response_model=dict[str, List[str]])
+async def get_session_coach_ids_bulk(
+    body: BulkSessionsRequest,
+    _: AuthUser = Depends(require_service_role),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Coach member IDs for each requested session (empty list when none)."""
+    coaches: dict[str, List[str]] = {sid: [] for sid in body.ids}
+    if not body.ids:
+        return coaches
+    uuids = [uuid.UUID(sid) for sid in body.ids]
+    result = await db.execute(
+        select(SessionCoach.session_id, SessionCoach.coach_id).where(
+            SessionCoach.session_id.in_(uuids)
+        )
+    )
+    for session_id, coach_id in result.all():
+        coaches.setdefault(str(session_id), []).append(str(coach_id))
+    return coaches
+
+
 # NOTE: Parameterized routes must come AFTER all static routes to avoid
 # "durations", "detailed-stats", etc. being matched as {session_id}.
 
@@ -350,23 +390,7 @@ async def get_session_by_id(
     session = result.scalar_one_or_none()
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
-    return SessionBasic(
-        id=str(session.id),
-        title=session.title,
-        session_type=session.session_type.value,
-        status=session.status.value,
-        starts_at=session.starts_at.isoformat(),
-        ends_at=session.ends_at.isoformat(),
-        location_name=session.location_name,
-        location_address=session.location_address,
-        location=session.location.value if session.location else None,
-        cohort_id=str(session.cohort_id) if session.cohort_id else None,
-        capacity=session.capacity,
-        pool_fee=session.pool_fee,
-        week_number=session.week_number,
-        lesson_title=session.lesson_title,
-        timezone=session.timezone,
-    )
+    return _session_basic(session)
 
 
 @router.get("/cohorts/{cohort_id}/next-session", response_model=NextSessionResponse)
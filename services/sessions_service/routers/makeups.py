@@ -18,6 +18,7 @@ from libs.common.datetime_utils import utc_now
 from libs.common.logging import get_logger
 from libs.common.service_client import (
     complete_makeup_obligation,
+    get_coach_availabilities_bulk,
     get_coach_availability,
     get_member_by_auth_id,
     get_member_by_id,
@@ -44,14 +45,18 @@ from services.sessions_service.schemas import (
     MakeupBookingCreate,
     MakeupBookingResponse,
     MakeupOpenSlotCreate,
+    MakeupOptionResponse,
+    MakeupOptionsResponse,
     MakeupRequestCreate,
 )
 from services.sessions_service.services.makeup_scheduling import (
     MAKEUP_WINDOW_DAYS,
+    CoachCalendar,
     CoachSession,
     compute_bookable_slots,
     makeup_window_end,
     notice_hours,
+    rank_makeup_options,
 )
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -61,6 +66,10 @@ logger = get_logger(__name__)
 
 _MAX_WINDOW_DAYS = 60
 _HOLD_MINUTES = 30
+# Multi-coach ranking: default coach set = coaches of the learner's sessions
+# in this lookback, capped.
+_ELIGIBLE_COACH_LOOKBACK = timedelta(days=90)
+_MAX_RANKED_COACHES = 20
 
 
 async def _resolve_member_id(auth_id: str | None) -> uuid.UUID:
@@ -77,30 +86,34 @@ async def _resolve_member_id(auth_id: str | None) -> uuid.UUID:
     return uuid.UUID(member["id"])
 
 
-async def _compute_bookable_slots_for(
-    db: AsyncSession,
-    *,
-    coach_id: uuid.UUID,
-    learner_id: uuid.UUID,
-    from_date: date,
-    to_date: date,
-) -> BookableSlotsResponse:
-    """Compute open + joinable make-up options for a coach + learner over a window.
+def _check_window(from_date: date, to_date: date) -> None:
+    if to_date < from_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="`from` must be on or before `to`.",
+        )
+    if (to_date - from_date).days > _MAX_WINDOW_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Window too large (max {_MAX_WINDOW_DAYS} days).",
+        )
 
-    Shared by the admin bookable-slots endpoint and the learner self-serve
-    options endpoint. Spacing violations are flagged, not removed (D2).
-    """
-    avail = await get_coach_availability(str(coach_id), calling_service="sessions")
-    calendar = (avail or {}).get("availability_calendar") or {}
-    availability_set = bool(calendar)
-    min_hours = (avail or {}).get("min_hours_between_sessions")
 
+def _window_bounds(from_date: date, to_date: date) -> tuple[datetime, datetime]:
+    """UTC bounds wide enough to cover the coach-local window plus spacing."""
     lo = datetime.combine(from_date - timedelta(days=1), time.min, tzinfo=timezone.utc)
     hi = datetime.combine(to_date + timedelta(days=2), time.min, tzinfo=timezone.utc)
+    return lo, hi
+
 
+async def _load_coach_sessions(
+    db: AsyncSession, coach_ids: list[uuid.UUID], lo: datetime, hi: datetime
+) -> dict[uuid.UUID, list[CoachSession]]:
+    """Scheduled sessions overlapping [lo, hi) per coach — two queries total."""
     session_rows = (
         await db.execute(
             select(
+                SessionCoach.coach_id,
                 Session.id,
                 Session.title,
                 Session.capacity,
@@ -108,7 +121,7 @@ async def _compute_bookable_slots_for(
                 Session.ends_at,
             )
             .join(SessionCoach, SessionCoach.session_id == Session.id)
-            .where(SessionCoach.coach_id == coach_id)
+            .where(SessionCoach.coach_id.in_(coach_ids))
             .where(
                 Session.status.in_([SessionStatus.SCHEDULED, SessionStatus.IN_PROGRESS])
             )
@@ -118,7 +131,7 @@ async def _compute_bookable_slots_for(
     ).all()
 
     booked: dict[uuid.UUID, int] = {}
-    session_ids = [r.id for r in session_rows]
+    session_ids = list({r.id for r in session_rows})
     if session_ids:
         count_rows = (
             await db.execute(
@@ -130,18 +143,24 @@ async def _compute_bookable_slots_for(
         ).all()
         booked = {sid: count for sid, count in count_rows}
 
-    coach_sessions = [
-        CoachSession(
-            start=r.starts_at,
-            end=r.ends_at,
-            session_id=str(r.id),
-            title=r.title,
-            capacity=r.capacity,
-            booked_count=booked.get(r.id, 0),
+    by_coach: dict[uuid.UUID, list[CoachSession]] = {cid: [] for cid in coach_ids}
+    for r in session_rows:
+        by_coach[r.coach_id].append(
+            CoachSession(
+                start=r.starts_at,
+                end=r.ends_at,
+                session_id=str(r.id),
+                title=r.title,
+                capacity=r.capacity,
+                booked_count=booked.get(r.id, 0),
+            )
         )
-        for r in session_rows
-    ]
+    return by_coach
+
 
+async def _load_learner_sessions(
+    db: AsyncSession, learner_id: uuid.UUID, lo: datetime, hi: datetime
+) -> list[datetime]:
     learner_rows = (
         await db.execute(
             select(Session.starts_at)
@@ -152,7 +171,43 @@ async def _compute_bookable_slots_for(
             .where(Session.starts_at < hi)
         )
     ).all()
-    learner_sessions = [r[0] for r in learner_rows]
+    return [r[0] for r in learner_rows]
+
+
+def _slot_fields(s) -> dict:
+    return dict(
+        start=s.start,
+        end=s.end,
+        kind=s.kind,
+        session_id=s.session_id,
+        session_title=s.session_title,
+        spots_left=s.spots_left,
+        ok=s.ok,
+        warnings=s.warnings,
+    )
+
+
+async def _compute_bookable_slots_for(
+    db: AsyncSession,
+    *,
+    coach_id: uuid.UUID,
+    learner_id: uuid.UUID,
+    from_date: date,
+    to_date: date,
+) -> BookableSlotsResponse:
+    """Compute open + joinable make-up options for a coach + learner over a window.
+
+    Shared by the admin bookable-slots endpoint and the learner self-serve
+    options endpoint. Spacing violations are flagged, not removed (D2).
+    """
+    avail = await get_coach_availability(str(coach_id), calling_service="sessions")
+    calendar = (avail or {}).get("availability_calendar") or {}
+    availability_set = bool(calendar)
+    min_hours = (avail or {}).get("min_hours_between_sessions")
+
+    lo, hi = _window_bounds(from_date, to_date)
+    coach_sessions = (await _load_coach_sessions(db, [coach_id], lo, hi))[coach_id]
+    learner_sessions = await _load_learner_sessions(db, learner_id, lo, hi)
 
     slots = compute_bookable_slots(
         calendar,
@@ -166,18 +221,94 @@ async def _compute_bookable_slots_for(
         coach_id=str(coach_id),
         learner_id=str(learner_id),
         availability_set=availability_set,
-        slots=[
-            BookableSlotResponse(
-                start=s.start,
-                end=s.end,
-                kind=s.kind,
-                session_id=s.session_id,
-                session_title=s.session_title,
-                spots_left=s.spots_left,
-                ok=s.ok,
-                warnings=s.warnings,
+        slots=[BookableSlotResponse(**_slot_fields(s)) for s in slots],
+    )
+
+
+async def _learner_coach_ids(
+    db: AsyncSession, learner_id: uuid.UUID
+) -> list[uuid.UUID]:
+    """Coaches of the learner's recent confirmed sessions, most recent first."""
+    since = utc_now() - _ELIGIBLE_COACH_LOOKBACK
+    rows = (
+        await db.execute(
+            select(SessionCoach.coach_id, func.max(Session.starts_at).label("last"))
+            .join(Session, Session.id == SessionCoach.session_id)
+            .join(SessionBooking, SessionBooking.session_id == Session.id)
+            .where(SessionBooking.member_id == learner_id)
+            .where(SessionBooking.status == SessionBookingStatus.CONFIRMED)
+            .where(Session.starts_at >= since)
+            .group_by(SessionCoach.coach_id)
+            .order_by(func.max(Session.starts_at).desc())
+            .limit(_MAX_RANKED_COACHES)
+        )
+    ).all()
+    return [r.coach_id for r in rows]
+
+
+async def _compute_ranked_options_for(
+    db: AsyncSession,
+    *,
+    learner_id: uuid.UUID,
+    coach_ids: list[uuid.UUID] | None,
+    from_date: date,
+    to_date: date,
+    limit: int,
+) -> MakeupOptionsResponse:
+    """Ranked make-up options across coaches (explicit, or the learner's own).
+
+    One bulk availability call and three queries regardless of coach count.
+    """
+    if not coach_ids:
+        coach_ids = await _learner_coach_ids(db, learner_id)
+    coach_ids = list(dict.fromkeys(coach_ids))[:_MAX_RANKED_COACHES]
+    if not coach_ids:
+        return MakeupOptionsResponse(
+            learner_id=str(learner_id),
+            coach_ids=[],
+            coaches_without_availability=[],
+            options=[],
+        )
+
+    avail_rows = await get_coach_availabilities_bulk(
+        [str(cid) for cid in coach_ids], calling_service="sessions"
+    )
+    avail_by_coach = {row["member_id"]: row for row in avail_rows}
+
+    lo, hi = _window_bounds(from_date, to_date)
+    sessions_by_coach = await _load_coach_sessions(db, coach_ids, lo, hi)
+    learner_sessions = await _load_learner_sessions(db, learner_id, lo, hi)
+
+    calendars = []
+    without_availability = []
+    for cid in coach_ids:
+        avail = avail_by_coach.get(str(cid)) or {}
+        calendar = avail.get("availability_calendar") or {}
+        if not calendar:
+            without_availability.append(str(cid))
+        calendars.append(
+            CoachCalendar(
+                coach_id=str(cid),
+                calendar=calendar,
+                sessions=sessions_by_coach.get(cid, []),
+                min_hours_between=avail.get("min_hours_between_sessions"),
             )
-            for s in slots
+        )
+
+    options = rank_makeup_options(
+        calendars,
+        window_start=from_date,
+        window_end=to_date,
+        learner_sessions=learner_sessions,
+        limit=limit,
+    )
+    return MakeupOptionsResponse(
+        learner_id=str(learner_id),
+        coach_ids=[str(cid) for cid in coach_ids],
+        coaches_without_availability=without_availability,
+        options=[
+            MakeupOptionResponse(coach_id=o.coach_id, **_slot_fields(o))
+            for o in options
         ],
     )
 
@@ -418,16 +549,7 @@ async def get_bookable_slots(
     *flagged*, not removed (decision D2). ``availability_set`` is False when the
     coach hasn't published a calendar — join options may still be returned.
     """
-    if to_date < from_date:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="`from` must be on or before `to`.",
-        )
-    if (to_date - from_date).days > _MAX_WINDOW_DAYS:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Window too large (max {_MAX_WINDOW_DAYS} days).",
-        )
+    _check_window(from_date, to_date)
 
     return await _compute_bookable_slots_for(
         db,
@@ -438,6 +560,39 @@ async def get_bookable_slots(
     )
 
 
+@router.get("/options", response_model=MakeupOptionsResponse)
+async def get_ranked_makeup_options(
+    learner_id: uuid.UUID = Query(..., description="Learner member id"),
+    from_date: date = Query(
+        ..., alias="from", description="Window start (coach-local date)"
+    ),
+    to_date: date = Query(..., alias="to", description="Window end, inclusive"),
+    coach_id: list[uuid.UUID] | None = Query(
+        None,
+        description="Coaches to consider (repeatable). Defaults to the coaches "
+        "of the learner's recent sessions.",
+    ),
+    limit: int = Query(50, ge=1, le=500),
+    _: AuthUser = Depends(require_admin),
+    db: AsyncSession = Depends(get_async_db),
+) -> MakeupOptionsResponse:
+    """Ranked make-up options for a learner across several coaches.
+
+    Same open / join_session options as ``/bookable-slots``, tagged with
+    ``coach_id`` and ordered best first: spacing-clean, fewest warnings,
+    earliest, joining an existing session before opening a new one.
+    """
+    _check_window(from_date, to_date)
+    return await _compute_ranked_options_for(
+        db,
+        learner_id=learner_id,
+        coach_ids=coach_id,
+        from_date=from_date,
+        to_date=to_date,
+        limit=limit,
+    )
+
+
 @router.post(
     "/bookings",
     response_model=MakeupBookingResponse,
@@ -767,16 +922,7 @@ async def get_my_bookable_options(
     db: AsyncSession = Depends(get_async_db),
 ) -> BookableSlotsResponse:
     """A learner's own bookable make-up options for a coach over [from, to]."""
-    if to_date < from_date:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="`from` must be on or before `to`.",
-        )
-    if (to_date - from_date).days > _MAX_WINDOW_DAYS:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Window too large (max {_MAX_WINDOW_DAYS} days).",
-        )
+    _check_window(from_date, to_date)
     learner_id = await _resolve_member_id(current_user.user_id)
     return await _compute_bookable_slots_for(
         db,
@@ -787,6 +933,27 @@ async def get_my_bookable_options(
     )
 
 
+@router.get("/me/ranked-options", response_model=MakeupOptionsResponse)
+async def get_my_ranked_options(
+    from_date: date = Query(..., alias="from"),
+    to_date: date = Query(..., alias="to"),
+    limit: int = Query(50, ge=1, le=500),
+    current_user: AuthUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+) -> MakeupOptionsResponse:
+    """A learner's own make-up options across their coaches, best first."""
+    _check_window(from_date, to_date)
+    learner_id = await _resolve_member_id(current_user.user_id)
+    return await _compute_ranked_options_for(
+        db,
+        learner_id=learner_id,
+        coach_ids=None,
+        from_date=from_date,
+        to_date=to_date,
+        limit=limit,
+    )
+
+
 @router.post(
     "/me/requests",
     response_model=MakeupBookingResponse,
@@ -31,6 +31,8 @@ from services.sessions_service.schemas.makeup import (
     MakeupBookingCreate,
     MakeupBookingResponse,
     MakeupOpenSlotCreate,
+    MakeupOptionResponse,
+    MakeupOptionsResponse,
     MakeupRequestCreate,
 )
 from services.sessions_service.schemas.templates import (
@@ -60,6 +62,8 @@ __all__ = [
     "MakeupBookingCreate",
     "MakeupBookingResponse",
     "MakeupOpenSlotCreate",
+    "MakeupOptionResponse",
+    "MakeupOptionsResponse",
     "MakeupRequestCreate",
     "RunningLateRequest",
     "SessionBase",
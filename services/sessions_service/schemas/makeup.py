@@ -43,6 +43,22 @@ class BookableSlotsResponse(BaseModel):
     slots: list[BookableSlotResponse]
 
 
+class MakeupOptionResponse(BookableSlotResponse):
+    """A ranked make-up option from one of several coaches."""
+
+    coach_id: str
+
+
+class MakeupOptionsResponse(BaseModel):
+    """Make-up options for a learner across coaches, best first."""
+
+    learner_id: str
+    coach_ids: list[str]  # Coaches considered, in tie-break order
+    # Considered coaches with no published calendar (join options only).
+    coaches_without_availability: list[str]
+    options: list[MakeupOptionResponse]
+
+
 class MakeupBookingCreate(BaseModel):
     """Admin request to confirm a make-up for a learner against a chosen session.
 
@@ -10,8 +10,14 @@ Time handling: availability is expressed in the coach's local timezone
 (``calendar['timezone']``); recurring blocks are a local weekday + 'HH:MM'.
 Everything is converted to tz-aware UTC for comparison and returned as UTC, so
 callers serialize ISO-8601 and clients render in local time.
+
+Interval work is sort-based rather than pairwise: occupied time is merged into
+disjoint sorted intervals and swept against the (sorted) candidate slots, and
+spacing checks bisect a sorted copy of the learner's sessions, so a window
+costs O((slots + sessions) log sessions) instead of O(slots × sessions).
 """
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta
 from zoneinfo import ZoneInfo
@@ -61,7 +67,8 @@ class BookableSlot:
     ``kind`` is "open" (a dedicated gap in the coach's availability) or
     "join_session" (an existing session the learner can join — policy §1: a
     make-up needn't be 1:1). For "join_session", session_id / session_title /
-    spots_left describe the session to join.
+    spots_left describe the session to join. ``coach_id`` is set by the
+    multi-coach ranking (``rank_makeup_options``).
     """
 
     start: datetime
@@ -72,6 +79,17 @@ class BookableSlot:
     spots_left: int | None = None
     ok: bool = True  # False when spacing warnings exist
     warnings: list[str] = field(default_factory=list)
+    coach_id: str | None = None
+
+
+@dataclass
+class CoachCalendar:
+    """One coach's inputs for the multi-coach ranking."""
+
+    coach_id: str
+    calendar: dict
+    sessions: list[CoachSession] = field(default_factory=list)
+    min_hours_between: int | None = None
 
 
 def _parse_hhmm(value: str) -> time:
@@ -147,6 +165,36 @@ def _overlaps(a: Interval, b: Interval) -> bool:
     return a.start < b.end and b.start < a.end
 
 
+def merge_intervals(intervals: list[Interval]) -> list[Interval]:
+    """Sorted, disjoint union of ``intervals`` (touching intervals coalesce)."""
+    merged: list[Interval] = []
+    for iv in sorted(intervals, key=lambda i: i.start):
+        if merged and iv.start <= merged[-1].end:
+            if iv.end > merged[-1].end:
+                merged[-1] = Interval(merged[-1].start, iv.end)
+        else:
+            merged.append(iv)
+    return merged
+
+
+def free_slots(slots: list[Interval], busy: list[Interval]) -> list[Interval]:
+    """Slots (sorted by start) that overlap no interval in ``busy``.
+
+    ``busy`` must be merged (``merge_intervals``). One forward sweep: slot
+    starts only grow, so busy intervals that end before the current slot can
+    never block a later one.
+    """
+    free: list[Interval] = []
+    i = 0
+    for slot in slots:
+        while i < len(busy) and busy[i].end <= slot.start:
+            i += 1
+        if i < len(busy) and busy[i].start < slot.end:
+            continue
+        free.append(slot)
+    return free
+
+
 def _adjacent_calendar_day(a: datetime, b: datetime, tz: ZoneInfo) -> bool:
     return abs((a.astimezone(tz).date() - b.astimezone(tz).date()).days) == 1
 
@@ -174,6 +222,35 @@ def _spacing_warnings(
     return warnings
 
 
+class _LearnerCalendar:
+    """The learner's sessions, sorted once for windowed spacing lookups."""
+
+    # Two times on adjacent local dates are < 48h apart (+1h across DST).
+    _ADJACENT_DAY_REACH = timedelta(hours=49)
+
+    def __init__(self, sessions: list[datetime]):
+        # Keep the caller's order for the warnings output.
+        order = sorted(range(len(sessions)), key=lambda i: sessions[i])
+        self._starts = [sessions[i] for i in order]
+        self._positions = order
+
+    def warnings(
+        self, slot: Interval, *, spacing_hours: int, tz: ZoneInfo
+    ) -> list[str]:
+        if not self._starts:
+            return []
+        reach = max(timedelta(hours=spacing_hours), self._ADJACENT_DAY_REACH)
+        lo = bisect_left(self._starts, slot.start - reach)
+        hi = bisect_right(self._starts, slot.start + reach)
+        nearby = sorted(range(lo, hi), key=lambda k: self._positions[k])
+        return _spacing_warnings(
+            slot,
+            [self._starts[k] for k in nearby],
+            spacing_hours=spacing_hours,
+            tz=tz,
+        )
+
+
 def compute_bookable_slots(
     calendar: dict,
     *,
@@ -197,47 +274,62 @@ def compute_bookable_slots(
     Joinable sessions are returned even when the coach has published no calendar.
     Pedagogical fit of a join option is the coach/admin's call (§3).
     """
-    coach_sessions = coach_sessions or []
-    learner_sessions = learner_sessions or []
+    return _bookable_slots(
+        calendar,
+        window_start=window_start,
+        window_end=window_end,
+        coach_sessions=coach_sessions or [],
+        learner=_LearnerCalendar(learner_sessions or []),
+        min_hours_between=min_hours_between,
+    )
+
+
+def _bookable_slots(
+    calendar: dict,
+    *,
+    window_start: date,
+    window_end: date,
+    coach_sessions: list[CoachSession],
+    learner: _LearnerCalendar,
+    min_hours_between: int | None,
+) -> list[BookableSlot]:
     tz = _coach_tz(calendar)
     slot_minutes = int(calendar.get("slot_minutes") or DEFAULT_SLOT_MINUTES)
     buffer_minutes = int(calendar.get("buffer_minutes") or 0)
     spacing_hours = min_hours_between or DEFAULT_SPACING_HOURS
 
-    occupied = [Interval(cs.start, cs.end) for cs in coach_sessions]
+    occupied = merge_intervals([Interval(cs.start, cs.end) for cs in coach_sessions])
     out: list[BookableSlot] = []
 
     # 1. Open slots — gaps in published availability, minus every coach session.
-    for block in expand_availability(
-        calendar, window_start=window_start, window_end=window_end
-    ):
+    candidates = [
+        slot
+        for block in expand_availability(
+            calendar, window_start=window_start, window_end=window_end
+        )
         for slot in slice_into_slots(
             block, slot_minutes=slot_minutes, buffer_minutes=buffer_minutes
-        ):
-            if any(_overlaps(slot, o) for o in occupied):
-                continue
-            warnings = _spacing_warnings(
-                slot, learner_sessions, spacing_hours=spacing_hours, tz=tz
-            )
-            out.append(
-                BookableSlot(
-                    start=slot.start,
-                    end=slot.end,
-                    kind="open",
-                    ok=not warnings,
-                    warnings=warnings,
-                )
+        )
+    ]
+    candidates.sort(key=lambda slot: slot.start)
+    for slot in free_slots(candidates, occupied):
+        warnings = learner.warnings(slot, spacing_hours=spacing_hours, tz=tz)
+        out.append(
+            BookableSlot(
+                start=slot.start,
+                end=slot.end,
+                kind="open",
+                ok=not warnings,
+                warnings=warnings,
             )
+        )
 
     # 2. Joinable existing sessions — those that still have room.
     for cs in coach_sessions:
         if not cs.has_room:
             continue
-        warnings = _spacing_warnings(
-            Interval(cs.start, cs.end),
-            learner_sessions,
-            spacing_hours=spacing_hours,
-            tz=tz,
+        warnings = learner.warnings(
+            Interval(cs.start, cs.end), spacing_hours=spacing_hours, tz=tz
         )
         out.append(
             BookableSlot(
@@ -256,6 +348,47 @@ def compute_bookable_slots(
     return out
 
 
+def rank_makeup_options(
+    coaches: list[CoachCalendar],
+    *,
+    window_start: date,
+    window_end: date,
+    learner_sessions: list[datetime] | None = None,
+    limit: int | None = None,
+) -> list[BookableSlot]:
+    """Make-up options across several coaches, best first.
+
+    Each coach's options are computed exactly as ``compute_bookable_slots``
+    would (sharing one sorted view of the learner's sessions) and tagged
+    with ``coach_id``. Ranking: spacing-clean options first, then fewer
+    warnings, earlier start, joining an existing session before opening a new
+    one, and finally the order ``coaches`` was given in.
+    """
+    learner = _LearnerCalendar(learner_sessions or [])
+    ranked: list[tuple[tuple, BookableSlot]] = []
+    for position, coach in enumerate(coaches):
+        for slot in _bookable_slots(
+            coach.calendar,
+            window_start=window_start,
+            window_end=window_end,
+            coach_sessions=coach.sessions,
+            learner=learner,
+            min_hours_between=coach.min_hours_between,
+        ):
+            slot.coach_id = coach.coach_id
+            key = (
+                not slot.ok,
+                len(slot.warnings),
+                slot.start,
+                slot.kind != "join_session",
+                position,
+            )
+            ranked.append((key, slot))
+    ranked.sort(key=lambda pair: pair[0])
+    options = [slot for _, slot in ranked]
+    return options[:limit] if limit is not None else options
+
+
 # ---------------------------------------------------------------------------
 # Eligibility helpers (§4 / §7) — pure decision functions
 # ---------------------------------------------------------------------------
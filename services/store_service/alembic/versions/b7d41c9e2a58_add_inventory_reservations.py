@@ -0,0 +1,40 @@
+"""Alembic script template for store service."""
+
+revision = "b7d41c9e2a58"
+down_revision = '2de3f310326d'
+branch_labels = None
+depends_on = None
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def upgrade() -> None:
+    # Holds taken before this table existed stay in quantity_reserved with
+    # no reservation rows; releasing such an order falls back to its items
+    # (see services/store_service/reservations.py).
+    op.create_table('store_inventory_reservations',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('inventory_item_id', sa.UUID(), nullable=False),
+    sa.Column('order_id', sa.UUID(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('active', 'committed', 'released', 'expired', name='store_reservation_status_enum'), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.CheckConstraint('quantity > 0', name='positive_reservation'),
+    sa.ForeignKeyConstraint(['inventory_item_id'], ['store_inventory_items.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['order_id'], ['store_orders.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_store_inventory_reservations_inventory_item_id'), 'store_inventory_reservations', ['inventory_item_id'], unique=False)
+    op.create_index(op.f('ix_store_inventory_reservations_order_id'), 'store_inventory_reservations', ['order_id'], unique=False)
+    op.create_index('ix_store_inventory_reservations_active_expiry', 'store_inventory_reservations', ['expires_at'], unique=False, postgresql_where=sa.text("status = 'active'"))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_store_inventory_reservations_active_expiry', table_name='store_inventory_reservations', postgresql_where=sa.text("status = 'active'"))
+    op.drop_index(op.f('ix_store_inventory_reservations_order_id'), table_name='store_inventory_reservations')
+    op.drop_index(op.f('ix_store_inventory_reservations_inventory_item_id'), table_name='store_inventory_reservations')
+    op.drop_table('store_inventory_reservations')
+    sa.Enum(name='store_reservation_status_enum').drop(op.get_bind(), checkfirst=True)
@@ -30,11 +30,16 @@ from services.store_service.models.enums import (
     PayoutStatus,
     ProductStatus,
     ProductType,
+    ReservationStatus,
     SourcingType,
     StoreCreditSourceType,
     SupplierStatus,
 )
-from services.store_service.models.inventory import InventoryItem, InventoryMovement
+from services.store_service.models.inventory import (
+    InventoryItem,
+    InventoryMovement,
+    InventoryReservation,
+)
 from services.store_service.models.supplier import Supplier, SupplierPayout
 
 __all__ = [
@@ -50,6 +55,7 @@ __all__ = [
     "InventoryItem",
     "InventoryMovement",
     "InventoryMovementType",
+    "InventoryReservation",
     "MemberRef",
     "Order",
     "OrderItem",
@@ -62,6 +68,7 @@ __all__ = [
     "ProductType",
     "ProductVariant",
     "ProductVideo",
+    "ReservationStatus",
     "SourcingType",
     "StoreAuditLog",
     "StoreCredit",
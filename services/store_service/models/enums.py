@@ -35,6 +35,13 @@ class InventoryMovementType(str, enum.Enum):
     RETURN = "return"
 
 
+class ReservationStatus(str, enum.Enum):
+    ACTIVE = "active"
+    COMMITTED = "committed"
+    RELEASED = "released"
+    EXPIRED = "expired"
+
+
 class CartStatus(str, enum.Enum):
     ACTIVE = "active"
     CONVERTED = "converted"
@@ -6,10 +6,14 @@ from typing import Optional
 
 from libs.common.datetime_utils import utc_now
 from libs.db.base import Base
-from services.store_service.models.enums import InventoryMovementType, enum_values
+from services.store_service.models.enums import (
+    InventoryMovementType,
+    ReservationStatus,
+    enum_values,
+)
 from sqlalchemy import CheckConstraint, DateTime
 from sqlalchemy import Enum as SAEnum
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -39,7 +43,7 @@ class InventoryItem(Base):
     )
     quantity_reserved: Mapped[int] = mapped_column(
         Integer, default=0, server_default="0", nullable=False
-    )  # Held in active carts
+    )  # Held for unpaid and unfulfilled orders (see InventoryReservation)
 
     # Thresholds
     low_stock_threshold: Mapped[int] = mapped_column(
@@ -131,3 +135,66 @@ class InventoryMovement(Base):
 
     def __repr__(self):
         return f"<InventoryMovement {self.movement_type} qty={self.quantity}>"
+
+
+class InventoryReservation(Base):
+    """Stock held for one order, from checkout until it expires or is released.
+
+    While a reservation is active or committed its quantity is counted in
+    the item's ``quantity_reserved``. See services/store_service/reservations.py.
+    """
+
+    __tablename__ = "store_inventory_reservations"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    inventory_item_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("store_inventory_items.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    order_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("store_orders.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[ReservationStatus] = mapped_column(
+        SAEnum(
+            ReservationStatus,
+            values_callable=enum_values,
+            name="store_reservation_status_enum",
+        ),
+        default=ReservationStatus.ACTIVE,
+        nullable=False,
+    )
+    # Only meaningful while active: the expiry sweep returns the stock to
+    # sale after this.
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now, onupdate=utc_now
+    )
+
+    __table_args__ = (
+        CheckConstraint("quantity > 0", name="positive_reservation"),
+        Index(
+            "ix_store_inventory_reservations_active_expiry",
+            "expires_at",
+            postgresql_where=text("status = 'active'"),
+        ),
+    )
+
+    def __repr__(self):
+        return (
+            f"<InventoryReservation order={self.order_id} "
+            f"item={self.inventory_item_id} qty={self.quantity} {self.status}>"
+        )
@@ -0,0 +1,394 @@
+"""Atomic stock reservations for store orders.
+
+Checkout holds stock with one conditional UPDATE per inventory item::
+
+    UPDATE store_inventory_items
+       SET quantity_reserved = quantity_reserved + :quantity
+     WHERE id = :id AND quantity_on_hand - quantity_reserved >= :quantity
+
+so checking availability and taking the stock is a single step. When buyers
+race for the last units, the losers' UPDATEs match no row. Before, every
+buyer passed a check in Python, and the increments then either overwrote
+each other (oversold) or tripped the ``valid_reserved`` constraint. Items are
+taken in id order so multi-item checkouts can't deadlock, and
+``start_checkout`` takes them as late as it can (after the wallet debit),
+so the row locks are held only until its commit and never across a call to
+another service.
+
+Each hold is an ``InventoryReservation`` of the order:
+
+  * active    — unpaid; after ``expires_at`` the store worker's expiry
+                sweep (every minute) puts the stock back on sale
+  * committed — paid; held until the order is cancelled
+  * released  — the order was cancelled or its payment failed
+  * expired   — timed out unpaid; a late payment takes the stock again
+                if it is still there
+
+Reservation rows are always locked before inventory rows. Nothing here
+commits.
+"""
+
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import bindparam, exists, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from libs.common.datetime_utils import utc_now
+from libs.common.logging import get_logger
+from services.store_service.models import (
+    InventoryItem,
+    InventoryMovement,
+    InventoryMovementType,
+    InventoryReservation,
+    Order,
+    OrderItem,
+    ProductVariant,
+    ReservationStatus,
+    SourcingType,
+)
+
+logger = get_logger(__name__)
+
+# How long checkout holds stock for an unpaid order.
+RESERVATION_TTL_MINUTES = 30
+
+# Reservations expired per sweep statement.
+EXPIRY_BATCH = 500
+
+_HELD = (ReservationStatus.ACTIVE, ReservationStatus.COMMITTED)
+
+
+class InsufficientStock(Exception):
+    """Not enough unreserved stock to hold an item. Routers map this to 400."""
+
+    def __init__(self, inventory_item_id: uuid.UUID, quantity: int, available: int):
+        super().__init__(f"{available} available, {quantity} requested")
+        self.inventory_item_id = inventory_item_id
+        self.quantity = quantity
+        self.available = available
+
+
+async def _take_stock(
+    db: AsyncSession, inventory_item_id: uuid.UUID, quantity: int
+) -> bool:
+    """Reserve ``quantity`` units if they are unreserved; True if it did."""
+    item = InventoryItem
+    taken = await db.execute(
+        update(item)
+        .where(
+            item.id == inventory_item_id,
+            item.quantity_on_hand - item.quantity_reserved >= quantity,
+        )
+        .values(
+            quantity_reserved=item.quantity_reserved + quantity,
+            updated_at=utc_now(),
+        )
+        .returning(item.id)
+        .execution_options(synchronize_session=False)
+    )
+    return taken.first() is not None
+
+
+async def _return_stock(db: AsyncSession, quantities: dict[uuid.UUID, int]) -> None:
+    """Un-reserve units (inventory item id -> units), one executemany."""
+    if not quantities:
+        return
+    items = InventoryItem.__table__
+    await db.execute(
+        items.update()
+        .where(items.c.id == bindparam("item_id"))
+        .values(
+            quantity_reserved=items.c.quantity_reserved - bindparam("released"),
+            updated_at=func.now(),
+        ),
+        [
+            {"item_id": item_id, "released": quantity}
+            for item_id, quantity in sorted(quantities.items())
+        ],
+    )
+
+
+async def _log_movements(
+    db: AsyncSession,
+    movement_type: InventoryMovementType,
+    rows: Iterable[tuple[uuid.UUID, int, uuid.UUID]],
+    *,
+    reference_type: str,
+    notes: str,
+    performed_by: Optional[str] = None,
+) -> None:
+    """Insert one movement per (inventory item id, signed quantity, order id)."""
+    movements = [
+        {
+            "inventory_item_id": item_id,
+            "movement_type": movement_type,
+            "quantity": quantity,
+            "reference_type": reference_type,
+            "reference_id": order_id,
+            "notes": notes,
+            "performed_by": performed_by,
+        }
+        for item_id, quantity, order_id in rows
+    ]
+    if movements:
+        await db.execute(insert(InventoryMovement), movements)
+
+
+async def reserve_order_stock(
+    db: AsyncSession,
+    order_id: uuid.UUID,
+    quantities: dict[uuid.UUID, int],
+    ttl: timedelta = timedelta(minutes=RESERVATION_TTL_MINUTES),
+) -> datetime:
+    """Hold ``quantities`` (inventory item id -> units) for a new order.
+
+    All or nothing: raises ``InsufficientStock`` for the first item that
+    can't be covered, and the caller must then roll back. Returns when the
+    hold expires.
+    """
+    for item_id, quantity in sorted(quantities.items()):
+        if not await _take_stock(db, item_id, quantity):
+            available = (
+                await db.execute(
+                    select(
+                        InventoryItem.quantity_on_hand - InventoryItem.quantity_reserved
+                    ).where(InventoryItem.id == item_id)
+                )
+            ).scalar_one()
+            raise InsufficientStock(item_id, quantity, max(available, 0))
+
+    expires_at = utc_now() + ttl
+    if quantities:
+        await db.execute(
+            insert(InventoryReservation),
+            [
+                {
+                    "inventory_item_id": item_id,
+                    "order_id": order_id,
+                    "quantity": quantity,
+                    "status": ReservationStatus.ACTIVE,
+                    "expires_at": expires_at,
+                }
+                for item_id, quantity in quantities.items()
+            ],
+        )
+        await _log_movements(
+            db,
+            InventoryMovementType.RESERVATION,
+            [(item_id, quantity, order_id) for item_id, quantity in quantities.items()],
+            reference_type="order",
+            notes="Reserved at checkout",
+        )
+    return expires_at
+
+
+async def commit_order_reservations(db: AsyncSession, order: Order) -> list[uuid.UUID]:
+    """Keep a paid order's stock held until it is fulfilled or cancelled.
+
+    Active holds become committed. Holds that expired before the payment
+    arrived are taken again if the stock is still there. Returns the
+    inventory items where it wasn't: the order is oversold and needs an
+    admin.
+    """
+    res = InventoryReservation
+    now = utc_now()
+    await db.execute(
+        update(res)
+        .where(res.order_id == order.id, res.status == ReservationStatus.ACTIVE)
+        .values(status=ReservationStatus.COMMITTED, updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    lapsed = (
+        (
+            await db.execute(
+                select(res)
+                .where(
+                    res.order_id == order.id, res.status == ReservationStatus.EXPIRED
+                )
+                .order_by(res.inventory_item_id)
+                .with_for_update()
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    retaken, short = [], []
+    for reservation in lapsed:
+        if await _take_stock(db, reservation.inventory_item_id, reservation.quantity):
+            reservation.status = ReservationStatus.COMMITTED
+            retaken.append(
+                (reservation.inventory_item_id, reservation.quantity, order.id)
+            )
+        else:
+            short.append(reservation.inventory_item_id)
+    await _log_movements(
+        db,
+        InventoryMovementType.RESERVATION,
+        retaken,
+        reference_type="order",
+        notes=f"Reserved again: order {order.order_number} paid after its hold expired",
+    )
+    if short:
+        logger.warning(
+            "Order %s was paid after its hold expired and %d item(s) have sold "
+            "out since: %s",
+            order.order_number,
+            len(short),
+            ", ".join(str(item_id) for item_id in short),
+        )
+    return short
+
+
+async def release_order_reservations(
+    db: AsyncSession, order: Order, performed_by: Optional[str]
+) -> int:
+    """Give back the stock held for a cancelled or failed order.
+
+    Idempotent; returns the units released.
+    """
+    res = InventoryReservation
+    released = (
+        await db.execute(
+            update(res)
+            .where(res.order_id == order.id, res.status.in_(_HELD))
+            .values(status=ReservationStatus.RELEASED, updated_at=utc_now())
+            .returning(res.inventory_item_id, res.quantity)
+            .execution_options(synchronize_session=False)
+        )
+    ).all()
+    if not released:
+        tracked = (
+            await db.execute(select(exists().where(res.order_id == order.id)))
+        ).scalar()
+        if tracked:
+            return 0
+        return await _release_untracked_order(db, order, performed_by)
+
+    quantities: dict[uuid.UUID, int] = defaultdict(int)
+    for item_id, quantity in released:
+        quantities[item_id] += quantity
+    await _return_stock(db, quantities)
+    await _log_movements(
+        db,
+        InventoryMovementType.RELEASE,
+        [(item_id, -quantity, order.id) for item_id, quantity in quantities.items()],
+        reference_type="order",
+        notes=f"Released for {order.status.value} order {order.order_number}",
+        performed_by=performed_by,
+    )
+    logger.info(
+        "Released %d reserved units for order %s",
+        sum(quantities.values()),
+        order.order_number,
+    )
+    return sum(quantities.values())
+
+
+async def _release_untracked_order(
+    db: AsyncSession, order: Order, performed_by: Optional[str]
+) -> int:
+    """Release an order placed before reservations were recorded.
+
+    Checkout added its stocked items' quantities to ``quantity_reserved``;
+    give them back without taking the count below zero.
+    """
+    items = (
+        (
+            await db.execute(
+                select(OrderItem)
+                .where(OrderItem.order_id == order.id)
+                .options(
+                    selectinload(OrderItem.variant).selectinload(
+                        ProductVariant.inventory_item
+                    ),
+                    selectinload(OrderItem.variant).selectinload(
+                        ProductVariant.product
+                    ),
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    released = 0
+    for item in items:
+        variant = item.variant
+        if not variant or not variant.inventory_item:
+            continue
+        if variant.product and variant.product.sourcing_type in (
+            SourcingType.PREORDER,
+            SourcingType.DROPSHIP,
+        ):
+            continue  # never reserved
+        inv = variant.inventory_item
+        release_qty = min(item.quantity, inv.quantity_reserved)
+        if release_qty <= 0:
+            continue
+
+        inv.quantity_reserved -= release_qty
+        released += release_qty
+        db.add(
+            InventoryMovement(
+                inventory_item_id=inv.id,
+                movement_type=InventoryMovementType.RELEASE,
+                quantity=-release_qty,
+                reference_type="order",
+                reference_id=order.id,
+                notes=f"Released for {order.status.value} order {order.order_number}",
+                performed_by=performed_by,
+            )
+        )
+
+    logger.info(
+        "Released inventory for order %s (%d items)", order.order_number, len(items)
+    )
+    return released
+
+
+async def expire_reservations(
+    db: AsyncSession, *, now: Optional[datetime] = None, limit: int = EXPIRY_BATCH
+) -> tuple[int, int]:
+    """Put the stock of unpaid holds past ``expires_at`` back on sale.
+
+    Expires up to ``limit`` reservations, oldest first. Rows locked by a
+    concurrent payment or cancellation are skipped. Returns (reservations,
+    units). Call again while it returns ``limit`` reservations.
+    """
+    now = now or utc_now()
+    res = InventoryReservation
+    due = (
+        select(res.id)
+        .where(res.status == ReservationStatus.ACTIVE, res.expires_at <= now)
+        .order_by(res.expires_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    expired = (
+        await db.execute(
+            update(res)
+            .where(res.id.in_(due), res.status == ReservationStatus.ACTIVE)
+            .values(status=ReservationStatus.EXPIRED, updated_at=now)
+            .returning(res.inventory_item_id, res.order_id, res.quantity)
+            .execution_options(synchronize_session=False)
+        )
+    ).all()
+
+    quantities: dict[uuid.UUID, int] = defaultdict(int)
+    for item_id, _, quantity in expired:
+        quantities[item_id] += quantity
+    await _return_stock(db, quantities)
+    await _log_movements(
+        db,
+        InventoryMovementType.RELEASE,
+        [(item_id, -quantity, order_id) for item_id, order_id, quantity in expired],
+        reference_type="reservation_expiry",
+        notes="Hold expired before payment",
+        performed_by="system",
+    )
+    return len(expired), sum(quantities.values())
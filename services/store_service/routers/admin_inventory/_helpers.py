@@ -21,14 +21,16 @@ from sqlalchemy.orm import selectinload
 
 from services.store_service.models import (
     AuditEntityType,
-    InventoryMovement,
-    InventoryMovementType,
     Order,
     OrderItem,
     OrderStatus,
     Product,
     ProductVariant,
 )
+from services.store_service.reservations import (
+    commit_order_reservations,
+    release_order_reservations,
+)
 from services.store_service.routers._helpers import log_audit
 
 logger = get_logger(__name__)
@@ -45,51 +47,6 @@ def _order_eager_load_options():
     )
 
 
-async def _release_order_inventory(
-    db: AsyncSession, order: Order, performed_by: str
-) -> None:
-    """Release reserved inventory for each item in a cancelled/failed order."""
-    # Eager-load items with their variant's inventory
-    items_query = (
-        select(OrderItem)
-        .where(OrderItem.order_id == order.id)
-        .options(
-            selectinload(OrderItem.variant).selectinload(ProductVariant.inventory_item)
-        )
-    )
-    items_result = await db.execute(items_query)
-    order_items = items_result.scalars().all()
-
-    for item in order_items:
-        variant = item.variant
-        if not variant or not variant.inventory_item:
-            continue
-        inv = variant.inventory_item
-        release_qty = min(item.quantity, inv.quantity_reserved)
-        if release_qty <= 0:
-            continue
-
-        inv.quantity_reserved -= release_qty
-
-        # Log inventory release movement
-        movement = InventoryMovement(
-            inventory_item_id=inv.id,
-            movement_type=InventoryMovementType.RELEASE,
-            quantity=-release_qty,
-            reference_type="order",
-            reference_id=order.id,
-            notes=f"Released for {order.status.value} order {order.order_number}",
-            performed_by=performed_by,
-        )
-        db.add(movement)
-
-    logger.info(
-        "Released inventory for order %s (%d items)",
-        order.order_number,
-        len(order_items),
-    )
-
-
 async def _apply_order_status_change(
     db: AsyncSession,
     order: Order,
@@ -105,14 +62,17 @@ async def _apply_order_status_change(
         order.admin_notes = admin_notes
 
     # Set timestamps based on status
-    if new_status in [OrderStatus.PICKED_UP, OrderStatus.DELIVERED]:
+    if new_status == OrderStatus.PAID and old_status != OrderStatus.PAID:
+        # Keep the stock held past the unpaid-reservation expiry
+        await commit_order_reservations(db, order)
+    elif new_status in [OrderStatus.PICKED_UP, OrderStatus.DELIVERED]:
         order.fulfilled_at = datetime.utcnow()
     elif new_status in (OrderStatus.CANCELLED, OrderStatus.PAYMENT_FAILED):
         if new_status == OrderStatus.CANCELLED:
             order.cancelled_at = datetime.utcnow()
 
         # Release inventory reservations for each order item
-        await _release_order_inventory(db, order, current_user.user_id)
+        await release_order_reservations(db, order, current_user.user_id)
 
         # Refund Bubbles if any were applied (covers split-payment Paystack failures too)
         if order.bubbles_applied and order.bubbles_applied > 0:
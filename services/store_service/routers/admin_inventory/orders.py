@@ -26,6 +26,7 @@ from services.store_service.models import (
     StoreCredit,
     StoreCreditSourceType,
 )
+from services.store_service.reservations import commit_order_reservations
 from services.store_service.routers._helpers import log_audit
 from services.store_service.schemas import (
     OrderListResponse,
@@ -186,6 +187,7 @@ async def mark_order_paid(
 
     old_status = order.status
     order.status = OrderStatus.PAID
+    await commit_order_reservations(db, order)
 
     await log_audit(
         db,
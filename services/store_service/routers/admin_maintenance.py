@@ -8,19 +8,14 @@ from libs.auth.models import AuthUser
 from libs.common.logging import get_logger
 from libs.db.session import get_async_db
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-
-from services.store_service.models import (
-    Cart,
-    CartItem,
-    CartStatus,
-    InventoryMovement,
-    InventoryMovementType,
-    Order,
-    OrderStatus,
-    ProductVariant,
+
+from services.store_service.models import Cart, CartStatus, Order, OrderStatus
+from services.store_service.reservations import (
+    EXPIRY_BATCH,
+    expire_reservations,
+    release_order_reservations,
 )
 
 router = APIRouter(tags=["admin-store"])
@@ -53,66 +48,42 @@ async def run_cleanup(
     current_user: AuthUser = Depends(require_admin),
     db: AsyncSession = Depends(get_async_db),
 ):
-    """Run store cleanup: expire stale carts, release inventory, mark stale orders.
+    """Run store cleanup: expire stale carts and reservations, fail stale orders.
 
-    This endpoint can be called periodically via a cron job or manually by admin.
+    The store worker expires reservations every minute; this endpoint runs the
+    same sweep on demand along with the cart and order cleanup.
 
     Actions performed:
-    1. Expire active carts older than ``expire_minutes``
-    2. Release inventory reservations for expired carts
-    3. Mark pending_payment orders older than ``stale_order_hours`` as payment_failed
+    1. Expire active carts older than ``expire_minutes`` (carts hold no stock;
+       checkout reserves it for the order)
+    2. Release reservations of unpaid orders past their hold
+    3. Mark pending_payment orders older than ``stale_order_hours`` as
+       payment_failed and release whatever stock they still hold
     """
     now = datetime.utcnow()
 
-    # --- 1. Find and expire stale active carts ---
+    # --- 1. Expire stale active carts ---
     cutoff = now - timedelta(minutes=expire_minutes)
-    stale_carts_query = (
-        select(Cart)
+    expired_carts = await db.execute(
+        update(Cart)
         .where(
             Cart.status == CartStatus.ACTIVE,
             Cart.updated_at < cutoff,
         )
-        .options(
-            selectinload(Cart.items)
-            .selectinload(CartItem.variant)
-            .selectinload(ProductVariant.inventory_item)
-        )
+        .values(status=CartStatus.EXPIRED)
+        .execution_options(synchronize_session=False)
     )
-    result = await db.execute(stale_carts_query)
-    stale_carts = list(result.scalars().all())
+    expired_count = expired_carts.rowcount or 0
 
-    expired_count = 0
+    # --- 2. Release lapsed reservations ---
     reservations_released = 0
+    while True:
+        expired, units = await expire_reservations(db)
+        reservations_released += units
+        if expired < EXPIRY_BATCH:
+            break
 
-    for cart in stale_carts:
-        cart.status = CartStatus.EXPIRED
-
-        # Release any inventory reservations held by this cart's items
-        for item in cart.items:
-            if not item.variant or not item.variant.inventory_item:
-                continue
-            inv = item.variant.inventory_item
-            release_qty = min(item.quantity, inv.quantity_reserved)
-            if release_qty <= 0:
-                continue
-
-            inv.quantity_reserved -= release_qty
-            reservations_released += release_qty
-
-            movement = InventoryMovement(
-                inventory_item_id=inv.id,
-                movement_type=InventoryMovementType.RELEASE,
-                quantity=-release_qty,
-                reference_type="cart_expiry",
-                reference_id=cart.id,
-                notes=f"Cart expired after {expire_minutes}min inactivity",
-                performed_by="system",
-            )
-            db.add(movement)
-
-        expired_count += 1
-
-    # --- 2. Mark stale pending_payment orders as payment_failed ---
+    # --- 3. Mark stale pending_payment orders as payment_failed ---
     order_cutoff = now - timedelta(hours=stale_order_hours)
     stale_orders_query = select(Order).where(
         Order.status == OrderStatus.PENDING_PAYMENT,
@@ -124,6 +95,7 @@ async def run_cleanup(
     stale_order_count = 0
     for order in stale_orders:
         order.status = OrderStatus.PAYMENT_FAILED
+        reservations_released += await release_order_reservations(db, order, "system")
         stale_order_count += 1
 
     await db.commit()
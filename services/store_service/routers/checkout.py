@@ -17,6 +17,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from services.store_service.models import Order, OrderItem, OrderStatus
+from services.store_service.reservations import (
+    commit_order_reservations,
+    release_order_reservations,
+)
 from services.store_service.schemas import PaymentInitRequest, PaymentInitResponse
 
 # Paystack redirects back here after payment — the verify page reads ?reference=…
@@ -311,6 +315,7 @@ async def verify_payment(
         from datetime import datetime
 
         order.paid_at = datetime.utcnow()
+        await commit_order_reservations(db, order)
         await db.commit()
 
         # Emit purchase event
@@ -358,6 +363,7 @@ async def verify_payment(
         return _verify_response("success", "Payment confirmed")
     elif payment_status == "failed":
         order.status = OrderStatus.PAYMENT_FAILED
+        await release_order_reservations(db, order, "system")
         await db.commit()
         return _verify_response("failed", "Payment failed. Please try again.")
     else:
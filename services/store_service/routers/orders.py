@@ -1,5 +1,7 @@
 """Store orders router: checkout, order history, and store credits."""
 
+import uuid
+from collections import defaultdict
 from datetime import datetime, timedelta
 from decimal import Decimal
 
@@ -12,8 +14,10 @@ from sqlalchemy.orm import selectinload
 from libs.auth.dependencies import get_current_user
 from libs.auth.models import AuthUser
 from libs.common.currency import bubbles_to_naira, naira_to_bubbles
+from libs.common.logging import get_logger
 from libs.common.service_client import (
     check_wallet_balance,
+    credit_member_wallet,
     debit_member_wallet,
     emit_rewards_event,
     get_member_by_auth_id,
@@ -24,8 +28,6 @@ from services.store_service.models import (
     CartItem,
     CartStatus,
     FulfillmentType,
-    InventoryMovement,
-    InventoryMovementType,
     Order,
     OrderItem,
     OrderStatus,
@@ -35,6 +37,11 @@ from services.store_service.models import (
     SourcingType,
     StoreCredit,
 )
+from services.store_service.reservations import (
+    InsufficientStock,
+    commit_order_reservations,
+    reserve_order_stock,
+)
 from services.store_service.routers.cart import (
     _resolve_coupon_discount,
     calculate_cart_totals,
@@ -47,6 +54,7 @@ from services.store_service.schemas import (
 )
 
 router = APIRouter(tags=["store"])
+logger = get_logger(__name__)
 
 # Constants
 DELIVERY_FEE_NGN = Decimal("2000")  # Flat delivery fee for now
@@ -57,6 +65,29 @@ DELIVERY_FEE_NGN = Decimal("2000")  # Flat delivery fee for now
 # ============================================================================
 
 
+async def _refund_unplaced_order(
+    member_auth_id: str, order_id: uuid.UUID, order_number: str, bubbles: int
+) -> None:
+    """Give back the Bubbles debited for an order that sold out at the hold."""
+    try:
+        await credit_member_wallet(
+            member_auth_id,
+            amount=bubbles,
+            idempotency_key=f"refund-order-{order_id}",
+            description=f"Refund for unplaced order {order_number} (sold out)",
+            calling_service="store",
+            transaction_type="refund",
+            reference_type="order",
+            reference_id=str(order_id),
+        )
+    except Exception:
+        logger.exception(
+            "Failed to refund %d Bubbles for unplaced order %s",
+            bubbles,
+            order_number,
+        )
+
+
 @router.post("/checkout/start", response_model=CheckoutStartResponse)
 async def start_checkout(
     request: CheckoutStartRequest,
@@ -114,7 +145,11 @@ async def start_checkout(
             detail="Size chart acknowledgment required for swimwear products",
         )
 
-    # Validate inventory and reserve (skip stock checks for pre-order/dropship)
+    # Validate inventory (skip stock checks for pre-order/dropship). This is
+    # only a fast fail on a snapshot; the stock is taken atomically once the
+    # order exists, just before commit.
+    reserve_quantities: dict[uuid.UUID, int] = defaultdict(int)
+    skus: dict[uuid.UUID, str] = {}
     for item in cart.items:
         inv = item.variant.inventory_item
         product = item.variant.product
@@ -135,16 +170,8 @@ async def start_checkout(
             )
         # Reserve inventory (only for stocked items, not pre-order/dropship)
         if inv and not is_preorder:
-            inv.quantity_reserved += item.quantity
-            # Log movement
-            movement = InventoryMovement(
-                inventory_item_id=inv.id,
-                movement_type=InventoryMovementType.RESERVATION,
-                quantity=item.quantity,
-                reference_type="cart",
-                reference_id=cart.id,
-            )
-            db.add(movement)
+            reserve_quantities[inv.id] += item.quantity
+            skus[inv.id] = item.variant.sku
 
     # Get member info for order via members service HTTP API
     member = await get_member_by_auth_id(current_user.user_id, calling_service="store")
@@ -271,7 +298,9 @@ async def start_checkout(
     db.add(order)
     await db.flush()  # Get order ID
 
-    # Debit Bubbles after we have the order ID (use it as idempotency scope)
+    # Debit Bubbles after we have the order ID (use it as idempotency scope),
+    # and before the stock is held, so the inventory rows aren't locked
+    # across the wallet service call.
     if bubbles_applied and bubbles_applied > 0:
         try:
             result_txn = await debit_member_wallet(
@@ -287,11 +316,6 @@ async def start_checkout(
             wallet_txn_id = result_txn.get("transaction_id")
             order.bubbles_applied = bubbles_applied
             order.wallet_transaction_id = wallet_txn_id
-
-            # If Bubbles covered the entire amount, mark as PAID
-            if paystack_amount <= 0:
-                order.status = OrderStatus.PAID
-                order.paid_at = datetime.utcnow()
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 400:
                 detail = e.response.json().get("detail", "")
@@ -327,6 +351,29 @@ async def start_checkout(
         )
         db.add(order_item)
 
+    # Hold the stock: one conditional UPDATE per item, all or nothing. The
+    # rollback on error discards the order and any units already taken; the
+    # Bubbles already debited for it are refunded.
+    try:
+        await reserve_order_stock(db, order.id, reserve_quantities)
+    except InsufficientStock as e:
+        order_id, order_number = order.id, order.order_number
+        await db.rollback()
+        if bubbles_applied:
+            await _refund_unplaced_order(
+                current_user.user_id, order_id, order_number, bubbles_applied
+            )
+        raise HTTPException(
+            status_code=400,
+            detail=f"Only {e.available} available for {skus[e.inventory_item_id]}",
+        )
+
+    # If Bubbles covered the entire amount, mark as PAID
+    if bubbles_applied and paystack_amount <= 0:
+        order.status = OrderStatus.PAID
+        order.paid_at = datetime.utcnow()
+        await commit_order_reservations(db, order)
+
     # Mark cart as converted
     cart.status = CartStatus.CONVERTED
     await db.commit()
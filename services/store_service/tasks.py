@@ -0,0 +1,33 @@
+"""Background tasks for the store service.
+
+The reservation expiry sweep: checkout holds stock for an unpaid order for
+``RESERVATION_TTL_MINUTES``; anything still unpaid after that goes back on
+sale, so abandoned checkouts during a drop don't lock stock up until an
+admin runs the maintenance cleanup. See services/store_service/reservations.py.
+"""
+
+from libs.common.logging import get_logger
+from libs.db.config import AsyncSessionLocal
+from services.store_service.reservations import EXPIRY_BATCH, expire_reservations
+
+logger = get_logger(__name__)
+
+
+async def sweep_expired_reservations() -> dict:
+    """Expire lapsed reservations, committing each batch.
+
+    Returns ``{expired, units_released}`` for logging.
+    """
+    expired = units_released = 0
+    async with AsyncSessionLocal() as db:
+        while True:
+            batch, units = await expire_reservations(db)
+            await db.commit()
+            expired += batch
+            units_released += units
+            if batch < EXPIRY_BATCH:
+                break
+
+    result = {"expired": expired, "units_released": units_released}
+    logger.info("sweep_expired_reservations: %s", result)
+    return result
@@ -0,0 +1,33 @@
+"""ARQ worker for store_service background tasks.
+
+Runs the reservation expiry sweep every minute, so stock held for unpaid
+orders goes back on sale within a minute of its hold lapsing. Run with:
+
+    arq services.store_service.worker.WorkerSettings
+"""
+
+from arq import cron
+from libs.common.arq_config import get_redis_settings
+
+
+async def task_sweep_expired_reservations(ctx: dict):
+    from services.store_service.tasks import sweep_expired_reservations
+
+    await sweep_expired_reservations()
+
+
+class WorkerSettings:
+    redis_settings = get_redis_settings()
+    queue_name = "arq:store"
+
+    functions = [task_sweep_expired_reservations]
+
+    cron_jobs = [
+        # Every minute — returns stock of unpaid orders past their hold
+        # (RESERVATION_TTL_MINUTES after checkout) to sale.
+        cron(
+            task_sweep_expired_reservations,
+            minute=set(range(60)),
+            run_at_startup=True,
+        ),
+    ]
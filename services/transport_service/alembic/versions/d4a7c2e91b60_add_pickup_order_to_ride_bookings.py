@@ -0,0 +1,23 @@
+"""add_pickup_order_to_ride_bookings
+
+Revision ID: d4a7c2e91b60
+Revises: be5f99aaf6bc
+Create Date: 2026-10-18 10:12:40.418203
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4a7c2e91b60'
+down_revision = 'be5f99aaf6bc'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('ride_bookings', sa.Column('pickup_order', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('ride_bookings', 'pickup_order')
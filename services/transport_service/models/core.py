@@ -1,5 +1,6 @@
 import uuid
 from datetime import datetime
+from typing import Optional
 
 from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
@@ -172,6 +173,9 @@ class RideBooking(Base):
         UUID(as_uuid=True), ForeignKey("pickup_locations.id"), nullable=False
     )
     assigned_ride_number: Mapped[int] = mapped_column(Integer, default=1)
+    # Stop position within the assigned ride (1 = first pickup). Set by the
+    # ride-assignment planner; NULL until the session's rides are planned.
+    pickup_order: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     num_seats: Mapped[int] = mapped_column(Integer, default=1, server_default="1")
 
     created_at: Mapped[datetime] = mapped_column(
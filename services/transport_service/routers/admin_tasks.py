@@ -1,6 +1,10 @@
 """Admin-triggered manual task endpoints (transport)."""
 
-from fastapi import APIRouter, Depends
+import uuid
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from libs.auth.dependencies import require_admin
@@ -10,6 +14,9 @@ from libs.db.session import get_async_db
 from services.transport_service.services.chat_reconciliation import (
     reconcile_trip_chat_memberships,
 )
+from services.transport_service.services.ride_assignment import (
+    assign_session_rides,
+)
 
 router = APIRouter(prefix="/transport", tags=["admin-tasks"])
 logger = get_logger(__name__)
@@ -28,3 +35,67 @@ async def trigger_trip_chat_reconciliation(
     """
     counters = await reconcile_trip_chat_memberships(db)
     return counters
+
+
+class PlannedRideResponse(BaseModel):
+    ride_number: int
+    pickup_location_ids: List[uuid.UUID]  # In pickup order
+    booking_ids: List[uuid.UUID]  # Grouped by stop, in pickup order
+    seats: int
+    drive_km: float
+    drive_minutes: float
+
+
+class ConfigRidePlanResponse(BaseModel):
+    session_ride_config_id: uuid.UUID
+    capacity: int
+    rides: List[PlannedRideResponse]
+    total_drive_minutes: float
+
+
+class SessionRidePlanResponse(BaseModel):
+    session_id: uuid.UUID
+    applied: bool
+    configs: List[ConfigRidePlanResponse]
+
+
+@router.post(
+    "/admin/sessions/{session_id}/assign-rides",
+    response_model=SessionRidePlanResponse,
+)
+async def trigger_session_ride_assignment(
+    session_id: uuid.UUID,
+    dry_run: bool = Query(False, description="Return the plan without saving"),
+    current_user: AuthUser = Depends(require_admin),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Pack the session's riders into vehicles and order each vehicle's pickups.
+
+    Overwrites ``assigned_ride_number`` and ``pickup_order`` on every booking
+    of the session (unless ``dry_run``). The transport-worker does the same
+    for sessions whose rides depart within the next few hours.
+    """
+    plans = await assign_session_rides(db, session_id, dry_run=dry_run)
+    return SessionRidePlanResponse(
+        session_id=session_id,
+        applied=not dry_run,
+        configs=[
+            ConfigRidePlanResponse(
+                session_ride_config_id=plan.session_ride_config_id,
+                capacity=plan.capacity,
+                total_drive_minutes=round(plan.total_drive_minutes, 1),
+                rides=[
+                    PlannedRideResponse(
+                        ride_number=ride.ride_number,
+                        pickup_location_ids=ride.stops,
+                        booking_ids=[b.booking_id for b in ride.bookings],
+                        seats=ride.seats,
+                        drive_km=round(ride.drive_km, 2),
+                        drive_minutes=round(ride.drive_minutes, 1),
+                    )
+                    for ride in plan.rides
+                ],
+            )
+            for plan in plans
+        ],
+    )
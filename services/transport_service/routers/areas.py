@@ -15,6 +15,9 @@ from services.transport_service.models import (
     RideBooking,
     SessionRideConfig,
 )
+from services.transport_service.services.ride_config_cache import (
+    invalidate_ride_configs,
+)
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -79,30 +82,31 @@ async def list_ride_areas(
     result = await db.execute(query)
     areas = result.scalars().all()
 
-    # Fetch pickup locations for each area
-    responses = []
-    for area in areas:
+    # Fetch pickup locations for all areas in one query
+    locations_by_area: dict[uuid.UUID, list[PickupLocation]] = {}
+    if areas:
         locs_query = select(PickupLocation).where(
-            PickupLocation.area_id == area.id, PickupLocation.is_active.is_(True)
+            PickupLocation.area_id.in_([area.id for area in areas]),
+            PickupLocation.is_active.is_(True),
         )
-        locs_result = await db.execute(locs_query)
-        locations = locs_result.scalars().all()
-
-        responses.append(
-            RideAreaResponse(
-                id=area.id,
-                name=area.name,
-                slug=area.slug,
-                is_active=area.is_active,
-                pickup_locations=[
-                    PickupLocationResponse.model_validate(loc) for loc in locations
-                ],
-                created_at=area.created_at,
-                updated_at=area.updated_at,
-            )
+        for loc in (await db.execute(locs_query)).scalars().all():
+            locations_by_area.setdefault(loc.area_id, []).append(loc)
+
+    return [
+        RideAreaResponse(
+            id=area.id,
+            name=area.name,
+            slug=area.slug,
+            is_active=area.is_active,
+            pickup_locations=[
+                PickupLocationResponse.model_validate(loc)
+                for loc in locations_by_area.get(area.id, [])
+            ],
+            created_at=area.created_at,
+            updated_at=area.updated_at,
         )
-
-    return responses
+        for area in areas
+    ]
 
 
 @router.delete("/admin/members/{member_id}")
@@ -115,10 +119,14 @@ async def admin_delete_member_transport(
     Delete transport bookings for a member (Admin only).
     """
     result = await db.execute(
-        delete(RideBooking).where(RideBooking.member_id == member_id)
+        delete(RideBooking)
+        .where(RideBooking.member_id == member_id)
+        .returning(RideBooking.session_id)
     )
+    session_ids = result.scalars().all()
     await db.commit()
-    return {"deleted": result.rowcount or 0}
+    await invalidate_ride_configs(*set(session_ids))
+    return {"deleted": len(session_ids)}
 
 
 @router.post("/areas", response_model=RideAreaResponse)
@@ -228,12 +236,16 @@ async def delete_ride_area(
     await db.execute(delete(PickupLocation).where(PickupLocation.area_id == area_id))
 
     # Delete associated session ride configs
-    await db.execute(
-        delete(SessionRideConfig).where(SessionRideConfig.ride_area_id == area_id)
+    result = await db.execute(
+        delete(SessionRideConfig)
+        .where(SessionRideConfig.ride_area_id == area_id)
+        .returning(SessionRideConfig.session_id)
     )
+    session_ids = set(result.scalars().all())
 
     await db.delete(area)
     await db.commit()
+    await invalidate_ride_configs(*session_ids)
 
 
 @router.post("/areas/{area_id}/locations", response_model=PickupLocationResponse)
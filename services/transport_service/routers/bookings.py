@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from libs.auth.dependencies import get_current_user
 from libs.auth.models import AuthUser
 from libs.common.currency import kobo_to_bubbles
@@ -31,6 +31,10 @@ from services.transport_service.services.chat_sync import (
     ensure_trip_channel,
     reconcile_trip_membership,
 )
+from services.transport_service.services.ride_config_cache import (
+    invalidate_ride_configs,
+)
+from services.transport_service.tasks.rides import replan_session_rides
 
 router = APIRouter(prefix="/transport", tags=["transport"])
 
@@ -51,6 +55,7 @@ class RideBookingResponse(BaseModel):
     pickup_location_name: str  # Populated
     ride_area_name: str  # Populated
     assigned_ride_number: int
+    pickup_order: Optional[int] = None  # Set once the session's rides are planned
     num_seats: int
     cost: float  # Total cost for all seats — naira (kobo converted on read)
     created_at: datetime
@@ -75,6 +80,7 @@ def _build_response(
         pickup_location_name=location.name if location else "Unknown Location",
         ride_area_name=area.name if area else "Unknown Area",
         assigned_ride_number=booking.assigned_ride_number,
+        pickup_order=booking.pickup_order,
         num_seats=booking.num_seats,
         cost=(cfg.cost * booking.num_seats / 100.0) if cfg else 0.0,  # kobo → naira
         created_at=booking.created_at,
@@ -107,6 +113,7 @@ async def _get_booking_details(
 async def create_ride_booking(
     session_id: uuid.UUID,
     booking_in: RideBookingCreate,
+    background_tasks: BackgroundTasks,
     member_id: Optional[uuid.UUID] = Query(
         None, description="Member ID override for service-to-service calls"
     ),
@@ -192,6 +199,14 @@ async def create_ride_booking(
         await db.commit()
         await db.refresh(booking)
 
+    # If the session's rides are already planned, fit this booking into the
+    # plan once the response is sent (the booking and any debit are already
+    # committed; a planner failure must not fail the request).
+    background_tasks.add_task(replan_session_rides, session_id)
+
+    # Availability counts in the cached ride-config response just changed.
+    await invalidate_ride_configs(session_id)
+
     cfg, area, location = await _get_booking_details(db, booking)
 
     # Sync chat membership for the trip channel. Best-effort — chat downtime
@@ -8,7 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from libs.auth.dependencies import get_current_user, require_admin
 from libs.auth.models import AuthUser
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import func, select
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from libs.common.currency import naira_to_kobo
@@ -21,6 +21,11 @@ from services.transport_service.models import (
     RouteInfo,
     SessionRideConfig,
 )
+from services.transport_service.services.ride_config_cache import (
+    cache_ride_configs,
+    get_cached_ride_configs,
+    invalidate_ride_configs,
+)
 
 router = APIRouter(prefix="/transport", tags=["transport"])
 
@@ -196,6 +201,7 @@ async def attach_ride_areas_to_session(
         new_configs.append(cfg)
 
     await db.commit()
+    await invalidate_ride_configs(session_id)
 
     # Fetch with joins to populate details
     responses = []
@@ -356,7 +362,16 @@ async def get_session_ride_configs(
     _user: AuthUser = Depends(get_current_user),
 ):
     """Get ride configurations for a session with route info and pickup location
-    availability."""
+    availability.
+
+    Four queries regardless of how many configs / pickup locations the session
+    has (configs+areas, locations, booking counts, route info). Responses are
+    cached briefly per session — see ``services/ride_config_cache.py``.
+    """
+    cached = await get_cached_ride_configs(session_id)
+    if cached is not None:
+        return cached
+
     # Fetch session via the shared service_client. Goes through
     # libs/common/service_client → /internal/sessions/{id} on sessions-service,
     # keeping the cross-service URL and auth concerns in one place.
@@ -372,49 +387,106 @@ async def get_session_ride_configs(
     session_pool_id = session_data.get("pool_id")
     session_location = session_data.get("location")
 
-    # Get session ride configs
-    query = select(SessionRideConfig).where(SessionRideConfig.session_id == session_id)
-    result = await db.execute(query)
-    configs = result.scalars().all()
-
-    responses = []
-    for cfg in configs:
-        # Get ride area details
-        area_query = select(RideArea).where(RideArea.id == cfg.ride_area_id)
-        area_result = await db.execute(area_query)
-        area = area_result.scalar_one()
-
-        # Get pickup locations
-        locs_query = select(PickupLocation).where(
-            PickupLocation.area_id == cfg.ride_area_id
+    # 1. Configs with their ride areas
+    rows = (
+        await db.execute(
+            select(SessionRideConfig, RideArea)
+            .join(RideArea, RideArea.id == SessionRideConfig.ride_area_id)
+            .where(SessionRideConfig.session_id == session_id)
         )
-        locs_result = await db.execute(locs_query)
-        locations = locs_result.scalars().all()
+    ).all()
+    if not rows:
+        await cache_ride_configs(session_id, [])
+        return []
 
-        # Check booking counts per pickup location to determine availability
-        # Get booking counts for all pickup locations in this config
-        booking_counts = {}
-        active_pickup_location_id = None
+    # 2. Pickup locations for all involved areas
+    area_ids = {cfg.ride_area_id for cfg, _ in rows}
+    locations_by_area: Dict[uuid.UUID, List[PickupLocation]] = {}
+    for loc in (
+        (
+            await db.execute(
+                select(PickupLocation).where(PickupLocation.area_id.in_(area_ids))
+            )
+        )
+        .scalars()
+        .all()
+    ):
+        locations_by_area.setdefault(loc.area_id, []).append(loc)
 
-        for loc in locations:
-            count_query = select(func.count(RideBooking.id)).where(
-                RideBooking.session_ride_config_id == cfg.id,
-                RideBooking.pickup_location_id == loc.id,
+    # 3. Booking counts per (config, pickup location)
+    booking_counts: Dict[tuple, int] = {
+        (cfg_id, loc_id): count
+        for cfg_id, loc_id, count in (
+            await db.execute(
+                select(
+                    RideBooking.session_ride_config_id,
+                    RideBooking.pickup_location_id,
+                    func.count(RideBooking.id),
+                )
+                .where(
+                    RideBooking.session_ride_config_id.in_([cfg.id for cfg, _ in rows])
+                )
+                .group_by(
+                    RideBooking.session_ride_config_id, RideBooking.pickup_location_id
+                )
+            )
+        ).all()
+    }
+
+    # 4. Route info for every pickup location → this session's destination.
+    # Match strategy: prefer the session's pool_id against the route's
+    # destination_pool_id (pool-registry era). When either side is missing,
+    # fall back to matching the legacy `destination` string against the
+    # session's `location` enum value.
+    location_ids = [loc.id for locs in locations_by_area.values() for loc in locs]
+    pool_routes: Dict[uuid.UUID, RouteInfo] = {}
+    legacy_routes: Dict[uuid.UUID, RouteInfo] = {}
+    destination_filters = []
+    if session_pool_id:
+        destination_filters.append(RouteInfo.destination_pool_id == session_pool_id)
+    if session_location:
+        destination_filters.append(RouteInfo.destination == session_location)
+    if location_ids and destination_filters:
+        for route in (
+            (
+                await db.execute(
+                    select(RouteInfo).where(
+                        RouteInfo.origin_pickup_location_id.in_(location_ids),
+                        or_(*destination_filters),
+                    )
+                )
             )
-            count_result = await db.execute(count_query)
-            count = count_result.scalar_one() or 0
-            booking_counts[str(loc.id)] = count
+            .scalars()
+            .all()
+        ):
+            loc_id = route.origin_pickup_location_id
+            if session_pool_id and str(route.destination_pool_id) == str(
+                session_pool_id
+            ):
+                pool_routes.setdefault(loc_id, route)
+            if session_location and route.destination == session_location:
+                legacy_routes.setdefault(loc_id, route)
 
-            # If this location has bookings, it's the active one
-            if count > 0 and active_pickup_location_id is None:
-                active_pickup_location_id = str(loc.id)
+    responses = []
+    for cfg, area in rows:
+        locations = locations_by_area.get(cfg.ride_area_id, [])
+
+        # The first location with bookings is the active one for this config
+        active_pickup_location_id = next(
+            (
+                str(loc.id)
+                for loc in locations
+                if booking_counts.get((cfg.id, loc.id), 0) > 0
+            ),
+            None,
+        )
 
         # Build pickup locations with availability info AND route info
         pickup_locations_data = []
 
         for loc in locations:
             loc_id = str(loc.id)
-            current_bookings = booking_counts.get(loc_id, 0)
+            current_bookings = booking_counts.get((cfg.id, loc.id), 0)
 
             # A location is available if:
             # 1. No location in this area has bookings yet, OR
@@ -428,30 +500,7 @@ async def get_session_ride_configs(
                 is_available = current_bookings < cfg.capacity
             # else: Another location is active, this one is not available
 
-            # Fetch route info for this specific pickup location.
-            # Match strategy: prefer the session's pool_id against the route's
-            # destination_pool_id (pool-registry era). When either side is
-            # missing, fall back to matching the legacy `destination` string
-            # against the session's `location` enum value.
-            route_info = None
-            if session_pool_id:
-                route_info = (
-                    await db.execute(
-                        select(RouteInfo).where(
-                            RouteInfo.origin_pickup_location_id == loc.id,
-                            RouteInfo.destination_pool_id == session_pool_id,
-                        )
-                    )
-                ).scalar_one_or_none()
-            if route_info is None and session_location:
-                route_info = (
-                    await db.execute(
-                        select(RouteInfo).where(
-                            RouteInfo.origin_pickup_location_id == loc.id,
-                            RouteInfo.destination == session_location,
-                        )
-                    )
-                ).scalar_one_or_none()
+            route_info = pool_routes.get(loc.id) or legacy_routes.get(loc.id)
             # Calculate times
             loc_distance_text = None
             loc_duration_text = None
@@ -498,4 +547,5 @@ async def get_session_ride_configs(
             )
         )
 
+    await cache_ride_configs(session_id, [r.model_dump(mode="json") for r in responses])
     return responses
@@ -0,0 +1,436 @@
+"""Ride assignment — pack a session's riders into vehicles and order pickups.
+
+``create_ride_booking`` numbers rides per pickup location as bookings come in
+(``seats // capacity + 1``): nearby stops never share a vehicle and nothing
+says in which order a driver should collect people. This planner re-derives
+both, per ``SessionRideConfig``:
+
+1. Packing — seeded greedy clustering. Each vehicle is seeded with the
+   unassigned stop farthest from the destination, then repeatedly takes the
+   booking whose stop is closest to a stop already on board (same stop is
+   free) and still fits. Bookings are never split across vehicles; a booking
+   larger than ``capacity`` rides alone.
+2. Sequencing — per vehicle, the pickup order with the shortest drive to the
+   destination: exhaustive for up to ``EXACT_SEQUENCE_MAX_STOPS`` stops,
+   nearest-neighbour + 2-opt beyond that.
+
+Distances are great-circle km turned into minutes with ``ROAD_FACTOR`` and
+``AVERAGE_SPEED_KMH`` — good enough to rank plans, not an ETA. Stops without
+coordinates are placed at the centroid of the config's located stops. The
+destination is the session's pool when pools_service knows its coordinates;
+otherwise routes are planned open-ended.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import uuid
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Iterable, Optional, Sequence
+
+from sqlalchemy import exists, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from libs.common.datetime_utils import utc_now
+from libs.common.logging import get_logger
+from libs.common.service_client.pools import get_partner_pool
+from libs.common.service_client.sessions import get_session_by_id
+from services.transport_service.models import (
+    PickupLocation,
+    RideBooking,
+    SessionRideConfig,
+)
+
+logger = get_logger(__name__)
+
+Coord = tuple[float, float]
+
+EARTH_RADIUS_KM = 6371.0088
+# Straight-line → road distance, and average urban speed (Lagos traffic).
+ROAD_FACTOR = 1.35
+AVERAGE_SPEED_KMH = 25.0
+EXACT_SEQUENCE_MAX_STOPS = 7
+# The worker re-plans sessions whose rides depart within this window.
+UPCOMING_WINDOW = timedelta(hours=6)
+
+
+@dataclass(frozen=True)
+class RiderBooking:
+    booking_id: uuid.UUID
+    pickup_location_id: uuid.UUID
+    seats: int
+
+
+@dataclass
+class PlannedRide:
+    ride_number: int
+    stops: list[uuid.UUID]  # pickup location ids, in pickup order
+    bookings: list[RiderBooking]  # grouped by stop, in pickup order
+    drive_km: float
+
+    @property
+    def seats(self) -> int:
+        return sum(b.seats for b in self.bookings)
+
+    @property
+    def drive_minutes(self) -> float:
+        return drive_minutes(self.drive_km)
+
+
+@dataclass
+class ConfigPlan:
+    session_ride_config_id: uuid.UUID
+    capacity: int
+    rides: list[PlannedRide] = field(default_factory=list)
+
+    @property
+    def total_drive_minutes(self) -> float:
+        return sum(r.drive_minutes for r in self.rides)
+
+
+def haversine_km(a: Coord, b: Coord) -> float:
+    phi1, phi2 = math.radians(a[0]), math.radians(b[0])
+    dphi = phi2 - phi1
+    dlmb = math.radians(b[1] - a[1])
+    h = (
+        math.sin(dphi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
+
+
+def drive_minutes(km: float) -> float:
+    return km * ROAD_FACTOR / AVERAGE_SPEED_KMH * 60
+
+
+def _centroid(coords: Iterable[Coord]) -> Optional[Coord]:
+    coords = list(coords)
+    if not coords:
+        return None
+    return (
+        sum(c[0] for c in coords) / len(coords),
+        sum(c[1] for c in coords) / len(coords),
+    )
+
+
+def _path_km(points: Sequence[Coord], destination: Optional[Coord]) -> float:
+    legs = list(points) + ([destination] if destination else [])
+    return sum(haversine_km(a, b) for a, b in zip(legs, legs[1:]))
+
+
+# ── Sequencing ──────────────────────────────────────────────────────────
+
+
+def sequence_stops(
+    coords: dict[uuid.UUID, Coord], destination: Optional[Coord]
+) -> tuple[list[uuid.UUID], float]:
+    """Pickup order over ``coords`` with the shortest drive (to ``destination``).
+
+    Returns ``(stop ids in order, drive km)``. Without a destination the path
+    is open at both ends.
+    """
+    # Sort for deterministic tie-breaks between equal-length orders.
+    stops = sorted(coords, key=str)
+    if len(stops) <= 1:
+        return stops, _path_km([coords[s] for s in stops], destination)
+
+    def length(order: Sequence[uuid.UUID]) -> float:
+        return _path_km([coords[s] for s in order], destination)
+
+    if len(stops) <= EXACT_SEQUENCE_MAX_STOPS:
+        best = min(itertools.permutations(stops), key=length)
+        return list(best), length(best)
+
+    # Nearest neighbour from the stop farthest from the destination (or from
+    # the centre when routes are open), then 2-opt until no reversal helps.
+    anchor = destination or _centroid(coords.values())
+    order = [max(stops, key=lambda s: haversine_km(coords[s], anchor))]
+    pending = set(stops) - {order[0]}
+    while pending:
+        here = coords[order[-1]]
+        nxt = min(pending, key=lambda s: (haversine_km(here, coords[s]), str(s)))
+        order.append(nxt)
+        pending.remove(nxt)
+
+    best_km = length(order)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(len(order) - 1):
+            for j in range(i + 1, len(order)):
+                candidate = order[:i] + order[i : j + 1][::-1] + order[j + 1 :]
+                candidate_km = length(candidate)
+                if candidate_km < best_km - 1e-9:
+                    order, best_km, improved = candidate, candidate_km, True
+    return order, best_km
+
+
+# ── Packing ─────────────────────────────────────────────────────────────
+
+
+def pack_bookings(
+    bookings: Sequence[RiderBooking],
+    coords: dict[uuid.UUID, Coord],
+    capacity: int,
+    destination: Optional[Coord],
+) -> list[list[RiderBooking]]:
+    """Group bookings into vehicles of ``capacity`` seats, nearby stops together."""
+    queues: dict[uuid.UUID, list[RiderBooking]] = {}
+    for booking in sorted(bookings, key=lambda b: (-b.seats, str(b.booking_id))):
+        queues.setdefault(booking.pickup_location_id, []).append(booking)
+
+    anchor = destination or _centroid(coords.values()) or (0.0, 0.0)
+    vehicles: list[list[RiderBooking]] = []
+
+    while queues:
+        seed = max(queues, key=lambda s: (haversine_km(coords[s], anchor), str(s)))
+        riders: list[RiderBooking] = []
+        load = 0
+        on_board = {seed}
+        # Distance from each waiting stop to the nearest stop already on board.
+        reach = {stop: haversine_km(coords[stop], coords[seed]) for stop in queues}
+
+        while True:
+            best: Optional[tuple[float, int, str, uuid.UUID, int]] = None
+            for stop, queue in queues.items():
+                for idx, booking in enumerate(queue):
+                    if riders and booking.seats > capacity - load:
+                        continue
+                    key = (reach[stop], -booking.seats, str(stop), stop, idx)
+                    if best is None or key[:3] < best[:3]:
+                        best = key
+                    break  # queues are largest-first; first fit is the best
+            if best is None:
+                break
+            stop, idx = best[3], best[4]
+            booking = queues[stop].pop(idx)
+            if not queues[stop]:
+                del queues[stop]
+            riders.append(booking)
+            load += booking.seats
+            if stop not in on_board:
+                on_board.add(stop)
+                for other in queues:
+                    reach[other] = min(
+                        reach[other], haversine_km(coords[other], coords[stop])
+                    )
+            if load >= capacity:
+                break
+        vehicles.append(riders)
+
+    return vehicles
+
+
+def plan_config(
+    config_id: uuid.UUID,
+    capacity: int,
+    bookings: Sequence[RiderBooking],
+    locations: dict[uuid.UUID, Optional[Coord]],
+    destination: Optional[Coord] = None,
+) -> ConfigPlan:
+    """Pack and sequence one ride config's bookings."""
+    capacity = max(1, capacity)
+    stop_ids = {b.pickup_location_id for b in bookings}
+    located = {s: locations[s] for s in stop_ids if locations.get(s)}
+    fallback = _centroid(located.values()) or destination or (0.0, 0.0)
+    coords = {s: located.get(s, fallback) for s in stop_ids}
+
+    plan = ConfigPlan(session_ride_config_id=config_id, capacity=capacity)
+    for number, riders in enumerate(
+        pack_bookings(bookings, coords, capacity, destination), start=1
+    ):
+        stops = {b.pickup_location_id: coords[b.pickup_location_id] for b in riders}
+        order, km = sequence_stops(stops, destination)
+        position = {stop: i for i, stop in enumerate(order)}
+        plan.rides.append(
+            PlannedRide(
+                ride_number=number,
+                stops=order,
+                bookings=sorted(
+                    riders,
+                    key=lambda b: (position[b.pickup_location_id], -b.seats),
+                ),
+                drive_km=km,
+            )
+        )
+    return plan
+
+
+# ── DB layer ────────────────────────────────────────────────────────────
+
+
+async def session_destination(session_id: uuid.UUID) -> Optional[Coord]:
+    """Coordinates of the session's pool, or None when unknown.
+
+    Best-effort — a missing pool link or a pools/sessions outage just means
+    the routes are planned without a fixed end.
+    """
+    try:
+        session = await get_session_by_id(str(session_id), calling_service="transport")
+        pool_id = (session or {}).get("pool_id")
+        if not pool_id:
+            return None
+        pool = await get_partner_pool(str(pool_id), calling_service="transport")
+    except Exception as exc:  # noqa: BLE001 — plan without a destination
+        logger.warning(
+            "ride_assignment.destination_failed session=%s err=%s", session_id, exc
+        )
+        return None
+    if pool and pool.get("latitude") is not None and pool.get("longitude") is not None:
+        return (pool["latitude"], pool["longitude"])
+    return None
+
+
+async def plan_session_rides(
+    db: AsyncSession,
+    session_id: uuid.UUID,
+    *,
+    destination: Optional[Coord] = None,
+) -> list[ConfigPlan]:
+    """Plan every ride config of a session (three queries, no writes)."""
+    configs = (
+        (
+            await db.execute(
+                select(SessionRideConfig).where(
+                    SessionRideConfig.session_id == session_id
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if not configs:
+        return []
+
+    rows = (
+        await db.execute(
+            select(
+                RideBooking.id,
+                RideBooking.session_ride_config_id,
+                RideBooking.pickup_location_id,
+                RideBooking.num_seats,
+            ).where(RideBooking.session_id == session_id)
+        )
+    ).all()
+    by_config: dict[uuid.UUID, list[RiderBooking]] = {}
+    for booking_id, config_id, location_id, seats in rows:
+        by_config.setdefault(config_id, []).append(
+            RiderBooking(booking_id, location_id, max(1, seats or 1))
+        )
+
+    location_ids = {r.pickup_location_id for rs in by_config.values() for r in rs}
+    locations: dict[uuid.UUID, Optional[Coord]] = {}
+    if location_ids:
+        for loc_id, lat, lon in (
+            await db.execute(
+                select(
+                    PickupLocation.id, PickupLocation.latitude, PickupLocation.longitude
+                ).where(PickupLocation.id.in_(location_ids))
+            )
+        ).all():
+            located = lat is not None and lon is not None
+            locations[loc_id] = (lat, lon) if located else None
+
+    return [
+        plan_config(
+            cfg.id, cfg.capacity, by_config.get(cfg.id, []), locations, destination
+        )
+        for cfg in configs
+    ]
+
+
+async def apply_plans(db: AsyncSession, plans: Sequence[ConfigPlan]) -> int:
+    """Write ride numbers and pickup order back to the bookings. Commits."""
+    params = [
+        {
+            "id": booking.booking_id,
+            "assigned_ride_number": ride.ride_number,
+            "pickup_order": ride.stops.index(booking.pickup_location_id) + 1,
+        }
+        for plan in plans
+        for ride in plan.rides
+        for booking in ride.bookings
+    ]
+    if params:
+        await db.execute(update(RideBooking), params)
+        await db.commit()
+    return len(params)
+
+
+async def assign_session_rides(
+    db: AsyncSession, session_id: uuid.UUID, *, dry_run: bool = False
+) -> list[ConfigPlan]:
+    """Plan a session's rides and (unless ``dry_run``) persist the assignment."""
+    destination = await session_destination(session_id)
+    plans = await plan_session_rides(db, session_id, destination=destination)
+    if not dry_run:
+        updated = await apply_plans(db, plans)
+        logger.info(
+            "ride_assignment.applied session=%s configs=%d bookings=%d rides=%d",
+            session_id,
+            len(plans),
+            updated,
+            sum(len(p.rides) for p in plans),
+        )
+    return plans
+
+
+async def replan_assigned_session(
+    db: AsyncSession, session_id: uuid.UUID
+) -> Optional[list[ConfigPlan]]:
+    """Re-plan a session whose rides were already assigned.
+
+    Called after a booking changes so a late rider gets a planned vehicle and
+    pickup slot rather than the per-stop ride number until the next worker
+    run. Sessions not planned yet are left alone (returns None).
+    """
+    planned = (
+        await db.execute(
+            select(
+                exists().where(
+                    RideBooking.session_id == session_id,
+                    RideBooking.pickup_order.is_not(None),
+                )
+            )
+        )
+    ).scalar()
+    if not planned:
+        return None
+    return await assign_session_rides(db, session_id)
+
+
+async def assign_upcoming_rides(db: AsyncSession) -> dict[str, int]:
+    """Re-plan every session with a ride departing within ``UPCOMING_WINDOW``.
+
+    Configs without a ``departure_time`` are skipped — plan those sessions
+    from the admin endpoint.
+    """
+    now = utc_now()
+    session_ids = (
+        (
+            await db.execute(
+                select(SessionRideConfig.session_id)
+                .where(
+                    SessionRideConfig.departure_time > now,
+                    SessionRideConfig.departure_time <= now + UPCOMING_WINDOW,
+                )
+                .distinct()
+            )
+        )
+        .scalars()
+        .all()
+    )
+    counters = {"sessions": 0, "rides": 0, "failed": 0}
+    for session_id in session_ids:
+        try:
+            plans = await assign_session_rides(db, session_id)
+        except Exception:
+            await db.rollback()
+            logger.exception("ride_assignment.failed session=%s", session_id)
+            counters["failed"] += 1
+            continue
+        counters["sessions"] += 1
+        counters["rides"] += sum(len(p.rides) for p in plans)
+    return counters
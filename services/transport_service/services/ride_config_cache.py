@@ -0,0 +1,56 @@
+"""Short-lived Redis cache for the per-session ride-config response.
+
+``GET /transport/sessions/{id}/ride-configs`` is polled by every member
+looking at a session, but only changes when someone books (availability
+counts) or an admin edits the session's ride setup. Responses are cached
+per session for ``RIDE_CONFIGS_TTL_SECONDS`` and dropped explicitly on
+booking and config writes; area / pickup / route edits simply age out.
+
+Fail-open like ``libs.common.validation_cache``: if Redis is unavailable
+the endpoint just recomputes.
+"""
+
+import json
+import uuid
+from typing import Any, Optional
+
+from libs.common.logging import get_logger
+from libs.common.redis import get_redis
+
+logger = get_logger(__name__)
+
+RIDE_CONFIGS_TTL_SECONDS = 30
+
+
+def _key(session_id: uuid.UUID) -> str:
+    return f"transport:ride-configs:{session_id}"
+
+
+async def get_cached_ride_configs(session_id: uuid.UUID) -> Optional[list[Any]]:
+    try:
+        redis = await get_redis()
+        raw = await redis.get(_key(session_id))
+    except Exception as e:
+        logger.warning(f"Ride-config cache read failed for {session_id}: {e}")
+        return None
+    return json.loads(raw) if raw else None
+
+
+async def cache_ride_configs(session_id: uuid.UUID, payload: list[Any]) -> None:
+    try:
+        redis = await get_redis()
+        await redis.set(
+            _key(session_id), json.dumps(payload), ex=RIDE_CONFIGS_TTL_SECONDS
+        )
+    except Exception as e:
+        logger.warning(f"Ride-config cache write failed for {session_id}: {e}")
+
+
+async def invalidate_ride_configs(*session_ids: uuid.UUID) -> None:
+    if not session_ids:
+        return
+    try:
+        redis = await get_redis()
+        await redis.delete(*{_key(sid) for sid in session_ids})
+    except Exception as e:
+        logger.warning(f"Ride-config cache invalidation failed: {e}")
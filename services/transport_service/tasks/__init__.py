@@ -1,7 +1,13 @@
 """Public exports for transport background tasks."""
 
 from services.transport_service.tasks.chat import reconcile_chat_memberships
+from services.transport_service.tasks.rides import (
+    assign_rides_for_upcoming_sessions,
+    replan_session_rides,
+)
 
 __all__ = [
+    "assign_rides_for_upcoming_sessions",
     "reconcile_chat_memberships",
+    "replan_session_rides",
 ]
@@ -0,0 +1,45 @@
+"""Ride-assignment background tasks (transport)."""
+
+import uuid
+
+from libs.common.logging import get_logger
+from libs.db.config import AsyncSessionLocal
+from libs.db.session import get_async_db
+from services.transport_service.services.ride_assignment import (
+    assign_upcoming_rides,
+    replan_assigned_session,
+)
+
+logger = get_logger(__name__)
+
+
+async def assign_rides_for_upcoming_sessions() -> dict[str, int]:
+    """Re-plan vehicles and pickup order for rides departing soon.
+
+    See [ride_assignment.py](../services/ride_assignment.py). Deterministic
+    for a given set of bookings, so re-running only moves riders when
+    bookings changed.
+    """
+    async for db in get_async_db():
+        try:
+            counters = await assign_upcoming_rides(db)
+        finally:
+            await db.close()
+        logger.info("ride_assignment.upcoming %s", counters)
+        return counters
+    return {}
+
+
+async def replan_session_rides(session_id: uuid.UUID) -> None:
+    """Fit a new or changed booking into its session's ride plan, if any.
+
+    Runs as a FastAPI background task once the booking is committed, in its
+    own session, so neither a planner failure nor the pools-service lookup
+    for the destination can touch the booking request. Best-effort — the
+    worker re-plans before departure anyway.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            await replan_assigned_session(db, session_id)
+        except Exception:
+            logger.exception("ride_assignment.replan_failed session=%s", session_id)
@@ -23,6 +23,14 @@ async def task_reconcile_chat_memberships(ctx: dict):
     await reconcile_chat_memberships()
 
 
+async def task_assign_upcoming_rides(ctx: dict):
+    """Pack riders into vehicles and order pickups for rides departing soon."""
+    from services.transport_service.tasks import assign_rides_for_upcoming_sessions
+
+    logger.info("Running: assign_rides_for_upcoming_sessions")
+    await assign_rides_for_upcoming_sessions()
+
+
 # ── Worker configuration ──
 
 
@@ -34,6 +42,7 @@ class WorkerSettings:
 
     functions = [
         task_reconcile_chat_memberships,
+        task_assign_upcoming_rides,
     ]
 
     cron_jobs = [
@@ -45,4 +54,9 @@ class WorkerSettings:
             minute=10,
             run_at_startup=True,
         ),
+        # Ride assignment for rides departing within the next few hours.
+        cron(
+            task_assign_upcoming_rides,
+            minute={0, 15, 30, 45},
+        ),
     ]
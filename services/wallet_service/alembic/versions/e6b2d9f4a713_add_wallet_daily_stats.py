@@ -0,0 +1,112 @@
+"""add_wallet_daily_totals_and_member_daily_activity
+
+Revision ID: e6b2d9f4a713
+Revises: d11870c4f761
+Create Date: 2026-10-18 23:41:37.208114
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "e6b2d9f4a713"
+down_revision = "d11870c4f761"
+branch_labels = None
+depends_on = None
+
+# Existing types, shared with wallet_transactions.
+transaction_type_enum = postgresql.ENUM(
+    name="transaction_type_enum", create_type=False
+)
+transaction_direction_enum = postgresql.ENUM(
+    name="transaction_direction_enum", create_type=False
+)
+transaction_status_enum = postgresql.ENUM(
+    name="transaction_status_enum", create_type=False
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "wallet_daily_totals",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("transaction_type", transaction_type_enum, nullable=False),
+        sa.Column("direction", transaction_direction_enum, nullable=False),
+        sa.Column("status", transaction_status_enum, nullable=False),
+        sa.Column("service_bucket", sa.String(), nullable=False),
+        sa.Column("shard", sa.SmallInteger(), nullable=False),
+        sa.Column("txn_count", sa.Integer(), nullable=False),
+        sa.Column("bubbles", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "day",
+            "transaction_type",
+            "direction",
+            "status",
+            "service_bucket",
+            "shard",
+        ),
+    )
+    op.create_table(
+        "wallet_member_daily_activity",
+        sa.Column("wallet_id", sa.UUID(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("direction", transaction_direction_enum, nullable=False),
+        sa.Column("status", transaction_status_enum, nullable=False),
+        sa.Column("service_bucket", sa.String(), nullable=False),
+        sa.Column("txn_count", sa.Integer(), nullable=False),
+        sa.Column("bubbles", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "wallet_id", "day", "direction", "status", "service_bucket"
+        ),
+    )
+    op.create_index(
+        op.f("ix_wallet_member_daily_activity_day"),
+        "wallet_member_daily_activity",
+        ["day"],
+        unique=False,
+    )
+    # Backfill from the existing transactions so the stats endpoints are
+    # right as soon as this release is up. Same grouping as
+    # rebuild_wallet_stats(); the SHARE lock keeps new transactions out
+    # until this commits. Anything the previous release writes between
+    # this commit and its restart isn't counted: re-run
+    # scripts/wallet/rebuild_wallet_stats.py --since <deploy day> for that.
+    op.execute("LOCK TABLE wallet_transactions IN SHARE MODE")
+    op.execute(
+        """
+        INSERT INTO wallet_daily_totals (
+            day, transaction_type, direction, status, service_bucket, shard,
+            txn_count, bubbles, updated_at
+        )
+        SELECT timezone('UTC', created_at)::date, transaction_type,
+               direction, status, coalesce(service_source, 'uncategorized'),
+               0, count(*), sum(amount), now()
+          FROM wallet_transactions
+         GROUP BY 1, 2, 3, 4, 5
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO wallet_member_daily_activity (
+            wallet_id, day, direction, status, service_bucket,
+            txn_count, bubbles, updated_at
+        )
+        SELECT wallet_id, timezone('UTC', created_at)::date, direction,
+               status, coalesce(service_source, 'uncategorized'),
+               count(*), sum(amount), now()
+          FROM wallet_transactions
+         GROUP BY 1, 2, 3, 4, 5
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_wallet_member_daily_activity_day"),
+        table_name="wallet_member_daily_activity",
+    )
+    op.drop_table("wallet_member_daily_activity")
+    op.drop_table("wallet_daily_totals")
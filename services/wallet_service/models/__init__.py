@@ -55,6 +55,10 @@ from services.wallet_service.models.rewards import (  # noqa: F401
 from services.wallet_service.models.ledger_failure import (  # noqa: F401
     WalletLedgerPostFailure,
 )
+from services.wallet_service.models.stats import (  # noqa: F401
+    WalletDailyTotal,
+    WalletMemberDailyActivity,
+)
 from services.wallet_service.models.topup import WalletTopup  # noqa: F401
 from services.wallet_service.models.transaction import WalletTransaction  # noqa: F401
 
@@ -84,6 +88,8 @@ __all__ = [
     "WalletLedgerPostFailure",
     "PromotionalBubbleGrant",
     "WalletAuditLog",
+    "WalletDailyTotal",
+    "WalletMemberDailyActivity",
     # Phase 3
     "ReferralCode",
     "ReferralRecord",
@@ -20,6 +20,18 @@ from services.wallet_service.models.enums import (
 )
 
 
+def render_reward_description(
+    template: Optional[str], display_name: str, bubbles: int, event_data: dict
+) -> str:
+    """Render a rule's description template, falling back to a generic line."""
+    if not template:
+        return f"Reward — {display_name} ({bubbles} 🫧)"
+    try:
+        return template.format(amount=bubbles, **event_data)
+    except (KeyError, IndexError):
+        return f"Reward — {display_name} ({bubbles} 🫧)"
+
+
 class RewardRule(Base):
     """Admin-configurable rules defining when Bubbles are auto-granted."""
 
@@ -76,14 +88,12 @@ class RewardRule(Base):
 
     def render_description(self, event_data: dict) -> str:
         """Render the reward description template with event data."""
-        if not self.reward_description_template:
-            return f"Reward — {self.display_name} ({self.reward_bubbles} 🫧)"
-        try:
-            return self.reward_description_template.format(
-                amount=self.reward_bubbles, **event_data
-            )
-        except (KeyError, IndexError):
-            return f"Reward — {self.display_name} ({self.reward_bubbles} 🫧)"
+        return render_reward_description(
+            self.reward_description_template,
+            self.display_name,
+            self.reward_bubbles,
+            event_data,
+        )
 
     def __repr__(self) -> str:
         return f"<RewardRule {self.rule_name}>"
@@ -0,0 +1,104 @@
+"""Daily wallet activity aggregates, maintained alongside wallet_transactions.
+
+Derived data — every transaction write adds itself to both tables in the
+same database transaction, and scripts/wallet/rebuild_wallet_stats.py
+re-derives them from the transactions. See
+services/wallet_service/services/wallet_stats.py.
+"""
+
+import uuid
+from datetime import date, datetime
+
+from libs.common.datetime_utils import utc_now
+from libs.db.base import Base
+from services.wallet_service.models.enums import (
+    TransactionDirection,
+    TransactionStatus,
+    TransactionType,
+    enum_values,
+)
+from sqlalchemy import BigInteger, Date, DateTime
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy import Integer, SmallInteger, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+def _enum(enum_cls, name: str) -> SAEnum:
+    # Same Postgres types as wallet_transactions, so rebuilds can
+    # INSERT ... SELECT straight from it.
+    return SAEnum(
+        enum_cls,
+        name=name,
+        values_callable=enum_values,
+        validate_strings=True,
+    )
+
+
+class WalletDailyTotal(Base):
+    """Ecosystem-wide totals per UTC day, transaction type and service.
+
+    Each key is split over ``shard`` (derived from the wallet id) so that
+    concurrent transactions on different wallets rarely wait on the same
+    row; readers sum across shards.
+    """
+
+    __tablename__ = "wallet_daily_totals"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    transaction_type: Mapped[TransactionType] = mapped_column(
+        _enum(TransactionType, "transaction_type_enum"), primary_key=True
+    )
+    direction: Mapped[TransactionDirection] = mapped_column(
+        _enum(TransactionDirection, "transaction_direction_enum"), primary_key=True
+    )
+    status: Mapped[TransactionStatus] = mapped_column(
+        _enum(TransactionStatus, "transaction_status_enum"), primary_key=True
+    )
+    # service_source, with NULL bucketed as "uncategorized".
+    service_bucket: Mapped[str] = mapped_column(String, primary_key=True)
+    shard: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+
+    txn_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    bubbles: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<WalletDailyTotal {self.day} {self.transaction_type.value} "
+            f"{self.direction.value} {self.service_bucket} #{self.shard}>"
+        )
+
+
+class WalletMemberDailyActivity(Base):
+    """One wallet's activity per UTC day, direction and service.
+
+    Serves per-member period summaries and the distinct-wallet counts of the
+    ecosystem stats (active and cross-service users).
+    """
+
+    __tablename__ = "wallet_member_daily_activity"
+
+    wallet_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True, index=True)
+    direction: Mapped[TransactionDirection] = mapped_column(
+        _enum(TransactionDirection, "transaction_direction_enum"), primary_key=True
+    )
+    status: Mapped[TransactionStatus] = mapped_column(
+        _enum(TransactionStatus, "transaction_status_enum"), primary_key=True
+    )
+    service_bucket: Mapped[str] = mapped_column(String, primary_key=True)
+
+    txn_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    bubbles: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<WalletMemberDailyActivity {self.wallet_id} {self.day} "
+            f"{self.direction.value} {self.service_bucket}>"
+        )
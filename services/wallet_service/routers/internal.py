@@ -4,10 +4,10 @@ These endpoints are called by other SwimBuddz services via service-role JWT,
 not by frontend clients directly.
 """
 
-from datetime import date, datetime, time, timedelta, timezone
+from datetime import date, datetime
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import distinct, func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from libs.auth.dependencies import require_service_role
@@ -20,6 +20,9 @@ from services.wallet_service.schemas import (
     BalanceCheckRequest,
     BalanceCheckResponse,
     BalanceResponse,
+    BulkCreditRequest,
+    BulkCreditResponse,
+    BulkCreditResult,
     ConfirmTopupRequest,
     CreditRequest,
     DebitRequest,
@@ -44,8 +47,13 @@ from services.wallet_service.services.referral_service import (
     get_or_create_referral_code,
 )
 from services.wallet_service.services.topup_service import confirm_topup
+from services.wallet_service.services.wallet_stats import (
+    ecosystem_stats,
+    member_wallet_summary,
+)
 from services.wallet_service.services.wallet_ops import (
     WELCOME_BONUS_BUBBLES,
+    bulk_credit_wallets,
     check_balance,
     create_wallet,
     credit_wallet,
@@ -104,6 +112,42 @@ async def internal_credit(
     )
 
 
+@router.post("/credit/bulk", response_model=BulkCreditResponse)
+async def internal_bulk_credit(
+    body: BulkCreditRequest,
+    _service: AuthUser = Depends(require_service_role),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Credit many wallets in one transaction (payouts, batch refunds).
+
+    Results are in request order. A replayed idempotency key returns its
+    original transaction; a member without a wallet is reported as failed
+    without affecting the rest of the batch.
+    """
+    txns = await bulk_credit_wallets(
+        db, [credit.model_dump() for credit in body.credits]
+    )
+    return BulkCreditResponse(
+        results=[
+            (
+                BulkCreditResult(
+                    idempotency_key=credit.idempotency_key,
+                    success=True,
+                    transaction_id=txn.id,
+                    balance_after=txn.balance_after,
+                )
+                if txn is not None
+                else BulkCreditResult(
+                    idempotency_key=credit.idempotency_key,
+                    success=False,
+                    detail="Wallet not found",
+                )
+            )
+            for credit, txn in zip(body.credits, txns)
+        ]
+    )
+
+
 @router.get("/balance/{auth_id}", response_model=BalanceResponse)
 async def internal_get_balance(
     auth_id: str,
@@ -386,13 +430,10 @@ async def get_member_wallet_summary(
 ):
     """Aggregate wallet stats for a member within a date range.
 
-    Used by the reporting service for quarterly reports.
+    Used by the reporting service for quarterly reports. Served from the
+    daily member activity, plus the partial days at either end.
     """
-    from services.wallet_service.models import (
-        TransactionDirection,
-        Wallet,
-        WalletTransaction,
-    )
+    from services.wallet_service.models import Wallet
 
     # Find wallet for this member
     wallet_result = await db.execute(
@@ -402,47 +443,8 @@ async def get_member_wallet_summary(
     if wallet_id is None:
         return MemberWalletSummary()
 
-    # Aggregate credits (earned) and debits (spent)
-    from sqlalchemy import case
-
-    result = await db.execute(
-        select(
-            func.coalesce(
-                func.sum(
-                    case(
-                        (
-                            WalletTransaction.direction == TransactionDirection.CREDIT,
-                            WalletTransaction.amount,
-                        ),
-                        else_=0,
-                    )
-                ),
-                0,
-            ).label("earned"),
-            func.coalesce(
-                func.sum(
-                    case(
-                        (
-                            WalletTransaction.direction == TransactionDirection.DEBIT,
-                            WalletTransaction.amount,
-                        ),
-                        else_=0,
-                    )
-                ),
-                0,
-            ).label("spent"),
-        ).where(
-            WalletTransaction.wallet_id == wallet_id,
-            WalletTransaction.created_at >= date_from,
-            WalletTransaction.created_at <= date_to,
-        )
-    )
-    row = result.one()
-
-    return MemberWalletSummary(
-        bubbles_earned=int(row.earned or 0),
-        bubbles_spent=int(row.spent or 0),
-    )
+    earned, spent = await member_wallet_summary(db, wallet_id, date_from, date_to)
+    return MemberWalletSummary(bubbles_earned=earned, bubbles_spent=spent)
 
 
 # ---------------------------------------------------------------------------
@@ -476,12 +478,6 @@ async def get_member_referral_link(
 # ---------------------------------------------------------------------------
 
 
-# Sentinel used to bucket NULL service_source values in spend distribution
-# and cross-service-user counting (NULL is treated as a single "uncategorized"
-# service per FLYWHEEL_METRICS_DESIGN).
-_UNCATEGORIZED_BUCKET = "uncategorized"
-
-
 @router.get(
     "/ecosystem-stats",
     response_model=WalletEcosystemStatsResponse,
@@ -497,115 +493,15 @@ async def get_ecosystem_stats(
     Window is ``[from 00:00 UTC, to+1 00:00 UTC)`` so the ``to`` date is
     inclusive of its full day.
 
-    All aggregations are pushed down to SQL (3 round-trips: active users,
-    spend totals + distribution, top-up totals + per-wallet service counts).
+    Served from the daily aggregates maintained on every transaction write
+    (2 round-trips: spend + top-up totals, active + cross-service wallets);
+    nothing scans ``wallet_transactions``. NULL ``service_source`` is
+    bucketed as "uncategorized".
 
     Auth: service-role JWT only.
     """
-    from services.wallet_service.models import (
-        TransactionDirection,
-        TransactionStatus,
-        TransactionType,
-        WalletTransaction,
-    )
-
-    # Convert inclusive date range to half-open UTC datetime range.
-    window_start = datetime.combine(period_start, time.min, tzinfo=timezone.utc)
-    window_end = datetime.combine(
-        period_end + timedelta(days=1), time.min, tzinfo=timezone.utc
-    )
-
-    in_window = (
-        WalletTransaction.created_at >= window_start,
-        WalletTransaction.created_at < window_end,
-        WalletTransaction.status == TransactionStatus.COMPLETED,
-    )
-
-    # 1. Active wallet users — any COMPLETED txn (any direction/type) in window.
-    active_result = await db.execute(
-        select(func.count(distinct(WalletTransaction.wallet_id))).where(*in_window)
-    )
-    active_wallet_users = int(active_result.scalar() or 0)
-
-    # 2. Spend totals + per-service distribution — only COMPLETED DEBITs.
-    spend_rows = (
-        await db.execute(
-            select(
-                func.coalesce(
-                    WalletTransaction.service_source, _UNCATEGORIZED_BUCKET
-                ).label("bucket"),
-                func.coalesce(func.sum(WalletTransaction.amount), 0).label("total"),
-            )
-            .where(
-                *in_window,
-                WalletTransaction.direction == TransactionDirection.DEBIT,
-            )
-            .group_by("bucket")
-        )
-    ).all()
-
-    spend_by_bucket: dict[str, int] = {
-        row.bucket: int(row.total or 0) for row in spend_rows
-    }
-    total_bubbles_spent = sum(spend_by_bucket.values())
-    if total_bubbles_spent > 0:
-        spend_distribution = {
-            bucket: amount / total_bubbles_spent
-            for bucket, amount in spend_by_bucket.items()
-        }
-    else:
-        spend_distribution = {}
-
-    # 3. Top-up totals — COMPLETED CREDITs of type TOPUP.
-    topup_result = await db.execute(
-        select(func.coalesce(func.sum(WalletTransaction.amount), 0)).where(
-            *in_window,
-            WalletTransaction.direction == TransactionDirection.CREDIT,
-            WalletTransaction.transaction_type == TransactionType.TOPUP,
-        )
-    )
-    total_topup_bubbles = int(topup_result.scalar() or 0)
-
-    # 4. Cross-service users — wallets with COMPLETED DEBITs tagged with
-    # ≥2 distinct service_source buckets (NULL collapses to one bucket).
-    per_wallet_distinct_services = (
-        select(
-            WalletTransaction.wallet_id.label("wallet_id"),
-            func.count(
-                distinct(
-                    func.coalesce(
-                        WalletTransaction.service_source, _UNCATEGORIZED_BUCKET
-                    )
-                )
-            ).label("service_count"),
-        )
-        .where(
-            *in_window,
-            WalletTransaction.direction == TransactionDirection.DEBIT,
-        )
-        .group_by(WalletTransaction.wallet_id)
-        .subquery()
-    )
-    cross_result = await db.execute(
-        select(func.count())
-        .select_from(per_wallet_distinct_services)
-        .where(per_wallet_distinct_services.c.service_count >= 2)
-    )
-    cross_service_users = int(cross_result.scalar() or 0)
-
-    # Single-service users = active users who are NOT cross-service. This
-    # includes active users whose only activity in the window was non-DEBIT
-    # (e.g. top-ups, refunds, rewards) — they spent on 0 distinct services,
-    # which still counts as "single-service" per the spec.
-    single_service_users = max(active_wallet_users - cross_service_users, 0)
-
     return WalletEcosystemStatsResponse(
-        active_wallet_users=active_wallet_users,
-        single_service_users=single_service_users,
-        cross_service_users=cross_service_users,
-        total_bubbles_spent=total_bubbles_spent,
-        total_topup_bubbles=total_topup_bubbles,
-        spend_distribution=spend_distribution,
+        **await ecosystem_stats(db, period_start, period_end)
     )
 
 
@@ -24,6 +24,7 @@ from services.wallet_service.schemas.rewards import (
     RewardRuleResponse,
     RewardRuleUpdateRequest,
 )
+from services.wallet_service.services.rule_index import invalidate_rule_index
 
 logger = logging.getLogger(__name__)
 
@@ -120,6 +121,7 @@ async def create_reward_rule(
     )
     db.add(rule)
     await db.commit()
+    invalidate_rule_index()
     await db.refresh(rule)
 
     logger.info("Admin %s created reward rule '%s'", admin.user_id, body.rule_name)
@@ -176,6 +178,7 @@ async def update_reward_rule(
 
     await db.flush()
     await db.commit()
+    invalidate_rule_index()
     await db.refresh(rule)
 
     return RewardRuleResponse.model_validate(rule)
@@ -10,22 +10,30 @@ from letting anonymous callers grant themselves rewards.
 """
 
 import logging
+import uuid
 
 from fastapi import APIRouter, Depends, HTTPException
 from libs.auth.dependencies import require_service_role
 from libs.auth.models import AuthUser
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from libs.db.session import get_async_db
 from services.wallet_service.models.rewards import WalletEvent
 from services.wallet_service.schemas.rewards import (
+    EventBatchIngestRequest,
+    EventBatchIngestResponse,
     EventIngestRequest,
     EventIngestResponse,
     RewardGrantItem,
 )
-from services.wallet_service.services.rewards_engine import process_event
+from services.wallet_service.services.cap_checker import release_caps
+from services.wallet_service.services.ledger_emit import emit_wallet_txn_to_ledger
+from services.wallet_service.services.rewards_engine import (
+    process_event,
+    process_events,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -134,3 +142,116 @@ async def ingest_event(
             for g in grants
         ],
     )
+
+
+@router.post("/events/batch", response_model=EventBatchIngestResponse)
+async def ingest_event_batch(
+    body: EventBatchIngestRequest,
+    db: AsyncSession = Depends(get_async_db),
+    _service: AuthUser = Depends(require_service_role),
+):
+    """Submit many events for rewards processing in one transaction.
+
+    Same deduplication as ``POST /events`` (including repeats within the
+    batch), checked for the whole batch in one query. New events are
+    inserted and processed together and committed once; a failing rule
+    only loses its own grant. Results come back in submission order.
+    """
+    result = await db.execute(
+        select(WalletEvent).where(
+            or_(
+                WalletEvent.event_id.in_({e.event_id for e in body.events}),
+                WalletEvent.idempotency_key.in_(
+                    {e.idempotency_key for e in body.events}
+                ),
+            )
+        )
+    )
+    by_event_id: dict[uuid.UUID, WalletEvent] = {}
+    by_key: dict[str, WalletEvent] = {}
+    for existing in result.scalars().all():
+        by_event_id[existing.event_id] = existing
+        by_key[existing.idempotency_key] = existing
+
+    # (event, is_new) per submitted item
+    slots: list[tuple[WalletEvent, bool]] = []
+    new_events: list[WalletEvent] = []
+    for item in body.events:
+        existing = by_event_id.get(item.event_id) or by_key.get(item.idempotency_key)
+        if existing:
+            slots.append((existing, False))
+            continue
+        event = WalletEvent(
+            event_id=item.event_id,
+            event_type=item.event_type,
+            member_auth_id=item.member_auth_id,
+            member_id=item.member_id,
+            service_source=item.service_source,
+            occurred_at=item.occurred_at,
+            event_data=item.event_data,
+            idempotency_key=item.idempotency_key,
+        )
+        by_event_id[event.event_id] = event
+        by_key[event.idempotency_key] = event
+        slots.append((event, True))
+        new_events.append(event)
+
+    grants_by_event: dict[int, list[dict]] = {}
+    if new_events:
+        db.add_all(new_events)
+        try:
+            await db.flush()
+        except IntegrityError:
+            # A concurrent request inserted one of these events first; a
+            # retry will see it and dedupe.
+            await db.rollback()
+            raise HTTPException(
+                status_code=409,
+                detail="Some events were ingested concurrently. Retry the batch.",
+            )
+
+        # process_events releases its own cap reservations if it raises;
+        # grants is only filled in (and released here) when the commit fails.
+        grants: list[list[dict]] = []
+        try:
+            grants = await process_events(new_events, db)
+            await db.commit()
+        except Exception:
+            logger.exception("Error processing a batch of %d events", len(new_events))
+            await db.rollback()
+            for event_grants in grants:
+                for grant in event_grants:
+                    await release_caps(grant["cap_keys"])
+            raise HTTPException(
+                status_code=500,
+                detail="Batch processing failed and was rolled back. Retry.",
+            )
+        grants_by_event = {id(e): g for e, g in zip(new_events, grants)}
+
+        # Mirror the committed grants to the ledger (best-effort, design §8.2).
+        for event, event_grants in zip(new_events, grants):
+            for grant in event_grants:
+                await emit_wallet_txn_to_ledger(
+                    db, grant["transaction"], event.member_auth_id
+                )
+
+    logger.info(
+        "Ingested event batch: %d submitted, %d new",
+        len(body.events),
+        len(new_events),
+    )
+    results = []
+    for event, is_new in slots:
+        event_grants = grants_by_event.get(id(event), []) if is_new else []
+        results.append(
+            EventIngestResponse(
+                event_id=event.event_id,
+                accepted=True,
+                rewards_granted=event.rewards_granted,
+                rewards=[
+                    RewardGrantItem(rule_name=g["rule_name"], bubbles=g["bubbles"])
+                    for g in event_grants
+                ],
+            )
+        )
+    return EventBatchIngestResponse(results=results)
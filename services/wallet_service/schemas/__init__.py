@@ -53,6 +53,8 @@ from services.wallet_service.schemas.rewards import (  # noqa: F401
     AdminEventSubmitRequest,
     AlertSummaryItem,
     AmbassadorStatusResponse,
+    EventBatchIngestRequest,
+    EventBatchIngestResponse,
     EventIngestRequest,
     EventIngestResponse,
     EventTypeCount,
@@ -84,6 +86,9 @@ from services.wallet_service.schemas.topup import (  # noqa: F401
     TopupResponse,
 )
 from services.wallet_service.schemas.transaction import (  # noqa: F401
+    BulkCreditRequest,
+    BulkCreditResponse,
+    BulkCreditResult,
     CreditRequest,
     DebitRequest,
     InternalDebitCreditResponse,
@@ -104,6 +109,9 @@ __all__ = [
     "WalletEcosystemStatsResponse",
     "WalletResponse",
     # Transaction
+    "BulkCreditRequest",
+    "BulkCreditResponse",
+    "BulkCreditResult",
     "CreditRequest",
     "DebitRequest",
     "InternalDebitCreditResponse",
@@ -36,6 +36,18 @@ class EventIngestResponse(BaseModel):
     rewards: list[RewardGrantItem] = Field(default_factory=list)
 
 
+class EventBatchIngestRequest(BaseModel):
+    """Many events, processed in one transaction."""
+
+    events: list[EventIngestRequest] = Field(..., min_length=1, max_length=500)
+
+
+class EventBatchIngestResponse(BaseModel):
+    """One result per submitted event, in submission order."""
+
+    results: list[EventIngestResponse]
+
+
 # ---------------------------------------------------------------------------
 # Reward Rules (admin)
 # ---------------------------------------------------------------------------
@@ -69,3 +69,21 @@ class InternalDebitCreditResponse(BaseModel):
     success: bool
     transaction_id: uuid.UUID
     balance_after: int
+
+
+class BulkCreditRequest(BaseModel):
+    """Credits for many wallets, applied in one transaction."""
+
+    credits: list[CreditRequest] = Field(..., min_length=1, max_length=500)
+
+
+class BulkCreditResult(BaseModel):
+    idempotency_key: str
+    success: bool
+    transaction_id: Optional[uuid.UUID] = None
+    balance_after: Optional[int] = None
+    detail: Optional[str] = None
+
+
+class BulkCreditResponse(BaseModel):
+    results: list[BulkCreditResult]
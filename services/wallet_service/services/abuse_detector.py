@@ -9,7 +9,9 @@ the reward grant that already happened.
 """
 
 import logging
+import uuid
 from datetime import timedelta
+from typing import Iterable
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -22,6 +24,7 @@ from services.wallet_service.models.rewards import (
     WalletEvent,
 )
 from libs.common.datetime_utils import utc_now
+from services.wallet_service.services.rule_index import CompiledRule
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +57,35 @@ async def check_for_abuse(
         )
 
 
+async def check_batch_for_abuse(
+    grants: Iterable[tuple[str, CompiledRule]],
+    db: AsyncSession,
+) -> None:
+    """Run the abuse checks once for a whole batch of grants.
+
+    Each (member, rule) pair and each member is checked once however many
+    of its grants the batch made, and the system-wide failure rate once,
+    instead of all three checks after every grant. Best-effort, like
+    ``check_for_abuse``.
+    """
+    rules: dict[tuple[str, uuid.UUID], CompiledRule] = {}
+    for member_auth_id, rule in grants:
+        rules.setdefault((member_auth_id, rule.id), rule)
+    if not rules:
+        return
+    try:
+        # The batch's grants share this transaction: a failed check must
+        # only roll back its own alerts.
+        async with db.begin_nested():
+            for (member_auth_id, _), rule in rules.items():
+                await _check_rapid_same_reward(member_auth_id, rule, db)
+            for member_auth_id in sorted({member for member, _ in rules}):
+                await _check_daily_bubbles_limit(member_auth_id, db)
+            await _check_failure_rate(db)
+    except Exception:
+        logger.exception("Abuse detection error for a batch of %d grants", len(rules))
+
+
 async def _check_rapid_same_reward(
     member_auth_id: str,
     rule: RewardRule,
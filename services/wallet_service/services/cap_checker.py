@@ -1,9 +1,19 @@
 """Cap enforcement for the rewards engine.
 
 Checks lifetime and periodic caps before granting a reward to a member.
+
+``MemberRewardHistory`` is the source of truth. The hot path goes through
+``reserve_caps`` instead of counting it on every event: one atomic Redis
+script per grant checks and bumps a per-member counter for each cap the
+rule has (keyed by rule, member and ``compute_period_key``). A missing
+counter is seeded from the Postgres count, and counters expire after
+``CAP_COUNTER_TTL_SECONDS`` so any drift (a grant rolled back after its
+reservation) is re-read from Postgres. If Redis is unavailable the checks
+fall back to the Postgres counts.
 """
 
 import logging
+from typing import Optional, Union
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,9 +21,41 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from services.wallet_service.models.enums import RewardPeriod
 from services.wallet_service.models.rewards import MemberRewardHistory, RewardRule
 from libs.common.datetime_utils import utc_now
+from libs.common.redis import get_redis
+from services.wallet_service.services.rule_index import CompiledRule
 
 logger = logging.getLogger(__name__)
 
+AnyRule = Union[RewardRule, CompiledRule]
+
+CAP_COUNTER_TTL_SECONDS = 6 * 60 * 60
+
+# KEYS: one counter per cap. ARGV[1]: TTL; ARGV[2..n+1]: caps;
+# ARGV[n+2..2n+1]: seeds ("" when the caller hasn't counted yet).
+# Returns -1 if a counter is missing and unseeded, 0 if any cap is reached
+# (nothing incremented), 1 once every counter has been incremented.
+_RESERVE_SCRIPT = """
+local n = #KEYS
+for i, key in ipairs(KEYS) do
+    if redis.call("exists", key) == 0 then
+        local seed = ARGV[n + 1 + i]
+        if seed == "" then
+            return -1
+        end
+        redis.call("set", key, seed, "ex", ARGV[1])
+    end
+end
+for i, key in ipairs(KEYS) do
+    if tonumber(redis.call("get", key)) >= tonumber(ARGV[1 + i]) then
+        return 0
+    end
+end
+for i, key in ipairs(KEYS) do
+    redis.call("incr", key)
+end
+return 1
+"""
+
 
 def compute_period_key(period: RewardPeriod) -> str:
     """Compute the current period key for cap checking.
@@ -33,8 +75,28 @@ def compute_period_key(period: RewardPeriod) -> str:
     return now.strftime("%Y-%m")
 
 
+async def _grant_count(
+    db: AsyncSession,
+    member_auth_id: str,
+    rule: AnyRule,
+    period_key: Optional[str] = None,
+) -> int:
+    """Grants of ``rule`` to the member, within ``period_key`` if given."""
+    query = (
+        select(func.count())
+        .select_from(MemberRewardHistory)
+        .where(
+            MemberRewardHistory.member_auth_id == member_auth_id,
+            MemberRewardHistory.reward_rule_id == rule.id,
+        )
+    )
+    if period_key is not None:
+        query = query.where(MemberRewardHistory.period_key == period_key)
+    return (await db.execute(query)).scalar_one()
+
+
 async def check_lifetime_cap(
-    db: AsyncSession, member_auth_id: str, rule: RewardRule
+    db: AsyncSession, member_auth_id: str, rule: AnyRule
 ) -> bool:
     """Return True if the member is still under the lifetime cap for this rule.
 
@@ -45,15 +107,7 @@ async def check_lifetime_cap(
     if rule.max_per_member_lifetime is None:
         return True
 
-    result = await db.execute(
-        select(func.count())
-        .select_from(MemberRewardHistory)
-        .where(
-            MemberRewardHistory.member_auth_id == member_auth_id,
-            MemberRewardHistory.reward_rule_id == rule.id,
-        )
-    )
-    count = result.scalar_one()
+    count = await _grant_count(db, member_auth_id, rule)
     eligible = count < rule.max_per_member_lifetime
     if not eligible:
         logger.debug(
@@ -67,7 +121,7 @@ async def check_lifetime_cap(
 
 
 async def check_period_cap(
-    db: AsyncSession, member_auth_id: str, rule: RewardRule
+    db: AsyncSession, member_auth_id: str, rule: AnyRule
 ) -> bool:
     """Return True if the member is still under the period cap for this rule.
 
@@ -80,17 +134,7 @@ async def check_period_cap(
         return True
 
     period_key = compute_period_key(rule.period)
-
-    result = await db.execute(
-        select(func.count())
-        .select_from(MemberRewardHistory)
-        .where(
-            MemberRewardHistory.member_auth_id == member_auth_id,
-            MemberRewardHistory.reward_rule_id == rule.id,
-            MemberRewardHistory.period_key == period_key,
-        )
-    )
-    count = result.scalar_one()
+    count = await _grant_count(db, member_auth_id, rule, period_key)
     eligible = count < rule.max_per_member_per_period
     if not eligible:
         logger.debug(
@@ -102,3 +146,78 @@ async def check_period_cap(
             rule.max_per_member_per_period,
         )
     return eligible
+
+
+def _cap_key(rule: AnyRule, member_auth_id: str, period_key: Optional[str]) -> str:
+    return f"wallet:reward-cap:{rule.id}:{member_auth_id}:{period_key or 'lifetime'}"
+
+
+async def reserve_caps(
+    db: AsyncSession, member_auth_id: str, rule: AnyRule
+) -> Optional[list[str]]:
+    """Claim one grant against each of the rule's caps for this member.
+
+    Returns the Redis counter keys that were incremented (empty when the
+    rule is uncapped or Redis is unavailable), or None if a cap is already
+    reached. Pass the keys to ``release_caps`` if the grant is then not
+    made or its transaction rolls back.
+    """
+    caps: list[tuple[int, Optional[str]]] = []
+    if rule.max_per_member_lifetime is not None:
+        caps.append((rule.max_per_member_lifetime, None))
+    if rule.max_per_member_per_period is not None and rule.period is not None:
+        caps.append((rule.max_per_member_per_period, compute_period_key(rule.period)))
+    if not caps:
+        return []
+
+    keys = [_cap_key(rule, member_auth_id, period_key) for _, period_key in caps]
+    limits = [limit for limit, _ in caps]
+    try:
+        redis = await get_redis()
+        outcome = await redis.eval(
+            _RESERVE_SCRIPT,
+            len(keys),
+            *keys,
+            CAP_COUNTER_TTL_SECONDS,
+            *limits,
+            *([""] * len(keys)),
+        )
+        if outcome == -1:
+            seeds = [
+                await _grant_count(db, member_auth_id, rule, period_key)
+                for _, period_key in caps
+            ]
+            outcome = await redis.eval(
+                _RESERVE_SCRIPT,
+                len(keys),
+                *keys,
+                CAP_COUNTER_TTL_SECONDS,
+                *limits,
+                *seeds,
+            )
+    except Exception as e:
+        logger.warning("Reward cap counters unavailable, counting in Postgres: %s", e)
+        if not await check_lifetime_cap(db, member_auth_id, rule):
+            return None
+        if not await check_period_cap(db, member_auth_id, rule):
+            return None
+        return []
+
+    if outcome != 1:
+        logger.debug(
+            "Cap reached for member=%s rule=%s", member_auth_id, rule.rule_name
+        )
+        return None
+    return keys
+
+
+async def release_caps(keys: list[str]) -> None:
+    """Give back reservations taken by ``reserve_caps`` for a grant not made."""
+    if not keys:
+        return
+    try:
+        redis = await get_redis()
+        for key in keys:
+            await redis.decr(key)
+    except Exception as e:
+        logger.warning("Reward cap counter release failed: %s", e)
@@ -13,23 +13,31 @@ import logging
 import uuid
 from typing import Optional
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from services.wallet_service.models.enums import TransactionType
 from services.wallet_service.models.rewards import (
     MemberRewardHistory,
-    RewardRule,
     WalletEvent,
 )
 from libs.common.datetime_utils import utc_now
-from services.wallet_service.services.abuse_detector import check_for_abuse
+from services.wallet_service.services.abuse_detector import (
+    check_batch_for_abuse,
+    check_for_abuse,
+)
 from services.wallet_service.services.cap_checker import (
-    check_lifetime_cap,
-    check_period_cap,
     compute_period_key,
+    release_caps,
+    reserve_caps,
+)
+from services.wallet_service.services.rule_index import (
+    CompiledRule,
+    compile_conditions,
+    conditions_match,
+    get_rule_index,
 )
 from services.wallet_service.services.wallet_ops import credit_wallet
+from services.wallet_service.services.wallet_stats import record_wallet_transactions
 
 logger = logging.getLogger(__name__)
 
@@ -42,43 +50,85 @@ def evaluate_conditions(trigger_config: Optional[dict], event_data: dict) -> boo
     - {"max_<key>": N} — event_data[key] <= N
     - {"<key>": value} — exact match
     - {} or None — always matches (no conditions)
+
+    Indexed rules are compiled once (``rule_index.compile_conditions``);
+    this is the one-off form.
     """
-    if not trigger_config:
-        return True
-
-    for key, expected in trigger_config.items():
-        if key.startswith("min_"):
-            field = key[4:]
-            actual = event_data.get(field)
-            if actual is None or actual < expected:
-                return False
-        elif key.startswith("max_"):
-            field = key[4:]
-            actual = event_data.get(field)
-            if actual is None or actual > expected:
-                return False
-        else:
-            actual = event_data.get(key)
-            if actual != expected:
-                return False
-
-    return True
-
-
-async def get_matching_rules(db: AsyncSession, event_type: str) -> list[RewardRule]:
-    """Fetch active rules for an event type, ordered by priority DESC."""
-    result = await db.execute(
-        select(RewardRule)
-        .where(RewardRule.event_type == event_type, RewardRule.is_active.is_(True))
-        .order_by(RewardRule.priority.desc())
+    return conditions_match(compile_conditions(trigger_config), event_data)
+
+
+async def get_matching_rules(db: AsyncSession, event_type: str) -> list[CompiledRule]:
+    """Active rules for an event type, ordered by priority DESC."""
+    index = await get_rule_index(db)
+    return list(index.rules_for(event_type))
+
+
+async def _grant(
+    event: WalletEvent,
+    rule: CompiledRule,
+    db: AsyncSession,
+    *,
+    commit: bool,
+    deferred_stats: Optional[list] = None,
+):
+    """Credit the rule's reward and record it in the member's history."""
+    txn = await credit_wallet(
+        db,
+        member_auth_id=event.member_auth_id,
+        amount=rule.reward_bubbles,
+        idempotency_key=f"reward-{rule.id}-{event.event_id}",
+        transaction_type=TransactionType.REWARD,
+        description=rule.render_description(event.event_data),
+        service_source="rewards_engine",
+        reference_type="reward_rule",
+        reference_id=str(rule.id),
+        initiated_by="rewards_engine",
+        metadata={
+            "rule_name": rule.rule_name,
+            "event_type": event.event_type,
+            "event_id": str(event.event_id),
+        },
+        commit=commit,
+        deferred_stats=deferred_stats,
     )
-    return list(result.scalars().all())
+
+    period_key = None
+    if rule.period is not None:
+        period_key = compute_period_key(rule.period)
+
+    db.add(
+        MemberRewardHistory(
+            member_auth_id=event.member_auth_id,
+            reward_rule_id=rule.id,
+            wallet_event_id=event.id,
+            transaction_id=txn.id,
+            bubbles_awarded=rule.reward_bubbles,
+            period_key=period_key,
+        )
+    )
+    await db.flush()
+    return txn
 
 
-async def process_event(event: WalletEvent, db: AsyncSession) -> list[dict]:
+async def process_event(
+    event: WalletEvent,
+    db: AsyncSession,
+    *,
+    commit: bool = True,
+    reserved_caps: Optional[list[str]] = None,
+    deferred_stats: Optional[list] = None,
+) -> list[dict]:
     """Process an ingested event against all matching reward rules.
 
     Returns a list of dicts: [{"rule_name": ..., "bubbles": ...}, ...]
+
+    By default each grant's wallet credit is committed as it is made. With
+    ``commit=False`` (``process_events``) each grant is only flushed, under
+    its own savepoint, and abuse checks are left to the caller. Cap counter
+    keys held by grants made are appended to ``reserved_caps`` as they are
+    taken, so the caller can release them if this raises, and with
+    ``deferred_stats`` the grants' new transactions are collected there for
+    the caller to record in the daily aggregates (see ``credit_wallet``).
     """
     grants: list[dict] = []
     granted_rule_ids: set[uuid.UUID] = set()
@@ -92,25 +142,14 @@ async def process_event(event: WalletEvent, db: AsyncSession) -> list[dict]:
         return grants
 
     for rule in matching_rules:
+        cap_keys: list[str] = []
+        new_txns: list = []
         try:
-            # 1. Check replaces_rule_id — skip if a higher-priority rule
-            #    that this one replaces has already granted
-            if rule.replaces_rule_id and rule.replaces_rule_id in granted_rule_ids:
-                # This rule supersedes an already-granted rule — that shouldn't
-                # happen since higher priority rules are processed first.
-                # But if the replaced rule was already granted, skip this one.
-                pass  # Fall through — the replaced rule is the lower-priority one
-
-            # Actually: replaces_rule_id means THIS rule replaces another.
-            # If this rule (higher priority) fires, we should skip the
-            # lower-priority rule it replaces. We track granted_rule_ids
-            # and check below.
-
-            # 2. Evaluate conditions
-            if not evaluate_conditions(rule.trigger_config, event.event_data):
+            # 1. Evaluate conditions
+            if not rule.matches(event.event_data):
                 continue
 
-            # 3. Check admin confirmation requirement
+            # 2. Check admin confirmation requirement
             if rule.requires_admin_confirmation:
                 if not event.event_data.get("admin_confirmed", False):
                     logger.debug(
@@ -119,95 +158,32 @@ async def process_event(event: WalletEvent, db: AsyncSession) -> list[dict]:
                     )
                     continue
 
-            # 4. Check caps
-            if not await check_lifetime_cap(db, event.member_auth_id, rule):
-                continue
-            if not await check_period_cap(db, event.member_auth_id, rule):
-                continue
-
-            # 5. Check if this rule is replaced by a higher-priority rule
-            #    that already fired for this event
-            replaced_by_higher = False
-            for granted_id in granted_rule_ids:
-                # Check if any already-granted rule replaces this one
-                for prev_rule in matching_rules:
-                    if (
-                        prev_rule.id == granted_id
-                        and prev_rule.replaces_rule_id == rule.id
-                    ):
-                        replaced_by_higher = True
-                        break
-                if replaced_by_higher:
-                    break
-            if replaced_by_higher:
+            # 3. Skip if a higher-priority rule that replaces this one
+            #    already fired for this event
+            if rule.replaced_by & granted_rule_ids:
                 logger.debug(
                     "Rule %s replaced by higher-priority rule, skipping",
                     rule.rule_name,
                 )
                 continue
 
-            # 6. Grant reward
-            idempotency_key = f"reward-{rule.id}-{event.event_id}"
-            description = rule.render_description(event.event_data)
-
-            txn = await credit_wallet(
-                db,
-                member_auth_id=event.member_auth_id,
-                amount=rule.reward_bubbles,
-                idempotency_key=idempotency_key,
-                transaction_type=TransactionType.REWARD,
-                description=description,
-                service_source="rewards_engine",
-                reference_type="reward_rule",
-                reference_id=str(rule.id),
-                initiated_by="rewards_engine",
-                metadata={
-                    "rule_name": rule.rule_name,
-                    "event_type": event.event_type,
-                    "event_id": str(event.event_id),
-                },
-            )
-
-            # 7. Record history for cap tracking
-            period_key = None
-            if rule.period is not None:
-                period_key = compute_period_key(rule.period)
-
-            history = MemberRewardHistory(
-                member_auth_id=event.member_auth_id,
-                reward_rule_id=rule.id,
-                wallet_event_id=event.id,
-                transaction_id=txn.id,
-                bubbles_awarded=rule.reward_bubbles,
-                period_key=period_key,
-            )
-            db.add(history)
-            await db.flush()
-
-            granted_rule_ids.add(rule.id)
-            grants.append(
-                {
-                    "rule_name": rule.rule_name,
-                    "bubbles": rule.reward_bubbles,
-                    "transaction_id": txn.id,
-                }
-            )
-
-            logger.info(
-                "Granted %d Bubbles to %s via rule %s (event=%s)",
-                rule.reward_bubbles,
-                event.member_auth_id,
-                rule.rule_name,
-                event.event_id,
-            )
-
-            # Best-effort abuse detection — never blocks the grant
-            try:
-                await check_for_abuse(event.member_auth_id, rule, event, db)
-            except Exception:
-                logger.exception("Abuse check failed for event %s", event.event_id)
+            # 4. Claim against the lifetime / period caps
+            reserved = await reserve_caps(db, event.member_auth_id, rule)
+            if reserved is None:
+                continue
+            cap_keys = reserved
+
+            # 5. Grant reward and record history for cap tracking
+            if commit:
+                txn = await _grant(event, rule, db, commit=True)
+            else:
+                async with db.begin_nested():
+                    txn = await _grant(
+                        event, rule, db, commit=False, deferred_stats=new_txns
+                    )
 
         except Exception:
+            await release_caps(cap_keys)
             logger.exception(
                 "Error processing rule %s for event %s",
                 rule.rule_name,
@@ -216,11 +192,93 @@ async def process_event(event: WalletEvent, db: AsyncSession) -> list[dict]:
             event.processing_error = (
                 f"Error in rule {rule.rule_name}: see logs for details"
             )
+            continue
+
+        if reserved_caps is not None:
+            reserved_caps.extend(cap_keys)
+        if deferred_stats is not None:
+            deferred_stats.extend(new_txns)
+        elif new_txns:
+            await record_wallet_transactions(db, new_txns)
+        granted_rule_ids.add(rule.id)
+        grants.append(
+            {
+                "rule_name": rule.rule_name,
+                "bubbles": rule.reward_bubbles,
+                "transaction_id": txn.id,
+                "transaction": txn,
+                "rule": rule,
+                "cap_keys": cap_keys,
+            }
+        )
+
+        logger.info(
+            "Granted %d Bubbles to %s via rule %s (event=%s)",
+            rule.reward_bubbles,
+            event.member_auth_id,
+            rule.rule_name,
+            event.event_id,
+        )
+
+        if commit:
+            # Best-effort abuse detection — never blocks the grant
+            try:
+                await check_for_abuse(event.member_auth_id, rule, event, db)
+            except Exception:
+                logger.exception("Abuse check failed for event %s", event.event_id)
 
-    # 8. Mark event as processed
+    # 6. Mark event as processed
     event.processed = True
     event.processed_at = utc_now()
     event.rewards_granted = len(grants)
     await db.flush()
 
     return grants
+
+
+async def process_events(
+    events: list[WalletEvent], db: AsyncSession
+) -> list[list[dict]]:
+    """Process a batch of ingested events inside the caller's transaction.
+
+    Nothing is committed: every grant is flushed under its own savepoint,
+    so a failing rule only loses its own grant. Events are worked through
+    member by member (keeping each member's order) so concurrent batches
+    lock wallet rows in the same order. The abuse checks run once for the
+    batch, and the grants are added to the daily wallet aggregates in one
+    go at the end, after every wallet row lock is taken. Returns each
+    event's grants in input order.
+
+    If this raises, the cap counters reserved so far are released and the
+    caller must roll back. Otherwise the caller commits, then emits each
+    grant's ``"transaction"`` to the ledger — or, if the commit fails, hands
+    every grant's ``"cap_keys"`` back to ``release_caps``.
+    """
+    grants_by_position: dict[int, list[dict]] = {}
+    reserved: list[str] = []
+    new_txns: list = []
+    order = sorted(range(len(events)), key=lambda i: events[i].member_auth_id)
+    try:
+        for position in order:
+            grants_by_position[position] = await process_event(
+                events[position],
+                db,
+                commit=False,
+                reserved_caps=reserved,
+                deferred_stats=new_txns,
+            )
+
+        granted = [
+            (events[position].member_auth_id, grant["rule"])
+            for position, grants in grants_by_position.items()
+            for grant in grants
+        ]
+        if granted:
+            await check_batch_for_abuse(granted, db)
+        await record_wallet_transactions(db, new_txns)
+    except Exception:
+        # None of the batch's grants survive the caller's rollback.
+        await release_caps(reserved)
+        raise
+
+    return [grants_by_position[i] for i in range(len(events))]
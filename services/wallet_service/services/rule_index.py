@@ -0,0 +1,165 @@
+"""In-process compiled index of the active reward rules.
+
+``process_event`` used to select the active ``RewardRule`` rows for every
+event and interpret each ``trigger_config`` dict key by key. The index
+loads every active rule in one query, compiles each into an immutable
+``CompiledRule`` (conditions pre-parsed into ``(field, comparison,
+expected)`` triples, the ids of rules that replace it pre-resolved) and
+groups them per event type in priority order.
+
+The admin rule endpoints call ``invalidate_rule_index`` after a change, so
+the worker that served the write reloads straight away; every other
+worker reloads once its copy is ``RULE_INDEX_TTL_SECONDS`` old.
+"""
+
+import logging
+import operator
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from services.wallet_service.models.enums import RewardPeriod
+from services.wallet_service.models.rewards import (
+    RewardRule,
+    render_reward_description,
+)
+
+logger = logging.getLogger(__name__)
+
+RULE_INDEX_TTL_SECONDS = 30
+
+Condition = tuple[str, Callable[[Any, Any], bool], Any]
+
+
+def compile_conditions(trigger_config: Optional[dict]) -> tuple[Condition, ...]:
+    """Parse a rule's ``trigger_config`` into ``(field, comparison, expected)``.
+
+    ``min_<key>`` becomes ``>=``, ``max_<key>`` becomes ``<=`` and any other
+    key an exact match (see ``rewards_engine.evaluate_conditions``).
+    """
+    conditions: list[Condition] = []
+    for key, expected in (trigger_config or {}).items():
+        if key.startswith("min_"):
+            conditions.append((key[4:], operator.ge, expected))
+        elif key.startswith("max_"):
+            conditions.append((key[4:], operator.le, expected))
+        else:
+            conditions.append((key, operator.eq, expected))
+    return tuple(conditions)
+
+
+def conditions_match(conditions: tuple[Condition, ...], event_data: dict) -> bool:
+    """True if ``event_data`` satisfies every compiled condition."""
+    for field_name, compare, expected in conditions:
+        actual = event_data.get(field_name)
+        if actual is None and compare is not operator.eq:
+            return False
+        if not compare(actual, expected):
+            return False
+    return True
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """Immutable, session-free snapshot of an active ``RewardRule``."""
+
+    id: uuid.UUID
+    rule_name: str
+    display_name: str
+    event_type: str
+    reward_bubbles: int
+    reward_description_template: Optional[str]
+    max_per_member_lifetime: Optional[int]
+    max_per_member_per_period: Optional[int]
+    period: Optional[RewardPeriod]
+    replaces_rule_id: Optional[uuid.UUID]
+    priority: int
+    requires_admin_confirmation: bool
+    conditions: tuple[Condition, ...] = ()
+    # Rules for the same event type that replace this one: if one of them
+    # has already granted for an event, this one is skipped.
+    replaced_by: frozenset[uuid.UUID] = frozenset()
+
+    def matches(self, event_data: dict) -> bool:
+        return conditions_match(self.conditions, event_data)
+
+    def render_description(self, event_data: dict) -> str:
+        return render_reward_description(
+            self.reward_description_template,
+            self.display_name,
+            self.reward_bubbles,
+            event_data,
+        )
+
+
+@dataclass
+class RuleIndex:
+    """Active compiled rules grouped by event type, highest priority first."""
+
+    by_event_type: dict[str, tuple[CompiledRule, ...]] = field(default_factory=dict)
+    loaded_at: float = 0.0
+
+    def rules_for(self, event_type: str) -> tuple[CompiledRule, ...]:
+        return self.by_event_type.get(event_type, ())
+
+
+def build_rule_index(rules: list[RewardRule], loaded_at: float = 0.0) -> RuleIndex:
+    """Compile active rules into a ``RuleIndex``."""
+    grouped: dict[str, list[RewardRule]] = {}
+    for rule in rules:
+        grouped.setdefault(rule.event_type, []).append(rule)
+
+    by_event_type: dict[str, tuple[CompiledRule, ...]] = {}
+    for event_type, group in grouped.items():
+        group.sort(key=lambda r: r.priority, reverse=True)
+        by_event_type[event_type] = tuple(
+            CompiledRule(
+                id=rule.id,
+                rule_name=rule.rule_name,
+                display_name=rule.display_name,
+                event_type=rule.event_type,
+                reward_bubbles=rule.reward_bubbles,
+                reward_description_template=rule.reward_description_template,
+                max_per_member_lifetime=rule.max_per_member_lifetime,
+                max_per_member_per_period=rule.max_per_member_per_period,
+                period=rule.period,
+                replaces_rule_id=rule.replaces_rule_id,
+                priority=rule.priority,
+                requires_admin_confirmation=rule.requires_admin_confirmation,
+                conditions=compile_conditions(rule.trigger_config),
+                replaced_by=frozenset(
+                    other.id for other in group if other.replaces_rule_id == rule.id
+                ),
+            )
+            for rule in group
+        )
+    return RuleIndex(by_event_type=by_event_type, loaded_at=loaded_at)
+
+
+_index: Optional[RuleIndex] = None
+
+
+async def get_rule_index(db: AsyncSession) -> RuleIndex:
+    """The process-wide index, reloaded when invalidated or stale."""
+    global _index
+    now = time.monotonic()
+    if _index is not None and now - _index.loaded_at < RULE_INDEX_TTL_SECONDS:
+        return _index
+
+    result = await db.execute(select(RewardRule).where(RewardRule.is_active.is_(True)))
+    _index = build_rule_index(list(result.scalars().all()), loaded_at=now)
+    logger.debug(
+        "Reward rule index loaded: %d event types",
+        len(_index.by_event_type),
+    )
+    return _index
+
+
+def invalidate_rule_index() -> None:
+    """Drop this process's index so the next event reloads the rules."""
+    global _index
+    _index = None
@@ -1,7 +1,7 @@
 """Core wallet operations — atomic debit/credit with idempotency and row-level locking."""
 
 import uuid
-from typing import Optional
+from typing import NoReturn, Optional
 
 from fastapi import HTTPException, status
 from libs.common.datetime_utils import utc_now
@@ -16,9 +16,21 @@ from services.wallet_service.models import (
     WalletStatus,
     WalletTransaction,
 )
-from sqlalchemy import or_, select
+from services.wallet_service.services.wallet_stats import record_wallet_transactions
+from sqlalchemy import (
+    Integer,
+    String,
+    column,
+    func,
+    inspect,
+    or_,
+    select,
+    update,
+    values,
+)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 logger = get_logger(__name__)
 
@@ -138,6 +150,7 @@ async def grant_welcome_bonus_if_eligible(
     )
     db.add(txn)
     await db.flush()
+    await record_wallet_transactions(db, [txn])
 
     grant.transaction_id = txn.id
     wallet.balance = balance_after
@@ -160,44 +173,91 @@ async def grant_welcome_bonus_if_eligible(
 # ---------------------------------------------------------------------------
 
 
+def _sync_loaded_wallet(db: AsyncSession, wallet_id: uuid.UUID, **committed) -> None:
+    """Mirror a Core balance UPDATE onto the Wallet if this session has it loaded.
+
+    The debit/credit paths update the row with ``UPDATE ... RETURNING``
+    rather than through a locked ORM instance; callers that loaded the
+    wallet earlier should still see the new balance without a refresh.
+    """
+    key = inspect(Wallet).identity_key_from_primary_key((wallet_id,))
+    loaded = db.identity_map.get(key)
+    if loaded is not None:
+        for attr, value in committed.items():
+            set_committed_value(loaded, attr, value)
+
+
 async def _consume_promo_grants_fifo(
-    db: AsyncSession, wallet: Wallet, amount: int
+    db: AsyncSession, wallet_id: uuid.UUID, amount: int
 ) -> tuple[int, int]:
     """Consume `amount` Bubbles promo-first (oldest unexpired grants), then
     purchased — design §19-B. Decrements grant.bubbles_remaining and returns
-    (promo_used, purchased_used). The caller holds the wallet row's FOR UPDATE
-    lock, so per-wallet consumption is serialised; spending promo here also
-    stops it from later expiring into breakage.
+    (promo_used, purchased_used).
+
+    One set-based UPDATE: a running total over the wallet's live grants
+    decides how much each one gives, and only the grants needed are touched.
+    The caller's balance UPDATE already holds the wallet row lock, so
+    per-wallet consumption is serialised and this statement sees every
+    earlier spend; spending promo here also stops it from later expiring
+    into breakage.
     """
     now = utc_now()
-    grants = (
-        (
-            await db.execute(
-                select(PromotionalBubbleGrant)
-                .where(
-                    PromotionalBubbleGrant.wallet_id == wallet.id,
-                    PromotionalBubbleGrant.bubbles_remaining > 0,
-                    or_(
-                        PromotionalBubbleGrant.expires_at.is_(None),
-                        PromotionalBubbleGrant.expires_at > now,
-                    ),
+    grant = PromotionalBubbleGrant
+    live = (
+        select(
+            grant.id,
+            grant.bubbles_remaining,
+            (
+                func.sum(grant.bubbles_remaining).over(
+                    order_by=(grant.created_at, grant.id)
                 )
-                .order_by(PromotionalBubbleGrant.created_at.asc())
+                - grant.bubbles_remaining
+            ).label("drawn_before"),
+        )
+        .where(
+            grant.wallet_id == wallet_id,
+            grant.bubbles_remaining > 0,
+            or_(grant.expires_at.is_(None), grant.expires_at > now),
+        )
+        .cte("live_grants")
+    )
+    take = func.least(live.c.bubbles_remaining, amount - live.c.drawn_before)
+    result = await db.execute(
+        update(grant)
+        .where(grant.id == live.c.id, live.c.drawn_before < amount)
+        .values(bubbles_remaining=grant.bubbles_remaining - take)
+        .returning(take)
+        .execution_options(synchronize_session=False)
+    )
+    promo_used = int(sum(result.scalars().all()))
+    return promo_used, amount - promo_used
+
+
+async def _raise_debit_refused(
+    db: AsyncSession, member_auth_id: str, amount: int
+) -> NoReturn:
+    """Explain why the conditional debit UPDATE matched no row."""
+    wallet = (
+        await db.execute(
+            select(Wallet.status, Wallet.balance).where(
+                Wallet.member_auth_id == member_auth_id
             )
         )
-        .scalars()
-        .all()
+    ).one_or_none()
+    if wallet is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Wallet not found",
+        )
+    if wallet.status != WalletStatus.ACTIVE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Wallet temporarily suspended",
+        )
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Not enough Bubbles. You need {amount} 🫧 but have {wallet.balance} 🫧.",
     )
-    promo_used = 0
-    remaining = amount
-    for g in grants:
-        if remaining <= 0:
-            break
-        take = min(remaining, g.bubbles_remaining)
-        g.bubbles_remaining -= take
-        promo_used += take
-        remaining -= take
-    return promo_used, remaining
 
 
 async def debit_wallet(
@@ -217,11 +277,16 @@ async def debit_wallet(
     """Atomically debit a wallet following design Section 7.1.
 
     1. Check idempotency — return existing transaction if key exists
-    2. SELECT FOR UPDATE on wallet row
-    3. Validate wallet active + sufficient balance
-    4. Create transaction record with balance snapshots
-    5. Update wallet balance + lifetime counters
-    6. Commit atomically
+    2. One conditional UPDATE (active + sufficient balance) takes the
+       balance and bumps the lifetime counter, RETURNING the new balance
+    3. If nothing matched, report why (not found / suspended / short)
+    4. Consume promo grants and create the transaction record
+    5. Commit atomically
+
+    The wallet row lock is taken by the UPDATE itself and held only for
+    the promo UPDATE, the insert and the commit, so concurrent debits on a
+    hot wallet queue for a few statements rather than a SELECT ... FOR
+    UPDATE plus per-grant reads.
     """
     # 1. Idempotency check
     result = await db.execute(
@@ -236,32 +301,32 @@ async def debit_wallet(
         )
         return existing
 
-    # 2. Lock wallet row
+    # 2. Take the balance (this UPDATE takes the row lock)
+    now = utc_now()
     result = await db.execute(
-        select(Wallet).where(Wallet.member_auth_id == member_auth_id).with_for_update()
-    )
-    wallet = result.scalar_one_or_none()
-    if not wallet:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Wallet not found",
+        update(Wallet)
+        .where(
+            Wallet.member_auth_id == member_auth_id,
+            Wallet.status == WalletStatus.ACTIVE,
+            Wallet.balance >= amount,
+        )
+        .values(
+            balance=Wallet.balance - amount,
+            lifetime_bubbles_spent=Wallet.lifetime_bubbles_spent + amount,
+            updated_at=now,
         )
+        .returning(Wallet.id, Wallet.balance, Wallet.lifetime_bubbles_spent)
+        .execution_options(synchronize_session=False)
+    )
+    wallet = result.one_or_none()
 
     # 3. Validate
-    if wallet.status != WalletStatus.ACTIVE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Wallet temporarily suspended",
-        )
-    if wallet.balance < amount:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Not enough Bubbles. You need {amount} 🫧 but have {wallet.balance} 🫧.",
-        )
+    if wallet is None:
+        await _raise_debit_refused(db, member_auth_id, amount)
 
     # 4. Create transaction
-    balance_before = wallet.balance
-    balance_after = wallet.balance - amount
+    balance_after = wallet.balance
+    balance_before = balance_after + amount
 
     # §19-B: member spends/penalties draw from promo grants first (FIFO), then
     # purchased Bubbles. Record the split on the txn so the ledger emitter can
@@ -269,7 +334,7 @@ async def debit_wallet(
     meta = dict(metadata or {})
     if transaction_type in (TransactionType.PURCHASE, TransactionType.PENALTY):
         promo_used, purchased_used = await _consume_promo_grants_fifo(
-            db, wallet, amount
+            db, wallet.id, amount
         )
         meta["promo_bubbles"] = promo_used
         meta["purchased_bubbles"] = purchased_used
@@ -289,15 +354,12 @@ async def debit_wallet(
         reference_id=reference_id,
         initiated_by=initiated_by,
         txn_metadata=meta,
+        created_at=now,
     )
     db.add(txn)
+    await record_wallet_transactions(db, [txn])
 
-    # 5. Update wallet
-    wallet.balance = balance_after
-    wallet.lifetime_bubbles_spent += amount
-    wallet.updated_at = utc_now()
-
-    # 6. Commit
+    # 5. Commit
     try:
         await db.commit()
     except IntegrityError:
@@ -318,6 +380,13 @@ async def debit_wallet(
             return existing_after_conflict
         raise
     await db.refresh(txn)
+    _sync_loaded_wallet(
+        db,
+        wallet.id,
+        balance=balance_after,
+        lifetime_bubbles_spent=wallet.lifetime_bubbles_spent,
+        updated_at=now,
+    )
 
     # Mirror the Bubbles movement to the ledger (best-effort, design §8.2). The
     # promo/purchased split for spends is on txn_metadata (set above).
@@ -354,10 +423,21 @@ async def credit_wallet(
     reference_id: Optional[str] = None,
     initiated_by: Optional[str] = None,
     metadata: Optional[dict] = None,
+    commit: bool = True,
+    deferred_stats: Optional[list[WalletTransaction]] = None,
 ) -> WalletTransaction:
-    """Atomically credit a wallet. Same pattern as debit but adds balance.
+    """Atomically credit a wallet. Same pattern as debit but adds balance:
+    one UPDATE ... RETURNING, then the transaction record.
 
     Note: Frozen wallets can still receive credits (for refunds).
+
+    With ``commit=False`` the credit is only flushed: the caller owns the
+    transaction (e.g. a savepoint per reward grant in a batch) and must
+    emit the txn to the ledger itself once it has committed. Such a caller
+    may also pass ``deferred_stats``: the new txn is appended to it instead
+    of being added to the daily aggregates, and the caller hands the list to
+    ``record_wallet_transactions`` once, just before it commits, so a batch
+    doesn't interleave aggregate row locks with wallet row locks.
     """
     # 1. Idempotency check
     result = await db.execute(
@@ -372,20 +452,36 @@ async def credit_wallet(
         )
         return existing
 
-    # 2. Lock wallet row
+    # 2. Add the balance + lifetime counter (this UPDATE takes the row lock)
+    counter = (
+        "lifetime_bubbles_purchased"
+        if transaction_type == TransactionType.TOPUP
+        else "lifetime_bubbles_received"
+    )
+    now = utc_now()
     result = await db.execute(
-        select(Wallet).where(Wallet.member_auth_id == member_auth_id).with_for_update()
+        update(Wallet)
+        .where(Wallet.member_auth_id == member_auth_id)
+        .values(
+            {
+                "balance": Wallet.balance + amount,
+                counter: getattr(Wallet, counter) + amount,
+                "updated_at": now,
+            }
+        )
+        .returning(Wallet.id, Wallet.balance, getattr(Wallet, counter))
+        .execution_options(synchronize_session=False)
     )
-    wallet = result.scalar_one_or_none()
-    if not wallet:
+    wallet = result.one_or_none()
+    if wallet is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Wallet not found",
         )
 
     # 3. Create transaction
-    balance_before = wallet.balance
-    balance_after = wallet.balance + amount
+    balance_after = wallet.balance
+    balance_before = balance_after - amount
 
     txn = WalletTransaction(
         wallet_id=wallet.id,
@@ -402,18 +498,33 @@ async def credit_wallet(
         reference_id=reference_id,
         initiated_by=initiated_by,
         txn_metadata=metadata,
+        created_at=now,
     )
     db.add(txn)
-
-    # 4. Update wallet + appropriate lifetime counter
-    wallet.balance = balance_after
-    if transaction_type == TransactionType.TOPUP:
-        wallet.lifetime_bubbles_purchased += amount
+    if deferred_stats is None:
+        await record_wallet_transactions(db, [txn])
     else:
-        wallet.lifetime_bubbles_received += amount
-    wallet.updated_at = utc_now()
+        deferred_stats.append(txn)
+    loaded_values = {
+        "balance": balance_after,
+        counter: getattr(wallet, counter),
+        "updated_at": now,
+    }
+
+    if not commit:
+        await db.flush()
+        _sync_loaded_wallet(db, wallet.id, **loaded_values)
+        logger.info(
+            "Credit %d to wallet %s (key=%s) flushed, balance %d→%d",
+            amount,
+            wallet.id,
+            idempotency_key,
+            balance_before,
+            balance_after,
+        )
+        return txn
 
-    # 5. Commit
+    # 4. Commit
     try:
         await db.commit()
     except IntegrityError:
@@ -434,6 +545,7 @@ async def credit_wallet(
             return existing_after_conflict
         raise
     await db.refresh(txn)
+    _sync_loaded_wallet(db, wallet.id, **loaded_values)
 
     # Mirror the Bubbles movement to the ledger (best-effort, design §8.2).
     from services.wallet_service.services.ledger_emit import emit_wallet_txn_to_ledger
@@ -451,6 +563,163 @@ async def credit_wallet(
     return txn
 
 
+async def bulk_credit_wallets(
+    db: AsyncSession, credits: list[dict]
+) -> list[Optional[WalletTransaction]]:
+    """Credit many wallets in one transaction.
+
+    Each dict holds ``credit_wallet``'s keyword arguments (minus ``commit``).
+    Replayed idempotency keys are resolved with one lookup (a key repeated
+    within ``credits`` is applied once). The new credits are summed per
+    wallet and applied with one ``UPDATE ... FROM (VALUES ...) RETURNING``
+    after the wallets are locked in id order, so overlapping bulk credits
+    can't deadlock; the transactions are inserted together and committed
+    once. Each gets the balance snapshots it would have had applied one
+    by one, in order.
+
+    Returns one entry per credit, in order: its transaction (the existing
+    one for a replayed key), or None if the member has no wallet.
+    """
+    if not credits:
+        return []
+
+    keys = [c["idempotency_key"] for c in credits]
+    existing = {
+        txn.idempotency_key: txn
+        for txn in (
+            await db.execute(
+                select(WalletTransaction).where(
+                    WalletTransaction.idempotency_key.in_(keys)
+                )
+            )
+        ).scalars()
+    }
+    pending: dict[str, dict] = {}
+    for credit in credits:
+        key = credit["idempotency_key"]
+        if key not in existing and key not in pending:
+            pending[key] = credit
+
+    # member_auth_id -> (total, purchased, received)
+    totals: dict[str, tuple[int, int, int]] = {}
+    for credit in pending.values():
+        total, purchased, received = totals.get(credit["member_auth_id"], (0, 0, 0))
+        amount = credit["amount"]
+        if credit["transaction_type"] == TransactionType.TOPUP:
+            purchased += amount
+        else:
+            received += amount
+        totals[credit["member_auth_id"]] = (total + amount, purchased, received)
+
+    created: dict[str, WalletTransaction] = {}
+    if totals:
+        await db.execute(
+            select(Wallet.id)
+            .where(Wallet.member_auth_id.in_(totals))
+            .order_by(Wallet.id)
+            .with_for_update()
+        )
+        deltas = values(
+            column("member_auth_id", String),
+            column("total", Integer),
+            column("purchased", Integer),
+            column("received", Integer),
+            name="deltas",
+        ).data([(member, *sums) for member, sums in totals.items()])
+        now = utc_now()
+        result = await db.execute(
+            update(Wallet)
+            .where(Wallet.member_auth_id == deltas.c.member_auth_id)
+            .values(
+                balance=Wallet.balance + deltas.c.total,
+                lifetime_bubbles_purchased=(
+                    Wallet.lifetime_bubbles_purchased + deltas.c.purchased
+                ),
+                lifetime_bubbles_received=(
+                    Wallet.lifetime_bubbles_received + deltas.c.received
+                ),
+                updated_at=now,
+            )
+            .returning(
+                Wallet.id,
+                Wallet.member_auth_id,
+                Wallet.balance,
+                Wallet.lifetime_bubbles_purchased,
+                Wallet.lifetime_bubbles_received,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        wallets = {row.member_auth_id: row for row in result.all()}
+
+        running = {
+            member: row.balance - totals[member][0] for member, row in wallets.items()
+        }
+        for key, credit in pending.items():
+            wallet = wallets.get(credit["member_auth_id"])
+            if wallet is None:
+                continue
+            balance_before = running[wallet.member_auth_id]
+            balance_after = balance_before + credit["amount"]
+            running[wallet.member_auth_id] = balance_after
+            created[key] = WalletTransaction(
+                wallet_id=wallet.id,
+                idempotency_key=key,
+                transaction_type=credit["transaction_type"],
+                direction=TransactionDirection.CREDIT,
+                amount=credit["amount"],
+                balance_before=balance_before,
+                balance_after=balance_after,
+                status=TransactionStatus.COMPLETED,
+                description=credit["description"],
+                service_source=credit["service_source"],
+                reference_type=credit.get("reference_type"),
+                reference_id=credit.get("reference_id"),
+                initiated_by=credit.get("initiated_by"),
+                txn_metadata=credit.get("metadata"),
+                created_at=now,
+            )
+        db.add_all(created.values())
+        await record_wallet_transactions(db, created.values())
+
+        try:
+            await db.commit()
+        except IntegrityError:
+            # A key in the batch was applied concurrently; a retry replays it.
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A credit in this batch was applied concurrently. Retry.",
+            )
+
+        for wallet in wallets.values():
+            _sync_loaded_wallet(
+                db,
+                wallet.id,
+                balance=wallet.balance,
+                lifetime_bubbles_purchased=wallet.lifetime_bubbles_purchased,
+                lifetime_bubbles_received=wallet.lifetime_bubbles_received,
+                updated_at=now,
+            )
+
+        from services.wallet_service.services.ledger_emit import (
+            emit_wallet_txn_to_ledger,
+        )
+
+        for txn in created.values():
+            member_auth_id = pending[txn.idempotency_key]["member_auth_id"]
+            await emit_wallet_txn_to_ledger(db, txn, member_auth_id)
+
+        logger.info(
+            "Bulk credit: %d credits to %d wallets (%d replayed, %d without wallet)",
+            len(created),
+            len(wallets),
+            len(credits) - len(pending),
+            len(pending) - len(created),
+        )
+
+    return [existing.get(key) or created.get(key) for key in keys]
+
+
 # ---------------------------------------------------------------------------
 # Balance check (read-only)
 # ---------------------------------------------------------------------------
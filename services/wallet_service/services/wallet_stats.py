@@ -0,0 +1,353 @@
+"""Incrementally maintained daily wallet aggregates.
+
+Two derived tables replace request-time scans of ``wallet_transactions``:
+
+  * ``wallet_daily_totals`` — count and Bubbles per UTC day, transaction
+    type, direction, status and service bucket (``service_source``, NULL as
+    ``"uncategorized"``), split over ``STATS_SHARDS`` rows per key
+  * ``wallet_member_daily_activity`` — the same per wallet, without the
+    type, for member summaries and distinct-wallet counts
+
+Every path in ``wallet_ops`` that inserts a transaction calls
+``record_wallet_transactions`` before committing (a batch of reward grants
+defers it to ``rewards_engine.process_events``, once per batch), so the
+aggregates commit or roll back with the transactions. Transactions are immutable, so adding
+them in is enough — unlike the attendance rollups, nothing is re-derived on
+write. ``rebuild_wallet_stats`` re-derives the tables from the transactions
+(backfill, or repair after rows were written outside ``wallet_ops``).
+
+The shards only spread write contention: a purchase takes the row lock of
+its (day, type, service, shard) total until it commits, and the shard comes
+from the wallet id, so purchases on different wallets rarely queue on the
+same row. Readers sum across shards, and a rebuild writes everything to
+shard 0.
+"""
+
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import (
+    Date,
+    SmallInteger,
+    and_,
+    case,
+    cast,
+    delete,
+    distinct,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from libs.common.datetime_utils import utc_now
+from services.wallet_service.models import (
+    TransactionDirection,
+    TransactionStatus,
+    TransactionType,
+    WalletDailyTotal,
+    WalletMemberDailyActivity,
+    WalletTransaction,
+)
+
+STATS_SHARDS = 16
+
+# Sentinel used to bucket NULL service_source values in spend distribution
+# and cross-service-user counting (NULL is treated as a single "uncategorized"
+# service per FLYWHEEL_METRICS_DESIGN).
+UNCATEGORIZED_BUCKET = "uncategorized"
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _midnight(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def service_bucket(service_source: Optional[str]) -> str:
+    return UNCATEGORIZED_BUCKET if service_source is None else service_source
+
+
+def stats_shard(wallet_id: uuid.UUID) -> int:
+    return wallet_id.int % STATS_SHARDS
+
+
+async def _add_to(db: AsyncSession, model, sums: dict[tuple, list[int]]) -> None:
+    """Upsert ``sums`` (primary key -> [txn_count, bubbles]) into ``model``."""
+    if not sums:
+        return
+    key_names = [c.name for c in model.__table__.primary_key]
+    now = utc_now()
+    # Sorted, so concurrent batches lock shared rows in the same order.
+    rows = [
+        {
+            **dict(zip(key_names, key)),
+            "txn_count": count,
+            "bubbles": bubbles,
+            "updated_at": now,
+        }
+        for key, (count, bubbles) in sorted(sums.items())
+    ]
+    stmt = pg_insert(model).values(rows)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=key_names,
+            set_={
+                "txn_count": model.txn_count + stmt.excluded.txn_count,
+                "bubbles": model.bubbles + stmt.excluded.bubbles,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+    )
+
+
+async def record_wallet_transactions(
+    db: AsyncSession, txns: Iterable[WalletTransaction]
+) -> None:
+    """Add newly inserted transactions to the daily aggregates.
+
+    Does not commit: call it in the transaction that inserts ``txns``
+    (``created_at`` must be set). Two upserts however many transactions.
+    """
+    totals: dict[tuple, list[int]] = defaultdict(lambda: [0, 0])
+    activity: dict[tuple, list[int]] = defaultdict(lambda: [0, 0])
+    for txn in txns:
+        day = _utc(txn.created_at).date()
+        bucket = service_bucket(txn.service_source)
+        for sums, key in (
+            (
+                totals,
+                (
+                    day,
+                    txn.transaction_type,
+                    txn.direction,
+                    txn.status,
+                    bucket,
+                    stats_shard(txn.wallet_id),
+                ),
+            ),
+            (activity, (txn.wallet_id, day, txn.direction, txn.status, bucket)),
+        ):
+            sums[key][0] += 1
+            sums[key][1] += txn.amount
+    await _add_to(db, WalletDailyTotal, totals)
+    await _add_to(db, WalletMemberDailyActivity, activity)
+
+
+async def rebuild_wallet_stats(
+    db: AsyncSession, since: Optional[date] = None
+) -> tuple[int, int]:
+    """Re-derive both tables from ``wallet_transactions``.
+
+    All days, or UTC days from ``since`` on. The tables are locked against
+    concurrent upserts for the rest of the transaction (wallet writes wait),
+    so a write can't be counted twice or lost. Does not commit; returns the
+    rows written to (daily totals, member activity).
+    """
+    await db.execute(
+        text(
+            "LOCK TABLE wallet_daily_totals, wallet_member_daily_activity "
+            "IN EXCLUSIVE MODE"
+        )
+    )
+    day = cast(func.timezone("UTC", WalletTransaction.created_at), Date)
+    bucket = func.coalesce(WalletTransaction.service_source, UNCATEGORIZED_BUCKET)
+    txn = WalletTransaction
+
+    written = []
+    for model, group_keys, shard in (
+        (
+            WalletDailyTotal,
+            [day, txn.transaction_type, txn.direction, txn.status, bucket],
+            [literal(0, SmallInteger)],
+        ),
+        (
+            WalletMemberDailyActivity,
+            [txn.wallet_id, day, txn.direction, txn.status, bucket],
+            [],
+        ),
+    ):
+        clear = delete(model)
+        rows = select(
+            *group_keys, *shard, func.count(), func.sum(txn.amount), func.now()
+        ).group_by(*group_keys)
+        if since is not None:
+            clear = clear.where(model.day >= since)
+            rows = rows.where(txn.created_at >= _midnight(since))
+        await db.execute(clear)
+
+        key_names = [c.name for c in model.__table__.primary_key]
+        result = await db.execute(
+            pg_insert(model).from_select(
+                [*key_names, "txn_count", "bubbles", "updated_at"], rows
+            )
+        )
+        written.append(result.rowcount or 0)
+    return written[0], written[1]
+
+
+async def ecosystem_stats(
+    db: AsyncSession, period_start: date, period_end: date
+) -> dict:
+    """Flywheel ecosystem aggregates over UTC days ``[period_start, period_end]``.
+
+    Two queries: spend/top-up totals from the daily totals, active and
+    cross-service wallets from the member activity.
+    """
+    totals = WalletDailyTotal
+    total_rows = (
+        await db.execute(
+            select(
+                totals.direction,
+                totals.transaction_type,
+                totals.service_bucket,
+                func.sum(totals.bubbles).label("bubbles"),
+            )
+            .where(
+                totals.day >= period_start,
+                totals.day <= period_end,
+                totals.status == TransactionStatus.COMPLETED,
+            )
+            .group_by(totals.direction, totals.transaction_type, totals.service_bucket)
+        )
+    ).all()
+
+    spend_by_bucket: dict[str, int] = defaultdict(int)
+    total_topup_bubbles = 0
+    for row in total_rows:
+        if row.direction == TransactionDirection.DEBIT:
+            spend_by_bucket[row.service_bucket] += int(row.bubbles or 0)
+        elif row.transaction_type == TransactionType.TOPUP:
+            total_topup_bubbles += int(row.bubbles or 0)
+    total_bubbles_spent = sum(spend_by_bucket.values())
+    spend_distribution = (
+        {
+            bucket: amount / total_bubbles_spent
+            for bucket, amount in spend_by_bucket.items()
+        }
+        if total_bubbles_spent > 0
+        else {}
+    )
+
+    # Active users: any COMPLETED txn in the window. Cross-service users:
+    # COMPLETED DEBITs in >= 2 distinct service buckets.
+    activity = WalletMemberDailyActivity
+    per_wallet = (
+        select(
+            activity.wallet_id,
+            func.count(distinct(activity.service_bucket))
+            .filter(activity.direction == TransactionDirection.DEBIT)
+            .label("service_count"),
+        )
+        .where(
+            activity.day >= period_start,
+            activity.day <= period_end,
+            activity.status == TransactionStatus.COMPLETED,
+        )
+        .group_by(activity.wallet_id)
+        .subquery()
+    )
+    users = (
+        await db.execute(
+            select(
+                func.count().label("active"),
+                func.count().filter(per_wallet.c.service_count >= 2).label("cross"),
+            ).select_from(per_wallet)
+        )
+    ).one()
+    active_wallet_users = int(users.active or 0)
+    cross_service_users = int(users.cross or 0)
+
+    return {
+        "active_wallet_users": active_wallet_users,
+        # Includes active users with no DEBIT in the window (top-ups, refunds,
+        # rewards only): they spent on 0 services, which counts as single.
+        "single_service_users": max(active_wallet_users - cross_service_users, 0),
+        "cross_service_users": cross_service_users,
+        "total_bubbles_spent": total_bubbles_spent,
+        "total_topup_bubbles": total_topup_bubbles,
+        "spend_distribution": spend_distribution,
+    }
+
+
+async def member_wallet_summary(
+    db: AsyncSession, wallet_id: uuid.UUID, date_from: datetime, date_to: datetime
+) -> tuple[int, int]:
+    """(earned, spent) Bubbles for a wallet's transactions in [from, to].
+
+    Whole UTC days inside the range come from the member activity; only the
+    (at most two) partial edge days are read from the transactions, so the
+    result matches a full scan.
+    """
+    date_from, date_to = _utc(date_from), _utc(date_to)
+    first_full = date_from.date()
+    if _midnight(first_full) < date_from:
+        first_full += timedelta(days=1)
+    end_full = date_to.date()  # exclusive
+
+    earned = spent = 0
+    created = WalletTransaction.created_at
+    raw_ranges = [and_(created >= date_from, created <= date_to)]
+    if end_full > first_full:
+        activity = WalletMemberDailyActivity
+        rows = await db.execute(
+            select(activity.direction, func.sum(activity.bubbles))
+            .where(
+                activity.wallet_id == wallet_id,
+                activity.day >= first_full,
+                activity.day < end_full,
+            )
+            .group_by(activity.direction)
+        )
+        for direction, bubbles in rows:
+            if direction == TransactionDirection.CREDIT:
+                earned += int(bubbles or 0)
+            else:
+                spent += int(bubbles or 0)
+        raw_ranges = [
+            and_(created >= date_from, created < _midnight(first_full)),
+            and_(created >= _midnight(end_full), created <= date_to),
+        ]
+
+    edge = (
+        await db.execute(
+            select(
+                func.coalesce(
+                    func.sum(
+                        case(
+                            (
+                                WalletTransaction.direction
+                                == TransactionDirection.CREDIT,
+                                WalletTransaction.amount,
+                            ),
+                            else_=0,
+                        )
+                    ),
+                    0,
+                ).label("earned"),
+                func.coalesce(
+                    func.sum(
+                        case(
+                            (
+                                WalletTransaction.direction
+                                == TransactionDirection.DEBIT,
+                                WalletTransaction.amount,
+                            ),
+                            else_=0,
+                        )
+                    ),
+                    0,
+                ).label("spent"),
+            ).where(WalletTransaction.wallet_id == wallet_id, or_(*raw_ranges))
+        )
+    ).one()
+    return earned + int(edge.earned or 0), spent + int(edge.spent or 0)
@@ -0,0 +1,124 @@
+"""Integration tests for stored certificate artifacts.
+
+`download_certificate` renders a certificate once, stores it keyed by the
+digest of its inputs and serves it with that digest as a strong ETag. The
+URL isn't content-addressed, so browsers must revalidate it on every use.
+The members-service lookup is patched out.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select
+
+_REPORTS = "services.academy_service.routers.reports"
+
+
+async def _issued_enrollment(academy_app, db_session):
+    from libs.auth.dependencies import get_current_user
+    from libs.auth.models import AuthUser
+    from tests.factories import CohortFactory, EnrollmentFactory, ProgramFactory
+
+    auth_id = str(uuid.uuid4())
+    program = ProgramFactory.create()
+    cohort = CohortFactory.create(program_id=program.id)
+    db_session.add_all([program, cohort])
+    await db_session.flush()
+    enrollment = EnrollmentFactory.create(
+        cohort_id=cohort.id,
+        program_id=program.id,
+        member_auth_id=auth_id,
+        certificate_issued_at=datetime(2026, 9, 30, tzinfo=timezone.utc),
+        certificate_code=f"SB-2026-{uuid.uuid4().hex[:8].upper()}",
+    )
+    db_session.add(enrollment)
+    await db_session.commit()
+
+    user = AuthUser(
+        user_id=auth_id,
+        email=f"{auth_id}@test.com",
+        role="authenticated",
+        app_metadata={"roles": ["member"]},
+        user_metadata={},
+    )
+
+    async def _get():
+        return user
+
+    academy_app.dependency_overrides[get_current_user] = _get
+    return enrollment
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_certificate_rendered_once_and_revalidated(academy_client, db_session):
+    from libs.common.pdf import generate_certificate_pdf
+    from services.academy_service.app.main import app as academy_app
+    from services.academy_service.models import CertificateArtifact
+
+    enrollment = await _issued_enrollment(academy_app, db_session)
+    member = {"first_name": "Ada", "last_name": "Obi"}
+    url = f"/academy/enrollments/{enrollment.id}/certificate.pdf"
+
+    with (
+        patch(f"{_REPORTS}.get_member_by_id", AsyncMock(return_value=member)),
+        patch(
+            f"{_REPORTS}.generate_certificate_pdf", wraps=generate_certificate_pdf
+        ) as render,
+    ):
+        first = await academy_client.get(url)
+        second = await academy_client.get(url)
+        revalidated = await academy_client.get(
+            url, headers={"If-None-Match": first.headers["etag"]}
+        )
+        # Weak and listed tags match too.
+        listed = await academy_client.get(
+            url, headers={"If-None-Match": f'"stale", W/{first.headers["etag"]}'}
+        )
+
+    assert first.status_code == 200, first.text
+    assert first.headers["content-type"] == "application/pdf"
+    assert first.content.startswith(b"%PDF")
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert listed.status_code == 304
+    render.assert_called_once()
+
+    [artifact] = (
+        (
+            await db_session.execute(
+                select(CertificateArtifact).where(
+                    CertificateArtifact.enrollment_id == enrollment.id
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert first.headers["etag"] == f'"{artifact.digest}"'
+    assert artifact.size_bytes == len(first.content)
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_certificate_name_change_gets_new_artifact(academy_client, db_session):
+    from services.academy_service.app.main import app as academy_app
+
+    enrollment = await _issued_enrollment(academy_app, db_session)
+    url = f"/academy/enrollments/{enrollment.id}/certificate.pdf"
+
+    etags = []
+    for last_name in ("Obi", "Obi-Okafor"):
+        member = {"first_name": "Ada", "last_name": last_name}
+        with patch(f"{_REPORTS}.get_member_by_id", AsyncMock(return_value=member)):
+            response = await academy_client.get(url)
+        assert response.status_code == 200, response.text
+        etags.append(response.headers["etag"])
+
+    assert etags[0] != etags[1]
@@ -0,0 +1,289 @@
+"""Integration tests for the aggregated coach dashboard.
+
+``GET /academy/coach/me/dashboard`` is built from a fixed number of
+queries whatever the coach's cohort count, overlaps the coach-profile
+lookup with them, and serves a per-coach cached summary that milestone
+reviews and admin cohort changes drop. The members-service lookups and
+Redis are patched out.
+"""
+
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import event
+
+from tests.conftest import make_member_user
+from tests.factories import (
+    CohortFactory,
+    EnrollmentFactory,
+    MilestoneFactory,
+    ProgramFactory,
+)
+
+_ROUTER = "services.academy_service.routers.coach_dashboard"
+_CACHE = "services.academy_service.services.coach_dashboard"
+
+
+@contextmanager
+def _count_queries(engine):
+    statements: list[str] = []
+
+    def _before(conn, cursor, statement, params, context, executemany):
+        # Savepoint bookkeeping from the rollback-wrapped test session isn't
+        # the endpoint's doing.
+        if not statement.lstrip().upper().startswith(("SAVEPOINT", "RELEASE")):
+            statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _before)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _before)
+
+
+@contextmanager
+def _coach(coach_id, *, cached=None, stipend=50_000):
+    with (
+        patch(
+            f"{_ROUTER}.get_cached_coach_member_id",
+            new_callable=AsyncMock,
+            return_value=None,
+        ),
+        patch(f"{_ROUTER}.cache_coach_member_id", new_callable=AsyncMock),
+        patch(
+            f"{_ROUTER}.get_member_by_auth_id",
+            new_callable=AsyncMock,
+            return_value={"id": str(coach_id)},
+        ),
+        patch(
+            f"{_ROUTER}.get_coach_profile",
+            new_callable=AsyncMock,
+            return_value={"academy_cohort_stipend": stipend},
+        ) as profile,
+        patch(
+            f"{_ROUTER}.get_cached_dashboard",
+            new_callable=AsyncMock,
+            return_value=cached,
+        ),
+        patch(f"{_ROUTER}.cache_dashboard", new_callable=AsyncMock) as cache,
+    ):
+        yield profile, cache
+
+
+async def _seed_coach(db_session, coach_id, *, cohorts: int):
+    """One ACTIVE cohort plus ``cohorts - 1`` upcoming ones, each with two
+    enrolled students (one with a pending claim) and one awaiting approval."""
+    from services.academy_service.models import (
+        CohortStatus,
+        EnrollmentStatus,
+        ProgressStatus,
+        StudentProgress,
+    )
+
+    program = ProgramFactory.create()
+    db_session.add(program)
+    await db_session.flush()
+    milestone = MilestoneFactory.create(program_id=program.id)
+    db_session.add(milestone)
+
+    for i in range(cohorts):
+        cohort = CohortFactory.create(
+            program_id=program.id,
+            coach_id=coach_id,
+            status=(CohortStatus.ACTIVE if i == 0 else CohortStatus.OPEN).value,
+        )
+        if i == 0:
+            cohort.start_date -= timedelta(days=14)
+        db_session.add(cohort)
+        await db_session.flush()
+        enrolled = [
+            EnrollmentFactory.create(cohort_id=cohort.id, program_id=program.id)
+            for _ in range(2)
+        ]
+        pending = EnrollmentFactory.create(
+            cohort_id=cohort.id,
+            program_id=program.id,
+            status=EnrollmentStatus.PENDING_APPROVAL,
+        )
+        db_session.add_all([*enrolled, pending])
+        await db_session.flush()
+        db_session.add(
+            StudentProgress(
+                enrollment_id=enrolled[0].id,
+                milestone_id=milestone.id,
+                status=ProgressStatus.PENDING,
+            )
+        )
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_dashboard_query_count_is_constant(
+    academy_client, db_session, test_engine
+):
+    small, large = uuid.uuid4(), uuid.uuid4()
+    await _seed_coach(db_session, small, cohorts=1)
+    await _seed_coach(db_session, large, cohorts=6)
+
+    counts = []
+    for coach_id in (small, large):
+        with _coach(coach_id), _count_queries(test_engine) as statements:
+            resp = await academy_client.get("/academy/coach/me/dashboard")
+        assert resp.status_code == 200, resp.text
+        counts.append(len(statements))
+
+    # cohorts+program, grouped enrollment counts, pending reviews
+    assert counts == [3, 3]
+
+    body = resp.json()
+    assert body["active_cohorts"] == 1
+    assert body["upcoming_cohorts"] == 5
+    assert body["total_students"] == 12
+    assert body["students_pending_approval"] == 6
+    assert body["pending_milestone_reviews"] == 6
+    assert body["current_period_earnings"] == 50_000
+    assert body["next_session"]["enrolled_count"] == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_dashboard_caches_summary_and_serves_from_cache(
+    academy_client, db_session, test_engine
+):
+    coach_id = uuid.uuid4()
+    await _seed_coach(db_session, coach_id, cohorts=2)
+
+    with _coach(coach_id) as (_, cache):
+        first = await academy_client.get("/academy/coach/me/dashboard")
+    assert first.status_code == 200, first.text
+    cache.assert_awaited_once()
+    assert cache.await_args.args[0] == str(coach_id)
+    payload = cache.await_args.args[1]
+    assert payload == first.json()
+
+    with (
+        _coach(coach_id, cached=payload) as (profile, cache),
+        _count_queries(test_engine) as statements,
+    ):
+        second = await academy_client.get("/academy/coach/me/dashboard")
+    assert second.status_code == 200
+    assert second.json() == payload
+    assert statements == []
+    profile.assert_not_awaited()
+    cache.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_dashboard_coach_without_cohorts(academy_client):
+    with _coach(uuid.uuid4()):
+        resp = await academy_client.get("/academy/coach/me/dashboard")
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert body["active_cohorts"] == 0
+    assert body["total_students"] == 0
+    assert body["next_session"] is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_milestone_claim_invalidates_coach_dashboard(academy_client, db_session):
+    from libs.auth.dependencies import get_current_user
+    from services.academy_service.app.main import app as academy_app
+
+    coach_id = uuid.uuid4()
+    program = ProgramFactory.create()
+    db_session.add(program)
+    await db_session.flush()
+    cohort = CohortFactory.create(program_id=program.id, coach_id=coach_id)
+    db_session.add(cohort)
+    await db_session.flush()
+    auth_id = str(uuid.uuid4())
+    enrollment = EnrollmentFactory.create(
+        cohort_id=cohort.id, program_id=program.id, member_auth_id=auth_id
+    )
+    milestone = MilestoneFactory.create(program_id=program.id)
+    db_session.add_all([enrollment, milestone])
+    await db_session.commit()
+
+    member = make_member_user(user_id=auth_id)
+
+    async def _member():
+        return member
+
+    academy_app.dependency_overrides[get_current_user] = _member
+    with patch(
+        f"{_CACHE}.invalidate_coach_dashboards", new_callable=AsyncMock
+    ) as invalidate:
+        resp = await academy_client.post(
+            f"/academy/enrollments/{enrollment.id}/progress/{milestone.id}/claim",
+            json={"student_notes": "did it"},
+        )
+    assert resp.status_code == 200, resp.text
+    invalidate.assert_awaited_once_with(coach_id)
+
+
+async def _seed_cohort(db_session, coach_id):
+    program = ProgramFactory.create()
+    db_session.add(program)
+    await db_session.flush()
+    cohort = CohortFactory.create(program_id=program.id, coach_id=coach_id)
+    db_session.add(cohort)
+    await db_session.commit()
+    return cohort
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_cohort_update_invalidates_coach_dashboard(academy_client, db_session):
+    coach_id = uuid.uuid4()
+    cohort = await _seed_cohort(db_session, coach_id)
+
+    with patch(
+        "services.academy_service.routers.cohorts.crud.invalidate_coach_dashboards",
+        new_callable=AsyncMock,
+    ) as invalidate:
+        resp = await academy_client.put(
+            f"/academy/cohorts/{cohort.id}", json={"name": "Renamed cohort"}
+        )
+    assert resp.status_code == 200, resp.text
+    invalidate.assert_awaited_once()
+    assert set(invalidate.await_args.args) == {coach_id}
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_lead_reassignment_invalidates_both_coaches(academy_client, db_session):
+    _ASSIGN = "services.academy_service.routers.coach_assignment"
+    old_coach, new_coach = uuid.uuid4(), uuid.uuid4()
+    cohort = await _seed_cohort(db_session, old_coach)
+
+    with (
+        patch(
+            f"{_ASSIGN}.get_member_by_auth_id",
+            new_callable=AsyncMock,
+            return_value={"id": str(uuid.uuid4())},
+        ),
+        patch(
+            f"{_ASSIGN}.get_member_by_id",
+            new_callable=AsyncMock,
+            return_value={"first_name": "New", "last_name": "Coach"},
+        ),
+        patch(
+            f"{_ASSIGN}.invalidate_coach_dashboards", new_callable=AsyncMock
+        ) as invalidate,
+    ):
+        resp = await academy_client.post(
+            "/academy/coach-assignments/",
+            json={
+                "cohort_id": str(cohort.id),
+                "coach_id": str(new_coach),
+                "role": "lead",
+            },
+        )
+    assert resp.status_code == 200, resp.text
+    invalidate.assert_awaited_once_with(old_coach, new_coach)
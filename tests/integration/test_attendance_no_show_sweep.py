@@ -0,0 +1,92 @@
+"""Integration tests for the set-based NO_SHOW sweep (``mark_no_shows``).
+
+Bookings and session payloads are passed in directly, as the task would
+after its bulk sessions_service calls, so no HTTP is involved.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from services.attendance_service.models import AttendanceRecord
+from services.attendance_service.models.enums import AttendanceStatus
+from services.attendance_service.tasks import mark_no_shows
+from tests.factories import AttendanceRecordFactory
+
+NOW = datetime(2026, 6, 10, 3, 0, tzinfo=timezone.utc)
+
+
+def _session(ends_at: datetime) -> dict:
+    return {"id": str(uuid.uuid4()), "ends_at": ends_at.isoformat()}
+
+
+def _booking(session: dict) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "session_id": session["id"],
+        "member_id": str(uuid.uuid4()),
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_mark_no_shows_inserts_only_ended_unmarked_bookings(db_session):
+    ended = _session(NOW - timedelta(hours=12))
+    upcoming = _session(NOW + timedelta(hours=12))
+    missing = _session(NOW - timedelta(hours=12))
+    attended, no_show = _booking(ended), _booking(ended)
+    bookings = [attended, no_show, _booking(upcoming), _booking(missing)]
+
+    db_session.add(
+        AttendanceRecordFactory.create(
+            session_id=uuid.UUID(ended["id"]),
+            member_id=uuid.UUID(attended["member_id"]),
+            status=AttendanceStatus.PRESENT.value,
+        )
+    )
+    await db_session.flush()
+
+    counts = await mark_no_shows(
+        db_session,
+        bookings,
+        {s["id"]: s for s in (ended, upcoming)},
+        now=NOW,
+    )
+
+    assert counts == {
+        "checked": 4,
+        "created": 1,
+        "skipped_already_attended": 1,
+        "skipped_session_lookup": 1,
+        "skipped_session_future": 1,
+    }
+    [record] = (
+        (
+            await db_session.execute(
+                select(AttendanceRecord).where(
+                    AttendanceRecord.status == AttendanceStatus.ABSENT
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert record.member_id == uuid.UUID(no_show["member_id"])
+    assert record.booking_id == uuid.UUID(no_show["id"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_mark_no_shows_is_idempotent(db_session):
+    ended = _session(NOW - timedelta(hours=2))
+    bookings = [_booking(ended) for _ in range(3)]
+    sessions = {ended["id"]: ended}
+
+    first = await mark_no_shows(db_session, bookings, sessions, now=NOW)
+    second = await mark_no_shows(db_session, bookings, sessions, now=NOW)
+
+    assert first["created"] == 3
+    assert second["created"] == 0
+    assert second["skipped_already_attended"] == 3
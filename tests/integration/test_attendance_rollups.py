@@ -0,0 +1,164 @@
+"""Integration tests for the weekly attendance rollups.
+
+``member_attendance_stats`` must give the same answer as aggregating the raw
+records, whether a week is served from ``attendance_weekly_rollups`` or read
+record by record at the range edges.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select
+
+from services.attendance_service.models import AttendanceWeeklyRollup
+from services.attendance_service.models.enums import AttendanceStatus
+from services.attendance_service.rollups import (
+    member_attendance_stats,
+    rebuild_attendance_rollups,
+    refresh_attendance_rollups,
+    rollup_keys,
+    week_start,
+)
+from tests.factories import AttendanceRecordFactory
+
+_SESSIONS_BULK = "services.attendance_service.rollups.get_sessions_bulk"
+
+MONDAY = datetime(2026, 3, 2, 7, 0, tzinfo=timezone.utc)
+
+
+def _record(member_id, at: datetime, status: AttendanceStatus, minutes=120):
+    return AttendanceRecordFactory.create(
+        member_id=member_id,
+        status=status.value,
+        session_minutes=minutes,
+        created_at=at,
+    )
+
+
+async def _seed(db_session, member_id):
+    """Ten weeks: attended Monday + Saturday each week, one absence in week 3,
+    nothing in week 5."""
+    records = []
+    for week in range(10):
+        if week == 5:
+            continue
+        base = MONDAY + timedelta(weeks=week)
+        records.append(_record(member_id, base, AttendanceStatus.PRESENT))
+        records.append(
+            _record(member_id, base + timedelta(days=5), AttendanceStatus.LATE, 90)
+        )
+    records.append(
+        _record(member_id, MONDAY + timedelta(weeks=3, days=2), AttendanceStatus.ABSENT)
+    )
+    db_session.add_all(records)
+    await db_session.flush()
+    return records
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_stats_from_rollups_match_raw_records(db_session):
+    member_id = uuid.uuid4()
+    await _seed(db_session, member_id)
+    await rebuild_attendance_rollups(db_session, [member_id])
+
+    # Starts mid-week (partial first week), ends mid-week 9.
+    stats = await member_attendance_stats(
+        db_session,
+        member_id,
+        MONDAY + timedelta(days=2),
+        MONDAY + timedelta(weeks=9, days=2),
+    )
+
+    # Week 0's Monday and week 9's Saturday fall outside the range; week 5 is
+    # empty. Weeks 1–8 come from the rollups, weeks 0 and 9 from raw records.
+    assert stats["total_present"] == 7 + 1
+    assert stats["total_late"] == 1 + 7
+    assert stats["total_absent"] == 1
+    assert stats["total_sessions"] == 17
+    assert stats["by_day"] == {"Monday": 8, "Saturday": 8}
+    assert stats["favorite_day"] == "Monday"  # ties go to the earlier day
+    assert stats["weekly_attendance"] == [True] * 5 + [False] + [True] * 4
+    # 8 × 120 min + 8 × 90 min = 28h, minus 1h warm-up per session.
+    assert stats["total_pool_hours"] == 12.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_refresh_follows_status_changes(db_session):
+    member_id = uuid.uuid4()
+    records = await _seed(db_session, member_id)
+    await refresh_attendance_rollups(db_session, rollup_keys(records))
+
+    first = records[0]
+    first.status = AttendanceStatus.EXCUSED
+    await db_session.flush()
+    await refresh_attendance_rollups(db_session, rollup_keys([first]))
+
+    row = (
+        await db_session.execute(
+            select(AttendanceWeeklyRollup).where(
+                AttendanceWeeklyRollup.member_id == member_id,
+                AttendanceWeeklyRollup.week_start == week_start(MONDAY),
+            )
+        )
+    ).scalar_one()
+    assert (row.present, row.late, row.excused, row.total) == (0, 1, 1, 2)
+    assert row.attended_minutes == 90
+    assert row.attended_by_weekday == [0, 0, 0, 0, 0, 1, 0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_stats_empty_range(db_session):
+    stats = await member_attendance_stats(
+        db_session, uuid.uuid4(), MONDAY, MONDAY + timedelta(weeks=4)
+    )
+    assert stats is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_pool_hours_look_up_records_without_session_minutes(db_session):
+    """Records from before session_minutes existed still count towards pool
+    hours, via sessions_service, until the backfill fills them in."""
+    member_id = uuid.uuid4()
+    legacy = _record(member_id, MONDAY, AttendanceStatus.PRESENT, minutes=None)
+    timed = _record(
+        member_id, MONDAY + timedelta(weeks=1), AttendanceStatus.PRESENT, 120
+    )
+    db_session.add_all([legacy, timed])
+    await db_session.flush()
+    await rebuild_attendance_rollups(db_session, [member_id])
+
+    lookup = AsyncMock(
+        return_value=[
+            {
+                "id": str(legacy.session_id),
+                "starts_at": "2026-03-02T07:00:00Z",
+                "ends_at": "2026-03-02T10:00:00Z",
+            }
+        ]
+    )
+    with patch(_SESSIONS_BULK, lookup):
+        stats = await member_attendance_stats(
+            db_session, member_id, MONDAY, MONDAY + timedelta(weeks=3)
+        )
+
+    lookup.assert_awaited_once()
+    assert lookup.await_args.args[0] == [str(legacy.session_id)]
+    # (3h + 2h) minus 1h warm-up per session.
+    assert stats["total_pool_hours"] == 3.0
+
+    # Once every attended record is timed, sessions_service isn't called.
+    legacy.session_minutes = 180
+    await db_session.flush()
+    await rebuild_attendance_rollups(db_session, [member_id])
+    with patch(_SESSIONS_BULK, AsyncMock()) as idle:
+        stats = await member_attendance_stats(
+            db_session, member_id, MONDAY, MONDAY + timedelta(weeks=3)
+        )
+    idle.assert_not_awaited()
+    assert stats["total_pool_hours"] == 3.0
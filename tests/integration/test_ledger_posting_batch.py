@@ -0,0 +1,127 @@
+"""Integration tests for batch journal posting (`post_entries_bulk`).
+
+Run against the dev DB (SwimBuddz org + CoA seeded), inside the rolled-back
+db_session. Covers: per-entry outcomes in request order, idempotent replay
+(against the DB and within the batch), bad refs rejected without sinking the
+batch, and balances matching the single-entry path.
+"""
+
+import uuid
+from datetime import date
+
+import pytest
+from libs.common.config import get_settings
+from services.ledger_service.models import AccountBalance, JournalLine, Organization
+from services.ledger_service.schemas.journal import JournalEntryCreate
+from services.ledger_service.services.accounts import resolve_account_ids
+from services.ledger_service.services.posting import (
+    UnresolvedAccountError,
+    post_entries_bulk,
+    post_entry,
+)
+from sqlalchemy import func, select, text
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _org_id(db_session) -> uuid.UUID:
+    configured = (get_settings().LEDGER_DEFAULT_ORG_ID or "").strip()
+    if configured:
+        return uuid.UUID(configured)
+    org = (
+        await db_session.execute(
+            select(Organization).where(Organization.name == "SwimBuddz")
+        )
+    ).scalar_one()
+    return org.id
+
+
+async def _set_ctx(db_session, org_id: uuid.UUID) -> None:
+    await db_session.execute(
+        text("SELECT set_config('app.current_org_id', :o, true)"),
+        {"o": str(org_id)},
+    )
+
+
+def _entry(
+    key: str, amount: int, credit_ref: str = "revenue_store"
+) -> JournalEntryCreate:
+    return JournalEntryCreate(
+        idempotency_key=key,
+        entry_date=date(2026, 6, 1),
+        description="batch posting test",
+        source_service="test",
+        source_type="batch",
+        source_id=key,
+        lines=[
+            {"account_ref": "paystack_clearing", "debit": amount},
+            {"account_ref": credit_ref, "credit": amount},
+        ],
+    )
+
+
+async def _closing(db_session, org_id, period_id, account_id) -> int:
+    return (
+        await db_session.execute(
+            select(AccountBalance.closing_minor).where(
+                AccountBalance.org_id == org_id,
+                AccountBalance.period_id == period_id,
+                AccountBalance.account_id == account_id,
+            )
+        )
+    ).scalar_one()
+
+
+async def test_batch_posts_replays_and_rejects_per_entry(db_session):
+    org_id = await _org_id(db_session)
+    await _set_ctx(db_session, org_id)
+    prior = f"batch:{uuid.uuid4()}"
+    await post_entry(db_session, org_id=org_id, payload=_entry(prior, 1_000))
+
+    fresh = f"batch:{uuid.uuid4()}"
+    outcomes = await post_entries_bulk(
+        db_session,
+        org_id=org_id,
+        payloads=[
+            _entry(fresh, 2_000),
+            _entry(prior, 1_000),
+            _entry(f"batch:{uuid.uuid4()}", 3_000, credit_ref="no_such_account"),
+            _entry(fresh, 2_000),
+        ],
+    )
+
+    posted, replay, rejected, duplicate = outcomes
+    assert posted.idempotent_replay is False
+    assert replay.idempotent_replay is True
+    assert isinstance(rejected, UnresolvedAccountError)
+    assert duplicate.idempotent_replay is True
+    assert duplicate.entry_id == posted.entry_id
+
+    lines = (
+        await db_session.execute(
+            select(func.count()).where(JournalLine.entry_id == posted.entry_id)
+        )
+    ).scalar_one()
+    assert lines == 2
+
+
+async def test_batch_balances_match_single_posts(db_session):
+    org_id = await _org_id(db_session)
+    await _set_ctx(db_session, org_id)
+    accts = await resolve_account_ids(db_session, org_id, ["paystack_clearing"])
+    clearing = accts["paystack_clearing"]
+
+    first = await post_entry(
+        db_session, org_id=org_id, payload=_entry(f"batch:{uuid.uuid4()}", 500)
+    )
+    before = await _closing(db_session, org_id, first.period_id, clearing)
+
+    outcomes = await post_entries_bulk(
+        db_session,
+        org_id=org_id,
+        payloads=[_entry(f"batch:{uuid.uuid4()}", n * 100) for n in range(1, 11)],
+    )
+    assert all(not o.idempotent_replay for o in outcomes)
+
+    after = await _closing(db_session, org_id, first.period_id, clearing)
+    assert after - before == sum(n * 100 for n in range(1, 11))
@@ -193,3 +193,36 @@ async def test_payments_reconcile_maps_and_pushes(monkeypatch):
     assert items[0]["fee_minor"] == 1_500
     assert items[0]["psp"] == "paystack"
     assert items[0]["settlement_ref"] == "SET-1"
+
+
+async def test_bulk_intake_applies_batch_in_request_order(db_session):
+    org_id = await _org_id(db_session)
+    await _set_ctx(db_session, org_id)
+
+    suffix = uuid.uuid4().hex[:6]
+    ref = f"RECON-ORDER-{suffix}"
+    txn_id = f"T-ORDER-{suffix}"
+    await _post_cashin(db_session, org_id, ref, 40_000)
+
+    # Same txn re-reported within one batch: first at a wrong amount (break),
+    # then corrected (resolves it). One row, one break opened then resolved.
+    summary = await intake_external_transactions(
+        db_session,
+        org_id,
+        [_ext(ref, 39_000, txn_id=txn_id), _ext(ref, 40_000, txn_id=txn_id)],
+    )
+    assert summary == {"received": 2, "inserted": 1, "matched": 1, "breaks_opened": 1}
+
+    row = (
+        await db_session.execute(
+            select(ExternalTransaction).where(
+                ExternalTransaction.org_id == org_id,
+                ExternalTransaction.external_txn_id == txn_id,
+            )
+        )
+    ).scalar_one()
+    assert row.match_status == "matched"
+    assert row.amount_minor == 40_000
+
+    report = await reconciliation_report(db_session, org_id, limit=500)
+    assert ref not in {b.external_ref for b in report.breaks}
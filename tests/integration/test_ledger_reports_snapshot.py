@@ -0,0 +1,133 @@
+"""Snapshot-backed report tests: account_balances + open-period delta.
+
+Posts into an elapsed month and the report month within the rolled-back
+db_session, then checks the snapshot-backed reports agree with a raw
+journal_lines scan, and that the report cache turns over when an entry posts.
+"""
+
+import uuid
+from datetime import date
+
+from libs.common.config import get_settings
+from services.ledger_service.models import (
+    ChartOfAccounts,
+    JournalEntry,
+    JournalLine,
+    Organization,
+)
+from services.ledger_service.schemas.journal import JournalEntryCreate
+from services.ledger_service.services.posting import post_entry
+from services.ledger_service.services.report_cache import cached_report
+from services.ledger_service.services.reports import (
+    balance_sheet,
+    cash_position,
+    trial_balance,
+)
+from sqlalchemy import func, select, text
+
+MID_MONTH = date(2026, 6, 20)
+MONTH_END = date(2026, 5, 31)
+
+
+async def _org_id(db_session) -> uuid.UUID:
+    configured = (get_settings().LEDGER_DEFAULT_ORG_ID or "").strip()
+    if configured:
+        return uuid.UUID(configured)
+    org = (
+        await db_session.execute(
+            select(Organization).where(Organization.name == "SwimBuddz")
+        )
+    ).scalar_one()
+    return org.id
+
+
+async def _ctx(db_session, org_id) -> None:
+    await db_session.execute(
+        text("SELECT set_config('app.current_org_id', :o, true)"), {"o": str(org_id)}
+    )
+
+
+async def _post(db_session, org_id, entry_date: date, amount: int) -> None:
+    await post_entry(
+        db_session,
+        org_id=org_id,
+        payload=JournalEntryCreate(
+            idempotency_key=f"snap-{uuid.uuid4().hex}",
+            entry_date=entry_date,
+            description="snapshot report test",
+            source_service="test",
+            source_type="snapshot",
+            source_id=uuid.uuid4().hex,
+            lines=[
+                {"account_ref": "paystack_clearing", "debit": amount},
+                {"account_ref": "revenue_store", "credit": amount},
+            ],
+        ),
+    )
+
+
+async def _line_scan(db_session, org_id, as_of: date) -> dict[str, int]:
+    """Net debit per account code straight from journal_lines (the old path)."""
+    rows = (
+        await db_session.execute(
+            select(
+                ChartOfAccounts.code,
+                func.sum(JournalLine.debit_minor) - func.sum(JournalLine.credit_minor),
+            )
+            .select_from(JournalLine)
+            .join(JournalEntry, JournalLine.entry_id == JournalEntry.id)
+            .join(ChartOfAccounts, JournalLine.account_id == ChartOfAccounts.id)
+            .where(JournalLine.org_id == org_id, JournalEntry.entry_date <= as_of)
+            .group_by(ChartOfAccounts.code)
+        )
+    ).all()
+    return {code: int(net) for code, net in rows if net}
+
+
+async def test_trial_balance_matches_line_scan(db_session):
+    org_id = await _org_id(db_session)
+    await _ctx(db_session, org_id)
+    await _post(db_session, org_id, date(2026, 4, 10), 120_000)
+    await _post(db_session, org_id, date(2026, 5, 31), 45_000)
+    await _post(db_session, org_id, date(2026, 6, 5), 30_000)
+    await _post(db_session, org_id, date(2026, 6, 25), 9_000)  # after MID_MONTH
+
+    for as_of in (MID_MONTH, MONTH_END):
+        tb = await trial_balance(db_session, org_id, as_of)
+        nets = {r.code: r.debit_minor - r.credit_minor for r in tb.rows}
+        assert nets == await _line_scan(db_session, org_id, as_of)
+        assert tb.balanced is True
+
+
+async def test_balance_sheet_and_cash_position_use_partial_month(db_session):
+    org_id = await _org_id(db_session)
+    await _ctx(db_session, org_id)
+    before_bs = await balance_sheet(db_session, org_id, MID_MONTH)
+    before_cash = await cash_position(db_session, org_id, MID_MONTH)
+
+    await _post(db_session, org_id, date(2026, 6, 10), 50_000)  # counted
+    await _post(db_session, org_id, date(2026, 6, 28), 7_000)  # after as_of
+
+    bs = await balance_sheet(db_session, org_id, MID_MONTH)
+    cash = await cash_position(db_session, org_id, MID_MONTH)
+    assert bs.balanced is True
+    assert bs.total_assets_minor - before_bs.total_assets_minor == 50_000
+    assert cash.clearing_minor - before_cash.clearing_minor == 50_000
+
+
+async def test_cached_report_turns_over_on_post(db_session):
+    org_id = await _org_id(db_session)
+    await _ctx(db_session, org_id)
+    await _post(db_session, org_id, date(2026, 6, 3), 10_000)
+
+    def compute():
+        return trial_balance(db_session, org_id, MID_MONTH)
+
+    first = await cached_report(db_session, org_id, "tb", (MID_MONTH,), compute)
+    again = await cached_report(db_session, org_id, "tb", (MID_MONTH,), compute)
+    assert again is first
+
+    await _post(db_session, org_id, date(2026, 6, 4), 25_000)
+    fresh = await cached_report(db_session, org_id, "tb", (MID_MONTH,), compute)
+    assert fresh is not first
+    assert fresh.total_debit_minor - first.total_debit_minor == 25_000
@@ -95,6 +95,60 @@ async def test_inverted_window_400(sessions_client, monkeypatch):
     assert r.status_code == 400
 
 
+def _patch_bulk_availability(monkeypatch, by_coach):
+    async def _fake(member_ids, *, calling_service):
+        return [
+            {"member_id": mid, **by_coach[mid]} for mid in member_ids if mid in by_coach
+        ]
+
+    monkeypatch.setattr(makeups_mod, "get_coach_availabilities_bulk", _fake)
+
+
+async def test_ranked_options_across_coaches(sessions_client, db_session, monkeypatch):
+    with_room, free, unpublished = (str(uuid.uuid4()) for _ in range(3))
+    _patch_bulk_availability(monkeypatch, {with_room: _CAL, free: _CAL})
+    # First coach runs a 06:00–07:00 Lagos (05:00 UTC) session with room.
+    sess = SessionFactory.create(
+        starts_at=datetime(2026, 6, 9, 5, 0, tzinfo=timezone.utc),
+        ends_at=datetime(2026, 6, 9, 6, 0, tzinfo=timezone.utc),
+        status="SCHEDULED",
+        capacity=10,
+    )
+    db_session.add(sess)
+    await db_session.flush()
+    db_session.add(
+        SessionCoachFactory.create(session_id=sess.id, coach_id=uuid.UUID(with_room))
+    )
+    await db_session.commit()
+
+    params = [
+        ("learner_id", str(uuid.uuid4())),
+        ("coach_id", with_room),
+        ("coach_id", free),
+        ("coach_id", unpublished),
+        *_PARAMS.items(),
+    ]
+    r = await sessions_client.get("/makeups/options", params=params)
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert body["coach_ids"] == [with_room, free, unpublished]
+    assert body["coaches_without_availability"] == [unpublished]
+    options = body["options"]
+    assert len(options) == 1 + 3 + 4  # join + 3 open gaps, 4 open slots
+    assert (options[0]["coach_id"], options[0]["kind"]) == (with_room, "join_session")
+    assert (options[1]["coach_id"], options[1]["kind"]) == (free, "open")
+    starts = [o["start"] for o in options]
+    assert starts == sorted(starts)
+
+
+async def test_ranked_options_without_coaches_is_empty(sessions_client, monkeypatch):
+    _patch_bulk_availability(monkeypatch, {})
+    params = {"learner_id": str(uuid.uuid4()), **_PARAMS}
+    r = await sessions_client.get("/makeups/options", params=params)
+    assert r.status_code == 200, r.text
+    assert r.json()["options"] == []
+
+
 async def test_makeup_booking_insert_roundtrips(db_session):
     from services.sessions_service.models import (
         MakeupBooking,
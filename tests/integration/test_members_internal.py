@@ -220,3 +220,72 @@ async def test_get_active_members(members_client, db_session):
     assert str(active.id) in returned_ids
     # inactive may or may not be in returned — depends on seeded data
     # but the active one should definitely be there
+
+
+@pytest.fixture
+def _stream_in_test_session(monkeypatch, db_session):
+    """Point the NDJSON streams at the test session, in pages of two."""
+    from contextlib import nullcontext
+
+    import services.members_service.services.member_stream as member_stream
+
+    monkeypatch.setattr(
+        member_stream, "AsyncSessionLocal", lambda: nullcontext(db_session)
+    )
+    monkeypatch.setattr(member_stream, "STREAM_PAGE_SIZE", 2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_stream_active_members_ndjson(
+    members_client, db_session, _stream_in_test_session
+):
+    """Active stream pages through every active member exactly once, as NDJSON."""
+    import json
+
+    active = [MemberFactory.create(is_active=True) for _ in range(5)]
+    inactive = MemberFactory.create(is_active=False)
+    db_session.add_all([*active, inactive])
+    await db_session.commit()
+
+    response = await members_client.get("/internal/members/active/stream")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    ids = [row["id"] for row in rows]
+    assert len(ids) == len(set(ids))
+    assert ids == sorted(ids)
+    assert {str(m.id) for m in active} <= set(ids)
+    assert str(inactive.id) not in ids
+    assert set(rows[0]) == {
+        "id",
+        "auth_id",
+        "first_name",
+        "last_name",
+        "email",
+        "phone",
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_stream_approved_members_matches_list(
+    members_client, db_session, _stream_in_test_session
+):
+    """Approved stream carries the same members and fields as /approved-list."""
+    import json
+
+    approved = [MemberFactory.create(approval_status="approved") for _ in range(3)]
+    pending = MemberFactory.create(approval_status="pending")
+    db_session.add_all([*approved, pending])
+    await db_session.commit()
+
+    listed = (await members_client.get("/internal/members/approved-list")).json()
+    response = await members_client.get("/internal/members/approved-list/stream")
+
+    assert response.status_code == 200
+    streamed = [json.loads(line) for line in response.text.splitlines()]
+    by_id = {row["id"]: row for row in streamed}
+    assert by_id == {row["id"]: row for row in listed}
+    assert str(pending.id) not in by_id
@@ -0,0 +1,106 @@
+"""Integration tests for GET /internal/members/search (ranked trigram search).
+
+Names use a random suffix so rows already in the dev database can't match.
+The Redis page cache is patched out.
+"""
+
+import uuid
+
+import pytest
+
+import services.members_service.services.member_search as member_search
+from tests.factories import MemberFactory
+
+
+@pytest.fixture(autouse=True)
+def _no_cache(monkeypatch):
+    async def _miss(key):
+        return None
+
+    async def _skip(key, page):
+        return None
+
+    monkeypatch.setattr(member_search, "_cached_page", _miss)
+    monkeypatch.setattr(member_search, "_cache_page", _skip)
+
+
+async def _seed(db_session, surname):
+    members = [
+        MemberFactory.create(first_name="Adebayo", last_name=surname),
+        MemberFactory.create(first_name="Bayo", last_name=f"Ola{surname}"),
+        MemberFactory.create(first_name="Chidi", last_name=f"{surname}son"),
+    ]
+    db_session.add_all(members)
+    await db_session.commit()
+    return members
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_search_ranks_word_prefix_before_substring(members_client, db_session):
+    surname = f"qz{uuid.uuid4().hex[:6]}"
+    adebayo, bayo, chidi = await _seed(db_session, surname)
+
+    response = await members_client.get(
+        "/internal/members/search", params={"q": surname}
+    )
+
+    assert response.status_code == 200
+    ids = [r["id"] for r in response.json()]
+    # Adebayo and Chidi's surnames start with the term; Bayo only contains it.
+    assert set(ids[:2]) == {str(adebayo.id), str(chidi.id)}
+    assert ids[2] == str(bayo.id)
+    assert set(response.json()[0]) == {
+        "id",
+        "auth_id",
+        "first_name",
+        "last_name",
+        "email",
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_search_tolerates_typos(members_client, db_session):
+    surname = f"Okonkwo{uuid.uuid4().hex[:4]}"
+    member = MemberFactory.create(first_name="Ngozi", last_name=surname)
+    db_session.add(member)
+    await db_session.commit()
+
+    typo = surname.lower().replace("konk", "kunk")
+    response = await members_client.get("/internal/members/search", params={"q": typo})
+
+    assert response.status_code == 200
+    assert str(member.id) in [r["id"] for r in response.json()]
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_search_keyset_continuation(members_client, db_session):
+    surname = f"qz{uuid.uuid4().hex[:6]}"
+    members = await _seed(db_session, surname)
+
+    seen = []
+    after = None
+    for _ in range(len(members)):
+        params = {"q": surname, "limit": 1}
+        if after:
+            params["after"] = after
+        response = await members_client.get("/internal/members/search", params=params)
+        assert response.status_code == 200
+        seen += [r["id"] for r in response.json()]
+        after = response.headers.get("X-Next-Cursor")
+        if after is None:
+            break
+
+    assert sorted(seen) == sorted(str(m.id) for m in members)
+    assert after is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_search_rejects_bad_cursor(members_client, db_session):
+    response = await members_client.get(
+        "/internal/members/search", params={"q": "ade", "after": "not-a-cursor"}
+    )
+    assert response.status_code == 400
@@ -0,0 +1,197 @@
+"""Equivalence test for the bulk-loading block payout calculator.
+
+``compute_block_payout`` now loads attendance and prior-block deliveries for
+every student in one query each. This seeds a cohort with the awkward cases
+(late join, dropout, pause, excused/absent/unmarked sessions, a student over
+the class cap) and checks every line against the previous per-student queries,
+kept here as the reference.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import bindparam, text
+
+from services.payments_service.models import RecurringPayoutConfig
+from services.payments_service.services.payout_calculator import (
+    CANCELLED_STATUS,
+    _paid_classes,
+    classify_session_for_payout,
+    compute_block_payout,
+)
+from tests.factories import (
+    AttendanceRecordFactory,
+    CohortFactory,
+    EnrollmentFactory,
+    MemberFactory,
+    ProgramFactory,
+    SessionFactory,
+)
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.integration]
+
+COHORT_START = datetime(2026, 1, 5, 9, tzinfo=timezone.utc)
+BLOCK_DAYS = 28
+
+
+async def _reference_student(db, config, block_start, sessions, enr, class_cap):
+    """Per-student counts the way the calculator computed them before bulk
+    loading: one attendance query and one prior-delivered query per student."""
+    enrolled_at = enr.enrolled_at
+    eligible = [
+        s
+        for s in sessions
+        if s.starts_at > enrolled_at
+        and (enr.dropped_at is None or s.starts_at < enr.dropped_at)
+        and (enr.paused_at is None or s.starts_at < enr.paused_at)
+    ]
+    attendance = {}
+    if eligible:
+        rows = await db.execute(
+            text(
+                "SELECT session_id, status FROM public.attendance_records "
+                "WHERE member_id = :m AND session_id IN :ids"
+            ).bindparams(bindparam("ids", expanding=True)),
+            {"m": enr.member_id, "ids": [s.id for s in eligible]},
+        )
+        attendance = {sid: (st or "").lower() for sid, st in rows.all()}
+    kinds = [classify_session_for_payout(attendance.get(s.id)) for s in eligible]
+    delivered = kinds.count("delivered")
+    prior = (
+        await db.execute(
+            text(
+                """
+                SELECT count(*) FROM public.attendance_records ar
+                JOIN public.sessions s ON s.id = ar.session_id
+                WHERE ar.member_id = :student AND s.cohort_id = :cohort
+                  AND s.session_type = 'cohort_class'
+                  AND s.status IS DISTINCT FROM CAST(:cancelled AS session_status_enum)
+                  AND s.starts_at < :block_start AND s.starts_at > :enrolled_at
+                  AND (CAST(:dropped_at AS timestamptz) IS NULL
+                       OR s.starts_at < CAST(:dropped_at AS timestamptz))
+                  AND (CAST(:paused_at AS timestamptz) IS NULL
+                       OR s.starts_at < CAST(:paused_at AS timestamptz))
+                  AND lower(ar.status::text) IN ('present', 'late')
+                """
+            ),
+            {
+                "student": enr.member_id,
+                "cohort": config.cohort_id,
+                "cancelled": CANCELLED_STATUS,
+                "block_start": block_start,
+                "enrolled_at": enrolled_at,
+                "dropped_at": enr.dropped_at,
+                "paused_at": enr.paused_at,
+            },
+        )
+    ).scalar()
+    return {
+        "eligible": len(eligible),
+        "excused": kinds.count("excused"),
+        "paid": _paid_classes(delivered, prior, class_cap) if class_cap else delivered,
+    }
+
+
+async def _seed(db_session):
+    program = ProgramFactory.create()
+    cohort = CohortFactory.create(
+        program_id=program.id,
+        start_date=COHORT_START,
+        end_date=COHORT_START + timedelta(days=BLOCK_DAYS * 2),
+    )
+    sessions = [
+        SessionFactory.create(
+            cohort_id=cohort.id,
+            starts_at=COHORT_START + timedelta(days=7 * week),
+            ends_at=COHORT_START + timedelta(days=7 * week, hours=1),
+        )
+        for week in range(8)
+    ]
+    members = [MemberFactory.create() for _ in range(5)]
+    db_session.add_all([program, cohort, *sessions, *members])
+    await db_session.flush()
+
+    before = COHORT_START - timedelta(days=3)
+    block1 = sessions[4:]
+    windows = [
+        {"enrolled_at": before},  # full attendance, hits the class cap
+        {"enrolled_at": block1[1].starts_at + timedelta(hours=2)},  # late join
+        {"enrolled_at": before, "dropped_at": block1[2].starts_at},  # dropout
+        {"enrolled_at": before, "paused_at": block1[1].starts_at},  # paused
+        {"enrolled_at": before},  # mixed statuses
+    ]
+    enrollments = [
+        EnrollmentFactory.create(
+            cohort_id=cohort.id,
+            program_id=program.id,
+            member_id=m.id,
+            created_at=w["enrolled_at"],
+            **w,
+        )
+        for m, w in zip(members, windows)
+    ]
+    mixed = ["present", "excused", "absent", None, "late", "excused", "late", None]
+    records = []
+    for i, s in enumerate(sessions):
+        for m in members[:4]:
+            records.append(
+                AttendanceRecordFactory.create(
+                    session_id=s.id, member_id=m.id, status="present"
+                )
+            )
+        if mixed[i]:
+            records.append(
+                AttendanceRecordFactory.create(
+                    session_id=s.id, member_id=members[4].id, status=mixed[i]
+                )
+            )
+    db_session.add_all([*enrollments, *records])
+    await db_session.flush()
+    return cohort, sessions, enrollments
+
+
+@pytest.mark.parametrize("fixed", [True, False])
+async def test_bulk_payout_matches_per_student_queries(db_session, fixed):
+    cohort, sessions, enrollments = await _seed(db_session)
+    config = RecurringPayoutConfig(
+        id=uuid.uuid4(),
+        coach_member_id=uuid.uuid4(),
+        cohort_id=cohort.id,
+        band_percentage=40,
+        total_blocks=2,
+        block_length_days=BLOCK_DAYS,
+        cohort_start_date=COHORT_START,
+        cohort_end_date=cohort.end_date,
+        cohort_price_amount=15_000_000,
+        total_classes=6 if fixed else None,
+        per_class_amount_kobo=50_000 if fixed else None,
+        role="lead",
+        block_index=1,
+    )
+    class_cap = 6 if fixed else None
+
+    computation = await compute_block_payout(db_session, config, 1)
+
+    block_start = COHORT_START + timedelta(days=BLOCK_DAYS)
+    in_block = [s for s in sessions if s.starts_at >= block_start]
+    lines = {line.student_member_id: line for line in computation.lines}
+    assert len(lines) == len(enrollments)
+    for enr in enrollments:
+        expected = await _reference_student(
+            db_session, config, block_start, in_block, enr, class_cap
+        )
+        line = lines[enr.member_id]
+        assert line.sessions_eligible == expected["eligible"]
+        assert line.sessions_excused == expected["excused"]
+        assert line.sessions_delivered == expected["paid"]
+        assert (
+            line.student_total_kobo == expected["paid"] * line.per_session_amount_kobo
+        )
+
+    # The capped student: 4 prior classes + 4 in this block, cap 6 → 2 paid.
+    if fixed:
+        assert lines[enrollments[0].member_id].sessions_delivered == 2
+    assert computation.total_kobo == sum(
+        line.student_total_kobo for line in computation.lines
+    )
@@ -141,3 +141,80 @@ async def test_public_get_inactive_pool_404(pools_client):
 
     response = await pools_client.get(f"/pools/{pool_id}")
     assert response.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# NEARBY (public)
+# ---------------------------------------------------------------------------
+
+YABA = (6.5095, 3.3711)
+
+
+@pytest.mark.asyncio
+async def test_public_nearby_orders_by_distance(pools_client):
+    """Nearby search ranks geocoded pools closest-first and skips the rest."""
+    spots = {
+        "Yaba Pool": (6.5150, 3.3750),  # ~0.7 km
+        "Ikeja Pool": (6.6018, 3.3515),  # ~10 km
+        "Lekki Pool": (6.4474, 3.4700),  # ~13 km
+    }
+    for name, (lat, lon) in spots.items():
+        slug = name.lower().replace(" ", "-")
+        await _create_active_pool(
+            pools_client,
+            {
+                **POOL_PAYLOAD,
+                "name": name,
+                "slug": slug,
+                "latitude": lat,
+                "longitude": lon,
+            },
+        )
+    await _create_active_pool(
+        pools_client, {**POOL_PAYLOAD, "name": "No Coords", "slug": "no-coords"}
+    )
+
+    response = await pools_client.get(
+        "/pools/nearby", params={"lat": YABA[0], "lon": YABA[1]}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    names = [p["name"] for p in data["items"]]
+    assert names == ["Yaba Pool", "Ikeja Pool", "Lekki Pool"]
+    assert data["total"] == 3
+    distances = [p["distance_km"] for p in data["items"]]
+    assert distances == sorted(distances)
+    assert distances[0] < 1
+
+
+@pytest.mark.asyncio
+async def test_public_nearby_radius_bounds_results(pools_client):
+    """Pools beyond radius_km are excluded from items and total."""
+    await _create_active_pool(
+        pools_client,
+        {
+            **POOL_PAYLOAD,
+            "name": "Near",
+            "slug": "near",
+            "latitude": 6.515,
+            "longitude": 3.375,
+        },
+    )
+    await _create_active_pool(
+        pools_client,
+        {
+            **POOL_PAYLOAD,
+            "name": "Far",
+            "slug": "far",
+            "latitude": 9.0765,
+            "longitude": 7.3986,
+        },
+    )
+
+    response = await pools_client.get(
+        "/pools/nearby", params={"lat": YABA[0], "lon": YABA[1], "radius_km": 5}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [p["name"] for p in data["items"]] == ["Near"]
+    assert data["total"] == 1
@@ -0,0 +1,230 @@
+"""Integration tests for store inventory reservations.
+
+Checkout takes stock with a conditional UPDATE per item (all or nothing),
+records an ``InventoryReservation`` per item, and the holds are committed on
+payment, released on cancel/failure, or expired by the store worker. These
+drive ``services.store_service.reservations`` directly; the HTTP checkout
+path needs the members/wallet services and stays out of scope (see
+test_store_cart.py). Concurrent buyers are exercised by
+scripts/store/bench_stock_drop.py.
+"""
+
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+# ---------------------------------------------------------------------------
+# Local factories (mirrors test_store_cart's in-file style).
+# ---------------------------------------------------------------------------
+
+
+async def _seed_inventory(db, *, on_hand):
+    """Create category→product→variant→inventory; return the inventory item."""
+    from services.store_service.models import (
+        Category,
+        InventoryItem,
+        Product,
+        ProductStatus,
+        ProductType,
+        ProductVariant,
+    )
+
+    s = uuid.uuid4().hex[:6]
+    cat = Category(id=uuid.uuid4(), name=f"Cat {s}", slug=f"cat-{s}", is_active=True)
+    db.add(cat)
+    await db.flush()
+    prod = Product(
+        id=uuid.uuid4(),
+        category_id=cat.id,
+        name=f"Drop cap {s}",
+        slug=f"drop-cap-{s}",
+        product_type=ProductType.STANDARD,
+        base_price_ngn=Decimal("15000.00"),
+        status=ProductStatus.ACTIVE,
+        is_featured=False,
+        has_variants=False,
+    )
+    db.add(prod)
+    await db.flush()
+    variant = ProductVariant(
+        id=uuid.uuid4(), product_id=prod.id, sku=f"SKU-{s}", name="Default"
+    )
+    db.add(variant)
+    await db.flush()
+    inv = InventoryItem(
+        id=uuid.uuid4(), variant_id=variant.id, quantity_on_hand=on_hand
+    )
+    db.add(inv)
+    await db.commit()
+    return inv
+
+
+async def _make_order(db):
+    from services.store_service.models import Order, OrderStatus
+
+    order = Order(
+        order_number=Order.generate_order_number(),
+        customer_email="buyer@example.com",
+        customer_name="Drop Buyer",
+        subtotal_ngn=Decimal("15000.00"),
+        total_ngn=Decimal("15000.00"),
+        status=OrderStatus.PENDING_PAYMENT,
+    )
+    db.add(order)
+    await db.flush()
+    return order
+
+
+async def _reserved(db, inv):
+    from services.store_service.models import InventoryItem
+
+    return (
+        await db.execute(
+            select(InventoryItem.quantity_reserved).where(InventoryItem.id == inv.id)
+        )
+    ).scalar_one()
+
+
+async def _statuses(db, order):
+    from services.store_service.models import InventoryReservation
+
+    rows = await db.execute(
+        select(InventoryReservation.status).where(
+            InventoryReservation.order_id == order.id
+        )
+    )
+    return sorted(status.value for status in rows.scalars())
+
+
+# ---------------------------------------------------------------------------
+# reserve
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_reserve_stops_at_stock_and_is_all_or_nothing(db_session):
+    from services.store_service.reservations import (
+        InsufficientStock,
+        reserve_order_stock,
+    )
+
+    inv = await _seed_inventory(db_session, on_hand=3)
+    for _ in range(3):
+        order = await _make_order(db_session)
+        await reserve_order_stock(db_session, order.id, {inv.id: 1})
+    await db_session.commit()
+    assert await _reserved(db_session, inv) == 3
+
+    # A multi-item order where one item is sold out: nothing is held, and
+    # the rollback gives back anything already taken.
+    other = await _seed_inventory(db_session, on_hand=5)
+    order = await _make_order(db_session)
+    with pytest.raises(InsufficientStock) as exc:
+        await reserve_order_stock(db_session, order.id, {inv.id: 1, other.id: 2})
+    assert exc.value.inventory_item_id == inv.id
+    assert exc.value.available == 0
+    await db_session.rollback()
+
+    assert await _reserved(db_session, inv) == 3
+    assert await _reserved(db_session, other) == 0
+
+
+# ---------------------------------------------------------------------------
+# expire / commit / release
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_expired_hold_returns_stock_and_late_payment_retakes_it(db_session):
+    from services.store_service.models import InventoryMovement
+    from services.store_service.reservations import (
+        commit_order_reservations,
+        expire_reservations,
+        reserve_order_stock,
+    )
+
+    inv = await _seed_inventory(db_session, on_hand=2)
+    lapsed = await _make_order(db_session)
+    await reserve_order_stock(
+        db_session, lapsed.id, {inv.id: 2}, ttl=timedelta(minutes=-1)
+    )
+    await db_session.commit()
+
+    assert await expire_reservations(db_session) == (1, 2)
+    await db_session.commit()
+    assert await _reserved(db_session, inv) == 0
+    assert await _statuses(db_session, lapsed) == ["expired"]
+    releases = (
+        await db_session.execute(
+            select(InventoryMovement.quantity).where(
+                InventoryMovement.reference_id == lapsed.id,
+                InventoryMovement.reference_type == "reservation_expiry",
+            )
+        )
+    ).scalars()
+    assert list(releases) == [-2]
+
+    # Paid after expiry while the stock is still there: held again.
+    assert await commit_order_reservations(db_session, lapsed) == []
+    await db_session.commit()
+    assert await _reserved(db_session, inv) == 2
+    assert await _statuses(db_session, lapsed) == ["committed"]
+
+    # Committed holds never expire.
+    assert await expire_reservations(db_session) == (0, 0)
+    assert await _reserved(db_session, inv) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_late_payment_after_sell_out_is_reported_short(db_session):
+    from services.store_service.reservations import (
+        commit_order_reservations,
+        expire_reservations,
+        reserve_order_stock,
+    )
+
+    inv = await _seed_inventory(db_session, on_hand=1)
+    lapsed = await _make_order(db_session)
+    await reserve_order_stock(
+        db_session, lapsed.id, {inv.id: 1}, ttl=timedelta(minutes=-1)
+    )
+    await expire_reservations(db_session)
+    buyer = await _make_order(db_session)
+    await reserve_order_stock(db_session, buyer.id, {inv.id: 1})
+    await db_session.commit()
+
+    assert await commit_order_reservations(db_session, lapsed) == [inv.id]
+    assert await _statuses(db_session, lapsed) == ["expired"]
+    assert await _reserved(db_session, inv) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_release_is_idempotent(db_session):
+    from services.store_service.models import OrderStatus
+    from services.store_service.reservations import (
+        commit_order_reservations,
+        release_order_reservations,
+        reserve_order_stock,
+    )
+
+    inv = await _seed_inventory(db_session, on_hand=4)
+    order = await _make_order(db_session)
+    await reserve_order_stock(db_session, order.id, {inv.id: 3})
+    order.status = OrderStatus.PAID
+    await commit_order_reservations(db_session, order)
+    await db_session.commit()
+
+    order.status = OrderStatus.CANCELLED
+    assert await release_order_reservations(db_session, order, "admin") == 3
+    assert await release_order_reservations(db_session, order, "admin") == 0
+    await db_session.commit()
+
+    assert await _reserved(db_session, inv) == 0
+    assert await _statuses(db_session, order) == ["released"]
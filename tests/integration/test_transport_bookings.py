@@ -11,6 +11,10 @@ capacity-driven van assignment. The guards worth pinning:
     (session, member)
   - van numbering rolls over by capacity (seats // capacity + 1) so a
     full van pushes the next rider to the next van
+  - once a session's rides are planned, a new booking is fitted into the
+    plan (vehicle + pickup slot) rather than numbered per stop, after the
+    response and in its own session, so a planner failure never fails a
+    committed booking
 
 auth resolves via the local ``members`` table (MemberRef.auth_id ==
 JWT.user_id) — no cross-service HTTP — so we seed a real Member with a
@@ -24,6 +28,7 @@ service-role member_id override path, area/route admin CRUD.
 """
 
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch
 
@@ -34,6 +39,7 @@ from libs.auth.dependencies import (
     require_admin,
     require_service_role,
 )
+from sqlalchemy import select
 
 from tests.conftest import make_admin_user
 from tests.factories import MemberFactory
@@ -42,6 +48,7 @@ from tests.factories import MemberFactory
 # they're called from — MEMORY.md).
 _ENSURE = "services.transport_service.routers.bookings.ensure_trip_channel"
 _RECONCILE = "services.transport_service.routers.bookings.reconcile_trip_membership"
+_REPLAN_TASK = "services.transport_service.tasks.rides"
 
 
 def _silence_chat_sync():
@@ -51,6 +58,16 @@ def _silence_chat_sync():
     )
 
 
+def _replan_in(db_session):
+    """Run the background re-plan in the test's session (it opens its own)."""
+
+    @asynccontextmanager
+    async def _session():
+        yield db_session
+
+    return patch(f"{_REPLAN_TASK}.AsyncSessionLocal", _session)
+
+
 async def _setup_member(db_session):
     """Seed a Member with a known auth_id and point the transport app's
     auth deps at it. Returns the seeded Member."""
@@ -282,6 +299,102 @@ async def test_van_number_rolls_over_by_capacity(transport_client, db_session):
     assert b.json()["assigned_ride_number"] == 2
 
 
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_booking_after_planning_is_planned(transport_client, db_session):
+    """Once a session's rides are assigned, a new booking is re-planned into
+    a vehicle with a pickup slot instead of the per-stop ride number."""
+    from services.transport_service.services.ride_assignment import (
+        assign_session_rides,
+    )
+
+    cfg, pickup = await _seed_ride(db_session, cost=0, capacity=4)
+    session_id = cfg.session_id
+    no_pool = patch(
+        "services.transport_service.services.ride_assignment.session_destination",
+        new_callable=AsyncMock,
+        return_value=None,
+    )
+
+    await _setup_member(db_session)
+    e, r = _silence_chat_sync()
+    with e, r:
+        a = await transport_client.post(
+            f"/transport/sessions/{session_id}/bookings",
+            json={
+                "session_ride_config_id": str(cfg.id),
+                "pickup_location_id": str(pickup.id),
+                "num_seats": 3,
+            },
+        )
+    assert a.status_code == 200, a.text
+    assert a.json()["pickup_order"] is None
+
+    with no_pool:
+        await assign_session_rides(db_session, session_id)
+
+    # Another stop; the per-stop number would put this rider in ride 1 too,
+    # but ride 1 has one seat left, so the plan needs a second vehicle.
+    other = _make_pickup(pickup.area_id)
+    db_session.add(other)
+    await db_session.commit()
+    await _setup_member(db_session)
+    e, r = _silence_chat_sync()
+    with e, r, no_pool, _replan_in(db_session):
+        b = await transport_client.post(
+            f"/transport/sessions/{session_id}/bookings",
+            json={
+                "session_ride_config_id": str(cfg.id),
+                "pickup_location_id": str(other.id),
+                "num_seats": 2,
+            },
+        )
+    assert b.status_code == 200, b.text
+
+    # The re-plan runs after the response, so read the stored plan.
+    from services.transport_service.models import RideBooking
+
+    planned = (
+        await db_session.execute(
+            select(RideBooking.assigned_ride_number, RideBooking.pickup_order).where(
+                RideBooking.id == uuid.UUID(b.json()["id"])
+            )
+        )
+    ).one()
+    assert tuple(planned) == (2, 1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_failed_replan_keeps_the_booking(transport_client, db_session):
+    """A planner error after the booking is committed is logged, and the
+    member still gets their booking back."""
+    from services.transport_service.models import RideBooking
+
+    cfg, pickup = await _seed_ride(db_session, cost=0, capacity=4)
+    await _setup_member(db_session)
+    e, r = _silence_chat_sync()
+    replan = patch(
+        f"{_REPLAN_TASK}.replan_assigned_session",
+        new_callable=AsyncMock,
+        side_effect=RuntimeError("planner down"),
+    )
+    with e, r, replan as failing, _replan_in(db_session):
+        resp = await transport_client.post(
+            f"/transport/sessions/{cfg.session_id}/bookings",
+            json={
+                "session_ride_config_id": str(cfg.id),
+                "pickup_location_id": str(pickup.id),
+            },
+        )
+
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["pickup_location_id"] == str(pickup.id)
+    failing.assert_awaited_once_with(db_session, cfg.session_id)
+    stored = await db_session.get(RideBooking, uuid.UUID(resp.json()["id"]))
+    assert stored is not None
+
+
 # ---------------------------------------------------------------------------
 # read endpoints
 # ---------------------------------------------------------------------------
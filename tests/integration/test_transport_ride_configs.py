@@ -0,0 +1,191 @@
+"""Integration tests for GET /transport/sessions/{id}/ride-configs.
+
+The endpoint used to issue queries per config *and* per pickup location
+(area, locations, one booking count and up to two RouteInfo lookups each).
+It now loads everything set-based; these tests pin the query count so the
+N+1 can't creep back, and check the availability / route-info payload the
+frontend relies on.
+
+The sessions-service lookup and the Redis response cache are patched out.
+"""
+
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import event
+
+_ROUTES = "services.transport_service.routers.routes"
+STARTS_AT = "2026-06-06T09:00:00Z"
+
+
+@contextmanager
+def _count_queries(engine):
+    statements: list[str] = []
+
+    def _before(conn, cursor, statement, params, context, executemany):
+        # Savepoint bookkeeping from the rollback-wrapped test session isn't
+        # the endpoint's doing.
+        if not statement.lstrip().upper().startswith(("SAVEPOINT", "RELEASE")):
+            statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _before)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _before)
+
+
+@contextmanager
+def _session_lookup(pool_id):
+    session = {"starts_at": STARTS_AT, "pool_id": str(pool_id), "location": None}
+    with (
+        patch(
+            f"{_ROUTES}.get_session_by_id",
+            new_callable=AsyncMock,
+            return_value=session,
+        ),
+        patch(
+            f"{_ROUTES}.get_cached_ride_configs",
+            new_callable=AsyncMock,
+            return_value=None,
+        ),
+        patch(f"{_ROUTES}.cache_ride_configs", new_callable=AsyncMock) as cache,
+    ):
+        yield cache
+
+
+async def _seed_session(db_session, *, areas: int, stops: int, pool_id):
+    """`areas` configs on one session, `stops` pickups per area, each with a
+    route to the pool. The first stop of each area gets one booking."""
+    from services.transport_service.models import (
+        PickupLocation,
+        RideArea,
+        RideBooking,
+        RouteInfo,
+        SessionRideConfig,
+    )
+
+    session_id = uuid.uuid4()
+    for _ in range(areas):
+        s = uuid.uuid4().hex[:6]
+        area = RideArea(id=uuid.uuid4(), name=f"Area {s}", slug=f"area-{s}")
+        db_session.add(area)
+        await db_session.flush()
+        cfg = SessionRideConfig(
+            id=uuid.uuid4(),
+            session_id=session_id,
+            ride_area_id=area.id,
+            cost=150000,
+            capacity=4,
+            departure_time=datetime(2026, 6, 6, 7, 0, tzinfo=timezone.utc),
+        )
+        db_session.add(cfg)
+        for i in range(stops):
+            loc = PickupLocation(id=uuid.uuid4(), name=f"Stop {s}-{i}", area_id=area.id)
+            db_session.add(loc)
+            await db_session.flush()
+            db_session.add(
+                RouteInfo(
+                    origin_pickup_location_id=loc.id,
+                    destination_pool_id=pool_id,
+                    destination_name="Test Pool",
+                    distance_text="10 km",
+                    duration_text="30 mins",
+                    departure_offset_minutes=90,
+                )
+            )
+            if i == 0:
+                await db_session.flush()
+                db_session.add(
+                    RideBooking(
+                        session_id=session_id,
+                        member_id=uuid.uuid4(),
+                        session_ride_config_id=cfg.id,
+                        pickup_location_id=loc.id,
+                    )
+                )
+    await db_session.commit()
+    return session_id
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_ride_configs_query_count_is_constant(
+    transport_client, db_session, test_engine
+):
+    pool_id = uuid.uuid4()
+    small = await _seed_session(db_session, areas=1, stops=2, pool_id=pool_id)
+    large = await _seed_session(db_session, areas=4, stops=6, pool_id=pool_id)
+
+    counts = []
+    for session_id in (small, large):
+        with _session_lookup(pool_id), _count_queries(test_engine) as statements:
+            resp = await transport_client.get(
+                f"/transport/sessions/{session_id}/ride-configs"
+            )
+        assert resp.status_code == 200, resp.text
+        counts.append(len(statements))
+
+    # configs+areas, pickup locations, booking counts, route info
+    assert counts == [4, 4]
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_ride_configs_availability_and_routes(transport_client, db_session):
+    pool_id = uuid.uuid4()
+    session_id = await _seed_session(db_session, areas=1, stops=3, pool_id=pool_id)
+
+    with _session_lookup(pool_id) as cache:
+        resp = await transport_client.get(
+            f"/transport/sessions/{session_id}/ride-configs"
+        )
+    assert resp.status_code == 200, resp.text
+    [cfg] = resp.json()
+    assert cfg["cost"] == 1500.0
+
+    stops = {p["name"].rsplit("-", 1)[1]: p for p in cfg["pickup_locations"]}
+    # Stop 0 holds the only booking, so it's the active location.
+    assert stops["0"]["current_bookings"] == 1
+    assert stops["0"]["is_available"] is True
+    assert stops["1"]["is_available"] is False
+    assert stops["2"]["current_bookings"] == 0
+    for stop in stops.values():
+        assert stop["duration_text"] == "30 mins"
+        assert stop["departure_time_calculated"].startswith("2026-06-06T07:30")
+
+    cache.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_ride_configs_served_from_cache(transport_client, db_session):
+    session_id = uuid.uuid4()
+    cached = [
+        {
+            "id": str(uuid.uuid4()),
+            "session_id": str(session_id),
+            "ride_area_id": str(uuid.uuid4()),
+            "ride_area_name": "Cached Area",
+            "pickup_locations": [],
+            "cost": 0.0,
+            "capacity": 4,
+            "departure_time": None,
+            "created_at": "2026-06-01T00:00:00Z",
+            "updated_at": "2026-06-01T00:00:00Z",
+        }
+    ]
+    lookup = AsyncMock()
+    with (
+        patch(f"{_ROUTES}.get_cached_ride_configs", AsyncMock(return_value=cached)),
+        patch(f"{_ROUTES}.get_session_by_id", lookup),
+    ):
+        resp = await transport_client.get(
+            f"/transport/sessions/{session_id}/ride-configs"
+        )
+    assert resp.status_code == 200, resp.text
+    assert resp.json()[0]["ride_area_name"] == "Cached Area"
+    lookup.assert_not_awaited()
@@ -159,6 +159,9 @@ async def test_internal_ecosystem_stats_classifies_users_and_spend(
         TransactionStatus,
         TransactionType,
     )
+    from services.wallet_service.services.wallet_stats import (
+        record_wallet_transactions,
+    )
     from tests.factories import WalletFactory, WalletTransactionFactory
 
     window_day = datetime(2030, 6, 15, 12, 0, tzinfo=timezone.utc)
@@ -220,6 +223,8 @@ async def test_internal_ecosystem_stats_classifies_users_and_spend(
         ),
     ]
     db_session.add_all(txns)
+    # Written behind wallet_ops' back, so add them to the daily stats too.
+    await record_wallet_transactions(db_session, txns)
     await db_session.commit()
 
     response = await wallet_client.get(
@@ -254,6 +259,9 @@ async def test_internal_ecosystem_stats_excludes_pending_and_out_of_window(
         TransactionStatus,
         TransactionType,
     )
+    from services.wallet_service.services.wallet_stats import (
+        record_wallet_transactions,
+    )
     from tests.factories import WalletFactory, WalletTransactionFactory
 
     in_window = datetime(2030, 7, 15, 12, 0, tzinfo=timezone.utc)
@@ -263,30 +271,30 @@ async def test_internal_ecosystem_stats_excludes_pending_and_out_of_window(
     db_session.add(wallet)
     await db_session.commit()
 
-    db_session.add_all(
-        [
-            # Pending — must be excluded
-            WalletTransactionFactory.create(
-                wallet_id=wallet.id,
-                direction=TransactionDirection.DEBIT,
-                transaction_type=TransactionType.PURCHASE,
-                status=TransactionStatus.PENDING,
-                amount=999,
-                service_source="academy_service",
-                created_at=in_window,
-            ),
-            # Out of window — must be excluded
-            WalletTransactionFactory.create(
-                wallet_id=wallet.id,
-                direction=TransactionDirection.DEBIT,
-                transaction_type=TransactionType.PURCHASE,
-                status=TransactionStatus.COMPLETED,
-                amount=999,
-                service_source="academy_service",
-                created_at=out_of_window,
-            ),
-        ]
-    )
+    txns = [
+        # Pending — must be excluded
+        WalletTransactionFactory.create(
+            wallet_id=wallet.id,
+            direction=TransactionDirection.DEBIT,
+            transaction_type=TransactionType.PURCHASE,
+            status=TransactionStatus.PENDING,
+            amount=999,
+            service_source="academy_service",
+            created_at=in_window,
+        ),
+        # Out of window — must be excluded
+        WalletTransactionFactory.create(
+            wallet_id=wallet.id,
+            direction=TransactionDirection.DEBIT,
+            transaction_type=TransactionType.PURCHASE,
+            status=TransactionStatus.COMPLETED,
+            amount=999,
+            service_source="academy_service",
+            created_at=out_of_window,
+        ),
+    ]
+    db_session.add_all(txns)
+    await record_wallet_transactions(db_session, txns)
     await db_session.commit()
 
     response = await wallet_client.get(
@@ -313,6 +321,9 @@ async def test_internal_ecosystem_stats_null_service_source_bucketed(
         TransactionStatus,
         TransactionType,
     )
+    from services.wallet_service.services.wallet_stats import (
+        record_wallet_transactions,
+    )
     from tests.factories import WalletFactory, WalletTransactionFactory
 
     window_day = datetime(2030, 8, 10, 12, 0, tzinfo=timezone.utc)
@@ -320,28 +331,28 @@ async def test_internal_ecosystem_stats_null_service_source_bucketed(
     db_session.add(wallet)
     await db_session.commit()
 
-    db_session.add_all(
-        [
-            WalletTransactionFactory.create(
-                wallet_id=wallet.id,
-                direction=TransactionDirection.DEBIT,
-                transaction_type=TransactionType.PURCHASE,
-                status=TransactionStatus.COMPLETED,
-                amount=40,
-                service_source=None,
-                created_at=window_day,
-            ),
-            WalletTransactionFactory.create(
-                wallet_id=wallet.id,
-                direction=TransactionDirection.DEBIT,
-                transaction_type=TransactionType.PURCHASE,
-                status=TransactionStatus.COMPLETED,
-                amount=60,
-                service_source=None,
-                created_at=window_day,
-            ),
-        ]
-    )
+    txns = [
+        WalletTransactionFactory.create(
+            wallet_id=wallet.id,
+            direction=TransactionDirection.DEBIT,
+            transaction_type=TransactionType.PURCHASE,
+            status=TransactionStatus.COMPLETED,
+            amount=40,
+            service_source=None,
+            created_at=window_day,
+        ),
+        WalletTransactionFactory.create(
+            wallet_id=wallet.id,
+            direction=TransactionDirection.DEBIT,
+            transaction_type=TransactionType.PURCHASE,
+            status=TransactionStatus.COMPLETED,
+            amount=60,
+            service_source=None,
+            created_at=window_day,
+        ),
+    ]
+    db_session.add_all(txns)
+    await record_wallet_transactions(db_session, txns)
     await db_session.commit()
 
     response = await wallet_client.get(
@@ -0,0 +1,143 @@
+"""Integration tests for batch rewards event ingestion.
+
+``POST /internal/wallet/events/batch`` dedupes and processes many events in
+one transaction against the compiled rule index, enforcing per-member caps
+across the batch. Ledger posting is patched out.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import func, select
+
+from tests.factories import WalletFactory
+
+_ROUTER = "services.wallet_service.routers.rewards_internal"
+
+
+async def _seed_rule(db_session, event_type, **overrides):
+    from services.wallet_service.models import RewardCategory
+    from services.wallet_service.models.rewards import RewardRule
+    from services.wallet_service.services.rule_index import invalidate_rule_index
+
+    defaults = {
+        "rule_name": f"checkin-{uuid.uuid4().hex[:8]}",
+        "display_name": "Checked in",
+        "event_type": event_type,
+        "reward_bubbles": 5,
+        "category": RewardCategory.RETENTION,
+        "max_per_member_lifetime": 1,
+    }
+    defaults.update(overrides)
+    rule = RewardRule(**defaults)
+    db_session.add(rule)
+    await db_session.commit()
+    invalidate_rule_index()
+    return rule
+
+
+def _event(event_type, member_auth_id, **overrides):
+    event = {
+        "event_id": str(uuid.uuid4()),
+        "event_type": event_type,
+        "member_auth_id": member_auth_id,
+        "service_source": "attendance",
+        "occurred_at": datetime.now(timezone.utc).isoformat(),
+        "event_data": {},
+        "idempotency_key": f"evt-{uuid.uuid4().hex}",
+    }
+    event.update(overrides)
+    return event
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_batch_ingest_grants_within_caps(wallet_client, db_session):
+    from services.wallet_service.models import Wallet
+    from services.wallet_service.models.rewards import MemberRewardHistory
+
+    event_type = f"attendance.checkin.{uuid.uuid4().hex[:6]}"
+    rule = await _seed_rule(db_session, event_type)
+    first, second = WalletFactory.create(balance=0), WalletFactory.create(balance=0)
+    db_session.add_all([first, second])
+    await db_session.commit()
+
+    events = [
+        _event(event_type, first.member_auth_id),
+        _event(event_type, second.member_auth_id),
+        # lifetime cap of 1: the second event for this member earns nothing
+        _event(event_type, first.member_auth_id),
+    ]
+    with patch(
+        f"{_ROUTER}.emit_wallet_txn_to_ledger", new_callable=AsyncMock
+    ) as ledger:
+        resp = await wallet_client.post(
+            "/internal/wallet/events/batch", json={"events": events}
+        )
+    assert resp.status_code == 200, resp.text
+
+    results = resp.json()["results"]
+    assert [r["event_id"] for r in results] == [e["event_id"] for e in events]
+    assert [r["rewards_granted"] for r in results] == [1, 1, 0]
+    assert results[0]["rewards"] == [{"rule_name": rule.rule_name, "bubbles": 5}]
+    assert ledger.await_count == 2
+
+    balances = dict(
+        (
+            await db_session.execute(
+                select(Wallet.member_auth_id, Wallet.balance).where(
+                    Wallet.id.in_([first.id, second.id])
+                )
+            )
+        ).all()
+    )
+    assert balances == {first.member_auth_id: 5, second.member_auth_id: 5}
+    grants = (
+        await db_session.execute(
+            select(func.count())
+            .select_from(MemberRewardHistory)
+            .where(MemberRewardHistory.reward_rule_id == rule.id)
+        )
+    ).scalar_one()
+    assert grants == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_batch_ingest_dedupes_within_and_across_batches(
+    wallet_client, db_session
+):
+    event_type = f"attendance.checkin.{uuid.uuid4().hex[:6]}"
+    await _seed_rule(db_session, event_type, max_per_member_lifetime=None)
+    wallet = WalletFactory.create(balance=0)
+    db_session.add(wallet)
+    await db_session.commit()
+
+    event = _event(event_type, wallet.member_auth_id)
+    repeat = _event(
+        event_type, wallet.member_auth_id, idempotency_key=event["idempotency_key"]
+    )
+    with patch(f"{_ROUTER}.emit_wallet_txn_to_ledger", new_callable=AsyncMock):
+        first = await wallet_client.post(
+            "/internal/wallet/events/batch", json={"events": [event, repeat]}
+        )
+        second = await wallet_client.post(
+            "/internal/wallet/events/batch", json={"events": [event]}
+        )
+    assert first.status_code == 200, first.text
+    assert second.status_code == 200, second.text
+
+    results = first.json()["results"]
+    assert [r["event_id"] for r in results] == [event["event_id"]] * 2
+    assert [r["rewards_granted"] for r in results] == [1, 1]
+    assert len(results[0]["rewards"]) == 1
+    assert results[1]["rewards"] == []
+
+    (replayed,) = second.json()["results"]
+    assert replayed["rewards_granted"] == 1
+    assert replayed["rewards"] == []
+
+    await db_session.refresh(wallet)
+    assert wallet.balance == 5
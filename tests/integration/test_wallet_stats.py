@@ -0,0 +1,181 @@
+"""Integration tests for the daily wallet stats.
+
+``wallet_ops`` adds every transaction it writes to ``wallet_daily_totals``
+and ``wallet_member_daily_activity``; the member summary serves whole days
+from the latter and reads only partial edge days from the transactions;
+``rebuild_wallet_stats`` re-derives both tables. Ledger posting is patched
+out.
+"""
+
+import uuid
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import func, select
+
+from tests.factories import WalletFactory, WalletTransactionFactory
+
+_LEDGER = "services.wallet_service.services.ledger_emit.emit_wallet_txn_to_ledger"
+
+
+async def _daily_totals(db_session, bucket):
+    from services.wallet_service.models import WalletDailyTotal
+
+    rows = await db_session.execute(
+        select(
+            WalletDailyTotal.transaction_type,
+            WalletDailyTotal.direction,
+            func.sum(WalletDailyTotal.txn_count),
+            func.sum(WalletDailyTotal.bubbles),
+        )
+        .where(WalletDailyTotal.service_bucket == bucket)
+        .group_by(WalletDailyTotal.transaction_type, WalletDailyTotal.direction)
+    )
+    return {(t.value, d.value): (int(c), int(b)) for t, d, c, b in rows}
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_wallet_ops_writes_record_daily_stats(wallet_client, db_session):
+    from services.wallet_service.models import WalletMemberDailyActivity
+
+    wallet = WalletFactory.create(balance=100)
+    db_session.add(wallet)
+    await db_session.commit()
+    source = f"svc-{uuid.uuid4().hex[:8]}"
+
+    def _body(amount, **overrides):
+        return {
+            "idempotency_key": f"stats-{uuid.uuid4().hex}",
+            "member_auth_id": wallet.member_auth_id,
+            "amount": amount,
+            "description": "Stats test",
+            "service_source": source,
+            **overrides,
+        }
+
+    with patch(_LEDGER, new_callable=AsyncMock):
+        for path, body in (
+            ("/internal/wallet/debit", _body(30, transaction_type="purchase")),
+            ("/internal/wallet/debit", _body(20, transaction_type="purchase")),
+            ("/internal/wallet/credit", _body(5)),
+            ("/internal/wallet/credit/bulk", {"credits": [_body(7), _body(8)]}),
+        ):
+            resp = await wallet_client.post(path, json=body)
+            assert resp.status_code == 200, resp.text
+        # Refused debits don't count.
+        resp = await wallet_client.post(
+            "/internal/wallet/debit", json=_body(1000, transaction_type="purchase")
+        )
+        assert resp.status_code == 400
+
+    assert await _daily_totals(db_session, source) == {
+        ("purchase", "debit"): (2, 50),
+        ("refund", "credit"): (3, 20),
+    }
+    activity = (
+        await db_session.execute(
+            select(
+                WalletMemberDailyActivity.direction,
+                WalletMemberDailyActivity.txn_count,
+                WalletMemberDailyActivity.bubbles,
+            ).where(WalletMemberDailyActivity.wallet_id == wallet.id)
+        )
+    ).all()
+    assert sorted((d.value, c, b) for d, c, b in activity) == [
+        ("credit", 3, 20),
+        ("debit", 2, 50),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_member_summary_combines_daily_activity_and_edge_days(
+    wallet_client, db_session
+):
+    from services.wallet_service.models import TransactionDirection
+    from services.wallet_service.services.wallet_stats import (
+        record_wallet_transactions,
+    )
+
+    wallet = WalletFactory.create(balance=500)
+    db_session.add(wallet)
+    await db_session.commit()
+
+    def _txn(when, amount, direction=TransactionDirection.CREDIT):
+        return WalletTransactionFactory.create(
+            wallet_id=wallet.id,
+            direction=direction,
+            amount=amount,
+            created_at=datetime(*when, tzinfo=timezone.utc),
+        )
+
+    txns = [
+        _txn((2030, 3, 1, 8), 1),  # before the window on the first edge day
+        _txn((2030, 3, 1, 18), 10),  # first edge day
+        _txn((2030, 3, 2, 0), 20),  # whole day
+        _txn((2030, 3, 5, 12), 30, TransactionDirection.DEBIT),  # whole day
+        _txn((2030, 3, 9, 6), 40, TransactionDirection.DEBIT),  # last edge day
+        _txn((2030, 3, 9, 20), 2),  # after the window on the last edge day
+    ]
+    db_session.add_all(txns)
+    await record_wallet_transactions(db_session, txns)
+    await db_session.commit()
+
+    resp = await wallet_client.get(
+        f"/internal/wallet/member-summary/{wallet.member_auth_id}",
+        params={"from": "2030-03-01T12:00:00Z", "to": "2030-03-09T12:00:00Z"},
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.json() == {"bubbles_earned": 30, "bubbles_spent": 70}
+
+    # A window inside one day is read from the transactions alone.
+    resp = await wallet_client.get(
+        f"/internal/wallet/member-summary/{wallet.member_auth_id}",
+        params={"from": "2030-03-01T12:00:00Z", "to": "2030-03-01T23:59:59Z"},
+    )
+    assert resp.json() == {"bubbles_earned": 10, "bubbles_spent": 0}
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+async def test_rebuild_wallet_stats_matches_incremental(db_session):
+    from services.wallet_service.models import TransactionDirection, TransactionType
+    from services.wallet_service.services.wallet_stats import (
+        rebuild_wallet_stats,
+        record_wallet_transactions,
+    )
+
+    wallets = [WalletFactory.create(balance=0) for _ in range(3)]
+    db_session.add_all(wallets)
+    await db_session.commit()
+    source = f"svc-{uuid.uuid4().hex[:8]}"
+    txns = [
+        WalletTransactionFactory.create(
+            wallet_id=wallets[i % 3].id,
+            direction=(
+                TransactionDirection.DEBIT if i % 2 else TransactionDirection.CREDIT
+            ),
+            transaction_type=(
+                TransactionType.PURCHASE if i % 2 else TransactionType.TOPUP
+            ),
+            amount=i + 1,
+            service_source=source,
+            created_at=datetime(2031, 1, 1 + i % 4, i, tzinfo=timezone.utc),
+        )
+        for i in range(12)
+    ]
+    db_session.add_all(txns)
+    await record_wallet_transactions(db_session, txns)
+    await db_session.flush()
+    incremental = await _daily_totals(db_session, source)
+
+    totals, activity = await rebuild_wallet_stats(db_session, since=date(2031, 1, 1))
+
+    assert totals > 0 and activity > 0
+    assert await _daily_totals(db_session, source) == incremental
+    assert incremental == {
+        ("topup", "credit"): (6, sum(range(1, 13, 2))),
+        ("purchase", "debit"): (6, sum(range(2, 13, 2))),
+    }
@@ -0,0 +1,150 @@
+"""Unit tests for the set-based installment billing sweeps.
+
+`deliver_installment_notices` mints a Paystack link and sends the payment
+email for each notice concurrently; a failed link is non-fatal and one
+failed send must not stop the others. `_record_reminders` appends the
+idempotency keys afterwards, one enrollment at a time.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from services.academy_service.tasks.billing import (
+    InstallmentNotice,
+    _record_reminders,
+    deliver_installment_notices,
+)
+
+_MODULE = "services.academy_service.tasks.billing"
+DUE = datetime(2026, 10, 25, 9, 0, tzinfo=timezone.utc)
+
+
+def _enrollment(reminders_sent=None):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        member_auth_id=str(uuid.uuid4()),
+        currency_snapshot="NGN",
+        total_installments=3,
+        reminders_sent=reminders_sent,
+    )
+
+
+def _notice(enrollment, number: int = 1, email: str = "ada@example.com"):
+    return InstallmentNotice(
+        installment=SimpleNamespace(
+            id=uuid.uuid4(), installment_number=number, amount=5_000_000, due_at=DUE
+        ),
+        enrollment=enrollment,
+        cohort=SimpleNamespace(id=uuid.uuid4(), name="October"),
+        program=SimpleNamespace(name="Learn to Swim"),
+        member={"email": email, "first_name": "Ada"},
+        reminder_key=f"installment_{number}_7d",
+        days_until=7,
+    )
+
+
+def _paystack_response(status_code=200, url="https://checkout.test/abc"):
+    resp = MagicMock(status_code=status_code, text="")
+    resp.json.return_value = {"authorization_url": url}
+    return resp
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_deliver_sends_with_checkout_links():
+    notices = [_notice(_enrollment(), email=f"s{i}@example.com") for i in range(3)]
+    email_client = SimpleNamespace(send_template=AsyncMock(return_value=True))
+
+    with patch(
+        f"{_MODULE}.internal_post", AsyncMock(return_value=_paystack_response())
+    ) as mint:
+        delivered, counts = await deliver_installment_notices(notices, email_client)
+
+    assert counts == {"sent": 3, "failed": 0, "link_failed": 0}
+    assert {id(n) for n in delivered} == {id(n) for n in notices}
+    assert mint.await_count == 3
+    sent = email_client.send_template.await_args_list
+    assert {c.kwargs["to_email"] for c in sent} == {
+        f"s{i}@example.com" for i in range(3)
+    }
+    assert all(
+        c.kwargs["template_data"]["checkout_url"] == "https://checkout.test/abc"
+        for c in sent
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_deliver_link_failure_is_non_fatal_and_send_failures_isolated():
+    notices = [_notice(_enrollment(), email=f"s{i}@example.com") for i in range(3)]
+    email_client = SimpleNamespace(
+        send_template=AsyncMock(side_effect=[True, RuntimeError("smtp down"), False])
+    )
+
+    with patch(
+        f"{_MODULE}.internal_post",
+        AsyncMock(
+            side_effect=[
+                _paystack_response(502),
+                RuntimeError("timeout"),
+                _paystack_response(),
+            ]
+        ),
+    ):
+        delivered, counts = await deliver_installment_notices(
+            notices, email_client, concurrency=1
+        )
+
+    assert counts == {"sent": 1, "failed": 2, "link_failed": 2}
+    assert delivered == [notices[0]]
+    first = email_client.send_template.await_args_list[0]
+    assert first.kwargs["template_data"]["checkout_url"] is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_deliver_respects_concurrency_bound():
+    in_flight = peak = 0
+
+    async def _slow_post(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _paystack_response()
+
+    notices = [_notice(_enrollment()) for _ in range(10)]
+    email_client = SimpleNamespace(send_template=AsyncMock(return_value=True))
+    with patch(f"{_MODULE}.internal_post", _slow_post):
+        _, counts = await deliver_installment_notices(
+            notices, email_client, concurrency=3
+        )
+
+    assert counts["sent"] == 10
+    assert peak == 3
+
+
+@pytest.mark.unit
+def test_record_reminders_keeps_every_key_per_enrollment():
+    shared = _enrollment(reminders_sent=["installment_1_7d"])
+    other = _enrollment()
+
+    _record_reminders(
+        [
+            _notice(shared, number=2),
+            _notice(shared, number=3),
+            _notice(other, number=1),
+        ]
+    )
+
+    assert shared.reminders_sent == [
+        "installment_1_7d",
+        "installment_2_7d",
+        "installment_3_7d",
+    ]
+    assert other.reminders_sent == ["installment_1_7d"]
@@ -0,0 +1,126 @@
+"""Unit tests for the weekly academy progress-report pipeline.
+
+`_progress_summary` turns one enrollment's progress rows into the email /
+PDF payloads; `deliver_progress_reports` renders PDFs in a process pool and
+sends the emails concurrently, where one student's failure must not stop
+the others.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from services.academy_service.models import ProgressStatus
+from services.academy_service.tasks.reporting import (
+    ProgressReport,
+    _progress_summary,
+    deliver_progress_reports,
+)
+
+NOW = datetime(2026, 10, 18, 8, 0, tzinfo=timezone.utc)
+SINCE = NOW - timedelta(days=7)
+FLOAT, KICK, BREATH = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+MILESTONES = {FLOAT: "Float", KICK: "Kick", BREATH: "Breathing"}
+
+
+def _progress(milestone_id, status, achieved_at=None, notes=None, reviewed_at=None):
+    return SimpleNamespace(
+        milestone_id=milestone_id,
+        status=status,
+        achieved_at=achieved_at,
+        coach_notes=notes,
+        reviewed_at=reviewed_at,
+    )
+
+
+def _report(email: str) -> ProgressReport:
+    return ProgressReport(
+        to_email=email,
+        template_data={"member_name": "Ada"},
+        pdf_kwargs={
+            "student_name": "Ada Obi",
+            "program_name": "Learn to Swim",
+            "cohort_name": "Oct",
+            "start_date": NOW - timedelta(days=30),
+            "end_date": NOW + timedelta(days=30),
+            "milestones": [
+                {
+                    "name": "Float",
+                    "status": "achieved",
+                    "achieved_at": NOW,
+                    "coach_notes": None,
+                }
+            ],
+            "total_milestones": 3,
+            "completed_milestones": 1,
+            "report_date": NOW,
+        },
+    )
+
+
+@pytest.mark.unit
+def test_progress_summary_splits_recent_and_feedback():
+    progress = [
+        _progress(FLOAT, ProgressStatus.ACHIEVED, achieved_at=NOW - timedelta(days=2)),
+        _progress(KICK, ProgressStatus.ACHIEVED, achieved_at=NOW - timedelta(days=20)),
+        _progress(
+            BREATH,
+            ProgressStatus.PENDING,
+            notes="Exhale underwater",
+            reviewed_at=NOW - timedelta(days=1),
+        ),
+    ]
+
+    summary = _progress_summary(progress, MILESTONES, SINCE)
+
+    assert summary["completed_count"] == 2
+    assert [r["name"] for r in summary["recent"]] == ["Float"]
+    assert summary["feedback"] == [
+        {"milestone": "Breathing", "notes": "Exhale underwater"}
+    ]
+    assert [m["status"] for m in summary["milestones"]] == [
+        "achieved",
+        "achieved",
+        "pending",
+    ]
+
+
+@pytest.mark.unit
+def test_progress_summary_unknown_milestone_and_no_progress():
+    assert _progress_summary([], MILESTONES, SINCE)["completed_count"] == 0
+    orphan = _progress(uuid.uuid4(), ProgressStatus.ACHIEVED, achieved_at=NOW)
+    assert _progress_summary([orphan], MILESTONES, SINCE)["recent"][0]["name"] == (
+        "Unknown"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_deliver_progress_reports_continues_past_failures():
+    email_client = SimpleNamespace(
+        send_template=AsyncMock(side_effect=[True, RuntimeError("boom"), True])
+    )
+    reports = [_report(f"student{i}@example.com") for i in range(3)]
+
+    counts = await deliver_progress_reports(reports, email_client, processes=1)
+
+    assert counts == {"sent": 2, "failed": 1, "pdf_failed": 0}
+    assert email_client.send_template.await_count == 3
+    sent_to = {
+        call.kwargs["to_email"] for call in email_client.send_template.await_args_list
+    }
+    assert sent_to == {r.to_email for r in reports}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_deliver_progress_reports_nothing_to_send():
+    email_client = SimpleNamespace(send_template=AsyncMock())
+    assert await deliver_progress_reports([], email_client) == {
+        "sent": 0,
+        "failed": 0,
+        "pdf_failed": 0,
+    }
+    email_client.send_template.assert_not_awaited()
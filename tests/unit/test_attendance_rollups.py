@@ -0,0 +1,65 @@
+"""Unit tests for attendance rollup helpers (week bucketing, durations,
+row locking)."""
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from services.attendance_service.rollups import (
+    _lock_id,
+    refresh_attendance_rollups,
+    session_minutes,
+    week_start,
+)
+
+
+@pytest.mark.unit
+def test_week_start_is_utc_monday():
+    # 00:30 Monday in Lagos is still Sunday in UTC.
+    lagos_monday = datetime(2026, 3, 9, 0, 30, tzinfo=timezone(timedelta(hours=1)))
+    assert week_start(lagos_monday) == date(2026, 3, 2)
+    assert week_start(datetime(2026, 3, 9, 0, 30, tzinfo=timezone.utc)) == date(
+        2026, 3, 9
+    )
+
+
+@pytest.mark.unit
+def test_session_minutes_from_payload():
+    payload = {"starts_at": "2026-03-07T07:00:00Z", "ends_at": "2026-03-07T09:30:00Z"}
+    assert session_minutes(payload) == 150
+    assert session_minutes(None) is None
+    assert session_minutes({"starts_at": "2026-03-07T07:00:00Z"}) is None
+    assert session_minutes({**payload, "ends_at": payload["starts_at"]}) is None
+
+
+class _FakeResult:
+    def mappings(self):
+        return []
+
+
+class _FakeDB:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt, params=None):
+        self.statements.append((str(stmt), params))
+        return _FakeResult()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_refresh_locks_rows_before_aggregating():
+    member = uuid.uuid4()
+    keys = {(member, date(2026, 3, 9)), (member, date(2026, 3, 2))}
+    db = _FakeDB()
+
+    await refresh_attendance_rollups(db, keys)
+
+    lock_sql, lock_params = db.statements[0]
+    assert "pg_advisory_xact_lock" in lock_sql
+    assert lock_params["ids"] == sorted(_lock_id(key) for key in keys)
+    assert "attendance_records" in db.statements[1][0]
+    # Distinct per week, stable across calls.
+    assert _lock_id((member, date(2026, 3, 2))) == _lock_id((member, date(2026, 3, 2)))
+    assert len(set(lock_params["ids"])) == 2
@@ -0,0 +1,123 @@
+"""Unit tests for batched email sending (`send_batches`, Brevo batch payloads).
+
+Outbox batches go out with bounded concurrency; a rate-limited call is retried
+after the provider's back-off, and a batch the provider rejects outright is
+re-sent one message per call so one bad address can't fail its neighbours.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from libs.common.emails.core import (
+    BatchSendResult,
+    EmailMessage,
+    _brevo_batch_payload,
+)
+from services.communications_service.services.email_outbox import (
+    OutboundBatch,
+    send_batches,
+)
+
+
+def _batch(*emails: str) -> OutboundBatch:
+    return OutboundBatch(
+        messages=[EmailMessage(e, "Hi", "Body") for e in emails],
+        row_ids=[uuid.uuid4() for _ in emails],
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_in_flight_calls_stay_within_concurrency():
+    in_flight = peak = 0
+
+    async def send(messages, **_):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return BatchSendResult(delivered=[True] * len(messages))
+
+    batches = [_batch(f"m{i}@example.com", f"n{i}@example.com") for i in range(10)]
+    outcomes = await send_batches(batches, concurrency=3, send_batch=send)
+
+    assert peak == 3
+    assert len(outcomes) == 10
+    assert all(all(result.delivered) for _, result in outcomes)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_rate_limited_batch_is_retried():
+    calls = 0
+
+    async def send(messages, **_):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return BatchSendResult(
+                delivered=[False] * len(messages), retryable=True, retry_after=0.0
+            )
+        return BatchSendResult(delivered=[True] * len(messages))
+
+    [(_, result)] = await send_batches(
+        [_batch("a@example.com", "b@example.com")], send_batch=send
+    )
+
+    assert calls == 2
+    assert result.delivered == [True, True]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_rejected_batch_is_split_per_message():
+    async def send(messages, **_):
+        bad = any(m.to_email == "bad@" for m in messages)
+        return BatchSendResult(
+            delivered=[not bad] * len(messages),
+            error="Brevo 400: invalid email" if bad else None,
+        )
+
+    outcomes = await send_batches(
+        [_batch("a@example.com", "bad@", "c@example.com")], send_batch=send
+    )
+
+    delivered = {
+        batch.messages[0].to_email: result.delivered[0] for batch, result in outcomes
+    }
+    assert delivered == {"a@example.com": True, "bad@": False, "c@example.com": True}
+
+
+@pytest.mark.unit
+def test_brevo_payload_versions_carry_their_own_body():
+    payload = _brevo_batch_payload(
+        [
+            EmailMessage("a@example.com", "Hi", "Body A", "<p>A</p>"),
+            EmailMessage("b@example.com", "Hi", "Body B"),
+            EmailMessage("c@example.com", "Hello", "Body C", "<p>C</p>"),
+        ],
+        "no-reply@swimbuddz.com",
+        "SwimBuddz",
+    )
+
+    assert payload["subject"] == "Hi"
+    assert payload["textContent"] == "Body A"
+    # A text-only message must not inherit another recipient's HTML.
+    assert "htmlContent" not in payload
+    assert payload["messageVersions"] == [
+        {
+            "to": [{"email": "a@example.com"}],
+            "textContent": "Body A",
+            "htmlContent": "<p>A</p>",
+        },
+        {"to": [{"email": "b@example.com"}], "textContent": "Body B"},
+        {
+            "to": [{"email": "c@example.com"}],
+            "textContent": "Body C",
+            "subject": "Hello",
+            "htmlContent": "<p>C</p>",
+        },
+    ]
@@ -0,0 +1,112 @@
+"""Unit tests for the client-side journal-entry batcher.
+
+`JournalEntryBatcher` coalesces entries into `/journal-entries/batch` calls but
+must keep `post_journal_entry`'s per-entry contract: each `post` resolves to its
+own result or RAISES for its own entry (callers dead-letter per entry).
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from libs.common import ledger_client
+from libs.common.ledger_client import JournalEntryBatcher
+
+
+def _kwargs(source_id: str) -> dict:
+    return {
+        "entry_date": "2026-06-01",
+        "description": "batch test",
+        "source_service": "payments",
+        "source_type": "payment_paid",
+        "source_id": source_id,
+        "lines": [
+            {"account_ref": "paystack_clearing", "debit": 100},
+            {"account_ref": "revenue_store", "credit": 100},
+        ],
+    }
+
+
+def _fake_ledger(calls: list, reject: set[str] = frozenset()):
+    async def fake_post(*, entries, calling_service):
+        calls.append([e["idempotency_key"] for e in entries])
+        items = []
+        for e in entries:
+            key = e["idempotency_key"]
+            if key in reject:
+                items.append(
+                    {"idempotency_key": key, "error": "closed", "error_status": 409}
+                )
+            else:
+                items.append(
+                    {"idempotency_key": key, "result": {"entry_id": f"id-{key}"}}
+                )
+        return {"items": items}
+
+    return fake_post
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_entries_in_window_share_one_request(monkeypatch):
+    calls: list = []
+    monkeypatch.setattr(ledger_client, "post_journal_entries", _fake_ledger(calls))
+
+    async with JournalEntryBatcher(calling_service="payments", max_wait=0.01) as b:
+        results = await asyncio.gather(*(b.post(**_kwargs(str(i))) for i in range(5)))
+
+    assert len(calls) == 1
+    assert [r["entry_id"] for r in results] == [
+        f"id-payments:payment_paid:{i}" for i in range(5)
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_max_batch_splits_requests(monkeypatch):
+    calls: list = []
+    monkeypatch.setattr(ledger_client, "post_journal_entries", _fake_ledger(calls))
+
+    async with JournalEntryBatcher(calling_service="payments", max_batch=2) as b:
+        await asyncio.gather(*(b.post(**_kwargs(str(i))) for i in range(5)))
+
+    assert [len(c) for c in calls] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_rejected_entry_raises_only_for_itself(monkeypatch):
+    calls: list = []
+    monkeypatch.setattr(
+        ledger_client,
+        "post_journal_entries",
+        _fake_ledger(calls, reject={"payments:payment_paid:bad"}),
+    )
+
+    async with JournalEntryBatcher(calling_service="payments") as b:
+        ok, bad = await asyncio.gather(
+            b.post(**_kwargs("good")),
+            b.post(**_kwargs("bad")),
+            return_exceptions=True,
+        )
+
+    assert ok["entry_id"] == "id-payments:payment_paid:good"
+    assert isinstance(bad, httpx.HTTPStatusError)
+    assert bad.response.status_code == 409
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_request_failure_raises_for_every_entry(monkeypatch):
+    async def boom(*, entries, calling_service):
+        raise httpx.ConnectError("ledger down")
+
+    monkeypatch.setattr(ledger_client, "post_journal_entries", boom)
+
+    async with JournalEntryBatcher(calling_service="payments") as b:
+        outcomes = await asyncio.gather(
+            b.post(**_kwargs("a")), b.post(**_kwargs("b")), return_exceptions=True
+        )
+
+    assert all(isinstance(o, httpx.ConnectError) for o in outcomes)
@@ -8,12 +8,16 @@ docs/design/AVAILABILITY_AND_MAKEUP_SCHEDULING_DESIGN.md §7–§8.
 from datetime import date, datetime, timezone
 
 from services.sessions_service.services.makeup_scheduling import (
+    CoachCalendar,
     CoachSession,
     Interval,
     compute_bookable_slots,
+    free_slots,
     is_penalty_free,
     is_within_makeup_window,
     makeup_window_end,
+    merge_intervals,
+    rank_makeup_options,
     slice_into_slots,
 )
 
@@ -133,6 +137,94 @@ def test_empty_calendar_yields_nothing():
     assert compute_bookable_slots({}, window_start=_TUE, window_end=_TUE) == []
 
 
+def test_merge_intervals_coalesces_overlapping_and_touching():
+    merged = merge_intervals(
+        [
+            Interval(_utc(2026, 6, 9, 9), _utc(2026, 6, 9, 10)),
+            Interval(_utc(2026, 6, 9, 5), _utc(2026, 6, 9, 7)),
+            Interval(_utc(2026, 6, 9, 6), _utc(2026, 6, 9, 8)),
+            Interval(_utc(2026, 6, 9, 8), _utc(2026, 6, 9, 9)),
+            Interval(_utc(2026, 6, 9, 12), _utc(2026, 6, 9, 13)),
+        ]
+    )
+    assert merged == [
+        Interval(_utc(2026, 6, 9, 5), _utc(2026, 6, 9, 10)),
+        Interval(_utc(2026, 6, 9, 12), _utc(2026, 6, 9, 13)),
+    ]
+
+
+def test_free_slots_drops_only_overlapping_slots():
+    slots = [
+        Interval(_utc(2026, 6, 9, h), _utc(2026, 6, 9, h + 1)) for h in range(5, 12)
+    ]
+    busy = merge_intervals(
+        [
+            Interval(_utc(2026, 6, 9, 6, 30), _utc(2026, 6, 9, 7)),
+            Interval(_utc(2026, 6, 9, 9), _utc(2026, 6, 9, 11)),
+        ]
+    )
+    assert [s.start.hour for s in free_slots(slots, busy)] == [5, 7, 8, 11]
+
+
+def test_spacing_warnings_keep_learner_session_order():
+    learner = [_utc(2026, 6, 10, 8), _utc(2026, 6, 9, 8)]  # given out of order
+    [slot, *_] = compute_bookable_slots(
+        CAL, window_start=_TUE, window_end=_TUE, learner_sessions=learner
+    )
+    assert "2026-06-10" in slot.warnings[0]
+    assert "2026-06-09" in slot.warnings[1]
+
+
+def test_rank_makeup_options_across_coaches():
+    busy_coach = CoachCalendar(
+        coach_id="c1",
+        calendar=CAL,
+        sessions=[_session(5, 6, capacity=4, booked=3, sid="club")],
+    )
+    free_coach = CoachCalendar(coach_id="c2", calendar=CAL)
+    learner = [_utc(2026, 6, 12, 8)]  # Friday: Tuesday is clean under 48h
+
+    options = rank_makeup_options(
+        [busy_coach, free_coach],
+        window_start=_TUE,
+        window_end=_TUE,
+        learner_sessions=learner,
+    )
+
+    assert all(o.ok for o in options)
+    # Same 05:00 start: joining c1's session beats opening a slot with c2.
+    assert [(o.coach_id, o.kind) for o in options[:2]] == [
+        ("c1", "join_session"),
+        ("c2", "open"),
+    ]
+    assert [o.start for o in options] == sorted(o.start for o in options)
+    assert len(options) == 1 + 3 + 4  # c1: join + 3 open, c2: 4 open
+
+    top = rank_makeup_options(
+        [busy_coach, free_coach], window_start=_TUE, window_end=_TUE, limit=3
+    )
+    assert top == options[:3]
+
+
+def test_rank_prefers_clean_options_over_earlier_flagged_ones():
+    learner = [_utc(2026, 6, 8, 12)]  # Monday: Tuesday slots are back-to-back
+    thu_cal = {
+        **CAL,
+        "recurring": [{"weekday": "thu", "start": "06:00", "end": "07:00"}],
+    }
+    options = rank_makeup_options(
+        [
+            CoachCalendar(coach_id="tue", calendar=CAL, min_hours_between=1),
+            CoachCalendar(coach_id="thu", calendar=thu_cal, min_hours_between=1),
+        ],
+        window_start=_TUE,
+        window_end=date(2026, 6, 11),
+        learner_sessions=learner,
+    )
+    assert options[0].coach_id == "thu" and options[0].ok
+    assert all(not o.ok for o in options[1:])
+
+
 def test_penalty_free_threshold():
     now = _utc(2026, 6, 9, 8)
     assert is_penalty_free(now, _utc(2026, 6, 11, 8)) is True  # 48h notice
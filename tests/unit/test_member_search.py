@@ -0,0 +1,41 @@
+"""Unit tests for member search helpers (query normalisation, cursors)."""
+
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from services.members_service.services.member_search import (
+    InvalidSearchCursor,
+    decode_cursor,
+    encode_cursor,
+    normalize_query,
+)
+
+
+@pytest.mark.unit
+def test_normalize_query_lowercases_and_collapses_whitespace():
+    assert normalize_query("  Ada   LOVELACE ") == "ada lovelace"
+    assert len(normalize_query("x" * 500)) == 100
+
+
+@pytest.mark.unit
+def test_cursor_round_trips():
+    member_id = uuid.uuid4()
+    cursor = encode_cursor("ada", 2, Decimal("0.875"), member_id)
+    assert "=" not in cursor
+    assert decode_cursor(cursor, "ada") == (2, Decimal("0.875"), member_id)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "eyJhIjogMX0"])
+def test_bad_cursor_rejected(cursor):
+    with pytest.raises(InvalidSearchCursor):
+        decode_cursor(cursor, "ada")
+
+
+@pytest.mark.unit
+def test_cursor_from_another_query_rejected():
+    cursor = encode_cursor("ada", 2, Decimal("0.875"), uuid.uuid4())
+    with pytest.raises(InvalidSearchCursor):
+        decode_cursor(cursor, "bola")
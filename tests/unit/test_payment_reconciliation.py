@@ -0,0 +1,73 @@
+"""Unit tests for concurrent Paystack verification (`verify_references`).
+
+The sweep verifies references concurrently over the shared client; it must stay
+within its in-flight bound, retry rate-limited references after Paystack's
+back-off, and keep one reference's failure from affecting the rest.
+"""
+
+import asyncio
+
+import pytest
+
+from services.payments_service.routers.intents import PaystackRateLimitedError
+from services.payments_service.services.payment_reconciliation import (
+    verify_references,
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_in_flight_calls_stay_within_concurrency():
+    in_flight = peak = 0
+
+    async def verify(reference: str) -> dict:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"reference": reference, "status": "success"}
+
+    refs = [f"ref-{i}" for i in range(20)]
+    results = await verify_references(
+        refs, verify=verify, concurrency=4, rate_per_sec=0
+    )
+
+    assert peak == 4
+    assert set(results) == set(refs)
+    assert all(r["status"] == "success" for r in results.values())
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_rate_limited_reference_is_retried_after_back_off():
+    calls: list[str] = []
+
+    async def verify(reference: str) -> dict:
+        calls.append(reference)
+        if reference == "slow" and calls.count("slow") == 1:
+            raise PaystackRateLimitedError(0.01, "Paystack rate limit exceeded")
+        return {"status": "success"}
+
+    results = await verify_references(
+        ["slow", "other"], verify=verify, concurrency=2, rate_per_sec=0
+    )
+
+    assert calls.count("slow") == 2
+    assert results["slow"] == {"status": "success"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_failure_is_isolated_per_reference():
+    async def verify(reference: str) -> dict:
+        if reference == "bad":
+            raise RuntimeError("boom")
+        return {"status": "abandoned"}
+
+    results = await verify_references(
+        ["good", "bad", "good"], verify=verify, rate_per_sec=0
+    )
+
+    assert isinstance(results["bad"], RuntimeError)
+    assert results["good"] == {"status": "abandoned"}
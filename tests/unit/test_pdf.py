@@ -0,0 +1,59 @@
+"""Unit tests for libs.common.pdf (cached styles, batches, certificate digest)."""
+
+from datetime import datetime, timezone
+
+import pytest
+from libs.common import pdf
+
+COMPLETED = datetime(2026, 9, 30, tzinfo=timezone.utc)
+CERT = {
+    "student_name": "Ada Obi",
+    "program_name": "Learn to Swim",
+    "completion_date": COMPLETED,
+    "verification_code": "SB-2026-ABCD1234",
+}
+
+
+@pytest.mark.unit
+def test_certificate_bytes_are_deterministic():
+    assert pdf.generate_certificate_pdf(**CERT) == pdf.generate_certificate_pdf(**CERT)
+
+
+@pytest.mark.unit
+def test_certificate_digest_tracks_inputs_and_template_version(monkeypatch):
+    digest = pdf.certificate_digest(**CERT)
+    assert len(digest) == 64
+    assert pdf.certificate_digest(**CERT) == digest
+    assert pdf.certificate_digest(**{**CERT, "student_name": "Ada O."}) != digest
+    monkeypatch.setattr(
+        pdf, "CERTIFICATE_TEMPLATE_VERSION", pdf.CERTIFICATE_TEMPLATE_VERSION + 1
+    )
+    assert pdf.certificate_digest(**CERT) != digest
+
+
+@pytest.mark.unit
+def test_styles_built_once_per_process():
+    pdf.generate_certificate_pdf(**CERT)
+    styles = pdf._styles()
+    pdf.generate_progress_report_pdf(
+        student_name="Ada Obi",
+        program_name="Learn to Swim",
+        cohort_name="October",
+        start_date=COMPLETED,
+        end_date=COMPLETED,
+        milestones=[],
+        total_milestones=0,
+        completed_milestones=0,
+        report_date=COMPLETED,
+    )
+    assert pdf._styles() is styles
+
+
+@pytest.mark.unit
+def test_render_many():
+    certs = [CERT, {**CERT, "student_name": "Chidi Eze"}]
+    rendered = pdf.render_certificates(certs)
+    assert len(rendered) == 2
+    assert all(doc.startswith(b"%PDF") for doc in rendered)
+    assert rendered[0] == pdf.generate_certificate_pdf(**CERT)
+    assert rendered[0] != rendered[1]
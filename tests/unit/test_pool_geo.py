@@ -0,0 +1,36 @@
+"""Unit tests for pool distance helpers (haversine + bounding boxes)."""
+
+import pytest
+
+from services.pools_service.services.geo import bounding_box, haversine_km
+
+YABA = (6.5095, 3.3711)
+ABUJA = (9.0765, 7.3986)
+
+
+@pytest.mark.unit
+def test_haversine_known_distance():
+    # Lagos (Yaba) → Abuja is roughly 525 km as the crow flies.
+    assert haversine_km(*YABA, *ABUJA) == pytest.approx(525, abs=10)
+    assert haversine_km(*YABA, *YABA) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("radius", [1.0, 25.0, 400.0])
+def test_bounding_box_contains_circle(radius):
+    box = bounding_box(*YABA, radius)
+    # Points due north/south/east/west at exactly the radius sit inside the box.
+    step = radius / 111.2
+    assert box.min_lat <= YABA[0] - step * 0.99
+    assert box.max_lat >= YABA[0] + step * 0.99
+    east = (YABA[0], YABA[1] + step)
+    assert haversine_km(*YABA, *east) <= radius * 1.01
+    assert box.min_lon < YABA[1] < box.max_lon
+    assert box.max_lon >= east[1] * 0.999
+
+
+@pytest.mark.unit
+def test_bounding_box_drops_longitude_near_pole_and_antimeridian():
+    assert bounding_box(89.9, 0.0, 50).min_lon is None
+    assert bounding_box(0.0, 179.9, 50).min_lon is None
+    assert bounding_box(*YABA, 50).min_lon is not None
@@ -0,0 +1,202 @@
+"""Unit tests for wave-based session reminder processing.
+
+`_process_single_notification` works from a preloaded `_ReminderWave`; these
+check recipient selection (coach-only 1h reminders, attendee/coach dedupe,
+preference opt-outs) and that stale sessions are cancelled without queueing.
+`_load_reminder_wave` is run against stubbed service clients and a fake
+session to check what it fetches and how preferences are keyed.
+"""
+
+import uuid
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from libs.common.datetime_utils import utc_now
+from services.communications_service.models import (
+    ScheduledNotification,
+    ScheduledNotificationStatus,
+    SessionNotificationType,
+)
+from services.communications_service.tasks import session_notifications as tasks
+
+SESSION_ID = uuid.uuid4()
+COACH = str(uuid.uuid4())
+SWIMMER = str(uuid.uuid4())
+OPTED_OUT = str(uuid.uuid4())
+
+
+def _auth_id(member_id: str) -> str:
+    return f"auth-{member_id}"
+
+
+def _member(member_id: str) -> dict:
+    return {
+        "id": member_id,
+        "auth_id": _auth_id(member_id),
+        "email": f"{member_id}@example.com",
+        "first_name": "Ada",
+    }
+
+
+def _wave(starts_in: timedelta, status: str = "scheduled") -> tasks._ReminderWave:
+    sid = str(SESSION_ID)
+    return tasks._ReminderWave(
+        sessions={
+            sid: {
+                "id": sid,
+                "title": "Community Swim",
+                "session_type": "community",
+                "status": status,
+                "starts_at": (utc_now() + starts_in).isoformat(),
+                "timezone": "Africa/Lagos",
+            }
+        },
+        coaches={sid: [COACH]},
+        attendees={sid: [COACH, SWIMMER, OPTED_OUT]},
+        members={mid: _member(mid) for mid in (COACH, SWIMMER, OPTED_OUT)},
+        prefs={
+            _auth_id(OPTED_OUT): SimpleNamespace(
+                email_session_reminders=True,
+                reminder_24h_enabled=False,
+                reminder_3h_enabled=True,
+            )
+        },
+    )
+
+
+def _notification(kind: SessionNotificationType) -> ScheduledNotification:
+    return ScheduledNotification(
+        id=uuid.uuid4(),
+        session_id=SESSION_ID,
+        notification_type=kind,
+        scheduled_for=utc_now(),
+        status=ScheduledNotificationStatus.PENDING,
+    )
+
+
+@pytest.fixture
+def queued(monkeypatch):
+    calls: list[list[str]] = []
+
+    async def fake_queue(db, session_id, notification_type, members, render):
+        calls.append([m["id"] for m in members])
+        return len(members)
+
+    monkeypatch.setattr(tasks, "_queue_session_emails", fake_queue)
+    return calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_24h_reminder_goes_to_attendees_and_coaches_minus_opt_outs(queued):
+    notification = _notification(SessionNotificationType.REMINDER_24H)
+    summary = tasks.ReminderWaveSummary()
+
+    dispatch = await tasks._process_single_notification(
+        None, notification, _wave(timedelta(hours=23)), summary
+    )
+
+    assert queued == [[COACH, SWIMMER]]
+    assert dispatch["member_ids"] == [COACH, SWIMMER, OPTED_OUT]
+    assert notification.status == ScheduledNotificationStatus.SENT
+    assert (summary.sent, summary.queued) == (1, 2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_1h_reminder_goes_to_coaches_only(queued):
+    notification = _notification(SessionNotificationType.REMINDER_1H)
+
+    dispatch = await tasks._process_single_notification(
+        None, notification, _wave(timedelta(minutes=50)), tasks.ReminderWaveSummary()
+    )
+
+    assert queued == [[COACH]]
+    assert dispatch["type"] == "session_reminder_1h"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "starts_in,status",
+    [(timedelta(hours=-1), "scheduled"), (timedelta(hours=3), "cancelled")],
+)
+async def test_stale_or_cancelled_session_is_skipped(queued, starts_in, status):
+    notification = _notification(SessionNotificationType.REMINDER_3H)
+    summary = tasks.ReminderWaveSummary()
+
+    dispatch = await tasks._process_single_notification(
+        None, notification, _wave(starts_in, status), summary
+    )
+
+    assert dispatch is None
+    assert queued == []
+    assert notification.status == ScheduledNotificationStatus.CANCELLED
+    assert summary.cancelled == 1
+
+
+class _FakeDB:
+    """Records statements; answers every query with ``rows``."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        rows = self.rows
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: rows))
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_load_reminder_wave_keys_preferences_by_auth_id(monkeypatch):
+    sid = str(SESSION_ID)
+    session = _wave(timedelta(hours=23)).sessions[sid]
+    requested: dict[str, list] = {}
+
+    async def sessions_bulk(ids, *, calling_service):
+        return [session]
+
+    async def coach_ids(ids, *, calling_service):
+        requested["coaches"] = ids
+        return {sid: [COACH]}
+
+    async def attendee_ids(ids, *, calling_service):
+        requested["attendees"] = ids
+        return {sid: [COACH, SWIMMER]}
+
+    async def members_bulk(ids, *, calling_service):
+        requested["members"] = ids
+        return [_member(mid) for mid in ids]
+
+    monkeypatch.setattr(tasks, "get_sessions_bulk", sessions_bulk)
+    monkeypatch.setattr(tasks, "get_session_coach_ids_bulk", coach_ids)
+    monkeypatch.setattr(tasks, "get_session_attendee_ids_bulk", attendee_ids)
+    monkeypatch.setattr(tasks, "get_members_bulk", members_bulk)
+    pref = SimpleNamespace(member_auth_id=_auth_id(SWIMMER))
+    db = _FakeDB([pref])
+
+    wave = await tasks._load_reminder_wave(
+        db,
+        [
+            _notification(SessionNotificationType.REMINDER_24H),
+            _notification(SessionNotificationType.REMINDER_1H),
+        ],
+    )
+
+    assert requested == {
+        "coaches": [sid],
+        "attendees": [sid],
+        "members": sorted({COACH, SWIMMER}),
+    }
+    assert set(wave.members) == {COACH, SWIMMER}
+    assert wave.prefs == {_auth_id(SWIMMER): pref}
+    (statement,) = db.statements
+    compiled = statement.compile()
+    assert "notification_preferences.member_auth_id IN" in str(compiled)
+    assert list(compiled.params.values()) == [
+        sorted([_auth_id(COACH), _auth_id(SWIMMER)])
+    ]
@@ -0,0 +1,66 @@
+"""Unit tests for the quarterly aggregator's approved-member stream handling.
+
+A member whose report fails is skipped, but a stream cut off partway must
+fail the run: percentiles and community stats over a partial roster would
+be published as if complete.
+"""
+
+import pytest
+
+from services.reporting_service.services import aggregator
+
+
+class _Session:
+    async def rollback(self):
+        pass
+
+
+def _patch(monkeypatch, *, members, fail_after=None, broken=()):
+    computed: list[str] = []
+    ranked: list[bool] = []
+
+    async def stream(*, calling_service):
+        for i, member in enumerate(members):
+            if i == fail_after:
+                raise ConnectionError("stream reset")
+            yield member
+
+    async def report(*, member_auth_id, **_):
+        if member_auth_id in broken:
+            raise ValueError("bad data")
+        computed.append(member_auth_id)
+
+    async def ranks(year, quarter, db):
+        ranked.append(True)
+
+    monkeypatch.setattr(aggregator, "iter_approved_members", stream)
+    monkeypatch.setattr(aggregator, "compute_member_report", report)
+    monkeypatch.setattr(aggregator, "_compute_percentile_ranks", ranks)
+    return computed, ranked
+
+
+MEMBERS = [{"auth_id": f"auth-{i}"} for i in range(3)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_failed_member_is_skipped(monkeypatch):
+    computed, ranked = _patch(monkeypatch, members=MEMBERS, broken={"auth-1"})
+
+    count = await aggregator.compute_all_member_reports(2026, 3, _Session())
+
+    assert count == 2
+    assert computed == ["auth-0", "auth-2"]
+    assert ranked == [True]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_stream_failure_fails_the_run(monkeypatch):
+    computed, ranked = _patch(monkeypatch, members=MEMBERS, fail_after=2)
+
+    with pytest.raises(RuntimeError, match="after 2 members"):
+        await aggregator.compute_all_member_reports(2026, 3, _Session())
+
+    assert computed == ["auth-0", "auth-1"]
+    assert ranked == []
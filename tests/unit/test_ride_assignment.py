@@ -0,0 +1,107 @@
+"""Unit tests for the ride-assignment planner (pure packing + sequencing)."""
+
+import itertools
+import uuid
+
+import pytest
+
+import services.transport_service.services.ride_assignment as ride_assignment
+from services.transport_service.services.ride_assignment import (
+    RiderBooking,
+    _path_km,
+    pack_bookings,
+    plan_config,
+    sequence_stops,
+)
+
+POOL = (6.5095, 3.3711)  # Yaba
+# Two pickup clusters: mainland (near the pool) and the island (far away).
+MAINLAND_A = uuid.uuid4()
+MAINLAND_B = uuid.uuid4()
+ISLAND_A = uuid.uuid4()
+ISLAND_B = uuid.uuid4()
+COORDS = {
+    MAINLAND_A: (6.5200, 3.3800),
+    MAINLAND_B: (6.5250, 3.3850),
+    ISLAND_A: (6.4300, 3.4200),
+    ISLAND_B: (6.4350, 3.4250),
+}
+
+
+def _booking(stop: uuid.UUID, seats: int = 1) -> RiderBooking:
+    return RiderBooking(uuid.uuid4(), stop, seats)
+
+
+@pytest.mark.unit
+def test_nearby_stops_share_a_vehicle():
+    bookings = [_booking(stop, 2) for stop in COORDS]
+
+    vehicles = pack_bookings(bookings, COORDS, capacity=4, destination=POOL)
+
+    groups = [{b.pickup_location_id for b in riders} for riders in vehicles]
+    assert sorted(groups, key=lambda g: MAINLAND_A in g) == [
+        {ISLAND_A, ISLAND_B},
+        {MAINLAND_A, MAINLAND_B},
+    ]
+
+
+@pytest.mark.unit
+def test_packing_respects_capacity_and_keeps_every_booking():
+    bookings = [_booking(stop, seats) for stop in COORDS for seats in (1, 2, 3)]
+
+    vehicles = pack_bookings(bookings, COORDS, capacity=4, destination=POOL)
+
+    assert all(sum(b.seats for b in riders) <= 4 for riders in vehicles)
+    packed = sorted(b.booking_id for riders in vehicles for b in riders)
+    assert packed == sorted(b.booking_id for b in bookings)
+
+
+@pytest.mark.unit
+def test_oversized_booking_rides_alone():
+    big = _booking(MAINLAND_A, 6)
+    vehicles = pack_bookings(
+        [big, _booking(MAINLAND_A)], COORDS, capacity=4, destination=POOL
+    )
+
+    assert [big] in vehicles
+    assert len(vehicles) == 2
+
+
+@pytest.mark.unit
+def test_sequence_ends_nearest_the_pool():
+    order, km = sequence_stops(COORDS, POOL)
+
+    # Far cluster first, then the mainland stops on the way in.
+    assert set(order[:2]) == {ISLAND_A, ISLAND_B}
+    assert set(order[2:]) == {MAINLAND_A, MAINLAND_B}
+    best = min(
+        _path_km([COORDS[s] for s in perm], POOL)
+        for perm in itertools.permutations(COORDS)
+    )
+    assert km == pytest.approx(best)
+
+
+@pytest.mark.unit
+def test_heuristic_sequence_is_close_to_optimal(monkeypatch):
+    stops = {uuid.uuid4(): (6.40 + 0.03 * (i % 4), 3.30 + 0.04 * i) for i in range(7)}
+    _, exact = sequence_stops(stops, POOL)
+    monkeypatch.setattr(ride_assignment, "EXACT_SEQUENCE_MAX_STOPS", 1)
+    _, heuristic = sequence_stops(stops, POOL)
+
+    assert heuristic <= exact * 1.1
+
+
+@pytest.mark.unit
+def test_plan_config_numbers_rides_and_orders_bookings():
+    unlocated = uuid.uuid4()
+    bookings = [_booking(stop) for stop in COORDS] + [_booking(unlocated)]
+    locations = {**COORDS, unlocated: None}
+
+    plan = plan_config(uuid.uuid4(), 4, bookings, locations, POOL)
+
+    assert [r.ride_number for r in plan.rides] == [1, 2]
+    assert sum(r.seats for r in plan.rides) == 5
+    for ride in plan.rides:
+        positions = [ride.stops.index(b.pickup_location_id) for b in ride.bookings]
+        assert positions == sorted(positions)
+    assert plan.total_drive_minutes > 0
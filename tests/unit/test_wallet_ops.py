@@ -5,10 +5,14 @@ No HTTP layer involved — pure business logic validation.
 """
 
 import uuid
+from datetime import timedelta
 
 import pytest
 from fastapi import HTTPException
+from libs.common.datetime_utils import utc_now
 from services.wallet_service.models import (
+    GrantType,
+    PromotionalBubbleGrant,
     TransactionDirection,
     TransactionStatus,
     TransactionType,
@@ -16,6 +20,7 @@ from services.wallet_service.models import (
     WalletStatus,
 )
 from services.wallet_service.services.wallet_ops import (
+    bulk_credit_wallets,
     check_balance,
     create_wallet,
     credit_wallet,
@@ -195,6 +200,68 @@ async def test_debit_wallet_idempotency(db_session):
     assert wallet.balance == 80
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_debit_wallet_consumes_promo_grants_oldest_first(db_session):
+    """Purchases draw down unexpired promo grants FIFO before paid Bubbles."""
+    wallet = await _make_active_wallet(db_session, balance=100)
+    now = utc_now()
+
+    def _grant(amount, age_minutes, **overrides):
+        return PromotionalBubbleGrant(
+            wallet_id=wallet.id,
+            member_auth_id=wallet.member_auth_id,
+            grant_type=GrantType.CAMPAIGN,
+            bubbles_amount=amount,
+            bubbles_remaining=amount,
+            reason="Test campaign",
+            created_at=now - timedelta(minutes=age_minutes),
+            **overrides,
+        )
+
+    oldest, newer, newest = _grant(10, 30), _grant(20, 20), _grant(15, 10)
+    expired = _grant(50, 40, expires_at=now - timedelta(minutes=1))
+    db_session.add_all([oldest, newer, newest, expired])
+    await db_session.commit()
+
+    txn = await debit_wallet(
+        db_session,
+        member_auth_id=wallet.member_auth_id,
+        amount=25,
+        idempotency_key=f"debit-{uuid.uuid4().hex[:8]}",
+        transaction_type=TransactionType.PURCHASE,
+        description="Promo-first purchase",
+        service_source="test",
+    )
+
+    assert txn.txn_metadata["promo_bubbles"] == 25
+    assert txn.txn_metadata["purchased_bubbles"] == 0
+    for grant in (oldest, newer, newest, expired):
+        await db_session.refresh(grant)
+    assert [g.bubbles_remaining for g in (oldest, newer, newest, expired)] == [
+        0,
+        5,
+        15,
+        50,
+    ]
+
+    txn = await debit_wallet(
+        db_session,
+        member_auth_id=wallet.member_auth_id,
+        amount=40,
+        idempotency_key=f"debit-{uuid.uuid4().hex[:8]}",
+        transaction_type=TransactionType.PURCHASE,
+        description="Spills into paid Bubbles",
+        service_source="test",
+    )
+
+    assert txn.txn_metadata["promo_bubbles"] == 20
+    assert txn.txn_metadata["purchased_bubbles"] == 20
+    assert txn.balance_after == 35
+    await db_session.refresh(newest)
+    assert newest.bubbles_remaining == 0
+
+
 # ---------------------------------------------------------------------------
 # credit_wallet
 # ---------------------------------------------------------------------------
@@ -280,6 +347,74 @@ async def test_credit_wallet_idempotency(db_session):
     assert wallet.balance == 80  # only credited once
 
 
+# ---------------------------------------------------------------------------
+# bulk_credit_wallets
+# ---------------------------------------------------------------------------
+
+
+def _credit(wallet_or_auth_id, amount, key=None, **overrides):
+    auth_id = getattr(wallet_or_auth_id, "member_auth_id", wallet_or_auth_id)
+    credit = {
+        "member_auth_id": auth_id,
+        "amount": amount,
+        "idempotency_key": key or f"bulk-{uuid.uuid4().hex[:8]}",
+        "transaction_type": TransactionType.REFUND,
+        "description": "Bulk refund",
+        "service_source": "test",
+    }
+    credit.update(overrides)
+    return credit
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_bulk_credit_wallets_applies_credits_in_order(db_session):
+    """Credits to one wallet get consecutive balance snapshots."""
+    first = await _make_active_wallet(db_session, balance=10)
+    second = await _make_active_wallet(db_session, balance=0)
+
+    txns = await bulk_credit_wallets(
+        db_session,
+        [
+            _credit(first, 5),
+            _credit(second, 7, transaction_type=TransactionType.TOPUP),
+            _credit(first, 3),
+            _credit("auth-missing", 4),
+        ],
+    )
+
+    assert [(t.balance_before, t.balance_after) for t in txns[:3]] == [
+        (10, 15),
+        (0, 7),
+        (15, 18),
+    ]
+    assert txns[3] is None
+    await db_session.refresh(first)
+    await db_session.refresh(second)
+    assert first.balance == 18
+    assert first.lifetime_bubbles_received == 8
+    assert second.balance == 7
+    assert second.lifetime_bubbles_purchased == 7
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_bulk_credit_wallets_idempotency(db_session):
+    """Replayed keys, in the batch or from earlier, are applied once."""
+    wallet = await _make_active_wallet(db_session, balance=0)
+    key = f"bulk-{uuid.uuid4().hex[:8]}"
+
+    first = await bulk_credit_wallets(
+        db_session, [_credit(wallet, 10, key), _credit(wallet, 10, key)]
+    )
+    again = await bulk_credit_wallets(db_session, [_credit(wallet, 10, key)])
+
+    assert first[0] is first[1]
+    assert again[0].id == first[0].id
+    await db_session.refresh(wallet)
+    assert wallet.balance == 10
+
+
 # ---------------------------------------------------------------------------
 # check_balance
 # ---------------------------------------------------------------------------
@@ -0,0 +1,303 @@
+"""Unit tests for the compiled reward-rule index and Redis cap counters.
+
+Rules are compiled once per process (conditions pre-parsed, replacement
+links pre-resolved) and grouped per event type; ``reserve_caps`` claims a
+grant against Redis counters seeded from Postgres, falling back to the
+Postgres counts when Redis is down. A batch that fails gives its
+reservations back.
+"""
+
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from services.wallet_service.models.enums import RewardPeriod
+from services.wallet_service.services import rule_index
+from services.wallet_service.services.cap_checker import (
+    CAP_COUNTER_TTL_SECONDS,
+    reserve_caps,
+)
+from services.wallet_service.services.rewards_engine import (
+    evaluate_conditions,
+    process_events,
+)
+from services.wallet_service.services.rule_index import (
+    build_rule_index,
+    compile_conditions,
+    conditions_match,
+    get_rule_index,
+    invalidate_rule_index,
+)
+
+_CAPS = "services.wallet_service.services.cap_checker"
+_ENGINE = "services.wallet_service.services.rewards_engine"
+
+
+def _rule(event_type="attendance.checkin", priority=0, **overrides):
+    defaults = {
+        "id": uuid.uuid4(),
+        "rule_name": f"rule-{uuid.uuid4().hex[:6]}",
+        "display_name": "Rule",
+        "event_type": event_type,
+        "trigger_config": None,
+        "reward_bubbles": 5,
+        "reward_description_template": None,
+        "max_per_member_lifetime": None,
+        "max_per_member_per_period": None,
+        "period": None,
+        "replaces_rule_id": None,
+        "priority": priority,
+        "requires_admin_confirmation": False,
+    }
+    defaults.update(overrides)
+    return SimpleNamespace(**defaults)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "trigger_config, event_data, expected",
+    [
+        (None, {}, True),
+        ({"min_count": 5}, {"count": 5}, True),
+        ({"min_count": 5}, {"count": 4}, False),
+        ({"min_count": 5}, {}, False),
+        ({"max_amount": 10}, {"amount": 10}, True),
+        ({"max_amount": 10}, {"amount": None}, False),
+        ({"tier": "gold"}, {"tier": "gold"}, True),
+        ({"tier": "gold"}, {}, False),
+        ({"min_count": 5, "tier": "gold"}, {"count": 9, "tier": "silver"}, False),
+    ],
+)
+def test_compiled_conditions_match_evaluate_conditions(
+    trigger_config, event_data, expected
+):
+    compiled = compile_conditions(trigger_config)
+    assert conditions_match(compiled, event_data) is expected
+    assert evaluate_conditions(trigger_config, event_data) is expected
+
+
+@pytest.mark.unit
+def test_build_rule_index_groups_by_event_type_in_priority_order():
+    low = _rule(priority=1)
+    high = _rule(priority=10, replaces_rule_id=low.id)
+    other = _rule(event_type="topup.completed")
+
+    index = build_rule_index([low, high, other])
+
+    rules = index.rules_for("attendance.checkin")
+    assert [r.id for r in rules] == [high.id, low.id]
+    assert rules[1].replaced_by == frozenset({high.id})
+    assert rules[0].replaced_by == frozenset()
+    assert [r.id for r in index.rules_for("topup.completed")] == [other.id]
+    assert index.rules_for("unknown") == ()
+
+
+@pytest.mark.unit
+def test_compiled_rule_renders_description_like_the_model():
+    compiled = build_rule_index(
+        [
+            _rule(
+                reward_bubbles=15,
+                reward_description_template="{amount} for {sessions} sessions",
+            )
+        ]
+    ).rules_for("attendance.checkin")[0]
+
+    assert compiled.render_description({"sessions": 10}) == "15 for 10 sessions"
+    assert compiled.render_description({}) == "Reward — Rule (15 🫧)"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_rule_index_is_cached_until_invalidated():
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = [_rule()]
+    db = SimpleNamespace(execute=AsyncMock(return_value=result))
+
+    invalidate_rule_index()
+    first = await get_rule_index(db)
+    second = await get_rule_index(db)
+    assert first is second
+    assert db.execute.await_count == 1
+
+    invalidate_rule_index()
+    third = await get_rule_index(db)
+    assert third is not first
+    assert db.execute.await_count == 2
+
+    with patch.object(rule_index, "RULE_INDEX_TTL_SECONDS", 0):
+        await get_rule_index(db)
+    assert db.execute.await_count == 3
+    invalidate_rule_index()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_reserve_caps_uncapped_rule_skips_redis():
+    with patch(f"{_CAPS}.get_redis", new_callable=AsyncMock) as get_redis:
+        assert await reserve_caps(SimpleNamespace(), "auth-1", _rule()) == []
+    get_redis.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_reserve_caps_seeds_missing_counters_from_postgres():
+    rule = _rule(
+        max_per_member_lifetime=3,
+        max_per_member_per_period=1,
+        period=RewardPeriod.MONTH,
+    )
+    redis = SimpleNamespace(eval=AsyncMock(side_effect=[-1, 1]))
+
+    with (
+        patch(f"{_CAPS}.get_redis", new_callable=AsyncMock, return_value=redis),
+        patch(f"{_CAPS}.compute_period_key", return_value="2026-10"),
+        patch(
+            f"{_CAPS}._grant_count", new_callable=AsyncMock, side_effect=[2, 0]
+        ) as grant_count,
+    ):
+        keys = await reserve_caps(SimpleNamespace(), "auth-1", rule)
+
+    assert keys == [
+        f"wallet:reward-cap:{rule.id}:auth-1:lifetime",
+        f"wallet:reward-cap:{rule.id}:auth-1:2026-10",
+    ]
+    assert grant_count.await_count == 2
+    first, second = redis.eval.await_args_list
+    # script, key count, keys, ttl, caps, then seeds ("" = not counted yet)
+    assert first.args[-2:] == ("", "")
+    assert second.args[1:] == (2, *keys, CAP_COUNTER_TTL_SECONDS, 3, 1, 2, 0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_reserve_caps_reports_a_reached_cap():
+    rule = _rule(max_per_member_lifetime=1)
+    redis = SimpleNamespace(eval=AsyncMock(return_value=0))
+
+    with patch(f"{_CAPS}.get_redis", new_callable=AsyncMock, return_value=redis):
+        assert await reserve_caps(SimpleNamespace(), "auth-1", rule) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_reserve_caps_falls_back_to_postgres_without_redis():
+    rule = _rule(max_per_member_lifetime=2)
+
+    with (
+        patch(
+            f"{_CAPS}.get_redis",
+            new_callable=AsyncMock,
+            side_effect=ConnectionError("redis down"),
+        ),
+        patch(f"{_CAPS}._grant_count", new_callable=AsyncMock, return_value=1),
+    ):
+        assert await reserve_caps(SimpleNamespace(), "auth-1", rule) == []
+
+    with (
+        patch(
+            f"{_CAPS}.get_redis",
+            new_callable=AsyncMock,
+            side_effect=ConnectionError("redis down"),
+        ),
+        patch(f"{_CAPS}._grant_count", new_callable=AsyncMock, return_value=2),
+    ):
+        assert await reserve_caps(SimpleNamespace(), "auth-1", rule) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_failed_batch_releases_its_cap_reservations():
+    rule = build_rule_index([_rule(max_per_member_lifetime=1)]).rules_for(
+        "attendance.checkin"
+    )[0]
+    events = [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            event_id=uuid.uuid4(),
+            event_type="attendance.checkin",
+            member_auth_id=f"auth-{i}",
+            event_data={},
+        )
+        for i in range(2)
+    ]
+
+    @asynccontextmanager
+    async def savepoint():
+        yield
+
+    # The second event's closing flush fails after its grant was made.
+    db = SimpleNamespace(
+        begin_nested=savepoint,
+        flush=AsyncMock(side_effect=[None, RuntimeError("flush failed")]),
+    )
+
+    with (
+        patch(
+            f"{_ENGINE}.get_matching_rules",
+            new_callable=AsyncMock,
+            return_value=[rule],
+        ),
+        patch(
+            f"{_ENGINE}.reserve_caps",
+            new_callable=AsyncMock,
+            side_effect=[["cap:auth-0"], ["cap:auth-1"]],
+        ),
+        patch(f"{_ENGINE}._grant", new_callable=AsyncMock),
+        patch(f"{_ENGINE}.check_batch_for_abuse", new_callable=AsyncMock),
+        patch(f"{_ENGINE}.release_caps", new_callable=AsyncMock) as release,
+    ):
+        with pytest.raises(RuntimeError):
+            await process_events(events, db)
+
+    release.assert_awaited_once_with(["cap:auth-0", "cap:auth-1"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_batch_records_daily_stats_once_after_all_grants():
+    rule = build_rule_index([_rule()]).rules_for("attendance.checkin")[0]
+    events = [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            event_id=uuid.uuid4(),
+            event_type="attendance.checkin",
+            member_auth_id=f"auth-{i}",
+            event_data={},
+        )
+        for i in range(3)
+    ]
+    calls: list[str] = []
+
+    async def grant(event, rule, db, *, commit, deferred_stats):
+        calls.append("grant")
+        txn = SimpleNamespace(id=uuid.uuid4(), member=event.member_auth_id)
+        deferred_stats.append(txn)
+        return txn
+
+    async def record(db, txns):
+        calls.append("record")
+        assert [t.member for t in txns] == ["auth-0", "auth-1", "auth-2"]
+
+    @asynccontextmanager
+    async def savepoint():
+        yield
+
+    db = SimpleNamespace(begin_nested=savepoint, flush=AsyncMock())
+    with (
+        patch(
+            f"{_ENGINE}.get_matching_rules",
+            new_callable=AsyncMock,
+            return_value=[rule],
+        ),
+        patch(f"{_ENGINE}.reserve_caps", new_callable=AsyncMock, return_value=[]),
+        patch(f"{_ENGINE}._grant", side_effect=grant),
+        patch(f"{_ENGINE}.check_batch_for_abuse", new_callable=AsyncMock),
+        patch(f"{_ENGINE}.record_wallet_transactions", side_effect=record),
+    ):
+        grants = await process_events(events, db)
+
+    assert [len(g) for g in grants] == [1, 1, 1]
+    assert calls == ["grant", "grant", "grant", "record"]